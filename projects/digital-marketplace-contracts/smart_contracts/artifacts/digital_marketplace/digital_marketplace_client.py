@@ -19,7 +19,7 @@ from algosdk.v2client.models import SimulateTraceConfig
 import algokit_utils
 from algokit_utils import AlgorandClient as _AlgoKitAlgorandClient
 
-_APP_SPEC_JSON = r"""{"arcs": [22, 28], "bareActions": {"call": [], "create": ["NoOp"]}, "methods": [{"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "pay", "name": "payment"}], "name": "deposit", "returns": {"type": "void"}, "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "name": "amount"}], "name": "withdraw", "returns": {"type": "void"}, "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "asset", "name": "asset"}], "name": "sponsor_asset", "returns": {"type": "void"}, "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "axfer", "name": "asset_deposit"}, {"type": "uint64", "name": "cost"}], "name": "open_sale", "returns": {"type": "void"}, "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "asset", "name": "asset"}], "name": "close_sale", "returns": {"type": "void"}, "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "(address,uint64)", "name": "sale_key", "struct": "SaleKey"}], "name": "buy", "returns": {"type": "void"}, "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "(address,uint64)", "name": "sale_key", "struct": "SaleKey"}, {"type": "uint64", "name": "new_bid_amount"}], "name": "bid", "returns": {"type": "void"}, "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [], "name": "claim_unencumbered_bids", "returns": {"type": "void"}, "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [], "name": "get_total_and_unencumbered_bids", "returns": {"type": "(uint64,uint64)", "struct": "UnencumberedBidsReceipt"}, "events": [], "readonly": true, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "name": "asset"}], "name": "accept_bid", "returns": {"type": "void"}, "events": [], "readonly": false, "recommendations": {}}], "name": "DigitalMarketplace", "state": {"keys": {"box": {}, "global": {}, "local": {}}, "maps": {"box": {"deposited": {"keyType": "address", "valueType": "uint64", "prefix": "ZGVwb3NpdGVk"}, "sales": {"keyType": "SaleKey", "valueType": "Sale", "prefix": "c2FsZXM="}, "receipt_book": {"keyType": "address", "valueType": "((address,uint64),uint64)[]", "prefix": "cmVjZWlwdF9ib29r"}}, "global": {}, "local": {}}, "schema": {"global": {"bytes": 0, "ints": 0}, "local": {"bytes": 0, "ints": 0}}}, "structs": {"Bid": [{"name": "bidder", "type": "address"}, {"name": "amount", "type": "uint64"}], "Sale": [{"name": "amount", "type": "uint64"}, {"name": "cost", "type": "uint64"}, {"name": "bid", "type": "Bid"}], "SaleKey": [{"name": "owner", "type": "address"}, {"name": "asset", "type": "uint64"}], "UnencumberedBidsReceipt": [{"name": "total_bids", "type": "uint64"}, {"name": "unencumbered_bids", "type": "uint64"}]}, "byteCode": {"approval": "CiAEAAEwBCYFCWRlcG9zaXRlZAxyZWNlaXB0X2Jvb2sFc2FsZXMAAgAAMRtBAQeCCgQ2JeTrBCHx3f8EEwAKlASmkgBmBAlUSBAE1JrGDgShjx/8BEVuOXUEHqu7WAT44O+vNhoAjgoApACVAIMAagBYAEkANwArABEAAiJDMRkURDEYRDYaAYgE8iNDMRkURDEYRIgEeEwWTBZQgAQVH3x1TFCwI0MxGRREMRhEiAPFI0MxGRREMRhENhoBNhoCiAKGI0MxGRREMRhENhoBiAIOI0MxGRREMRhENhoBF8AwiAG5I0MxGRREMRhEMRYjCUk4ECUSRDYaAYgBKSNDMRkURDEYRDYaARfAMIgA3iNDMRkURDEYRDYaAYgApyNDMRkURDEYRDEWIwlJOBAjEkSIAEkjQzEZQP9BMRgURCNDigICi/4iWSKLAYsADEEAJYv+VwIAiwEkCyRYVwAoi/8SQQAII4sBTwNPA4mLASMIjAFC/9MiSU8DTwOJigEAi/84ADEAEkSL/zgHMgoSRDIKcwFEKDEAUL5MFyJMTwJNi/84CCgxAFBOAggWvzIKcwFETAkoMQBQSb5MF0xETwIJFr+JigEAKDEAUEm+TBdMRIv/F0xLAQkWTwJMv7ExALIHsggjshAisgGziYoBADIKi/9wAEUBFESL/3EKRDIDEkQoMQBQSb5MF0xEMhAJFr+xMgoishKyFIv/shElshAisgGziYoCAIv+OAAxABJEi/44FDIKEkQxAIv+OBEWUCpMUEm9RQEURDIKcwFEi/44EhaL/1CAKAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAABQTwJMvzIKcwFETAkoMQBQSb5MF0xETwIJFr+JigEAMQCL/xZQsTEAKk8CUEm+RCJbshJMshSL/7IRJbIQIrIBszIKcwFETLxIMgpzAUQJKDEAUEm+TBdMRE8CCBa/iYoBADEAi/9XACBMSwETRCqL/1BJvkSxi/+BIFsxAEsCIluyErIUshElshAisgGzMgpzAURPArxIMgpzAUQJKDEAUEm+TBdMRE8DgQhbTEsBCRZPAky/KE8DUEm+TBdMRE8CTwMICBa/iYoCACJJK0kxAIv/UIv+VwAgMQATRCqL/lBJvkxJTwJEVxAoSVcAIDIDE0EACosHgSBbi/8XDESLBklXAAhMVwgIUIsEUIsFTL8yCnMBTIwDRIv+i/9QjAApMQBQvkyMAUEAhosBi/6I/Y6MAkEAXCgxAFBJvkwXTESLAUlOAlcCAIsCSU4EJAtMSwEkWIEoW08CCBZPBEy/SwEiWU8DDUSBAgiLAF0pMQBQSbxITL8yCnMBRIsDCSgxAFBJvkwXTESL/xdPAwgJFr+JiwFXAgCLAFBJFSQKFlcGAkxQKTEAUEm8SEy/Qv/GgAIAAYsAUCkxAFBJvEhMv0L/s4oBASKL/1cAKCpMUL5BAB2LAVcQKFcAIEmMADIDE0EADIsAMQASQQAEI4wAiSJC//mKAAArJwQpMQBQvkxJTwJEIlkiiwSLAwxBAEOLAlcCAIsEJAskWEmI/6VBAByLAVcCAExQSRUkChZXBgJMUIwBiwQjCIwEQv/KKDEAUEm+TBdMRE8CgShbCBa/Qv/iMgpzAUyMAESLASJZQQAjKTEAUEm8SIsBvzIKcwFEiwBMCSgxAFBJvkwXTERPAggWv4kpMQBQvEhC/96KAAIrRwIiRwMpMQBQvkxOA0xOAkEATosFIlmMACKMAYsBiwAMQQA1iwVXAgCLASQLJFhJgShbSYwCiwMIjAOI/vSLBIwGQAAHiwSLAgiMBosGjASLASMIjAFC/8OLBIwGiwOMB4sHiwaMAYwAiYoBACJJKzEAi/9QKksBUEm+RElXEChJVwAgSU4ETgUyCnMBRE8DvEgyCnMBRAkoMQBQSb5MF0xETwOBIFtPAwgIFr+xi/8XTCJbshJLAbIUshElshAisgGzKUxQSU4CvkxJTgJOA0RJTwKI+1dOAkQnBEwiWSKLCYsIDEEAQosFVwIAiwkkC0sBTCRYSU4CjAGLBiQLJFgTiweMAEEAFIsHVwIAiwFQSRUkChZXBgJMUIwAiwCMB4sJIwiMCUL/tjIKcwFMjAJEiwciWUEAIYsESbxIiwe/MgpzAUSLAkwJKIsDUEm+TBdMRE8CCBa/iYsEvEhC/+A=", "clear": "CoEBQw=="}, "compilerInfo": {"compiler": "puya", "compilerVersion": {"major": 4, "minor": 7, "patch": 0}}, "events": [], "networks": {}, "source": {"approval": "I3ByYWdtYSB2ZXJzaW9uIDEwCiNwcmFnbWEgdHlwZXRyYWNrIGZhbHNlCgovLyBzbWFydF9jb250cmFjdHMuZGlnaXRhbF9tYXJrZXRwbGFjZS5jb250cmFjdC5EaWdpdGFsTWFya2V0cGxhY2UuX19hbGdvcHlfZW50cnlwb2ludF93aXRoX2luaXQoKSAtPiB1aW50NjQ6Cm1haW46CiAgICBpbnRjYmxvY2sgMCAxIDQ4IDQKICAgIGJ5dGVjYmxvY2sgImRlcG9zaXRlZCIgInJlY2VpcHRfYm9vayIgInNhbGVzIiAiIiAweDAwMDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjU1CiAgICAvLyBjbGFzcyBEaWdpdGFsTWFya2V0cGxhY2UoQVJDNENvbnRyYWN0KToKICAgIHR4biBOdW1BcHBBcmdzCiAgICBieiBtYWluX2JhcmVfcm91dGluZ0AxNQogICAgcHVzaGJ5dGVzcyAweDM2MjVlNGViIDB4MjFmMWRkZmYgMHgxMzAwMGE5NCAweGE2OTIwMDY2IDB4MDk1NDQ4MTAgMHhkNDlhYzYwZSAweGExOGYxZmZjIDB4NDU2ZTM5NzUgMHgxZWFiYmI1OCAweGY4ZTBlZmFmIC8vIG1ldGhvZCAiZGVwb3NpdChwYXkpdm9pZCIsIG1ldGhvZCAid2l0aGRyYXcodWludDY0KXZvaWQiLCBtZXRob2QgInNwb25zb3JfYXNzZXQoYXNzZXQpdm9pZCIsIG1ldGhvZCAib3Blbl9zYWxlKGF4ZmVyLHVpbnQ2NCl2b2lkIiwgbWV0aG9kICJjbG9zZV9zYWxlKGFzc2V0KXZvaWQiLCBtZXRob2QgImJ1eSgoYWRkcmVzcyx1aW50NjQpKXZvaWQiLCBtZXRob2QgImJpZCgoYWRkcmVzcyx1aW50NjQpLHVpbnQ2NCl2b2lkIiwgbWV0aG9kICJjbGFpbV91bmVuY3VtYmVyZWRfYmlkcygpdm9pZCIsIG1ldGhvZCAiZ2V0X3RvdGFsX2FuZF91bmVuY3VtYmVyZWRfYmlkcygpKHVpbnQ2NCx1aW50NjQpIiwgbWV0aG9kICJhY2NlcHRfYmlkKHVpbnQ2NCl2b2lkIgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMAogICAgbWF0Y2ggbWFpbl9kZXBvc2l0X3JvdXRlQDUgbWFpbl93aXRoZHJhd19yb3V0ZUA2IG1haW5fc3BvbnNvcl9hc3NldF9yb3V0ZUA3IG1haW5fb3Blbl9zYWxlX3JvdXRlQDggbWFpbl9jbG9zZV9zYWxlX3JvdXRlQDkgbWFpbl9idXlfcm91dGVAMTAgbWFpbl9iaWRfcm91dGVAMTEgbWFpbl9jbGFpbV91bmVuY3VtYmVyZWRfYmlkc19yb3V0ZUAxMiBtYWluX2dldF90b3RhbF9hbmRfdW5lbmN1bWJlcmVkX2JpZHNfcm91dGVAMTMgbWFpbl9hY2NlcHRfYmlkX3JvdXRlQDE0CgptYWluX2FmdGVyX2lmX2Vsc2VAMTc6CiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weTo1NQogICAgLy8gY2xhc3MgRGlnaXRhbE1hcmtldHBsYWNlKEFSQzRDb250cmFjdCk6CiAgICBpbnRjXzAgLy8gMAogICAgcmV0dXJuCgptYWluX2FjY2VwdF9iaWRfcm91dGVAMTQ6CiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weToyMjIKICAgIC8vIEBhYmltZXRob2QKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgbm90IE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gY2FuIG9ubHkgY2FsbCB3aGVuIG5vdCBjcmVhdGluZwogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2UvY29udHJhY3QucHk6NTUKICAgIC8vIGNsYXNzIERpZ2l0YWxNYXJrZXRwbGFjZShBUkM0Q29udHJhY3QpOgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2UvY29udHJhY3QucHk6MjIyCiAgICAvLyBAYWJpbWV0aG9kCiAgICBjYWxsc3ViIGFjY2VwdF9iaWQKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCm1haW5fZ2V0X3RvdGFsX2FuZF91bmVuY3VtYmVyZWRfYmlkc19yb3V0ZUAxMzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjIwOAogICAgLy8gQGFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBub3QgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBjYW4gb25seSBjYWxsIHdoZW4gbm90IGNyZWF0aW5nCiAgICBjYWxsc3ViIGdldF90b3RhbF9hbmRfdW5lbmN1bWJlcmVkX2JpZHMKICAgIHN3YXAKICAgIGl0b2IKICAgIHN3YXAKICAgIGl0b2IKICAgIGNvbmNhdAogICAgcHVzaGJ5dGVzIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgptYWluX2NsYWltX3VuZW5jdW1iZXJlZF9iaWRzX3JvdXRlQDEyOgogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2UvY29udHJhY3QucHk6MTg5CiAgICAvLyBAYWJpbWV0aG9kCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIG5vdCBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGNhbiBvbmx5IGNhbGwgd2hlbiBub3QgY3JlYXRpbmcKICAgIGNhbGxzdWIgY2xhaW1fdW5lbmN1bWJlcmVkX2JpZHMKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCm1haW5fYmlkX3JvdXRlQDExOgogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2UvY29udHJhY3QucHk6MTU0CiAgICAvLyBAYWJpbWV0aG9kCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIG5vdCBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGNhbiBvbmx5IGNhbGwgd2hlbiBub3QgY3JlYXRpbmcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjU1CiAgICAvLyBjbGFzcyBEaWdpdGFsTWFya2V0cGxhY2UoQVJDNENvbnRyYWN0KToKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjE1NAogICAgLy8gQGFiaW1ldGhvZAogICAgY2FsbHN1YiBiaWQKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCm1haW5fYnV5X3JvdXRlQDEwOgogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2UvY29udHJhY3QucHk6MTM2CiAgICAvLyBAYWJpbWV0aG9kCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIG5vdCBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGNhbiBvbmx5IGNhbGwgd2hlbiBub3QgY3JlYXRpbmcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjU1CiAgICAvLyBjbGFzcyBEaWdpdGFsTWFya2V0cGxhY2UoQVJDNENvbnRyYWN0KToKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjEzNgogICAgLy8gQGFiaW1ldGhvZAogICAgY2FsbHN1YiBidXkKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCm1haW5fY2xvc2Vfc2FsZV9yb3V0ZUA5OgogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2UvY29udHJhY3QucHk6MTIxCiAgICAvLyBAYWJpbWV0aG9kCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIG5vdCBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGNhbiBvbmx5IGNhbGwgd2hlbiBub3QgY3JlYXRpbmcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjU1CiAgICAvLyBjbGFzcyBEaWdpdGFsTWFya2V0cGxhY2UoQVJDNENvbnRyYWN0KToKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGJ0b2kKICAgIHR4bmFzIEFzc2V0cwogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2UvY29udHJhY3QucHk6MTIxCiAgICAvLyBAYWJpbWV0aG9kCiAgICBjYWxsc3ViIGNsb3NlX3NhbGUKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCm1haW5fb3Blbl9zYWxlX3JvdXRlQDg6CiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weTo5NwogICAgLy8gQGFiaW1ldGhvZAogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBub3QgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBjYW4gb25seSBjYWxsIHdoZW4gbm90IGNyZWF0aW5nCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weTo1NQogICAgLy8gY2xhc3MgRGlnaXRhbE1hcmtldHBsYWNlKEFSQzRDb250cmFjdCk6CiAgICB0eG4gR3JvdXBJbmRleAogICAgaW50Y18xIC8vIDEKICAgIC0KICAgIGR1cAogICAgZ3R4bnMgVHlwZUVudW0KICAgIGludGNfMyAvLyBheGZlcgogICAgPT0KICAgIGFzc2VydCAvLyB0cmFuc2FjdGlvbiB0eXBlIGlzIGF4ZmVyCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weTo5NwogICAgLy8gQGFiaW1ldGhvZAogICAgY2FsbHN1YiBvcGVuX3NhbGUKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCm1haW5fc3BvbnNvcl9hc3NldF9yb3V0ZUA3OgogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2UvY29udHJhY3QucHk6ODIKICAgIC8vIEBhYmltZXRob2QKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgbm90IE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gY2FuIG9ubHkgY2FsbCB3aGVuIG5vdCBjcmVhdGluZwogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2UvY29udHJhY3QucHk6NTUKICAgIC8vIGNsYXNzIERpZ2l0YWxNYXJrZXRwbGFjZShBUkM0Q29udHJhY3QpOgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgYnRvaQogICAgdHhuYXMgQXNzZXRzCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weTo4MgogICAgLy8gQGFiaW1ldGhvZAogICAgY2FsbHN1YiBzcG9uc29yX2Fzc2V0CiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgptYWluX3dpdGhkcmF3X3JvdXRlQDY6CiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weTo3NgogICAgLy8gQGFiaW1ldGhvZAogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBub3QgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBjYW4gb25seSBjYWxsIHdoZW4gbm90IGNyZWF0aW5nCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weTo1NQogICAgLy8gY2xhc3MgRGlnaXRhbE1hcmtldHBsYWNlKEFSQzRDb250cmFjdCk6CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weTo3NgogICAgLy8gQGFiaW1ldGhvZAogICAgY2FsbHN1YiB3aXRoZHJhdwogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKbWFpbl9kZXBvc2l0X3JvdXRlQDU6CiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weTo2MgogICAgLy8gQGFiaW1ldGhvZAogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBub3QgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBjYW4gb25seSBjYWxsIHdoZW4gbm90IGNyZWF0aW5nCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weTo1NQogICAgLy8gY2xhc3MgRGlnaXRhbE1hcmtldHBsYWNlKEFSQzRDb250cmFjdCk6CiAgICB0eG4gR3JvdXBJbmRleAogICAgaW50Y18xIC8vIDEKICAgIC0KICAgIGR1cAogICAgZ3R4bnMgVHlwZUVudW0KICAgIGludGNfMSAvLyBwYXkKICAgID09CiAgICBhc3NlcnQgLy8gdHJhbnNhY3Rpb24gdHlwZSBpcyBwYXkKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjYyCiAgICAvLyBAYWJpbWV0aG9kCiAgICBjYWxsc3ViIGRlcG9zaXQKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCm1haW5fYmFyZV9yb3V0aW5nQDE1OgogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2UvY29udHJhY3QucHk6NTUKICAgIC8vIGNsYXNzIERpZ2l0YWxNYXJrZXRwbGFjZShBUkM0Q29udHJhY3QpOgogICAgdHhuIE9uQ29tcGxldGlvbgogICAgYm56IG1haW5fYWZ0ZXJfaWZfZWxzZUAxNwogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgICEKICAgIGFzc2VydCAvLyBjYW4gb25seSBjYWxsIHdoZW4gY3JlYXRpbmcKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCgovLyBzbWFydF9jb250cmFjdHMuZGlnaXRhbF9tYXJrZXRwbGFjZS5zdWJyb3V0aW5lcy5maW5kX2JpZF9yZWNlaXB0KHJlY2VpcHRzOiBieXRlcywga2V5OiBieXRlcykgLT4gdWludDY0LCB1aW50NjQ6CmZpbmRfYmlkX3JlY2VpcHQ6CiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9zdWJyb3V0aW5lcy5weTo2LTkKICAgIC8vIEBzdWJyb3V0aW5lCiAgICAvLyBkZWYgZmluZF9iaWRfcmVjZWlwdCgKICAgIC8vICAgICByZWNlaXB0czogSW1tdXRhYmxlQXJyYXlbQmlkUmVjZWlwdF0sIGtleTogU2FsZUtleQogICAgLy8gKSAtPiB0dXBsZVtib29sLCBVSW50NjRdOgogICAgcHJvdG8gMiAyCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9zdWJyb3V0aW5lcy5weToxMAogICAgLy8gZm9yIGkgaW4gdXJhbmdlKHJlY2VpcHRzLmxlbmd0aCk6CiAgICBmcmFtZV9kaWcgLTIKICAgIGludGNfMCAvLyAwCiAgICBleHRyYWN0X3VpbnQxNgogICAgaW50Y18wIC8vIDAKCmZpbmRfYmlkX3JlY2VpcHRfZm9yX2hlYWRlckAxOgogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2Uvc3Vicm91dGluZXMucHk6MTAKICAgIC8vIGZvciBpIGluIHVyYW5nZShyZWNlaXB0cy5sZW5ndGgpOgogICAgZnJhbWVfZGlnIDEKICAgIGZyYW1lX2RpZyAwCiAgICA8CiAgICBieiBmaW5kX2JpZF9yZWNlaXB0X2FmdGVyX2ZvckA2CiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9zdWJyb3V0aW5lcy5weToxMQogICAgLy8gaWYgcmVjZWlwdHNbaV0uc2FsZV9rZXkgPT0ga2V5OgogICAgZnJhbWVfZGlnIC0yCiAgICBleHRyYWN0IDIgMAogICAgZnJhbWVfZGlnIDEKICAgIGludGNfMiAvLyA0OAogICAgKgogICAgaW50Y18yIC8vIDQ4CiAgICBleHRyYWN0MyAvLyBvbiBlcnJvcjogSW5kZXggYWNjZXNzIGlzIG91dCBvZiBib3VuZHMKICAgIGV4dHJhY3QgMCA0MCAvLyBvbiBlcnJvcjogSW5kZXggYWNjZXNzIGlzIG91dCBvZiBib3VuZHMKICAgIGZyYW1lX2RpZyAtMQogICAgPT0KICAgIGJ6IGZpbmRfYmlkX3JlY2VpcHRfYWZ0ZXJfaWZfZWxzZUA0CiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9zdWJyb3V0aW5lcy5weToxMgogICAgLy8gcmV0dXJuIFRydWUsIGkKICAgIGludGNfMSAvLyAxCiAgICBmcmFtZV9kaWcgMQogICAgdW5jb3ZlciAzCiAgICB1bmNvdmVyIDMKICAgIHJldHN1YgoKZmluZF9iaWRfcmVjZWlwdF9hZnRlcl9pZl9lbHNlQDQ6CiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9zdWJyb3V0aW5lcy5weToxMAogICAgLy8gZm9yIGkgaW4gdXJhbmdlKHJlY2VpcHRzLmxlbmd0aCk6CiAgICBmcmFtZV9kaWcgMQogICAgaW50Y18xIC8vIDEKICAgICsKICAgIGZyYW1lX2J1cnkgMQogICAgYiBmaW5kX2JpZF9yZWNlaXB0X2Zvcl9oZWFkZXJAMQoKZmluZF9iaWRfcmVjZWlwdF9hZnRlcl9mb3JANjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL3N1YnJvdXRpbmVzLnB5OjEzCiAgICAvLyByZXR1cm4gRmFsc2UsIFVJbnQ2NCgwKQogICAgaW50Y18wIC8vIDAKICAgIGR1cAogICAgdW5jb3ZlciAzCiAgICB1bmNvdmVyIDMKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5kaWdpdGFsX21hcmtldHBsYWNlLmNvbnRyYWN0LkRpZ2l0YWxNYXJrZXRwbGFjZS5kZXBvc2l0KHBheW1lbnQ6IHVpbnQ2NCkgLT4gdm9pZDoKZGVwb3NpdDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjYyLTYzCiAgICAvLyBAYWJpbWV0aG9kCiAgICAvLyBkZWYgZGVwb3NpdChzZWxmLCBwYXltZW50OiBndHhuLlBheW1lbnRUcmFuc2FjdGlvbikgLT4gTm9uZToKICAgIHByb3RvIDEgMAogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2UvY29udHJhY3QucHk6NjQKICAgIC8vIGFzc2VydCBwYXltZW50LnNlbmRlciA9PSBUeG4uc2VuZGVyLCBlcnIuRElGRkVSRU5UX1NFTkRFUgogICAgZnJhbWVfZGlnIC0xCiAgICBndHhucyBTZW5kZXIKICAgIHR4biBTZW5kZXIKICAgID09CiAgICBhc3NlcnQgLy8gRGlmZmVyZW50IHNlbmRlcgogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2UvY29udHJhY3QucHk6NjYKICAgIC8vIHBheW1lbnQucmVjZWl2ZXIgPT0gR2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcwogICAgZnJhbWVfZGlnIC0xCiAgICBndHhucyBSZWNlaXZlcgogICAgZ2xvYmFsIEN1cnJlbnRBcHBsaWNhdGlvbkFkZHJlc3MKICAgID09CiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weTo2NS02NwogICAgLy8gYXNzZXJ0ICgKICAgIC8vICAgICBwYXltZW50LnJlY2VpdmVyID09IEdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MKICAgIC8vICksIGVyci5XUk9OR19SRUNFSVZFUgogICAgYXNzZXJ0IC8vIFdyb25nIHJlY2VpdmVyCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weTo2OQogICAgLy8gbWJyX2Jhc2VsaW5lID0gR2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcy5taW5fYmFsYW5jZQogICAgZ2xvYmFsIEN1cnJlbnRBcHBsaWNhdGlvbkFkZHJlc3MKICAgIGFjY3RfcGFyYW1zX2dldCBBY2N0TWluQmFsYW5jZQogICAgYXNzZXJ0IC8vIGFjY291bnQgZnVuZGVkCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weTo3MQogICAgLy8gc2VsZi5kZXBvc2l0ZWQuZ2V0KFR4bi5zZW5kZXIsIGRlZmF1bHQ9VUludDY0KDApKSArIHBheW1lbnQuYW1vdW50CiAgICBieXRlY18wIC8vICJkZXBvc2l0ZWQiCiAgICB0eG4gU2VuZGVyCiAgICBjb25jYXQKICAgIGJveF9nZXQKICAgIHN3YXAKICAgIGJ0b2kKICAgIGludGNfMCAvLyAwCiAgICBzd2FwCiAgICB1bmNvdmVyIDIKICAgIHNlbGVjdAogICAgZnJhbWVfZGlnIC0xCiAgICBndHhucyBBbW91bnQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjcwCiAgICAvLyBzZWxmLmRlcG9zaXRlZFtUeG4uc2VuZGVyXSA9ICgKICAgIGJ5dGVjXzAgLy8gImRlcG9zaXRlZCIKICAgIHR4biBTZW5kZXIKICAgIGNvbmNhdAogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2UvY29udHJhY3QucHk6NzEKICAgIC8vIHNlbGYuZGVwb3NpdGVkLmdldChUeG4uc2VuZGVyLCBkZWZhdWx0PVVJbnQ2NCgwKSkgKyBwYXltZW50LmFtb3VudAogICAgY292ZXIgMgogICAgKwogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2UvY29udHJhY3QucHk6NzAtNzIKICAgIC8vIHNlbGYuZGVwb3NpdGVkW1R4bi5zZW5kZXJdID0gKAogICAgLy8gICAgIHNlbGYuZGVwb3NpdGVkLmdldChUeG4uc2VuZGVyLCBkZWZhdWx0PVVJbnQ2NCgwKSkgKyBwYXltZW50LmFtb3VudAogICAgLy8gKQogICAgaXRvYgogICAgYm94X3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2UvY29udHJhY3QucHk6NzMKICAgIC8vIG1icl9kaWZmID0gR2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcy5taW5fYmFsYW5jZSAtIG1icl9iYXNlbGluZQogICAgZ2xvYmFsIEN1cnJlbnRBcHBsaWNhdGlvbkFkZHJlc3MKICAgIGFjY3RfcGFyYW1zX2dldCBBY2N0TWluQmFsYW5jZQogICAgYXNzZXJ0IC8vIGFjY291bnQgZnVuZGVkCiAgICBzd2FwCiAgICAtCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weTo3NAogICAgLy8gc2VsZi5kZXBvc2l0ZWRbVHhuLnNlbmRlcl0gLT0gbWJyX2RpZmYKICAgIGJ5dGVjXzAgLy8gImRlcG9zaXRlZCIKICAgIHR4biBTZW5kZXIKICAgIGNvbmNhdAogICAgZHVwCiAgICBib3hfZ2V0CiAgICBzd2FwCiAgICBidG9pCiAgICBzd2FwCiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5kZXBvc2l0ZWQgZW50cnkgZXhpc3RzCiAgICB1bmNvdmVyIDIKICAgIC0KICAgIGl0b2IKICAgIGJveF9wdXQKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5kaWdpdGFsX21hcmtldHBsYWNlLmNvbnRyYWN0LkRpZ2l0YWxNYXJrZXRwbGFjZS53aXRoZHJhdyhhbW91bnQ6IGJ5dGVzKSAtPiB2b2lkOgp3aXRoZHJhdzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5Ojc2LTc3CiAgICAvLyBAYWJpbWV0aG9kCiAgICAvLyBkZWYgd2l0aGRyYXcoc2VsZiwgYW1vdW50OiBhcmM0LlVJbnQ2NCkgLT4gTm9uZToKICAgIHByb3RvIDEgMAogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2UvY29udHJhY3QucHk6NzgKICAgIC8vIHNlbGYuZGVwb3NpdGVkW1R4bi5zZW5kZXJdIC09IGFtb3VudC5uYXRpdmUKICAgIGJ5dGVjXzAgLy8gImRlcG9zaXRlZCIKICAgIHR4biBTZW5kZXIKICAgIGNvbmNhdAogICAgZHVwCiAgICBib3hfZ2V0CiAgICBzd2FwCiAgICBidG9pCiAgICBzd2FwCiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5kZXBvc2l0ZWQgZW50cnkgZXhpc3RzCiAgICBmcmFtZV9kaWcgLTEKICAgIGJ0b2kKICAgIHN3YXAKICAgIGRpZyAxCiAgICAtCiAgICBpdG9iCiAgICB1bmNvdmVyIDIKICAgIHN3YXAKICAgIGJveF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjgwCiAgICAvLyBpdHhuLlBheW1lbnQocmVjZWl2ZXI9VHhuLnNlbmRlciwgYW1vdW50PWFtb3VudC5uYXRpdmUpLnN1Ym1pdCgpCiAgICBpdHhuX2JlZ2luCiAgICB0eG4gU2VuZGVyCiAgICBpdHhuX2ZpZWxkIFJlY2VpdmVyCiAgICBpdHhuX2ZpZWxkIEFtb3VudAogICAgaW50Y18xIC8vIHBheQogICAgaXR4bl9maWVsZCBUeXBlRW51bQogICAgaW50Y18wIC8vIDAKICAgIGl0eG5fZmllbGQgRmVlCiAgICBpdHhuX3N1Ym1pdAogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLmRpZ2l0YWxfbWFya2V0cGxhY2UuY29udHJhY3QuRGlnaXRhbE1hcmtldHBsYWNlLnNwb25zb3JfYXNzZXQoYXNzZXQ6IHVpbnQ2NCkgLT4gdm9pZDoKc3BvbnNvcl9hc3NldDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjgyLTgzCiAgICAvLyBAYWJpbWV0aG9kCiAgICAvLyBkZWYgc3BvbnNvcl9hc3NldChzZWxmLCBhc3NldDogQXNzZXQpIC0+IE5vbmU6CiAgICBwcm90byAxIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5Ojg0CiAgICAvLyBhc3NlcnQgbm90IEdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MuaXNfb3B0ZWRfaW4oCiAgICBnbG9iYWwgQ3VycmVudEFwcGxpY2F0aW9uQWRkcmVzcwogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2UvY29udHJhY3QucHk6ODQtODYKICAgIC8vIGFzc2VydCBub3QgR2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcy5pc19vcHRlZF9pbigKICAgIC8vICAgICBhc3NldAogICAgLy8gKSwgZXJyLkFMUkVBRFlfT1BURURfSU4KICAgIGZyYW1lX2RpZyAtMQogICAgYXNzZXRfaG9sZGluZ19nZXQgQXNzZXRCYWxhbmNlCiAgICBidXJ5IDEKICAgICEKICAgIGFzc2VydCAvLyBBbHJlYWR5IG9wdGVkIGluCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weTo4NwogICAgLy8gYXNzZXJ0IGFzc2V0LmNsYXdiYWNrID09IEdsb2JhbC56ZXJvX2FkZHJlc3MsIGVyci5DTEFXQkFDS19BU0EKICAgIGZyYW1lX2RpZyAtMQogICAgYXNzZXRfcGFyYW1zX2dldCBBc3NldENsYXdiYWNrCiAgICBhc3NlcnQgLy8gYXNzZXQgZXhpc3RzCiAgICBnbG9iYWwgWmVyb0FkZHJlc3MKICAgID09CiAgICBhc3NlcnQgLy8gQ2xhd2JhY2sgQVNBCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weTo4OQogICAgLy8gc2VsZi5kZXBvc2l0ZWRbVHhuLnNlbmRlcl0gLT0gR2xvYmFsLmFzc2V0X29wdF9pbl9taW5fYmFsYW5jZQogICAgYnl0ZWNfMCAvLyAiZGVwb3NpdGVkIgogICAgdHhuIFNlbmRlcgogICAgY29uY2F0CiAgICBkdXAKICAgIGJveF9nZXQKICAgIHN3YXAKICAgIGJ0b2kKICAgIHN3YXAKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmRlcG9zaXRlZCBlbnRyeSBleGlzdHMKICAgIGdsb2JhbCBBc3NldE9wdEluTWluQmFsYW5jZQogICAgLQogICAgaXRvYgogICAgYm94X3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2UvY29udHJhY3QucHk6OTEtOTUKICAgIC8vIGl0eG4uQXNzZXRUcmFuc2ZlcigKICAgIC8vICAgICB4ZmVyX2Fzc2V0PWFzc2V0LAogICAgLy8gICAgIGFzc2V0X3JlY2VpdmVyPUdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MsCiAgICAvLyAgICAgYXNzZXRfYW1vdW50PTAsCiAgICAvLyApLnN1Ym1pdCgpCiAgICBpdHhuX2JlZ2luCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weTo5MwogICAgLy8gYXNzZXRfcmVjZWl2ZXI9R2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcywKICAgIGdsb2JhbCBDdXJyZW50QXBwbGljYXRpb25BZGRyZXNzCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weTo5NAogICAgLy8gYXNzZXRfYW1vdW50PTAsCiAgICBpbnRjXzAgLy8gMAogICAgaXR4bl9maWVsZCBBc3NldEFtb3VudAogICAgaXR4bl9maWVsZCBBc3NldFJlY2VpdmVyCiAgICBmcmFtZV9kaWcgLTEKICAgIGl0eG5fZmllbGQgWGZlckFzc2V0CiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weTo5MQogICAgLy8gaXR4bi5Bc3NldFRyYW5zZmVyKAogICAgaW50Y18zIC8vIGF4ZmVyCiAgICBpdHhuX2ZpZWxkIFR5cGVFbnVtCiAgICBpbnRjXzAgLy8gMAogICAgaXR4bl9maWVsZCBGZWUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjkxLTk1CiAgICAvLyBpdHhuLkFzc2V0VHJhbnNmZXIoCiAgICAvLyAgICAgeGZlcl9hc3NldD1hc3NldCwKICAgIC8vICAgICBhc3NldF9yZWNlaXZlcj1HbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzLAogICAgLy8gICAgIGFzc2V0X2Ftb3VudD0wLAogICAgLy8gKS5zdWJtaXQoKQogICAgaXR4bl9zdWJtaXQKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5kaWdpdGFsX21hcmtldHBsYWNlLmNvbnRyYWN0LkRpZ2l0YWxNYXJrZXRwbGFjZS5vcGVuX3NhbGUoYXNzZXRfZGVwb3NpdDogdWludDY0LCBjb3N0OiBieXRlcykgLT4gdm9pZDoKb3Blbl9zYWxlOgogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2UvY29udHJhY3QucHk6OTctMTAwCiAgICAvLyBAYWJpbWV0aG9kCiAgICAvLyBkZWYgb3Blbl9zYWxlKAogICAgLy8gICAgIHNlbGYsIGFzc2V0X2RlcG9zaXQ6IGd0eG4uQXNzZXRUcmFuc2ZlclRyYW5zYWN0aW9uLCBjb3N0OiBhcmM0LlVJbnQ2NAogICAgLy8gKSAtPiBOb25lOgogICAgcHJvdG8gMiAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weToxMDEKICAgIC8vIGFzc2VydCBhc3NldF9kZXBvc2l0LnNlbmRlciA9PSBUeG4uc2VuZGVyLCBlcnIuRElGRkVSRU5UX1NFTkRFUgogICAgZnJhbWVfZGlnIC0yCiAgICBndHhucyBTZW5kZXIKICAgIHR4biBTZW5kZXIKICAgID09CiAgICBhc3NlcnQgLy8gRGlmZmVyZW50IHNlbmRlcgogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2UvY29udHJhY3QucHk6MTAzCiAgICAvLyBhc3NldF9kZXBvc2l0LmFzc2V0X3JlY2VpdmVyID09IEdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MKICAgIGZyYW1lX2RpZyAtMgogICAgZ3R4bnMgQXNzZXRSZWNlaXZlcgogICAgZ2xvYmFsIEN1cnJlbnRBcHBsaWNhdGlvbkFkZHJlc3MKICAgID09CiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weToxMDItMTA0CiAgICAvLyBhc3NlcnQgKAogICAgLy8gICAgIGFzc2V0X2RlcG9zaXQuYXNzZXRfcmVjZWl2ZXIgPT0gR2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcwogICAgLy8gKSwgZXJyLldST05HX1JFQ0VJVkVSCiAgICBhc3NlcnQgLy8gV3JvbmcgcmVjZWl2ZXIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjEwNwogICAgLy8gYXJjNC5BZGRyZXNzKFR4bi5zZW5kZXIpLCBhcmM0LlVJbnQ2NChhc3NldF9kZXBvc2l0LnhmZXJfYXNzZXQuaWQpCiAgICB0eG4gU2VuZGVyCiAgICBmcmFtZV9kaWcgLTIKICAgIGd0eG5zIFhmZXJBc3NldAogICAgaXRvYgogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2UvY29udHJhY3QucHk6MTA2LTEwOAogICAgLy8gc2FsZV9rZXkgPSBTYWxlS2V5KAogICAgLy8gICAgIGFyYzQuQWRkcmVzcyhUeG4uc2VuZGVyKSwgYXJjNC5VSW50NjQoYXNzZXRfZGVwb3NpdC54ZmVyX2Fzc2V0LmlkKQogICAgLy8gKQogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weToxMDkKICAgIC8vIGFzc2VydCBzYWxlX2tleSBub3QgaW4gc2VsZi5zYWxlcywgZXJyLlNBTEVfQUxSRUFEWV9FWElTVFMKICAgIGJ5dGVjXzIgLy8gInNhbGVzIgogICAgc3dhcAogICAgY29uY2F0CiAgICBkdXAKICAgIGJveF9sZW4KICAgIGJ1cnkgMQogICAgIQogICAgYXNzZXJ0IC8vIFNhbGUgYWxyZWFkeSBleGlzdHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjExMQogICAgLy8gbWJyX2Jhc2VsaW5lID0gR2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcy5taW5fYmFsYW5jZQogICAgZ2xvYmFsIEN1cnJlbnRBcHBsaWNhdGlvbkFkZHJlc3MKICAgIGFjY3RfcGFyYW1zX2dldCBBY2N0TWluQmFsYW5jZQogICAgYXNzZXJ0IC8vIGFjY291bnQgZnVuZGVkCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weToxMTMKICAgIC8vIGFyYzQuVUludDY0KGFzc2V0X2RlcG9zaXQuYXNzZXRfYW1vdW50KSwKICAgIGZyYW1lX2RpZyAtMgogICAgZ3R4bnMgQXNzZXRBbW91bnQKICAgIGl0b2IKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjExMi0xMTYKICAgIC8vIHNlbGYuc2FsZXNbc2FsZV9rZXldID0gU2FsZSgKICAgIC8vICAgICBhcmM0LlVJbnQ2NChhc3NldF9kZXBvc2l0LmFzc2V0X2Ftb3VudCksCiAgICAvLyAgICAgY29zdCwKICAgIC8vICAgICBCaWQoYXJjNC5BZGRyZXNzKCksIGFyYzQuVUludDY0KCkpLAogICAgLy8gKQogICAgZnJhbWVfZGlnIC0xCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjExNQogICAgLy8gQmlkKGFyYzQuQWRkcmVzcygpLCBhcmM0LlVJbnQ2NCgpKSwKICAgIHB1c2hieXRlcyBiYXNlMzIoQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQSkKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjExMi0xMTYKICAgIC8vIHNlbGYuc2FsZXNbc2FsZV9rZXldID0gU2FsZSgKICAgIC8vICAgICBhcmM0LlVJbnQ2NChhc3NldF9kZXBvc2l0LmFzc2V0X2Ftb3VudCksCiAgICAvLyAgICAgY29zdCwKICAgIC8vICAgICBCaWQoYXJjNC5BZGRyZXNzKCksIGFyYzQuVUludDY0KCkpLAogICAgLy8gKQogICAgY29uY2F0CiAgICB1bmNvdmVyIDIKICAgIHN3YXAKICAgIGJveF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjExNwogICAgLy8gbWJyX2RpZmYgPSBHbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzLm1pbl9iYWxhbmNlIC0gbWJyX2Jhc2VsaW5lCiAgICBnbG9iYWwgQ3VycmVudEFwcGxpY2F0aW9uQWRkcmVzcwogICAgYWNjdF9wYXJhbXNfZ2V0IEFjY3RNaW5CYWxhbmNlCiAgICBhc3NlcnQgLy8gYWNjb3VudCBmdW5kZWQKICAgIHN3YXAKICAgIC0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjExOQogICAgLy8gc2VsZi5kZXBvc2l0ZWRbVHhuLnNlbmRlcl0gLT0gbWJyX2RpZmYKICAgIGJ5dGVjXzAgLy8gImRlcG9zaXRlZCIKICAgIHR4biBTZW5kZXIKICAgIGNvbmNhdAogICAgZHVwCiAgICBib3hfZ2V0CiAgICBzd2FwCiAgICBidG9pCiAgICBzd2FwCiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5kZXBvc2l0ZWQgZW50cnkgZXhpc3RzCiAgICB1bmNvdmVyIDIKICAgIC0KICAgIGl0b2IKICAgIGJveF9wdXQKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5kaWdpdGFsX21hcmtldHBsYWNlLmNvbnRyYWN0LkRpZ2l0YWxNYXJrZXRwbGFjZS5jbG9zZV9zYWxlKGFzc2V0OiB1aW50NjQpIC0+IHZvaWQ6CmNsb3NlX3NhbGU6CiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weToxMjEtMTIyCiAgICAvLyBAYWJpbWV0aG9kCiAgICAvLyBkZWYgY2xvc2Vfc2FsZShzZWxmLCBhc3NldDogQXNzZXQpIC0+IE5vbmU6CiAgICBwcm90byAxIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjEyMwogICAgLy8gc2FsZV9rZXkgPSBTYWxlS2V5KGFyYzQuQWRkcmVzcyhUeG4uc2VuZGVyKSwgYXJjNC5VSW50NjQoYXNzZXQuaWQpKQogICAgdHhuIFNlbmRlcgogICAgZnJhbWVfZGlnIC0xCiAgICBpdG9iCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjEyNS0xMjkKICAgIC8vIGl0eG4uQXNzZXRUcmFuc2ZlcigKICAgIC8vICAgICB4ZmVyX2Fzc2V0PWFzc2V0LAogICAgLy8gICAgIGFzc2V0X3JlY2VpdmVyPVR4bi5zZW5kZXIsCiAgICAvLyAgICAgYXNzZXRfYW1vdW50PXNlbGYuc2FsZXNbc2FsZV9rZXldLmFtb3VudC5uYXRpdmUsCiAgICAvLyApLnN1Ym1pdCgpCiAgICBpdHhuX2JlZ2luCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weToxMjcKICAgIC8vIGFzc2V0X3JlY2VpdmVyPVR4bi5zZW5kZXIsCiAgICB0eG4gU2VuZGVyCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weToxMjgKICAgIC8vIGFzc2V0X2Ftb3VudD1zZWxmLnNhbGVzW3NhbGVfa2V5XS5hbW91bnQubmF0aXZlLAogICAgYnl0ZWNfMiAvLyAic2FsZXMiCiAgICB1bmNvdmVyIDIKICAgIGNvbmNhdAogICAgZHVwCiAgICBib3hfZ2V0CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5zYWxlcyBlbnRyeSBleGlzdHMKICAgIGludGNfMCAvLyAwCiAgICBleHRyYWN0X3VpbnQ2NAogICAgaXR4bl9maWVsZCBBc3NldEFtb3VudAogICAgc3dhcAogICAgaXR4bl9maWVsZCBBc3NldFJlY2VpdmVyCiAgICBmcmFtZV9kaWcgLTEKICAgIGl0eG5fZmllbGQgWGZlckFzc2V0CiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weToxMjUKICAgIC8vIGl0eG4uQXNzZXRUcmFuc2ZlcigKICAgIGludGNfMyAvLyBheGZlcgogICAgaXR4bl9maWVsZCBUeXBlRW51bQogICAgaW50Y18wIC8vIDAKICAgIGl0eG5fZmllbGQgRmVlCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weToxMjUtMTI5CiAgICAvLyBpdHhuLkFzc2V0VHJhbnNmZXIoCiAgICAvLyAgICAgeGZlcl9hc3NldD1hc3NldCwKICAgIC8vICAgICBhc3NldF9yZWNlaXZlcj1UeG4uc2VuZGVyLAogICAgLy8gICAgIGFzc2V0X2Ftb3VudD1zZWxmLnNhbGVzW3NhbGVfa2V5XS5hbW91bnQubmF0aXZlLAogICAgLy8gKS5zdWJtaXQoKQogICAgaXR4bl9zdWJtaXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjEzMQogICAgLy8gbWJyX2Jhc2VsaW5lID0gR2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcy5taW5fYmFsYW5jZQogICAgZ2xvYmFsIEN1cnJlbnRBcHBsaWNhdGlvbkFkZHJlc3MKICAgIGFjY3RfcGFyYW1zX2dldCBBY2N0TWluQmFsYW5jZQogICAgYXNzZXJ0IC8vIGFjY291bnQgZnVuZGVkCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weToxMzIKICAgIC8vIGRlbCBzZWxmLnNhbGVzW3NhbGVfa2V5XQogICAgc3dhcAogICAgYm94X2RlbAogICAgcG9wCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weToxMzMKICAgIC8vIG1icl9kaWZmID0gbWJyX2Jhc2VsaW5lIC0gR2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcy5taW5fYmFsYW5jZQogICAgZ2xvYmFsIEN1cnJlbnRBcHBsaWNhdGlvbkFkZHJlc3MKICAgIGFjY3RfcGFyYW1zX2dldCBBY2N0TWluQmFsYW5jZQogICAgYXNzZXJ0IC8vIGFjY291bnQgZnVuZGVkCiAgICAtCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weToxMzQKICAgIC8vIHNlbGYuZGVwb3NpdGVkW1R4bi5zZW5kZXJdICs9IG1icl9kaWZmCiAgICBieXRlY18wIC8vICJkZXBvc2l0ZWQiCiAgICB0eG4gU2VuZGVyCiAgICBjb25jYXQKICAgIGR1cAogICAgYm94X2dldAogICAgc3dhcAogICAgYnRvaQogICAgc3dhcAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuZGVwb3NpdGVkIGVudHJ5IGV4aXN0cwogICAgdW5jb3ZlciAyCiAgICArCiAgICBpdG9iCiAgICBib3hfcHV0CiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuZGlnaXRhbF9tYXJrZXRwbGFjZS5jb250cmFjdC5EaWdpdGFsTWFya2V0cGxhY2UuYnV5KHNhbGVfa2V5OiBieXRlcykgLT4gdm9pZDoKYnV5OgogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2UvY29udHJhY3QucHk6MTM2LTEzNwogICAgLy8gQGFiaW1ldGhvZAogICAgLy8gZGVmIGJ1eShzZWxmLCBzYWxlX2tleTogU2FsZUtleSkgLT4gTm9uZToKICAgIHByb3RvIDEgMAogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2UvY29udHJhY3QucHk6MTM4CiAgICAvLyBhc3NlcnQgVHhuLnNlbmRlciAhPSBzYWxlX2tleS5vd25lci5uYXRpdmUsIGVyci5TRUxMRVJfQ0FOVF9CRV9CVVlFUgogICAgdHhuIFNlbmRlcgogICAgZnJhbWVfZGlnIC0xCiAgICBleHRyYWN0IDAgMzIgLy8gb24gZXJyb3I6IEluZGV4IGFjY2VzcyBpcyBvdXQgb2YgYm91bmRzCiAgICBzd2FwCiAgICBkaWcgMQogICAgIT0KICAgIGFzc2VydCAvLyBTZWxsZXIgY2Fubm90IGJlIGJ1eWVyCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weToxMzkKICAgIC8vIHNhbGUgPSBzZWxmLnNhbGVzW3NhbGVfa2V5XQogICAgYnl0ZWNfMiAvLyAic2FsZXMiCiAgICBmcmFtZV9kaWcgLTEKICAgIGNvbmNhdAogICAgZHVwCiAgICBib3hfZ2V0CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5zYWxlcyBlbnRyeSBleGlzdHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjE0MS0xNDUKICAgIC8vIGl0eG4uQXNzZXRUcmFuc2ZlcigKICAgIC8vICAgICB4ZmVyX2Fzc2V0PXNhbGVfa2V5LmFzc2V0Lm5hdGl2ZSwKICAgIC8vICAgICBhc3NldF9yZWNlaXZlcj1UeG4uc2VuZGVyLAogICAgLy8gICAgIGFzc2V0X2Ftb3VudD1zYWxlLmFtb3VudC5uYXRpdmUsCiAgICAvLyApLnN1Ym1pdCgpCiAgICBpdHhuX2JlZ2luCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weToxNDIKICAgIC8vIHhmZXJfYXNzZXQ9c2FsZV9rZXkuYXNzZXQubmF0aXZlLAogICAgZnJhbWVfZGlnIC0xCiAgICBwdXNoaW50IDMyIC8vIDMyCiAgICBleHRyYWN0X3VpbnQ2NAogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2UvY29udHJhY3QucHk6MTQzCiAgICAvLyBhc3NldF9yZWNlaXZlcj1UeG4uc2VuZGVyLAogICAgdHhuIFNlbmRlcgogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2UvY29udHJhY3QucHk6MTQ0CiAgICAvLyBhc3NldF9hbW91bnQ9c2FsZS5hbW91bnQubmF0aXZlLAogICAgZGlnIDIKICAgIGludGNfMCAvLyAwCiAgICBleHRyYWN0X3VpbnQ2NAogICAgaXR4bl9maWVsZCBBc3NldEFtb3VudAogICAgaXR4bl9maWVsZCBBc3NldFJlY2VpdmVyCiAgICBpdHhuX2ZpZWxkIFhmZXJBc3NldAogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2UvY29udHJhY3QucHk6MTQxCiAgICAvLyBpdHhuLkFzc2V0VHJhbnNmZXIoCiAgICBpbnRjXzMgLy8gYXhmZXIKICAgIGl0eG5fZmllbGQgVHlwZUVudW0KICAgIGludGNfMCAvLyAwCiAgICBpdHhuX2ZpZWxkIEZlZQogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2UvY29udHJhY3QucHk6MTQxLTE0NQogICAgLy8gaXR4bi5Bc3NldFRyYW5zZmVyKAogICAgLy8gICAgIHhmZXJfYXNzZXQ9c2FsZV9rZXkuYXNzZXQubmF0aXZlLAogICAgLy8gICAgIGFzc2V0X3JlY2VpdmVyPVR4bi5zZW5kZXIsCiAgICAvLyAgICAgYXNzZXRfYW1vdW50PXNhbGUuYW1vdW50Lm5hdGl2ZSwKICAgIC8vICkuc3VibWl0KCkKICAgIGl0eG5fc3VibWl0CiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weToxNDcKICAgIC8vIG1icl9iYXNlbGluZSA9IEdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MubWluX2JhbGFuY2UKICAgIGdsb2JhbCBDdXJyZW50QXBwbGljYXRpb25BZGRyZXNzCiAgICBhY2N0X3BhcmFtc19nZXQgQWNjdE1pbkJhbGFuY2UKICAgIGFzc2VydCAvLyBhY2NvdW50IGZ1bmRlZAogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2UvY29udHJhY3QucHk6MTQ4CiAgICAvLyBkZWwgc2VsZi5zYWxlc1tzYWxlX2tleV0KICAgIHVuY292ZXIgMgogICAgYm94X2RlbAogICAgcG9wCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weToxNDkKICAgIC8vIG1icl9kaWZmID0gbWJyX2Jhc2VsaW5lIC0gR2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcy5taW5fYmFsYW5jZQogICAgZ2xvYmFsIEN1cnJlbnRBcHBsaWNhdGlvbkFkZHJlc3MKICAgIGFjY3RfcGFyYW1zX2dldCBBY2N0TWluQmFsYW5jZQogICAgYXNzZXJ0IC8vIGFjY291bnQgZnVuZGVkCiAgICAtCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weToxNTEKICAgIC8vIHNlbGYuZGVwb3NpdGVkW1R4bi5zZW5kZXJdIC09IHNhbGUuY29zdC5uYXRpdmUKICAgIGJ5dGVjXzAgLy8gImRlcG9zaXRlZCIKICAgIHR4biBTZW5kZXIKICAgIGNvbmNhdAogICAgZHVwCiAgICBib3hfZ2V0CiAgICBzd2FwCiAgICBidG9pCiAgICBzd2FwCiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5kZXBvc2l0ZWQgZW50cnkgZXhpc3RzCiAgICB1bmNvdmVyIDMKICAgIHB1c2hpbnQgOCAvLyA4CiAgICBleHRyYWN0X3VpbnQ2NAogICAgc3dhcAogICAgZGlnIDEKICAgIC0KICAgIGl0b2IKICAgIHVuY292ZXIgMgogICAgc3dhcAogICAgYm94X3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2UvY29udHJhY3QucHk6MTUyCiAgICAvLyBzZWxmLmRlcG9zaXRlZFtzYWxlX2tleS5vd25lci5uYXRpdmVdICs9IHNhbGUuY29zdC5uYXRpdmUgKyBtYnJfZGlmZgogICAgYnl0ZWNfMCAvLyAiZGVwb3NpdGVkIgogICAgdW5jb3ZlciAzCiAgICBjb25jYXQKICAgIGR1cAogICAgYm94X2dldAogICAgc3dhcAogICAgYnRvaQogICAgc3dhcAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuZGVwb3NpdGVkIGVudHJ5IGV4aXN0cwogICAgdW5jb3ZlciAyCiAgICB1bmNvdmVyIDMKICAgICsKICAgICsKICAgIGl0b2IKICAgIGJveF9wdXQKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5kaWdpdGFsX21hcmtldHBsYWNlLmNvbnRyYWN0LkRpZ2l0YWxNYXJrZXRwbGFjZS5iaWQoc2FsZV9rZXk6IGJ5dGVzLCBuZXdfYmlkX2Ftb3VudDogYnl0ZXMpIC0+IHZvaWQ6CmJpZDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjE1NC0xNTUKICAgIC8vIEBhYmltZXRob2QKICAgIC8vIGRlZiBiaWQoc2VsZiwgc2FsZV9rZXk6IFNhbGVLZXksIG5ld19iaWRfYW1vdW50OiBhcmM0LlVJbnQ2NCkgLT4gTm9uZToKICAgIHByb3RvIDIgMAogICAgaW50Y18wIC8vIDAKICAgIGR1cAogICAgYnl0ZWNfMyAvLyAiIgogICAgZHVwCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weToxNTYKICAgIC8vIG5ld19iaWQgPSBCaWQoYmlkZGVyPWFyYzQuQWRkcmVzcyhUeG4uc2VuZGVyKSwgYW1vdW50PW5ld19iaWRfYW1vdW50KQogICAgdHhuIFNlbmRlcgogICAgZnJhbWVfZGlnIC0xCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjE1OAogICAgLy8gYXNzZXJ0IFR4bi5zZW5kZXIgIT0gc2FsZV9rZXkub3duZXIsIGVyci5TRUxMRVJfQ0FOVF9CRV9CSURERVIKICAgIGZyYW1lX2RpZyAtMgogICAgZXh0cmFjdCAwIDMyIC8vIG9uIGVycm9yOiBJbmRleCBhY2Nlc3MgaXMgb3V0IG9mIGJvdW5kcwogICAgdHhuIFNlbmRlcgogICAgIT0KICAgIGFzc2VydCAvLyBTZWxsZXIgY2Fubm90IGJlIGJpZGRlcgogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2UvY29udHJhY3QucHk6MTYwCiAgICAvLyBzYWxlID0gc2VsZi5zYWxlc1tzYWxlX2tleV0KICAgIGJ5dGVjXzIgLy8gInNhbGVzIgogICAgZnJhbWVfZGlnIC0yCiAgICBjb25jYXQKICAgIGR1cAogICAgYm94X2dldAogICAgc3dhcAogICAgZHVwCiAgICB1bmNvdmVyIDIKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnNhbGVzIGVudHJ5IGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2UvY29udHJhY3QucHk6MTYxCiAgICAvLyBpZiBzYWxlLmJpZC5iaWRkZXI6CiAgICBleHRyYWN0IDE2IDQwIC8vIG9uIGVycm9yOiBJbmRleCBhY2Nlc3MgaXMgb3V0IG9mIGJvdW5kcwogICAgZHVwCiAgICBleHRyYWN0IDAgMzIgLy8gb24gZXJyb3I6IEluZGV4IGFjY2VzcyBpcyBvdXQgb2YgYm91bmRzCiAgICBnbG9iYWwgWmVyb0FkZHJlc3MKICAgICE9CiAgICBieiBiaWRfYWZ0ZXJfaWZfZWxzZUAyCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weToxNjIKICAgIC8vIGFzc2VydCBzYWxlLmJpZC5hbW91bnQubmF0aXZlIDwgbmV3X2JpZF9hbW91bnQubmF0aXZlLCBlcnIuV09SU0VfQklECiAgICBmcmFtZV9kaWcgNwogICAgcHVzaGludCAzMiAvLyAzMgogICAgZXh0cmFjdF91aW50NjQKICAgIGZyYW1lX2RpZyAtMQogICAgYnRvaQogICAgPAogICAgYXNzZXJ0IC8vIFdvcnNlIGJpZAoKYmlkX2FmdGVyX2lmX2Vsc2VAMjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjE2NAogICAgLy8gc2VsZi5zYWxlc1tzYWxlX2tleV0gPSBzYWxlLl9yZXBsYWNlKGJpZD1uZXdfYmlkKQogICAgZnJhbWVfZGlnIDYKICAgIGR1cAogICAgZXh0cmFjdCAwIDggLy8gb24gZXJyb3I6IEluZGV4IGFjY2VzcyBpcyBvdXQgb2YgYm91bmRzCiAgICBzd2FwCiAgICBleHRyYWN0IDggOCAvLyBvbiBlcnJvcjogSW5kZXggYWNjZXNzIGlzIG91dCBvZiBib3VuZHMKICAgIGNvbmNhdAogICAgZnJhbWVfZGlnIDQKICAgIGNvbmNhdAogICAgZnJhbWVfZGlnIDUKICAgIHN3YXAKICAgIGJveF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjE2NgogICAgLy8gbWJyX2Jhc2VsaW5lID0gR2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcy5taW5fYmFsYW5jZQogICAgZ2xvYmFsIEN1cnJlbnRBcHBsaWNhdGlvbkFkZHJlc3MKICAgIGFjY3RfcGFyYW1zX2dldCBBY2N0TWluQmFsYW5jZQogICAgc3dhcAogICAgZnJhbWVfYnVyeSAzCiAgICBhc3NlcnQgLy8gYWNjb3VudCBmdW5kZWQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjE2NwogICAgLy8gbmV3X2JpZF9yZWNlaXB0ID0gQmlkUmVjZWlwdChzYWxlX2tleSwgbmV3X2JpZF9hbW91bnQpCiAgICBmcmFtZV9kaWcgLTIKICAgIGZyYW1lX2RpZyAtMQogICAgY29uY2F0CiAgICBmcmFtZV9idXJ5IDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjE2OAogICAgLy8gcmVjZWlwdF9ib29rLCBleGlzdHMgPSBzZWxmLnJlY2VpcHRfYm9vay5tYXliZShUeG4uc2VuZGVyKQogICAgYnl0ZWNfMSAvLyAicmVjZWlwdF9ib29rIgogICAgdHhuIFNlbmRlcgogICAgY29uY2F0CiAgICBib3hfZ2V0CiAgICBzd2FwCiAgICBmcmFtZV9idXJ5IDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjE2OQogICAgLy8gaWYgZXhpc3RzOgogICAgYnogYmlkX2Vsc2VfYm9keUA3CiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weToxNzAKICAgIC8vIGZvdW5kLCBpbmRleCA9IGZpbmRfYmlkX3JlY2VpcHQocmVjZWlwdF9ib29rLCBzYWxlX2tleSkKICAgIGZyYW1lX2RpZyAxCiAgICBmcmFtZV9kaWcgLTIKICAgIGNhbGxzdWIgZmluZF9iaWRfcmVjZWlwdAogICAgZnJhbWVfYnVyeSAyCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weToxNzEKICAgIC8vIGlmIGZvdW5kOgogICAgYnogYmlkX2Vsc2VfYm9keUA1CiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weToxNzIKICAgIC8vIHNlbGYuZGVwb3NpdGVkW1R4bi5zZW5kZXJdICs9IHJlY2VpcHRfYm9va1tpbmRleF0uYW1vdW50Lm5hdGl2ZQogICAgYnl0ZWNfMCAvLyAiZGVwb3NpdGVkIgogICAgdHhuIFNlbmRlcgogICAgY29uY2F0CiAgICBkdXAKICAgIGJveF9nZXQKICAgIHN3YXAKICAgIGJ0b2kKICAgIHN3YXAKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmRlcG9zaXRlZCBlbnRyeSBleGlzdHMKICAgIGZyYW1lX2RpZyAxCiAgICBkdXAKICAgIGNvdmVyIDIKICAgIGV4dHJhY3QgMiAwCiAgICBmcmFtZV9kaWcgMgogICAgZHVwCiAgICBjb3ZlciA0CiAgICBpbnRjXzIgLy8gNDgKICAgICoKICAgIHN3YXAKICAgIGRpZyAxCiAgICBpbnRjXzIgLy8gNDgKICAgIGV4dHJhY3QzIC8vIG9uIGVycm9yOiBJbmRleCBhY2Nlc3MgaXMgb3V0IG9mIGJvdW5kcwogICAgcHVzaGludCA0MCAvLyA0MAogICAgZXh0cmFjdF91aW50NjQKICAgIHVuY292ZXIgMgogICAgKwogICAgaXRvYgogICAgdW5jb3ZlciA0CiAgICBzd2FwCiAgICBib3hfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weToxNzMtMTc1CiAgICAvLyBzZWxmLnJlY2VpcHRfYm9va1tUeG4uc2VuZGVyXSA9IHJlY2VpcHRfYm9vay5yZXBsYWNlKAogICAgLy8gICAgIGluZGV4LCBuZXdfYmlkX3JlY2VpcHQKICAgIC8vICkKICAgIGRpZyAxCiAgICBpbnRjXzAgLy8gMAogICAgZXh0cmFjdF91aW50MTYKICAgIHVuY292ZXIgMwogICAgPgogICAgYXNzZXJ0IC8vIEluZGV4IGFjY2VzcyBpcyBvdXQgb2YgYm91bmRzCiAgICBwdXNoaW50IDIgLy8gMgogICAgKwogICAgZnJhbWVfZGlnIDAKICAgIHJlcGxhY2UzCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weToxNzMKICAgIC8vIHNlbGYucmVjZWlwdF9ib29rW1R4bi5zZW5kZXJdID0gcmVjZWlwdF9ib29rLnJlcGxhY2UoCiAgICBieXRlY18xIC8vICJyZWNlaXB0X2Jvb2siCiAgICB0eG4gU2VuZGVyCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjE3My0xNzUKICAgIC8vIHNlbGYucmVjZWlwdF9ib29rW1R4bi5zZW5kZXJdID0gcmVjZWlwdF9ib29rLnJlcGxhY2UoCiAgICAvLyAgICAgaW5kZXgsIG5ld19iaWRfcmVjZWlwdAogICAgLy8gKQogICAgZHVwCiAgICBib3hfZGVsCiAgICBwb3AKICAgIHN3YXAKICAgIGJveF9wdXQKCmJpZF9hZnRlcl9pZl9lbHNlQDg6CiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weToxODAKICAgIC8vIG1icl9kaWZmID0gR2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcy5taW5fYmFsYW5jZSAtIG1icl9iYXNlbGluZQogICAgZ2xvYmFsIEN1cnJlbnRBcHBsaWNhdGlvbkFkZHJlc3MKICAgIGFjY3RfcGFyYW1zX2dldCBBY2N0TWluQmFsYW5jZQogICAgYXNzZXJ0IC8vIGFjY291bnQgZnVuZGVkCiAgICBmcmFtZV9kaWcgMwogICAgLQogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2UvY29udHJhY3QucHk6MTgyCiAgICAvLyBzZWxmLmRlcG9zaXRlZFtUeG4uc2VuZGVyXSAtPSBuZXdfYmlkX2Ftb3VudC5uYXRpdmUgKyBtYnJfZGlmZgogICAgYnl0ZWNfMCAvLyAiZGVwb3NpdGVkIgogICAgdHhuIFNlbmRlcgogICAgY29uY2F0CiAgICBkdXAKICAgIGJveF9nZXQKICAgIHN3YXAKICAgIGJ0b2kKICAgIHN3YXAKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmRlcG9zaXRlZCBlbnRyeSBleGlzdHMKICAgIGZyYW1lX2RpZyAtMQogICAgYnRvaQogICAgdW5jb3ZlciAzCiAgICArCiAgICAtCiAgICBpdG9iCiAgICBib3hfcHV0CiAgICByZXRzdWIKCmJpZF9lbHNlX2JvZHlANToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjE3NwogICAgLy8gc2VsZi5yZWNlaXB0X2Jvb2tbVHhuLnNlbmRlcl0gPSByZWNlaXB0X2Jvb2suYXBwZW5kKG5ld19iaWRfcmVjZWlwdCkKICAgIGZyYW1lX2RpZyAxCiAgICBleHRyYWN0IDIgMAogICAgZnJhbWVfZGlnIDAKICAgIGNvbmNhdAogICAgZHVwCiAgICBsZW4KICAgIGludGNfMiAvLyA0OAogICAgLwogICAgaXRvYgogICAgZXh0cmFjdCA2IDIKICAgIHN3YXAKICAgIGNvbmNhdAogICAgYnl0ZWNfMSAvLyAicmVjZWlwdF9ib29rIgogICAgdHhuIFNlbmRlcgogICAgY29uY2F0CiAgICBkdXAKICAgIGJveF9kZWwKICAgIHBvcAogICAgc3dhcAogICAgYm94X3B1dAogICAgYiBiaWRfYWZ0ZXJfaWZfZWxzZUA4CgpiaWRfZWxzZV9ib2R5QDc6CiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weToxNzkKICAgIC8vIHNlbGYucmVjZWlwdF9ib29rW1R4bi5zZW5kZXJdID0gSW1tdXRhYmxlQXJyYXkobmV3X2JpZF9yZWNlaXB0KQogICAgcHVzaGJ5dGVzIDB4MDAwMQogICAgZnJhbWVfZGlnIDAKICAgIGNvbmNhdAogICAgYnl0ZWNfMSAvLyAicmVjZWlwdF9ib29rIgogICAgdHhuIFNlbmRlcgogICAgY29uY2F0CiAgICBkdXAKICAgIGJveF9kZWwKICAgIHBvcAogICAgc3dhcAogICAgYm94X3B1dAogICAgYiBiaWRfYWZ0ZXJfaWZfZWxzZUA4CgoKLy8gc21hcnRfY29udHJhY3RzLmRpZ2l0YWxfbWFya2V0cGxhY2UuY29udHJhY3QuRGlnaXRhbE1hcmtldHBsYWNlLmlzX2VuY3VtYmVyZWQoYmlkOiBieXRlcykgLT4gdWludDY0Ogppc19lbmN1bWJlcmVkOgogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2UvY29udHJhY3QucHk6MTg0LTE4NQogICAgLy8gQHN1YnJvdXRpbmUKICAgIC8vIGRlZiBpc19lbmN1bWJlcmVkKHNlbGYsIGJpZDogQmlkUmVjZWlwdCkgLT4gYm9vbDoKICAgIHByb3RvIDEgMQogICAgaW50Y18wIC8vIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjE4NgogICAgLy8gc2FsZSwgZXhpc3RzID0gc2VsZi5zYWxlcy5tYXliZShiaWQuc2FsZV9rZXkpCiAgICBmcmFtZV9kaWcgLTEKICAgIGV4dHJhY3QgMCA0MCAvLyBvbiBlcnJvcjogSW5kZXggYWNjZXNzIGlzIG91dCBvZiBib3VuZHMKICAgIGJ5dGVjXzIgLy8gInNhbGVzIgogICAgc3dhcAogICAgY29uY2F0CiAgICBib3hfZ2V0CiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weToxODcKICAgIC8vIHJldHVybiBleGlzdHMgYW5kIGJvb2woc2FsZS5iaWQuYmlkZGVyKSBhbmQgc2FsZS5iaWQuYmlkZGVyID09IFR4bi5zZW5kZXIKICAgIGJ6IGlzX2VuY3VtYmVyZWRfYm9vbF9mYWxzZUA0CiAgICBmcmFtZV9kaWcgMQogICAgZXh0cmFjdCAxNiA0MCAvLyBvbiBlcnJvcjogSW5kZXggYWNjZXNzIGlzIG91dCBvZiBib3VuZHMKICAgIGV4dHJhY3QgMCAzMiAvLyBvbiBlcnJvcjogSW5kZXggYWNjZXNzIGlzIG91dCBvZiBib3VuZHMKICAgIGR1cAogICAgZnJhbWVfYnVyeSAwCiAgICBnbG9iYWwgWmVyb0FkZHJlc3MKICAgICE9CiAgICBieiBpc19lbmN1bWJlcmVkX2Jvb2xfZmFsc2VANAogICAgZnJhbWVfZGlnIDAKICAgIHR4biBTZW5kZXIKICAgID09CiAgICBieiBpc19lbmN1bWJlcmVkX2Jvb2xfZmFsc2VANAogICAgaW50Y18xIC8vIDEKCmlzX2VuY3VtYmVyZWRfYm9vbF9tZXJnZUA1OgogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2UvY29udHJhY3QucHk6MTg3CiAgICAvLyByZXR1cm4gZXhpc3RzIGFuZCBib29sKHNhbGUuYmlkLmJpZGRlcikgYW5kIHNhbGUuYmlkLmJpZGRlciA9PSBUeG4uc2VuZGVyCiAgICBmcmFtZV9idXJ5IDAKICAgIHJldHN1YgoKaXNfZW5jdW1iZXJlZF9ib29sX2ZhbHNlQDQ6CiAgICBpbnRjXzAgLy8gMAogICAgYiBpc19lbmN1bWJlcmVkX2Jvb2xfbWVyZ2VANQoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5kaWdpdGFsX21hcmtldHBsYWNlLmNvbnRyYWN0LkRpZ2l0YWxNYXJrZXRwbGFjZS5jbGFpbV91bmVuY3VtYmVyZWRfYmlkcygpIC0+IHZvaWQ6CmNsYWltX3VuZW5jdW1iZXJlZF9iaWRzOgogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2UvY29udHJhY3QucHk6MTg5LTE5MAogICAgLy8gQGFiaW1ldGhvZAogICAgLy8gZGVmIGNsYWltX3VuZW5jdW1iZXJlZF9iaWRzKHNlbGYpIC0+IE5vbmU6CiAgICBwcm90byAwIDAKICAgIGJ5dGVjXzMgLy8gIiIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjE5MQogICAgLy8gZW5jdW1iZXJlZF9yZWNlaXB0cyA9IEltbXV0YWJsZUFycmF5W0JpZFJlY2VpcHRdKCkKICAgIGJ5dGVjIDQgLy8gMHgwMDAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weToxOTMKICAgIC8vIGZvciByZWNlaXB0IGluIHNlbGYucmVjZWlwdF9ib29rW1R4bi5zZW5kZXJdOgogICAgYnl0ZWNfMSAvLyAicmVjZWlwdF9ib29rIgogICAgdHhuIFNlbmRlcgogICAgY29uY2F0CiAgICBib3hfZ2V0CiAgICBzd2FwCiAgICBkdXAKICAgIHVuY292ZXIgMgogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYucmVjZWlwdF9ib29rIGVudHJ5IGV4aXN0cwogICAgaW50Y18wIC8vIDAKICAgIGV4dHJhY3RfdWludDE2CiAgICBpbnRjXzAgLy8gMAoKY2xhaW1fdW5lbmN1bWJlcmVkX2JpZHNfZm9yX2hlYWRlckAxOgogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2UvY29udHJhY3QucHk6MTkzCiAgICAvLyBmb3IgcmVjZWlwdCBpbiBzZWxmLnJlY2VpcHRfYm9va1tUeG4uc2VuZGVyXToKICAgIGZyYW1lX2RpZyA0CiAgICBmcmFtZV9kaWcgMwogICAgPAogICAgYnogY2xhaW1fdW5lbmN1bWJlcmVkX2JpZHNfYWZ0ZXJfZm9yQDcKICAgIGZyYW1lX2RpZyAyCiAgICBleHRyYWN0IDIgMAogICAgZnJhbWVfZGlnIDQKICAgIGludGNfMiAvLyA0OAogICAgKgogICAgaW50Y18yIC8vIDQ4CiAgICBleHRyYWN0MyAvLyBvbiBlcnJvcjogSW5kZXggYWNjZXNzIGlzIG91dCBvZiBib3VuZHMKICAgIGR1cAogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2UvY29udHJhY3QucHk6MTk0CiAgICAvLyBpZiBzZWxmLmlzX2VuY3VtYmVyZWQocmVjZWlwdCk6CiAgICBjYWxsc3ViIGlzX2VuY3VtYmVyZWQKICAgIGJ6IGNsYWltX3VuZW5jdW1iZXJlZF9iaWRzX2Vsc2VfYm9keUA0CiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weToxOTUKICAgIC8vIGVuY3VtYmVyZWRfcmVjZWlwdHMgPSBlbmN1bWJlcmVkX3JlY2VpcHRzLmFwcGVuZChyZWNlaXB0KQogICAgZnJhbWVfZGlnIDEKICAgIGV4dHJhY3QgMiAwCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzIgLy8gNDgKICAgIC8KICAgIGl0b2IKICAgIGV4dHJhY3QgNiAyCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGZyYW1lX2J1cnkgMQoKY2xhaW1fdW5lbmN1bWJlcmVkX2JpZHNfYWZ0ZXJfaWZfZWxzZUA1OgogICAgZnJhbWVfZGlnIDQKICAgIGludGNfMSAvLyAxCiAgICArCiAgICBmcmFtZV9idXJ5IDQKICAgIGIgY2xhaW1fdW5lbmN1bWJlcmVkX2JpZHNfZm9yX2hlYWRlckAxCgpjbGFpbV91bmVuY3VtYmVyZWRfYmlkc19lbHNlX2JvZHlANDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjE5NwogICAgLy8gc2VsZi5kZXBvc2l0ZWRbVHhuLnNlbmRlcl0gKz0gcmVjZWlwdC5hbW91bnQubmF0aXZlCiAgICBieXRlY18wIC8vICJkZXBvc2l0ZWQiCiAgICB0eG4gU2VuZGVyCiAgICBjb25jYXQKICAgIGR1cAogICAgYm94X2dldAogICAgc3dhcAogICAgYnRvaQogICAgc3dhcAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuZGVwb3NpdGVkIGVudHJ5IGV4aXN0cwogICAgdW5jb3ZlciAyCiAgICBwdXNoaW50IDQwIC8vIDQwCiAgICBleHRyYWN0X3VpbnQ2NAogICAgKwogICAgaXRvYgogICAgYm94X3B1dAogICAgYiBjbGFpbV91bmVuY3VtYmVyZWRfYmlkc19hZnRlcl9pZl9lbHNlQDUKCmNsYWltX3VuZW5jdW1iZXJlZF9iaWRzX2FmdGVyX2ZvckA3OgogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2UvY29udHJhY3QucHk6MTk5CiAgICAvLyBtYnJfYmFzZWxpbmUgPSBHbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzLm1pbl9iYWxhbmNlCiAgICBnbG9iYWwgQ3VycmVudEFwcGxpY2F0aW9uQWRkcmVzcwogICAgYWNjdF9wYXJhbXNfZ2V0IEFjY3RNaW5CYWxhbmNlCiAgICBzd2FwCiAgICBmcmFtZV9idXJ5IDAKICAgIGFzc2VydCAvLyBhY2NvdW50IGZ1bmRlZAogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2UvY29udHJhY3QucHk6MjAwCiAgICAvLyBpZiBlbmN1bWJlcmVkX3JlY2VpcHRzOgogICAgZnJhbWVfZGlnIDEKICAgIGludGNfMCAvLyAwCiAgICBleHRyYWN0X3VpbnQxNgogICAgYnogY2xhaW1fdW5lbmN1bWJlcmVkX2JpZHNfZWxzZV9ib2R5QDkKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjIwMQogICAgLy8gc2VsZi5yZWNlaXB0X2Jvb2tbVHhuLnNlbmRlcl0gPSBlbmN1bWJlcmVkX3JlY2VpcHRzCiAgICBieXRlY18xIC8vICJyZWNlaXB0X2Jvb2siCiAgICB0eG4gU2VuZGVyCiAgICBjb25jYXQKICAgIGR1cAogICAgYm94X2RlbAogICAgcG9wCiAgICBmcmFtZV9kaWcgMQogICAgYm94X3B1dAoKY2xhaW1fdW5lbmN1bWJlcmVkX2JpZHNfYWZ0ZXJfaWZfZWxzZUAxMDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjIwNAogICAgLy8gbWJyX2RpZmYgPSBtYnJfYmFzZWxpbmUgLSBHbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzLm1pbl9iYWxhbmNlCiAgICBnbG9iYWwgQ3VycmVudEFwcGxpY2F0aW9uQWRkcmVzcwogICAgYWNjdF9wYXJhbXNfZ2V0IEFjY3RNaW5CYWxhbmNlCiAgICBhc3NlcnQgLy8gYWNjb3VudCBmdW5kZWQKICAgIGZyYW1lX2RpZyAwCiAgICBzd2FwCiAgICAtCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weToyMDYKICAgIC8vIHNlbGYuZGVwb3NpdGVkW1R4bi5zZW5kZXJdICs9IG1icl9kaWZmCiAgICBieXRlY18wIC8vICJkZXBvc2l0ZWQiCiAgICB0eG4gU2VuZGVyCiAgICBjb25jYXQKICAgIGR1cAogICAgYm94X2dldAogICAgc3dhcAogICAgYnRvaQogICAgc3dhcAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuZGVwb3NpdGVkIGVudHJ5IGV4aXN0cwogICAgdW5jb3ZlciAyCiAgICArCiAgICBpdG9iCiAgICBib3hfcHV0CiAgICByZXRzdWIKCmNsYWltX3VuZW5jdW1iZXJlZF9iaWRzX2Vsc2VfYm9keUA5OgogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2UvY29udHJhY3QucHk6MjAzCiAgICAvLyBkZWwgc2VsZi5yZWNlaXB0X2Jvb2tbVHhuLnNlbmRlcl0KICAgIGJ5dGVjXzEgLy8gInJlY2VpcHRfYm9vayIKICAgIHR4biBTZW5kZXIKICAgIGNvbmNhdAogICAgYm94X2RlbAogICAgcG9wCiAgICBiIGNsYWltX3VuZW5jdW1iZXJlZF9iaWRzX2FmdGVyX2lmX2Vsc2VAMTAKCgovLyBzbWFydF9jb250cmFjdHMuZGlnaXRhbF9tYXJrZXRwbGFjZS5jb250cmFjdC5EaWdpdGFsTWFya2V0cGxhY2UuZ2V0X3RvdGFsX2FuZF91bmVuY3VtYmVyZWRfYmlkcygpIC0+IHVpbnQ2NCwgdWludDY0OgpnZXRfdG90YWxfYW5kX3VuZW5jdW1iZXJlZF9iaWRzOgogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2UvY29udHJhY3QucHk6MjA4LTIwOQogICAgLy8gQGFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgLy8gZGVmIGdldF90b3RhbF9hbmRfdW5lbmN1bWJlcmVkX2JpZHMoc2VsZikgLT4gVW5lbmN1bWJlcmVkQmlkc1JlY2VpcHQ6CiAgICBwcm90byAwIDIKICAgIGJ5dGVjXzMgLy8gIiIKICAgIGR1cG4gMgogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2UvY29udHJhY3QucHk6MjEwCiAgICAvLyB0b3RhbF9iaWRzID0gVUludDY0KDApCiAgICBpbnRjXzAgLy8gMAogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2UvY29udHJhY3QucHk6MjEwLTIxMQogICAgLy8gdG90YWxfYmlkcyA9IFVJbnQ2NCgwKQogICAgLy8gdW5lbmN1bWJlcmVkX2JpZHMgPSBVSW50NjQoMCkKICAgIGR1cG4gMwogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2UvY29udHJhY3QucHk6MjEzCiAgICAvLyByZWNlaXB0X2Jvb2ssIGV4aXN0cyA9IHNlbGYucmVjZWlwdF9ib29rLm1heWJlKFR4bi5zZW5kZXIpCiAgICBieXRlY18xIC8vICJyZWNlaXB0X2Jvb2siCiAgICB0eG4gU2VuZGVyCiAgICBjb25jYXQKICAgIGJveF9nZXQKICAgIHN3YXAKICAgIGNvdmVyIDMKICAgIHN3YXAKICAgIGNvdmVyIDIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjIxNAogICAgLy8gaWYgZXhpc3RzOgogICAgYnogZ2V0X3RvdGFsX2FuZF91bmVuY3VtYmVyZWRfYmlkc19hZnRlcl9pZl9lbHNlQDgKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjIxNQogICAgLy8gZm9yIHJlY2VpcHQgaW4gcmVjZWlwdF9ib29rOgogICAgZnJhbWVfZGlnIDUKICAgIGludGNfMCAvLyAwCiAgICBleHRyYWN0X3VpbnQxNgogICAgZnJhbWVfYnVyeSAwCiAgICBpbnRjXzAgLy8gMAogICAgZnJhbWVfYnVyeSAxCgpnZXRfdG90YWxfYW5kX3VuZW5jdW1iZXJlZF9iaWRzX2Zvcl9oZWFkZXJAMjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjIxNQogICAgLy8gZm9yIHJlY2VpcHQgaW4gcmVjZWlwdF9ib29rOgogICAgZnJhbWVfZGlnIDEKICAgIGZyYW1lX2RpZyAwCiAgICA8CiAgICBieiBnZXRfdG90YWxfYW5kX3VuZW5jdW1iZXJlZF9iaWRzX2FmdGVyX2ZvckA3CiAgICBmcmFtZV9kaWcgNQogICAgZXh0cmFjdCAyIDAKICAgIGZyYW1lX2RpZyAxCiAgICBpbnRjXzIgLy8gNDgKICAgICoKICAgIGludGNfMiAvLyA0OAogICAgZXh0cmFjdDMgLy8gb24gZXJyb3I6IEluZGV4IGFjY2VzcyBpcyBvdXQgb2YgYm91bmRzCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weToyMTYKICAgIC8vIHRvdGFsX2JpZHMgKz0gcmVjZWlwdC5hbW91bnQubmF0aXZlCiAgICBkdXAKICAgIHB1c2hpbnQgNDAgLy8gNDAKICAgIGV4dHJhY3RfdWludDY0CiAgICBkdXAKICAgIGZyYW1lX2J1cnkgMgogICAgZnJhbWVfZGlnIDMKICAgICsKICAgIGZyYW1lX2J1cnkgMwogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2UvY29udHJhY3QucHk6MjE3CiAgICAvLyBpZiBub3Qgc2VsZi5pc19lbmN1bWJlcmVkKHJlY2VpcHQpOgogICAgY2FsbHN1YiBpc19lbmN1bWJlcmVkCiAgICBmcmFtZV9kaWcgNAogICAgZnJhbWVfYnVyeSA2CiAgICBibnogZ2V0X3RvdGFsX2FuZF91bmVuY3VtYmVyZWRfYmlkc19hZnRlcl9pZl9lbHNlQDUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjIxOAogICAgLy8gdW5lbmN1bWJlcmVkX2JpZHMgKz0gcmVjZWlwdC5hbW91bnQubmF0aXZlCiAgICBmcmFtZV9kaWcgNAogICAgZnJhbWVfZGlnIDIKICAgICsKICAgIGZyYW1lX2J1cnkgNgoKZ2V0X3RvdGFsX2FuZF91bmVuY3VtYmVyZWRfYmlkc19hZnRlcl9pZl9lbHNlQDU6CiAgICBmcmFtZV9kaWcgNgogICAgZnJhbWVfYnVyeSA0CiAgICBmcmFtZV9kaWcgMQogICAgaW50Y18xIC8vIDEKICAgICsKICAgIGZyYW1lX2J1cnkgMQogICAgYiBnZXRfdG90YWxfYW5kX3VuZW5jdW1iZXJlZF9iaWRzX2Zvcl9oZWFkZXJAMgoKZ2V0X3RvdGFsX2FuZF91bmVuY3VtYmVyZWRfYmlkc19hZnRlcl9mb3JANzoKICAgIGZyYW1lX2RpZyA0CiAgICBmcmFtZV9idXJ5IDYKICAgIGZyYW1lX2RpZyAzCiAgICBmcmFtZV9idXJ5IDcKCmdldF90b3RhbF9hbmRfdW5lbmN1bWJlcmVkX2JpZHNfYWZ0ZXJfaWZfZWxzZUA4OgogICAgZnJhbWVfZGlnIDcKICAgIGZyYW1lX2RpZyA2CiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weToyMjAKICAgIC8vIHJldHVybiBVbmVuY3VtYmVyZWRCaWRzUmVjZWlwdCh0b3RhbF9iaWRzLCB1bmVuY3VtYmVyZWRfYmlkcykKICAgIGZyYW1lX2J1cnkgMQogICAgZnJhbWVfYnVyeSAwCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuZGlnaXRhbF9tYXJrZXRwbGFjZS5jb250cmFjdC5EaWdpdGFsTWFya2V0cGxhY2UuYWNjZXB0X2JpZChhc3NldDogYnl0ZXMpIC0+IHZvaWQ6CmFjY2VwdF9iaWQ6CiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weToyMjItMjIzCiAgICAvLyBAYWJpbWV0aG9kCiAgICAvLyBkZWYgYWNjZXB0X2JpZChzZWxmLCBhc3NldDogYXJjNC5VSW50NjQpIC0+IE5vbmU6CiAgICBwcm90byAxIDAKICAgIGludGNfMCAvLyAwCiAgICBkdXAKICAgIGJ5dGVjXzMgLy8gIiIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjIyNAogICAgLy8gc2FsZV9rZXkgPSBTYWxlS2V5KG93bmVyPWFyYzQuQWRkcmVzcyhUeG4uc2VuZGVyKSwgYXNzZXQ9YXNzZXQpCiAgICB0eG4gU2VuZGVyCiAgICBmcmFtZV9kaWcgLTEKICAgIGNvbmNhdAogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2UvY29udHJhY3QucHk6MjI1CiAgICAvLyBzYWxlID0gc2VsZi5zYWxlc1tzYWxlX2tleV0KICAgIGJ5dGVjXzIgLy8gInNhbGVzIgogICAgZGlnIDEKICAgIGNvbmNhdAogICAgZHVwCiAgICBib3hfZ2V0CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5zYWxlcyBlbnRyeSBleGlzdHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjIyNgogICAgLy8gY3VycmVudF9iZXN0X2JpZCA9IHNhbGUuYmlkCiAgICBkdXAKICAgIGV4dHJhY3QgMTYgNDAgLy8gb24gZXJyb3I6IEluZGV4IGFjY2VzcyBpcyBvdXQgb2YgYm91bmRzCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weToyMjcKICAgIC8vIGN1cnJlbnRfYmVzdF9iaWRkZXIgPSBjdXJyZW50X2Jlc3RfYmlkLmJpZGRlci5uYXRpdmUKICAgIGR1cAogICAgZXh0cmFjdCAwIDMyIC8vIG9uIGVycm9yOiBJbmRleCBhY2Nlc3MgaXMgb3V0IG9mIGJvdW5kcwogICAgZHVwCiAgICBjb3ZlciA0CiAgICBjb3ZlciA1CiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weToyMjkKICAgIC8vIHNlbGxlcl9tYnJfYmFzZWxpbmUgPSBHbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzLm1pbl9iYWxhbmNlCiAgICBnbG9iYWwgQ3VycmVudEFwcGxpY2F0aW9uQWRkcmVzcwogICAgYWNjdF9wYXJhbXNfZ2V0IEFjY3RNaW5CYWxhbmNlCiAgICBhc3NlcnQgLy8gYWNjb3VudCBmdW5kZWQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjIzMAogICAgLy8gZGVsIHNlbGYuc2FsZXNbc2FsZV9rZXldCiAgICB1bmNvdmVyIDMKICAgIGJveF9kZWwKICAgIHBvcAogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2UvY29udHJhY3QucHk6MjMyCiAgICAvLyBzZWxsZXJfbWJyX2Jhc2VsaW5lIC0gR2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcy5taW5fYmFsYW5jZQogICAgZ2xvYmFsIEN1cnJlbnRBcHBsaWNhdGlvbkFkZHJlc3MKICAgIGFjY3RfcGFyYW1zX2dldCBBY2N0TWluQmFsYW5jZQogICAgYXNzZXJ0IC8vIGFjY291bnQgZnVuZGVkCiAgICAtCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weToyMzUKICAgIC8vIHNlbGYuZGVwb3NpdGVkW1R4bi5zZW5kZXJdICs9IGN1cnJlbnRfYmVzdF9iaWQuYW1vdW50Lm5hdGl2ZSArIHNlbGxlcl9tYnJfZGlmZgogICAgYnl0ZWNfMCAvLyAiZGVwb3NpdGVkIgogICAgdHhuIFNlbmRlcgogICAgY29uY2F0CiAgICBkdXAKICAgIGJveF9nZXQKICAgIHN3YXAKICAgIGJ0b2kKICAgIHN3YXAKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmRlcG9zaXRlZCBlbnRyeSBleGlzdHMKICAgIHVuY292ZXIgMwogICAgcHVzaGludCAzMiAvLyAzMgogICAgZXh0cmFjdF91aW50NjQKICAgIHVuY292ZXIgMwogICAgKwogICAgKwogICAgaXRvYgogICAgYm94X3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2UvY29udHJhY3QucHk6MjM2LTI0MAogICAgLy8gaXR4bi5Bc3NldFRyYW5zZmVyKAogICAgLy8gICAgIHhmZXJfYXNzZXQ9YXNzZXQubmF0aXZlLAogICAgLy8gICAgIGFzc2V0X3JlY2VpdmVyPWN1cnJlbnRfYmVzdF9iaWRkZXIsCiAgICAvLyAgICAgYXNzZXRfYW1vdW50PXNhbGUuYW1vdW50Lm5hdGl2ZSwKICAgIC8vICkuc3VibWl0KCkKICAgIGl0eG5fYmVnaW4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjIzNwogICAgLy8geGZlcl9hc3NldD1hc3NldC5uYXRpdmUsCiAgICBmcmFtZV9kaWcgLTEKICAgIGJ0b2kKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjIzOQogICAgLy8gYXNzZXRfYW1vdW50PXNhbGUuYW1vdW50Lm5hdGl2ZSwKICAgIHN3YXAKICAgIGludGNfMCAvLyAwCiAgICBleHRyYWN0X3VpbnQ2NAogICAgaXR4bl9maWVsZCBBc3NldEFtb3VudAogICAgZGlnIDEKICAgIGl0eG5fZmllbGQgQXNzZXRSZWNlaXZlcgogICAgaXR4bl9maWVsZCBYZmVyQXNzZXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjIzNgogICAgLy8gaXR4bi5Bc3NldFRyYW5zZmVyKAogICAgaW50Y18zIC8vIGF4ZmVyCiAgICBpdHhuX2ZpZWxkIFR5cGVFbnVtCiAgICBpbnRjXzAgLy8gMAogICAgaXR4bl9maWVsZCBGZWUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjIzNi0yNDAKICAgIC8vIGl0eG4uQXNzZXRUcmFuc2ZlcigKICAgIC8vICAgICB4ZmVyX2Fzc2V0PWFzc2V0Lm5hdGl2ZSwKICAgIC8vICAgICBhc3NldF9yZWNlaXZlcj1jdXJyZW50X2Jlc3RfYmlkZGVyLAogICAgLy8gICAgIGFzc2V0X2Ftb3VudD1zYWxlLmFtb3VudC5uYXRpdmUsCiAgICAvLyApLnN1Ym1pdCgpCiAgICBpdHhuX3N1Ym1pdAogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2UvY29udHJhY3QucHk6MjQyCiAgICAvLyByZWNlaXB0X2Jvb2sgPSBzZWxmLnJlY2VpcHRfYm9va1tjdXJyZW50X2Jlc3RfYmlkZGVyXQogICAgYnl0ZWNfMSAvLyAicmVjZWlwdF9ib29rIgogICAgc3dhcAogICAgY29uY2F0CiAgICBkdXAKICAgIGNvdmVyIDIKICAgIGJveF9nZXQKICAgIHN3YXAKICAgIGR1cAogICAgY292ZXIgMgogICAgY292ZXIgMwogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYucmVjZWlwdF9ib29rIGVudHJ5IGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2UvY29udHJhY3QucHk6MjQzCiAgICAvLyBmb3VuZCwgaW5kZXggPSBmaW5kX2JpZF9yZWNlaXB0KHJlY2VpcHRfYm9vaywgc2FsZV9rZXkpCiAgICBkdXAKICAgIHVuY292ZXIgMgogICAgY2FsbHN1YiBmaW5kX2JpZF9yZWNlaXB0CiAgICBjb3ZlciAyCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weToyNDQKICAgIC8vIGFzc2VydCBmb3VuZAogICAgYXNzZXJ0CiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weToyNDYKICAgIC8vIGVuY3VtYmVyZWRfcmVjZWlwdHMgPSBJbW11dGFibGVBcnJheVtCaWRSZWNlaXB0XSgpCiAgICBieXRlYyA0IC8vIDB4MDAwMAogICAgc3dhcAogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2UvY29udHJhY3QucHk6MjQ3CiAgICAvLyBmb3IgcmVjZWlwdCBpbiByZWNlaXB0X2Jvb2s6CiAgICBpbnRjXzAgLy8gMAogICAgZXh0cmFjdF91aW50MTYKICAgIGludGNfMCAvLyAwCgphY2NlcHRfYmlkX2Zvcl9oZWFkZXJAMjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjI0NwogICAgLy8gZm9yIHJlY2VpcHQgaW4gcmVjZWlwdF9ib29rOgogICAgZnJhbWVfZGlnIDkKICAgIGZyYW1lX2RpZyA4CiAgICA8CiAgICBieiBhY2NlcHRfYmlkX2FmdGVyX2ZvckA3CiAgICBmcmFtZV9kaWcgNQogICAgZXh0cmFjdCAyIDAKICAgIGZyYW1lX2RpZyA5CiAgICBpbnRjXzIgLy8gNDgKICAgICoKICAgIGRpZyAxCiAgICBzd2FwCiAgICBpbnRjXzIgLy8gNDgKICAgIGV4dHJhY3QzIC8vIG9uIGVycm9yOiBJbmRleCBhY2Nlc3MgaXMgb3V0IG9mIGJvdW5kcwogICAgZHVwCiAgICBjb3ZlciAyCiAgICBmcmFtZV9idXJ5IDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjI0OAogICAgLy8gaWYgcmVjZWlwdCAhPSByZWNlaXB0X2Jvb2tbaW5kZXhdOgogICAgZnJhbWVfZGlnIDYKICAgIGludGNfMiAvLyA0OAogICAgKgogICAgaW50Y18yIC8vIDQ4CiAgICBleHRyYWN0MyAvLyBvbiBlcnJvcjogSW5kZXggYWNjZXNzIGlzIG91dCBvZiBib3VuZHMKICAgICE9CiAgICBmcmFtZV9kaWcgNwogICAgZnJhbWVfYnVyeSAwCiAgICBieiBhY2NlcHRfYmlkX2FmdGVyX2lmX2Vsc2VANQogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2UvY29udHJhY3QucHk6MjQ5CiAgICAvLyBlbmN1bWJlcmVkX3JlY2VpcHRzID0gZW5jdW1iZXJlZF9yZWNlaXB0cy5hcHBlbmQocmVjZWlwdCkKICAgIGZyYW1lX2RpZyA3CiAgICBleHRyYWN0IDIgMAogICAgZnJhbWVfZGlnIDEKICAgIGNvbmNhdAogICAgZHVwCiAgICBsZW4KICAgIGludGNfMiAvLyA0OAogICAgLwogICAgaXRvYgogICAgZXh0cmFjdCA2IDIKICAgIHN3YXAKICAgIGNvbmNhdAogICAgZnJhbWVfYnVyeSAwCgphY2NlcHRfYmlkX2FmdGVyX2lmX2Vsc2VANToKICAgIGZyYW1lX2RpZyAwCiAgICBmcmFtZV9idXJ5IDcKICAgIGZyYW1lX2RpZyA5CiAgICBpbnRjXzEgLy8gMQogICAgKwogICAgZnJhbWVfYnVyeSA5CiAgICBiIGFjY2VwdF9iaWRfZm9yX2hlYWRlckAyCgphY2NlcHRfYmlkX2FmdGVyX2ZvckA3OgogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2UvY29udHJhY3QucHk6MjUxCiAgICAvLyBiaWRkZXJfbWJyX2Jhc2VsaW5lID0gR2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcy5taW5fYmFsYW5jZQogICAgZ2xvYmFsIEN1cnJlbnRBcHBsaWNhdGlvbkFkZHJlc3MKICAgIGFjY3RfcGFyYW1zX2dldCBBY2N0TWluQmFsYW5jZQogICAgc3dhcAogICAgZnJhbWVfYnVyeSAyCiAgICBhc3NlcnQgLy8gYWNjb3VudCBmdW5kZWQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjI1MgogICAgLy8gaWYgZW5jdW1iZXJlZF9yZWNlaXB0czoKICAgIGZyYW1lX2RpZyA3CiAgICBpbnRjXzAgLy8gMAogICAgZXh0cmFjdF91aW50MTYKICAgIGJ6IGFjY2VwdF9iaWRfZWxzZV9ib2R5QDkKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjI1MwogICAgLy8gc2VsZi5yZWNlaXB0X2Jvb2tbY3VycmVudF9iZXN0X2JpZGRlcl0gPSBlbmN1bWJlcmVkX3JlY2VpcHRzCiAgICBmcmFtZV9kaWcgNAogICAgZHVwCiAgICBib3hfZGVsCiAgICBwb3AKICAgIGZyYW1lX2RpZyA3CiAgICBib3hfcHV0CgphY2NlcHRfYmlkX2FmdGVyX2lmX2Vsc2VAMTA6CiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weToyNTcKICAgIC8vIGJpZGRlcl9tYnJfYmFzZWxpbmUgLSBHbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzLm1pbl9iYWxhbmNlCiAgICBnbG9iYWwgQ3VycmVudEFwcGxpY2F0aW9uQWRkcmVzcwogICAgYWNjdF9wYXJhbXNfZ2V0IEFjY3RNaW5CYWxhbmNlCiAgICBhc3NlcnQgLy8gYWNjb3VudCBmdW5kZWQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjI1Ni0yNTgKICAgIC8vIGJpZGRlcl9tYnJfZGlmZiA9ICgKICAgIC8vICAgICBiaWRkZXJfbWJyX2Jhc2VsaW5lIC0gR2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcy5taW5fYmFsYW5jZQogICAgLy8gKQogICAgZnJhbWVfZGlnIDIKICAgIHN3YXAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjI1NwogICAgLy8gYmlkZGVyX21icl9iYXNlbGluZSAtIEdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MubWluX2JhbGFuY2UKICAgIC0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjI2MAogICAgLy8gc2VsZi5kZXBvc2l0ZWRbY3VycmVudF9iZXN0X2JpZGRlcl0gKz0gYmlkZGVyX21icl9kaWZmCiAgICBieXRlY18wIC8vICJkZXBvc2l0ZWQiCiAgICBmcmFtZV9kaWcgMwogICAgY29uY2F0CiAgICBkdXAKICAgIGJveF9nZXQKICAgIHN3YXAKICAgIGJ0b2kKICAgIHN3YXAKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmRlcG9zaXRlZCBlbnRyeSBleGlzdHMKICAgIHVuY292ZXIgMgogICAgKwogICAgaXRvYgogICAgYm94X3B1dAogICAgcmV0c3ViCgphY2NlcHRfYmlkX2Vsc2VfYm9keUA5OgogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2UvY29udHJhY3QucHk6MjU1CiAgICAvLyBkZWwgc2VsZi5yZWNlaXB0X2Jvb2tbY3VycmVudF9iZXN0X2JpZGRlcl0KICAgIGZyYW1lX2RpZyA0CiAgICBib3hfZGVsCiAgICBwb3AKICAgIGIgYWNjZXB0X2JpZF9hZnRlcl9pZl9lbHNlQDEwCg==", "clear": "I3ByYWdtYSB2ZXJzaW9uIDEwCiNwcmFnbWEgdHlwZXRyYWNrIGZhbHNlCgovLyBhbGdvcHkuYXJjNC5BUkM0Q29udHJhY3QuY2xlYXJfc3RhdGVfcHJvZ3JhbSgpIC0+IHVpbnQ2NDoKbWFpbjoKICAgIHB1c2hpbnQgMSAvLyAxCiAgICByZXR1cm4K"}, "sourceInfo": {"approval": {"pcOffsetMethod": "none", "sourceInfo": [{"pc": [505], "errorMessage": "Already opted in"}, {"pc": [514], "errorMessage": "Clawback ASA"}, {"pc": [391, 560], "errorMessage": "Different sender"}, {"pc": [347, 348, 743, 855, 873, 877, 899, 903, 981, 1000, 1099, 1111, 1114, 1179, 1345, 1424, 1428, 1544, 1555], "errorMessage": "Index access is out of bounds"}, {"pc": [129, 144, 170, 182, 200, 215, 233, 258, 276, 291], "errorMessage": "OnCompletion is not NoOp"}, {"pc": [585], "errorMessage": "Sale already exists"}, {"pc": [861], "errorMessage": "Seller cannot be bidder"}, {"pc": [750], "errorMessage": "Seller cannot be buyer"}, {"pc": [895], "errorMessage": "Worse bid"}, {"pc": [399, 568], "errorMessage": "Wrong receiver"}, {"pc": [404, 434, 590, 650, 710, 718, 787, 796, 921, 1020, 1243, 1265, 1440, 1449, 1604, 1624], "errorMessage": "account funded"}, {"pc": [510], "errorMessage": "asset exists"}, {"pc": [318], "errorMessage": "can only call when creating"}, {"pc": [132, 147, 173, 185, 203, 218, 236, 261, 279, 294], "errorMessage": "can only call when not creating"}, {"pc": [446, 465, 524, 662, 729, 807, 831, 961, 1033, 1224, 1279, 1460, 1638], "errorMessage": "check self.deposited entry exists"}, {"pc": [1157, 1507], "errorMessage": "check self.receipt_book entry exists"}, {"pc": [687, 757, 872, 1422], "errorMessage": "check self.sales entry exists"}, {"pc": [246], "errorMessage": "transaction type is axfer"}, {"pc": [304], "errorMessage": "transaction type is pay"}]}, "clear": {"pcOffsetMethod": "none", "sourceInfo": []}}, "templateVariables": {}}"""
+_APP_SPEC_JSON = r"""{"arcs": [22, 28], "bareActions": {"call": [], "create": ["NoOp"]}, "methods": [{"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "pay", "name": "payment"}], "name": "deposit", "returns": {"type": "void"}, "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "name": "amount"}], "name": "withdraw", "returns": {"type": "void"}, "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [], "name": "add_resources", "returns": {"type": "void"}, "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "asset", "name": "asset"}], "name": "sponsor_asset", "returns": {"type": "void"}, "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "axfer", "name": "asset_deposit"}, {"type": "uint64", "name": "cost"}], "name": "open_sale", "returns": {"type": "void"}, "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "axfer", "name": "asset_deposit"}, {"type": "uint64", "name": "cost"}, {"type": "uint64", "name": "expires_at"}], "name": "open_expiring_sale", "returns": {"type": "void"}, "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64[]", "name": "costs"}], "name": "open_sales", "returns": {"type": "void"}, "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "asset", "name": "asset"}], "name": "close_sale", "returns": {"type": "void"}, "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "(address,uint64)", "name": "sale_key", "struct": "SaleKey"}], "name": "buy", "returns": {"type": "void"}, "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "(address,uint64)", "name": "sale_key", "struct": "SaleKey"}, {"type": "uint64", "name": "quantity"}], "name": "buy_partial", "returns": {"type": "void"}, "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "(address,uint64)[]", "name": "sale_keys"}, {"type": "uint64", "name": "max_total_cost"}], "name": "buy_many", "returns": {"type": "void"}, "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "(address,uint64)", "name": "sale_key", "struct": "SaleKey"}, {"type": "uint64", "name": "new_bid_amount"}], "name": "bid", "returns": {"type": "void"}, "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "(address,uint64)[]", "name": "sale_keys"}, {"type": "uint64[]", "name": "amounts"}], "name": "bid_many", "returns": {"type": "void"}, "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "(address,uint64)", "name": "sale_key", "struct": "SaleKey"}, {"type": "uint64", "name": "new_bid_amount"}], "name": "isolated_bid", "returns": {"type": "void"}, "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [], "name": "claim_unencumbered_bids", "returns": {"type": "void"}, "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "name": "n_pages"}], "name": "open_receipt_pages", "returns": {"type": "void"}, "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "name": "page"}], "name": "claim_unencumbered_bids_of_page", "returns": {"type": "void"}, "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "address", "name": "bidder"}], "name": "prune_unencumbered_bids", "returns": {"type": "void"}, "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "address", "name": "bidder"}, {"type": "uint64", "name": "page"}], "name": "prune_unencumbered_bids_of_page", "returns": {"type": "void"}, "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "name": "offset"}, {"type": "uint64", "name": "limit"}], "name": "claim_unencumbered_bids_page", "returns": {"type": "void"}, "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "(address,uint64)", "name": "sale_key", "struct": "SaleKey"}], "name": "claim_isolated_bid", "returns": {"type": "void"}, "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [], "name": "get_total_and_unencumbered_bids", "returns": {"type": "(uint64,uint64)", "struct": "UnencumberedBidsReceipt"}, "events": [], "readonly": true, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "address[]", "name": "bidders"}], "name": "get_total_and_unencumbered_bids_of", "returns": {"type": "(uint64,uint64)[]"}, "events": [], "readonly": true, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "address", "name": "bidder"}], "name": "get_receipt_count", "returns": {"type": "uint64"}, "events": [], "readonly": true, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "address", "name": "bidder"}], "name": "get_receipt_pages", "returns": {"type": "uint16[]"}, "events": [], "readonly": true, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "(address,uint64)[]", "name": "sale_keys"}], "name": "get_sales", "returns": {"type": "((uint64,uint64,uint64),(address,uint64,bool))[]"}, "events": [], "readonly": true, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "name": "asset"}], "name": "accept_bid", "returns": {"type": "void"}, "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "(address,uint64)[]", "name": "sale_keys"}], "name": "settle_expired", "returns": {"type": "void"}, "events": [], "readonly": false, "recommendations": {}}], "name": "DigitalMarketplace", "state": {"keys": {"box": {}, "global": {}, "local": {}}, "maps": {"box": {"deposited": {"keyType": "address", "valueType": "uint64", "prefix": "ZGVwb3NpdGVk"}, "sales": {"keyType": "SaleKey", "valueType": "Sale", "prefix": "c2FsZXM="}, "bids": {"keyType": "uint64", "valueType": "Bid", "prefix": "Ymlkcw=="}, "best_asks": {"keyType": "uint64", "valueType": "AssetBook", "prefix": "YmVzdF9hc2tz"}, "best_bids": {"keyType": "uint64", "valueType": "AssetBook", "prefix": "YmVzdF9iaWRz"}, "receipt_book": {"keyType": "address", "valueType": "(uint64,uint64)[]", "prefix": "cmVjZWlwdF9ib29r"}, "receipt_pages": {"keyType": "address", "valueType": "uint16[]", "prefix": "cmVjZWlwdF9wYWdlcw=="}, "receipt_book_pages": {"keyType": "AVMBytes", "valueType": "(uint64,uint64)[]", "prefix": "cA=="}, "isolated_receipts": {"keyType": "AVMBytes", "valueType": "uint64", "prefix": "aQ=="}, "bid_totals": {"keyType": "address", "valueType": "BidTotals", "prefix": "YmlkX3RvdGFscw=="}}, "global": {}, "local": {}}, "schema": {"global": {"bytes": 0, "ints": 0}, "local": {"bytes": 0, "ints": 0}}}, "structs": {"AssetBook": [{"name": "n_untracked", "type": "uint64"}, {"name": "slots", "type": "(address,uint64,uint64)[4]"}], "Bid": [{"name": "bidder", "type": "address"}, {"name": "amount", "type": "uint64"}, {"name": "isolated", "type": "bool"}], "BidTotals": [{"name": "committed", "type": "uint64"}, {"name": "winning", "type": "uint64"}, {"name": "n_pages", "type": "uint16"}], "Sale": [{"name": "amount", "type": "uint64"}, {"name": "cost", "type": "uint64"}, {"name": "expires_at", "type": "uint64"}], "SaleKey": [{"name": "owner", "type": "address"}, {"name": "asset", "type": "uint64"}], "UnencumberedBidsReceipt": [{"name": "total_bids", "type": "uint64"}, {"name": "unencumbered_bids", "type": "uint64"}]}, "byteCode": {"approval": "CiAIAAECEJTrAdSsAZS5AYTPASYQCWRlcG9zaXRlZAAFc2FsZXMMcmVjZWlwdF9ib29rBGJpZHMKYmlkX3RvdGFscwQVH3x1AWkIAAAAAAAAAAANcmVjZWlwdF9wYWdlcwliZXN0X2Fza3MJYmVzdF9iaWRzAQACAAADBoEBEgAAAAAAAAAAAAAAAAAAAAAAADEbQQK/ghwENiXk6wQh8d3/BFXYu6gEEwAKlASmkgBmBHsti9cEdGOThwQJVEgQBNSaxg4ERhyQ8ARCrhj2BKGPH/wEV+oJwQTwq0hDBEVuOXUEvb5JCgTGbu+qBJ4sQNgEUkACygSBxm9QBOqPEwYEHqu7WASyw9bSBAfZtB0EAFUxtgS/mMpiBPjg768EtBOsBDYaAI4cAd4BzwHGAbQBmgF9AW4BXAFNATsBKQEXAQUA8wDnANgAyQC6AKgAlgCHAHEAXQBIADQAIAARAAIiQzEZFEQxGEQ2GgGIEjAjQzEZFEQxGEQ2GgGIEc4jQzEZFEQxGEQ2GgGIEG8nBkxQsCNDMRkURDEYRDYaAYgQTCcGTFCwI0MxGRREMRhENhoBiBAfFicGTFCwI0MxGRREMRhENhoBiA/FJwZMULAjQzEZFEQxGESID65MFkwWUCcGTFCwI0MxGRREMRhENhoBiA81I0MxGRREMRhENhoBNhoCiA45I0MxGRREMRhENhoBNhoCiA3nI0MxGRREMRhENhoBiA2nI0MxGRREMRhENhoBiA0MI0MxGRREMRhENhoBiAxbI0MxGRREMRhEiAwOI0MxGRREMRhENhoBNhoCiAsRI0MxGRREMRhENhoBNhoCiApvI0MxGRREMRhENhoBNhoCiAogI0MxGRREMRhENhoBNhoCiAbpI0MxGRREMRhENhoBNhoCiAX9I0MxGRREMRhENhoBiAWHI0MxGRREMRhENhoBF8AwiAUPI0MxGRREMRhENhoBiASvI0MxGRREMRhEMRYjCUk4EIEEEkQ2GgE2GgKIBG8jQzEZFEQxGEQxFiMJSTgQgQQSRDYaAYgEOSNDMRkURDEYRDYaARfAMIgDOSNDMRkURDEYRCNDMRkURDEYRDYaAYgC+SNDMRkURDEYRDEWIwlJOBAjEkSIAiIjQzEZQP4HMRgURCNDigIBi/9AAAIiiYv+FYv/JQskCAiBkAMLgcQTCImKAgCL/0AABYv+vEiJi/8lCyQIi/5M04v/FkmTJQ5EVwYCi/4iTwK7iYoCAilHAiKL/iIkuheLA4sEDEEAQosDiwQIJApJjAAlCyQIi/5MgQi6F0mMAYv/F0mMAhJBAAgjiwCMAYwAiYsBiwIMQQAJiwAjCIwDQv+9iwCMBEL/tiKLA4wBjACJigIAKSKLAYEEDEEAKYsBgTALgQgISYwAi/5MgSC6i/8SQQAJi/6LAIEwKdKJiwEjCIwBQv/Pi/4igQi6FyMJFov+Ik8Cu4mKBAAiKUcFi/9BAAuL/VcAIIv8TIj/oov8gwKYATC6VwAgMgMTQQAQi/wigQi6FyMIFov8Ik8CuyKMBYsFgQQMQQCAiwWBMAuBCAhJjAaL/EyBMLpJjABXACAyAxJAADSL/YEgW4sASU4CgShbHYwESU4CjAOBIFuL/YEoWx2MAkmMARNBACeL/kEAGosDiwENQQAJi/yLBiKL/dKJiwUjCIwFQv+ViwOLAQxC/+OL/kEACIsEiwINQv/WiwSLAgxC/86JigEAi/+BlgELgcgBCIEKCIsAMgwNQQAYsYEGshCBBbIZJw6yHicOsh8isgGzQv/giYoBAYv/VxAIJwipQQAMMgaL/yVbD0EAAiOJIomKAgGL/ov/cAFBAAiLAEAAAyNMiSJC//qKAQCL/zgAMQASRIv/OAcyChJEKDEAUL5MF0wiTEAABCEFjAGL/zgIiwAIKDEAUEyLAQkWv4mKAwAoi/1QSb5MF0xEi/4Ii/8JFr+JigIBi/8WSZMlDkRXBgKL/kxQgAFwTFCJigEBJwWL/1C+QAADIkyJiwAlWUyJigICi/6I/+NJQAAIK4v+UCJPAomL/xeLABiL/ksBiP+yTE8CiYoDAIv9iP++QQAXJwmL/VCL/iQLJAiL/xZJkyUORFcGAruJigEAKDEAUEm+TBdMRIv/F0xLAQkWTwJMv7ExALIHsggjshAisgGziYoBADIKi/9wAEUBFESL/3EKRDIDEkSL/xaByAGvJwpLAlBLAb8nC08CUEy/KDEAUEm+TBdMRDIQgajzCggJFr+xMgoishKyFIv/shGBBLIQIrIBs4mKAwAqi/1Qi/6/i/1XIAgnCkxQi/1XACCL/lcICIv+VwAITgJQTFAii/+I/WyJigEAKov/ULxIi/9XIAgnCkxQi/9XACCI/QqJigIAJwSL/1C8SIv+VyAIJwtMUIv+VwAgiPzuiYoDAIv9OAAxABJEi/04FDIKEkQxAIv9OBEWUCpLAVC9RQEURIv9OBIWi/5Qi/9QIoj/aImKAgCL/ov/JwiI/8AoMQBQSb5MF0xEIQQJFr+JigMAi/8XMgYNRIv9i/6L/4j/nSgxAFBJvkwXTEQhBAkWv4mKAQAxFov/IllJTgIJIosCiwAMQQAoiwGLAklOAghJOBCBBBJEi/9XAgBLAoEIC4EIWCcIiP9WIwiMAkL/0CgxAFBJvkwXTESLACEECwkWv4mKAQAxAIv/FlBHAgFXAAhMKkxQvkxJTwJEiP1JQQBDJwSLAVC9RQFBADgjFESxMQCLAiJbshKyFIv/shGBBLIQIrIBs4sASYj+uygxAFBJvkwXTERPAosBiALmIQQICBa/iSJC/8WKAQAxAIv/VwAgTEsBE0Qqi/9QvkRJiPzmFESxi/+BIFsxAEsCIluyErIUshGBBLIQIrIBs4v/iP5lMQCL/wFXAAiL/0yIApNPAoEIW04CSwKI/RUoTwJQSb5MF0xETwIhBAgIFr+JigIAIilHAjEAi/5XACBJTgITRCqL/lC+TElPAkSI/HgURIv/F0lBAK2LBSJbiwYPQQCjI0SLBUmBCFtJTgKMAklXAAiMACJbSU4CjAGLBh0iTwMfTgNITgJIQQB0IwiMA7GL/oEgWzEAiwayErIUshGBBLIQIrIBs4v/iwCoQQAti/6I/bKLAyEECDEAi/4BVwAIi/5MiAHbiwOI/GQoiwRQSb5MF0xETwIIFr+JiwGLBgkWiwKLA0lOAwkWiwVXEAhOAlBMUIv+TCOI/TxC/7qMA0L/iyJC/1qKAgAiRwMpi/4iWUlEIkcDiwmLBQxBALeL/lcCAEmMAIsJSU4CgSgLgShYSYwDMQBLAVcAIEmMARNEKkxQvkxJTgKMAkSI+3YUREAAfrGBBLIQIrIBiwNJgSBbshExALIUiwJJTgIiW7ISSYj88EkBVwAIiAEkiwcIjAeBCFuLBksBCIwGIQQIiwgIjAiLCSMISYwJiwUSQAAYiwmBKAuLAEyBKFhXACCLAROLCIwEQQASKIsBUEm+TBdMRIsICBa/IowEiwSMCEL/RbZC/3+zi/8XiwZJTwIORDEAiwdPAoj7RYmKBAEnBYv8UEm+SU8CTEAABCcPjAKLAkkiW4v9CIv+CRZLAYEIW4v/CBZPAlcQAk4CUExQiwBMv4sBQQAEIowAiSEHjACJigMAJwWL/VBJvkRJIluL/gkWSwGBCFuL/wkWTwJXEAJOAlBMUL+JigIBi/+BwAJTJwwiTwJUIlNBACOL/1cAIEmL/lAnB0xQvEiL/4EgW0xLAUsCiP+pIQYIIQUIiYv/VwAgi/+BIFsiTIj/kyEGiYoCASInBIv/UL5AAAQijACJi/6L/4j7x4v/iwFJTgKI/5VMVwAgSYwAMQASQQADjACJKIsAUEm+TBdMRE8CCBa/IowAiYoEAjEAJwwii/9UTIv+UExQi/xXACBJMQATRCqL/FC+TElPAkSI+bcURCcEi/1QSb5JTwJMQQAKiwWBIFuL/hcMRIsDiwBJTgK/i/xXIAgnC0xQTFcgCIsCVwAIiwFPAlBMUCOLBElOBIj4fkEAGosFVwAgMQASQQAPi/4XiwWBIFsJIowAjAGJiwRBABmLBUlXACAoTFBJvkwXTESL/U8DiP7OCBa/i/4XIQaMAIwBiYoCAjEAi/6I+dFMSb1FAUAABYsBJLlIi/6L/1CLAYv+iPdwTgJBAB1MJQskCIsBSU4CSwEluoEIW04CTwO7IkxPA08DiYsBSSIkuhcjCEklCyQISwJM008DJQskCEsCTCJPBdIWSZMlDkRXBgJLASJPArtJIiS6FzEAiwBLAoj5f0qI9shMIwlPAkyI9r8JIk8DTwOJigIAi/4BVwAIi/5LAYv/Ioj+p08Ci/+I/1ExAIv/F0xLAUsDTwaI/ZZPAwgxAE8CTwQITwIITE4CiPjHiYoCAIv+IllJi/8iWRJEIkcEiwWLAAxBAFeL/lcCAIsFSU4CgSgLgShYSQFXAAiL/1cCAEsDgQgLSoEIWE8ESwRLAiKI/jdPBU8DiP7hTwNPAgiLAwiMA4sETwIIjASLAQiMAVuLAgiMAiMIjAVC/6ExAIsCSU4CiwFJTgSLBIj9AYsDCDEATgIITE4CiPg3iYoCAIv+AVcACIv+SwGL/yOI/dpOAkwxAExQJwdMUEm+TBdMIkxAAAQhBYwEi/8XSRaLAky/MQBLAYsDSU4EiwCI/K+LBAgxAE8CiwEITwIITE4CiPfgiYoCAScEi/9QvkEADosAVwAgi/4SQQADI0yJIkL/+ooDAiKL/4j3HSJHAosDi/8MQQBKiwMlCyQIi/5MJbpJjABXAAiL/UyI/7dAABOLAIEIW4sBCIwBiwMjCIwDQv/LiwKLAxNBAAyLAiULJAiL/kyLALuLAiMIjAJC/9qLAov/E0EAB4v+iwKI9SaLAYsCjAGMAIkrMQBQvUQkCSUKKzEAUDEASwFLA4j/c0sCTwSI9OJPA08CiPTbCTEASwIiiPwfKDEAUEm+TBdMRE8DTwMICBa/iYoBACJHAilJi/8XSUEAj4sFgYACDkEAhiNEKzEAUL1FARREMQCI9xAURCcJMQBQSYwAiwVJTgIkCyQISYwDSwFMuUhMFkmTJQ5EVwYCSYwCIky7JwUxAFC+TIwBIowEQAAIJw+MASEHjASLAUlXAAhMVwgIUIsCUCcFMQBQTL8oMQBQSb5MF0xEiwAViwMIgZADC4HEEwiLBAgJFr+JIkL/d4oBADEAi/8XTEsBiPZwSb1FAURJIiS6FzEASwJLAoj+hjEATwVLAoj2pksDTwOI8+xPA08CiPPlCTEASwIiiPspKDEAUEm+TBdMRE8DTwMICBa/iYoDAIv/RIv/gQoKi/2L/iKI+wMoi/1QSb5MF0xEi/6L/whLAwkIFr8oMQBQSb5MF0xETwIIFr+JigEAK4v/UEm9RQFESSIkuheL/0sCSwKI/gFLA08DiPNwTwNPAojzaQmL/04CiP+YiYoCAIv/F4v+SwGI9bRJvUUBREkiJLoXi/5LAksCiP3Ki/5PBUsCiPXqSwNPA4jzME8DTwKI8ykJi/5OAoj/WImKAgAiSSlHAysxAFC9RQFEKzEAUEkiJLoXSYv+F0lOAklLAgxECUmL/xdJTwIMQQAEiwqMCYsIJQskCEmMBYsJSU4CJQuLBk4CuowBiPSBIowCKYwAIowDiwOLCQxBADCLAyULiwFMJVhJMQBMVwAIiP0ZQQAPiwBMUIwAiwMjCIwDQv/TgQhbiwIIjAJC/+yLABUlCosJTAlJjARBABeLARWLBklOAosFTwKLANKLB4sECYjyh4sGSYsHSU4CiPJfTIsECU8CTIjyVQkxAIsCSU4CIoj5ligxAFBJvkwXTERPAk8DCAgWv4mKAQCL/wFXAAgxAEsBUCcHTFBJvkwXTEQxAE8DiPyDFERMvEgxAEsBIoj5VygxAFBJvkwXTERPAiEFCAgWv4mKAQInBYv/UL5AAAUiSU8CiYsASSJbTIEIW0sBTAlPAokxAIj/2omKAQEnDYv/IlkiiwKLAQxBADKL/1cCAIsCSU4CgSALgSBYiwBXAgBMiP+uTBZMFlBQSRUlChZXBgJMUIwAIwiMAkL/xomKAQEri/9QSb1FAUAAAyJMiYsAIiS6F0yJigEBJwmL/1C+Jw1OAk2JigEBJw2L/yJZIosCiwEMQQCGi/9XAgCLAklOAoEoC4EoWIsAVwIAKksCUL6AGAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAE4CTU8CAVcACCcETFC+gCkAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAE4CTVBQSRWBQQoWVwYCTFCMACMIjAJC/3KJigMAIilHA4v/VwAgi/+BwAJTJwwiTwJUIlNBADeLBYv+UCcHTFC8SCEFi/2L/oj0NYv/gSBbiwVJTgJLAU8CiPfVKExQSb5MF0xETwIhBggIFr+JiwWL/ojy/YwESYwASSIkuheMAkmL/ojwo0lOA4wBRCIkuhdJjANMIwgNQQAMiwElCyQIiwBMJSnSiwMjCYsASU8CiPBOiwJJIwmLBYsESwKI8tZLAk8CiPAcTgKI8BcJQv9zigEAMQCL/1BJAVcACCpLAlC+RCcESwJQvkRLA4jzdSgxAFBJvkwXTERLAoEgWyEECAgWv7GL/xdLAVcAIE8DIluyErIUshGBBLIQIrIBs4j+94mKAQAiRwUpSYv/IllJRCJHAosLiwgMQQDli/9XAgCLC4EoC4EoWEmMBSpMUL5MjANBAJSLA4jxaUSLBUlXACCMAQFXAAhJjAQnBExQvkyMAEEApYsAVwAgiwWBIFuI8V1BAJUjjAaLBkEAeIsAVwAgjAKLBYjyyiEEjAeLBkEAVIsASYEgWyEECIwHiwWLBE8CiP5iKIsBUEm+TBdMRIsHCBa/iwlAACixgQSyECKyAYsFgSBbshGLArIUiwMiW7ISiwkjCIwJiwsjCIwLQv9BtkL/1YsFiwSI9qKLCgiMCkL/sYsFgSBbiwFMiPDPQf/WiwGMAkL/eiKMBkL/aIsJQQABs4sKQQAPKDEAUEm+TBdMRIsKCBa/iQ==", "clear": "CoEBQw=="}, "compilerInfo": {"compiler": "puya", "compilerVersion": {"major": 4, "minor": 7, "patch": 0}}, "events": [], "networks": {}, "source": {"approval": "I3ByYWdtYSB2ZXJzaW9uIDEwCiNwcmFnbWEgdHlwZXRyYWNrIGZhbHNlCgovLyBzbWFydF9jb250cmFjdHMuZGlnaXRhbF9tYXJrZXRwbGFjZS5jb250cmFjdC5EaWdpdGFsTWFya2V0cGxhY2UuX19hbGdvcHlfZW50cnlwb2ludF93aXRoX2luaXQoKSAtPiB1aW50NjQ6Cm1haW46CiAgICBpbnRjYmxvY2sgMCAxIDIgMTYgMzAxMDAgMjIxMDAgMjM3MDAgMjY1MDAKICAgIGJ5dGVjYmxvY2sgImRlcG9zaXRlZCIgMHggInNhbGVzIiAicmVjZWlwdF9ib29rIiAiYmlkcyIgImJpZF90b3RhbHMiIDB4MTUxZjdjNzUgMHg2OSAweDAwMDAwMDAwMDAwMDAwMDAgInJlY2VpcHRfcGFnZXMiICJiZXN0X2Fza3MiICJiZXN0X2JpZHMiIDB4MDAgMHgwMDAwIDB4MDY4MTAxIDB4MDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weToxMjEKICAgIC8vIGNsYXNzIERpZ2l0YWxNYXJrZXRwbGFjZShBUkM0Q29udHJhY3QpOgogICAgdHhuIE51bUFwcEFyZ3MKICAgIGJ6IG1haW5fYmFyZV9yb3V0aW5nQDMzCiAgICBwdXNoYnl0ZXNzIDB4MzYyNWU0ZWIgMHgyMWYxZGRmZiAweDU1ZDhiYmE4IDB4MTMwMDBhOTQgMHhhNjkyMDA2NiAweDdiMmQ4YmQ3IDB4NzQ2MzkzODcgMHgwOTU0NDgxMCAweGQ0OWFjNjBlIDB4NDYxYzkwZjAgMHg0MmFlMThmNiAweGExOGYxZmZjIDB4NTdlYTA5YzEgMHhmMGFiNDg0MyAweDQ1NmUzOTc1IDB4YmRiZTQ5MGEgMHhjNjZlZWZhYSAweDllMmM0MGQ4IDB4NTI0MDAyY2EgMHg4MWM2NmY1MCAweGVhOGYxMzA2IDB4MWVhYmJiNTggMHhiMmMzZDZkMiAweDA3ZDliNDFkIDB4MDA1NTMxYjYgMHhiZjk4Y2E2MiAweGY4ZTBlZmFmIDB4YjQxM2FjMDQgLy8gbWV0aG9kICJkZXBvc2l0KHBheSl2b2lkIiwgbWV0aG9kICJ3aXRoZHJhdyh1aW50NjQpdm9pZCIsIG1ldGhvZCAiYWRkX3Jlc291cmNlcygpdm9pZCIsIG1ldGhvZCAic3BvbnNvcl9hc3NldChhc3NldCl2b2lkIiwgbWV0aG9kICJvcGVuX3NhbGUoYXhmZXIsdWludDY0KXZvaWQiLCBtZXRob2QgIm9wZW5fZXhwaXJpbmdfc2FsZShheGZlcix1aW50NjQsdWludDY0KXZvaWQiLCBtZXRob2QgIm9wZW5fc2FsZXModWludDY0W10pdm9pZCIsIG1ldGhvZCAiY2xvc2Vfc2FsZShhc3NldCl2b2lkIiwgbWV0aG9kICJidXkoKGFkZHJlc3MsdWludDY0KSl2b2lkIiwgbWV0aG9kICJidXlfcGFydGlhbCgoYWRkcmVzcyx1aW50NjQpLHVpbnQ2NCl2b2lkIiwgbWV0aG9kICJidXlfbWFueSgoYWRkcmVzcyx1aW50NjQpW10sdWludDY0KXZvaWQiLCBtZXRob2QgImJpZCgoYWRkcmVzcyx1aW50NjQpLHVpbnQ2NCl2b2lkIiwgbWV0aG9kICJiaWRfbWFueSgoYWRkcmVzcyx1aW50NjQpW10sdWludDY0W10pdm9pZCIsIG1ldGhvZCAiaXNvbGF0ZWRfYmlkKChhZGRyZXNzLHVpbnQ2NCksdWludDY0KXZvaWQiLCBtZXRob2QgImNsYWltX3VuZW5jdW1iZXJlZF9iaWRzKCl2b2lkIiwgbWV0aG9kICJvcGVuX3JlY2VpcHRfcGFnZXModWludDY0KXZvaWQiLCBtZXRob2QgImNsYWltX3VuZW5jdW1iZXJlZF9iaWRzX29mX3BhZ2UodWludDY0KXZvaWQiLCBtZXRob2QgInBydW5lX3VuZW5jdW1iZXJlZF9iaWRzKGFkZHJlc3Mpdm9pZCIsIG1ldGhvZCAicHJ1bmVfdW5lbmN1bWJlcmVkX2JpZHNfb2ZfcGFnZShhZGRyZXNzLHVpbnQ2NCl2b2lkIiwgbWV0aG9kICJjbGFpbV91bmVuY3VtYmVyZWRfYmlkc19wYWdlKHVpbnQ2NCx1aW50NjQpdm9pZCIsIG1ldGhvZCAiY2xhaW1faXNvbGF0ZWRfYmlkKChhZGRyZXNzLHVpbnQ2NCkpdm9pZCIsIG1ldGhvZCAiZ2V0X3RvdGFsX2FuZF91bmVuY3VtYmVyZWRfYmlkcygpKHVpbnQ2NCx1aW50NjQpIiwgbWV0aG9kICJnZXRfdG90YWxfYW5kX3VuZW5jdW1iZXJlZF9iaWRzX29mKGFkZHJlc3NbXSkodWludDY0LHVpbnQ2NClbXSIsIG1ldGhvZCAiZ2V0X3JlY2VpcHRfY291bnQoYWRkcmVzcyl1aW50NjQiLCBtZXRob2QgImdldF9yZWNlaXB0X3BhZ2VzKGFkZHJlc3MpdWludDE2W10iLCBtZXRob2QgImdldF9zYWxlcygoYWRkcmVzcyx1aW50NjQpW10pKCh1aW50NjQsdWludDY0LHVpbnQ2NCksKGFkZHJlc3MsdWludDY0LGJvb2wpKVtdIiwgbWV0aG9kICJhY2NlcHRfYmlkKHVpbnQ2NCl2b2lkIiwgbWV0aG9kICJzZXR0bGVfZXhwaXJlZCgoYWRkcmVzcyx1aW50NjQpW10pdm9pZCIKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDAKICAgIG1hdGNoIG1haW5fZGVwb3NpdF9yb3V0ZUA1IG1haW5fd2l0aGRyYXdfcm91dGVANiBtYWluX2FkZF9yZXNvdXJjZXNfcm91dGVANyBtYWluX3Nwb25zb3JfYXNzZXRfcm91dGVAOCBtYWluX29wZW5fc2FsZV9yb3V0ZUA5IG1haW5fb3Blbl9leHBpcmluZ19zYWxlX3JvdXRlQDEwIG1haW5fb3Blbl9zYWxlc19yb3V0ZUAxMSBtYWluX2Nsb3NlX3NhbGVfcm91dGVAMTIgbWFpbl9idXlfcm91dGVAMTMgbWFpbl9idXlfcGFydGlhbF9yb3V0ZUAxNCBtYWluX2J1eV9tYW55X3JvdXRlQDE1IG1haW5fYmlkX3JvdXRlQDE2IG1haW5fYmlkX21hbnlfcm91dGVAMTcgbWFpbl9pc29sYXRlZF9iaWRfcm91dGVAMTggbWFpbl9jbGFpbV91bmVuY3VtYmVyZWRfYmlkc19yb3V0ZUAxOSBtYWluX29wZW5fcmVjZWlwdF9wYWdlc19yb3V0ZUAyMCBtYWluX2NsYWltX3VuZW5jdW1iZXJlZF9iaWRzX29mX3BhZ2Vfcm91dGVAMjEgbWFpbl9wcnVuZV91bmVuY3VtYmVyZWRfYmlkc19yb3V0ZUAyMiBtYWluX3BydW5lX3VuZW5jdW1iZXJlZF9iaWRzX29mX3BhZ2Vfcm91dGVAMjMgbWFpbl9jbGFpbV91bmVuY3VtYmVyZWRfYmlkc19wYWdlX3JvdXRlQDI0IG1haW5fY2xhaW1faXNvbGF0ZWRfYmlkX3JvdXRlQDI1IG1haW5fZ2V0X3RvdGFsX2FuZF91bmVuY3VtYmVyZWRfYmlkc19yb3V0ZUAyNiBtYWluX2dldF90b3RhbF9hbmRfdW5lbmN1bWJlcmVkX2JpZHNfb2Zfcm91dGVAMjcgbWFpbl9nZXRfcmVjZWlwdF9jb3VudF9yb3V0ZUAyOCBtYWluX2dldF9yZWNlaXB0X3BhZ2VzX3JvdXRlQDI5IG1haW5fZ2V0X3NhbGVzX3JvdXRlQDMwIG1haW5fYWNjZXB0X2JpZF9yb3V0ZUAzMSBtYWluX3NldHRsZV9leHBpcmVkX3JvdXRlQDMyCgptYWluX2FmdGVyX2lmX2Vsc2VAMzU6CiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weToxMjEKICAgIC8vIGNsYXNzIERpZ2l0YWxNYXJrZXRwbGFjZShBUkM0Q29udHJhY3QpOgogICAgaW50Y18wIC8vIDAKICAgIHJldHVybgoKbWFpbl9zZXR0bGVfZXhwaXJlZF9yb3V0ZUAzMjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjEwMzUKICAgIC8vIEBhYmltZXRob2QKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgbm90IE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gY2FuIG9ubHkgY2FsbCB3aGVuIG5vdCBjcmVhdGluZwogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2UvY29udHJhY3QucHk6MTIxCiAgICAvLyBjbGFzcyBEaWdpdGFsTWFya2V0cGxhY2UoQVJDNENvbnRyYWN0KToKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjEwMzUKICAgIC8vIEBhYmltZXRob2QKICAgIGNhbGxzdWIgc2V0dGxlX2V4cGlyZWQKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCm1haW5fYWNjZXB0X2JpZF9yb3V0ZUAzMToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjEwMTUKICAgIC8vIEBhYmltZXRob2QKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgbm90IE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gY2FuIG9ubHkgY2FsbCB3aGVuIG5vdCBjcmVhdGluZwogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2UvY29udHJhY3QucHk6MTIxCiAgICAvLyBjbGFzcyBEaWdpdGFsTWFya2V0cGxhY2UoQVJDNENvbnRyYWN0KToKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjEwMTUKICAgIC8vIEBhYmltZXRob2QKICAgIGNhbGxzdWIgYWNjZXB0X2JpZAogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKbWFpbl9nZXRfc2FsZXNfcm91dGVAMzA6CiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weTo5NjcKICAgIC8vIEBhYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgbm90IE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gY2FuIG9ubHkgY2FsbCB3aGVuIG5vdCBjcmVhdGluZwogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2UvY29udHJhY3QucHk6MTIxCiAgICAvLyBjbGFzcyBEaWdpdGFsTWFya2V0cGxhY2UoQVJDNENvbnRyYWN0KToKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5Ojk2NwogICAgLy8gQGFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgY2FsbHN1YiBnZXRfc2FsZXMKICAgIGJ5dGVjIDYgLy8gMHgxNTFmN2M3NQogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCm1haW5fZ2V0X3JlY2VpcHRfcGFnZXNfcm91dGVAMjk6CiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weTo5NjAKICAgIC8vIEBhYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgbm90IE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gY2FuIG9ubHkgY2FsbCB3aGVuIG5vdCBjcmVhdGluZwogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2UvY29udHJhY3QucHk6MTIxCiAgICAvLyBjbGFzcyBEaWdpdGFsTWFya2V0cGxhY2UoQVJDNENvbnRyYWN0KToKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5Ojk2MAogICAgLy8gQGFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgY2FsbHN1YiBnZXRfcmVjZWlwdF9wYWdlcwogICAgYnl0ZWMgNiAvLyAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKbWFpbl9nZXRfcmVjZWlwdF9jb3VudF9yb3V0ZUAyODoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5Ojk1MAogICAgLy8gQGFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBub3QgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBjYW4gb25seSBjYWxsIHdoZW4gbm90IGNyZWF0aW5nCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weToxMjEKICAgIC8vIGNsYXNzIERpZ2l0YWxNYXJrZXRwbGFjZShBUkM0Q29udHJhY3QpOgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2UvY29udHJhY3QucHk6OTUwCiAgICAvLyBAYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICBjYWxsc3ViIGdldF9yZWNlaXB0X2NvdW50CiAgICBpdG9iCiAgICBieXRlYyA2IC8vIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgptYWluX2dldF90b3RhbF9hbmRfdW5lbmN1bWJlcmVkX2JpZHNfb2Zfcm91dGVAMjc6CiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weTo5NDAKICAgIC8vIEBhYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgbm90IE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gY2FuIG9ubHkgY2FsbCB3aGVuIG5vdCBjcmVhdGluZwogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2UvY29udHJhY3QucHk6MTIxCiAgICAvLyBjbGFzcyBEaWdpdGFsTWFya2V0cGxhY2UoQVJDNENvbnRyYWN0KToKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5Ojk0MAogICAgLy8gQGFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgY2FsbHN1YiBnZXRfdG90YWxfYW5kX3VuZW5jdW1iZXJlZF9iaWRzX29mCiAgICBieXRlYyA2IC8vIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgptYWluX2dldF90b3RhbF9hbmRfdW5lbmN1bWJlcmVkX2JpZHNfcm91dGVAMjY6CiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weTo5MzYKICAgIC8vIEBhYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgbm90IE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gY2FuIG9ubHkgY2FsbCB3aGVuIG5vdCBjcmVhdGluZwogICAgY2FsbHN1YiBnZXRfdG90YWxfYW5kX3VuZW5jdW1iZXJlZF9iaWRzCiAgICBzd2FwCiAgICBpdG9iCiAgICBzd2FwCiAgICBpdG9iCiAgICBjb25jYXQKICAgIGJ5dGVjIDYgLy8gMHgxNTFmN2M3NQogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCm1haW5fY2xhaW1faXNvbGF0ZWRfYmlkX3JvdXRlQDI1OgogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2UvY29udHJhY3QucHk6OTEzCiAgICAvLyBAYWJpbWV0aG9kCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIG5vdCBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGNhbiBvbmx5IGNhbGwgd2hlbiBub3QgY3JlYXRpbmcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjEyMQogICAgLy8gY2xhc3MgRGlnaXRhbE1hcmtldHBsYWNlKEFSQzRDb250cmFjdCk6CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weTo5MTMKICAgIC8vIEBhYmltZXRob2QKICAgIGNhbGxzdWIgY2xhaW1faXNvbGF0ZWRfYmlkCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgptYWluX2NsYWltX3VuZW5jdW1iZXJlZF9iaWRzX3BhZ2Vfcm91dGVAMjQ6CiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weTo4NzAKICAgIC8vIEBhYmltZXRob2QKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgbm90IE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gY2FuIG9ubHkgY2FsbCB3aGVuIG5vdCBjcmVhdGluZwogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2UvY29udHJhY3QucHk6MTIxCiAgICAvLyBjbGFzcyBEaWdpdGFsTWFya2V0cGxhY2UoQVJDNENvbnRyYWN0KToKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5Ojg3MAogICAgLy8gQGFiaW1ldGhvZAogICAgY2FsbHN1YiBjbGFpbV91bmVuY3VtYmVyZWRfYmlkc19wYWdlCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgptYWluX3BydW5lX3VuZW5jdW1iZXJlZF9iaWRzX29mX3BhZ2Vfcm91dGVAMjM6CiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weTo4NTAKICAgIC8vIEBhYmltZXRob2QKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgbm90IE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gY2FuIG9ubHkgY2FsbCB3aGVuIG5vdCBjcmVhdGluZwogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2UvY29udHJhY3QucHk6MTIxCiAgICAvLyBjbGFzcyBEaWdpdGFsTWFya2V0cGxhY2UoQVJDNENvbnRyYWN0KToKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5Ojg1MAogICAgLy8gQGFiaW1ldGhvZAogICAgY2FsbHN1YiBwcnVuZV91bmVuY3VtYmVyZWRfYmlkc19vZl9wYWdlCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgptYWluX3BydW5lX3VuZW5jdW1iZXJlZF9iaWRzX3JvdXRlQDIyOgogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2UvY29udHJhY3QucHk6ODMyCiAgICAvLyBAYWJpbWV0aG9kCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIG5vdCBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGNhbiBvbmx5IGNhbGwgd2hlbiBub3QgY3JlYXRpbmcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjEyMQogICAgLy8gY2xhc3MgRGlnaXRhbE1hcmtldHBsYWNlKEFSQzRDb250cmFjdCk6CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weTo4MzIKICAgIC8vIEBhYmltZXRob2QKICAgIGNhbGxzdWIgcHJ1bmVfdW5lbmN1bWJlcmVkX2JpZHMKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCm1haW5fY2xhaW1fdW5lbmN1bWJlcmVkX2JpZHNfb2ZfcGFnZV9yb3V0ZUAyMToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjgwMgogICAgLy8gQGFiaW1ldGhvZAogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBub3QgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBjYW4gb25seSBjYWxsIHdoZW4gbm90IGNyZWF0aW5nCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weToxMjEKICAgIC8vIGNsYXNzIERpZ2l0YWxNYXJrZXRwbGFjZShBUkM0Q29udHJhY3QpOgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2UvY29udHJhY3QucHk6ODAyCiAgICAvLyBAYWJpbWV0aG9kCiAgICBjYWxsc3ViIGNsYWltX3VuZW5jdW1iZXJlZF9iaWRzX29mX3BhZ2UKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCm1haW5fb3Blbl9yZWNlaXB0X3BhZ2VzX3JvdXRlQDIwOgogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2UvY29udHJhY3QucHk6NzczCiAgICAvLyBAYWJpbWV0aG9kCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIG5vdCBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGNhbiBvbmx5IGNhbGwgd2hlbiBub3QgY3JlYXRpbmcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjEyMQogICAgLy8gY2xhc3MgRGlnaXRhbE1hcmtldHBsYWNlKEFSQzRDb250cmFjdCk6CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weTo3NzMKICAgIC8vIEBhYmltZXRob2QKICAgIGNhbGxzdWIgb3Blbl9yZWNlaXB0X3BhZ2VzCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgptYWluX2NsYWltX3VuZW5jdW1iZXJlZF9iaWRzX3JvdXRlQDE5OgogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2UvY29udHJhY3QucHk6NzU2CiAgICAvLyBAYWJpbWV0aG9kCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIG5vdCBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGNhbiBvbmx5IGNhbGwgd2hlbiBub3QgY3JlYXRpbmcKICAgIGNhbGxzdWIgY2xhaW1fdW5lbmN1bWJlcmVkX2JpZHMKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCm1haW5faXNvbGF0ZWRfYmlkX3JvdXRlQDE4OgogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2UvY29udHJhY3QucHk6NzAyCiAgICAvLyBAYWJpbWV0aG9kCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIG5vdCBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGNhbiBvbmx5IGNhbGwgd2hlbiBub3QgY3JlYXRpbmcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjEyMQogICAgLy8gY2xhc3MgRGlnaXRhbE1hcmtldHBsYWNlKEFSQzRDb250cmFjdCk6CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAyCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weTo3MDIKICAgIC8vIEBhYmltZXRob2QKICAgIGNhbGxzdWIgaXNvbGF0ZWRfYmlkCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgptYWluX2JpZF9tYW55X3JvdXRlQDE3OgogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2UvY29udHJhY3QucHk6NjcxCiAgICAvLyBAYWJpbWV0aG9kCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIG5vdCBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGNhbiBvbmx5IGNhbGwgd2hlbiBub3QgY3JlYXRpbmcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjEyMQogICAgLy8gY2xhc3MgRGlnaXRhbE1hcmtldHBsYWNlKEFSQzRDb250cmFjdCk6CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAyCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weTo2NzEKICAgIC8vIEBhYmltZXRob2QKICAgIGNhbGxzdWIgYmlkX21hbnkKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCm1haW5fYmlkX3JvdXRlQDE2OgogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2UvY29udHJhY3QucHk6NjUyCiAgICAvLyBAYWJpbWV0aG9kCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIG5vdCBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGNhbiBvbmx5IGNhbGwgd2hlbiBub3QgY3JlYXRpbmcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjEyMQogICAgLy8gY2xhc3MgRGlnaXRhbE1hcmtldHBsYWNlKEFSQzRDb250cmFjdCk6CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAyCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weTo2NTIKICAgIC8vIEBhYmltZXRob2QKICAgIGNhbGxzdWIgYmlkCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgptYWluX2J1eV9tYW55X3JvdXRlQDE1OgogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2UvY29udHJhY3QucHk6NDgyCiAgICAvLyBAYWJpbWV0aG9kCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIG5vdCBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGNhbiBvbmx5IGNhbGwgd2hlbiBub3QgY3JlYXRpbmcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjEyMQogICAgLy8gY2xhc3MgRGlnaXRhbE1hcmtldHBsYWNlKEFSQzRDb250cmFjdCk6CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAyCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weTo0ODIKICAgIC8vIEBhYmltZXRob2QKICAgIGNhbGxzdWIgYnV5X21hbnkKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCm1haW5fYnV5X3BhcnRpYWxfcm91dGVAMTQ6CiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weTo0NDcKICAgIC8vIEBhYmltZXRob2QKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgbm90IE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gY2FuIG9ubHkgY2FsbCB3aGVuIG5vdCBjcmVhdGluZwogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2UvY29udHJhY3QucHk6MTIxCiAgICAvLyBjbGFzcyBEaWdpdGFsTWFya2V0cGxhY2UoQVJDNENvbnRyYWN0KToKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjQ0NwogICAgLy8gQGFiaW1ldGhvZAogICAgY2FsbHN1YiBidXlfcGFydGlhbAogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKbWFpbl9idXlfcm91dGVAMTM6CiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weTo0MjgKICAgIC8vIEBhYmltZXRob2QKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgbm90IE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gY2FuIG9ubHkgY2FsbCB3aGVuIG5vdCBjcmVhdGluZwogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2UvY29udHJhY3QucHk6MTIxCiAgICAvLyBjbGFzcyBEaWdpdGFsTWFya2V0cGxhY2UoQVJDNENvbnRyYWN0KToKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjQyOAogICAgLy8gQGFiaW1ldGhvZAogICAgY2FsbHN1YiBidXkKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCm1haW5fY2xvc2Vfc2FsZV9yb3V0ZUAxMjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjQwOAogICAgLy8gQGFiaW1ldGhvZAogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBub3QgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBjYW4gb25seSBjYWxsIHdoZW4gbm90IGNyZWF0aW5nCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weToxMjEKICAgIC8vIGNsYXNzIERpZ2l0YWxNYXJrZXRwbGFjZShBUkM0Q29udHJhY3QpOgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgYnRvaQogICAgdHhuYXMgQXNzZXRzCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weTo0MDgKICAgIC8vIEBhYmltZXRob2QKICAgIGNhbGxzdWIgY2xvc2Vfc2FsZQogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKbWFpbl9vcGVuX3NhbGVzX3JvdXRlQDExOgogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2UvY29udHJhY3QucHk6MzkzCiAgICAvLyBAYWJpbWV0aG9kCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIG5vdCBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGNhbiBvbmx5IGNhbGwgd2hlbiBub3QgY3JlYXRpbmcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjEyMQogICAgLy8gY2xhc3MgRGlnaXRhbE1hcmtldHBsYWNlKEFSQzRDb250cmFjdCk6CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weTozOTMKICAgIC8vIEBhYmltZXRob2QKICAgIGNhbGxzdWIgb3Blbl9zYWxlcwogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKbWFpbl9vcGVuX2V4cGlyaW5nX3NhbGVfcm91dGVAMTA6CiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weTozODEKICAgIC8vIEBhYmltZXRob2QKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgbm90IE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gY2FuIG9ubHkgY2FsbCB3aGVuIG5vdCBjcmVhdGluZwogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2UvY29udHJhY3QucHk6MTIxCiAgICAvLyBjbGFzcyBEaWdpdGFsTWFya2V0cGxhY2UoQVJDNENvbnRyYWN0KToKICAgIHR4biBHcm91cEluZGV4CiAgICBpbnRjXzEgLy8gMQogICAgLQogICAgZHVwCiAgICBndHhucyBUeXBlRW51bQogICAgcHVzaGludCA0IC8vIGF4ZmVyCiAgICA9PQogICAgYXNzZXJ0IC8vIHRyYW5zYWN0aW9uIHR5cGUgaXMgYXhmZXIKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjM4MQogICAgLy8gQGFiaW1ldGhvZAogICAgY2FsbHN1YiBvcGVuX2V4cGlyaW5nX3NhbGUKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCm1haW5fb3Blbl9zYWxlX3JvdXRlQDk6CiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weTozNzMKICAgIC8vIEBhYmltZXRob2QKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgbm90IE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gY2FuIG9ubHkgY2FsbCB3aGVuIG5vdCBjcmVhdGluZwogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2UvY29udHJhY3QucHk6MTIxCiAgICAvLyBjbGFzcyBEaWdpdGFsTWFya2V0cGxhY2UoQVJDNENvbnRyYWN0KToKICAgIHR4biBHcm91cEluZGV4CiAgICBpbnRjXzEgLy8gMQogICAgLQogICAgZHVwCiAgICBndHhucyBUeXBlRW51bQogICAgcHVzaGludCA0IC8vIGF4ZmVyCiAgICA9PQogICAgYXNzZXJ0IC8vIHRyYW5zYWN0aW9uIHR5cGUgaXMgYXhmZXIKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjM3MwogICAgLy8gQGFiaW1ldGhvZAogICAgY2FsbHN1YiBvcGVuX3NhbGUKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCm1haW5fc3BvbnNvcl9hc3NldF9yb3V0ZUA4OgogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2UvY29udHJhY3QucHk6MjgyCiAgICAvLyBAYWJpbWV0aG9kCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIG5vdCBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGNhbiBvbmx5IGNhbGwgd2hlbiBub3QgY3JlYXRpbmcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjEyMQogICAgLy8gY2xhc3MgRGlnaXRhbE1hcmtldHBsYWNlKEFSQzRDb250cmFjdCk6CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBidG9pCiAgICB0eG5hcyBBc3NldHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjI4MgogICAgLy8gQGFiaW1ldGhvZAogICAgY2FsbHN1YiBzcG9uc29yX2Fzc2V0CiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgptYWluX2FkZF9yZXNvdXJjZXNfcm91dGVANzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjI3NgogICAgLy8gQGFiaW1ldGhvZAogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBub3QgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBjYW4gb25seSBjYWxsIHdoZW4gbm90IGNyZWF0aW5nCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgptYWluX3dpdGhkcmF3X3JvdXRlQDY6CiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weToyNzAKICAgIC8vIEBhYmltZXRob2QKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgbm90IE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gY2FuIG9ubHkgY2FsbCB3aGVuIG5vdCBjcmVhdGluZwogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2UvY29udHJhY3QucHk6MTIxCiAgICAvLyBjbGFzcyBEaWdpdGFsTWFya2V0cGxhY2UoQVJDNENvbnRyYWN0KToKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjI3MAogICAgLy8gQGFiaW1ldGhvZAogICAgY2FsbHN1YiB3aXRoZHJhdwogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKbWFpbl9kZXBvc2l0X3JvdXRlQDU6CiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weToxNjYKICAgIC8vIEBhYmltZXRob2QKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgbm90IE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gY2FuIG9ubHkgY2FsbCB3aGVuIG5vdCBjcmVhdGluZwogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2UvY29udHJhY3QucHk6MTIxCiAgICAvLyBjbGFzcyBEaWdpdGFsTWFya2V0cGxhY2UoQVJDNENvbnRyYWN0KToKICAgIHR4biBHcm91cEluZGV4CiAgICBpbnRjXzEgLy8gMQogICAgLQogICAgZHVwCiAgICBndHhucyBUeXBlRW51bQogICAgaW50Y18xIC8vIHBheQogICAgPT0KICAgIGFzc2VydCAvLyB0cmFuc2FjdGlvbiB0eXBlIGlzIHBheQogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2UvY29udHJhY3QucHk6MTY2CiAgICAvLyBAYWJpbWV0aG9kCiAgICBjYWxsc3ViIGRlcG9zaXQKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCm1haW5fYmFyZV9yb3V0aW5nQDMzOgogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2UvY29udHJhY3QucHk6MTIxCiAgICAvLyBjbGFzcyBEaWdpdGFsTWFya2V0cGxhY2UoQVJDNENvbnRyYWN0KToKICAgIHR4biBPbkNvbXBsZXRpb24KICAgIGJueiBtYWluX2FmdGVyX2lmX2Vsc2VAMzUKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICAhCiAgICBhc3NlcnQgLy8gY2FuIG9ubHkgY2FsbCB3aGVuIGNyZWF0aW5nCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgoKLy8gc21hcnRfY29udHJhY3RzLmRpZ2l0YWxfbWFya2V0cGxhY2Uuc3Vicm91dGluZXMucmVjZWlwdF9ib29rX21icihyZWNlaXB0X2Jvb2s6IGJ5dGVzLCBuX3JlY2VpcHRzOiB1aW50NjQpIC0+IHVpbnQ2NDoKcmVjZWlwdF9ib29rX21icjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL3N1YnJvdXRpbmVzLnB5OjQzLTQ0CiAgICAvLyBAc3Vicm91dGluZQogICAgLy8gZGVmIHJlY2VpcHRfYm9va19tYnIocmVjZWlwdF9ib29rOiBCb3hSZWYsIG5fcmVjZWlwdHM6IFVJbnQ2NCkgLT4gVUludDY0OgogICAgcHJvdG8gMiAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9zdWJyb3V0aW5lcy5weTo0NS00NgogICAgLy8gIyBBbiBlbXB0eSByZWNlaXB0IGJvb2sgaXMgZGVsZXRlZCwgc28gaXQgZG9lc24ndCBob2xkIGFueSBNQlIuCiAgICAvLyBpZiBub3Qgbl9yZWNlaXB0czoKICAgIGZyYW1lX2RpZyAtMQogICAgYm56IHJlY2VpcHRfYm9va19tYnJfYWZ0ZXJfaWZfZWxzZUAyCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9zdWJyb3V0aW5lcy5weTo0NwogICAgLy8gcmV0dXJuIFVJbnQ2NCgwKQogICAgaW50Y18wIC8vIDAKICAgIHJldHN1YgoKcmVjZWlwdF9ib29rX21icl9hZnRlcl9pZl9lbHNlQDI6CiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9zdWJyb3V0aW5lcy5weTo0OAogICAgLy8gcmV0dXJuIGJveF9tYnIocmVjZWlwdF9ib29rLmtleS5sZW5ndGggKyByZWNlaXB0X29mZnNldChuX3JlY2VpcHRzKSkKICAgIGZyYW1lX2RpZyAtMgogICAgbGVuCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9zdWJyb3V0aW5lcy5weTo0MAogICAgLy8gcmV0dXJuIGNzdC5BUlJBWV9IRUFERVJfU0laRSArIGluZGV4ICogY3N0LkJJRF9SRUNFSVBUX1NJWkUKICAgIGZyYW1lX2RpZyAtMQogICAgaW50Y18zIC8vIDE2CiAgICAqCiAgICBpbnRjXzIgLy8gMgogICAgKwogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2Uvc3Vicm91dGluZXMucHk6NDgKICAgIC8vIHJldHVybiBib3hfbWJyKHJlY2VpcHRfYm9vay5rZXkubGVuZ3RoICsgcmVjZWlwdF9vZmZzZXQobl9yZWNlaXB0cykpCiAgICArCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9zdWJyb3V0aW5lcy5weToyNi0yNwogICAgLy8gIyBUaGUgc2l6ZSBvZiBhIGJveCBpbmNsdWRlcyBpdHMgbmFtZSwga2V5IHByZWZpeCBpbmNsdWRlZC4KICAgIC8vIHJldHVybiBjc3QuQk9YX0ZMQVRfTUlOX0JBTEFOQ0UgKyBzaXplICogY3N0LkJPWF9CWVRFX01JTl9CQUxBTkNFCiAgICBwdXNoaW50IDQwMCAvLyA0MDAKICAgICoKICAgIHB1c2hpbnQgMjUwMCAvLyAyNTAwCiAgICArCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9zdWJyb3V0aW5lcy5weTo0OAogICAgLy8gcmV0dXJuIGJveF9tYnIocmVjZWlwdF9ib29rLmtleS5sZW5ndGggKyByZWNlaXB0X29mZnNldChuX3JlY2VpcHRzKSkKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5kaWdpdGFsX21hcmtldHBsYWNlLnN1YnJvdXRpbmVzLnRydW5jYXRlX3JlY2VpcHRzKHJlY2VpcHRfYm9vazogYnl0ZXMsIG5fcmVjZWlwdHM6IHVpbnQ2NCkgLT4gdm9pZDoKdHJ1bmNhdGVfcmVjZWlwdHM6CiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9zdWJyb3V0aW5lcy5weTo3Mi03MwogICAgLy8gQHN1YnJvdXRpbmUKICAgIC8vIGRlZiB0cnVuY2F0ZV9yZWNlaXB0cyhyZWNlaXB0X2Jvb2s6IEJveFJlZiwgbl9yZWNlaXB0czogVUludDY0KSAtPiBOb25lOgogICAgcHJvdG8gMiAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9zdWJyb3V0aW5lcy5weTo3NC03NQogICAgLy8gIyBLZWVwcyB0aGUgZmlyc3Qgbl9yZWNlaXB0cyByZWNlaXB0cyBvZiB0aGUgYm9vaywgZGVsZXRpbmcgaXQgb25jZSBlbXB0eS4KICAgIC8vIGlmIG5vdCBuX3JlY2VpcHRzOgogICAgZnJhbWVfZGlnIC0xCiAgICBibnogdHJ1bmNhdGVfcmVjZWlwdHNfYWZ0ZXJfaWZfZWxzZUAyCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9zdWJyb3V0aW5lcy5weTo3NgogICAgLy8gX2RlbGV0ZWQgPSByZWNlaXB0X2Jvb2suZGVsZXRlKCkKICAgIGZyYW1lX2RpZyAtMgogICAgYm94X2RlbAogICAgcG9wCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9zdWJyb3V0aW5lcy5weTo3NwogICAgLy8gcmV0dXJuCiAgICByZXRzdWIKCnRydW5jYXRlX3JlY2VpcHRzX2FmdGVyX2lmX2Vsc2VAMjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL3N1YnJvdXRpbmVzLnB5OjQwCiAgICAvLyByZXR1cm4gY3N0LkFSUkFZX0hFQURFUl9TSVpFICsgaW5kZXggKiBjc3QuQklEX1JFQ0VJUFRfU0laRQogICAgZnJhbWVfZGlnIC0xCiAgICBpbnRjXzMgLy8gMTYKICAgICoKICAgIGludGNfMiAvLyAyCiAgICArCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9zdWJyb3V0aW5lcy5weTo3OAogICAgLy8gcmVjZWlwdF9ib29rLnJlc2l6ZShyZWNlaXB0X29mZnNldChuX3JlY2VpcHRzKSkKICAgIGZyYW1lX2RpZyAtMgogICAgc3dhcAogICAgYm94X3Jlc2l6ZQogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2Uvc3Vicm91dGluZXMucHk6NzkKICAgIC8vIHJlY2VpcHRfYm9vay5yZXBsYWNlKDAsIGFyYzQuVUludDE2KG5fcmVjZWlwdHMpLmJ5dGVzKQogICAgZnJhbWVfZGlnIC0xCiAgICBpdG9iCiAgICBkdXAKICAgIGJpdGxlbgogICAgaW50Y18zIC8vIDE2CiAgICA8PQogICAgYXNzZXJ0IC8vIG92ZXJmbG93CiAgICBleHRyYWN0IDYgMgogICAgZnJhbWVfZGlnIC0yCiAgICBpbnRjXzAgLy8gMAogICAgdW5jb3ZlciAyCiAgICBib3hfcmVwbGFjZQogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLmRpZ2l0YWxfbWFya2V0cGxhY2Uuc3Vicm91dGluZXMuZmluZF9iaWRfcmVjZWlwdChyZWNlaXB0X2Jvb2s6IGJ5dGVzLCBzYWxlX2lkOiBieXRlcykgLT4gdWludDY0LCB1aW50NjQ6CmZpbmRfYmlkX3JlY2VpcHQ6CiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9zdWJyb3V0aW5lcy5weTo5MS05MgogICAgLy8gQHN1YnJvdXRpbmUKICAgIC8vIGRlZiBmaW5kX2JpZF9yZWNlaXB0KHJlY2VpcHRfYm9vazogQm94UmVmLCBzYWxlX2lkOiBhcmM0LlVJbnQ2NCkgLT4gdHVwbGVbYm9vbCwgVUludDY0XToKICAgIHByb3RvIDIgMgogICAgYnl0ZWNfMSAvLyAiIgogICAgZHVwbiAyCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9zdWJyb3V0aW5lcy5weTo5My05NwogICAgLy8gIyBSZWNlaXB0IGJvb2tzIGFyZSBzb3J0ZWQgYnkgc2FsZSBpZC4KICAgIC8vICMgUmV0dXJucyB3aGV0aGVyIHRoZSByZWNlaXB0IHdhcyBmb3VuZCBhbmQgZWl0aGVyIGl0cyBpbmRleCBvciB0aGUgaW5kZXggd2hlcmUgaXQKICAgIC8vICMgIGhhcyB0byBiZSBpbnNlcnRlZCB0byBrZWVwIHRoZSByZWNlaXB0IGJvb2sgc29ydGVkLgogICAgLy8gIyBPbmx5IHRoZSBzYWxlIGlkcyBvZiB0aGUgcHJvYmVkIHJlY2VpcHRzIGFyZSByZWFkLgogICAgLy8gbG93ID0gVUludDY0KDApCiAgICBpbnRjXzAgLy8gMAogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2Uvc3Vicm91dGluZXMucHk6MzUKICAgIC8vIHJldHVybiBvcC5idG9pKHJlY2VpcHRfYm9vay5leHRyYWN0KDAsIGNzdC5BUlJBWV9IRUFERVJfU0laRSkpCiAgICBmcmFtZV9kaWcgLTIKICAgIGludGNfMCAvLyAwCiAgICBpbnRjXzIgLy8gMgogICAgYm94X2V4dHJhY3QKICAgIGJ0b2kKCmZpbmRfYmlkX3JlY2VpcHRfd2hpbGVfdG9wQDE6CiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9zdWJyb3V0aW5lcy5weTo5OQogICAgLy8gd2hpbGUgbG93IDwgaGlnaDoKICAgIGZyYW1lX2RpZyAzCiAgICBmcmFtZV9kaWcgNAogICAgPAogICAgYnogZmluZF9iaWRfcmVjZWlwdF9hZnRlcl93aGlsZUA4CiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9zdWJyb3V0aW5lcy5weToxMDAKICAgIC8vIG1pZGRsZSA9IChsb3cgKyBoaWdoKSAvLyAyCiAgICBmcmFtZV9kaWcgMwogICAgZnJhbWVfZGlnIDQKICAgICsKICAgIGludGNfMiAvLyAyCiAgICAvCiAgICBkdXAKICAgIGZyYW1lX2J1cnkgMAogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2Uvc3Vicm91dGluZXMucHk6NDAKICAgIC8vIHJldHVybiBjc3QuQVJSQVlfSEVBREVSX1NJWkUgKyBpbmRleCAqIGNzdC5CSURfUkVDRUlQVF9TSVpFCiAgICBpbnRjXzMgLy8gMTYKICAgICoKICAgIGludGNfMiAvLyAyCiAgICArCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9zdWJyb3V0aW5lcy5weToxMDIKICAgIC8vIHJlY2VpcHRfYm9vay5leHRyYWN0KHJlY2VpcHRfb2Zmc2V0KG1pZGRsZSksIGNzdC5TQUxFX0lEX0xFTkdUSCkKICAgIGZyYW1lX2RpZyAtMgogICAgc3dhcAogICAgcHVzaGludCA4IC8vIDgKICAgIGJveF9leHRyYWN0CiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9zdWJyb3V0aW5lcy5weToxMDEtMTAzCiAgICAvLyBtaWRkbGVfaWQgPSBvcC5idG9pKAogICAgLy8gICAgIHJlY2VpcHRfYm9vay5leHRyYWN0KHJlY2VpcHRfb2Zmc2V0KG1pZGRsZSksIGNzdC5TQUxFX0lEX0xFTkdUSCkKICAgIC8vICkKICAgIGJ0b2kKICAgIGR1cAogICAgZnJhbWVfYnVyeSAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9zdWJyb3V0aW5lcy5weToxMDQKICAgIC8vIGlmIG1pZGRsZV9pZCA9PSBzYWxlX2lkLm5hdGl2ZToKICAgIGZyYW1lX2RpZyAtMQogICAgYnRvaQogICAgZHVwCiAgICBmcmFtZV9idXJ5IDIKICAgID09CiAgICBieiBmaW5kX2JpZF9yZWNlaXB0X2FmdGVyX2lmX2Vsc2VANAogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2Uvc3Vicm91dGluZXMucHk6MTA1CiAgICAvLyByZXR1cm4gVHJ1ZSwgbWlkZGxlCiAgICBpbnRjXzEgLy8gMQogICAgZnJhbWVfZGlnIDAKICAgIGZyYW1lX2J1cnkgMQogICAgZnJhbWVfYnVyeSAwCiAgICByZXRzdWIKCmZpbmRfYmlkX3JlY2VpcHRfYWZ0ZXJfaWZfZWxzZUA0OgogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2Uvc3Vicm91dGluZXMucHk6MTA2CiAgICAvLyBpZiBtaWRkbGVfaWQgPCBzYWxlX2lkLm5hdGl2ZToKICAgIGZyYW1lX2RpZyAxCiAgICBmcmFtZV9kaWcgMgogICAgPAogICAgYnogZmluZF9iaWRfcmVjZWlwdF9lbHNlX2JvZHlANgogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2Uvc3Vicm91dGluZXMucHk6MTA3CiAgICAvLyBsb3cgPSBtaWRkbGUgKyAxCiAgICBmcmFtZV9kaWcgMAogICAgaW50Y18xIC8vIDEKICAgICsKICAgIGZyYW1lX2J1cnkgMwogICAgYiBmaW5kX2JpZF9yZWNlaXB0X3doaWxlX3RvcEAxCgpmaW5kX2JpZF9yZWNlaXB0X2Vsc2VfYm9keUA2OgogICAgZnJhbWVfZGlnIDAKICAgIGZyYW1lX2J1cnkgNAogICAgYiBmaW5kX2JpZF9yZWNlaXB0X3doaWxlX3RvcEAxCgpmaW5kX2JpZF9yZWNlaXB0X2FmdGVyX3doaWxlQDg6CiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9zdWJyb3V0aW5lcy5weToxMTAKICAgIC8vIHJldHVybiBGYWxzZSwgbG93CiAgICBpbnRjXzAgLy8gMAogICAgZnJhbWVfZGlnIDMKICAgIGZyYW1lX2J1cnkgMQogICAgZnJhbWVfYnVyeSAwCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuZGlnaXRhbF9tYXJrZXRwbGFjZS5zdWJyb3V0aW5lcy5yZW1vdmVfYm9va19lbnRyeShib29rOiBieXRlcywgb3duZXI6IGJ5dGVzKSAtPiB2b2lkOgpyZW1vdmVfYm9va19lbnRyeToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL3N1YnJvdXRpbmVzLnB5OjEzOC0xMzkKICAgIC8vIEBzdWJyb3V0aW5lCiAgICAvLyBkZWYgcmVtb3ZlX2Jvb2tfZW50cnkoYm9vazogQm94UmVmLCBvd25lcjogYXJjNC5BZGRyZXNzKSAtPiBOb25lOgogICAgcHJvdG8gMiAwCiAgICBieXRlY18xIC8vICIiCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9zdWJyb3V0aW5lcy5weToxNDAtMTQzCiAgICAvLyAjIFNoaWZ0cyB0aGUgZm9sbG93aW5nIGVudHJpZXMgdXAsIHdoaWNoIHplcm9lcyB0aGUgbGFzdCBzbG90LiBBIHNhbGUgbWlzc2luZyBmcm9tCiAgICAvLyAjICB0aGUgc2xvdHMgd2FzIHB1c2hlZCBvdXQgb3IgbGVmdCBvdXQgb2YgdGhlbSwgYW5kIGlzIHRha2VuIG9mZiB0aGUgdW50cmFja2VkCiAgICAvLyAjICBjb3VudCBpbnN0ZWFkLgogICAgLy8gZm9yIHNsb3QgaW4gdXJhbmdlKGNzdC5BU1NFVF9CT09LX1NMT1RTKToKICAgIGludGNfMCAvLyAwCgpyZW1vdmVfYm9va19lbnRyeV9mb3JfaGVhZGVyQDE6CiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9zdWJyb3V0aW5lcy5weToxNDAtMTQzCiAgICAvLyAjIFNoaWZ0cyB0aGUgZm9sbG93aW5nIGVudHJpZXMgdXAsIHdoaWNoIHplcm9lcyB0aGUgbGFzdCBzbG90LiBBIHNhbGUgbWlzc2luZyBmcm9tCiAgICAvLyAjICB0aGUgc2xvdHMgd2FzIHB1c2hlZCBvdXQgb3IgbGVmdCBvdXQgb2YgdGhlbSwgYW5kIGlzIHRha2VuIG9mZiB0aGUgdW50cmFja2VkCiAgICAvLyAjICBjb3VudCBpbnN0ZWFkLgogICAgLy8gZm9yIHNsb3QgaW4gdXJhbmdlKGNzdC5BU1NFVF9CT09LX1NMT1RTKToKICAgIGZyYW1lX2RpZyAxCiAgICBwdXNoaW50IDQgLy8gNAogICAgPAogICAgYnogcmVtb3ZlX2Jvb2tfZW50cnlfYWZ0ZXJfZm9yQDYKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL3N1YnJvdXRpbmVzLnB5OjExOAogICAgLy8gcmV0dXJuIGNzdC5VSU5UNjRfU0laRSArIHNsb3QgKiBjc3QuQk9PS19FTlRSWV9TSVpFCiAgICBmcmFtZV9kaWcgMQogICAgcHVzaGludCA0OCAvLyA0OAogICAgKgogICAgcHVzaGludCA4IC8vIDgKICAgICsKICAgIGR1cAogICAgZnJhbWVfYnVyeSAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9zdWJyb3V0aW5lcy5weToxNDQKICAgIC8vIGlmIGJvb2suZXh0cmFjdChib29rX3Nsb3Rfb2Zmc2V0KHNsb3QpLCBjc3QuQUREUkVTU19TSVpFKSA9PSBvd25lci5ieXRlczoKICAgIGZyYW1lX2RpZyAtMgogICAgc3dhcAogICAgcHVzaGludCAzMiAvLyAzMgogICAgYm94X2V4dHJhY3QKICAgIGZyYW1lX2RpZyAtMQogICAgPT0KICAgIGJ6IHJlbW92ZV9ib29rX2VudHJ5X2FmdGVyX2lmX2Vsc2VANAogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2Uvc3Vicm91dGluZXMucHk6MTQ1CiAgICAvLyBib29rLnNwbGljZShib29rX3Nsb3Rfb2Zmc2V0KHNsb3QpLCBjc3QuQk9PS19FTlRSWV9TSVpFLCBCeXRlcygpKQogICAgZnJhbWVfZGlnIC0yCiAgICBmcmFtZV9kaWcgMAogICAgcHVzaGludCA0OCAvLyA0OAogICAgYnl0ZWNfMSAvLyAweAogICAgYm94X3NwbGljZQogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2Uvc3Vicm91dGluZXMucHk6MTQ2CiAgICAvLyByZXR1cm4KICAgIHJldHN1YgoKcmVtb3ZlX2Jvb2tfZW50cnlfYWZ0ZXJfaWZfZWxzZUA0OgogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2Uvc3Vicm91dGluZXMucHk6MTQwLTE0MwogICAgLy8gIyBTaGlmdHMgdGhlIGZvbGxvd2luZyBlbnRyaWVzIHVwLCB3aGljaCB6ZXJvZXMgdGhlIGxhc3Qgc2xvdC4gQSBzYWxlIG1pc3NpbmcgZnJvbQogICAgLy8gIyAgdGhlIHNsb3RzIHdhcyBwdXNoZWQgb3V0IG9yIGxlZnQgb3V0IG9mIHRoZW0sIGFuZCBpcyB0YWtlbiBvZmYgdGhlIHVudHJhY2tlZAogICAgLy8gIyAgY291bnQgaW5zdGVhZC4KICAgIC8vIGZvciBzbG90IGluIHVyYW5nZShjc3QuQVNTRVRfQk9PS19TTE9UUyk6CiAgICBmcmFtZV9kaWcgMQogICAgaW50Y18xIC8vIDEKICAgICsKICAgIGZyYW1lX2J1cnkgMQogICAgYiByZW1vdmVfYm9va19lbnRyeV9mb3JfaGVhZGVyQDEKCnJlbW92ZV9ib29rX2VudHJ5X2FmdGVyX2ZvckA2OgogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2Uvc3Vicm91dGluZXMucHk6MTM1CiAgICAvLyByZXR1cm4gb3AuYnRvaShib29rLmV4dHJhY3QoMCwgY3N0LlVJTlQ2NF9TSVpFKSkKICAgIGZyYW1lX2RpZyAtMgogICAgaW50Y18wIC8vIDAKICAgIHB1c2hpbnQgOCAvLyA4CiAgICBib3hfZXh0cmFjdAogICAgYnRvaQogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2Uvc3Vicm91dGluZXMucHk6MTQ3CiAgICAvLyBjb3VudF91bnRyYWNrZWQoYm9vaywgdW50cmFja2VkX2NvdW50KGJvb2spIC0gMSkKICAgIGludGNfMSAvLyAxCiAgICAtCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9zdWJyb3V0aW5lcy5weToxMzAKICAgIC8vIGJvb2sucmVwbGFjZSgwLCBvcC5pdG9iKG5fdW50cmFja2VkKSkKICAgIGl0b2IKICAgIGZyYW1lX2RpZyAtMgogICAgaW50Y18wIC8vIDAKICAgIHVuY292ZXIgMgogICAgYm94X3JlcGxhY2UKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5kaWdpdGFsX21hcmtldHBsYWNlLnN1YnJvdXRpbmVzLnB1dF9ib29rX2VudHJ5KGJvb2s6IGJ5dGVzLCBlbnRyeTogYnl0ZXMsIGRlc2NlbmRpbmc6IHVpbnQ2NCwgcmVwbGFjZTogdWludDY0KSAtPiB2b2lkOgpwdXRfYm9va19lbnRyeToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL3N1YnJvdXRpbmVzLnB5OjE2NS0xNjgKICAgIC8vIEBzdWJyb3V0aW5lCiAgICAvLyBkZWYgcHV0X2Jvb2tfZW50cnkoCiAgICAvLyAgICAgYm9vazogQm94UmVmLCBlbnRyeTogQm9va0VudHJ5LCAqLCBkZXNjZW5kaW5nOiBib29sLCByZXBsYWNlOiBib29sCiAgICAvLyApIC0+IE5vbmU6CiAgICBwcm90byA0IDAKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18xIC8vICIiCiAgICBkdXBuIDUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL3N1YnJvdXRpbmVzLnB5OjE2OS0xNzMKICAgIC8vICMgUmVwbGFjZXMgdGhlIGVudHJ5IG9mIHRoZSBzYWxlLCBpZiBpdCBoYXMgb25lLCBhbmQgaW5zZXJ0cyB0aGUgbmV3IG9uZSBpbiBvcmRlci4KICAgIC8vICMgQW4gZW50cnkgdGhhdCBkb2Vzbid0IGJlYXQgYW55IGluZGV4ZWQgb25lIGlzIGxlZnQgb3V0IG9mIGEgZnVsbCBib29rLCBhbmQKICAgIC8vICMgIGluc2VydGluZyBpbiBhIGZ1bGwgYm9vayBwdXNoZXMgaXRzIGxhc3QgZW50cnkgb3V0LiBFaXRoZXIgd2F5IG9uZSBtb3JlIHNhbGUgaXMKICAgIC8vICMgIHVudHJhY2tlZC4KICAgIC8vIGlmIHJlcGxhY2U6CiAgICBmcmFtZV9kaWcgLTEKICAgIGJ6IHB1dF9ib29rX2VudHJ5X2FmdGVyX2lmX2Vsc2VAMgogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2Uvc3Vicm91dGluZXMucHk6MTc0CiAgICAvLyByZW1vdmVfYm9va19lbnRyeShib29rLCBlbnRyeS5vd25lcikKICAgIGZyYW1lX2RpZyAtMwogICAgZXh0cmFjdCAwIDMyIC8vIG9uIGVycm9yOiBJbmRleCBhY2Nlc3MgaXMgb3V0IG9mIGJvdW5kcwogICAgZnJhbWVfZGlnIC00CiAgICBzd2FwCiAgICBjYWxsc3ViIHJlbW92ZV9ib29rX2VudHJ5CgpwdXRfYm9va19lbnRyeV9hZnRlcl9pZl9lbHNlQDI6CiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9zdWJyb3V0aW5lcy5weToxMjMtMTI1CiAgICAvLyByZXR1cm4gQm9va0VudHJ5LmZyb21fYnl0ZXMoCiAgICAvLyAgICAgYm9vay5leHRyYWN0KGJvb2tfc2xvdF9vZmZzZXQoc2xvdCksIGNzdC5CT09LX0VOVFJZX1NJWkUpCiAgICAvLyApCiAgICBmcmFtZV9kaWcgLTQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL3N1YnJvdXRpbmVzLnB5OjExOAogICAgLy8gcmV0dXJuIGNzdC5VSU5UNjRfU0laRSArIHNsb3QgKiBjc3QuQk9PS19FTlRSWV9TSVpFCiAgICBwdXNoaW50cyAxNTIgNDggLy8gMTUyLCA0OAogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2Uvc3Vicm91dGluZXMucHk6MTI0CiAgICAvLyBib29rLmV4dHJhY3QoYm9va19zbG90X29mZnNldChzbG90KSwgY3N0LkJPT0tfRU5UUllfU0laRSkKICAgIGJveF9leHRyYWN0CiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9zdWJyb3V0aW5lcy5weToxNzUKICAgIC8vIGlmIHJlYWRfYm9va19lbnRyeShib29rLCBVSW50NjQoY3N0LkFTU0VUX0JPT0tfU0xPVFMgLSAxKSkub3duZXIgIT0gYXJjNC5BZGRyZXNzKCk6CiAgICBleHRyYWN0IDAgMzIgLy8gb24gZXJyb3I6IEluZGV4IGFjY2VzcyBpcyBvdXQgb2YgYm91bmRzCiAgICBnbG9iYWwgWmVyb0FkZHJlc3MKICAgICE9CiAgICBieiBwdXRfYm9va19lbnRyeV9hZnRlcl9pZl9lbHNlQDQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL3N1YnJvdXRpbmVzLnB5OjEzNQogICAgLy8gcmV0dXJuIG9wLmJ0b2koYm9vay5leHRyYWN0KDAsIGNzdC5VSU5UNjRfU0laRSkpCiAgICBmcmFtZV9kaWcgLTQKICAgIGludGNfMCAvLyAwCiAgICBwdXNoaW50IDggLy8gOAogICAgYm94X2V4dHJhY3QKICAgIGJ0b2kKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL3N1YnJvdXRpbmVzLnB5OjE3NgogICAgLy8gY291bnRfdW50cmFja2VkKGJvb2ssIHVudHJhY2tlZF9jb3VudChib29rKSArIDEpCiAgICBpbnRjXzEgLy8gMQogICAgKwogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2Uvc3Vicm91dGluZXMucHk6MTMwCiAgICAvLyBib29rLnJlcGxhY2UoMCwgb3AuaXRvYihuX3VudHJhY2tlZCkpCiAgICBpdG9iCiAgICBmcmFtZV9kaWcgLTQKICAgIGludGNfMCAvLyAwCiAgICB1bmNvdmVyIDIKICAgIGJveF9yZXBsYWNlCgpwdXRfYm9va19lbnRyeV9hZnRlcl9pZl9lbHNlQDQ6CiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9zdWJyb3V0aW5lcy5weToxNzcKICAgIC8vIGZvciBzbG90IGluIHVyYW5nZShjc3QuQVNTRVRfQk9PS19TTE9UUyk6CiAgICBpbnRjXzAgLy8gMAogICAgZnJhbWVfYnVyeSA1CgpwdXRfYm9va19lbnRyeV9mb3JfaGVhZGVyQDU6CiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9zdWJyb3V0aW5lcy5weToxNzcKICAgIC8vIGZvciBzbG90IGluIHVyYW5nZShjc3QuQVNTRVRfQk9PS19TTE9UUyk6CiAgICBmcmFtZV9kaWcgNQogICAgcHVzaGludCA0IC8vIDQKICAgIDwKICAgIGJ6IHB1dF9ib29rX2VudHJ5X2FmdGVyX2ZvckAxMQogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2Uvc3Vicm91dGluZXMucHk6MTE4CiAgICAvLyByZXR1cm4gY3N0LlVJTlQ2NF9TSVpFICsgc2xvdCAqIGNzdC5CT09LX0VOVFJZX1NJWkUKICAgIGZyYW1lX2RpZyA1CiAgICBwdXNoaW50IDQ4IC8vIDQ4CiAgICAqCiAgICBwdXNoaW50IDggLy8gOAogICAgKwogICAgZHVwCiAgICBmcmFtZV9idXJ5IDYKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL3N1YnJvdXRpbmVzLnB5OjEyMy0xMjUKICAgIC8vIHJldHVybiBCb29rRW50cnkuZnJvbV9ieXRlcygKICAgIC8vICAgICBib29rLmV4dHJhY3QoYm9va19zbG90X29mZnNldChzbG90KSwgY3N0LkJPT0tfRU5UUllfU0laRSkKICAgIC8vICkKICAgIGZyYW1lX2RpZyAtNAogICAgc3dhcAogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2Uvc3Vicm91dGluZXMucHk6MTI0CiAgICAvLyBib29rLmV4dHJhY3QoYm9va19zbG90X29mZnNldChzbG90KSwgY3N0LkJPT0tfRU5UUllfU0laRSkKICAgIHB1c2hpbnQgNDggLy8gNDgKICAgIGJveF9leHRyYWN0CiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9zdWJyb3V0aW5lcy5weToxMjMtMTI1CiAgICAvLyByZXR1cm4gQm9va0VudHJ5LmZyb21fYnl0ZXMoCiAgICAvLyAgICAgYm9vay5leHRyYWN0KGJvb2tfc2xvdF9vZmZzZXQoc2xvdCksIGNzdC5CT09LX0VOVFJZX1NJWkUpCiAgICAvLyApCiAgICBkdXAKICAgIGZyYW1lX2J1cnkgMAogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2Uvc3Vicm91dGluZXMucHk6MTc5CiAgICAvLyBpZiBjdXJyZW50Lm93bmVyID09IGFyYzQuQWRkcmVzcygpIG9yIHJhbmtzX2JlZm9yZSgKICAgIGV4dHJhY3QgMCAzMiAvLyBvbiBlcnJvcjogSW5kZXggYWNjZXNzIGlzIG91dCBvZiBib3VuZHMKICAgIGdsb2JhbCBaZXJvQWRkcmVzcwogICAgPT0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL3N1YnJvdXRpbmVzLnB5OjE3OS0xODEKICAgIC8vIGlmIGN1cnJlbnQub3duZXIgPT0gYXJjNC5BZGRyZXNzKCkgb3IgcmFua3NfYmVmb3JlKAogICAgLy8gICAgIGVudHJ5LCBjdXJyZW50LCBkZXNjZW5kaW5nPWRlc2NlbmRpbmcKICAgIC8vICk6CiAgICBibnogcHV0X2Jvb2tfZW50cnlfaWZfYm9keUA4CiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9zdWJyb3V0aW5lcy5weToxNTItMTU0CiAgICAvLyAjIEVudHJpZXMgYXJlIHJhbmtlZCBieSBwcmljZSBwZXIgdW5pdCwgY29tcGFyZWQgYnkgY3Jvc3MtbXVsdGlwbHlpbmcgdGhlIHByaWNlcwogICAgLy8gIyAgYW5kIHRoZSBhbW91bnRzIG9uIDEyOCBiaXRzIHNvIHRoYXQgbm8gcHJlY2lzaW9uIGlzIGxvc3QuCiAgICAvLyBlbnRyeV9oaWdoLCBlbnRyeV9sb3cgPSBvcC5tdWx3KGVudHJ5LnByaWNlLm5hdGl2ZSwgY3VycmVudC5hbW91bnQubmF0aXZlKQogICAgZnJhbWVfZGlnIC0zCiAgICBwdXNoaW50IDMyIC8vIDMyCiAgICBleHRyYWN0X3VpbnQ2NAogICAgZnJhbWVfZGlnIDAKICAgIGR1cAogICAgY292ZXIgMgogICAgcHVzaGludCA0MCAvLyA0MAogICAgZXh0cmFjdF91aW50NjQKICAgIG11bHcKICAgIGZyYW1lX2J1cnkgNAogICAgZHVwCiAgICBjb3ZlciAyCiAgICBmcmFtZV9idXJ5IDMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL3N1YnJvdXRpbmVzLnB5OjE1NQogICAgLy8gY3VycmVudF9oaWdoLCBjdXJyZW50X2xvdyA9IG9wLm11bHcoY3VycmVudC5wcmljZS5uYXRpdmUsIGVudHJ5LmFtb3VudC5uYXRpdmUpCiAgICBwdXNoaW50IDMyIC8vIDMyCiAgICBleHRyYWN0X3VpbnQ2NAogICAgZnJhbWVfZGlnIC0zCiAgICBwdXNoaW50IDQwIC8vIDQwCiAgICBleHRyYWN0X3VpbnQ2NAogICAgbXVsdwogICAgZnJhbWVfYnVyeSAyCiAgICBkdXAKICAgIGZyYW1lX2J1cnkgMQogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2Uvc3Vicm91dGluZXMucHk6MTU2CiAgICAvLyBpZiBlbnRyeV9oaWdoICE9IGN1cnJlbnRfaGlnaDoKICAgICE9CiAgICBieiBwdXRfYm9va19lbnRyeV9hZnRlcl9pZl9lbHNlQDE2CiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9zdWJyb3V0aW5lcy5weToxNTcKICAgIC8vIGlmIGRlc2NlbmRpbmc6CiAgICBmcmFtZV9kaWcgLTIKICAgIGJ6IHB1dF9ib29rX2VudHJ5X2FmdGVyX2lmX2Vsc2VAMTUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL3N1YnJvdXRpbmVzLnB5OjE1OAogICAgLy8gcmV0dXJuIGVudHJ5X2hpZ2ggPiBjdXJyZW50X2hpZ2gKICAgIGZyYW1lX2RpZyAzCiAgICBmcmFtZV9kaWcgMQogICAgPgoKcHV0X2Jvb2tfZW50cnlfYWZ0ZXJfaW5saW5lZF9zbWFydF9jb250cmFjdHMuZGlnaXRhbF9tYXJrZXRwbGFjZS5zdWJyb3V0aW5lcy5yYW5rc19iZWZvcmVAMTk6CiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9zdWJyb3V0aW5lcy5weToxNzktMTgxCiAgICAvLyBpZiBjdXJyZW50Lm93bmVyID09IGFyYzQuQWRkcmVzcygpIG9yIHJhbmtzX2JlZm9yZSgKICAgIC8vICAgICBlbnRyeSwgY3VycmVudCwgZGVzY2VuZGluZz1kZXNjZW5kaW5nCiAgICAvLyApOgogICAgYnogcHV0X2Jvb2tfZW50cnlfYWZ0ZXJfaWZfZWxzZUA5CgpwdXRfYm9va19lbnRyeV9pZl9ib2R5QDg6CiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9zdWJyb3V0aW5lcy5weToxODIKICAgIC8vIGJvb2suc3BsaWNlKGJvb2tfc2xvdF9vZmZzZXQoc2xvdCksIDAsIGVudHJ5LmJ5dGVzKQogICAgZnJhbWVfZGlnIC00CiAgICBmcmFtZV9kaWcgNgogICAgaW50Y18wIC8vIDAKICAgIGZyYW1lX2RpZyAtMwogICAgYm94X3NwbGljZQogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2Uvc3Vicm91dGluZXMucHk6MTgzCiAgICAvLyByZXR1cm4KICAgIHJldHN1YgoKcHV0X2Jvb2tfZW50cnlfYWZ0ZXJfaWZfZWxzZUA5OgogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2Uvc3Vicm91dGluZXMucHk6MTc3CiAgICAvLyBmb3Igc2xvdCBpbiB1cmFuZ2UoY3N0LkFTU0VUX0JPT0tfU0xPVFMpOgogICAgZnJhbWVfZGlnIDUKICAgIGludGNfMSAvLyAxCiAgICArCiAgICBmcmFtZV9idXJ5IDUKICAgIGIgcHV0X2Jvb2tfZW50cnlfZm9yX2hlYWRlckA1CgpwdXRfYm9va19lbnRyeV9hZnRlcl9pZl9lbHNlQDE1OgogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2Uvc3Vicm91dGluZXMucHk6MTU5CiAgICAvLyByZXR1cm4gZW50cnlfaGlnaCA8IGN1cnJlbnRfaGlnaAogICAgZnJhbWVfZGlnIDMKICAgIGZyYW1lX2RpZyAxCiAgICA8CiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9zdWJyb3V0aW5lcy5weToxNzktMTgxCiAgICAvLyBpZiBjdXJyZW50Lm93bmVyID09IGFyYzQuQWRkcmVzcygpIG9yIHJhbmtzX2JlZm9yZSgKICAgIC8vICAgICBlbnRyeSwgY3VycmVudCwgZGVzY2VuZGluZz1kZXNjZW5kaW5nCiAgICAvLyApOgogICAgYiBwdXRfYm9va19lbnRyeV9hZnRlcl9pbmxpbmVkX3NtYXJ0X2NvbnRyYWN0cy5kaWdpdGFsX21hcmtldHBsYWNlLnN1YnJvdXRpbmVzLnJhbmtzX2JlZm9yZUAxOQoKcHV0X2Jvb2tfZW50cnlfYWZ0ZXJfaWZfZWxzZUAxNjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL3N1YnJvdXRpbmVzLnB5OjE2MAogICAgLy8gaWYgZGVzY2VuZGluZzoKICAgIGZyYW1lX2RpZyAtMgogICAgYnogcHV0X2Jvb2tfZW50cnlfYWZ0ZXJfaWZfZWxzZUAxOAogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2Uvc3Vicm91dGluZXMucHk6MTYxCiAgICAvLyByZXR1cm4gZW50cnlfbG93ID4gY3VycmVudF9sb3cKICAgIGZyYW1lX2RpZyA0CiAgICBmcmFtZV9kaWcgMgogICAgPgogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2Uvc3Vicm91dGluZXMucHk6MTc5LTE4MQogICAgLy8gaWYgY3VycmVudC5vd25lciA9PSBhcmM0LkFkZHJlc3MoKSBvciByYW5rc19iZWZvcmUoCiAgICAvLyAgICAgZW50cnksIGN1cnJlbnQsIGRlc2NlbmRpbmc9ZGVzY2VuZGluZwogICAgLy8gKToKICAgIGIgcHV0X2Jvb2tfZW50cnlfYWZ0ZXJfaW5saW5lZF9zbWFydF9jb250cmFjdHMuZGlnaXRhbF9tYXJrZXRwbGFjZS5zdWJyb3V0aW5lcy5yYW5rc19iZWZvcmVAMTkKCnB1dF9ib29rX2VudHJ5X2FmdGVyX2lmX2Vsc2VAMTg6CiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9zdWJyb3V0aW5lcy5weToxNjIKICAgIC8vIHJldHVybiBlbnRyeV9sb3cgPCBjdXJyZW50X2xvdwogICAgZnJhbWVfZGlnIDQKICAgIGZyYW1lX2RpZyAyCiAgICA8CiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9zdWJyb3V0aW5lcy5weToxNzktMTgxCiAgICAvLyBpZiBjdXJyZW50Lm93bmVyID09IGFyYzQuQWRkcmVzcygpIG9yIHJhbmtzX2JlZm9yZSgKICAgIC8vICAgICBlbnRyeSwgY3VycmVudCwgZGVzY2VuZGluZz1kZXNjZW5kaW5nCiAgICAvLyApOgogICAgYiBwdXRfYm9va19lbnRyeV9hZnRlcl9pbmxpbmVkX3NtYXJ0X2NvbnRyYWN0cy5kaWdpdGFsX21hcmtldHBsYWNlLnN1YnJvdXRpbmVzLnJhbmtzX2JlZm9yZUAxOQoKcHV0X2Jvb2tfZW50cnlfYWZ0ZXJfZm9yQDExOgogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLmRpZ2l0YWxfbWFya2V0cGxhY2Uuc3Vicm91dGluZXMuZW5zdXJlX3JlY2VpcHRfbG9vcF9idWRnZXQobl9yZWNlaXB0czogdWludDY0KSAtPiB2b2lkOgplbnN1cmVfcmVjZWlwdF9sb29wX2J1ZGdldDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL3N1YnJvdXRpbmVzLnB5OjIyNi0yMjcKICAgIC8vIEBzdWJyb3V0aW5lCiAgICAvLyBkZWYgZW5zdXJlX3JlY2VpcHRfbG9vcF9idWRnZXQobl9yZWNlaXB0czogVUludDY0KSAtPiBOb25lOgogICAgcHJvdG8gMSAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9zdWJyb3V0aW5lcy5weToyMzAKICAgIC8vIGNzdC5SRUNFSVBUX0xPT1BfQkFTRV9CVURHRVQgKyBuX3JlY2VpcHRzICogY3N0LlJFQ0VJUFRfTE9PUF9QRVJfUkVDRUlQVF9CVURHRVQsCiAgICBmcmFtZV9kaWcgLTEKICAgIHB1c2hpbnQgMTUwIC8vIDE1MAogICAgKgogICAgcHVzaGludCAyMDAgLy8gMjAwCiAgICArCiAgICBwdXNoaW50IDEwIC8vIDEwCiAgICArCgplbnN1cmVfcmVjZWlwdF9sb29wX2J1ZGdldF93aGlsZV90b3BAMjoKICAgIGZyYW1lX2RpZyAwCiAgICBnbG9iYWwgT3Bjb2RlQnVkZ2V0CiAgICA+CiAgICBieiBlbnN1cmVfcmVjZWlwdF9sb29wX2J1ZGdldF9hZnRlcl93aGlsZUA3CiAgICBpdHhuX2JlZ2luCiAgICBwdXNoaW50IDYgLy8gYXBwbAogICAgaXR4bl9maWVsZCBUeXBlRW51bQogICAgcHVzaGludCA1IC8vIERlbGV0ZUFwcGxpY2F0aW9uCiAgICBpdHhuX2ZpZWxkIE9uQ29tcGxldGlvbgogICAgYnl0ZWMgMTQgLy8gMHgwNjgxMDEKICAgIGl0eG5fZmllbGQgQXBwcm92YWxQcm9ncmFtCiAgICBieXRlYyAxNCAvLyAweDA2ODEwMQogICAgaXR4bl9maWVsZCBDbGVhclN0YXRlUHJvZ3JhbQogICAgaW50Y18wIC8vIDAKICAgIGl0eG5fZmllbGQgRmVlCiAgICBpdHhuX3N1Ym1pdAogICAgYiBlbnN1cmVfcmVjZWlwdF9sb29wX2J1ZGdldF93aGlsZV90b3BAMgoKZW5zdXJlX3JlY2VpcHRfbG9vcF9idWRnZXRfYWZ0ZXJfd2hpbGVANzoKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5kaWdpdGFsX21hcmtldHBsYWNlLnN1YnJvdXRpbmVzLmlzX2V4cGlyZWQoc2FsZTogYnl0ZXMpIC0+IHVpbnQ2NDoKaXNfZXhwaXJlZDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL3N1YnJvdXRpbmVzLnB5OjIzNS0yMzYKICAgIC8vIEBzdWJyb3V0aW5lCiAgICAvLyBkZWYgaXNfZXhwaXJlZChzYWxlOiBTYWxlKSAtPiBib29sOgogICAgcHJvdG8gMSAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9zdWJyb3V0aW5lcy5weToyMzctMjM5CiAgICAvLyAjIFRoZSBleHBpcnkgcm91bmQgaXMga2VwdCBpbiB0aGUgc2FsZSwgc28gdGhhdCB0aGUgbWV0aG9kcyB0aGF0IGNoZWNrIGl0IGRvbid0CiAgICAvLyAjICByZWZlcmVuY2UgYW5vdGhlciBib3guCiAgICAvLyByZXR1cm4gc2FsZS5leHBpcmVzX2F0ICE9IDAgYW5kIEdsb2JhbC5yb3VuZCA+PSBzYWxlLmV4cGlyZXNfYXQubmF0aXZlCiAgICBmcmFtZV9kaWcgLTEKICAgIGV4dHJhY3QgMTYgOCAvLyBvbiBlcnJvcjogSW5kZXggYWNjZXNzIGlzIG91dCBvZiBib3VuZHMKICAgIGJ5dGVjIDggLy8gMHgwMDAwMDAwMDAwMDAwMDAwCiAgICBiIT0KICAgIGJ6IGlzX2V4cGlyZWRfYm9vbF9mYWxzZUAzCiAgICBnbG9iYWwgUm91bmQKICAgIGZyYW1lX2RpZyAtMQogICAgaW50Y18zIC8vIDE2CiAgICBleHRyYWN0X3VpbnQ2NAogICAgPj0KICAgIGJ6IGlzX2V4cGlyZWRfYm9vbF9mYWxzZUAzCiAgICBpbnRjXzEgLy8gMQogICAgcmV0c3ViCgppc19leHBpcmVkX2Jvb2xfZmFsc2VAMzoKICAgIGludGNfMCAvLyAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9zdWJyb3V0aW5lcy5weToyMzctMjM5CiAgICAvLyAjIFRoZSBleHBpcnkgcm91bmQgaXMga2VwdCBpbiB0aGUgc2FsZSwgc28gdGhhdCB0aGUgbWV0aG9kcyB0aGF0IGNoZWNrIGl0IGRvbid0CiAgICAvLyAjICByZWZlcmVuY2UgYW5vdGhlciBib3guCiAgICAvLyByZXR1cm4gc2FsZS5leHBpcmVzX2F0ICE9IDAgYW5kIEdsb2JhbC5yb3VuZCA+PSBzYWxlLmV4cGlyZXNfYXQubmF0aXZlCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuZGlnaXRhbF9tYXJrZXRwbGFjZS5zdWJyb3V0aW5lcy5jYW5fcmVjZWl2ZV9hc3NldChhY2NvdW50OiBieXRlcywgYXNzZXQ6IHVpbnQ2NCkgLT4gdWludDY0OgpjYW5fcmVjZWl2ZV9hc3NldDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL3N1YnJvdXRpbmVzLnB5OjI0Mi0yNDMKICAgIC8vIEBzdWJyb3V0aW5lCiAgICAvLyBkZWYgY2FuX3JlY2VpdmVfYXNzZXQoYWNjb3VudDogQWNjb3VudCwgYXNzZXQ6IFVJbnQ2NCkgLT4gYm9vbDoKICAgIHByb3RvIDIgMQogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2Uvc3Vicm91dGluZXMucHk6MjQ0LTI0NgogICAgLy8gIyBBbiBhc3NldCB0cmFuc2ZlciBmYWlscyBpZiB0aGUgcmVjZWl2ZXIgaXNuJ3Qgb3B0ZWQgaW4gdG8gdGhlIGFzc2V0LCBhcyB3aGVuIGl0CiAgICAvLyAjICBvcHRlZCBvdXQgYWZ0ZXIgYmlkZGluZywgb3IgaWYgaXRzIGhvbGRpbmcgaXMgZnJvemVuLgogICAgLy8gZnJvemVuLCBvcHRlZF9pbiA9IG9wLkFzc2V0SG9sZGluZ0dldC5hc3NldF9mcm96ZW4oYWNjb3VudCwgYXNzZXQpCiAgICBmcmFtZV9kaWcgLTIKICAgIGZyYW1lX2RpZyAtMQogICAgYXNzZXRfaG9sZGluZ19nZXQgQXNzZXRGcm96ZW4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL3N1YnJvdXRpbmVzLnB5OjI0NwogICAgLy8gcmV0dXJuIG9wdGVkX2luIGFuZCBub3QgZnJvemVuCiAgICBieiBjYW5fcmVjZWl2ZV9hc3NldF9ib29sX2ZhbHNlQDMKICAgIGZyYW1lX2RpZyAwCiAgICBibnogY2FuX3JlY2VpdmVfYXNzZXRfYm9vbF9mYWxzZUAzCiAgICBpbnRjXzEgLy8gMQoKY2FuX3JlY2VpdmVfYXNzZXRfYm9vbF9tZXJnZUA0OgogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2Uvc3Vicm91dGluZXMucHk6MjQ3CiAgICAvLyByZXR1cm4gb3B0ZWRfaW4gYW5kIG5vdCBmcm96ZW4KICAgIHN3YXAKICAgIHJldHN1YgoKY2FuX3JlY2VpdmVfYXNzZXRfYm9vbF9mYWxzZUAzOgogICAgaW50Y18wIC8vIDAKICAgIGIgY2FuX3JlY2VpdmVfYXNzZXRfYm9vbF9tZXJnZUA0CgoKLy8gc21hcnRfY29udHJhY3RzLmRpZ2l0YWxfbWFya2V0cGxhY2UuY29udHJhY3QuRGlnaXRhbE1hcmtldHBsYWNlLmRlcG9zaXQocGF5bWVudDogdWludDY0KSAtPiB2b2lkOgpkZXBvc2l0OgogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2UvY29udHJhY3QucHk6MTY2LTE2NwogICAgLy8gQGFiaW1ldGhvZAogICAgLy8gZGVmIGRlcG9zaXQoc2VsZiwgcGF5bWVudDogZ3R4bi5QYXltZW50VHJhbnNhY3Rpb24pIC0+IE5vbmU6CiAgICBwcm90byAxIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjE2OAogICAgLy8gYXNzZXJ0IHBheW1lbnQuc2VuZGVyID09IFR4bi5zZW5kZXIsIGVyci5ESUZGRVJFTlRfU0VOREVSCiAgICBmcmFtZV9kaWcgLTEKICAgIGd0eG5zIFNlbmRlcgogICAgdHhuIFNlbmRlcgogICAgPT0KICAgIGFzc2VydCAvLyBEaWZmZXJlbnQgc2VuZGVyCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weToxNzAKICAgIC8vIHBheW1lbnQucmVjZWl2ZXIgPT0gR2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcwogICAgZnJhbWVfZGlnIC0xCiAgICBndHhucyBSZWNlaXZlcgogICAgZ2xvYmFsIEN1cnJlbnRBcHBsaWNhdGlvbkFkZHJlc3MKICAgID09CiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weToxNjktMTcxCiAgICAvLyBhc3NlcnQgKAogICAgLy8gICAgIHBheW1lbnQucmVjZWl2ZXIgPT0gR2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcwogICAgLy8gKSwgZXJyLldST05HX1JFQ0VJVkVSCiAgICBhc3NlcnQgLy8gV3JvbmcgcmVjZWl2ZXIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjE3My0xNzQKICAgIC8vICMgVGhlIE1CUiBvZiBhIG5ldyBkZXBvc2l0IGJveCBpcyBrbm93biB1cGZyb250LCBzbyB0aGUgYm94IGlzIHdyaXR0ZW4gb25jZS4KICAgIC8vIGRlcG9zaXRlZCwgZXhpc3RzID0gc2VsZi5kZXBvc2l0ZWQubWF5YmUoVHhuLnNlbmRlcikKICAgIGJ5dGVjXzAgLy8gImRlcG9zaXRlZCIKICAgIHR4biBTZW5kZXIKICAgIGNvbmNhdAogICAgYm94X2dldAogICAgc3dhcAogICAgYnRvaQogICAgc3dhcAogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2UvY29udHJhY3QucHk6MTc1CiAgICAvLyBib3hfbWJyX2NoYXJnZSA9IFVJbnQ2NCgwKQogICAgaW50Y18wIC8vIDAKICAgIHN3YXAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjE3NgogICAgLy8gaWYgbm90IGV4aXN0czoKICAgIGJueiBkZXBvc2l0X2FmdGVyX2lmX2Vsc2VAMgogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2Uvc3Vicm91dGluZXMucHk6MjYtMjcKICAgIC8vICMgVGhlIHNpemUgb2YgYSBib3ggaW5jbHVkZXMgaXRzIG5hbWUsIGtleSBwcmVmaXggaW5jbHVkZWQuCiAgICAvLyByZXR1cm4gY3N0LkJPWF9GTEFUX01JTl9CQUxBTkNFICsgc2l6ZSAqIGNzdC5CT1hfQllURV9NSU5fQkFMQU5DRQogICAgaW50YyA1IC8vIDIyMTAwCiAgICBmcmFtZV9idXJ5IDEKCmRlcG9zaXRfYWZ0ZXJfaWZfZWxzZUAyOgogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2UvY29udHJhY3QucHk6MTc4CiAgICAvLyBzZWxmLmRlcG9zaXRlZFtUeG4uc2VuZGVyXSA9IGRlcG9zaXRlZCArIHBheW1lbnQuYW1vdW50IC0gYm94X21icl9jaGFyZ2UKICAgIGZyYW1lX2RpZyAtMQogICAgZ3R4bnMgQW1vdW50CiAgICBmcmFtZV9kaWcgMAogICAgKwogICAgYnl0ZWNfMCAvLyAiZGVwb3NpdGVkIgogICAgdHhuIFNlbmRlcgogICAgY29uY2F0CiAgICBzd2FwCiAgICBmcmFtZV9kaWcgMQogICAgLQogICAgaXRvYgogICAgYm94X3B1dAogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLmRpZ2l0YWxfbWFya2V0cGxhY2UuY29udHJhY3QuRGlnaXRhbE1hcmtldHBsYWNlLnNldHRsZShhY2NvdW50OiBieXRlcywgY3JlZGl0OiB1aW50NjQsIGRlYml0OiB1aW50NjQpIC0+IHZvaWQ6CnNldHRsZToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjIxOS0yMjAKICAgIC8vIEBzdWJyb3V0aW5lCiAgICAvLyBkZWYgc2V0dGxlKHNlbGYsIGFjY291bnQ6IEFjY291bnQsIGNyZWRpdDogVUludDY0LCBkZWJpdDogVUludDY0KSAtPiBOb25lOgogICAgcHJvdG8gMyAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weToyMjEtMjI0CiAgICAvLyAjIE1ldGhvZHMgbmV0IGFsbCB0aGUgY3JlZGl0cyBhbmQgZGViaXRzIG9mIGFuIGFjY291bnQgaW4gbWVtb3J5IGFuZCBzZXR0bGUKICAgIC8vICMgIHRoZW0gaGVyZSwgc28gdGhhdCBlYWNoIGRlcG9zaXQgYm94IGlzIHJlYWQgYW5kIHdyaXR0ZW4gb25jZSBwZXIgY2FsbC4KICAgIC8vICMgQ3JlZGl0cyBhcmUgYXBwbGllZCBmaXJzdCwgc28gdGhhdCBhIGNhbGwgY2FuIHNwZW5kIHdoYXQgaXQgZ2l2ZXMgYmFjay4KICAgIC8vIHNlbGYuZGVwb3NpdGVkW2FjY291bnRdID0gc2VsZi5kZXBvc2l0ZWRbYWNjb3VudF0gKyBjcmVkaXQgLSBkZWJpdAogICAgYnl0ZWNfMCAvLyAiZGVwb3NpdGVkIgogICAgZnJhbWVfZGlnIC0zCiAgICBjb25jYXQKICAgIGR1cAogICAgYm94X2dldAogICAgc3dhcAogICAgYnRvaQogICAgc3dhcAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuZGVwb3NpdGVkIGVudHJ5IGV4aXN0cwogICAgZnJhbWVfZGlnIC0yCiAgICArCiAgICBmcmFtZV9kaWcgLTEKICAgIC0KICAgIGl0b2IKICAgIGJveF9wdXQKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5kaWdpdGFsX21hcmtldHBsYWNlLmNvbnRyYWN0LkRpZ2l0YWxNYXJrZXRwbGFjZS5yZWNlaXB0X3BhZ2VfYm94KGJpZGRlcjogYnl0ZXMsIHBhZ2U6IHVpbnQ2NCkgLT4gYnl0ZXM6CnJlY2VpcHRfcGFnZV9ib3g6CiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weToyMzQtMjM1CiAgICAvLyBAc3Vicm91dGluZQogICAgLy8gZGVmIHJlY2VpcHRfcGFnZV9ib3goc2VsZiwgYmlkZGVyOiBBY2NvdW50LCBwYWdlOiBVSW50NjQpIC0+IEJveFJlZjoKICAgIHByb3RvIDIgMQogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2Uvc3Vicm91dGluZXMucHk6MjEwCiAgICAvLyByZXR1cm4gYmlkZGVyLmJ5dGVzICsgYXJjNC5VSW50MTYocGFnZSkuYnl0ZXMKICAgIGZyYW1lX2RpZyAtMQogICAgaXRvYgogICAgZHVwCiAgICBiaXRsZW4KICAgIGludGNfMyAvLyAxNgogICAgPD0KICAgIGFzc2VydCAvLyBvdmVyZmxvdwogICAgZXh0cmFjdCA2IDIKICAgIGZyYW1lX2RpZyAtMgogICAgc3dhcAogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weToyMzcKICAgIC8vIGtleT1zZWxmLnJlY2VpcHRfYm9va19wYWdlcy5rZXlfcHJlZml4ICsgcmVjZWlwdF9wYWdlX2tleShiaWRkZXIsIHBhZ2UpCiAgICBwdXNoYnl0ZXMgMHg3MAogICAgc3dhcAogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weToyMzYtMjM4CiAgICAvLyByZXR1cm4gQm94UmVmKAogICAgLy8gICAgIGtleT1zZWxmLnJlY2VpcHRfYm9va19wYWdlcy5rZXlfcHJlZml4ICsgcmVjZWlwdF9wYWdlX2tleShiaWRkZXIsIHBhZ2UpCiAgICAvLyApCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuZGlnaXRhbF9tYXJrZXRwbGFjZS5jb250cmFjdC5EaWdpdGFsTWFya2V0cGxhY2UucmVjZWlwdF9wYWdlc19vZihiaWRkZXI6IGJ5dGVzKSAtPiB1aW50NjQ6CnJlY2VpcHRfcGFnZXNfb2Y6CiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weToyNDAtMjQxCiAgICAvLyBAc3Vicm91dGluZQogICAgLy8gZGVmIHJlY2VpcHRfcGFnZXNfb2Yoc2VsZiwgYmlkZGVyOiBBY2NvdW50KSAtPiBVSW50NjQ6CiAgICBwcm90byAxIDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjI0MgogICAgLy8gdG90YWxzLCBleGlzdHMgPSBzZWxmLmJpZF90b3RhbHMubWF5YmUoYmlkZGVyKQogICAgYnl0ZWMgNSAvLyAiYmlkX3RvdGFscyIKICAgIGZyYW1lX2RpZyAtMQogICAgY29uY2F0CiAgICBib3hfZ2V0CiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weToyNDMKICAgIC8vIGlmIG5vdCBleGlzdHM6CiAgICBibnogcmVjZWlwdF9wYWdlc19vZl9hZnRlcl9pZl9lbHNlQDIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjI0NAogICAgLy8gcmV0dXJuIFVJbnQ2NCgwKQogICAgaW50Y18wIC8vIDAKICAgIHN3YXAKICAgIHJldHN1YgoKcmVjZWlwdF9wYWdlc19vZl9hZnRlcl9pZl9lbHNlQDI6CiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weToyNDUKICAgIC8vIHJldHVybiB0b3RhbHMubl9wYWdlcy5uYXRpdmUKICAgIGZyYW1lX2RpZyAwCiAgICBpbnRjXzMgLy8gMTYKICAgIGV4dHJhY3RfdWludDE2CiAgICBzd2FwCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuZGlnaXRhbF9tYXJrZXRwbGFjZS5jb250cmFjdC5EaWdpdGFsTWFya2V0cGxhY2UucmVjZWlwdF9ib29rX29mKGJpZGRlcjogYnl0ZXMsIHNhbGVfaWQ6IGJ5dGVzKSAtPiBieXRlcywgdWludDY0OgpyZWNlaXB0X2Jvb2tfb2Y6CiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weToyNDctMjUwCiAgICAvLyBAc3Vicm91dGluZQogICAgLy8gZGVmIHJlY2VpcHRfYm9va19vZigKICAgIC8vICAgICBzZWxmLCBiaWRkZXI6IEFjY291bnQsIHNhbGVfaWQ6IGFyYzQuVUludDY0CiAgICAvLyApIC0+IHR1cGxlW0JveFJlZiwgVUludDY0XToKICAgIHByb3RvIDIgMgogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2UvY29udHJhY3QucHk6MjUxLTI1MwogICAgLy8gIyBSZXR1cm5zIHRoZSBib3ggaG9sZGluZyB0aGUgcmVjZWlwdCBvZiB0aGUgYmlkZGVyIGZvciB0aGUgc2FsZSBhbmQgaXRzIHBhZ2UsCiAgICAvLyAjICB3aGljaCBpcyB6ZXJvIGZvciBhIGJpZGRlciB3aXRob3V0IHBhZ2VzLgogICAgLy8gbl9wYWdlcyA9IHNlbGYucmVjZWlwdF9wYWdlc19vZihiaWRkZXIpCiAgICBmcmFtZV9kaWcgLTIKICAgIGNhbGxzdWIgcmVjZWlwdF9wYWdlc19vZgogICAgZHVwCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weToyNTQKICAgIC8vIGlmIG5vdCBuX3BhZ2VzOgogICAgYm56IHJlY2VpcHRfYm9va19vZl9hZnRlcl9pZl9lbHNlQDIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjIyOAogICAgLy8gcmV0dXJuIEJveFJlZihrZXk9c2VsZi5yZWNlaXB0X2Jvb2sua2V5X3ByZWZpeCArIGJpZGRlci5ieXRlcykKICAgIGJ5dGVjXzMgLy8gInJlY2VpcHRfYm9vayIKICAgIGZyYW1lX2RpZyAtMgogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weToyNTUKICAgIC8vIHJldHVybiBzZWxmLnJlY2VpcHRfYm9va19ib3goYmlkZGVyKSwgVUludDY0KDApCiAgICBpbnRjXzAgLy8gMAogICAgdW5jb3ZlciAyCiAgICByZXRzdWIKCnJlY2VpcHRfYm9va19vZl9hZnRlcl9pZl9lbHNlQDI6CiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9zdWJyb3V0aW5lcy5weToyMDQtMjA1CiAgICAvLyAjIFRoZSBwYWdlIG9mIGEgc2FsZSBvbmx5IGRlcGVuZHMgb24gaXRzIGlkLCBzbyBpdCBpcyBmb3VuZCB3aXRob3V0IGEgbG9va3VwLgogICAgLy8gcmV0dXJuIHNhbGVfaWQubmF0aXZlICUgbl9wYWdlcwogICAgZnJhbWVfZGlnIC0xCiAgICBidG9pCiAgICBmcmFtZV9kaWcgMAogICAgJQogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2UvY29udHJhY3QucHk6MjU3CiAgICAvLyByZXR1cm4gc2VsZi5yZWNlaXB0X3BhZ2VfYm94KGJpZGRlciwgcGFnZSksIHBhZ2UKICAgIGZyYW1lX2RpZyAtMgogICAgZGlnIDEKICAgIGNhbGxzdWIgcmVjZWlwdF9wYWdlX2JveAogICAgc3dhcAogICAgdW5jb3ZlciAyCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuZGlnaXRhbF9tYXJrZXRwbGFjZS5jb250cmFjdC5EaWdpdGFsTWFya2V0cGxhY2UuY291bnRfcGFnZV9yZWNlaXB0cyhiaWRkZXI6IGJ5dGVzLCBwYWdlOiB1aW50NjQsIG5fcmVjZWlwdHM6IHVpbnQ2NCkgLT4gdm9pZDoKY291bnRfcGFnZV9yZWNlaXB0czoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjI1OS0yNjIKICAgIC8vIEBzdWJyb3V0aW5lCiAgICAvLyBkZWYgY291bnRfcGFnZV9yZWNlaXB0cygKICAgIC8vICAgICBzZWxmLCBiaWRkZXI6IEFjY291bnQsIHBhZ2U6IFVJbnQ2NCwgbl9yZWNlaXB0czogVUludDY0CiAgICAvLyApIC0+IE5vbmU6CiAgICBwcm90byAzIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjI2My0yNjQKICAgIC8vICMgS2VlcHMgdGhlIG51bWJlciBvZiByZWNlaXB0cyBvZiB0aGUgcGFnZSBpbiB0aGUgaGVhZGVyIG9mIGEgcGFnZWQgYmlkZGVyLgogICAgLy8gaWYgc2VsZi5yZWNlaXB0X3BhZ2VzX29mKGJpZGRlcik6CiAgICBmcmFtZV9kaWcgLTMKICAgIGNhbGxzdWIgcmVjZWlwdF9wYWdlc19vZgogICAgYnogY291bnRfcGFnZV9yZWNlaXB0c19hZnRlcl9pZl9lbHNlQDIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjIzMgogICAgLy8gcmV0dXJuIEJveFJlZihrZXk9c2VsZi5yZWNlaXB0X3BhZ2VzLmtleV9wcmVmaXggKyBiaWRkZXIuYnl0ZXMpCiAgICBieXRlYyA5IC8vICJyZWNlaXB0X3BhZ2VzIgogICAgZnJhbWVfZGlnIC0zCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjI2NgogICAgLy8gY3N0LkFSUkFZX0hFQURFUl9TSVpFICsgcGFnZSAqIGNzdC5VSU5UMTZfU0laRSwKICAgIGZyYW1lX2RpZyAtMgogICAgaW50Y18yIC8vIDIKICAgICoKICAgIGludGNfMiAvLyAyCiAgICArCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weToyNjcKICAgIC8vIGFyYzQuVUludDE2KG5fcmVjZWlwdHMpLmJ5dGVzLAogICAgZnJhbWVfZGlnIC0xCiAgICBpdG9iCiAgICBkdXAKICAgIGJpdGxlbgogICAgaW50Y18zIC8vIDE2CiAgICA8PQogICAgYXNzZXJ0IC8vIG92ZXJmbG93CiAgICBleHRyYWN0IDYgMgogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2UvY29udHJhY3QucHk6MjY1LTI2OAogICAgLy8gc2VsZi5yZWNlaXB0X3BhZ2VzX2JveChiaWRkZXIpLnJlcGxhY2UoCiAgICAvLyAgICAgY3N0LkFSUkFZX0hFQURFUl9TSVpFICsgcGFnZSAqIGNzdC5VSU5UMTZfU0laRSwKICAgIC8vICAgICBhcmM0LlVJbnQxNihuX3JlY2VpcHRzKS5ieXRlcywKICAgIC8vICkKICAgIGJveF9yZXBsYWNlCgpjb3VudF9wYWdlX3JlY2VpcHRzX2FmdGVyX2lmX2Vsc2VAMjoKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5kaWdpdGFsX21hcmtldHBsYWNlLmNvbnRyYWN0LkRpZ2l0YWxNYXJrZXRwbGFjZS53aXRoZHJhdyhhbW91bnQ6IGJ5dGVzKSAtPiB2b2lkOgp3aXRoZHJhdzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjI3MC0yNzEKICAgIC8vIEBhYmltZXRob2QKICAgIC8vIGRlZiB3aXRoZHJhdyhzZWxmLCBhbW91bnQ6IGFyYzQuVUludDY0KSAtPiBOb25lOgogICAgcHJvdG8gMSAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weToyNzIKICAgIC8vIHNlbGYuZGVwb3NpdGVkW1R4bi5zZW5kZXJdIC09IGFtb3VudC5uYXRpdmUKICAgIGJ5dGVjXzAgLy8gImRlcG9zaXRlZCIKICAgIHR4biBTZW5kZXIKICAgIGNvbmNhdAogICAgZHVwCiAgICBib3hfZ2V0CiAgICBzd2FwCiAgICBidG9pCiAgICBzd2FwCiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5kZXBvc2l0ZWQgZW50cnkgZXhpc3RzCiAgICBmcmFtZV9kaWcgLTEKICAgIGJ0b2kKICAgIHN3YXAKICAgIGRpZyAxCiAgICAtCiAgICBpdG9iCiAgICB1bmNvdmVyIDIKICAgIHN3YXAKICAgIGJveF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjI3NAogICAgLy8gaXR4bi5QYXltZW50KHJlY2VpdmVyPVR4bi5zZW5kZXIsIGFtb3VudD1hbW91bnQubmF0aXZlKS5zdWJtaXQoKQogICAgaXR4bl9iZWdpbgogICAgdHhuIFNlbmRlcgogICAgaXR4bl9maWVsZCBSZWNlaXZlcgogICAgaXR4bl9maWVsZCBBbW91bnQKICAgIGludGNfMSAvLyBwYXkKICAgIGl0eG5fZmllbGQgVHlwZUVudW0KICAgIGludGNfMCAvLyAwCiAgICBpdHhuX2ZpZWxkIEZlZQogICAgaXR4bl9zdWJtaXQKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5kaWdpdGFsX21hcmtldHBsYWNlLmNvbnRyYWN0LkRpZ2l0YWxNYXJrZXRwbGFjZS5zcG9uc29yX2Fzc2V0KGFzc2V0OiB1aW50NjQpIC0+IHZvaWQ6CnNwb25zb3JfYXNzZXQ6CiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weToyODItMjgzCiAgICAvLyBAYWJpbWV0aG9kCiAgICAvLyBkZWYgc3BvbnNvcl9hc3NldChzZWxmLCBhc3NldDogQXNzZXQpIC0+IE5vbmU6CiAgICBwcm90byAxIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjI4NAogICAgLy8gYXNzZXJ0IG5vdCBHbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzLmlzX29wdGVkX2luKAogICAgZ2xvYmFsIEN1cnJlbnRBcHBsaWNhdGlvbkFkZHJlc3MKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjI4NC0yODYKICAgIC8vIGFzc2VydCBub3QgR2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcy5pc19vcHRlZF9pbigKICAgIC8vICAgICBhc3NldAogICAgLy8gKSwgZXJyLkFMUkVBRFlfT1BURURfSU4KICAgIGZyYW1lX2RpZyAtMQogICAgYXNzZXRfaG9sZGluZ19nZXQgQXNzZXRCYWxhbmNlCiAgICBidXJ5IDEKICAgICEKICAgIGFzc2VydCAvLyBBbHJlYWR5IG9wdGVkIGluCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weToyODcKICAgIC8vIGFzc2VydCBhc3NldC5jbGF3YmFjayA9PSBHbG9iYWwuemVyb19hZGRyZXNzLCBlcnIuQ0xBV0JBQ0tfQVNBCiAgICBmcmFtZV9kaWcgLTEKICAgIGFzc2V0X3BhcmFtc19nZXQgQXNzZXRDbGF3YmFjawogICAgYXNzZXJ0IC8vIGFzc2V0IGV4aXN0cwogICAgZ2xvYmFsIFplcm9BZGRyZXNzCiAgICA9PQogICAgYXNzZXJ0IC8vIENsYXdiYWNrIEFTQQogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2UvY29udHJhY3QucHk6Mjg5CiAgICAvLyBhc3NldF9rZXkgPSBhcmM0LlVJbnQ2NChhc3NldC5pZCkKICAgIGZyYW1lX2RpZyAtMQogICAgaXRvYgogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2UvY29udHJhY3QucHk6MjkwCiAgICAvLyBzZWxmLmJlc3RfYXNrc1thc3NldF9rZXldID0gQXNzZXRCb29rLmZyb21fYnl0ZXMob3AuYnplcm8oY3N0LkFTU0VUX0JPT0tfU0laRSkpCiAgICBwdXNoaW50IDIwMCAvLyAyMDAKICAgIGJ6ZXJvCiAgICBieXRlYyAxMCAvLyAiYmVzdF9hc2tzIgogICAgZGlnIDIKICAgIGNvbmNhdAogICAgZGlnIDEKICAgIGJveF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjI5MQogICAgLy8gc2VsZi5iZXN0X2JpZHNbYXNzZXRfa2V5XSA9IEFzc2V0Qm9vay5mcm9tX2J5dGVzKG9wLmJ6ZXJvKGNzdC5BU1NFVF9CT09LX1NJWkUpKQogICAgYnl0ZWMgMTEgLy8gImJlc3RfYmlkcyIKICAgIHVuY292ZXIgMgogICAgY29uY2F0CiAgICBzd2FwCiAgICBib3hfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weToyOTMKICAgIC8vIHNlbGYuZGVwb3NpdGVkW1R4bi5zZW5kZXJdIC09ICgKICAgIGJ5dGVjXzAgLy8gImRlcG9zaXRlZCIKICAgIHR4biBTZW5kZXIKICAgIGNvbmNhdAogICAgZHVwCiAgICBib3hfZ2V0CiAgICBzd2FwCiAgICBidG9pCiAgICBzd2FwCiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5kZXBvc2l0ZWQgZW50cnkgZXhpc3RzCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weToyOTQKICAgIC8vIEdsb2JhbC5hc3NldF9vcHRfaW5fbWluX2JhbGFuY2UgKyBzZWxmLmFzc2V0X2Jvb2tzX21icigpCiAgICBnbG9iYWwgQXNzZXRPcHRJbk1pbkJhbGFuY2UKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjIwMC0yMDIKICAgIC8vIHJldHVybiBib3hfbWJyKHNlbGYuYmVzdF9hc2tzLmtleV9wcmVmaXgubGVuZ3RoICsgYm9va19zaXplKSArIGJveF9tYnIoCiAgICAvLyAgICAgc2VsZi5iZXN0X2JpZHMua2V5X3ByZWZpeC5sZW5ndGggKyBib29rX3NpemUKICAgIC8vICkKICAgIHB1c2hpbnQgMTc4NjAwIC8vIDE3ODYwMAogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2UvY29udHJhY3QucHk6Mjk0CiAgICAvLyBHbG9iYWwuYXNzZXRfb3B0X2luX21pbl9iYWxhbmNlICsgc2VsZi5hc3NldF9ib29rc19tYnIoKQogICAgKwogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2UvY29udHJhY3QucHk6MjkzLTI5NQogICAgLy8gc2VsZi5kZXBvc2l0ZWRbVHhuLnNlbmRlcl0gLT0gKAogICAgLy8gICAgIEdsb2JhbC5hc3NldF9vcHRfaW5fbWluX2JhbGFuY2UgKyBzZWxmLmFzc2V0X2Jvb2tzX21icigpCiAgICAvLyApCiAgICAtCiAgICBpdG9iCiAgICBib3hfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weToyOTctMzAxCiAgICAvLyBpdHhuLkFzc2V0VHJhbnNmZXIoCiAgICAvLyAgICAgeGZlcl9hc3NldD1hc3NldCwKICAgIC8vICAgICBhc3NldF9yZWNlaXZlcj1HbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzLAogICAgLy8gICAgIGFzc2V0X2Ftb3VudD0wLAogICAgLy8gKS5zdWJtaXQoKQogICAgaXR4bl9iZWdpbgogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2UvY29udHJhY3QucHk6Mjk5CiAgICAvLyBhc3NldF9yZWNlaXZlcj1HbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzLAogICAgZ2xvYmFsIEN1cnJlbnRBcHBsaWNhdGlvbkFkZHJlc3MKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjMwMAogICAgLy8gYXNzZXRfYW1vdW50PTAsCiAgICBpbnRjXzAgLy8gMAogICAgaXR4bl9maWVsZCBBc3NldEFtb3VudAogICAgaXR4bl9maWVsZCBBc3NldFJlY2VpdmVyCiAgICBmcmFtZV9kaWcgLTEKICAgIGl0eG5fZmllbGQgWGZlckFzc2V0CiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weToyOTcKICAgIC8vIGl0eG4uQXNzZXRUcmFuc2ZlcigKICAgIHB1c2hpbnQgNCAvLyBheGZlcgogICAgaXR4bl9maWVsZCBUeXBlRW51bQogICAgaW50Y18wIC8vIDAKICAgIGl0eG5fZmllbGQgRmVlCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weToyOTctMzAxCiAgICAvLyBpdHhuLkFzc2V0VHJhbnNmZXIoCiAgICAvLyAgICAgeGZlcl9hc3NldD1hc3NldCwKICAgIC8vICAgICBhc3NldF9yZWNlaXZlcj1HbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzLAogICAgLy8gICAgIGFzc2V0X2Ftb3VudD0wLAogICAgLy8gKS5zdWJtaXQoKQogICAgaXR4bl9zdWJtaXQKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5kaWdpdGFsX21hcmtldHBsYWNlLmNvbnRyYWN0LkRpZ2l0YWxNYXJrZXRwbGFjZS5wdXRfc2FsZShzYWxlX2tleTogYnl0ZXMsIHNhbGU6IGJ5dGVzLCByZXBsYWNlOiB1aW50NjQpIC0+IHZvaWQ6CnB1dF9zYWxlOgogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2UvY29udHJhY3QucHk6MzAzLTMwNwogICAgLy8gIyBTYWxlcyBhbmQgYmVzdCBiaWRzIGFyZSB3cml0dGVuIGFuZCBkZWxldGVkIHRocm91Z2ggdGhlc2Ugc3Vicm91dGluZXMsIHdoaWNoCiAgICAvLyAjICBrZWVwIHRoZSBhc3NldCBib29rcyB1cCB0byBkYXRlLiBSZXBsYWNpbmcgdGVsbHMgd2hldGhlciB0aGUgc2FsZSBhbHJlYWR5IGhhcwogICAgLy8gIyAgYW4gZW50cnksIGluIHRoZSBzbG90cyBvciBjb3VudGVkIGFzIHVudHJhY2tlZC4KICAgIC8vIEBzdWJyb3V0aW5lCiAgICAvLyBkZWYgcHV0X3NhbGUoc2VsZiwgc2FsZV9rZXk6IFNhbGVLZXksIHNhbGU6IFNhbGUsICosIHJlcGxhY2U6IGJvb2wpIC0+IE5vbmU6CiAgICBwcm90byAzIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjMwOAogICAgLy8gc2VsZi5zYWxlc1tzYWxlX2tleV0gPSBzYWxlCiAgICBieXRlY18yIC8vICJzYWxlcyIKICAgIGZyYW1lX2RpZyAtMwogICAgY29uY2F0CiAgICBmcmFtZV9kaWcgLTIKICAgIGJveF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjMxMAogICAgLy8gQm94UmVmKGtleT1zZWxmLmJlc3RfYXNrcy5rZXlfcHJlZml4ICsgc2FsZV9rZXkuYXNzZXQuYnl0ZXMpLAogICAgZnJhbWVfZGlnIC0zCiAgICBleHRyYWN0IDMyIDggLy8gb24gZXJyb3I6IEluZGV4IGFjY2VzcyBpcyBvdXQgb2YgYm91bmRzCiAgICBieXRlYyAxMCAvLyAiYmVzdF9hc2tzIgogICAgc3dhcAogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weTozMTEKICAgIC8vIEJvb2tFbnRyeShzYWxlX2tleS5vd25lciwgc2FsZS5jb3N0LCBzYWxlLmFtb3VudCksCiAgICBmcmFtZV9kaWcgLTMKICAgIGV4dHJhY3QgMCAzMiAvLyBvbiBlcnJvcjogSW5kZXggYWNjZXNzIGlzIG91dCBvZiBib3VuZHMKICAgIGZyYW1lX2RpZyAtMgogICAgZXh0cmFjdCA4IDggLy8gb24gZXJyb3I6IEluZGV4IGFjY2VzcyBpcyBvdXQgb2YgYm91bmRzCiAgICBmcmFtZV9kaWcgLTIKICAgIGV4dHJhY3QgMCA4IC8vIG9uIGVycm9yOiBJbmRleCBhY2Nlc3MgaXMgb3V0IG9mIGJvdW5kcwogICAgY292ZXIgMgogICAgY29uY2F0CiAgICBzd2FwCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjMxMgogICAgLy8gZGVzY2VuZGluZz1GYWxzZSwKICAgIGludGNfMCAvLyAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weTozMDktMzE0CiAgICAvLyBwdXRfYm9va19lbnRyeSgKICAgIC8vICAgICBCb3hSZWYoa2V5PXNlbGYuYmVzdF9hc2tzLmtleV9wcmVmaXggKyBzYWxlX2tleS5hc3NldC5ieXRlcyksCiAgICAvLyAgICAgQm9va0VudHJ5KHNhbGVfa2V5Lm93bmVyLCBzYWxlLmNvc3QsIHNhbGUuYW1vdW50KSwKICAgIC8vICAgICBkZXNjZW5kaW5nPUZhbHNlLAogICAgLy8gICAgIHJlcGxhY2U9cmVwbGFjZSwKICAgIC8vICkKICAgIGZyYW1lX2RpZyAtMQogICAgY2FsbHN1YiBwdXRfYm9va19lbnRyeQogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLmRpZ2l0YWxfbWFya2V0cGxhY2UuY29udHJhY3QuRGlnaXRhbE1hcmtldHBsYWNlLmRlbGV0ZV9zYWxlKHNhbGVfa2V5OiBieXRlcykgLT4gdm9pZDoKZGVsZXRlX3NhbGU6CiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weTozMTYtMzE3CiAgICAvLyBAc3Vicm91dGluZQogICAgLy8gZGVmIGRlbGV0ZV9zYWxlKHNlbGYsIHNhbGVfa2V5OiBTYWxlS2V5KSAtPiBOb25lOgogICAgcHJvdG8gMSAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weTozMTgKICAgIC8vIGRlbCBzZWxmLnNhbGVzW3NhbGVfa2V5XQogICAgYnl0ZWNfMiAvLyAic2FsZXMiCiAgICBmcmFtZV9kaWcgLTEKICAgIGNvbmNhdAogICAgYm94X2RlbAogICAgcG9wCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weTozMjAKICAgIC8vIEJveFJlZihrZXk9c2VsZi5iZXN0X2Fza3Mua2V5X3ByZWZpeCArIHNhbGVfa2V5LmFzc2V0LmJ5dGVzKSwKICAgIGZyYW1lX2RpZyAtMQogICAgZXh0cmFjdCAzMiA4IC8vIG9uIGVycm9yOiBJbmRleCBhY2Nlc3MgaXMgb3V0IG9mIGJvdW5kcwogICAgYnl0ZWMgMTAgLy8gImJlc3RfYXNrcyIKICAgIHN3YXAKICAgIGNvbmNhdAogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2UvY29udHJhY3QucHk6MzIxCiAgICAvLyBzYWxlX2tleS5vd25lciwKICAgIGZyYW1lX2RpZyAtMQogICAgZXh0cmFjdCAwIDMyIC8vIG9uIGVycm9yOiBJbmRleCBhY2Nlc3MgaXMgb3V0IG9mIGJvdW5kcwogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2UvY29udHJhY3QucHk6MzE5LTMyMgogICAgLy8gcmVtb3ZlX2Jvb2tfZW50cnkoCiAgICAvLyAgICAgQm94UmVmKGtleT1zZWxmLmJlc3RfYXNrcy5rZXlfcHJlZml4ICsgc2FsZV9rZXkuYXNzZXQuYnl0ZXMpLAogICAgLy8gICAgIHNhbGVfa2V5Lm93bmVyLAogICAgLy8gKQogICAgY2FsbHN1YiByZW1vdmVfYm9va19lbnRyeQogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLmRpZ2l0YWxfbWFya2V0cGxhY2UuY29udHJhY3QuRGlnaXRhbE1hcmtldHBsYWNlLmRlbGV0ZV9iaWQoc2FsZV9rZXk6IGJ5dGVzLCBzYWxlX2lkOiBieXRlcykgLT4gdm9pZDoKZGVsZXRlX2JpZDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjM0Mi0zNDMKICAgIC8vIEBzdWJyb3V0aW5lCiAgICAvLyBkZWYgZGVsZXRlX2JpZChzZWxmLCBzYWxlX2tleTogU2FsZUtleSwgc2FsZV9pZDogYXJjNC5VSW50NjQpIC0+IE5vbmU6CiAgICBwcm90byAyIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjM0NAogICAgLy8gZGVsIHNlbGYuYmlkc1tzYWxlX2lkXQogICAgYnl0ZWMgNCAvLyAiYmlkcyIKICAgIGZyYW1lX2RpZyAtMQogICAgY29uY2F0CiAgICBib3hfZGVsCiAgICBwb3AKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjM0NgogICAgLy8gQm94UmVmKGtleT1zZWxmLmJlc3RfYmlkcy5rZXlfcHJlZml4ICsgc2FsZV9rZXkuYXNzZXQuYnl0ZXMpLAogICAgZnJhbWVfZGlnIC0yCiAgICBleHRyYWN0IDMyIDggLy8gb24gZXJyb3I6IEluZGV4IGFjY2VzcyBpcyBvdXQgb2YgYm91bmRzCiAgICBieXRlYyAxMSAvLyAiYmVzdF9iaWRzIgogICAgc3dhcAogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weTozNDcKICAgIC8vIHNhbGVfa2V5Lm93bmVyLAogICAgZnJhbWVfZGlnIC0yCiAgICBleHRyYWN0IDAgMzIgLy8gb24gZXJyb3I6IEluZGV4IGFjY2VzcyBpcyBvdXQgb2YgYm91bmRzCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weTozNDUtMzQ4CiAgICAvLyByZW1vdmVfYm9va19lbnRyeSgKICAgIC8vICAgICBCb3hSZWYoa2V5PXNlbGYuYmVzdF9iaWRzLmtleV9wcmVmaXggKyBzYWxlX2tleS5hc3NldC5ieXRlcyksCiAgICAvLyAgICAgc2FsZV9rZXkub3duZXIsCiAgICAvLyApCiAgICBjYWxsc3ViIHJlbW92ZV9ib29rX2VudHJ5CiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuZGlnaXRhbF9tYXJrZXRwbGFjZS5jb250cmFjdC5EaWdpdGFsTWFya2V0cGxhY2UuY3JlYXRlX3NhbGUoYXNzZXRfZGVwb3NpdDogdWludDY0LCBjb3N0OiBieXRlcywgZXhwaXJlc19hdDogYnl0ZXMpIC0+IHZvaWQ6CmNyZWF0ZV9zYWxlOgogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2UvY29udHJhY3QucHk6MzUwLTM1NgogICAgLy8gQHN1YnJvdXRpbmUKICAgIC8vIGRlZiBjcmVhdGVfc2FsZSgKICAgIC8vICAgICBzZWxmLAogICAgLy8gICAgIGFzc2V0X2RlcG9zaXQ6IGd0eG4uQXNzZXRUcmFuc2ZlclRyYW5zYWN0aW9uLAogICAgLy8gICAgIGNvc3Q6IGFyYzQuVUludDY0LAogICAgLy8gICAgIGV4cGlyZXNfYXQ6IGFyYzQuVUludDY0LAogICAgLy8gKSAtPiBOb25lOgogICAgcHJvdG8gMyAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weTozNTcKICAgIC8vIGFzc2VydCBhc3NldF9kZXBvc2l0LnNlbmRlciA9PSBUeG4uc2VuZGVyLCBlcnIuRElGRkVSRU5UX1NFTkRFUgogICAgZnJhbWVfZGlnIC0zCiAgICBndHhucyBTZW5kZXIKICAgIHR4biBTZW5kZXIKICAgID09CiAgICBhc3NlcnQgLy8gRGlmZmVyZW50IHNlbmRlcgogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2UvY29udHJhY3QucHk6MzU5CiAgICAvLyBhc3NldF9kZXBvc2l0LmFzc2V0X3JlY2VpdmVyID09IEdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MKICAgIGZyYW1lX2RpZyAtMwogICAgZ3R4bnMgQXNzZXRSZWNlaXZlcgogICAgZ2xvYmFsIEN1cnJlbnRBcHBsaWNhdGlvbkFkZHJlc3MKICAgID09CiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weTozNTgtMzYwCiAgICAvLyBhc3NlcnQgKAogICAgLy8gICAgIGFzc2V0X2RlcG9zaXQuYXNzZXRfcmVjZWl2ZXIgPT0gR2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcwogICAgLy8gKSwgZXJyLldST05HX1JFQ0VJVkVSCiAgICBhc3NlcnQgLy8gV3JvbmcgcmVjZWl2ZXIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjM2MwogICAgLy8gYXJjNC5BZGRyZXNzKFR4bi5zZW5kZXIpLCBhcmM0LlVJbnQ2NChhc3NldF9kZXBvc2l0LnhmZXJfYXNzZXQuaWQpCiAgICB0eG4gU2VuZGVyCiAgICBmcmFtZV9kaWcgLTMKICAgIGd0eG5zIFhmZXJBc3NldAogICAgaXRvYgogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2UvY29udHJhY3QucHk6MzYyLTM2NAogICAgLy8gc2FsZV9rZXkgPSBTYWxlS2V5KAogICAgLy8gICAgIGFyYzQuQWRkcmVzcyhUeG4uc2VuZGVyKSwgYXJjNC5VSW50NjQoYXNzZXRfZGVwb3NpdC54ZmVyX2Fzc2V0LmlkKQogICAgLy8gKQogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weTozNjUKICAgIC8vIGFzc2VydCBzYWxlX2tleSBub3QgaW4gc2VsZi5zYWxlcywgZXJyLlNBTEVfQUxSRUFEWV9FWElTVFMKICAgIGJ5dGVjXzIgLy8gInNhbGVzIgogICAgZGlnIDEKICAgIGNvbmNhdAogICAgYm94X2xlbgogICAgYnVyeSAxCiAgICAhCiAgICBhc3NlcnQgLy8gU2FsZSBhbHJlYWR5IGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2UvY29udHJhY3QucHk6MzY5CiAgICAvLyBTYWxlKGFyYzQuVUludDY0KGFzc2V0X2RlcG9zaXQuYXNzZXRfYW1vdW50KSwgY29zdCwgZXhwaXJlc19hdCksCiAgICBmcmFtZV9kaWcgLTMKICAgIGd0eG5zIEFzc2V0QW1vdW50CiAgICBpdG9iCiAgICBmcmFtZV9kaWcgLTIKICAgIGNvbmNhdAogICAgZnJhbWVfZGlnIC0xCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjM3MAogICAgLy8gcmVwbGFjZT1GYWxzZSwKICAgIGludGNfMCAvLyAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weTozNjctMzcxCiAgICAvLyBzZWxmLnB1dF9zYWxlKAogICAgLy8gICAgIHNhbGVfa2V5LAogICAgLy8gICAgIFNhbGUoYXJjNC5VSW50NjQoYXNzZXRfZGVwb3NpdC5hc3NldF9hbW91bnQpLCBjb3N0LCBleHBpcmVzX2F0KSwKICAgIC8vICAgICByZXBsYWNlPUZhbHNlLAogICAgLy8gKQogICAgY2FsbHN1YiBwdXRfc2FsZQogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLmRpZ2l0YWxfbWFya2V0cGxhY2UuY29udHJhY3QuRGlnaXRhbE1hcmtldHBsYWNlLm9wZW5fc2FsZShhc3NldF9kZXBvc2l0OiB1aW50NjQsIGNvc3Q6IGJ5dGVzKSAtPiB2b2lkOgpvcGVuX3NhbGU6CiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weTozNzMtMzc2CiAgICAvLyBAYWJpbWV0aG9kCiAgICAvLyBkZWYgb3Blbl9zYWxlKAogICAgLy8gICAgIHNlbGYsIGFzc2V0X2RlcG9zaXQ6IGd0eG4uQXNzZXRUcmFuc2ZlclRyYW5zYWN0aW9uLCBjb3N0OiBhcmM0LlVJbnQ2NAogICAgLy8gKSAtPiBOb25lOgogICAgcHJvdG8gMiAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weTozNzcKICAgIC8vIHNlbGYuY3JlYXRlX3NhbGUoYXNzZXRfZGVwb3NpdCwgY29zdCwgYXJjNC5VSW50NjQoMCkpCiAgICBmcmFtZV9kaWcgLTIKICAgIGZyYW1lX2RpZyAtMQogICAgYnl0ZWMgOCAvLyAweDAwMDAwMDAwMDAwMDAwMDAKICAgIGNhbGxzdWIgY3JlYXRlX3NhbGUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjM3OQogICAgLy8gc2VsZi5kZXBvc2l0ZWRbVHhuLnNlbmRlcl0gLT0gc2VsZi5zYWxlX2JveF9tYnIoKQogICAgYnl0ZWNfMCAvLyAiZGVwb3NpdGVkIgogICAgdHhuIFNlbmRlcgogICAgY29uY2F0CiAgICBkdXAKICAgIGJveF9nZXQKICAgIHN3YXAKICAgIGJ0b2kKICAgIHN3YXAKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmRlcG9zaXRlZCBlbnRyeSBleGlzdHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL3N1YnJvdXRpbmVzLnB5OjI2LTI3CiAgICAvLyAjIFRoZSBzaXplIG9mIGEgYm94IGluY2x1ZGVzIGl0cyBuYW1lLCBrZXkgcHJlZml4IGluY2x1ZGVkLgogICAgLy8gcmV0dXJuIGNzdC5CT1hfRkxBVF9NSU5fQkFMQU5DRSArIHNpemUgKiBjc3QuQk9YX0JZVEVfTUlOX0JBTEFOQ0UKICAgIGludGMgNCAvLyAzMDEwMAogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2UvY29udHJhY3QucHk6Mzc5CiAgICAvLyBzZWxmLmRlcG9zaXRlZFtUeG4uc2VuZGVyXSAtPSBzZWxmLnNhbGVfYm94X21icigpCiAgICAtCiAgICBpdG9iCiAgICBib3hfcHV0CiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuZGlnaXRhbF9tYXJrZXRwbGFjZS5jb250cmFjdC5EaWdpdGFsTWFya2V0cGxhY2Uub3Blbl9leHBpcmluZ19zYWxlKGFzc2V0X2RlcG9zaXQ6IHVpbnQ2NCwgY29zdDogYnl0ZXMsIGV4cGlyZXNfYXQ6IGJ5dGVzKSAtPiB2b2lkOgpvcGVuX2V4cGlyaW5nX3NhbGU6CiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weTozODEtMzg3CiAgICAvLyBAYWJpbWV0aG9kCiAgICAvLyBkZWYgb3Blbl9leHBpcmluZ19zYWxlKAogICAgLy8gICAgIHNlbGYsCiAgICAvLyAgICAgYXNzZXRfZGVwb3NpdDogZ3R4bi5Bc3NldFRyYW5zZmVyVHJhbnNhY3Rpb24sCiAgICAvLyAgICAgY29zdDogYXJjNC5VSW50NjQsCiAgICAvLyAgICAgZXhwaXJlc19hdDogYXJjNC5VSW50NjQsCiAgICAvLyApIC0+IE5vbmU6CiAgICBwcm90byAzIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjM4OAogICAgLy8gYXNzZXJ0IGV4cGlyZXNfYXQubmF0aXZlID4gR2xvYmFsLnJvdW5kLCBlcnIuSU5WQUxJRF9FWFBJUlkKICAgIGZyYW1lX2RpZyAtMQogICAgYnRvaQogICAgZ2xvYmFsIFJvdW5kCiAgICA+CiAgICBhc3NlcnQgLy8gSW52YWxpZCBleHBpcnkKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjM4OQogICAgLy8gc2VsZi5jcmVhdGVfc2FsZShhc3NldF9kZXBvc2l0LCBjb3N0LCBleHBpcmVzX2F0KQogICAgZnJhbWVfZGlnIC0zCiAgICBmcmFtZV9kaWcgLTIKICAgIGZyYW1lX2RpZyAtMQogICAgY2FsbHN1YiBjcmVhdGVfc2FsZQogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2UvY29udHJhY3QucHk6MzkxCiAgICAvLyBzZWxmLmRlcG9zaXRlZFtUeG4uc2VuZGVyXSAtPSBzZWxmLnNhbGVfYm94X21icigpCiAgICBieXRlY18wIC8vICJkZXBvc2l0ZWQiCiAgICB0eG4gU2VuZGVyCiAgICBjb25jYXQKICAgIGR1cAogICAgYm94X2dldAogICAgc3dhcAogICAgYnRvaQogICAgc3dhcAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuZGVwb3NpdGVkIGVudHJ5IGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2Uvc3Vicm91dGluZXMucHk6MjYtMjcKICAgIC8vICMgVGhlIHNpemUgb2YgYSBib3ggaW5jbHVkZXMgaXRzIG5hbWUsIGtleSBwcmVmaXggaW5jbHVkZWQuCiAgICAvLyByZXR1cm4gY3N0LkJPWF9GTEFUX01JTl9CQUxBTkNFICsgc2l6ZSAqIGNzdC5CT1hfQllURV9NSU5fQkFMQU5DRQogICAgaW50YyA0IC8vIDMwMTAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weTozOTEKICAgIC8vIHNlbGYuZGVwb3NpdGVkW1R4bi5zZW5kZXJdIC09IHNlbGYuc2FsZV9ib3hfbWJyKCkKICAgIC0KICAgIGl0b2IKICAgIGJveF9wdXQKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5kaWdpdGFsX21hcmtldHBsYWNlLmNvbnRyYWN0LkRpZ2l0YWxNYXJrZXRwbGFjZS5vcGVuX3NhbGVzKGNvc3RzOiBieXRlcykgLT4gdm9pZDoKb3Blbl9zYWxlczoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjM5My0zOTQKICAgIC8vIEBhYmltZXRob2QKICAgIC8vIGRlZiBvcGVuX3NhbGVzKHNlbGYsIGNvc3RzOiBhcmM0LkR5bmFtaWNBcnJheVthcmM0LlVJbnQ2NF0pIC0+IE5vbmU6CiAgICBwcm90byAxIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjM5NS0zOTcKICAgIC8vICMgVGhlIGFzc2V0IGRlcG9zaXRzIGFyZSB0aGUgY29zdHMubGVuZ3RoIHRyYW5zYWN0aW9ucyByaWdodCBiZWZvcmUgdGhpcyBjYWxsLAogICAgLy8gIyAgaW4gdGhlIHNhbWUgb3JkZXIgYXMgdGhlaXIgY29zdHMuCiAgICAvLyBmaXJzdF9kZXBvc2l0X2luZGV4ID0gVHhuLmdyb3VwX2luZGV4IC0gY29zdHMubGVuZ3RoCiAgICB0eG4gR3JvdXBJbmRleAogICAgZnJhbWVfZGlnIC0xCiAgICBpbnRjXzAgLy8gMAogICAgZXh0cmFjdF91aW50MTYKICAgIGR1cAogICAgY292ZXIgMgogICAgLQogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2UvY29udHJhY3QucHk6Mzk5CiAgICAvLyBmb3IgaSBpbiB1cmFuZ2UoY29zdHMubGVuZ3RoKToKICAgIGludGNfMCAvLyAwCgpvcGVuX3NhbGVzX2Zvcl9oZWFkZXJAMToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjM5OQogICAgLy8gZm9yIGkgaW4gdXJhbmdlKGNvc3RzLmxlbmd0aCk6CiAgICBmcmFtZV9kaWcgMgogICAgZnJhbWVfZGlnIDAKICAgIDwKICAgIGJ6IG9wZW5fc2FsZXNfYWZ0ZXJfZm9yQDQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjQwMQogICAgLy8gZ3R4bi5Bc3NldFRyYW5zZmVyVHJhbnNhY3Rpb24oZmlyc3RfZGVwb3NpdF9pbmRleCArIGkpLAogICAgZnJhbWVfZGlnIDEKICAgIGZyYW1lX2RpZyAyCiAgICBkdXAKICAgIGNvdmVyIDIKICAgICsKICAgIGR1cAogICAgZ3R4bnMgVHlwZUVudW0KICAgIHB1c2hpbnQgNCAvLyBheGZlcgogICAgPT0KICAgIGFzc2VydCAvLyB0cmFuc2FjdGlvbiB0eXBlIGlzIGF4ZmVyCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weTo0MDIKICAgIC8vIGNvc3RzW2ldLAogICAgZnJhbWVfZGlnIC0xCiAgICBleHRyYWN0IDIgMAogICAgZGlnIDIKICAgIHB1c2hpbnQgOCAvLyA4CiAgICAqCiAgICBwdXNoaW50IDggLy8gOAogICAgZXh0cmFjdDMgLy8gb24gZXJyb3I6IEluZGV4IGFjY2VzcyBpcyBvdXQgb2YgYm91bmRzCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weTo0MDMKICAgIC8vIGFyYzQuVUludDY0KDApLAogICAgYnl0ZWMgOCAvLyAweDAwMDAwMDAwMDAwMDAwMDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjQwMC00MDQKICAgIC8vIHNlbGYuY3JlYXRlX3NhbGUoCiAgICAvLyAgICAgZ3R4bi5Bc3NldFRyYW5zZmVyVHJhbnNhY3Rpb24oZmlyc3RfZGVwb3NpdF9pbmRleCArIGkpLAogICAgLy8gICAgIGNvc3RzW2ldLAogICAgLy8gICAgIGFyYzQuVUludDY0KDApLAogICAgLy8gKQogICAgY2FsbHN1YiBjcmVhdGVfc2FsZQogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2UvY29udHJhY3QucHk6Mzk5CiAgICAvLyBmb3IgaSBpbiB1cmFuZ2UoY29zdHMubGVuZ3RoKToKICAgIGludGNfMSAvLyAxCiAgICArCiAgICBmcmFtZV9idXJ5IDIKICAgIGIgb3Blbl9zYWxlc19mb3JfaGVhZGVyQDEKCm9wZW5fc2FsZXNfYWZ0ZXJfZm9yQDQ6CiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weTo0MDYKICAgIC8vIHNlbGYuZGVwb3NpdGVkW1R4bi5zZW5kZXJdIC09IGNvc3RzLmxlbmd0aCAqIHNlbGYuc2FsZV9ib3hfbWJyKCkKICAgIGJ5dGVjXzAgLy8gImRlcG9zaXRlZCIKICAgIHR4biBTZW5kZXIKICAgIGNvbmNhdAogICAgZHVwCiAgICBib3hfZ2V0CiAgICBzd2FwCiAgICBidG9pCiAgICBzd2FwCiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5kZXBvc2l0ZWQgZW50cnkgZXhpc3RzCiAgICBmcmFtZV9kaWcgMAogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2Uvc3Vicm91dGluZXMucHk6MjYtMjcKICAgIC8vICMgVGhlIHNpemUgb2YgYSBib3ggaW5jbHVkZXMgaXRzIG5hbWUsIGtleSBwcmVmaXggaW5jbHVkZWQuCiAgICAvLyByZXR1cm4gY3N0LkJPWF9GTEFUX01JTl9CQUxBTkNFICsgc2l6ZSAqIGNzdC5CT1hfQllURV9NSU5fQkFMQU5DRQogICAgaW50YyA0IC8vIDMwMTAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weTo0MDYKICAgIC8vIHNlbGYuZGVwb3NpdGVkW1R4bi5zZW5kZXJdIC09IGNvc3RzLmxlbmd0aCAqIHNlbGYuc2FsZV9ib3hfbWJyKCkKICAgICoKICAgIC0KICAgIGl0b2IKICAgIGJveF9wdXQKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5kaWdpdGFsX21hcmtldHBsYWNlLmNvbnRyYWN0LkRpZ2l0YWxNYXJrZXRwbGFjZS5jbG9zZV9zYWxlKGFzc2V0OiB1aW50NjQpIC0+IHZvaWQ6CmNsb3NlX3NhbGU6CiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weTo0MDgtNDA5CiAgICAvLyBAYWJpbWV0aG9kCiAgICAvLyBkZWYgY2xvc2Vfc2FsZShzZWxmLCBhc3NldDogQXNzZXQpIC0+IE5vbmU6CiAgICBwcm90byAxIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjQxMAogICAgLy8gc2FsZV9rZXkgPSBTYWxlS2V5KGFyYzQuQWRkcmVzcyhUeG4uc2VuZGVyKSwgYXJjNC5VSW50NjQoYXNzZXQuaWQpKQogICAgdHhuIFNlbmRlcgogICAgZnJhbWVfZGlnIC0xCiAgICBpdG9iCiAgICBjb25jYXQKICAgIGR1cG4gMgogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2Uvc3Vicm91dGluZXMucHk6MTkyCiAgICAvLyBvcC5leHRyYWN0KG9wLnNoYTI1NihrZXkuYnl0ZXMpLCAwLCBjc3QuU0FMRV9JRF9MRU5HVEgpCiAgICBzaGEyNTYKICAgIGV4dHJhY3QgMCA4CiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9zdWJyb3V0aW5lcy5weToxODgtMTkzCiAgICAvLyAjIENvbXBhY3QgOCBieXRlcyBpZGVudGlmaWVyIG9mIGEgc2FsZSwgZGVyaXZlZCBmcm9tIGl0cyA0MCBieXRlcyBrZXkgc28gdGhhdCBpdAogICAgLy8gIyAgY2FuIGJlIGNvbXB1dGVkIGJ5IGFueW9uZSBrbm93aW5nIHRoZSAob3duZXIsIGFzc2V0KSBwYWlyIHdpdGhvdXQgYSBsb29rdXAuCiAgICAvLyAjIFJlYWQgYXMgYSB1aW50NjQsIHNvIHRoYXQgcmVjZWlwdHMgc29ydGVkIGJ5IHNhbGUgaWQgY29tcGFyZSBhcyBpbnRlZ2Vycy4KICAgIC8vIHJldHVybiBhcmM0LlVJbnQ2NC5mcm9tX2J5dGVzKAogICAgLy8gICAgIG9wLmV4dHJhY3Qob3Auc2hhMjU2KGtleS5ieXRlcyksIDAsIGNzdC5TQUxFX0lEX0xFTkdUSCkKICAgIC8vICkKICAgIHN3YXAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjQxMgogICAgLy8gc2FsZSA9IHNlbGYuc2FsZXNbc2FsZV9rZXldCiAgICBieXRlY18yIC8vICJzYWxlcyIKICAgIHN3YXAKICAgIGNvbmNhdAogICAgYm94X2dldAogICAgc3dhcAogICAgZHVwCiAgICB1bmNvdmVyIDIKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnNhbGVzIGVudHJ5IGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2UvY29udHJhY3QucHk6NDEzLTQxNAogICAgLy8gIyBBbiBleHBpcmVkIHNhbGUgd2l0aCBhIGJpZCBiZWxvbmdzIHRvIGl0cyBiZXN0IGJpZGRlciBhbmQgY2FuIG9ubHkgYmUgc2V0dGxlZC4KICAgIC8vIGFzc2VydCBub3QgKGlzX2V4cGlyZWQoc2FsZSkgYW5kIHNhbGVfaWQgaW4gc2VsZi5iaWRzKSwgZXJyLlNBTEVfRVhQSVJFRAogICAgY2FsbHN1YiBpc19leHBpcmVkCiAgICBieiBjbG9zZV9zYWxlX2Jvb2xfZmFsc2VAMwogICAgYnl0ZWMgNCAvLyAiYmlkcyIKICAgIGZyYW1lX2RpZyAxCiAgICBjb25jYXQKICAgIGJveF9sZW4KICAgIGJ1cnkgMQogICAgYnogY2xvc2Vfc2FsZV9ib29sX2ZhbHNlQDMKICAgIGludGNfMSAvLyAxCgpjbG9zZV9zYWxlX2Jvb2xfbWVyZ2VANDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjQxMy00MTQKICAgIC8vICMgQW4gZXhwaXJlZCBzYWxlIHdpdGggYSBiaWQgYmVsb25ncyB0byBpdHMgYmVzdCBiaWRkZXIgYW5kIGNhbiBvbmx5IGJlIHNldHRsZWQuCiAgICAvLyBhc3NlcnQgbm90IChpc19leHBpcmVkKHNhbGUpIGFuZCBzYWxlX2lkIGluIHNlbGYuYmlkcyksIGVyci5TQUxFX0VYUElSRUQKICAgICEKICAgIGFzc2VydCAvLyBTYWxlIGV4cGlyZWQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjQxNi00MjAKICAgIC8vIGl0eG4uQXNzZXRUcmFuc2ZlcigKICAgIC8vICAgICB4ZmVyX2Fzc2V0PWFzc2V0LAogICAgLy8gICAgIGFzc2V0X3JlY2VpdmVyPVR4bi5zZW5kZXIsCiAgICAvLyAgICAgYXNzZXRfYW1vdW50PXNhbGUuYW1vdW50Lm5hdGl2ZSwKICAgIC8vICkuc3VibWl0KCkKICAgIGl0eG5fYmVnaW4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjQxOAogICAgLy8gYXNzZXRfcmVjZWl2ZXI9VHhuLnNlbmRlciwKICAgIHR4biBTZW5kZXIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjQxOQogICAgLy8gYXNzZXRfYW1vdW50PXNhbGUuYW1vdW50Lm5hdGl2ZSwKICAgIGZyYW1lX2RpZyAyCiAgICBpbnRjXzAgLy8gMAogICAgZXh0cmFjdF91aW50NjQKICAgIGl0eG5fZmllbGQgQXNzZXRBbW91bnQKICAgIGl0eG5fZmllbGQgQXNzZXRSZWNlaXZlcgogICAgZnJhbWVfZGlnIC0xCiAgICBpdHhuX2ZpZWxkIFhmZXJBc3NldAogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2UvY29udHJhY3QucHk6NDE2CiAgICAvLyBpdHhuLkFzc2V0VHJhbnNmZXIoCiAgICBwdXNoaW50IDQgLy8gYXhmZXIKICAgIGl0eG5fZmllbGQgVHlwZUVudW0KICAgIGludGNfMCAvLyAwCiAgICBpdHhuX2ZpZWxkIEZlZQogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2UvY29udHJhY3QucHk6NDE2LTQyMAogICAgLy8gaXR4bi5Bc3NldFRyYW5zZmVyKAogICAgLy8gICAgIHhmZXJfYXNzZXQ9YXNzZXQsCiAgICAvLyAgICAgYXNzZXRfcmVjZWl2ZXI9VHhuLnNlbmRlciwKICAgIC8vICAgICBhc3NldF9hbW91bnQ9c2FsZS5hbW91bnQubmF0aXZlLAogICAgLy8gKS5zdWJtaXQoKQogICAgaXR4bl9zdWJtaXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjQyMgogICAgLy8gc2VsZi5kZWxldGVfc2FsZShzYWxlX2tleSkKICAgIGZyYW1lX2RpZyAwCiAgICBkdXAKICAgIGNhbGxzdWIgZGVsZXRlX3NhbGUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjQyNAogICAgLy8gc2VsZi5kZXBvc2l0ZWRbVHhuLnNlbmRlcl0gKz0gc2VsZi5zYWxlX2JveF9tYnIoKSArIHNlbGYuZHJvcF9iaWQoCiAgICBieXRlY18wIC8vICJkZXBvc2l0ZWQiCiAgICB0eG4gU2VuZGVyCiAgICBjb25jYXQKICAgIGR1cAogICAgYm94X2dldAogICAgc3dhcAogICAgYnRvaQogICAgc3dhcAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuZGVwb3NpdGVkIGVudHJ5IGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2UvY29udHJhY3QucHk6NDI0LTQyNgogICAgLy8gc2VsZi5kZXBvc2l0ZWRbVHhuLnNlbmRlcl0gKz0gc2VsZi5zYWxlX2JveF9tYnIoKSArIHNlbGYuZHJvcF9iaWQoCiAgICAvLyAgICAgc2FsZV9rZXksIHNhbGVfaWQKICAgIC8vICkKICAgIHVuY292ZXIgMgogICAgZnJhbWVfZGlnIDEKICAgIGNhbGxzdWIgZHJvcF9iaWQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL3N1YnJvdXRpbmVzLnB5OjI2LTI3CiAgICAvLyAjIFRoZSBzaXplIG9mIGEgYm94IGluY2x1ZGVzIGl0cyBuYW1lLCBrZXkgcHJlZml4IGluY2x1ZGVkLgogICAgLy8gcmV0dXJuIGNzdC5CT1hfRkxBVF9NSU5fQkFMQU5DRSArIHNpemUgKiBjc3QuQk9YX0JZVEVfTUlOX0JBTEFOQ0UKICAgIGludGMgNCAvLyAzMDEwMAogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2UvY29udHJhY3QucHk6NDI0LTQyNgogICAgLy8gc2VsZi5kZXBvc2l0ZWRbVHhuLnNlbmRlcl0gKz0gc2VsZi5zYWxlX2JveF9tYnIoKSArIHNlbGYuZHJvcF9iaWQoCiAgICAvLyAgICAgc2FsZV9rZXksIHNhbGVfaWQKICAgIC8vICkKICAgICsKICAgICsKICAgIGl0b2IKICAgIGJveF9wdXQKICAgIHJldHN1YgoKY2xvc2Vfc2FsZV9ib29sX2ZhbHNlQDM6CiAgICBpbnRjXzAgLy8gMAogICAgYiBjbG9zZV9zYWxlX2Jvb2xfbWVyZ2VANAoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5kaWdpdGFsX21hcmtldHBsYWNlLmNvbnRyYWN0LkRpZ2l0YWxNYXJrZXRwbGFjZS5idXkoc2FsZV9rZXk6IGJ5dGVzKSAtPiB2b2lkOgpidXk6CiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weTo0MjgtNDI5CiAgICAvLyBAYWJpbWV0aG9kCiAgICAvLyBkZWYgYnV5KHNlbGYsIHNhbGVfa2V5OiBTYWxlS2V5KSAtPiBOb25lOgogICAgcHJvdG8gMSAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weTo0MzAKICAgIC8vIGFzc2VydCBUeG4uc2VuZGVyICE9IHNhbGVfa2V5Lm93bmVyLm5hdGl2ZSwgZXJyLlNFTExFUl9DQU5UX0JFX0JVWUVSCiAgICB0eG4gU2VuZGVyCiAgICBmcmFtZV9kaWcgLTEKICAgIGV4dHJhY3QgMCAzMiAvLyBvbiBlcnJvcjogSW5kZXggYWNjZXNzIGlzIG91dCBvZiBib3VuZHMKICAgIHN3YXAKICAgIGRpZyAxCiAgICAhPQogICAgYXNzZXJ0IC8vIFNlbGxlciBjYW5ub3QgYmUgYnV5ZXIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjQzMQogICAgLy8gc2FsZSA9IHNlbGYuc2FsZXNbc2FsZV9rZXldCiAgICBieXRlY18yIC8vICJzYWxlcyIKICAgIGZyYW1lX2RpZyAtMQogICAgY29uY2F0CiAgICBib3hfZ2V0CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5zYWxlcyBlbnRyeSBleGlzdHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjQzMgogICAgLy8gYXNzZXJ0IG5vdCBpc19leHBpcmVkKHNhbGUpLCBlcnIuU0FMRV9FWFBJUkVECiAgICBkdXAKICAgIGNhbGxzdWIgaXNfZXhwaXJlZAogICAgIQogICAgYXNzZXJ0IC8vIFNhbGUgZXhwaXJlZAogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2UvY29udHJhY3QucHk6NDM0LTQzOAogICAgLy8gaXR4bi5Bc3NldFRyYW5zZmVyKAogICAgLy8gICAgIHhmZXJfYXNzZXQ9c2FsZV9rZXkuYXNzZXQubmF0aXZlLAogICAgLy8gICAgIGFzc2V0X3JlY2VpdmVyPVR4bi5zZW5kZXIsCiAgICAvLyAgICAgYXNzZXRfYW1vdW50PXNhbGUuYW1vdW50Lm5hdGl2ZSwKICAgIC8vICkuc3VibWl0KCkKICAgIGl0eG5fYmVnaW4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjQzNQogICAgLy8geGZlcl9hc3NldD1zYWxlX2tleS5hc3NldC5uYXRpdmUsCiAgICBmcmFtZV9kaWcgLTEKICAgIHB1c2hpbnQgMzIgLy8gMzIKICAgIGV4dHJhY3RfdWludDY0CiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weTo0MzYKICAgIC8vIGFzc2V0X3JlY2VpdmVyPVR4bi5zZW5kZXIsCiAgICB0eG4gU2VuZGVyCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weTo0MzcKICAgIC8vIGFzc2V0X2Ftb3VudD1zYWxlLmFtb3VudC5uYXRpdmUsCiAgICBkaWcgMgogICAgaW50Y18wIC8vIDAKICAgIGV4dHJhY3RfdWludDY0CiAgICBpdHhuX2ZpZWxkIEFzc2V0QW1vdW50CiAgICBpdHhuX2ZpZWxkIEFzc2V0UmVjZWl2ZXIKICAgIGl0eG5fZmllbGQgWGZlckFzc2V0CiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weTo0MzQKICAgIC8vIGl0eG4uQXNzZXRUcmFuc2ZlcigKICAgIHB1c2hpbnQgNCAvLyBheGZlcgogICAgaXR4bl9maWVsZCBUeXBlRW51bQogICAgaW50Y18wIC8vIDAKICAgIGl0eG5fZmllbGQgRmVlCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weTo0MzQtNDM4CiAgICAvLyBpdHhuLkFzc2V0VHJhbnNmZXIoCiAgICAvLyAgICAgeGZlcl9hc3NldD1zYWxlX2tleS5hc3NldC5uYXRpdmUsCiAgICAvLyAgICAgYXNzZXRfcmVjZWl2ZXI9VHhuLnNlbmRlciwKICAgIC8vICAgICBhc3NldF9hbW91bnQ9c2FsZS5hbW91bnQubmF0aXZlLAogICAgLy8gKS5zdWJtaXQoKQogICAgaXR4bl9zdWJtaXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjQ0MAogICAgLy8gc2VsZi5kZWxldGVfc2FsZShzYWxlX2tleSkKICAgIGZyYW1lX2RpZyAtMQogICAgY2FsbHN1YiBkZWxldGVfc2FsZQogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2UvY29udHJhY3QucHk6NDQzCiAgICAvLyBUeG4uc2VuZGVyLCBzZWxmLmRyb3BfYmlkKHNhbGVfa2V5LCBzYWxlX2lkX29mKHNhbGVfa2V5KSksIHNhbGUuY29zdC5uYXRpdmUKICAgIHR4biBTZW5kZXIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL3N1YnJvdXRpbmVzLnB5OjE5MgogICAgLy8gb3AuZXh0cmFjdChvcC5zaGEyNTYoa2V5LmJ5dGVzKSwgMCwgY3N0LlNBTEVfSURfTEVOR1RIKQogICAgZnJhbWVfZGlnIC0xCiAgICBzaGEyNTYKICAgIGV4dHJhY3QgMCA4CiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weTo0NDMKICAgIC8vIFR4bi5zZW5kZXIsIHNlbGYuZHJvcF9iaWQoc2FsZV9rZXksIHNhbGVfaWRfb2Yoc2FsZV9rZXkpKSwgc2FsZS5jb3N0Lm5hdGl2ZQogICAgZnJhbWVfZGlnIC0xCiAgICBzd2FwCiAgICBjYWxsc3ViIGRyb3BfYmlkCiAgICB1bmNvdmVyIDIKICAgIHB1c2hpbnQgOCAvLyA4CiAgICBleHRyYWN0X3VpbnQ2NAogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2UvY29udHJhY3QucHk6NDQyLTQ0NAogICAgLy8gc2VsZi5zZXR0bGUoCiAgICAvLyAgICAgVHhuLnNlbmRlciwgc2VsZi5kcm9wX2JpZChzYWxlX2tleSwgc2FsZV9pZF9vZihzYWxlX2tleSkpLCBzYWxlLmNvc3QubmF0aXZlCiAgICAvLyApCiAgICBjb3ZlciAyCiAgICBkaWcgMgogICAgY2FsbHN1YiBzZXR0bGUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjQ0NQogICAgLy8gc2VsZi5kZXBvc2l0ZWRbc2FsZV9rZXkub3duZXIubmF0aXZlXSArPSBzYWxlLmNvc3QubmF0aXZlICsgc2VsZi5zYWxlX2JveF9tYnIoKQogICAgYnl0ZWNfMCAvLyAiZGVwb3NpdGVkIgogICAgdW5jb3ZlciAyCiAgICBjb25jYXQKICAgIGR1cAogICAgYm94X2dldAogICAgc3dhcAogICAgYnRvaQogICAgc3dhcAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuZGVwb3NpdGVkIGVudHJ5IGV4aXN0cwogICAgdW5jb3ZlciAyCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9zdWJyb3V0aW5lcy5weToyNi0yNwogICAgLy8gIyBUaGUgc2l6ZSBvZiBhIGJveCBpbmNsdWRlcyBpdHMgbmFtZSwga2V5IHByZWZpeCBpbmNsdWRlZC4KICAgIC8vIHJldHVybiBjc3QuQk9YX0ZMQVRfTUlOX0JBTEFOQ0UgKyBzaXplICogY3N0LkJPWF9CWVRFX01JTl9CQUxBTkNFCiAgICBpbnRjIDQgLy8gMzAxMDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjQ0NQogICAgLy8gc2VsZi5kZXBvc2l0ZWRbc2FsZV9rZXkub3duZXIubmF0aXZlXSArPSBzYWxlLmNvc3QubmF0aXZlICsgc2VsZi5zYWxlX2JveF9tYnIoKQogICAgKwogICAgKwogICAgaXRvYgogICAgYm94X3B1dAogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLmRpZ2l0YWxfbWFya2V0cGxhY2UuY29udHJhY3QuRGlnaXRhbE1hcmtldHBsYWNlLmJ1eV9wYXJ0aWFsKHNhbGVfa2V5OiBieXRlcywgcXVhbnRpdHk6IGJ5dGVzKSAtPiB2b2lkOgpidXlfcGFydGlhbDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjQ0Ny00NDgKICAgIC8vIEBhYmltZXRob2QKICAgIC8vIGRlZiBidXlfcGFydGlhbChzZWxmLCBzYWxlX2tleTogU2FsZUtleSwgcXVhbnRpdHk6IGFyYzQuVUludDY0KSAtPiBOb25lOgogICAgcHJvdG8gMiAwCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMSAvLyAiIgogICAgZHVwbiAyCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weTo0NDktNDUyCiAgICAvLyAjIEJ1eXMgcXVhbnRpdHkgdW5pdHMgb2YgdGhlIGFzc2V0IG9uIHNhbGUgYXQgdGhlIHByby1yYXRhIHByaWNlIG9mIGl0cyBjb3N0LAogICAgLy8gIyAgbGVhdmluZyB0aGUgcmVzdCBvZiB0aGUgc2FsZSBvcGVuLiBCdXlpbmcgdGhlIHdob2xlIGFtb3VudCBjbG9zZXMgdGhlIHNhbGUuCiAgICAvLyAjIFRoZSBiZXN0IGJpZCB3YXMgcGxhY2VkIG9uIHRoZSB3aG9sZSBhbW91bnQsIHNvIGl0IGlzIGRyb3BwZWQgZWl0aGVyIHdheS4KICAgIC8vIGFzc2VydCBUeG4uc2VuZGVyICE9IHNhbGVfa2V5Lm93bmVyLm5hdGl2ZSwgZXJyLlNFTExFUl9DQU5UX0JFX0JVWUVSCiAgICB0eG4gU2VuZGVyCiAgICBmcmFtZV9kaWcgLTIKICAgIGV4dHJhY3QgMCAzMiAvLyBvbiBlcnJvcjogSW5kZXggYWNjZXNzIGlzIG91dCBvZiBib3VuZHMKICAgIGR1cAogICAgY292ZXIgMgogICAgIT0KICAgIGFzc2VydCAvLyBTZWxsZXIgY2Fubm90IGJlIGJ1eWVyCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weTo0NTMKICAgIC8vIHNhbGUgPSBzZWxmLnNhbGVzW3NhbGVfa2V5XQogICAgYnl0ZWNfMiAvLyAic2FsZXMiCiAgICBmcmFtZV9kaWcgLTIKICAgIGNvbmNhdAogICAgYm94X2dldAogICAgc3dhcAogICAgZHVwCiAgICB1bmNvdmVyIDIKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnNhbGVzIGVudHJ5IGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2UvY29udHJhY3QucHk6NDU0CiAgICAvLyBhc3NlcnQgbm90IGlzX2V4cGlyZWQoc2FsZSksIGVyci5TQUxFX0VYUElSRUQKICAgIGNhbGxzdWIgaXNfZXhwaXJlZAogICAgIQogICAgYXNzZXJ0IC8vIFNhbGUgZXhwaXJlZAogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2UvY29udHJhY3QucHk6NDU1CiAgICAvLyBhc3NlcnQgMCA8IHF1YW50aXR5Lm5hdGl2ZSA8PSBzYWxlLmFtb3VudC5uYXRpdmUsIGVyci5JTlZBTElEX1FVQU5USVRZCiAgICBmcmFtZV9kaWcgLTEKICAgIGJ0b2kKICAgIGR1cAogICAgYnogYnV5X3BhcnRpYWxfYm9vbF9mYWxzZUAzCiAgICBmcmFtZV9kaWcgNQogICAgaW50Y18wIC8vIDAKICAgIGV4dHJhY3RfdWludDY0CiAgICBmcmFtZV9kaWcgNgogICAgPj0KICAgIGJ6IGJ1eV9wYXJ0aWFsX2Jvb2xfZmFsc2VAMwogICAgaW50Y18xIC8vIDEKCmJ1eV9wYXJ0aWFsX2Jvb2xfbWVyZ2VANDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjQ1NQogICAgLy8gYXNzZXJ0IDAgPCBxdWFudGl0eS5uYXRpdmUgPD0gc2FsZS5hbW91bnQubmF0aXZlLCBlcnIuSU5WQUxJRF9RVUFOVElUWQogICAgYXNzZXJ0IC8vIEludmFsaWQgcXVhbnRpdHkKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjQ1NgogICAgLy8gcHJpY2UgPSBwcm9fcmF0YV9jb3N0KHNhbGUuY29zdC5uYXRpdmUsIHF1YW50aXR5Lm5hdGl2ZSwgc2FsZS5hbW91bnQubmF0aXZlKQogICAgZnJhbWVfZGlnIDUKICAgIGR1cAogICAgcHVzaGludCA4IC8vIDgKICAgIGV4dHJhY3RfdWludDY0CiAgICBkdXAKICAgIGNvdmVyIDIKICAgIGZyYW1lX2J1cnkgMgogICAgZHVwCiAgICBleHRyYWN0IDAgOCAvLyBvbiBlcnJvcjogSW5kZXggYWNjZXNzIGlzIG91dCBvZiBib3VuZHMKICAgIGZyYW1lX2J1cnkgMAogICAgaW50Y18wIC8vIDAKICAgIGV4dHJhY3RfdWludDY0CiAgICBkdXAKICAgIGNvdmVyIDIKICAgIGZyYW1lX2J1cnkgMQogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2Uvc3Vicm91dGluZXMucHk6MjE1LTIxNwogICAgLy8gIyBDb3N0IG9mIHF1YW50aXR5IG91dCBvZiBhbW91bnQgdW5pdHMsIHJvdW5kZWQgdXAgaW4gZmF2b3VyIG9mIHRoZSBzZWxsZXIuCiAgICAvLyAjIFRoZSBwcm9kdWN0IGlzIGNvbXB1dGVkIG9uIDEyOCBiaXRzLCBhbmQgdGhlIHF1b3RpZW50IG5ldmVyIGV4Y2VlZHMgY29zdC4KICAgIC8vIHByb2R1Y3RfaGlnaCwgcHJvZHVjdF9sb3cgPSBvcC5tdWx3KGNvc3QsIHF1YW50aXR5KQogICAgZnJhbWVfZGlnIDYKICAgIG11bHcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL3N1YnJvdXRpbmVzLnB5OjIxOQogICAgLy8gcHJvZHVjdF9oaWdoLCBwcm9kdWN0X2xvdywgMCwgYW1vdW50CiAgICBpbnRjXzAgLy8gMAogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2Uvc3Vicm91dGluZXMucHk6MjE4LTIyMAogICAgLy8gX3F1b3RpZW50X2hpZ2gsIHF1b3RpZW50LCBfcmVtYWluZGVyX2hpZ2gsIHJlbWFpbmRlciA9IG9wLmRpdm1vZHcoCiAgICAvLyAgICAgcHJvZHVjdF9oaWdoLCBwcm9kdWN0X2xvdywgMCwgYW1vdW50CiAgICAvLyApCiAgICB1bmNvdmVyIDMKICAgIGRpdm1vZHcKICAgIGNvdmVyIDMKICAgIHBvcAogICAgY292ZXIgMgogICAgcG9wCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9zdWJyb3V0aW5lcy5weToyMjEKICAgIC8vIGlmIHJlbWFpbmRlcjoKICAgIGJ6IGJ1eV9wYXJ0aWFsX2FmdGVyX2lmX2Vsc2VAMTEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL3N1YnJvdXRpbmVzLnB5OjIyMgogICAgLy8gcmV0dXJuIHF1b3RpZW50ICsgMQogICAgaW50Y18xIC8vIDEKICAgICsKICAgIGZyYW1lX2J1cnkgMwoKYnV5X3BhcnRpYWxfYWZ0ZXJfaW5saW5lZF9zbWFydF9jb250cmFjdHMuZGlnaXRhbF9tYXJrZXRwbGFjZS5zdWJyb3V0aW5lcy5wcm9fcmF0YV9jb3N0QDEyOgogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2UvY29udHJhY3QucHk6NDU4LTQ2MgogICAgLy8gaXR4bi5Bc3NldFRyYW5zZmVyKAogICAgLy8gICAgIHhmZXJfYXNzZXQ9c2FsZV9rZXkuYXNzZXQubmF0aXZlLAogICAgLy8gICAgIGFzc2V0X3JlY2VpdmVyPVR4bi5zZW5kZXIsCiAgICAvLyAgICAgYXNzZXRfYW1vdW50PXF1YW50aXR5Lm5hdGl2ZSwKICAgIC8vICkuc3VibWl0KCkKICAgIGl0eG5fYmVnaW4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjQ1OQogICAgLy8geGZlcl9hc3NldD1zYWxlX2tleS5hc3NldC5uYXRpdmUsCiAgICBmcmFtZV9kaWcgLTIKICAgIHB1c2hpbnQgMzIgLy8gMzIKICAgIGV4dHJhY3RfdWludDY0CiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weTo0NjAKICAgIC8vIGFzc2V0X3JlY2VpdmVyPVR4bi5zZW5kZXIsCiAgICB0eG4gU2VuZGVyCiAgICBmcmFtZV9kaWcgNgogICAgaXR4bl9maWVsZCBBc3NldEFtb3VudAogICAgaXR4bl9maWVsZCBBc3NldFJlY2VpdmVyCiAgICBpdHhuX2ZpZWxkIFhmZXJBc3NldAogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2UvY29udHJhY3QucHk6NDU4CiAgICAvLyBpdHhuLkFzc2V0VHJhbnNmZXIoCiAgICBwdXNoaW50IDQgLy8gYXhmZXIKICAgIGl0eG5fZmllbGQgVHlwZUVudW0KICAgIGludGNfMCAvLyAwCiAgICBpdHhuX2ZpZWxkIEZlZQogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2UvY29udHJhY3QucHk6NDU4LTQ2MgogICAgLy8gaXR4bi5Bc3NldFRyYW5zZmVyKAogICAgLy8gICAgIHhmZXJfYXNzZXQ9c2FsZV9rZXkuYXNzZXQubmF0aXZlLAogICAgLy8gICAgIGFzc2V0X3JlY2VpdmVyPVR4bi5zZW5kZXIsCiAgICAvLyAgICAgYXNzZXRfYW1vdW50PXF1YW50aXR5Lm5hdGl2ZSwKICAgIC8vICkuc3VibWl0KCkKICAgIGl0eG5fc3VibWl0CiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weTo0NjUKICAgIC8vIGlmIHF1YW50aXR5ID09IHNhbGUuYW1vdW50OgogICAgZnJhbWVfZGlnIC0xCiAgICBmcmFtZV9kaWcgMAogICAgYj09CiAgICBieiBidXlfcGFydGlhbF9lbHNlX2JvZHlANwogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2UvY29udHJhY3QucHk6NDY2CiAgICAvLyBzZWxmLmRlbGV0ZV9zYWxlKHNhbGVfa2V5KQogICAgZnJhbWVfZGlnIC0yCiAgICBjYWxsc3ViIGRlbGV0ZV9zYWxlCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weTo0NjcKICAgIC8vIG93bmVyX3Byb2NlZWRzICs9IHNlbGYuc2FsZV9ib3hfbWJyKCkKICAgIGZyYW1lX2RpZyAzCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9zdWJyb3V0aW5lcy5weToyNi0yNwogICAgLy8gIyBUaGUgc2l6ZSBvZiBhIGJveCBpbmNsdWRlcyBpdHMgbmFtZSwga2V5IHByZWZpeCBpbmNsdWRlZC4KICAgIC8vIHJldHVybiBjc3QuQk9YX0ZMQVRfTUlOX0JBTEFOQ0UgKyBzaXplICogY3N0LkJPWF9CWVRFX01JTl9CQUxBTkNFCiAgICBpbnRjIDQgLy8gMzAxMDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjQ2NwogICAgLy8gb3duZXJfcHJvY2VlZHMgKz0gc2VsZi5zYWxlX2JveF9tYnIoKQogICAgKwoKYnV5X3BhcnRpYWxfYWZ0ZXJfaWZfZWxzZUA4OgogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2UvY29udHJhY3QucHk6NDc5CiAgICAvLyBzZWxmLnNldHRsZShUeG4uc2VuZGVyLCBzZWxmLmRyb3BfYmlkKHNhbGVfa2V5LCBzYWxlX2lkX29mKHNhbGVfa2V5KSksIHByaWNlKQogICAgdHhuIFNlbmRlcgogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2Uvc3Vicm91dGluZXMucHk6MTkyCiAgICAvLyBvcC5leHRyYWN0KG9wLnNoYTI1NihrZXkuYnl0ZXMpLCAwLCBjc3QuU0FMRV9JRF9MRU5HVEgpCiAgICBmcmFtZV9kaWcgLTIKICAgIHNoYTI1NgogICAgZXh0cmFjdCAwIDgKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjQ3OQogICAgLy8gc2VsZi5zZXR0bGUoVHhuLnNlbmRlciwgc2VsZi5kcm9wX2JpZChzYWxlX2tleSwgc2FsZV9pZF9vZihzYWxlX2tleSkpLCBwcmljZSkKICAgIGZyYW1lX2RpZyAtMgogICAgc3dhcAogICAgY2FsbHN1YiBkcm9wX2JpZAogICAgZnJhbWVfZGlnIDMKICAgIGNhbGxzdWIgc2V0dGxlCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weTo0ODAKICAgIC8vIHNlbGYuZGVwb3NpdGVkW3NhbGVfa2V5Lm93bmVyLm5hdGl2ZV0gKz0gb3duZXJfcHJvY2VlZHMKICAgIGJ5dGVjXzAgLy8gImRlcG9zaXRlZCIKICAgIGZyYW1lX2RpZyA0CiAgICBjb25jYXQKICAgIGR1cAogICAgYm94X2dldAogICAgc3dhcAogICAgYnRvaQogICAgc3dhcAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuZGVwb3NpdGVkIGVudHJ5IGV4aXN0cwogICAgdW5jb3ZlciAyCiAgICArCiAgICBpdG9iCiAgICBib3hfcHV0CiAgICByZXRzdWIKCmJ1eV9wYXJ0aWFsX2Vsc2VfYm9keUA3OgogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2UvY29udHJhY3QucHk6NDcyCiAgICAvLyBhcmM0LlVJbnQ2NChzYWxlLmFtb3VudC5uYXRpdmUgLSBxdWFudGl0eS5uYXRpdmUpLAogICAgZnJhbWVfZGlnIDEKICAgIGZyYW1lX2RpZyA2CiAgICAtCiAgICBpdG9iCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weTo0NzMKICAgIC8vIGFyYzQuVUludDY0KHNhbGUuY29zdC5uYXRpdmUgLSBwcmljZSksCiAgICBmcmFtZV9kaWcgMgogICAgZnJhbWVfZGlnIDMKICAgIGR1cAogICAgY292ZXIgMwogICAgLQogICAgaXRvYgogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2UvY29udHJhY3QucHk6NDc0CiAgICAvLyBzYWxlLmV4cGlyZXNfYXQsCiAgICBmcmFtZV9kaWcgNQogICAgZXh0cmFjdCAxNiA4IC8vIG9uIGVycm9yOiBJbmRleCBhY2Nlc3MgaXMgb3V0IG9mIGJvdW5kcwogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2UvY29udHJhY3QucHk6NDcxLTQ3NQogICAgLy8gU2FsZSgKICAgIC8vICAgICBhcmM0LlVJbnQ2NChzYWxlLmFtb3VudC5uYXRpdmUgLSBxdWFudGl0eS5uYXRpdmUpLAogICAgLy8gICAgIGFyYzQuVUludDY0KHNhbGUuY29zdC5uYXRpdmUgLSBwcmljZSksCiAgICAvLyAgICAgc2FsZS5leHBpcmVzX2F0LAogICAgLy8gKSwKICAgIGNvdmVyIDIKICAgIGNvbmNhdAogICAgc3dhcAogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weTo0NjktNDc3CiAgICAvLyBzZWxmLnB1dF9zYWxlKAogICAgLy8gICAgIHNhbGVfa2V5LAogICAgLy8gICAgIFNhbGUoCiAgICAvLyAgICAgICAgIGFyYzQuVUludDY0KHNhbGUuYW1vdW50Lm5hdGl2ZSAtIHF1YW50aXR5Lm5hdGl2ZSksCiAgICAvLyAgICAgICAgIGFyYzQuVUludDY0KHNhbGUuY29zdC5uYXRpdmUgLSBwcmljZSksCiAgICAvLyAgICAgICAgIHNhbGUuZXhwaXJlc19hdCwKICAgIC8vICAgICApLAogICAgLy8gICAgIHJlcGxhY2U9VHJ1ZSwKICAgIC8vICkKICAgIGZyYW1lX2RpZyAtMgogICAgc3dhcAogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2UvY29udHJhY3QucHk6NDc2CiAgICAvLyByZXBsYWNlPVRydWUsCiAgICBpbnRjXzEgLy8gMQogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2UvY29udHJhY3QucHk6NDY5LTQ3NwogICAgLy8gc2VsZi5wdXRfc2FsZSgKICAgIC8vICAgICBzYWxlX2tleSwKICAgIC8vICAgICBTYWxlKAogICAgLy8gICAgICAgICBhcmM0LlVJbnQ2NChzYWxlLmFtb3VudC5uYXRpdmUgLSBxdWFudGl0eS5uYXRpdmUpLAogICAgLy8gICAgICAgICBhcmM0LlVJbnQ2NChzYWxlLmNvc3QubmF0aXZlIC0gcHJpY2UpLAogICAgLy8gICAgICAgICBzYWxlLmV4cGlyZXNfYXQsCiAgICAvLyAgICAgKSwKICAgIC8vICAgICByZXBsYWNlPVRydWUsCiAgICAvLyApCiAgICBjYWxsc3ViIHB1dF9zYWxlCiAgICBiIGJ1eV9wYXJ0aWFsX2FmdGVyX2lmX2Vsc2VAOAoKYnV5X3BhcnRpYWxfYWZ0ZXJfaWZfZWxzZUAxMToKICAgIGZyYW1lX2J1cnkgMwogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2UvY29udHJhY3QucHk6NDU2CiAgICAvLyBwcmljZSA9IHByb19yYXRhX2Nvc3Qoc2FsZS5jb3N0Lm5hdGl2ZSwgcXVhbnRpdHkubmF0aXZlLCBzYWxlLmFtb3VudC5uYXRpdmUpCiAgICBiIGJ1eV9wYXJ0aWFsX2FmdGVyX2lubGluZWRfc21hcnRfY29udHJhY3RzLmRpZ2l0YWxfbWFya2V0cGxhY2Uuc3Vicm91dGluZXMucHJvX3JhdGFfY29zdEAxMgoKYnV5X3BhcnRpYWxfYm9vbF9mYWxzZUAzOgogICAgaW50Y18wIC8vIDAKICAgIGIgYnV5X3BhcnRpYWxfYm9vbF9tZXJnZUA0CgoKLy8gc21hcnRfY29udHJhY3RzLmRpZ2l0YWxfbWFya2V0cGxhY2UuY29udHJhY3QuRGlnaXRhbE1hcmtldHBsYWNlLmJ1eV9tYW55KHNhbGVfa2V5czogYnl0ZXMsIG1heF90b3RhbF9jb3N0OiBieXRlcykgLT4gdm9pZDoKYnV5X21hbnk6CiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weTo0ODItNDg1CiAgICAvLyBAYWJpbWV0aG9kCiAgICAvLyBkZWYgYnV5X21hbnkoCiAgICAvLyAgICAgc2VsZiwgc2FsZV9rZXlzOiBhcmM0LkR5bmFtaWNBcnJheVtTYWxlS2V5XSwgbWF4X3RvdGFsX2Nvc3Q6IGFyYzQuVUludDY0CiAgICAvLyApIC0+IE5vbmU6CiAgICBwcm90byAyIDAKICAgIGludGNfMCAvLyAwCiAgICBkdXBuIDMKICAgIGJ5dGVjXzEgLy8gIiIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjQ4Ni00ODkKICAgIC8vICMgQWxsIHRoZSBhc3NldCB0cmFuc2ZlcnMgYXJlIHN1Ym1pdHRlZCBhcyBhIHNpbmdsZSBpbm5lciBncm91cC4KICAgIC8vICMgUHJvY2VlZHMgYXJlIGNyZWRpdGVkIG9uY2UgcGVyIHJ1biBvZiBhZGphY2VudCBzYWxlIGtleXMgd2l0aCB0aGUgc2FtZSBvd25lciwKICAgIC8vICMgIHNvIGNhbGxlcnMgc2hvdWxkIGdyb3VwIHRoZSBzYWxlIGtleXMgYnkgb3duZXIuCiAgICAvLyBhc3NlcnQgc2FsZV9rZXlzLmxlbmd0aCwgZXJyLk5PX1NBTEVTCiAgICBmcmFtZV9kaWcgLTIKICAgIGludGNfMCAvLyAwCiAgICBleHRyYWN0X3VpbnQxNgogICAgZHVwCiAgICBhc3NlcnQgLy8gTm8gc2FsZXMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjQ5MAogICAgLy8gdG90YWxfY29zdCA9IFVJbnQ2NCgwKQogICAgaW50Y18wIC8vIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjQ5MS00OTMKICAgIC8vIGJpZF9yZWZ1bmRzID0gVUludDY0KDApCiAgICAvLyBvd25lcl9wcm9jZWVkcyA9IFVJbnQ2NCgwKQogICAgLy8gZm9yIGkgaW4gdXJhbmdlKHNhbGVfa2V5cy5sZW5ndGgpOgogICAgZHVwbiAzCgpidXlfbWFueV9mb3JfaGVhZGVyQDE6CiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weTo0OTMKICAgIC8vIGZvciBpIGluIHVyYW5nZShzYWxlX2tleXMubGVuZ3RoKToKICAgIGZyYW1lX2RpZyA5CiAgICBmcmFtZV9kaWcgNQogICAgPAogICAgYnogYnV5X21hbnlfYWZ0ZXJfZm9yQDEwCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weTo0OTQKICAgIC8vIHNhbGVfa2V5ID0gc2FsZV9rZXlzW2ldCiAgICBmcmFtZV9kaWcgLTIKICAgIGV4dHJhY3QgMiAwCiAgICBkdXAKICAgIGZyYW1lX2J1cnkgMAogICAgZnJhbWVfZGlnIDkKICAgIGR1cAogICAgY292ZXIgMgogICAgcHVzaGludCA0MCAvLyA0MAogICAgKgogICAgcHVzaGludCA0MCAvLyA0MAogICAgZXh0cmFjdDMgLy8gb24gZXJyb3I6IEluZGV4IGFjY2VzcyBpcyBvdXQgb2YgYm91bmRzCiAgICBkdXAKICAgIGZyYW1lX2J1cnkgMwogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2UvY29udHJhY3QucHk6NDk1CiAgICAvLyBhc3NlcnQgVHhuLnNlbmRlciAhPSBzYWxlX2tleS5vd25lci5uYXRpdmUsIGVyci5TRUxMRVJfQ0FOVF9CRV9CVVlFUgogICAgdHhuIFNlbmRlcgogICAgZGlnIDEKICAgIGV4dHJhY3QgMCAzMiAvLyBvbiBlcnJvcjogSW5kZXggYWNjZXNzIGlzIG91dCBvZiBib3VuZHMKICAgIGR1cAogICAgZnJhbWVfYnVyeSAxCiAgICAhPQogICAgYXNzZXJ0IC8vIFNlbGxlciBjYW5ub3QgYmUgYnV5ZXIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjQ5NgogICAgLy8gc2FsZSA9IHNlbGYuc2FsZXNbc2FsZV9rZXldCiAgICBieXRlY18yIC8vICJzYWxlcyIKICAgIHN3YXAKICAgIGNvbmNhdAogICAgYm94X2dldAogICAgc3dhcAogICAgZHVwCiAgICBjb3ZlciAyCiAgICBmcmFtZV9idXJ5IDIKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnNhbGVzIGVudHJ5IGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2UvY29udHJhY3QucHk6NDk3CiAgICAvLyBhc3NlcnQgbm90IGlzX2V4cGlyZWQoc2FsZSksIGVyci5TQUxFX0VYUElSRUQKICAgIGNhbGxzdWIgaXNfZXhwaXJlZAogICAgIQogICAgYXNzZXJ0IC8vIFNhbGUgZXhwaXJlZAogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2UvY29udHJhY3QucHk6NDk5CiAgICAvLyBpZiBpID09IDA6CiAgICBibnogYnV5X21hbnlfZWxzZV9ib2R5QDQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjUwMAogICAgLy8gb3AuSVR4bkNyZWF0ZS5iZWdpbigpCiAgICBpdHhuX2JlZ2luCgpidXlfbWFueV9hZnRlcl9pZl9lbHNlQDU6CiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weTo1MDMKICAgIC8vIG9wLklUeG5DcmVhdGUuc2V0X3R5cGVfZW51bShUcmFuc2FjdGlvblR5cGUuQXNzZXRUcmFuc2ZlcikKICAgIHB1c2hpbnQgNCAvLyBheGZlcgogICAgaXR4bl9maWVsZCBUeXBlRW51bQogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2UvY29udHJhY3QucHk6NTA0CiAgICAvLyBvcC5JVHhuQ3JlYXRlLnNldF9mZWUoMCkKICAgIGludGNfMCAvLyAwCiAgICBpdHhuX2ZpZWxkIEZlZQogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2UvY29udHJhY3QucHk6NTA1CiAgICAvLyBvcC5JVHhuQ3JlYXRlLnNldF94ZmVyX2Fzc2V0KHNhbGVfa2V5LmFzc2V0Lm5hdGl2ZSkKICAgIGZyYW1lX2RpZyAzCiAgICBkdXAKICAgIHB1c2hpbnQgMzIgLy8gMzIKICAgIGV4dHJhY3RfdWludDY0CiAgICBpdHhuX2ZpZWxkIFhmZXJBc3NldAogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2UvY29udHJhY3QucHk6NTA2CiAgICAvLyBvcC5JVHhuQ3JlYXRlLnNldF9hc3NldF9yZWNlaXZlcihUeG4uc2VuZGVyKQogICAgdHhuIFNlbmRlcgogICAgaXR4bl9maWVsZCBBc3NldFJlY2VpdmVyCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weTo1MDcKICAgIC8vIG9wLklUeG5DcmVhdGUuc2V0X2Fzc2V0X2Ftb3VudChzYWxlLmFtb3VudC5uYXRpdmUpCiAgICBmcmFtZV9kaWcgMgogICAgZHVwCiAgICBjb3ZlciAyCiAgICBpbnRjXzAgLy8gMAogICAgZXh0cmFjdF91aW50NjQKICAgIGl0eG5fZmllbGQgQXNzZXRBbW91bnQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjUwOQogICAgLy8gc2VsZi5kZWxldGVfc2FsZShzYWxlX2tleSkKICAgIGR1cAogICAgY2FsbHN1YiBkZWxldGVfc2FsZQogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2Uvc3Vicm91dGluZXMucHk6MTkyCiAgICAvLyBvcC5leHRyYWN0KG9wLnNoYTI1NihrZXkuYnl0ZXMpLCAwLCBjc3QuU0FMRV9JRF9MRU5HVEgpCiAgICBkdXAKICAgIHNoYTI1NgogICAgZXh0cmFjdCAwIDgKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjUxMAogICAgLy8gYmlkX3JlZnVuZHMgKz0gc2VsZi5kcm9wX2JpZChzYWxlX2tleSwgc2FsZV9pZF9vZihzYWxlX2tleSkpCiAgICBjYWxsc3ViIGRyb3BfYmlkCiAgICBmcmFtZV9kaWcgNwogICAgKwogICAgZnJhbWVfYnVyeSA3CiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weTo1MTIKICAgIC8vIHRvdGFsX2Nvc3QgKz0gc2FsZS5jb3N0Lm5hdGl2ZQogICAgcHVzaGludCA4IC8vIDgKICAgIGV4dHJhY3RfdWludDY0CiAgICBmcmFtZV9kaWcgNgogICAgZGlnIDEKICAgICsKICAgIGZyYW1lX2J1cnkgNgogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2Uvc3Vicm91dGluZXMucHk6MjYtMjcKICAgIC8vICMgVGhlIHNpemUgb2YgYSBib3ggaW5jbHVkZXMgaXRzIG5hbWUsIGtleSBwcmVmaXggaW5jbHVkZWQuCiAgICAvLyByZXR1cm4gY3N0LkJPWF9GTEFUX01JTl9CQUxBTkNFICsgc2l6ZSAqIGNzdC5CT1hfQllURV9NSU5fQkFMQU5DRQogICAgaW50YyA0IC8vIDMwMTAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weTo1MTMKICAgIC8vIG93bmVyX3Byb2NlZWRzICs9IHNhbGUuY29zdC5uYXRpdmUgKyBzZWxmLnNhbGVfYm94X21icigpCiAgICArCiAgICBmcmFtZV9kaWcgOAogICAgKwogICAgZnJhbWVfYnVyeSA4CiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weTo1MTQKICAgIC8vIGlmIGkgKyAxID09IHNhbGVfa2V5cy5sZW5ndGggb3Igc2FsZV9rZXlzW2kgKyAxXS5vd25lciAhPSBzYWxlX2tleS5vd25lcjoKICAgIGZyYW1lX2RpZyA5CiAgICBpbnRjXzEgLy8gMQogICAgKwogICAgZHVwCiAgICBmcmFtZV9idXJ5IDkKICAgIGZyYW1lX2RpZyA1CiAgICA9PQogICAgYm56IGJ1eV9tYW55X2lmX2JvZHlANwogICAgZnJhbWVfZGlnIDkKICAgIHB1c2hpbnQgNDAgLy8gNDAKICAgICoKICAgIGZyYW1lX2RpZyAwCiAgICBzd2FwCiAgICBwdXNoaW50IDQwIC8vIDQwCiAgICBleHRyYWN0MyAvLyBvbiBlcnJvcjogSW5kZXggYWNjZXNzIGlzIG91dCBvZiBib3VuZHMKICAgIGV4dHJhY3QgMCAzMiAvLyBvbiBlcnJvcjogSW5kZXggYWNjZXNzIGlzIG91dCBvZiBib3VuZHMKICAgIGZyYW1lX2RpZyAxCiAgICAhPQogICAgZnJhbWVfZGlnIDgKICAgIGZyYW1lX2J1cnkgNAogICAgYnogYnV5X21hbnlfYWZ0ZXJfaWZfZWxzZUA4CgpidXlfbWFueV9pZl9ib2R5QDc6CiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weTo1MTUKICAgIC8vIHNlbGYuZGVwb3NpdGVkW3NhbGVfa2V5Lm93bmVyLm5hdGl2ZV0gKz0gb3duZXJfcHJvY2VlZHMKICAgIGJ5dGVjXzAgLy8gImRlcG9zaXRlZCIKICAgIGZyYW1lX2RpZyAxCiAgICBjb25jYXQKICAgIGR1cAogICAgYm94X2dldAogICAgc3dhcAogICAgYnRvaQogICAgc3dhcAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuZGVwb3NpdGVkIGVudHJ5IGV4aXN0cwogICAgZnJhbWVfZGlnIDgKICAgICsKICAgIGl0b2IKICAgIGJveF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjUxNgogICAgLy8gb3duZXJfcHJvY2VlZHMgPSBVSW50NjQoMCkKICAgIGludGNfMCAvLyAwCiAgICBmcmFtZV9idXJ5IDQKCmJ1eV9tYW55X2FmdGVyX2lmX2Vsc2VAODoKICAgIGZyYW1lX2RpZyA0CiAgICBmcmFtZV9idXJ5IDgKICAgIGIgYnV5X21hbnlfZm9yX2hlYWRlckAxCgpidXlfbWFueV9lbHNlX2JvZHlANDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjUwMgogICAgLy8gb3AuSVR4bkNyZWF0ZS5uZXh0KCkKICAgIGl0eG5fbmV4dAogICAgYiBidXlfbWFueV9hZnRlcl9pZl9lbHNlQDUKCmJ1eV9tYW55X2FmdGVyX2ZvckAxMDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjUxNwogICAgLy8gb3AuSVR4bkNyZWF0ZS5zdWJtaXQoKQogICAgaXR4bl9zdWJtaXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjUxOQogICAgLy8gYXNzZXJ0IHRvdGFsX2Nvc3QgPD0gbWF4X3RvdGFsX2Nvc3QubmF0aXZlLCBlcnIuTUFYX1RPVEFMX0NPU1RfRVhDRUVERUQKICAgIGZyYW1lX2RpZyAtMQogICAgYnRvaQogICAgZnJhbWVfZGlnIDYKICAgIGR1cAogICAgdW5jb3ZlciAyCiAgICA8PQogICAgYXNzZXJ0IC8vIE1heCB0b3RhbCBjb3N0IGV4Y2VlZGVkCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weTo1MjAKICAgIC8vIHNlbGYuc2V0dGxlKFR4bi5zZW5kZXIsIGJpZF9yZWZ1bmRzLCB0b3RhbF9jb3N0KQogICAgdHhuIFNlbmRlcgogICAgZnJhbWVfZGlnIDcKICAgIHVuY292ZXIgMgogICAgY2FsbHN1YiBzZXR0bGUKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5kaWdpdGFsX21hcmtldHBsYWNlLmNvbnRyYWN0LkRpZ2l0YWxNYXJrZXRwbGFjZS5hZGRfYmlkX3RvdGFscyhiaWRkZXI6IGJ5dGVzLCBjb21taXR0ZWQ6IHVpbnQ2NCwgcmVsZWFzZWQ6IHVpbnQ2NCwgd2lubmluZzogdWludDY0KSAtPiB1aW50NjQ6CmFkZF9iaWRfdG90YWxzOgogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2UvY29udHJhY3QucHk6NTIyLTUyNQogICAgLy8gQHN1YnJvdXRpbmUKICAgIC8vIGRlZiBhZGRfYmlkX3RvdGFscygKICAgIC8vICAgICBzZWxmLCBiaWRkZXI6IEFjY291bnQsIGNvbW1pdHRlZDogVUludDY0LCByZWxlYXNlZDogVUludDY0LCB3aW5uaW5nOiBVSW50NjQKICAgIC8vICkgLT4gVUludDY0OgogICAgcHJvdG8gNCAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weTo1MjYtNTMyCiAgICAvLyAjIENvbW1pdHMgdGhlIG5ldyByZWNlaXB0cyBvZiB0aGUgYmlkZGVyIGFuZCByZWxlYXNlcyB0aGUgcmVjZWlwdHMgdGhleQogICAgLy8gIyAgb3Zlcndyb3RlIGluIGEgc2luZ2xlIHdyaXRlIG9mIHRoZSB0b3RhbHMgYm94LgogICAgLy8gIyBUaGUgcmVsZWFzZWQgYW1vdW50IGNhbiBiZSBsYXJnZXIgdGhhbiB0aGUgY29tbWl0dGVkIG9uZSBpZiBpdCB3YXMgbGVmdCBvbiBhCiAgICAvLyAjICBzYWxlIHRoYXQgaGFzIHNpbmNlIGJlZW4gY2xvc2VkIGFuZCBvcGVuZWQgYWdhaW4sIHNvIGl0IGlzIHRha2VuIG9mZiBsYXN0LgogICAgLy8gIyBSZXR1cm5zIHRoZSBNQlIgb2YgdGhlIHRvdGFscyBib3ggaWYgaXQgaGFkIHRvIGJlIGNyZWF0ZWQsIHdoaWNoIHRoZSBiaWRkZXIKICAgIC8vICMgIGhhcyB0byBwYXkuCiAgICAvLyB0b3RhbHMsIGV4aXN0cyA9IHNlbGYuYmlkX3RvdGFscy5tYXliZShiaWRkZXIpCiAgICBieXRlYyA1IC8vICJiaWRfdG90YWxzIgogICAgZnJhbWVfZGlnIC00CiAgICBjb25jYXQKICAgIGR1cAogICAgYm94X2dldAogICAgZHVwCiAgICB1bmNvdmVyIDIKICAgIHN3YXAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjUzMwogICAgLy8gaWYgbm90IGV4aXN0czoKICAgIGJueiBhZGRfYmlkX3RvdGFsc19hZnRlcl9pZl9lbHNlQDIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjUzNAogICAgLy8gdG90YWxzID0gQmlkVG90YWxzKGFyYzQuVUludDY0KCksIGFyYzQuVUludDY0KCksIGFyYzQuVUludDE2KCkpCiAgICBieXRlYyAxNSAvLyAweDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMAogICAgZnJhbWVfYnVyeSAyCgphZGRfYmlkX3RvdGFsc19hZnRlcl9pZl9lbHNlQDI6CiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weTo1MzcKICAgIC8vIGFyYzQuVUludDY0KHRvdGFscy5jb21taXR0ZWQubmF0aXZlICsgY29tbWl0dGVkIC0gcmVsZWFzZWQpLAogICAgZnJhbWVfZGlnIDIKICAgIGR1cAogICAgaW50Y18wIC8vIDAKICAgIGV4dHJhY3RfdWludDY0CiAgICBmcmFtZV9kaWcgLTMKICAgICsKICAgIGZyYW1lX2RpZyAtMgogICAgLQogICAgaXRvYgogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2UvY29udHJhY3QucHk6NTM4CiAgICAvLyBhcmM0LlVJbnQ2NCh0b3RhbHMud2lubmluZy5uYXRpdmUgKyB3aW5uaW5nKSwKICAgIGRpZyAxCiAgICBwdXNoaW50IDggLy8gOAogICAgZXh0cmFjdF91aW50NjQKICAgIGZyYW1lX2RpZyAtMQogICAgKwogICAgaXRvYgogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2UvY29udHJhY3QucHk6NTM5CiAgICAvLyB0b3RhbHMubl9wYWdlcywKICAgIHVuY292ZXIgMgogICAgZXh0cmFjdCAxNiAyIC8vIG9uIGVycm9yOiBJbmRleCBhY2Nlc3MgaXMgb3V0IG9mIGJvdW5kcwogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2UvY29udHJhY3QucHk6NTM2LTU0MAogICAgLy8gc2VsZi5iaWRfdG90YWxzW2JpZGRlcl0gPSBCaWRUb3RhbHMoCiAgICAvLyAgICAgYXJjNC5VSW50NjQodG90YWxzLmNvbW1pdHRlZC5uYXRpdmUgKyBjb21taXR0ZWQgLSByZWxlYXNlZCksCiAgICAvLyAgICAgYXJjNC5VSW50NjQodG90YWxzLndpbm5pbmcubmF0aXZlICsgd2lubmluZyksCiAgICAvLyAgICAgdG90YWxzLm5fcGFnZXMsCiAgICAvLyApCiAgICBjb3ZlciAyCiAgICBjb25jYXQKICAgIHN3YXAKICAgIGNvbmNhdAogICAgZnJhbWVfZGlnIDAKICAgIHN3YXAKICAgIGJveF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjU0MQogICAgLy8gaWYgZXhpc3RzOgogICAgZnJhbWVfZGlnIDEKICAgIGJ6IGFkZF9iaWRfdG90YWxzX2FmdGVyX2lmX2Vsc2VANAogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2UvY29udHJhY3QucHk6NTQyCiAgICAvLyByZXR1cm4gVUludDY0KDApCiAgICBpbnRjXzAgLy8gMAogICAgZnJhbWVfYnVyeSAwCiAgICByZXRzdWIKCmFkZF9iaWRfdG90YWxzX2FmdGVyX2lmX2Vsc2VANDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL3N1YnJvdXRpbmVzLnB5OjI2LTI3CiAgICAvLyAjIFRoZSBzaXplIG9mIGEgYm94IGluY2x1ZGVzIGl0cyBuYW1lLCBrZXkgcHJlZml4IGluY2x1ZGVkLgogICAgLy8gcmV0dXJuIGNzdC5CT1hfRkxBVF9NSU5fQkFMQU5DRSArIHNpemUgKiBjc3QuQk9YX0JZVEVfTUlOX0JBTEFOQ0UKICAgIGludGMgNyAvLyAyNjUwMAogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2UvY29udHJhY3QucHk6NTQzCiAgICAvLyByZXR1cm4gc2VsZi5iaWRfdG90YWxzX2JveF9tYnIoKQogICAgZnJhbWVfYnVyeSAwCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuZGlnaXRhbF9tYXJrZXRwbGFjZS5jb250cmFjdC5EaWdpdGFsTWFya2V0cGxhY2Uuc3ViX2JpZF90b3RhbHMoYmlkZGVyOiBieXRlcywgY29tbWl0dGVkOiB1aW50NjQsIHdpbm5pbmc6IHVpbnQ2NCkgLT4gdm9pZDoKc3ViX2JpZF90b3RhbHM6CiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weTo1NDUtNTQ4CiAgICAvLyBAc3Vicm91dGluZQogICAgLy8gZGVmIHN1Yl9iaWRfdG90YWxzKAogICAgLy8gICAgIHNlbGYsIGJpZGRlcjogQWNjb3VudCwgY29tbWl0dGVkOiBVSW50NjQsIHdpbm5pbmc6IFVJbnQ2NAogICAgLy8gKSAtPiBOb25lOgogICAgcHJvdG8gMyAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weTo1NDkKICAgIC8vIHRvdGFscyA9IHNlbGYuYmlkX3RvdGFsc1tiaWRkZXJdCiAgICBieXRlYyA1IC8vICJiaWRfdG90YWxzIgogICAgZnJhbWVfZGlnIC0zCiAgICBjb25jYXQKICAgIGR1cAogICAgYm94X2dldAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuYmlkX3RvdGFscyBlbnRyeSBleGlzdHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjU1MQogICAgLy8gYXJjNC5VSW50NjQodG90YWxzLmNvbW1pdHRlZC5uYXRpdmUgLSBjb21taXR0ZWQpLAogICAgZHVwCiAgICBpbnRjXzAgLy8gMAogICAgZXh0cmFjdF91aW50NjQKICAgIGZyYW1lX2RpZyAtMgogICAgLQogICAgaXRvYgogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2UvY29udHJhY3QucHk6NTUyCiAgICAvLyBhcmM0LlVJbnQ2NCh0b3RhbHMud2lubmluZy5uYXRpdmUgLSB3aW5uaW5nKSwKICAgIGRpZyAxCiAgICBwdXNoaW50IDggLy8gOAogICAgZXh0cmFjdF91aW50NjQKICAgIGZyYW1lX2RpZyAtMQogICAgLQogICAgaXRvYgogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2UvY29udHJhY3QucHk6NTUzCiAgICAvLyB0b3RhbHMubl9wYWdlcywKICAgIHVuY292ZXIgMgogICAgZXh0cmFjdCAxNiAyIC8vIG9uIGVycm9yOiBJbmRleCBhY2Nlc3MgaXMgb3V0IG9mIGJvdW5kcwogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2UvY29udHJhY3QucHk6NTUwLTU1NAogICAgLy8gc2VsZi5iaWRfdG90YWxzW2JpZGRlcl0gPSBCaWRUb3RhbHMoCiAgICAvLyAgICAgYXJjNC5VSW50NjQodG90YWxzLmNvbW1pdHRlZC5uYXRpdmUgLSBjb21taXR0ZWQpLAogICAgLy8gICAgIGFyYzQuVUludDY0KHRvdGFscy53aW5uaW5nLm5hdGl2ZSAtIHdpbm5pbmcpLAogICAgLy8gICAgIHRvdGFscy5uX3BhZ2VzLAogICAgLy8gKQogICAgY292ZXIgMgogICAgY29uY2F0CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGJveF9wdXQKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5kaWdpdGFsX21hcmtldHBsYWNlLmNvbnRyYWN0LkRpZ2l0YWxNYXJrZXRwbGFjZS5yZWxlYXNlX2JpZChzYWxlX2lkOiBieXRlcywgYmlkOiBieXRlcykgLT4gdWludDY0OgpyZWxlYXNlX2JpZDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjU1Ni01NTcKICAgIC8vIEBzdWJyb3V0aW5lCiAgICAvLyBkZWYgcmVsZWFzZV9iaWQoc2VsZiwgc2FsZV9pZDogYXJjNC5VSW50NjQsIGJpZDogQmlkKSAtPiBVSW50NjQ6CiAgICBwcm90byAyIDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjU1OC01NjIKICAgIC8vICMgQ2FsbGVkIHdoZW4gYSBiaWQgc3RvcHMgYmVpbmcgdGhlIGJlc3QgYmlkIG9mIGl0cyBzYWxlLgogICAgLy8gIyBSZXR1cm5zIHdoYXQgdGhlIGJpZGRlciBpcyBvd2VkOiB0aGUgTUJSIG9mIHRoZSBiaWQgYm94IGFuZCwgaWYgdGhlIGJpZCB3YXMKICAgIC8vICMgIHBsYWNlZCB3aXRoIGlzb2xhdGVkX2JpZCwgaXRzIHJlY2VpcHQgd2hpY2ggaXMgcHVzaGVkIGJhY2sgcmlnaHQgYXdheS4KICAgIC8vICMgUmVjZWlwdHMgaW4gdGhlIHJlY2VpcHQgYm9vayBzdGF5IGNvbW1pdHRlZCB1bnRpbCB0aGV5IGFyZSBjbGFpbWVkLgogICAgLy8gaWYgYmlkLmlzb2xhdGVkLm5hdGl2ZToKICAgIGZyYW1lX2RpZyAtMQogICAgcHVzaGludCAzMjAgLy8gMzIwCiAgICBnZXRiaXQKICAgIGJ5dGVjIDEyIC8vIDB4MDAKICAgIGludGNfMCAvLyAwCiAgICB1bmNvdmVyIDIKICAgIHNldGJpdAogICAgaW50Y18wIC8vIDAKICAgIGdldGJpdAogICAgYnogcmVsZWFzZV9iaWRfYWZ0ZXJfaWZfZWxzZUAyCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weTo1NjMKICAgIC8vIGRlbCBzZWxmLmlzb2xhdGVkX3JlY2VpcHRzW2lzb2xhdGVkX3JlY2VpcHRfa2V5KGJpZC5iaWRkZXIubmF0aXZlLCBzYWxlX2lkKV0KICAgIGZyYW1lX2RpZyAtMQogICAgZXh0cmFjdCAwIDMyIC8vIG9uIGVycm9yOiBJbmRleCBhY2Nlc3MgaXMgb3V0IG9mIGJvdW5kcwogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2Uvc3Vicm91dGluZXMucHk6MTk4LTE5OQogICAgLy8gIyBSZWNlaXB0cyBvZiB0aGUgc2FtZSBiaWRkZXIgc2hhcmUgdGhlIHByZWZpeCBhbmQgY2FuIGJlIGxpc3RlZCBvZmYtY2hhaW4uCiAgICAvLyByZXR1cm4gYmlkZGVyLmJ5dGVzICsgc2FsZV9pZC5ieXRlcwogICAgZHVwCiAgICBmcmFtZV9kaWcgLTIKICAgIGNvbmNhdAogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2UvY29udHJhY3QucHk6NTYzCiAgICAvLyBkZWwgc2VsZi5pc29sYXRlZF9yZWNlaXB0c1tpc29sYXRlZF9yZWNlaXB0X2tleShiaWQuYmlkZGVyLm5hdGl2ZSwgc2FsZV9pZCldCiAgICBieXRlYyA3IC8vIDB4NjkKICAgIHN3YXAKICAgIGNvbmNhdAogICAgYm94X2RlbAogICAgcG9wCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weTo1NjQKICAgIC8vIHNlbGYuc3ViX2JpZF90b3RhbHMoYmlkLmJpZGRlci5uYXRpdmUsIGJpZC5hbW91bnQubmF0aXZlLCBiaWQuYW1vdW50Lm5hdGl2ZSkKICAgIGZyYW1lX2RpZyAtMQogICAgcHVzaGludCAzMiAvLyAzMgogICAgZXh0cmFjdF91aW50NjQKICAgIHN3YXAKICAgIGRpZyAxCiAgICBkaWcgMgogICAgY2FsbHN1YiBzdWJfYmlkX3RvdGFscwogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2Uvc3Vicm91dGluZXMucHk6MjYtMjcKICAgIC8vICMgVGhlIHNpemUgb2YgYSBib3ggaW5jbHVkZXMgaXRzIG5hbWUsIGtleSBwcmVmaXggaW5jbHVkZWQuCiAgICAvLyByZXR1cm4gY3N0LkJPWF9GTEFUX01JTl9CQUxBTkNFICsgc2l6ZSAqIGNzdC5CT1hfQllURV9NSU5fQkFMQU5DRQogICAgaW50YyA2IC8vIDIzNzAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weTo1NjYKICAgIC8vIHNlbGYuYmlkX2JveF9tYnIoKSArIGJpZC5hbW91bnQubmF0aXZlICsgc2VsZi5pc29sYXRlZF9yZWNlaXB0X2JveF9tYnIoKQogICAgKwogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2Uvc3Vicm91dGluZXMucHk6MjYtMjcKICAgIC8vICMgVGhlIHNpemUgb2YgYSBib3ggaW5jbHVkZXMgaXRzIG5hbWUsIGtleSBwcmVmaXggaW5jbHVkZWQuCiAgICAvLyByZXR1cm4gY3N0LkJPWF9GTEFUX01JTl9CQUxBTkNFICsgc2l6ZSAqIGNzdC5CT1hfQllURV9NSU5fQkFMQU5DRQogICAgaW50YyA1IC8vIDIyMTAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weTo1NjYKICAgIC8vIHNlbGYuYmlkX2JveF9tYnIoKSArIGJpZC5hbW91bnQubmF0aXZlICsgc2VsZi5pc29sYXRlZF9yZWNlaXB0X2JveF9tYnIoKQogICAgKwogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2UvY29udHJhY3QucHk6NTY1LTU2NwogICAgLy8gcmV0dXJuICgKICAgIC8vICAgICBzZWxmLmJpZF9ib3hfbWJyKCkgKyBiaWQuYW1vdW50Lm5hdGl2ZSArIHNlbGYuaXNvbGF0ZWRfcmVjZWlwdF9ib3hfbWJyKCkKICAgIC8vICkKICAgIHJldHN1YgoKcmVsZWFzZV9iaWRfYWZ0ZXJfaWZfZWxzZUAyOgogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2UvY29udHJhY3QucHk6NTY5CiAgICAvLyBzZWxmLnN1Yl9iaWRfdG90YWxzKGJpZC5iaWRkZXIubmF0aXZlLCBVSW50NjQoMCksIGJpZC5hbW91bnQubmF0aXZlKQogICAgZnJhbWVfZGlnIC0xCiAgICBleHRyYWN0IDAgMzIgLy8gb24gZXJyb3I6IEluZGV4IGFjY2VzcyBpcyBvdXQgb2YgYm91bmRzCiAgICBmcmFtZV9kaWcgLTEKICAgIHB1c2hpbnQgMzIgLy8gMzIKICAgIGV4dHJhY3RfdWludDY0CiAgICBpbnRjXzAgLy8gMAogICAgc3dhcAogICAgY2FsbHN1YiBzdWJfYmlkX3RvdGFscwogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2Uvc3Vicm91dGluZXMucHk6MjYtMjcKICAgIC8vICMgVGhlIHNpemUgb2YgYSBib3ggaW5jbHVkZXMgaXRzIG5hbWUsIGtleSBwcmVmaXggaW5jbHVkZWQuCiAgICAvLyByZXR1cm4gY3N0LkJPWF9GTEFUX01JTl9CQUxBTkNFICsgc2l6ZSAqIGNzdC5CT1hfQllURV9NSU5fQkFMQU5DRQogICAgaW50YyA2IC8vIDIzNzAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weTo1NzAKICAgIC8vIHJldHVybiBzZWxmLmJpZF9ib3hfbWJyKCkKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5kaWdpdGFsX21hcmtldHBsYWNlLmNvbnRyYWN0LkRpZ2l0YWxNYXJrZXRwbGFjZS5kcm9wX2JpZChzYWxlX2tleTogYnl0ZXMsIHNhbGVfaWQ6IGJ5dGVzKSAtPiB1aW50NjQ6CmRyb3BfYmlkOgogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2UvY29udHJhY3QucHk6NTcyLTU3MwogICAgLy8gQHN1YnJvdXRpbmUKICAgIC8vIGRlZiBkcm9wX2JpZChzZWxmLCBzYWxlX2tleTogU2FsZUtleSwgc2FsZV9pZDogYXJjNC5VSW50NjQpIC0+IFVJbnQ2NDoKICAgIHByb3RvIDIgMQogICAgaW50Y18wIC8vIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjU3NC01NzcKICAgIC8vICMgUmVsZWFzZXMgdGhlIGJlc3QgYmlkIG9mIHRoZSBzYWxlLCBpZiB0aGVyZSBpcyBvbmUuCiAgICAvLyAjIFRoZSByZWZ1bmQgb2YgYW55IG90aGVyIGFjY291bnQgaXMgc2V0dGxlZCBoZXJlLCB3aGlsZSB0aGUgcmVmdW5kIG9mIHRoZQogICAgLy8gIyAgY2FsbGVyIGlzIHJldHVybmVkIHRvIGJlIG5ldHRlZCB3aXRoIHRoZSByZXN0IG9mIHRoZSBjYWxsLgogICAgLy8gYmlkLCBleGlzdHMgPSBzZWxmLmJpZHMubWF5YmUoc2FsZV9pZCkKICAgIGJ5dGVjIDQgLy8gImJpZHMiCiAgICBmcmFtZV9kaWcgLTEKICAgIGNvbmNhdAogICAgYm94X2dldAogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2UvY29udHJhY3QucHk6NTc4CiAgICAvLyBpZiBub3QgZXhpc3RzOgogICAgYm56IGRyb3BfYmlkX2FmdGVyX2lmX2Vsc2VAMgogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2UvY29udHJhY3QucHk6NTc5CiAgICAvLyByZXR1cm4gVUludDY0KDApCiAgICBpbnRjXzAgLy8gMAogICAgZnJhbWVfYnVyeSAwCiAgICByZXRzdWIKCmRyb3BfYmlkX2FmdGVyX2lmX2Vsc2VAMjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjU4MQogICAgLy8gc2VsZi5kZWxldGVfYmlkKHNhbGVfa2V5LCBzYWxlX2lkKQogICAgZnJhbWVfZGlnIC0yCiAgICBmcmFtZV9kaWcgLTEKICAgIGNhbGxzdWIgZGVsZXRlX2JpZAogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2UvY29udHJhY3QucHk6NTgyCiAgICAvLyByZWZ1bmQgPSBzZWxmLnJlbGVhc2VfYmlkKHNhbGVfaWQsIGJpZCkKICAgIGZyYW1lX2RpZyAtMQogICAgZnJhbWVfZGlnIDEKICAgIGR1cAogICAgY292ZXIgMgogICAgY2FsbHN1YiByZWxlYXNlX2JpZAogICAgc3dhcAogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2UvY29udHJhY3QucHk6NTgzCiAgICAvLyBpZiBiaWQuYmlkZGVyID09IFR4bi5zZW5kZXI6CiAgICBleHRyYWN0IDAgMzIgLy8gb24gZXJyb3I6IEluZGV4IGFjY2VzcyBpcyBvdXQgb2YgYm91bmRzCiAgICBkdXAKICAgIGZyYW1lX2J1cnkgMAogICAgdHhuIFNlbmRlcgogICAgPT0KICAgIGJ6IGRyb3BfYmlkX2FmdGVyX2lmX2Vsc2VANAogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2UvY29udHJhY3QucHk6NTg0CiAgICAvLyByZXR1cm4gcmVmdW5kCiAgICBmcmFtZV9idXJ5IDAKICAgIHJldHN1YgoKZHJvcF9iaWRfYWZ0ZXJfaWZfZWxzZUA0OgogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2UvY29udHJhY3QucHk6NTg1CiAgICAvLyBzZWxmLmRlcG9zaXRlZFtiaWQuYmlkZGVyLm5hdGl2ZV0gKz0gcmVmdW5kCiAgICBieXRlY18wIC8vICJkZXBvc2l0ZWQiCiAgICBmcmFtZV9kaWcgMAogICAgY29uY2F0CiAgICBkdXAKICAgIGJveF9nZXQKICAgIHN3YXAKICAgIGJ0b2kKICAgIHN3YXAKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmRlcG9zaXRlZCBlbnRyeSBleGlzdHMKICAgIHVuY292ZXIgMgogICAgKwogICAgaXRvYgogICAgYm94X3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2UvY29udHJhY3QucHk6NTg2CiAgICAvLyByZXR1cm4gVUludDY0KDApCiAgICBpbnRjXzAgLy8gMAogICAgZnJhbWVfYnVyeSAwCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuZGlnaXRhbF9tYXJrZXRwbGFjZS5jb250cmFjdC5EaWdpdGFsTWFya2V0cGxhY2Uub3V0YmlkKHNhbGVfa2V5OiBieXRlcywgc2FsZV9pZDogYnl0ZXMsIG5ld19iaWRfYW1vdW50OiBieXRlcywgaXNvbGF0ZWQ6IHVpbnQ2NCkgLT4gdWludDY0LCB1aW50NjQ6Cm91dGJpZDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjU4OC01OTYKICAgIC8vIEBzdWJyb3V0aW5lCiAgICAvLyBkZWYgb3V0YmlkKAogICAgLy8gICAgIHNlbGYsCiAgICAvLyAgICAgc2FsZV9rZXk6IFNhbGVLZXksCiAgICAvLyAgICAgc2FsZV9pZDogYXJjNC5VSW50NjQsCiAgICAvLyAgICAgbmV3X2JpZF9hbW91bnQ6IGFyYzQuVUludDY0LAogICAgLy8gICAgICosCiAgICAvLyAgICAgaXNvbGF0ZWQ6IGJvb2wsCiAgICAvLyApIC0+IHR1cGxlW1VJbnQ2NCwgVUludDY0XToKICAgIHByb3RvIDQgMgogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2UvY29udHJhY3QucHk6NjAyCiAgICAvLyBiaWRkZXI9YXJjNC5BZGRyZXNzKFR4bi5zZW5kZXIpLAogICAgdHhuIFNlbmRlcgogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2UvY29udHJhY3QucHk6NjA0CiAgICAvLyBpc29sYXRlZD1hcmM0LkJvb2woaXNvbGF0ZWQpLAogICAgYnl0ZWMgMTIgLy8gMHgwMAogICAgaW50Y18wIC8vIDAKICAgIGZyYW1lX2RpZyAtMQogICAgc2V0Yml0CiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weTo1OTctNjA1CiAgICAvLyAjIFJldHVybnMgdGhlIE1CUiBvZiB0aGUgYmlkIGJveCB0aGF0IHRoZSBjYWxsZXIgaGFzIHRvIHBheSBhbmQgaG93IG11Y2ggdGhlCiAgICAvLyAjICB3aW5uaW5nIGJpZHMgb2YgdGhlIGNhbGxlciBncmV3LgogICAgLy8gIyBUaGUgYmVzdCBiaWRkZXIgYWx3YXlzIGhvbGRzIHRoZSBNQlIgb2YgdGhlIGJpZCBib3g6IGEgbmV3IGJlc3QgYmlkZGVyIHBheXMKICAgIC8vICMgIGl0IGJhY2sgdG8gdGhlIHByZXZpb3VzIG9uZSwgd2hpbGUgcmFpc2luZyB5b3VyIG93biBiaWQgY29zdHMgbm90aGluZy4KICAgIC8vIG5ld19iaWQgPSBCaWQoCiAgICAvLyAgICAgYmlkZGVyPWFyYzQuQWRkcmVzcyhUeG4uc2VuZGVyKSwKICAgIC8vICAgICBhbW91bnQ9bmV3X2JpZF9hbW91bnQsCiAgICAvLyAgICAgaXNvbGF0ZWQ9YXJjNC5Cb29sKGlzb2xhdGVkKSwKICAgIC8vICkKICAgIHN3YXAKICAgIGZyYW1lX2RpZyAtMgogICAgY29uY2F0CiAgICBzd2FwCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjYwNwogICAgLy8gYXNzZXJ0IFR4bi5zZW5kZXIgIT0gc2FsZV9rZXkub3duZXIsIGVyci5TRUxMRVJfQ0FOVF9CRV9CSURERVIKICAgIGZyYW1lX2RpZyAtNAogICAgZXh0cmFjdCAwIDMyIC8vIG9uIGVycm9yOiBJbmRleCBhY2Nlc3MgaXMgb3V0IG9mIGJvdW5kcwogICAgZHVwCiAgICB0eG4gU2VuZGVyCiAgICAhPQogICAgYXNzZXJ0IC8vIFNlbGxlciBjYW5ub3QgYmUgYmlkZGVyCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weTo2MDgKICAgIC8vIHNhbGUsIHNhbGVfZXhpc3RzID0gc2VsZi5zYWxlcy5tYXliZShzYWxlX2tleSkKICAgIGJ5dGVjXzIgLy8gInNhbGVzIgogICAgZnJhbWVfZGlnIC00CiAgICBjb25jYXQKICAgIGJveF9nZXQKICAgIHN3YXAKICAgIGR1cAogICAgdW5jb3ZlciAyCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weTo2MDkKICAgIC8vIGFzc2VydCBzYWxlX2V4aXN0cywgZXJyLlNBTEVfTk9UX0ZPVU5ECiAgICBhc3NlcnQgLy8gU2FsZSBub3QgZm91bmQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjYxMAogICAgLy8gYXNzZXJ0IG5vdCBpc19leHBpcmVkKHNhbGUpLCBlcnIuU0FMRV9FWFBJUkVECiAgICBjYWxsc3ViIGlzX2V4cGlyZWQKICAgICEKICAgIGFzc2VydCAvLyBTYWxlIGV4cGlyZWQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjYxMgogICAgLy8gY3VycmVudF9iaWQsIGV4aXN0cyA9IHNlbGYuYmlkcy5tYXliZShzYWxlX2lkKQogICAgYnl0ZWMgNCAvLyAiYmlkcyIKICAgIGZyYW1lX2RpZyAtMwogICAgY29uY2F0CiAgICBkdXAKICAgIGJveF9nZXQKICAgIGR1cAogICAgdW5jb3ZlciAyCiAgICBzd2FwCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weTo2MTMKICAgIC8vIGlmIGV4aXN0czoKICAgIGJ6IG91dGJpZF9hZnRlcl9pZl9lbHNlQDIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjYxNAogICAgLy8gYXNzZXJ0IGN1cnJlbnRfYmlkLmFtb3VudC5uYXRpdmUgPCBuZXdfYmlkX2Ftb3VudC5uYXRpdmUsIGVyci5XT1JTRV9CSUQKICAgIGZyYW1lX2RpZyA1CiAgICBwdXNoaW50IDMyIC8vIDMyCiAgICBleHRyYWN0X3VpbnQ2NAogICAgZnJhbWVfZGlnIC0yCiAgICBidG9pCiAgICA8CiAgICBhc3NlcnQgLy8gV29yc2UgYmlkCgpvdXRiaWRfYWZ0ZXJfaWZfZWxzZUAyOgogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2UvY29udHJhY3QucHk6MzM0CiAgICAvLyBzZWxmLmJpZHNbc2FsZV9pZF0gPSBiaWQKICAgIGZyYW1lX2RpZyAzCiAgICBmcmFtZV9kaWcgMAogICAgZHVwCiAgICBjb3ZlciAyCiAgICBib3hfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weTozMzYKICAgIC8vIEJveFJlZihrZXk9c2VsZi5iZXN0X2JpZHMua2V5X3ByZWZpeCArIHNhbGVfa2V5LmFzc2V0LmJ5dGVzKSwKICAgIGZyYW1lX2RpZyAtNAogICAgZXh0cmFjdCAzMiA4IC8vIG9uIGVycm9yOiBJbmRleCBhY2Nlc3MgaXMgb3V0IG9mIGJvdW5kcwogICAgYnl0ZWMgMTEgLy8gImJlc3RfYmlkcyIKICAgIHN3YXAKICAgIGNvbmNhdAogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2UvY29udHJhY3QucHk6MzM3CiAgICAvLyBCb29rRW50cnkoc2FsZV9rZXkub3duZXIsIGJpZC5hbW91bnQsIHNhbGUuYW1vdW50KSwKICAgIHN3YXAKICAgIGV4dHJhY3QgMzIgOCAvLyBvbiBlcnJvcjogSW5kZXggYWNjZXNzIGlzIG91dCBvZiBib3VuZHMKICAgIGZyYW1lX2RpZyAyCiAgICBleHRyYWN0IDAgOCAvLyBvbiBlcnJvcjogSW5kZXggYWNjZXNzIGlzIG91dCBvZiBib3VuZHMKICAgIGZyYW1lX2RpZyAxCiAgICB1bmNvdmVyIDIKICAgIGNvbmNhdAogICAgc3dhcAogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weTozMzgKICAgIC8vIGRlc2NlbmRpbmc9VHJ1ZSwKICAgIGludGNfMSAvLyAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weTozMzUtMzQwCiAgICAvLyBwdXRfYm9va19lbnRyeSgKICAgIC8vICAgICBCb3hSZWYoa2V5PXNlbGYuYmVzdF9iaWRzLmtleV9wcmVmaXggKyBzYWxlX2tleS5hc3NldC5ieXRlcyksCiAgICAvLyAgICAgQm9va0VudHJ5KHNhbGVfa2V5Lm93bmVyLCBiaWQuYW1vdW50LCBzYWxlLmFtb3VudCksCiAgICAvLyAgICAgZGVzY2VuZGluZz1UcnVlLAogICAgLy8gICAgIHJlcGxhY2U9cmVwbGFjZSwKICAgIC8vICkKICAgIGZyYW1lX2RpZyA0CiAgICBkdXAKICAgIGNvdmVyIDQKICAgIGNhbGxzdWIgcHV0X2Jvb2tfZW50cnkKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjYxNwogICAgLy8gaWYgZXhpc3RzIGFuZCBjdXJyZW50X2JpZC5iaWRkZXIgPT0gVHhuLnNlbmRlcjoKICAgIGJ6IG91dGJpZF9hZnRlcl9pZl9lbHNlQDUKICAgIGZyYW1lX2RpZyA1CiAgICBleHRyYWN0IDAgMzIgLy8gb24gZXJyb3I6IEluZGV4IGFjY2VzcyBpcyBvdXQgb2YgYm91bmRzCiAgICB0eG4gU2VuZGVyCiAgICA9PQogICAgYnogb3V0YmlkX2FmdGVyX2lmX2Vsc2VANQogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2UvY29udHJhY3QucHk6NjE4CiAgICAvLyByZXR1cm4gVUludDY0KDApLCBuZXdfYmlkX2Ftb3VudC5uYXRpdmUgLSBjdXJyZW50X2JpZC5hbW91bnQubmF0aXZlCiAgICBmcmFtZV9kaWcgLTIKICAgIGJ0b2kKICAgIGZyYW1lX2RpZyA1CiAgICBwdXNoaW50IDMyIC8vIDMyCiAgICBleHRyYWN0X3VpbnQ2NAogICAgLQogICAgaW50Y18wIC8vIDAKICAgIGZyYW1lX2J1cnkgMAogICAgZnJhbWVfYnVyeSAxCiAgICByZXRzdWIKCm91dGJpZF9hZnRlcl9pZl9lbHNlQDU6CiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weTo2MTkKICAgIC8vIGlmIGV4aXN0czoKICAgIGZyYW1lX2RpZyA0CiAgICBieiBvdXRiaWRfYWZ0ZXJfaWZfZWxzZUA3CiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weTo2MjAKICAgIC8vIHNlbGYuZGVwb3NpdGVkW2N1cnJlbnRfYmlkLmJpZGRlci5uYXRpdmVdICs9IHNlbGYucmVsZWFzZV9iaWQoCiAgICBmcmFtZV9kaWcgNQogICAgZHVwCiAgICBleHRyYWN0IDAgMzIgLy8gb24gZXJyb3I6IEluZGV4IGFjY2VzcyBpcyBvdXQgb2YgYm91bmRzCiAgICBieXRlY18wIC8vICJkZXBvc2l0ZWQiCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGR1cAogICAgYm94X2dldAogICAgc3dhcAogICAgYnRvaQogICAgc3dhcAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuZGVwb3NpdGVkIGVudHJ5IGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2UvY29udHJhY3QucHk6NjIwLTYyMgogICAgLy8gc2VsZi5kZXBvc2l0ZWRbY3VycmVudF9iaWQuYmlkZGVyLm5hdGl2ZV0gKz0gc2VsZi5yZWxlYXNlX2JpZCgKICAgIC8vICAgICBzYWxlX2lkLCBjdXJyZW50X2JpZAogICAgLy8gKQogICAgZnJhbWVfZGlnIC0zCiAgICB1bmNvdmVyIDMKICAgIGNhbGxzdWIgcmVsZWFzZV9iaWQKICAgICsKICAgIGl0b2IKICAgIGJveF9wdXQKCm91dGJpZF9hZnRlcl9pZl9lbHNlQDc6CiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weTo2MjMKICAgIC8vIHJldHVybiBzZWxmLmJpZF9ib3hfbWJyKCksIG5ld19iaWRfYW1vdW50Lm5hdGl2ZQogICAgZnJhbWVfZGlnIC0yCiAgICBidG9pCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9zdWJyb3V0aW5lcy5weToyNi0yNwogICAgLy8gIyBUaGUgc2l6ZSBvZiBhIGJveCBpbmNsdWRlcyBpdHMgbmFtZSwga2V5IHByZWZpeCBpbmNsdWRlZC4KICAgIC8vIHJldHVybiBjc3QuQk9YX0ZMQVRfTUlOX0JBTEFOQ0UgKyBzaXplICogY3N0LkJPWF9CWVRFX01JTl9CQUxBTkNFCiAgICBpbnRjIDYgLy8gMjM3MDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjYyMwogICAgLy8gcmV0dXJuIHNlbGYuYmlkX2JveF9tYnIoKSwgbmV3X2JpZF9hbW91bnQubmF0aXZlCiAgICBmcmFtZV9idXJ5IDAKICAgIGZyYW1lX2J1cnkgMQogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLmRpZ2l0YWxfbWFya2V0cGxhY2UuY29udHJhY3QuRGlnaXRhbE1hcmtldHBsYWNlLnJlY29yZF9iaWQoc2FsZV9pZDogYnl0ZXMsIG5ld19iaWRfYW1vdW50OiBieXRlcykgLT4gdWludDY0LCB1aW50NjQ6CnJlY29yZF9iaWQ6CiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weTo2MjUtNjI4CiAgICAvLyBAc3Vicm91dGluZQogICAgLy8gZGVmIHJlY29yZF9iaWQoCiAgICAvLyAgICAgc2VsZiwgc2FsZV9pZDogYXJjNC5VSW50NjQsIG5ld19iaWRfYW1vdW50OiBhcmM0LlVJbnQ2NAogICAgLy8gKSAtPiB0dXBsZVtVSW50NjQsIFVJbnQ2NF06CiAgICBwcm90byAyIDIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjYyOS02MzIKICAgIC8vICMgV3JpdGVzIHRoZSByZWNlaXB0IG9mIHRoZSBuZXcgYmlkIGluIHRoZSByZWNlaXB0IGJvb2sgb2YgdGhlIGNhbGxlci4KICAgIC8vICMgUmV0dXJucyB0aGUgTUJSIG9mIHRoZSByZWNlaXB0IHRoYXQgdGhlIGNhbGxlciBoYXMgdG8gcGF5IGFuZCB0aGUgYW1vdW50IG9mCiAgICAvLyAjICB0aGUgcmVjZWlwdCBpdCBvdmVyd3JvdGUuCiAgICAvLyByZWNlaXB0X2Jvb2ssIHBhZ2UgPSBzZWxmLnJlY2VpcHRfYm9va19vZihUeG4uc2VuZGVyLCBzYWxlX2lkKQogICAgdHhuIFNlbmRlcgogICAgZnJhbWVfZGlnIC0yCiAgICBjYWxsc3ViIHJlY2VpcHRfYm9va19vZgogICAgc3dhcAogICAgZHVwCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weTo2MzMKICAgIC8vIGlmIG5vdCByZWNlaXB0X2Jvb2s6CiAgICBib3hfbGVuCiAgICBidXJ5IDEKICAgIGJueiByZWNvcmRfYmlkX2FmdGVyX2lmX2Vsc2VAMgogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2UvY29udHJhY3QucHk6NjM0CiAgICAvLyBfY3JlYXRlZCA9IHJlY2VpcHRfYm9vay5jcmVhdGUoc2l6ZT1jc3QuQVJSQVlfSEVBREVSX1NJWkUpCiAgICBmcmFtZV9kaWcgMQogICAgaW50Y18yIC8vIDIKICAgIGJveF9jcmVhdGUKICAgIHBvcAoKcmVjb3JkX2JpZF9hZnRlcl9pZl9lbHNlQDI6CiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weTo2MzUKICAgIC8vIG5ld19iaWRfcmVjZWlwdCA9IEJpZFJlY2VpcHQoc2FsZV9pZCwgbmV3X2JpZF9hbW91bnQpCiAgICBmcmFtZV9kaWcgLTIKICAgIGZyYW1lX2RpZyAtMQogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weTo2MzcKICAgIC8vIGZvdW5kLCBpbmRleCA9IGZpbmRfYmlkX3JlY2VpcHQocmVjZWlwdF9ib29rLCBzYWxlX2lkKQogICAgZnJhbWVfZGlnIDEKICAgIGZyYW1lX2RpZyAtMgogICAgY2FsbHN1YiBmaW5kX2JpZF9yZWNlaXB0CiAgICBjb3ZlciAyCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weTo2MzgKICAgIC8vIGlmIGZvdW5kOgogICAgYnogcmVjb3JkX2JpZF9hZnRlcl9pZl9lbHNlQDQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL3N1YnJvdXRpbmVzLnB5OjQwCiAgICAvLyByZXR1cm4gY3N0LkFSUkFZX0hFQURFUl9TSVpFICsgaW5kZXggKiBjc3QuQklEX1JFQ0VJUFRfU0laRQogICAgc3dhcAogICAgaW50Y18zIC8vIDE2CiAgICAqCiAgICBpbnRjXzIgLy8gMgogICAgKwogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2Uvc3Vicm91dGluZXMucHk6NTMtNTUKICAgIC8vIHJldHVybiBCaWRSZWNlaXB0LmZyb21fYnl0ZXMoCiAgICAvLyAgICAgcmVjZWlwdF9ib29rLmV4dHJhY3QocmVjZWlwdF9vZmZzZXQoaW5kZXgpLCBjc3QuQklEX1JFQ0VJUFRfU0laRSkKICAgIC8vICkKICAgIGZyYW1lX2RpZyAxCiAgICBkdXAKICAgIGNvdmVyIDIKICAgIGRpZyAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9zdWJyb3V0aW5lcy5weTo1NAogICAgLy8gcmVjZWlwdF9ib29rLmV4dHJhY3QocmVjZWlwdF9vZmZzZXQoaW5kZXgpLCBjc3QuQklEX1JFQ0VJUFRfU0laRSkKICAgIGludGNfMyAvLyAxNgogICAgYm94X2V4dHJhY3QKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjYzOQogICAgLy8gb3ZlcndyaXR0ZW5fYW1vdW50ID0gcmVhZF9yZWNlaXB0KHJlY2VpcHRfYm9vaywgaW5kZXgpLmFtb3VudC5uYXRpdmUKICAgIHB1c2hpbnQgOCAvLyA4CiAgICBleHRyYWN0X3VpbnQ2NAogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2Uvc3Vicm91dGluZXMucHk6NjAKICAgIC8vIHJlY2VpcHRfYm9vay5yZXBsYWNlKHJlY2VpcHRfb2Zmc2V0KGluZGV4KSwgcmVjZWlwdC5ieXRlcykKICAgIGNvdmVyIDIKICAgIHVuY292ZXIgMwogICAgYm94X3JlcGxhY2UKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjY0MQogICAgLy8gcmV0dXJuIFVJbnQ2NCgwKSwgb3ZlcndyaXR0ZW5fYW1vdW50CiAgICBpbnRjXzAgLy8gMAogICAgc3dhcAogICAgdW5jb3ZlciAzCiAgICB1bmNvdmVyIDMKICAgIHJldHN1YgoKcmVjb3JkX2JpZF9hZnRlcl9pZl9lbHNlQDQ6CiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9zdWJyb3V0aW5lcy5weTozNQogICAgLy8gcmV0dXJuIG9wLmJ0b2kocmVjZWlwdF9ib29rLmV4dHJhY3QoMCwgY3N0LkFSUkFZX0hFQURFUl9TSVpFKSkKICAgIGZyYW1lX2RpZyAxCiAgICBkdXAKICAgIGludGNfMCAvLyAwCiAgICBpbnRjXzIgLy8gMgogICAgYm94X2V4dHJhY3QKICAgIGJ0b2kKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL3N1YnJvdXRpbmVzLnB5OjY3CiAgICAvLyByZWNlaXB0X2Jvb2sucmVzaXplKHJlY2VpcHRfb2Zmc2V0KG5fcmVjZWlwdHMgKyAxKSkKICAgIGludGNfMSAvLyAxCiAgICArCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9zdWJyb3V0aW5lcy5weTo0MAogICAgLy8gcmV0dXJuIGNzdC5BUlJBWV9IRUFERVJfU0laRSArIGluZGV4ICogY3N0LkJJRF9SRUNFSVBUX1NJWkUKICAgIGR1cAogICAgaW50Y18zIC8vIDE2CiAgICAqCiAgICBpbnRjXzIgLy8gMgogICAgKwogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2Uvc3Vicm91dGluZXMucHk6NjcKICAgIC8vIHJlY2VpcHRfYm9vay5yZXNpemUocmVjZWlwdF9vZmZzZXQobl9yZWNlaXB0cyArIDEpKQogICAgZGlnIDIKICAgIHN3YXAKICAgIGJveF9yZXNpemUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL3N1YnJvdXRpbmVzLnB5OjQwCiAgICAvLyByZXR1cm4gY3N0LkFSUkFZX0hFQURFUl9TSVpFICsgaW5kZXggKiBjc3QuQklEX1JFQ0VJUFRfU0laRQogICAgdW5jb3ZlciAzCiAgICBpbnRjXzMgLy8gMTYKICAgICoKICAgIGludGNfMiAvLyAyCiAgICArCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9zdWJyb3V0aW5lcy5weTo2OAogICAgLy8gcmVjZWlwdF9ib29rLnNwbGljZShyZWNlaXB0X29mZnNldChpbmRleCksIDAsIHJlY2VpcHQuYnl0ZXMpCiAgICBkaWcgMgogICAgc3dhcAogICAgaW50Y18wIC8vIDAKICAgIHVuY292ZXIgNQogICAgYm94X3NwbGljZQogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2Uvc3Vicm91dGluZXMucHk6NjkKICAgIC8vIHJlY2VpcHRfYm9vay5yZXBsYWNlKDAsIGFyYzQuVUludDE2KG5fcmVjZWlwdHMgKyAxKS5ieXRlcykKICAgIGl0b2IKICAgIGR1cAogICAgYml0bGVuCiAgICBpbnRjXzMgLy8gMTYKICAgIDw9CiAgICBhc3NlcnQgLy8gb3ZlcmZsb3cKICAgIGV4dHJhY3QgNiAyCiAgICBkaWcgMQogICAgaW50Y18wIC8vIDAKICAgIHVuY292ZXIgMgogICAgYm94X3JlcGxhY2UKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL3N1YnJvdXRpbmVzLnB5OjM1CiAgICAvLyByZXR1cm4gb3AuYnRvaShyZWNlaXB0X2Jvb2suZXh0cmFjdCgwLCBjc3QuQVJSQVlfSEVBREVSX1NJWkUpKQogICAgZHVwCiAgICBpbnRjXzAgLy8gMAogICAgaW50Y18yIC8vIDIKICAgIGJveF9leHRyYWN0CiAgICBidG9pCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weTo2NDUKICAgIC8vIHNlbGYuY291bnRfcGFnZV9yZWNlaXB0cyhUeG4uc2VuZGVyLCBwYWdlLCBuX3JlY2VpcHRzKQogICAgdHhuIFNlbmRlcgogICAgZnJhbWVfZGlnIDAKICAgIGRpZyAyCiAgICBjYWxsc3ViIGNvdW50X3BhZ2VfcmVjZWlwdHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjY0NwogICAgLy8gcmVjZWlwdF9ib29rX21icihyZWNlaXB0X2Jvb2ssIG5fcmVjZWlwdHMpCiAgICBkdXAyCiAgICBjYWxsc3ViIHJlY2VpcHRfYm9va19tYnIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjY0OAogICAgLy8gLSByZWNlaXB0X2Jvb2tfbWJyKHJlY2VpcHRfYm9vaywgbl9yZWNlaXB0cyAtIDEpLAogICAgc3dhcAogICAgaW50Y18xIC8vIDEKICAgIC0KICAgIHVuY292ZXIgMgogICAgc3dhcAogICAgY2FsbHN1YiByZWNlaXB0X2Jvb2tfbWJyCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weTo2NDctNjQ4CiAgICAvLyByZWNlaXB0X2Jvb2tfbWJyKHJlY2VpcHRfYm9vaywgbl9yZWNlaXB0cykKICAgIC8vIC0gcmVjZWlwdF9ib29rX21icihyZWNlaXB0X2Jvb2ssIG5fcmVjZWlwdHMgLSAxKSwKICAgIC0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjY0OQogICAgLy8gVUludDY0KDApLAogICAgaW50Y18wIC8vIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjY0Ni02NTAKICAgIC8vIHJldHVybiAoCiAgICAvLyAgICAgcmVjZWlwdF9ib29rX21icihyZWNlaXB0X2Jvb2ssIG5fcmVjZWlwdHMpCiAgICAvLyAgICAgLSByZWNlaXB0X2Jvb2tfbWJyKHJlY2VpcHRfYm9vaywgbl9yZWNlaXB0cyAtIDEpLAogICAgLy8gICAgIFVJbnQ2NCgwKSwKICAgIC8vICkKICAgIHVuY292ZXIgMwogICAgdW5jb3ZlciAzCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuZGlnaXRhbF9tYXJrZXRwbGFjZS5jb250cmFjdC5EaWdpdGFsTWFya2V0cGxhY2UuYmlkKHNhbGVfa2V5OiBieXRlcywgbmV3X2JpZF9hbW91bnQ6IGJ5dGVzKSAtPiB2b2lkOgpiaWQ6CiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weTo2NTItNjUzCiAgICAvLyBAYWJpbWV0aG9kCiAgICAvLyBkZWYgYmlkKHNlbGYsIHNhbGVfa2V5OiBTYWxlS2V5LCBuZXdfYmlkX2Ftb3VudDogYXJjNC5VSW50NjQpIC0+IE5vbmU6CiAgICBwcm90byAyIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL3N1YnJvdXRpbmVzLnB5OjE5MgogICAgLy8gb3AuZXh0cmFjdChvcC5zaGEyNTYoa2V5LmJ5dGVzKSwgMCwgY3N0LlNBTEVfSURfTEVOR1RIKQogICAgZnJhbWVfZGlnIC0yCiAgICBzaGEyNTYKICAgIGV4dHJhY3QgMCA4CiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weTo2NTUtNjU3CiAgICAvLyBiaWRfYm94X21iciwgd2lubmluZyA9IHNlbGYub3V0YmlkKAogICAgLy8gICAgIHNhbGVfa2V5LCBzYWxlX2lkLCBuZXdfYmlkX2Ftb3VudCwgaXNvbGF0ZWQ9RmFsc2UKICAgIC8vICkKICAgIGZyYW1lX2RpZyAtMgogICAgZGlnIDEKICAgIGZyYW1lX2RpZyAtMQogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2UvY29udHJhY3QucHk6NjU2CiAgICAvLyBzYWxlX2tleSwgc2FsZV9pZCwgbmV3X2JpZF9hbW91bnQsIGlzb2xhdGVkPUZhbHNlCiAgICBpbnRjXzAgLy8gMAogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2UvY29udHJhY3QucHk6NjU1LTY1NwogICAgLy8gYmlkX2JveF9tYnIsIHdpbm5pbmcgPSBzZWxmLm91dGJpZCgKICAgIC8vICAgICBzYWxlX2tleSwgc2FsZV9pZCwgbmV3X2JpZF9hbW91bnQsIGlzb2xhdGVkPUZhbHNlCiAgICAvLyApCiAgICBjYWxsc3ViIG91dGJpZAogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2UvY29udHJhY3QucHk6NjU4CiAgICAvLyByZWNlaXB0X21iciwgb3ZlcndyaXR0ZW5fYW1vdW50ID0gc2VsZi5yZWNvcmRfYmlkKHNhbGVfaWQsIG5ld19iaWRfYW1vdW50KQogICAgdW5jb3ZlciAyCiAgICBmcmFtZV9kaWcgLTEKICAgIGNhbGxzdWIgcmVjb3JkX2JpZAogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2UvY29udHJhY3QucHk6NjYxCiAgICAvLyBUeG4uc2VuZGVyLCBuZXdfYmlkX2Ftb3VudC5uYXRpdmUsIG92ZXJ3cml0dGVuX2Ftb3VudCwgd2lubmluZwogICAgdHhuIFNlbmRlcgogICAgZnJhbWVfZGlnIC0xCiAgICBidG9pCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weTo2NjAtNjYyCiAgICAvLyBtYnJfZGlmZiA9IHJlY2VpcHRfbWJyICsgc2VsZi5hZGRfYmlkX3RvdGFscygKICAgIC8vICAgICBUeG4uc2VuZGVyLCBuZXdfYmlkX2Ftb3VudC5uYXRpdmUsIG92ZXJ3cml0dGVuX2Ftb3VudCwgd2lubmluZwogICAgLy8gKQogICAgc3dhcAogICAgZGlnIDEKICAgIGRpZyAzCiAgICB1bmNvdmVyIDYKICAgIGNhbGxzdWIgYWRkX2JpZF90b3RhbHMKICAgIHVuY292ZXIgMwogICAgKwogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2UvY29udHJhY3QucHk6NjY2CiAgICAvLyBUeG4uc2VuZGVyLAogICAgdHhuIFNlbmRlcgogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2UvY29udHJhY3QucHk6NjY4CiAgICAvLyBuZXdfYmlkX2Ftb3VudC5uYXRpdmUgKyBiaWRfYm94X21iciArIG1icl9kaWZmLAogICAgdW5jb3ZlciAyCiAgICB1bmNvdmVyIDQKICAgICsKICAgIHVuY292ZXIgMgogICAgKwogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2UvY29udHJhY3QucHk6NjY0LTY2OQogICAgLy8gIyBUaGUgb3ZlcndyaXR0ZW4gcmVjZWlwdCBpcyBnaXZlbiBiYWNrIGJlZm9yZSB0aGUgbmV3IGJpZCBpcyB0YWtlbi4KICAgIC8vIHNlbGYuc2V0dGxlKAogICAgLy8gICAgIFR4bi5zZW5kZXIsCiAgICAvLyAgICAgb3ZlcndyaXR0ZW5fYW1vdW50LAogICAgLy8gICAgIG5ld19iaWRfYW1vdW50Lm5hdGl2ZSArIGJpZF9ib3hfbWJyICsgbWJyX2RpZmYsCiAgICAvLyApCiAgICBzd2FwCiAgICBjb3ZlciAyCiAgICBjYWxsc3ViIHNldHRsZQogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLmRpZ2l0YWxfbWFya2V0cGxhY2UuY29udHJhY3QuRGlnaXRhbE1hcmtldHBsYWNlLmJpZF9tYW55KHNhbGVfa2V5czogYnl0ZXMsIGFtb3VudHM6IGJ5dGVzKSAtPiB2b2lkOgpiaWRfbWFueToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjY3MS02NzYKICAgIC8vIEBhYmltZXRob2QKICAgIC8vIGRlZiBiaWRfbWFueSgKICAgIC8vICAgICBzZWxmLAogICAgLy8gICAgIHNhbGVfa2V5czogYXJjNC5EeW5hbWljQXJyYXlbU2FsZUtleV0sCiAgICAvLyAgICAgYW1vdW50czogYXJjNC5EeW5hbWljQXJyYXlbYXJjNC5VSW50NjRdLAogICAgLy8gKSAtPiBOb25lOgogICAgcHJvdG8gMiAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weTo2NzcKICAgIC8vIGFzc2VydCBzYWxlX2tleXMubGVuZ3RoID09IGFtb3VudHMubGVuZ3RoLCBlcnIuTEVOR1RIX01JU01BVENICiAgICBmcmFtZV9kaWcgLTIKICAgIGludGNfMCAvLyAwCiAgICBleHRyYWN0X3VpbnQxNgogICAgZHVwCiAgICBmcmFtZV9kaWcgLTEKICAgIGludGNfMCAvLyAwCiAgICBleHRyYWN0X3VpbnQxNgogICAgPT0KICAgIGFzc2VydCAvLyBMZW5ndGggbWlzbWF0Y2gKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjY3OQogICAgLy8gb3ZlcndyaXR0ZW5fYW1vdW50ID0gVUludDY0KDApCiAgICBpbnRjXzAgLy8gMAogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2UvY29udHJhY3QucHk6NjgwLTY4MwogICAgLy8gbmV3X2JpZHNfYW1vdW50ID0gVUludDY0KDApCiAgICAvLyBtYnJfZGlmZiA9IFVJbnQ2NCgwKQogICAgLy8gd2lubmluZyA9IFVJbnQ2NCgwKQogICAgLy8gZm9yIGkgaW4gdXJhbmdlKHNhbGVfa2V5cy5sZW5ndGgpOgogICAgZHVwbiA0CgpiaWRfbWFueV9mb3JfaGVhZGVyQDE6CiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weTo2ODMKICAgIC8vIGZvciBpIGluIHVyYW5nZShzYWxlX2tleXMubGVuZ3RoKToKICAgIGZyYW1lX2RpZyA1CiAgICBmcmFtZV9kaWcgMAogICAgPAogICAgYnogYmlkX21hbnlfYWZ0ZXJfZm9yQDQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjY4NAogICAgLy8gc2FsZV9pZCA9IHNhbGVfaWRfb2Yoc2FsZV9rZXlzW2ldKQogICAgZnJhbWVfZGlnIC0yCiAgICBleHRyYWN0IDIgMAogICAgZnJhbWVfZGlnIDUKICAgIGR1cAogICAgY292ZXIgMgogICAgcHVzaGludCA0MCAvLyA0MAogICAgKgogICAgcHVzaGludCA0MCAvLyA0MAogICAgZXh0cmFjdDMgLy8gb24gZXJyb3I6IEluZGV4IGFjY2VzcyBpcyBvdXQgb2YgYm91bmRzCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9zdWJyb3V0aW5lcy5weToxOTIKICAgIC8vIG9wLmV4dHJhY3Qob3Auc2hhMjU2KGtleS5ieXRlcyksIDAsIGNzdC5TQUxFX0lEX0xFTkdUSCkKICAgIGR1cAogICAgc2hhMjU2CiAgICBleHRyYWN0IDAgOAogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2UvY29udHJhY3QucHk6Njg2CiAgICAvLyBzYWxlX2tleXNbaV0sIHNhbGVfaWQsIGFtb3VudHNbaV0sIGlzb2xhdGVkPUZhbHNlCiAgICBmcmFtZV9kaWcgLTEKICAgIGV4dHJhY3QgMiAwCiAgICBkaWcgMwogICAgcHVzaGludCA4IC8vIDgKICAgICoKICAgIGR1cDIKICAgIHB1c2hpbnQgOCAvLyA4CiAgICBleHRyYWN0MyAvLyBvbiBlcnJvcjogSW5kZXggYWNjZXNzIGlzIG91dCBvZiBib3VuZHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjY4NS02ODcKICAgIC8vIGJpZF9ib3hfbWJyLCBiaWRfd2lubmluZyA9IHNlbGYub3V0YmlkKAogICAgLy8gICAgIHNhbGVfa2V5c1tpXSwgc2FsZV9pZCwgYW1vdW50c1tpXSwgaXNvbGF0ZWQ9RmFsc2UKICAgIC8vICkKICAgIHVuY292ZXIgNAogICAgZGlnIDQKICAgIGRpZyAyCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weTo2ODYKICAgIC8vIHNhbGVfa2V5c1tpXSwgc2FsZV9pZCwgYW1vdW50c1tpXSwgaXNvbGF0ZWQ9RmFsc2UKICAgIGludGNfMCAvLyAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weTo2ODUtNjg3CiAgICAvLyBiaWRfYm94X21iciwgYmlkX3dpbm5pbmcgPSBzZWxmLm91dGJpZCgKICAgIC8vICAgICBzYWxlX2tleXNbaV0sIHNhbGVfaWQsIGFtb3VudHNbaV0sIGlzb2xhdGVkPUZhbHNlCiAgICAvLyApCiAgICBjYWxsc3ViIG91dGJpZAogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2UvY29udHJhY3QucHk6Njg4LTY5MAogICAgLy8gcmVjZWlwdF9tYnIsIG92ZXJ3cml0dGVuX3JlY2VpcHRfYW1vdW50ID0gc2VsZi5yZWNvcmRfYmlkKAogICAgLy8gICAgIHNhbGVfaWQsIGFtb3VudHNbaV0KICAgIC8vICkKICAgIHVuY292ZXIgNQogICAgdW5jb3ZlciAzCiAgICBjYWxsc3ViIHJlY29yZF9iaWQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjY5MQogICAgLy8gbWJyX2RpZmYgKz0gYmlkX2JveF9tYnIgKyByZWNlaXB0X21icgogICAgdW5jb3ZlciAzCiAgICB1bmNvdmVyIDIKICAgICsKICAgIGZyYW1lX2RpZyAzCiAgICArCiAgICBmcmFtZV9idXJ5IDMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjY5MgogICAgLy8gd2lubmluZyArPSBiaWRfd2lubmluZwogICAgZnJhbWVfZGlnIDQKICAgIHVuY292ZXIgMgogICAgKwogICAgZnJhbWVfYnVyeSA0CiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weTo2OTMKICAgIC8vIG92ZXJ3cml0dGVuX2Ftb3VudCArPSBvdmVyd3JpdHRlbl9yZWNlaXB0X2Ftb3VudAogICAgZnJhbWVfZGlnIDEKICAgICsKICAgIGZyYW1lX2J1cnkgMQogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2UvY29udHJhY3QucHk6Njk0CiAgICAvLyBuZXdfYmlkc19hbW91bnQgKz0gYW1vdW50c1tpXS5uYXRpdmUKICAgIGV4dHJhY3RfdWludDY0CiAgICBmcmFtZV9kaWcgMgogICAgKwogICAgZnJhbWVfYnVyeSAyCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weTo2ODMKICAgIC8vIGZvciBpIGluIHVyYW5nZShzYWxlX2tleXMubGVuZ3RoKToKICAgIGludGNfMSAvLyAxCiAgICArCiAgICBmcmFtZV9idXJ5IDUKICAgIGIgYmlkX21hbnlfZm9yX2hlYWRlckAxCgpiaWRfbWFueV9hZnRlcl9mb3JANDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjY5NwogICAgLy8gVHhuLnNlbmRlciwgbmV3X2JpZHNfYW1vdW50LCBvdmVyd3JpdHRlbl9hbW91bnQsIHdpbm5pbmcKICAgIHR4biBTZW5kZXIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjY5Ni02OTgKICAgIC8vIG1icl9kaWZmICs9IHNlbGYuYWRkX2JpZF90b3RhbHMoCiAgICAvLyAgICAgVHhuLnNlbmRlciwgbmV3X2JpZHNfYW1vdW50LCBvdmVyd3JpdHRlbl9hbW91bnQsIHdpbm5pbmcKICAgIC8vICkKICAgIGZyYW1lX2RpZyAyCiAgICBkdXAKICAgIGNvdmVyIDIKICAgIGZyYW1lX2RpZyAxCiAgICBkdXAKICAgIGNvdmVyIDQKICAgIGZyYW1lX2RpZyA0CiAgICBjYWxsc3ViIGFkZF9iaWRfdG90YWxzCiAgICBmcmFtZV9kaWcgMwogICAgKwogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2UvY29udHJhY3QucHk6NzAwCiAgICAvLyBzZWxmLnNldHRsZShUeG4uc2VuZGVyLCBvdmVyd3JpdHRlbl9hbW91bnQsIG5ld19iaWRzX2Ftb3VudCArIG1icl9kaWZmKQogICAgdHhuIFNlbmRlcgogICAgY292ZXIgMgogICAgKwogICAgc3dhcAogICAgY292ZXIgMgogICAgY2FsbHN1YiBzZXR0bGUKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5kaWdpdGFsX21hcmtldHBsYWNlLmNvbnRyYWN0LkRpZ2l0YWxNYXJrZXRwbGFjZS5pc29sYXRlZF9iaWQoc2FsZV9rZXk6IGJ5dGVzLCBuZXdfYmlkX2Ftb3VudDogYnl0ZXMpIC0+IHZvaWQ6Cmlzb2xhdGVkX2JpZDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjcwMi03MDMKICAgIC8vIEBhYmltZXRob2QKICAgIC8vIGRlZiBpc29sYXRlZF9iaWQoc2VsZiwgc2FsZV9rZXk6IFNhbGVLZXksIG5ld19iaWRfYW1vdW50OiBhcmM0LlVJbnQ2NCkgLT4gTm9uZToKICAgIHByb3RvIDIgMAogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2Uvc3Vicm91dGluZXMucHk6MTkyCiAgICAvLyBvcC5leHRyYWN0KG9wLnNoYTI1NihrZXkuYnl0ZXMpLCAwLCBjc3QuU0FMRV9JRF9MRU5HVEgpCiAgICBmcmFtZV9kaWcgLTIKICAgIHNoYTI1NgogICAgZXh0cmFjdCAwIDgKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjcwNS03MDcKICAgIC8vIGJpZF9ib3hfbWJyLCB3aW5uaW5nID0gc2VsZi5vdXRiaWQoCiAgICAvLyAgICAgc2FsZV9rZXksIHNhbGVfaWQsIG5ld19iaWRfYW1vdW50LCBpc29sYXRlZD1UcnVlCiAgICAvLyApCiAgICBmcmFtZV9kaWcgLTIKICAgIGRpZyAxCiAgICBmcmFtZV9kaWcgLTEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjcwNgogICAgLy8gc2FsZV9rZXksIHNhbGVfaWQsIG5ld19iaWRfYW1vdW50LCBpc29sYXRlZD1UcnVlCiAgICBpbnRjXzEgLy8gMQogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2UvY29udHJhY3QucHk6NzA1LTcwNwogICAgLy8gYmlkX2JveF9tYnIsIHdpbm5pbmcgPSBzZWxmLm91dGJpZCgKICAgIC8vICAgICBzYWxlX2tleSwgc2FsZV9pZCwgbmV3X2JpZF9hbW91bnQsIGlzb2xhdGVkPVRydWUKICAgIC8vICkKICAgIGNhbGxzdWIgb3V0YmlkCiAgICBjb3ZlciAyCiAgICBzd2FwCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weTo3MDkKICAgIC8vIHJlY2VpcHRfa2V5ID0gaXNvbGF0ZWRfcmVjZWlwdF9rZXkoVHhuLnNlbmRlciwgc2FsZV9pZCkKICAgIHR4biBTZW5kZXIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL3N1YnJvdXRpbmVzLnB5OjE5OC0xOTkKICAgIC8vICMgUmVjZWlwdHMgb2YgdGhlIHNhbWUgYmlkZGVyIHNoYXJlIHRoZSBwcmVmaXggYW5kIGNhbiBiZSBsaXN0ZWQgb2ZmLWNoYWluLgogICAgLy8gcmV0dXJuIGJpZGRlci5ieXRlcyArIHNhbGVfaWQuYnl0ZXMKICAgIHN3YXAKICAgIGNvbmNhdAogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2UvY29udHJhY3QucHk6NzEwCiAgICAvLyBwcmV2aW91c19hbW91bnQsIGV4aXN0cyA9IHNlbGYuaXNvbGF0ZWRfcmVjZWlwdHMubWF5YmUocmVjZWlwdF9rZXkpCiAgICBieXRlYyA3IC8vIDB4NjkKICAgIHN3YXAKICAgIGNvbmNhdAogICAgZHVwCiAgICBib3hfZ2V0CiAgICBzd2FwCiAgICBidG9pCiAgICBzd2FwCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weTo3MTEKICAgIC8vIHJlY2VpcHRfYm94X21iciA9IFVJbnQ2NCgwKQogICAgaW50Y18wIC8vIDAKICAgIHN3YXAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjcxMgogICAgLy8gaWYgbm90IGV4aXN0czoKICAgIGJueiBpc29sYXRlZF9iaWRfYWZ0ZXJfaWZfZWxzZUAyCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9zdWJyb3V0aW5lcy5weToyNi0yNwogICAgLy8gIyBUaGUgc2l6ZSBvZiBhIGJveCBpbmNsdWRlcyBpdHMgbmFtZSwga2V5IHByZWZpeCBpbmNsdWRlZC4KICAgIC8vIHJldHVybiBjc3QuQk9YX0ZMQVRfTUlOX0JBTEFOQ0UgKyBzaXplICogY3N0LkJPWF9CWVRFX01JTl9CQUxBTkNFCiAgICBpbnRjIDUgLy8gMjIxMDAKICAgIGZyYW1lX2J1cnkgNAoKaXNvbGF0ZWRfYmlkX2FmdGVyX2lmX2Vsc2VAMjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjcxNQogICAgLy8gc2VsZi5pc29sYXRlZF9yZWNlaXB0c1tyZWNlaXB0X2tleV0gPSBuZXdfYmlkX2Ftb3VudC5uYXRpdmUKICAgIGZyYW1lX2RpZyAtMQogICAgYnRvaQogICAgZHVwCiAgICBpdG9iCiAgICBmcmFtZV9kaWcgMgogICAgc3dhcAogICAgYm94X3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2UvY29udHJhY3QucHk6NzE3CiAgICAvLyBUeG4uc2VuZGVyLCBuZXdfYmlkX2Ftb3VudC5uYXRpdmUsIHByZXZpb3VzX2Ftb3VudCwgd2lubmluZwogICAgdHhuIFNlbmRlcgogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2UvY29udHJhY3QucHk6NzE2LTcxOAogICAgLy8gcmVjZWlwdF9ib3hfbWJyICs9IHNlbGYuYWRkX2JpZF90b3RhbHMoCiAgICAvLyAgICAgVHhuLnNlbmRlciwgbmV3X2JpZF9hbW91bnQubmF0aXZlLCBwcmV2aW91c19hbW91bnQsIHdpbm5pbmcKICAgIC8vICkKICAgIGRpZyAxCiAgICBmcmFtZV9kaWcgMwogICAgZHVwCiAgICBjb3ZlciA0CiAgICBmcmFtZV9kaWcgMAogICAgY2FsbHN1YiBhZGRfYmlkX3RvdGFscwogICAgZnJhbWVfZGlnIDQKICAgICsKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjcyMQogICAgLy8gVHhuLnNlbmRlciwKICAgIHR4biBTZW5kZXIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjcyMwogICAgLy8gbmV3X2JpZF9hbW91bnQubmF0aXZlICsgYmlkX2JveF9tYnIgKyByZWNlaXB0X2JveF9tYnIsCiAgICB1bmNvdmVyIDIKICAgIGZyYW1lX2RpZyAxCiAgICArCiAgICB1bmNvdmVyIDIKICAgICsKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjcyMC03MjQKICAgIC8vIHNlbGYuc2V0dGxlKAogICAgLy8gICAgIFR4bi5zZW5kZXIsCiAgICAvLyAgICAgcHJldmlvdXNfYW1vdW50LAogICAgLy8gICAgIG5ld19iaWRfYW1vdW50Lm5hdGl2ZSArIGJpZF9ib3hfbWJyICsgcmVjZWlwdF9ib3hfbWJyLAogICAgLy8gKQogICAgc3dhcAogICAgY292ZXIgMgogICAgY2FsbHN1YiBzZXR0bGUKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5kaWdpdGFsX21hcmtldHBsYWNlLmNvbnRyYWN0LkRpZ2l0YWxNYXJrZXRwbGFjZS5pc19lbmN1bWJlcmVkKGJpZGRlcjogYnl0ZXMsIHNhbGVfaWQ6IGJ5dGVzKSAtPiB1aW50NjQ6CmlzX2VuY3VtYmVyZWQ6CiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weTo3MjYtNzI3CiAgICAvLyBAc3Vicm91dGluZQogICAgLy8gZGVmIGlzX2VuY3VtYmVyZWQoc2VsZiwgYmlkZGVyOiBBY2NvdW50LCBzYWxlX2lkOiBhcmM0LlVJbnQ2NCkgLT4gYm9vbDoKICAgIHByb3RvIDIgMQogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2UvY29udHJhY3QucHk6NzI4CiAgICAvLyBiZXN0X2JpZCwgZXhpc3RzID0gc2VsZi5iaWRzLm1heWJlKHNhbGVfaWQpCiAgICBieXRlYyA0IC8vICJiaWRzIgogICAgZnJhbWVfZGlnIC0xCiAgICBjb25jYXQKICAgIGJveF9nZXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjcyOQogICAgLy8gcmV0dXJuIGV4aXN0cyBhbmQgYmVzdF9iaWQuYmlkZGVyID09IGJpZGRlcgogICAgYnogaXNfZW5jdW1iZXJlZF9ib29sX2ZhbHNlQDMKICAgIGZyYW1lX2RpZyAwCiAgICBleHRyYWN0IDAgMzIgLy8gb24gZXJyb3I6IEluZGV4IGFjY2VzcyBpcyBvdXQgb2YgYm91bmRzCiAgICBmcmFtZV9kaWcgLTIKICAgID09CiAgICBieiBpc19lbmN1bWJlcmVkX2Jvb2xfZmFsc2VAMwogICAgaW50Y18xIC8vIDEKCmlzX2VuY3VtYmVyZWRfYm9vbF9tZXJnZUA0OgogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2UvY29udHJhY3QucHk6NzI5CiAgICAvLyByZXR1cm4gZXhpc3RzIGFuZCBiZXN0X2JpZC5iaWRkZXIgPT0gYmlkZGVyCiAgICBzd2FwCiAgICByZXRzdWIKCmlzX2VuY3VtYmVyZWRfYm9vbF9mYWxzZUAzOgogICAgaW50Y18wIC8vIDAKICAgIGIgaXNfZW5jdW1iZXJlZF9ib29sX21lcmdlQDQKCgovLyBzbWFydF9jb250cmFjdHMuZGlnaXRhbF9tYXJrZXRwbGFjZS5jb250cmFjdC5EaWdpdGFsTWFya2V0cGxhY2UuY2xhaW1fcmVjZWlwdHMoYmlkZGVyOiBieXRlcywgcmVjZWlwdF9ib29rOiBieXRlcywgbl9yZWNlaXB0czogdWludDY0KSAtPiB1aW50NjQsIHVpbnQ2NDoKY2xhaW1fcmVjZWlwdHM6CiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weTo3MzEtNzM0CiAgICAvLyBAc3Vicm91dGluZQogICAgLy8gZGVmIGNsYWltX3JlY2VpcHRzKAogICAgLy8gICAgIHNlbGYsIGJpZGRlcjogQWNjb3VudCwgcmVjZWlwdF9ib29rOiBCb3hSZWYsIG5fcmVjZWlwdHM6IFVJbnQ2NAogICAgLy8gKSAtPiB0dXBsZVtVSW50NjQsIFVJbnQ2NF06CiAgICBwcm90byAzIDIKICAgIGludGNfMCAvLyAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weTo3MzUtNzM3CiAgICAvLyAjIFJlbW92ZXMgdGhlIHVuZW5jdW1iZXJlZCByZWNlaXB0cyBvZiB0aGUgYmlkZGVyIGZyb20gdGhlaXIgcmVjZWlwdCBib29rLgogICAgLy8gIyBSZXR1cm5zIHRoZSBjbGFpbWVkIGFtb3VudCBhbmQgdGhlIG51bWJlciBvZiByZWNlaXB0cyBsZWZ0IGluIHRoZSBib29rLgogICAgLy8gZW5zdXJlX3JlY2VpcHRfbG9vcF9idWRnZXQobl9yZWNlaXB0cykKICAgIGZyYW1lX2RpZyAtMQogICAgY2FsbHN1YiBlbnN1cmVfcmVjZWlwdF9sb29wX2J1ZGdldAogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2UvY29udHJhY3QucHk6NzM5LTc0MQogICAgLy8gIyBFbmN1bWJlcmVkIHJlY2VpcHRzIGFyZSBjb21wYWN0ZWQgaW4gcGxhY2UgYXQgdGhlIHN0YXJ0IG9mIHRoZSBib29rLCBhbmQKICAgIC8vICMgIG9ubHkgdGhlIG9uZXMgdGhhdCBoYXZlIHRvIG1vdmUgYXJlIHdyaXR0ZW4uCiAgICAvLyBjbGFpbWVkID0gVUludDY0KDApCiAgICBpbnRjXzAgLy8gMAogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2UvY29udHJhY3QucHk6NzQyLTc0MwogICAgLy8gbl9lbmN1bWJlcmVkID0gVUludDY0KDApCiAgICAvLyBmb3IgaSBpbiB1cmFuZ2Uobl9yZWNlaXB0cyk6CiAgICBkdXBuIDIKCmNsYWltX3JlY2VpcHRzX2Zvcl9oZWFkZXJAMToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5Ojc0MwogICAgLy8gZm9yIGkgaW4gdXJhbmdlKG5fcmVjZWlwdHMpOgogICAgZnJhbWVfZGlnIDMKICAgIGZyYW1lX2RpZyAtMQogICAgPAogICAgYnogY2xhaW1fcmVjZWlwdHNfYWZ0ZXJfZm9yQDgKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL3N1YnJvdXRpbmVzLnB5OjQwCiAgICAvLyByZXR1cm4gY3N0LkFSUkFZX0hFQURFUl9TSVpFICsgaW5kZXggKiBjc3QuQklEX1JFQ0VJUFRfU0laRQogICAgZnJhbWVfZGlnIDMKICAgIGludGNfMyAvLyAxNgogICAgKgogICAgaW50Y18yIC8vIDIKICAgICsKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL3N1YnJvdXRpbmVzLnB5OjUzLTU1CiAgICAvLyByZXR1cm4gQmlkUmVjZWlwdC5mcm9tX2J5dGVzKAogICAgLy8gICAgIHJlY2VpcHRfYm9vay5leHRyYWN0KHJlY2VpcHRfb2Zmc2V0KGluZGV4KSwgY3N0LkJJRF9SRUNFSVBUX1NJWkUpCiAgICAvLyApCiAgICBmcmFtZV9kaWcgLTIKICAgIHN3YXAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL3N1YnJvdXRpbmVzLnB5OjU0CiAgICAvLyByZWNlaXB0X2Jvb2suZXh0cmFjdChyZWNlaXB0X29mZnNldChpbmRleCksIGNzdC5CSURfUkVDRUlQVF9TSVpFKQogICAgaW50Y18zIC8vIDE2CiAgICBib3hfZXh0cmFjdAogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2Uvc3Vicm91dGluZXMucHk6NTMtNTUKICAgIC8vIHJldHVybiBCaWRSZWNlaXB0LmZyb21fYnl0ZXMoCiAgICAvLyAgICAgcmVjZWlwdF9ib29rLmV4dHJhY3QocmVjZWlwdF9vZmZzZXQoaW5kZXgpLCBjc3QuQklEX1JFQ0VJUFRfU0laRSkKICAgIC8vICkKICAgIGR1cAogICAgZnJhbWVfYnVyeSAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weTo3NDUKICAgIC8vIGlmIG5vdCBzZWxmLmlzX2VuY3VtYmVyZWQoYmlkZGVyLCByZWNlaXB0LnNhbGVfaWQpOgogICAgZXh0cmFjdCAwIDggLy8gb24gZXJyb3I6IEluZGV4IGFjY2VzcyBpcyBvdXQgb2YgYm91bmRzCiAgICBmcmFtZV9kaWcgLTMKICAgIHN3YXAKICAgIGNhbGxzdWIgaXNfZW5jdW1iZXJlZAogICAgYm56IGNsYWltX3JlY2VpcHRzX2FmdGVyX2lmX2Vsc2VANAogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2UvY29udHJhY3QucHk6NzQ2CiAgICAvLyBjbGFpbWVkICs9IHJlY2VpcHQuYW1vdW50Lm5hdGl2ZQogICAgZnJhbWVfZGlnIDAKICAgIHB1c2hpbnQgOCAvLyA4CiAgICBleHRyYWN0X3VpbnQ2NAogICAgZnJhbWVfZGlnIDEKICAgICsKICAgIGZyYW1lX2J1cnkgMQoKY2xhaW1fcmVjZWlwdHNfZm9yX2Zvb3RlckA3OgogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2UvY29udHJhY3QucHk6NzQzCiAgICAvLyBmb3IgaSBpbiB1cmFuZ2Uobl9yZWNlaXB0cyk6CiAgICBmcmFtZV9kaWcgMwogICAgaW50Y18xIC8vIDEKICAgICsKICAgIGZyYW1lX2J1cnkgMwogICAgYiBjbGFpbV9yZWNlaXB0c19mb3JfaGVhZGVyQDEKCmNsYWltX3JlY2VpcHRzX2FmdGVyX2lmX2Vsc2VANDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5Ojc0OAogICAgLy8gaWYgbl9lbmN1bWJlcmVkICE9IGk6CiAgICBmcmFtZV9kaWcgMgogICAgZnJhbWVfZGlnIDMKICAgICE9CiAgICBieiBjbGFpbV9yZWNlaXB0c19hZnRlcl9pZl9lbHNlQDYKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL3N1YnJvdXRpbmVzLnB5OjQwCiAgICAvLyByZXR1cm4gY3N0LkFSUkFZX0hFQURFUl9TSVpFICsgaW5kZXggKiBjc3QuQklEX1JFQ0VJUFRfU0laRQogICAgZnJhbWVfZGlnIDIKICAgIGludGNfMyAvLyAxNgogICAgKgogICAgaW50Y18yIC8vIDIKICAgICsKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL3N1YnJvdXRpbmVzLnB5OjYwCiAgICAvLyByZWNlaXB0X2Jvb2sucmVwbGFjZShyZWNlaXB0X29mZnNldChpbmRleCksIHJlY2VpcHQuYnl0ZXMpCiAgICBmcmFtZV9kaWcgLTIKICAgIHN3YXAKICAgIGZyYW1lX2RpZyAwCiAgICBib3hfcmVwbGFjZQoKY2xhaW1fcmVjZWlwdHNfYWZ0ZXJfaWZfZWxzZUA2OgogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2UvY29udHJhY3QucHk6NzUwCiAgICAvLyBuX2VuY3VtYmVyZWQgKz0gMQogICAgZnJhbWVfZGlnIDIKICAgIGludGNfMSAvLyAxCiAgICArCiAgICBmcmFtZV9idXJ5IDIKICAgIGIgY2xhaW1fcmVjZWlwdHNfZm9yX2Zvb3RlckA3CgpjbGFpbV9yZWNlaXB0c19hZnRlcl9mb3JAODoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5Ojc1MgogICAgLy8gaWYgbl9lbmN1bWJlcmVkICE9IG5fcmVjZWlwdHM6CiAgICBmcmFtZV9kaWcgMgogICAgZnJhbWVfZGlnIC0xCiAgICAhPQogICAgYnogY2xhaW1fcmVjZWlwdHNfYWZ0ZXJfaWZfZWxzZUAxMAogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2UvY29udHJhY3QucHk6NzUzCiAgICAvLyB0cnVuY2F0ZV9yZWNlaXB0cyhyZWNlaXB0X2Jvb2ssIG5fZW5jdW1iZXJlZCkKICAgIGZyYW1lX2RpZyAtMgogICAgZnJhbWVfZGlnIDIKICAgIGNhbGxzdWIgdHJ1bmNhdGVfcmVjZWlwdHMKCmNsYWltX3JlY2VpcHRzX2FmdGVyX2lmX2Vsc2VAMTA6CiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weTo3NTQKICAgIC8vIHJldHVybiBjbGFpbWVkLCBuX2VuY3VtYmVyZWQKICAgIGZyYW1lX2RpZyAxCiAgICBmcmFtZV9kaWcgMgogICAgZnJhbWVfYnVyeSAxCiAgICBmcmFtZV9idXJ5IDAKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5kaWdpdGFsX21hcmtldHBsYWNlLmNvbnRyYWN0LkRpZ2l0YWxNYXJrZXRwbGFjZS5jbGFpbV91bmVuY3VtYmVyZWRfYmlkcygpIC0+IHZvaWQ6CmNsYWltX3VuZW5jdW1iZXJlZF9iaWRzOgogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2UvY29udHJhY3QucHk6NzYwCiAgICAvLyBzZWxmLnJlY2VpcHRfYm9vay5sZW5ndGgoVHhuLnNlbmRlcikgLSBjc3QuQVJSQVlfSEVBREVSX1NJWkUKICAgIGJ5dGVjXzMgLy8gInJlY2VpcHRfYm9vayIKICAgIHR4biBTZW5kZXIKICAgIGNvbmNhdAogICAgYm94X2xlbgogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYucmVjZWlwdF9ib29rIGVudHJ5IGV4aXN0cwogICAgaW50Y18yIC8vIDIKICAgIC0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5Ojc2MQogICAgLy8gKSAvLyBjc3QuQklEX1JFQ0VJUFRfU0laRQogICAgaW50Y18zIC8vIDE2CiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weTo3NTgtNzYxCiAgICAvLyAjIFRoZSBsZW5ndGggb2YgdGhlIGJveCBpcyByZWFkIGZpcnN0LCBmYWlsaW5nIGlmIHRoZXJlIGlzIG5vIHJlY2VpcHQgYm9vay4KICAgIC8vIG5fcmVjZWlwdHMgPSAoCiAgICAvLyAgICAgc2VsZi5yZWNlaXB0X2Jvb2subGVuZ3RoKFR4bi5zZW5kZXIpIC0gY3N0LkFSUkFZX0hFQURFUl9TSVpFCiAgICAvLyApIC8vIGNzdC5CSURfUkVDRUlQVF9TSVpFCiAgICAvCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weToyMjgKICAgIC8vIHJldHVybiBCb3hSZWYoa2V5PXNlbGYucmVjZWlwdF9ib29rLmtleV9wcmVmaXggKyBiaWRkZXIuYnl0ZXMpCiAgICBieXRlY18zIC8vICJyZWNlaXB0X2Jvb2siCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weTo3NjIKICAgIC8vIHJlY2VpcHRfYm9vayA9IHNlbGYucmVjZWlwdF9ib29rX2JveChUeG4uc2VuZGVyKQogICAgdHhuIFNlbmRlcgogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2UvY29udHJhY3QucHk6MjI4CiAgICAvLyByZXR1cm4gQm94UmVmKGtleT1zZWxmLnJlY2VpcHRfYm9vay5rZXlfcHJlZml4ICsgYmlkZGVyLmJ5dGVzKQogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weTo3NjQKICAgIC8vIFR4bi5zZW5kZXIsIHJlY2VpcHRfYm9vaywgbl9yZWNlaXB0cwogICAgdHhuIFNlbmRlcgogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2UvY29udHJhY3QucHk6NzYzLTc2NQogICAgLy8gY2xhaW1lZCwgbl9lbmN1bWJlcmVkID0gc2VsZi5jbGFpbV9yZWNlaXB0cygKICAgIC8vICAgICBUeG4uc2VuZGVyLCByZWNlaXB0X2Jvb2ssIG5fcmVjZWlwdHMKICAgIC8vICkKICAgIGRpZyAxCiAgICBkaWcgMwogICAgY2FsbHN1YiBjbGFpbV9yZWNlaXB0cwogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2UvY29udHJhY3QucHk6NzY3CiAgICAvLyBtYnJfZGlmZiA9IHJlY2VpcHRfYm9va19tYnIocmVjZWlwdF9ib29rLCBuX3JlY2VpcHRzKSAtIHJlY2VpcHRfYm9va19tYnIoCiAgICBkaWcgMgogICAgdW5jb3ZlciA0CiAgICBjYWxsc3ViIHJlY2VpcHRfYm9va19tYnIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5Ojc2Ny03NjkKICAgIC8vIG1icl9kaWZmID0gcmVjZWlwdF9ib29rX21icihyZWNlaXB0X2Jvb2ssIG5fcmVjZWlwdHMpIC0gcmVjZWlwdF9ib29rX21icigKICAgIC8vICAgICByZWNlaXB0X2Jvb2ssIG5fZW5jdW1iZXJlZAogICAgLy8gKQogICAgdW5jb3ZlciAzCiAgICB1bmNvdmVyIDIKICAgIGNhbGxzdWIgcmVjZWlwdF9ib29rX21icgogICAgLQogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2UvY29udHJhY3QucHk6NzcwCiAgICAvLyBzZWxmLnN1Yl9iaWRfdG90YWxzKFR4bi5zZW5kZXIsIGNsYWltZWQsIFVJbnQ2NCgwKSkKICAgIHR4biBTZW5kZXIKICAgIGRpZyAyCiAgICBpbnRjXzAgLy8gMAogICAgY2FsbHN1YiBzdWJfYmlkX3RvdGFscwogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2UvY29udHJhY3QucHk6NzcxCiAgICAvLyBzZWxmLmRlcG9zaXRlZFtUeG4uc2VuZGVyXSArPSBjbGFpbWVkICsgbWJyX2RpZmYKICAgIGJ5dGVjXzAgLy8gImRlcG9zaXRlZCIKICAgIHR4biBTZW5kZXIKICAgIGNvbmNhdAogICAgZHVwCiAgICBib3hfZ2V0CiAgICBzd2FwCiAgICBidG9pCiAgICBzd2FwCiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5kZXBvc2l0ZWQgZW50cnkgZXhpc3RzCiAgICB1bmNvdmVyIDMKICAgIHVuY292ZXIgMwogICAgKwogICAgKwogICAgaXRvYgogICAgYm94X3B1dAogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLmRpZ2l0YWxfbWFya2V0cGxhY2UuY29udHJhY3QuRGlnaXRhbE1hcmtldHBsYWNlLm9wZW5fcmVjZWlwdF9wYWdlcyhuX3BhZ2VzOiBieXRlcykgLT4gdm9pZDoKb3Blbl9yZWNlaXB0X3BhZ2VzOgogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2UvY29udHJhY3QucHk6NzczLTc3NAogICAgLy8gQGFiaW1ldGhvZAogICAgLy8gZGVmIG9wZW5fcmVjZWlwdF9wYWdlcyhzZWxmLCBuX3BhZ2VzOiBhcmM0LlVJbnQ2NCkgLT4gTm9uZToKICAgIHByb3RvIDEgMAogICAgaW50Y18wIC8vIDAKICAgIGR1cG4gMgogICAgYnl0ZWNfMSAvLyAiIgogICAgZHVwCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weTo3NzUtNzc4CiAgICAvLyAjIFNwbGl0cyB0aGUgcmVjZWlwdHMgb2YgdGhlIGNhbGxlciBhY3Jvc3Mgbl9wYWdlcyBwYWdlIGJveGVzLgogICAgLy8gIyBUaGUgbnVtYmVyIG9mIHBhZ2VzIGRlY2lkZXMgdGhlIHBhZ2Ugb2YgZXZlcnkgc2FsZSwgc28gaXQgY2FuIG9ubHkgYmUgY2hvc2VuCiAgICAvLyAjICBvbmNlIGFuZCBiZWZvcmUgYW55IHJlY2VpcHQgaXMgd3JpdHRlbiBpbiB0aGUgcmVjZWlwdCBib29rLgogICAgLy8gYXNzZXJ0IDAgPCBuX3BhZ2VzLm5hdGl2ZSA8PSBjc3QuTUFYX1JFQ0VJUFRfUEFHRVMsIGVyci5JTlZBTElEX1BBR0VfQ09VTlQKICAgIGZyYW1lX2RpZyAtMQogICAgYnRvaQogICAgZHVwCiAgICBieiBvcGVuX3JlY2VpcHRfcGFnZXNfYm9vbF9mYWxzZUAzCiAgICBmcmFtZV9kaWcgNQogICAgcHVzaGludCAyNTYgLy8gMjU2CiAgICA8PQogICAgYnogb3Blbl9yZWNlaXB0X3BhZ2VzX2Jvb2xfZmFsc2VAMwogICAgaW50Y18xIC8vIDEKCm9wZW5fcmVjZWlwdF9wYWdlc19ib29sX21lcmdlQDQ6CiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weTo3NzUtNzc4CiAgICAvLyAjIFNwbGl0cyB0aGUgcmVjZWlwdHMgb2YgdGhlIGNhbGxlciBhY3Jvc3Mgbl9wYWdlcyBwYWdlIGJveGVzLgogICAgLy8gIyBUaGUgbnVtYmVyIG9mIHBhZ2VzIGRlY2lkZXMgdGhlIHBhZ2Ugb2YgZXZlcnkgc2FsZSwgc28gaXQgY2FuIG9ubHkgYmUgY2hvc2VuCiAgICAvLyAjICBvbmNlIGFuZCBiZWZvcmUgYW55IHJlY2VpcHQgaXMgd3JpdHRlbiBpbiB0aGUgcmVjZWlwdCBib29rLgogICAgLy8gYXNzZXJ0IDAgPCBuX3BhZ2VzLm5hdGl2ZSA8PSBjc3QuTUFYX1JFQ0VJUFRfUEFHRVMsIGVyci5JTlZBTElEX1BBR0VfQ09VTlQKICAgIGFzc2VydCAvLyBJbnZhbGlkIHBhZ2UgY291bnQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5Ojc3OQogICAgLy8gYXNzZXJ0IFR4bi5zZW5kZXIgbm90IGluIHNlbGYucmVjZWlwdF9ib29rLCBlcnIuUkVDRUlQVF9CT09LX0lOX1VTRQogICAgYnl0ZWNfMyAvLyAicmVjZWlwdF9ib29rIgogICAgdHhuIFNlbmRlcgogICAgY29uY2F0CiAgICBib3hfbGVuCiAgICBidXJ5IDEKICAgICEKICAgIGFzc2VydCAvLyBSZWNlaXB0IGJvb2sgaW4gdXNlCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weTo3ODAKICAgIC8vIGFzc2VydCBub3Qgc2VsZi5yZWNlaXB0X3BhZ2VzX29mKFR4bi5zZW5kZXIpLCBlcnIuUkVDRUlQVF9CT09LX0lOX1VTRQogICAgdHhuIFNlbmRlcgogICAgY2FsbHN1YiByZWNlaXB0X3BhZ2VzX29mCiAgICAhCiAgICBhc3NlcnQgLy8gUmVjZWlwdCBib29rIGluIHVzZQogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2UvY29udHJhY3QucHk6MjMyCiAgICAvLyByZXR1cm4gQm94UmVmKGtleT1zZWxmLnJlY2VpcHRfcGFnZXMua2V5X3ByZWZpeCArIGJpZGRlci5ieXRlcykKICAgIGJ5dGVjIDkgLy8gInJlY2VpcHRfcGFnZXMiCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weTo3ODIKICAgIC8vIHJlY2VpcHRfcGFnZXMgPSBzZWxmLnJlY2VpcHRfcGFnZXNfYm94KFR4bi5zZW5kZXIpCiAgICB0eG4gU2VuZGVyCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weToyMzIKICAgIC8vIHJldHVybiBCb3hSZWYoa2V5PXNlbGYucmVjZWlwdF9wYWdlcy5rZXlfcHJlZml4ICsgYmlkZGVyLmJ5dGVzKQogICAgY29uY2F0CiAgICBkdXAKICAgIGZyYW1lX2J1cnkgMAogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2UvY29udHJhY3QucHk6NzgzCiAgICAvLyBoZWFkZXJfc2l6ZSA9IGNzdC5BUlJBWV9IRUFERVJfU0laRSArIG5fcGFnZXMubmF0aXZlICogY3N0LlVJTlQxNl9TSVpFCiAgICBmcmFtZV9kaWcgNQogICAgZHVwCiAgICBjb3ZlciAyCiAgICBpbnRjXzIgLy8gMgogICAgKgogICAgaW50Y18yIC8vIDIKICAgICsKICAgIGR1cAogICAgZnJhbWVfYnVyeSAzCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weTo3ODQKICAgIC8vIF9jcmVhdGVkID0gcmVjZWlwdF9wYWdlcy5jcmVhdGUoc2l6ZT1oZWFkZXJfc2l6ZSkKICAgIGRpZyAxCiAgICBzd2FwCiAgICBib3hfY3JlYXRlCiAgICBwb3AKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5Ojc4NQogICAgLy8gcmVjZWlwdF9wYWdlcy5yZXBsYWNlKDAsIGFyYzQuVUludDE2KG5fcGFnZXMubmF0aXZlKS5ieXRlcykKICAgIHN3YXAKICAgIGl0b2IKICAgIGR1cAogICAgYml0bGVuCiAgICBpbnRjXzMgLy8gMTYKICAgIDw9CiAgICBhc3NlcnQgLy8gb3ZlcmZsb3cKICAgIGV4dHJhY3QgNiAyCiAgICBkdXAKICAgIGZyYW1lX2J1cnkgMgogICAgaW50Y18wIC8vIDAKICAgIHN3YXAKICAgIGJveF9yZXBsYWNlCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weTo3ODctNzg5CiAgICAvLyAjIFRoZSBudW1iZXIgb2YgcGFnZXMgaXMgYWxzbyBrZXB0IGluIHRoZSB0b3RhbHMgb2YgdGhlIGJpZGRlciwgd2hpY2ggYXJlCiAgICAvLyAjICBjcmVhdGVkIGhlcmUgaWYgdGhlIGJpZGRlciBuZXZlciBiaWQuCiAgICAvLyB0b3RhbHMsIGV4aXN0cyA9IHNlbGYuYmlkX3RvdGFscy5tYXliZShUeG4uc2VuZGVyKQogICAgYnl0ZWMgNSAvLyAiYmlkX3RvdGFscyIKICAgIHR4biBTZW5kZXIKICAgIGNvbmNhdAogICAgYm94X2dldAogICAgc3dhcAogICAgZnJhbWVfYnVyeSAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weTo3OTAKICAgIC8vIHRvdGFsc19tYnIgPSBVSW50NjQoMCkKICAgIGludGNfMCAvLyAwCiAgICBmcmFtZV9idXJ5IDQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5Ojc5MQogICAgLy8gaWYgbm90IGV4aXN0czoKICAgIGJueiBvcGVuX3JlY2VpcHRfcGFnZXNfYWZ0ZXJfaWZfZWxzZUA2CiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weTo3OTIKICAgIC8vIHRvdGFscyA9IEJpZFRvdGFscyhhcmM0LlVJbnQ2NCgpLCBhcmM0LlVJbnQ2NCgpLCBhcmM0LlVJbnQxNigpKQogICAgYnl0ZWMgMTUgLy8gMHgwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAKICAgIGZyYW1lX2J1cnkgMQogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2Uvc3Vicm91dGluZXMucHk6MjYtMjcKICAgIC8vICMgVGhlIHNpemUgb2YgYSBib3ggaW5jbHVkZXMgaXRzIG5hbWUsIGtleSBwcmVmaXggaW5jbHVkZWQuCiAgICAvLyByZXR1cm4gY3N0LkJPWF9GTEFUX01JTl9CQUxBTkNFICsgc2l6ZSAqIGNzdC5CT1hfQllURV9NSU5fQkFMQU5DRQogICAgaW50YyA3IC8vIDI2NTAwCiAgICBmcmFtZV9idXJ5IDQKCm9wZW5fcmVjZWlwdF9wYWdlc19hZnRlcl9pZl9lbHNlQDY6CiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weTo3OTUKICAgIC8vIHRvdGFscy5jb21taXR0ZWQsIHRvdGFscy53aW5uaW5nLCBhcmM0LlVJbnQxNihuX3BhZ2VzLm5hdGl2ZSkKICAgIGZyYW1lX2RpZyAxCiAgICBkdXAKICAgIGV4dHJhY3QgMCA4IC8vIG9uIGVycm9yOiBJbmRleCBhY2Nlc3MgaXMgb3V0IG9mIGJvdW5kcwogICAgc3dhcAogICAgZXh0cmFjdCA4IDggLy8gb24gZXJyb3I6IEluZGV4IGFjY2VzcyBpcyBvdXQgb2YgYm91bmRzCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weTo3OTQtNzk2CiAgICAvLyBzZWxmLmJpZF90b3RhbHNbVHhuLnNlbmRlcl0gPSBCaWRUb3RhbHMoCiAgICAvLyAgICAgdG90YWxzLmNvbW1pdHRlZCwgdG90YWxzLndpbm5pbmcsIGFyYzQuVUludDE2KG5fcGFnZXMubmF0aXZlKQogICAgLy8gKQogICAgY29uY2F0CiAgICBmcmFtZV9kaWcgMgogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weTo3OTQKICAgIC8vIHNlbGYuYmlkX3RvdGFsc1tUeG4uc2VuZGVyXSA9IEJpZFRvdGFscygKICAgIGJ5dGVjIDUgLy8gImJpZF90b3RhbHMiCiAgICB0eG4gU2VuZGVyCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5Ojc5NC03OTYKICAgIC8vIHNlbGYuYmlkX3RvdGFsc1tUeG4uc2VuZGVyXSA9IEJpZFRvdGFscygKICAgIC8vICAgICB0b3RhbHMuY29tbWl0dGVkLCB0b3RhbHMud2lubmluZywgYXJjNC5VSW50MTYobl9wYWdlcy5uYXRpdmUpCiAgICAvLyApCiAgICBzd2FwCiAgICBib3hfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weTo3OTgKICAgIC8vIHNlbGYuZGVwb3NpdGVkW1R4bi5zZW5kZXJdIC09ICgKICAgIGJ5dGVjXzAgLy8gImRlcG9zaXRlZCIKICAgIHR4biBTZW5kZXIKICAgIGNvbmNhdAogICAgZHVwCiAgICBib3hfZ2V0CiAgICBzd2FwCiAgICBidG9pCiAgICBzd2FwCiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5kZXBvc2l0ZWQgZW50cnkgZXhpc3RzCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weTo3OTkKICAgIC8vIGJveF9tYnIocmVjZWlwdF9wYWdlcy5rZXkubGVuZ3RoICsgaGVhZGVyX3NpemUpICsgdG90YWxzX21icgogICAgZnJhbWVfZGlnIDAKICAgIGxlbgogICAgZnJhbWVfZGlnIDMKICAgICsKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL3N1YnJvdXRpbmVzLnB5OjI2LTI3CiAgICAvLyAjIFRoZSBzaXplIG9mIGEgYm94IGluY2x1ZGVzIGl0cyBuYW1lLCBrZXkgcHJlZml4IGluY2x1ZGVkLgogICAgLy8gcmV0dXJuIGNzdC5CT1hfRkxBVF9NSU5fQkFMQU5DRSArIHNpemUgKiBjc3QuQk9YX0JZVEVfTUlOX0JBTEFOQ0UKICAgIHB1c2hpbnQgNDAwIC8vIDQwMAogICAgKgogICAgcHVzaGludCAyNTAwIC8vIDI1MDAKICAgICsKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5Ojc5OQogICAgLy8gYm94X21icihyZWNlaXB0X3BhZ2VzLmtleS5sZW5ndGggKyBoZWFkZXJfc2l6ZSkgKyB0b3RhbHNfbWJyCiAgICBmcmFtZV9kaWcgNAogICAgKwogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2UvY29udHJhY3QucHk6Nzk4LTgwMAogICAgLy8gc2VsZi5kZXBvc2l0ZWRbVHhuLnNlbmRlcl0gLT0gKAogICAgLy8gICAgIGJveF9tYnIocmVjZWlwdF9wYWdlcy5rZXkubGVuZ3RoICsgaGVhZGVyX3NpemUpICsgdG90YWxzX21icgogICAgLy8gKQogICAgLQogICAgaXRvYgogICAgYm94X3B1dAogICAgcmV0c3ViCgpvcGVuX3JlY2VpcHRfcGFnZXNfYm9vbF9mYWxzZUAzOgogICAgaW50Y18wIC8vIDAKICAgIGIgb3Blbl9yZWNlaXB0X3BhZ2VzX2Jvb2xfbWVyZ2VANAoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5kaWdpdGFsX21hcmtldHBsYWNlLmNvbnRyYWN0LkRpZ2l0YWxNYXJrZXRwbGFjZS5jbGFpbV91bmVuY3VtYmVyZWRfYmlkc19vZl9wYWdlKHBhZ2U6IGJ5dGVzKSAtPiB2b2lkOgpjbGFpbV91bmVuY3VtYmVyZWRfYmlkc19vZl9wYWdlOgogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2UvY29udHJhY3QucHk6ODAyLTgwMwogICAgLy8gQGFiaW1ldGhvZAogICAgLy8gZGVmIGNsYWltX3VuZW5jdW1iZXJlZF9iaWRzX29mX3BhZ2Uoc2VsZiwgcGFnZTogYXJjNC5VSW50NjQpIC0+IE5vbmU6CiAgICBwcm90byAxIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjgwNC04MDUKICAgIC8vICMgU2FtZSBhcyBjbGFpbV91bmVuY3VtYmVyZWRfYmlkcyBmb3IgYSBzaW5nbGUgcGFnZSBvZiBhIHBhZ2VkIHJlY2VpcHQgYm9vay4KICAgIC8vIHJlY2VpcHRfYm9vayA9IHNlbGYucmVjZWlwdF9wYWdlX2JveChUeG4uc2VuZGVyLCBwYWdlLm5hdGl2ZSkKICAgIHR4biBTZW5kZXIKICAgIGZyYW1lX2RpZyAtMQogICAgYnRvaQogICAgc3dhcAogICAgZGlnIDEKICAgIGNhbGxzdWIgcmVjZWlwdF9wYWdlX2JveAogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2UvY29udHJhY3QucHk6ODA2CiAgICAvLyBhc3NlcnQgcmVjZWlwdF9ib29rLCBlcnIuTk9USElOR19UT19DTEFJTQogICAgZHVwCiAgICBib3hfbGVuCiAgICBidXJ5IDEKICAgIGFzc2VydCAvLyBOb3RoaW5nIHRvIGNsYWltCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9zdWJyb3V0aW5lcy5weTozNQogICAgLy8gcmV0dXJuIG9wLmJ0b2kocmVjZWlwdF9ib29rLmV4dHJhY3QoMCwgY3N0LkFSUkFZX0hFQURFUl9TSVpFKSkKICAgIGR1cAogICAgaW50Y18wIC8vIDAKICAgIGludGNfMiAvLyAyCiAgICBib3hfZXh0cmFjdAogICAgYnRvaQogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2UvY29udHJhY3QucHk6ODA5CiAgICAvLyBUeG4uc2VuZGVyLCByZWNlaXB0X2Jvb2ssIG5fcmVjZWlwdHMKICAgIHR4biBTZW5kZXIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjgwOC04MTAKICAgIC8vIGNsYWltZWQsIG5fZW5jdW1iZXJlZCA9IHNlbGYuY2xhaW1fcmVjZWlwdHMoCiAgICAvLyAgICAgVHhuLnNlbmRlciwgcmVjZWlwdF9ib29rLCBuX3JlY2VpcHRzCiAgICAvLyApCiAgICBkaWcgMgogICAgZGlnIDIKICAgIGNhbGxzdWIgY2xhaW1fcmVjZWlwdHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjgxMQogICAgLy8gc2VsZi5jb3VudF9wYWdlX3JlY2VpcHRzKFR4bi5zZW5kZXIsIHBhZ2UubmF0aXZlLCBuX2VuY3VtYmVyZWQpCiAgICB0eG4gU2VuZGVyCiAgICB1bmNvdmVyIDUKICAgIGRpZyAyCiAgICBjYWxsc3ViIGNvdW50X3BhZ2VfcmVjZWlwdHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjgxMwogICAgLy8gbWJyX2RpZmYgPSByZWNlaXB0X2Jvb2tfbWJyKHJlY2VpcHRfYm9vaywgbl9yZWNlaXB0cykgLSByZWNlaXB0X2Jvb2tfbWJyKAogICAgZGlnIDMKICAgIHVuY292ZXIgMwogICAgY2FsbHN1YiByZWNlaXB0X2Jvb2tfbWJyCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weTo4MTMtODE1CiAgICAvLyBtYnJfZGlmZiA9IHJlY2VpcHRfYm9va19tYnIocmVjZWlwdF9ib29rLCBuX3JlY2VpcHRzKSAtIHJlY2VpcHRfYm9va19tYnIoCiAgICAvLyAgICAgcmVjZWlwdF9ib29rLCBuX2VuY3VtYmVyZWQKICAgIC8vICkKICAgIHVuY292ZXIgMwogICAgdW5jb3ZlciAyCiAgICBjYWxsc3ViIHJlY2VpcHRfYm9va19tYnIKICAgIC0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjgxNgogICAgLy8gc2VsZi5zdWJfYmlkX3RvdGFscyhUeG4uc2VuZGVyLCBjbGFpbWVkLCBVSW50NjQoMCkpCiAgICB0eG4gU2VuZGVyCiAgICBkaWcgMgogICAgaW50Y18wIC8vIDAKICAgIGNhbGxzdWIgc3ViX2JpZF90b3RhbHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjgxNwogICAgLy8gc2VsZi5kZXBvc2l0ZWRbVHhuLnNlbmRlcl0gKz0gY2xhaW1lZCArIG1icl9kaWZmCiAgICBieXRlY18wIC8vICJkZXBvc2l0ZWQiCiAgICB0eG4gU2VuZGVyCiAgICBjb25jYXQKICAgIGR1cAogICAgYm94X2dldAogICAgc3dhcAogICAgYnRvaQogICAgc3dhcAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuZGVwb3NpdGVkIGVudHJ5IGV4aXN0cwogICAgdW5jb3ZlciAzCiAgICB1bmNvdmVyIDMKICAgICsKICAgICsKICAgIGl0b2IKICAgIGJveF9wdXQKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5kaWdpdGFsX21hcmtldHBsYWNlLmNvbnRyYWN0LkRpZ2l0YWxNYXJrZXRwbGFjZS5wYXlfcHJ1bmVkX3JlY2VpcHRzKGJpZGRlcjogYnl0ZXMsIGNsYWltZWQ6IHVpbnQ2NCwgZnJlZWRfbWJyOiB1aW50NjQpIC0+IHZvaWQ6CnBheV9wcnVuZWRfcmVjZWlwdHM6CiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weTo4MTktODIyCiAgICAvLyBAc3Vicm91dGluZQogICAgLy8gZGVmIHBheV9wcnVuZWRfcmVjZWlwdHMoCiAgICAvLyAgICAgc2VsZiwgYmlkZGVyOiBBY2NvdW50LCBjbGFpbWVkOiBVSW50NjQsIGZyZWVkX21icjogVUludDY0CiAgICAvLyApIC0+IE5vbmU6CiAgICBwcm90byAzIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjgyMy04MjUKICAgIC8vICMgVGhlIGNhbGxlciBpcyBwYWlkIGEgc2hhcmUgb2YgdGhlIE1CUiBmcmVlZCBieSBwcnVuaW5nIHRoZSByZWNlaXB0cywgdGhlIHJlc3QKICAgIC8vICMgIGdvZXMgYmFjayB0byB0aGUgYmlkZGVyIGFsb25nIHdpdGggdGhlIGFtb3VudCBvZiB0aGUgcmVjZWlwdHMuCiAgICAvLyBhc3NlcnQgZnJlZWRfbWJyLCBlcnIuTk9USElOR19UT19DTEFJTQogICAgZnJhbWVfZGlnIC0xCiAgICBhc3NlcnQgLy8gTm90aGluZyB0byBjbGFpbQogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2UvY29udHJhY3QucHk6ODI2CiAgICAvLyBib3VudHkgPSBmcmVlZF9tYnIgLy8gY3N0LlBSVU5FX0JPVU5UWV9ESVZJU09SCiAgICBmcmFtZV9kaWcgLTEKICAgIHB1c2hpbnQgMTAgLy8gMTAKICAgIC8KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjgyOAogICAgLy8gc2VsZi5zdWJfYmlkX3RvdGFscyhiaWRkZXIsIGNsYWltZWQsIFVJbnQ2NCgwKSkKICAgIGZyYW1lX2RpZyAtMwogICAgZnJhbWVfZGlnIC0yCiAgICBpbnRjXzAgLy8gMAogICAgY2FsbHN1YiBzdWJfYmlkX3RvdGFscwogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2UvY29udHJhY3QucHk6ODI5CiAgICAvLyBzZWxmLmRlcG9zaXRlZFtiaWRkZXJdICs9IGNsYWltZWQgKyBmcmVlZF9tYnIgLSBib3VudHkKICAgIGJ5dGVjXzAgLy8gImRlcG9zaXRlZCIKICAgIGZyYW1lX2RpZyAtMwogICAgY29uY2F0CiAgICBkdXAKICAgIGJveF9nZXQKICAgIHN3YXAKICAgIGJ0b2kKICAgIHN3YXAKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmRlcG9zaXRlZCBlbnRyeSBleGlzdHMKICAgIGZyYW1lX2RpZyAtMgogICAgZnJhbWVfZGlnIC0xCiAgICArCiAgICBkaWcgMwogICAgLQogICAgKwogICAgaXRvYgogICAgYm94X3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2UvY29udHJhY3QucHk6ODMwCiAgICAvLyBzZWxmLmRlcG9zaXRlZFtUeG4uc2VuZGVyXSArPSBib3VudHkKICAgIGJ5dGVjXzAgLy8gImRlcG9zaXRlZCIKICAgIHR4biBTZW5kZXIKICAgIGNvbmNhdAogICAgZHVwCiAgICBib3hfZ2V0CiAgICBzd2FwCiAgICBidG9pCiAgICBzd2FwCiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5kZXBvc2l0ZWQgZW50cnkgZXhpc3RzCiAgICB1bmNvdmVyIDIKICAgICsKICAgIGl0b2IKICAgIGJveF9wdXQKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5kaWdpdGFsX21hcmtldHBsYWNlLmNvbnRyYWN0LkRpZ2l0YWxNYXJrZXRwbGFjZS5wcnVuZV91bmVuY3VtYmVyZWRfYmlkcyhiaWRkZXI6IGJ5dGVzKSAtPiB2b2lkOgpwcnVuZV91bmVuY3VtYmVyZWRfYmlkczoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjgzMi04MzMKICAgIC8vIEBhYmltZXRob2QKICAgIC8vIGRlZiBwcnVuZV91bmVuY3VtYmVyZWRfYmlkcyhzZWxmLCBiaWRkZXI6IGFyYzQuQWRkcmVzcykgLT4gTm9uZToKICAgIHByb3RvIDEgMAogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2UvY29udHJhY3QucHk6ODM0LTgzNgogICAgLy8gIyBBbnlvbmUgY2FuIGNsYWltIHRoZSB1bmVuY3VtYmVyZWQgcmVjZWlwdHMgb2YgYSBiaWRkZXIgb24gdGhlaXIgYmVoYWxmLCBzbwogICAgLy8gIyAgdGhhdCB0aGUgYm94ZXMgb2YgaW5hY3RpdmUgYmlkZGVycyBkb24ndCBrZWVwIGdyb3dpbmcuCiAgICAvLyBhc3NlcnQgYmlkZGVyLm5hdGl2ZSBpbiBzZWxmLnJlY2VpcHRfYm9vaywgZXJyLk5PVEhJTkdfVE9fQ0xBSU0KICAgIGJ5dGVjXzMgLy8gInJlY2VpcHRfYm9vayIKICAgIGZyYW1lX2RpZyAtMQogICAgY29uY2F0CiAgICBkdXAKICAgIGJveF9sZW4KICAgIGJ1cnkgMQogICAgYXNzZXJ0IC8vIE5vdGhpbmcgdG8gY2xhaW0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL3N1YnJvdXRpbmVzLnB5OjM1CiAgICAvLyByZXR1cm4gb3AuYnRvaShyZWNlaXB0X2Jvb2suZXh0cmFjdCgwLCBjc3QuQVJSQVlfSEVBREVSX1NJWkUpKQogICAgZHVwCiAgICBpbnRjXzAgLy8gMAogICAgaW50Y18yIC8vIDIKICAgIGJveF9leHRyYWN0CiAgICBidG9pCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weTo4MzktODQxCiAgICAvLyBjbGFpbWVkLCBuX2VuY3VtYmVyZWQgPSBzZWxmLmNsYWltX3JlY2VpcHRzKAogICAgLy8gICAgIGJpZGRlci5uYXRpdmUsIHJlY2VpcHRfYm9vaywgbl9yZWNlaXB0cwogICAgLy8gKQogICAgZnJhbWVfZGlnIC0xCiAgICBkaWcgMgogICAgZGlnIDIKICAgIGNhbGxzdWIgY2xhaW1fcmVjZWlwdHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5Ojg0NgogICAgLy8gcmVjZWlwdF9ib29rX21icihyZWNlaXB0X2Jvb2ssIG5fcmVjZWlwdHMpCiAgICBkaWcgMwogICAgdW5jb3ZlciAzCiAgICBjYWxsc3ViIHJlY2VpcHRfYm9va19tYnIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5Ojg0NwogICAgLy8gLSByZWNlaXB0X2Jvb2tfbWJyKHJlY2VpcHRfYm9vaywgbl9lbmN1bWJlcmVkKSwKICAgIHVuY292ZXIgMwogICAgdW5jb3ZlciAyCiAgICBjYWxsc3ViIHJlY2VpcHRfYm9va19tYnIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5Ojg0Ni04NDcKICAgIC8vIHJlY2VpcHRfYm9va19tYnIocmVjZWlwdF9ib29rLCBuX3JlY2VpcHRzKQogICAgLy8gLSByZWNlaXB0X2Jvb2tfbWJyKHJlY2VpcHRfYm9vaywgbl9lbmN1bWJlcmVkKSwKICAgIC0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5Ojg0My04NDgKICAgIC8vIHNlbGYucGF5X3BydW5lZF9yZWNlaXB0cygKICAgIC8vICAgICBiaWRkZXIubmF0aXZlLAogICAgLy8gICAgIGNsYWltZWQsCiAgICAvLyAgICAgcmVjZWlwdF9ib29rX21icihyZWNlaXB0X2Jvb2ssIG5fcmVjZWlwdHMpCiAgICAvLyAgICAgLSByZWNlaXB0X2Jvb2tfbWJyKHJlY2VpcHRfYm9vaywgbl9lbmN1bWJlcmVkKSwKICAgIC8vICkKICAgIGZyYW1lX2RpZyAtMQogICAgY292ZXIgMgogICAgY2FsbHN1YiBwYXlfcHJ1bmVkX3JlY2VpcHRzCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuZGlnaXRhbF9tYXJrZXRwbGFjZS5jb250cmFjdC5EaWdpdGFsTWFya2V0cGxhY2UucHJ1bmVfdW5lbmN1bWJlcmVkX2JpZHNfb2ZfcGFnZShiaWRkZXI6IGJ5dGVzLCBwYWdlOiBieXRlcykgLT4gdm9pZDoKcHJ1bmVfdW5lbmN1bWJlcmVkX2JpZHNfb2ZfcGFnZToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5Ojg1MC04NTMKICAgIC8vIEBhYmltZXRob2QKICAgIC8vIGRlZiBwcnVuZV91bmVuY3VtYmVyZWRfYmlkc19vZl9wYWdlKAogICAgLy8gICAgIHNlbGYsIGJpZGRlcjogYXJjNC5BZGRyZXNzLCBwYWdlOiBhcmM0LlVJbnQ2NAogICAgLy8gKSAtPiBOb25lOgogICAgcHJvdG8gMiAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weTo4NTQtODU1CiAgICAvLyAjIFNhbWUgYXMgcHJ1bmVfdW5lbmN1bWJlcmVkX2JpZHMgZm9yIGEgc2luZ2xlIHBhZ2Ugb2YgYSBwYWdlZCByZWNlaXB0IGJvb2suCiAgICAvLyByZWNlaXB0X2Jvb2sgPSBzZWxmLnJlY2VpcHRfcGFnZV9ib3goYmlkZGVyLm5hdGl2ZSwgcGFnZS5uYXRpdmUpCiAgICBmcmFtZV9kaWcgLTEKICAgIGJ0b2kKICAgIGZyYW1lX2RpZyAtMgogICAgZGlnIDEKICAgIGNhbGxzdWIgcmVjZWlwdF9wYWdlX2JveAogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2UvY29udHJhY3QucHk6ODU2CiAgICAvLyBhc3NlcnQgcmVjZWlwdF9ib29rLCBlcnIuTk9USElOR19UT19DTEFJTQogICAgZHVwCiAgICBib3hfbGVuCiAgICBidXJ5IDEKICAgIGFzc2VydCAvLyBOb3RoaW5nIHRvIGNsYWltCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9zdWJyb3V0aW5lcy5weTozNQogICAgLy8gcmV0dXJuIG9wLmJ0b2kocmVjZWlwdF9ib29rLmV4dHJhY3QoMCwgY3N0LkFSUkFZX0hFQURFUl9TSVpFKSkKICAgIGR1cAogICAgaW50Y18wIC8vIDAKICAgIGludGNfMiAvLyAyCiAgICBib3hfZXh0cmFjdAogICAgYnRvaQogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2UvY29udHJhY3QucHk6ODU4LTg2MAogICAgLy8gY2xhaW1lZCwgbl9lbmN1bWJlcmVkID0gc2VsZi5jbGFpbV9yZWNlaXB0cygKICAgIC8vICAgICBiaWRkZXIubmF0aXZlLCByZWNlaXB0X2Jvb2ssIG5fcmVjZWlwdHMKICAgIC8vICkKICAgIGZyYW1lX2RpZyAtMgogICAgZGlnIDIKICAgIGRpZyAyCiAgICBjYWxsc3ViIGNsYWltX3JlY2VpcHRzCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weTo4NjEKICAgIC8vIHNlbGYuY291bnRfcGFnZV9yZWNlaXB0cyhiaWRkZXIubmF0aXZlLCBwYWdlLm5hdGl2ZSwgbl9lbmN1bWJlcmVkKQogICAgZnJhbWVfZGlnIC0yCiAgICB1bmNvdmVyIDUKICAgIGRpZyAyCiAgICBjYWxsc3ViIGNvdW50X3BhZ2VfcmVjZWlwdHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5Ojg2NgogICAgLy8gcmVjZWlwdF9ib29rX21icihyZWNlaXB0X2Jvb2ssIG5fcmVjZWlwdHMpCiAgICBkaWcgMwogICAgdW5jb3ZlciAzCiAgICBjYWxsc3ViIHJlY2VpcHRfYm9va19tYnIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5Ojg2NwogICAgLy8gLSByZWNlaXB0X2Jvb2tfbWJyKHJlY2VpcHRfYm9vaywgbl9lbmN1bWJlcmVkKSwKICAgIHVuY292ZXIgMwogICAgdW5jb3ZlciAyCiAgICBjYWxsc3ViIHJlY2VpcHRfYm9va19tYnIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5Ojg2Ni04NjcKICAgIC8vIHJlY2VpcHRfYm9va19tYnIocmVjZWlwdF9ib29rLCBuX3JlY2VpcHRzKQogICAgLy8gLSByZWNlaXB0X2Jvb2tfbWJyKHJlY2VpcHRfYm9vaywgbl9lbmN1bWJlcmVkKSwKICAgIC0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5Ojg2My04NjgKICAgIC8vIHNlbGYucGF5X3BydW5lZF9yZWNlaXB0cygKICAgIC8vICAgICBiaWRkZXIubmF0aXZlLAogICAgLy8gICAgIGNsYWltZWQsCiAgICAvLyAgICAgcmVjZWlwdF9ib29rX21icihyZWNlaXB0X2Jvb2ssIG5fcmVjZWlwdHMpCiAgICAvLyAgICAgLSByZWNlaXB0X2Jvb2tfbWJyKHJlY2VpcHRfYm9vaywgbl9lbmN1bWJlcmVkKSwKICAgIC8vICkKICAgIGZyYW1lX2RpZyAtMgogICAgY292ZXIgMgogICAgY2FsbHN1YiBwYXlfcHJ1bmVkX3JlY2VpcHRzCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuZGlnaXRhbF9tYXJrZXRwbGFjZS5jb250cmFjdC5EaWdpdGFsTWFya2V0cGxhY2UuY2xhaW1fdW5lbmN1bWJlcmVkX2JpZHNfcGFnZShvZmZzZXQ6IGJ5dGVzLCBsaW1pdDogYnl0ZXMpIC0+IHZvaWQ6CmNsYWltX3VuZW5jdW1iZXJlZF9iaWRzX3BhZ2U6CiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weTo4NzAtODczCiAgICAvLyBAYWJpbWV0aG9kCiAgICAvLyBkZWYgY2xhaW1fdW5lbmN1bWJlcmVkX2JpZHNfcGFnZSgKICAgIC8vICAgICBzZWxmLCBvZmZzZXQ6IGFyYzQuVUludDY0LCBsaW1pdDogYXJjNC5VSW50NjQKICAgIC8vICkgLT4gTm9uZToKICAgIHByb3RvIDIgMAogICAgaW50Y18wIC8vIDAKICAgIGR1cAogICAgYnl0ZWNfMSAvLyAiIgogICAgZHVwbiAzCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weTo4NzQtODc4CiAgICAvLyAjIENsYWltcyB0aGUgdW5lbmN1bWJlcmVkIHJlY2VpcHRzIGFtb25nIHRoZSAoYXQgbW9zdCkgbGltaXQgcmVjZWlwdHMgc3RhcnRpbmcKICAgIC8vICMgIGF0IG9mZnNldCwgZWRpdGluZyBvbmx5IHRoYXQgc2xpY2Ugb2YgdGhlIHJlY2VpcHQgYm9vayBib3guCiAgICAvLyAjIENsYWltZWQgcmVjZWlwdHMgc2hpZnQgdGhlIGZvbGxvd2luZyBvbmVzIGRvd24sIHNvIHNldmVyYWwgcGFnZXMgY2hhaW5lZCBpbgogICAgLy8gIyAgdGhlIHNhbWUgZ3JvdXAgbXVzdCBiZSBjbGFpbWVkIGJhY2sgdG8gZnJvbnQgdG8ga2VlcCB0aGVpciBvZmZzZXRzIHZhbGlkLgogICAgLy8gYXNzZXJ0IFR4bi5zZW5kZXIgaW4gc2VsZi5yZWNlaXB0X2Jvb2ssIGVyci5OT1RISU5HX1RPX0NMQUlNCiAgICBieXRlY18zIC8vICJyZWNlaXB0X2Jvb2siCiAgICB0eG4gU2VuZGVyCiAgICBjb25jYXQKICAgIGJveF9sZW4KICAgIGJ1cnkgMQogICAgYXNzZXJ0IC8vIE5vdGhpbmcgdG8gY2xhaW0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjIyOAogICAgLy8gcmV0dXJuIEJveFJlZihrZXk9c2VsZi5yZWNlaXB0X2Jvb2sua2V5X3ByZWZpeCArIGJpZGRlci5ieXRlcykKICAgIGJ5dGVjXzMgLy8gInJlY2VpcHRfYm9vayIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5Ojg3OQogICAgLy8gcmVjZWlwdF9ib29rID0gc2VsZi5yZWNlaXB0X2Jvb2tfYm94KFR4bi5zZW5kZXIpCiAgICB0eG4gU2VuZGVyCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weToyMjgKICAgIC8vIHJldHVybiBCb3hSZWYoa2V5PXNlbGYucmVjZWlwdF9ib29rLmtleV9wcmVmaXggKyBiaWRkZXIuYnl0ZXMpCiAgICBjb25jYXQKICAgIGR1cAogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2Uvc3Vicm91dGluZXMucHk6MzUKICAgIC8vIHJldHVybiBvcC5idG9pKHJlY2VpcHRfYm9vay5leHRyYWN0KDAsIGNzdC5BUlJBWV9IRUFERVJfU0laRSkpCiAgICBpbnRjXzAgLy8gMAogICAgaW50Y18yIC8vIDIKICAgIGJveF9leHRyYWN0CiAgICBidG9pCiAgICBkdXAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5Ojg4MgogICAgLy8gYXNzZXJ0IG9mZnNldC5uYXRpdmUgPCBuX3JlY2VpcHRzLCBlcnIuTk9USElOR19UT19DTEFJTQogICAgZnJhbWVfZGlnIC0yCiAgICBidG9pCiAgICBkdXAKICAgIGNvdmVyIDIKICAgIGR1cAogICAgZGlnIDIKICAgIDwKICAgIGFzc2VydCAvLyBOb3RoaW5nIHRvIGNsYWltCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weTo4ODMKICAgIC8vIHBhZ2VfbGVuZ3RoID0gbl9yZWNlaXB0cyAtIG9mZnNldC5uYXRpdmUKICAgIC0KICAgIGR1cAogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2UvY29udHJhY3QucHk6ODg0CiAgICAvLyBpZiBsaW1pdC5uYXRpdmUgPCBwYWdlX2xlbmd0aDoKICAgIGZyYW1lX2RpZyAtMQogICAgYnRvaQogICAgZHVwCiAgICB1bmNvdmVyIDIKICAgIDwKICAgIGJ6IGNsYWltX3VuZW5jdW1iZXJlZF9iaWRzX3BhZ2VfYWZ0ZXJfaWZfZWxzZUAyCiAgICBmcmFtZV9kaWcgMTAKICAgIGZyYW1lX2J1cnkgOQoKY2xhaW1fdW5lbmN1bWJlcmVkX2JpZHNfcGFnZV9hZnRlcl9pZl9lbHNlQDI6CiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9zdWJyb3V0aW5lcy5weTo0MAogICAgLy8gcmV0dXJuIGNzdC5BUlJBWV9IRUFERVJfU0laRSArIGluZGV4ICogY3N0LkJJRF9SRUNFSVBUX1NJWkUKICAgIGZyYW1lX2RpZyA4CiAgICBpbnRjXzMgLy8gMTYKICAgICoKICAgIGludGNfMiAvLyAyCiAgICArCiAgICBkdXAKICAgIGZyYW1lX2J1cnkgNQogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2UvY29udHJhY3QucHk6ODg4CiAgICAvLyBwYWdlID0gcmVjZWlwdF9ib29rLmV4dHJhY3QocGFnZV9zdGFydCwgcGFnZV9sZW5ndGggKiBjc3QuQklEX1JFQ0VJUFRfU0laRSkKICAgIGZyYW1lX2RpZyA5CiAgICBkdXAKICAgIGNvdmVyIDIKICAgIGludGNfMyAvLyAxNgogICAgKgogICAgZnJhbWVfZGlnIDYKICAgIGNvdmVyIDIKICAgIGJveF9leHRyYWN0CiAgICBmcmFtZV9idXJ5IDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5Ojg4OQogICAgLy8gZW5zdXJlX3JlY2VpcHRfbG9vcF9idWRnZXQocGFnZV9sZW5ndGgpCiAgICBjYWxsc3ViIGVuc3VyZV9yZWNlaXB0X2xvb3BfYnVkZ2V0CiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weTo4OTEKICAgIC8vIGNsYWltZWQgPSBVSW50NjQoMCkKICAgIGludGNfMCAvLyAwCiAgICBmcmFtZV9idXJ5IDIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5Ojg5MgogICAgLy8gZW5jdW1iZXJlZF9yZWNlaXB0cyA9IEJ5dGVzKCkKICAgIGJ5dGVjXzEgLy8gMHgKICAgIGZyYW1lX2J1cnkgMAogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2UvY29udHJhY3QucHk6ODkzCiAgICAvLyBmb3IgaSBpbiB1cmFuZ2UocGFnZV9sZW5ndGgpOgogICAgaW50Y18wIC8vIDAKICAgIGZyYW1lX2J1cnkgMwoKY2xhaW1fdW5lbmN1bWJlcmVkX2JpZHNfcGFnZV9mb3JfaGVhZGVyQDM6CiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weTo4OTMKICAgIC8vIGZvciBpIGluIHVyYW5nZShwYWdlX2xlbmd0aCk6CiAgICBmcmFtZV9kaWcgMwogICAgZnJhbWVfZGlnIDkKICAgIDwKICAgIGJ6IGNsYWltX3VuZW5jdW1iZXJlZF9iaWRzX3BhZ2VfYWZ0ZXJfZm9yQDkKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5Ojg5NQogICAgLy8gb3AuZXh0cmFjdChwYWdlLCBpICogY3N0LkJJRF9SRUNFSVBUX1NJWkUsIGNzdC5CSURfUkVDRUlQVF9TSVpFKQogICAgZnJhbWVfZGlnIDMKICAgIGludGNfMyAvLyAxNgogICAgKgogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2UvY29udHJhY3QucHk6ODk0LTg5NgogICAgLy8gcmVjZWlwdCA9IEJpZFJlY2VpcHQuZnJvbV9ieXRlcygKICAgIC8vICAgICBvcC5leHRyYWN0KHBhZ2UsIGkgKiBjc3QuQklEX1JFQ0VJUFRfU0laRSwgY3N0LkJJRF9SRUNFSVBUX1NJWkUpCiAgICAvLyApCiAgICBmcmFtZV9kaWcgMQogICAgc3dhcAogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2UvY29udHJhY3QucHk6ODk1CiAgICAvLyBvcC5leHRyYWN0KHBhZ2UsIGkgKiBjc3QuQklEX1JFQ0VJUFRfU0laRSwgY3N0LkJJRF9SRUNFSVBUX1NJWkUpCiAgICBpbnRjXzMgLy8gMTYKICAgIGV4dHJhY3QzCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weTo4OTQtODk2CiAgICAvLyByZWNlaXB0ID0gQmlkUmVjZWlwdC5mcm9tX2J5dGVzKAogICAgLy8gICAgIG9wLmV4dHJhY3QocGFnZSwgaSAqIGNzdC5CSURfUkVDRUlQVF9TSVpFLCBjc3QuQklEX1JFQ0VJUFRfU0laRSkKICAgIC8vICkKICAgIGR1cAogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2UvY29udHJhY3QucHk6ODk3CiAgICAvLyBpZiBzZWxmLmlzX2VuY3VtYmVyZWQoVHhuLnNlbmRlciwgcmVjZWlwdC5zYWxlX2lkKToKICAgIHR4biBTZW5kZXIKICAgIHN3YXAKICAgIGV4dHJhY3QgMCA4IC8vIG9uIGVycm9yOiBJbmRleCBhY2Nlc3MgaXMgb3V0IG9mIGJvdW5kcwogICAgY2FsbHN1YiBpc19lbmN1bWJlcmVkCiAgICBieiBjbGFpbV91bmVuY3VtYmVyZWRfYmlkc19wYWdlX2Vsc2VfYm9keUA2CiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weTo4OTgKICAgIC8vIGVuY3VtYmVyZWRfcmVjZWlwdHMgKz0gcmVjZWlwdC5ieXRlcwogICAgZnJhbWVfZGlnIDAKICAgIHN3YXAKICAgIGNvbmNhdAogICAgZnJhbWVfYnVyeSAwCgpjbGFpbV91bmVuY3VtYmVyZWRfYmlkc19wYWdlX2FmdGVyX2lmX2Vsc2VANzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5Ojg5MwogICAgLy8gZm9yIGkgaW4gdXJhbmdlKHBhZ2VfbGVuZ3RoKToKICAgIGZyYW1lX2RpZyAzCiAgICBpbnRjXzEgLy8gMQogICAgKwogICAgZnJhbWVfYnVyeSAzCiAgICBiIGNsYWltX3VuZW5jdW1iZXJlZF9iaWRzX3BhZ2VfZm9yX2hlYWRlckAzCgpjbGFpbV91bmVuY3VtYmVyZWRfYmlkc19wYWdlX2Vsc2VfYm9keUA2OgogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2UvY29udHJhY3QucHk6OTAwCiAgICAvLyBjbGFpbWVkICs9IHJlY2VpcHQuYW1vdW50Lm5hdGl2ZQogICAgcHVzaGludCA4IC8vIDgKICAgIGV4dHJhY3RfdWludDY0CiAgICBmcmFtZV9kaWcgMgogICAgKwogICAgZnJhbWVfYnVyeSAyCiAgICBiIGNsYWltX3VuZW5jdW1iZXJlZF9iaWRzX3BhZ2VfYWZ0ZXJfaWZfZWxzZUA3CgpjbGFpbV91bmVuY3VtYmVyZWRfYmlkc19wYWdlX2FmdGVyX2ZvckA5OgogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2UvY29udHJhY3QucHk6OTAxCiAgICAvLyBuX2NsYWltZWQgPSBwYWdlX2xlbmd0aCAtIGVuY3VtYmVyZWRfcmVjZWlwdHMubGVuZ3RoIC8vIGNzdC5CSURfUkVDRUlQVF9TSVpFCiAgICBmcmFtZV9kaWcgMAogICAgbGVuCiAgICBpbnRjXzMgLy8gMTYKICAgIC8KICAgIGZyYW1lX2RpZyA5CiAgICBzd2FwCiAgICAtCiAgICBkdXAKICAgIGZyYW1lX2J1cnkgNAogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2UvY29udHJhY3QucHk6OTAzCiAgICAvLyBpZiBuX2NsYWltZWQ6CiAgICBieiBjbGFpbV91bmVuY3VtYmVyZWRfYmlkc19wYWdlX2FmdGVyX2lmX2Vsc2VAMTEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjkwNAogICAgLy8gcmVjZWlwdF9ib29rLnNwbGljZShwYWdlX3N0YXJ0LCBwYWdlLmxlbmd0aCwgZW5jdW1iZXJlZF9yZWNlaXB0cykKICAgIGZyYW1lX2RpZyAxCiAgICBsZW4KICAgIGZyYW1lX2RpZyA2CiAgICBkdXAKICAgIGNvdmVyIDIKICAgIGZyYW1lX2RpZyA1CiAgICB1bmNvdmVyIDIKICAgIGZyYW1lX2RpZyAwCiAgICBib3hfc3BsaWNlCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weTo5MDUKICAgIC8vIHRydW5jYXRlX3JlY2VpcHRzKHJlY2VpcHRfYm9vaywgbl9yZWNlaXB0cyAtIG5fY2xhaW1lZCkKICAgIGZyYW1lX2RpZyA3CiAgICBmcmFtZV9kaWcgNAogICAgLQogICAgY2FsbHN1YiB0cnVuY2F0ZV9yZWNlaXB0cwoKY2xhaW1fdW5lbmN1bWJlcmVkX2JpZHNfcGFnZV9hZnRlcl9pZl9lbHNlQDExOgogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2UvY29udHJhY3QucHk6OTA2CiAgICAvLyBtYnJfZGlmZiA9IHJlY2VpcHRfYm9va19tYnIocmVjZWlwdF9ib29rLCBuX3JlY2VpcHRzKSAtIHJlY2VpcHRfYm9va19tYnIoCiAgICBmcmFtZV9kaWcgNgogICAgZHVwCiAgICBmcmFtZV9kaWcgNwogICAgZHVwCiAgICBjb3ZlciAyCiAgICBjYWxsc3ViIHJlY2VpcHRfYm9va19tYnIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjkwNwogICAgLy8gcmVjZWlwdF9ib29rLCBuX3JlY2VpcHRzIC0gbl9jbGFpbWVkCiAgICBzd2FwCiAgICBmcmFtZV9kaWcgNAogICAgLQogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2UvY29udHJhY3QucHk6OTA2LTkwOAogICAgLy8gbWJyX2RpZmYgPSByZWNlaXB0X2Jvb2tfbWJyKHJlY2VpcHRfYm9vaywgbl9yZWNlaXB0cykgLSByZWNlaXB0X2Jvb2tfbWJyKAogICAgLy8gICAgIHJlY2VpcHRfYm9vaywgbl9yZWNlaXB0cyAtIG5fY2xhaW1lZAogICAgLy8gKQogICAgdW5jb3ZlciAyCiAgICBzd2FwCiAgICBjYWxsc3ViIHJlY2VpcHRfYm9va19tYnIKICAgIC0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjkxMAogICAgLy8gc2VsZi5zdWJfYmlkX3RvdGFscyhUeG4uc2VuZGVyLCBjbGFpbWVkLCBVSW50NjQoMCkpCiAgICB0eG4gU2VuZGVyCiAgICBmcmFtZV9kaWcgMgogICAgZHVwCiAgICBjb3ZlciAyCiAgICBpbnRjXzAgLy8gMAogICAgY2FsbHN1YiBzdWJfYmlkX3RvdGFscwogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2UvY29udHJhY3QucHk6OTExCiAgICAvLyBzZWxmLmRlcG9zaXRlZFtUeG4uc2VuZGVyXSArPSBjbGFpbWVkICsgbWJyX2RpZmYKICAgIGJ5dGVjXzAgLy8gImRlcG9zaXRlZCIKICAgIHR4biBTZW5kZXIKICAgIGNvbmNhdAogICAgZHVwCiAgICBib3hfZ2V0CiAgICBzd2FwCiAgICBidG9pCiAgICBzd2FwCiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5kZXBvc2l0ZWQgZW50cnkgZXhpc3RzCiAgICB1bmNvdmVyIDIKICAgIHVuY292ZXIgMwogICAgKwogICAgKwogICAgaXRvYgogICAgYm94X3B1dAogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLmRpZ2l0YWxfbWFya2V0cGxhY2UuY29udHJhY3QuRGlnaXRhbE1hcmtldHBsYWNlLmNsYWltX2lzb2xhdGVkX2JpZChzYWxlX2tleTogYnl0ZXMpIC0+IHZvaWQ6CmNsYWltX2lzb2xhdGVkX2JpZDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjkxMy05MTQKICAgIC8vIEBhYmltZXRob2QKICAgIC8vIGRlZiBjbGFpbV9pc29sYXRlZF9iaWQoc2VsZiwgc2FsZV9rZXk6IFNhbGVLZXkpIC0+IE5vbmU6CiAgICBwcm90byAxIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL3N1YnJvdXRpbmVzLnB5OjE5MgogICAgLy8gb3AuZXh0cmFjdChvcC5zaGEyNTYoa2V5LmJ5dGVzKSwgMCwgY3N0LlNBTEVfSURfTEVOR1RIKQogICAgZnJhbWVfZGlnIC0xCiAgICBzaGEyNTYKICAgIGV4dHJhY3QgMCA4CiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weTo5MTYKICAgIC8vIHJlY2VpcHRfa2V5ID0gaXNvbGF0ZWRfcmVjZWlwdF9rZXkoVHhuLnNlbmRlciwgc2FsZV9pZCkKICAgIHR4biBTZW5kZXIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL3N1YnJvdXRpbmVzLnB5OjE5OC0xOTkKICAgIC8vICMgUmVjZWlwdHMgb2YgdGhlIHNhbWUgYmlkZGVyIHNoYXJlIHRoZSBwcmVmaXggYW5kIGNhbiBiZSBsaXN0ZWQgb2ZmLWNoYWluLgogICAgLy8gcmV0dXJuIGJpZGRlci5ieXRlcyArIHNhbGVfaWQuYnl0ZXMKICAgIGRpZyAxCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjkxNwogICAgLy8gYW1vdW50ID0gc2VsZi5pc29sYXRlZF9yZWNlaXB0c1tyZWNlaXB0X2tleV0KICAgIGJ5dGVjIDcgLy8gMHg2OQogICAgc3dhcAogICAgY29uY2F0CiAgICBkdXAKICAgIGJveF9nZXQKICAgIHN3YXAKICAgIGJ0b2kKICAgIHN3YXAKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmlzb2xhdGVkX3JlY2VpcHRzIGVudHJ5IGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2UvY29udHJhY3QucHk6OTE4CiAgICAvLyBhc3NlcnQgbm90IHNlbGYuaXNfZW5jdW1iZXJlZChUeG4uc2VuZGVyLCBzYWxlX2lkKSwgZXJyLkVOQ1VNQkVSRURfQklECiAgICB0eG4gU2VuZGVyCiAgICB1bmNvdmVyIDMKICAgIGNhbGxzdWIgaXNfZW5jdW1iZXJlZAogICAgIQogICAgYXNzZXJ0IC8vIEVuY3VtYmVyZWQgYmlkCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weTo5MjAKICAgIC8vIGRlbCBzZWxmLmlzb2xhdGVkX3JlY2VpcHRzW3JlY2VpcHRfa2V5XQogICAgc3dhcAogICAgYm94X2RlbAogICAgcG9wCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weTo5MjIKICAgIC8vIHNlbGYuc3ViX2JpZF90b3RhbHMoVHhuLnNlbmRlciwgYW1vdW50LCBVSW50NjQoMCkpCiAgICB0eG4gU2VuZGVyCiAgICBkaWcgMQogICAgaW50Y18wIC8vIDAKICAgIGNhbGxzdWIgc3ViX2JpZF90b3RhbHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjkyMwogICAgLy8gc2VsZi5kZXBvc2l0ZWRbVHhuLnNlbmRlcl0gKz0gYW1vdW50ICsgc2VsZi5pc29sYXRlZF9yZWNlaXB0X2JveF9tYnIoKQogICAgYnl0ZWNfMCAvLyAiZGVwb3NpdGVkIgogICAgdHhuIFNlbmRlcgogICAgY29uY2F0CiAgICBkdXAKICAgIGJveF9nZXQKICAgIHN3YXAKICAgIGJ0b2kKICAgIHN3YXAKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmRlcG9zaXRlZCBlbnRyeSBleGlzdHMKICAgIHVuY292ZXIgMgogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2Uvc3Vicm91dGluZXMucHk6MjYtMjcKICAgIC8vICMgVGhlIHNpemUgb2YgYSBib3ggaW5jbHVkZXMgaXRzIG5hbWUsIGtleSBwcmVmaXggaW5jbHVkZWQuCiAgICAvLyByZXR1cm4gY3N0LkJPWF9GTEFUX01JTl9CQUxBTkNFICsgc2l6ZSAqIGNzdC5CT1hfQllURV9NSU5fQkFMQU5DRQogICAgaW50YyA1IC8vIDIyMTAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weTo5MjMKICAgIC8vIHNlbGYuZGVwb3NpdGVkW1R4bi5zZW5kZXJdICs9IGFtb3VudCArIHNlbGYuaXNvbGF0ZWRfcmVjZWlwdF9ib3hfbWJyKCkKICAgICsKICAgICsKICAgIGl0b2IKICAgIGJveF9wdXQKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5kaWdpdGFsX21hcmtldHBsYWNlLmNvbnRyYWN0LkRpZ2l0YWxNYXJrZXRwbGFjZS50b3RhbF9hbmRfdW5lbmN1bWJlcmVkX2JpZHMoYmlkZGVyOiBieXRlcykgLT4gdWludDY0LCB1aW50NjQ6CnRvdGFsX2FuZF91bmVuY3VtYmVyZWRfYmlkczoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjkyNS05MjYKICAgIC8vIEBzdWJyb3V0aW5lCiAgICAvLyBkZWYgdG90YWxfYW5kX3VuZW5jdW1iZXJlZF9iaWRzKHNlbGYsIGJpZGRlcjogQWNjb3VudCkgLT4gVW5lbmN1bWJlcmVkQmlkc1JlY2VpcHQ6CiAgICBwcm90byAxIDIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjkyNy05MjgKICAgIC8vICMgUmVjZWlwdHMgdGhhdCBhcmUgbm90IHRoZSBiZXN0IGJpZCBvZiB0aGVpciBzYWxlIGNvdW50IGFzIHVuZW5jdW1iZXJlZC4KICAgIC8vIHRvdGFscywgZXhpc3RzID0gc2VsZi5iaWRfdG90YWxzLm1heWJlKGJpZGRlcikKICAgIGJ5dGVjIDUgLy8gImJpZF90b3RhbHMiCiAgICBmcmFtZV9kaWcgLTEKICAgIGNvbmNhdAogICAgYm94X2dldAogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2UvY29udHJhY3QucHk6OTI5CiAgICAvLyBpZiBub3QgZXhpc3RzOgogICAgYm56IHRvdGFsX2FuZF91bmVuY3VtYmVyZWRfYmlkc19hZnRlcl9pZl9lbHNlQDIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjkzMAogICAgLy8gcmV0dXJuIFVuZW5jdW1iZXJlZEJpZHNSZWNlaXB0KFVJbnQ2NCgwKSwgVUludDY0KDApKQogICAgaW50Y18wIC8vIDAKICAgIGR1cAogICAgdW5jb3ZlciAyCiAgICByZXRzdWIKCnRvdGFsX2FuZF91bmVuY3VtYmVyZWRfYmlkc19hZnRlcl9pZl9lbHNlQDI6CiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weTo5MzIKICAgIC8vIHRvdGFscy5jb21taXR0ZWQubmF0aXZlLAogICAgZnJhbWVfZGlnIDAKICAgIGR1cAogICAgaW50Y18wIC8vIDAKICAgIGV4dHJhY3RfdWludDY0CiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weTo5MzMKICAgIC8vIHRvdGFscy5jb21taXR0ZWQubmF0aXZlIC0gdG90YWxzLndpbm5pbmcubmF0aXZlLAogICAgc3dhcAogICAgcHVzaGludCA4IC8vIDgKICAgIGV4dHJhY3RfdWludDY0CiAgICBkaWcgMQogICAgc3dhcAogICAgLQogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2UvY29udHJhY3QucHk6OTMxLTkzNAogICAgLy8gcmV0dXJuIFVuZW5jdW1iZXJlZEJpZHNSZWNlaXB0KAogICAgLy8gICAgIHRvdGFscy5jb21taXR0ZWQubmF0aXZlLAogICAgLy8gICAgIHRvdGFscy5jb21taXR0ZWQubmF0aXZlIC0gdG90YWxzLndpbm5pbmcubmF0aXZlLAogICAgLy8gKQogICAgdW5jb3ZlciAyCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuZGlnaXRhbF9tYXJrZXRwbGFjZS5jb250cmFjdC5EaWdpdGFsTWFya2V0cGxhY2UuZ2V0X3RvdGFsX2FuZF91bmVuY3VtYmVyZWRfYmlkcygpIC0+IHVpbnQ2NCwgdWludDY0OgpnZXRfdG90YWxfYW5kX3VuZW5jdW1iZXJlZF9iaWRzOgogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2UvY29udHJhY3QucHk6OTM4CiAgICAvLyByZXR1cm4gc2VsZi50b3RhbF9hbmRfdW5lbmN1bWJlcmVkX2JpZHMoVHhuLnNlbmRlcikKICAgIHR4biBTZW5kZXIKICAgIGNhbGxzdWIgdG90YWxfYW5kX3VuZW5jdW1iZXJlZF9iaWRzCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuZGlnaXRhbF9tYXJrZXRwbGFjZS5jb250cmFjdC5EaWdpdGFsTWFya2V0cGxhY2UuZ2V0X3RvdGFsX2FuZF91bmVuY3VtYmVyZWRfYmlkc19vZihiaWRkZXJzOiBieXRlcykgLT4gYnl0ZXM6CmdldF90b3RhbF9hbmRfdW5lbmN1bWJlcmVkX2JpZHNfb2Y6CiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weTo5NDAtOTQzCiAgICAvLyBAYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICAvLyBkZWYgZ2V0X3RvdGFsX2FuZF91bmVuY3VtYmVyZWRfYmlkc19vZigKICAgIC8vICAgICBzZWxmLCBiaWRkZXJzOiBhcmM0LkR5bmFtaWNBcnJheVthcmM0LkFkZHJlc3NdCiAgICAvLyApIC0+IEltbXV0YWJsZUFycmF5W1VuZW5jdW1iZXJlZEJpZHNSZWNlaXB0XToKICAgIHByb3RvIDEgMQogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2UvY29udHJhY3QucHk6OTQ0LTk0NQogICAgLy8gIyBTYW1lIGFzIGdldF90b3RhbF9hbmRfdW5lbmN1bWJlcmVkX2JpZHMgZm9yIGVhY2ggb2YgdGhlIGJpZGRlcnMsIGluIG9yZGVyLgogICAgLy8gcmVjZWlwdHMgPSBJbW11dGFibGVBcnJheVtVbmVuY3VtYmVyZWRCaWRzUmVjZWlwdF0oKQogICAgYnl0ZWMgMTMgLy8gMHgwMDAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weTo5NDYKICAgIC8vIGZvciBiaWRkZXIgaW4gYmlkZGVyczoKICAgIGZyYW1lX2RpZyAtMQogICAgaW50Y18wIC8vIDAKICAgIGV4dHJhY3RfdWludDE2CiAgICBpbnRjXzAgLy8gMAoKZ2V0X3RvdGFsX2FuZF91bmVuY3VtYmVyZWRfYmlkc19vZl9mb3JfaGVhZGVyQDE6CiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weTo5NDYKICAgIC8vIGZvciBiaWRkZXIgaW4gYmlkZGVyczoKICAgIGZyYW1lX2RpZyAyCiAgICBmcmFtZV9kaWcgMQogICAgPAogICAgYnogZ2V0X3RvdGFsX2FuZF91bmVuY3VtYmVyZWRfYmlkc19vZl9hZnRlcl9mb3JANAogICAgZnJhbWVfZGlnIC0xCiAgICBleHRyYWN0IDIgMAogICAgZnJhbWVfZGlnIDIKICAgIGR1cAogICAgY292ZXIgMgogICAgcHVzaGludCAzMiAvLyAzMgogICAgKgogICAgcHVzaGludCAzMiAvLyAzMgogICAgZXh0cmFjdDMgLy8gb24gZXJyb3I6IEluZGV4IGFjY2VzcyBpcyBvdXQgb2YgYm91bmRzCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weTo5NDcKICAgIC8vIHJlY2VpcHRzID0gcmVjZWlwdHMuYXBwZW5kKHNlbGYudG90YWxfYW5kX3VuZW5jdW1iZXJlZF9iaWRzKGJpZGRlci5uYXRpdmUpKQogICAgZnJhbWVfZGlnIDAKICAgIGV4dHJhY3QgMiAwCiAgICBzd2FwCiAgICBjYWxsc3ViIHRvdGFsX2FuZF91bmVuY3VtYmVyZWRfYmlkcwogICAgc3dhcAogICAgaXRvYgogICAgc3dhcAogICAgaXRvYgogICAgY29uY2F0CiAgICBjb25jYXQKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzMgLy8gMTYKICAgIC8KICAgIGl0b2IKICAgIGV4dHJhY3QgNiAyCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGZyYW1lX2J1cnkgMAogICAgaW50Y18xIC8vIDEKICAgICsKICAgIGZyYW1lX2J1cnkgMgogICAgYiBnZXRfdG90YWxfYW5kX3VuZW5jdW1iZXJlZF9iaWRzX29mX2Zvcl9oZWFkZXJAMQoKZ2V0X3RvdGFsX2FuZF91bmVuY3VtYmVyZWRfYmlkc19vZl9hZnRlcl9mb3JANDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5Ojk0OAogICAgLy8gcmV0dXJuIHJlY2VpcHRzCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuZGlnaXRhbF9tYXJrZXRwbGFjZS5jb250cmFjdC5EaWdpdGFsTWFya2V0cGxhY2UuZ2V0X3JlY2VpcHRfY291bnQoYmlkZGVyOiBieXRlcykgLT4gdWludDY0OgpnZXRfcmVjZWlwdF9jb3VudDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5Ojk1MC05NTEKICAgIC8vIEBhYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIC8vIGRlZiBnZXRfcmVjZWlwdF9jb3VudChzZWxmLCBiaWRkZXI6IGFyYzQuQWRkcmVzcykgLT4gVUludDY0OgogICAgcHJvdG8gMSAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weToyMjgKICAgIC8vIHJldHVybiBCb3hSZWYoa2V5PXNlbGYucmVjZWlwdF9ib29rLmtleV9wcmVmaXggKyBiaWRkZXIuYnl0ZXMpCiAgICBieXRlY18zIC8vICJyZWNlaXB0X2Jvb2siCiAgICBmcmFtZV9kaWcgLTEKICAgIGNvbmNhdAogICAgZHVwCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weTo5NTYKICAgIC8vIGlmIG5vdCByZWNlaXB0X2Jvb2s6CiAgICBib3hfbGVuCiAgICBidXJ5IDEKICAgIGJueiBnZXRfcmVjZWlwdF9jb3VudF9hZnRlcl9pZl9lbHNlQDIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5Ojk1NwogICAgLy8gcmV0dXJuIFVJbnQ2NCgwKQogICAgaW50Y18wIC8vIDAKICAgIHN3YXAKICAgIHJldHN1YgoKZ2V0X3JlY2VpcHRfY291bnRfYWZ0ZXJfaWZfZWxzZUAyOgogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2Uvc3Vicm91dGluZXMucHk6MzUKICAgIC8vIHJldHVybiBvcC5idG9pKHJlY2VpcHRfYm9vay5leHRyYWN0KDAsIGNzdC5BUlJBWV9IRUFERVJfU0laRSkpCiAgICBmcmFtZV9kaWcgMAogICAgaW50Y18wIC8vIDAKICAgIGludGNfMiAvLyAyCiAgICBib3hfZXh0cmFjdAogICAgYnRvaQogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2UvY29udHJhY3QucHk6OTU4CiAgICAvLyByZXR1cm4gcmVjZWlwdF9jb3VudChyZWNlaXB0X2Jvb2spCiAgICBzd2FwCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuZGlnaXRhbF9tYXJrZXRwbGFjZS5jb250cmFjdC5EaWdpdGFsTWFya2V0cGxhY2UuZ2V0X3JlY2VpcHRfcGFnZXMoYmlkZGVyOiBieXRlcykgLT4gYnl0ZXM6CmdldF9yZWNlaXB0X3BhZ2VzOgogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2UvY29udHJhY3QucHk6OTYwLTk2MQogICAgLy8gQGFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgLy8gZGVmIGdldF9yZWNlaXB0X3BhZ2VzKHNlbGYsIGJpZGRlcjogYXJjNC5BZGRyZXNzKSAtPiBhcmM0LkR5bmFtaWNBcnJheVthcmM0LlVJbnQxNl06CiAgICBwcm90byAxIDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5Ojk2Mi05NjMKICAgIC8vICMgTnVtYmVyIG9mIHJlY2VpcHRzIG9mIGVhY2ggcGFnZSBvZiB0aGUgYmlkZGVyLCBlbXB0eSBpZiB0aGV5IGhhdmUgbm8gcGFnZXMuCiAgICAvLyByZXR1cm4gc2VsZi5yZWNlaXB0X3BhZ2VzLmdldCgKICAgIGJ5dGVjIDkgLy8gInJlY2VpcHRfcGFnZXMiCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weTo5NjItOTY1CiAgICAvLyAjIE51bWJlciBvZiByZWNlaXB0cyBvZiBlYWNoIHBhZ2Ugb2YgdGhlIGJpZGRlciwgZW1wdHkgaWYgdGhleSBoYXZlIG5vIHBhZ2VzLgogICAgLy8gcmV0dXJuIHNlbGYucmVjZWlwdF9wYWdlcy5nZXQoCiAgICAvLyAgICAgYmlkZGVyLm5hdGl2ZSwgZGVmYXVsdD1hcmM0LkR5bmFtaWNBcnJheVthcmM0LlVJbnQxNl0oKQogICAgLy8gKQogICAgZnJhbWVfZGlnIC0xCiAgICBjb25jYXQKICAgIGJveF9nZXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5Ojk2NAogICAgLy8gYmlkZGVyLm5hdGl2ZSwgZGVmYXVsdD1hcmM0LkR5bmFtaWNBcnJheVthcmM0LlVJbnQxNl0oKQogICAgYnl0ZWMgMTMgLy8gMHgwMDAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weTo5NjItOTY1CiAgICAvLyAjIE51bWJlciBvZiByZWNlaXB0cyBvZiBlYWNoIHBhZ2Ugb2YgdGhlIGJpZGRlciwgZW1wdHkgaWYgdGhleSBoYXZlIG5vIHBhZ2VzLgogICAgLy8gcmV0dXJuIHNlbGYucmVjZWlwdF9wYWdlcy5nZXQoCiAgICAvLyAgICAgYmlkZGVyLm5hdGl2ZSwgZGVmYXVsdD1hcmM0LkR5bmFtaWNBcnJheVthcmM0LlVJbnQxNl0oKQogICAgLy8gKQogICAgY292ZXIgMgogICAgc2VsZWN0CiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuZGlnaXRhbF9tYXJrZXRwbGFjZS5jb250cmFjdC5EaWdpdGFsTWFya2V0cGxhY2UuZ2V0X3NhbGVzKHNhbGVfa2V5czogYnl0ZXMpIC0+IGJ5dGVzOgpnZXRfc2FsZXM6CiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weTo5NjctOTcwCiAgICAvLyBAYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICAvLyBkZWYgZ2V0X3NhbGVzKAogICAgLy8gICAgIHNlbGYsIHNhbGVfa2V5czogYXJjNC5EeW5hbWljQXJyYXlbU2FsZUtleV0KICAgIC8vICkgLT4gYXJjNC5EeW5hbWljQXJyYXlbU2FsZUxpc3RpbmddOgogICAgcHJvdG8gMSAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weTo5NzEtOTczCiAgICAvLyAjIE1lYW50IHRvIGJlIHNpbXVsYXRlZCB3aXRoIGV4dHJhIG9wY29kZSBidWRnZXQgYW5kIHVubmFtZWQgcmVzb3VyY2VzLCBzbyB0aGF0CiAgICAvLyAjICBhIHNpbmdsZSByZXF1ZXN0IGNhbiBzbmFwc2hvdCBtYW55IGxpc3RpbmdzLgogICAgLy8gbGlzdGluZ3MgPSBhcmM0LkR5bmFtaWNBcnJheVtTYWxlTGlzdGluZ10oKQogICAgYnl0ZWMgMTMgLy8gMHgwMDAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weTo5NzQKICAgIC8vIGZvciBzYWxlX2tleSBpbiBzYWxlX2tleXM6CiAgICBmcmFtZV9kaWcgLTEKICAgIGludGNfMCAvLyAwCiAgICBleHRyYWN0X3VpbnQxNgogICAgaW50Y18wIC8vIDAKCmdldF9zYWxlc19mb3JfaGVhZGVyQDE6CiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weTo5NzQKICAgIC8vIGZvciBzYWxlX2tleSBpbiBzYWxlX2tleXM6CiAgICBmcmFtZV9kaWcgMgogICAgZnJhbWVfZGlnIDEKICAgIDwKICAgIGJ6IGdldF9zYWxlc19hZnRlcl9mb3JANAogICAgZnJhbWVfZGlnIC0xCiAgICBleHRyYWN0IDIgMAogICAgZnJhbWVfZGlnIDIKICAgIGR1cAogICAgY292ZXIgMgogICAgcHVzaGludCA0MCAvLyA0MAogICAgKgogICAgcHVzaGludCA0MCAvLyA0MAogICAgZXh0cmFjdDMgLy8gb24gZXJyb3I6IEluZGV4IGFjY2VzcyBpcyBvdXQgb2YgYm91bmRzCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weTo5NzUtOTg2CiAgICAvLyBsaXN0aW5ncy5hcHBlbmQoCiAgICAvLyAgICAgU2FsZUxpc3RpbmcoCiAgICAvLyAgICAgICAgIHNlbGYuc2FsZXMuZ2V0KAogICAgLy8gICAgICAgICAgICAgc2FsZV9rZXksCiAgICAvLyAgICAgICAgICAgICBkZWZhdWx0PVNhbGUoYXJjNC5VSW50NjQoKSwgYXJjNC5VSW50NjQoKSwgYXJjNC5VSW50NjQoKSksCiAgICAvLyAgICAgICAgICksCiAgICAvLyAgICAgICAgIHNlbGYuYmlkcy5nZXQoCiAgICAvLyAgICAgICAgICAgICBzYWxlX2lkX29mKHNhbGVfa2V5KSwKICAgIC8vICAgICAgICAgICAgIGRlZmF1bHQ9QmlkKGFyYzQuQWRkcmVzcygpLCBhcmM0LlVJbnQ2NCgpLCBhcmM0LkJvb2woKSksCiAgICAvLyAgICAgICAgICksCiAgICAvLyAgICAgKQogICAgLy8gKQogICAgZnJhbWVfZGlnIDAKICAgIGV4dHJhY3QgMiAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weTo5NzcKICAgIC8vIHNlbGYuc2FsZXMuZ2V0KAogICAgYnl0ZWNfMiAvLyAic2FsZXMiCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weTo5NzctOTgwCiAgICAvLyBzZWxmLnNhbGVzLmdldCgKICAgIC8vICAgICBzYWxlX2tleSwKICAgIC8vICAgICBkZWZhdWx0PVNhbGUoYXJjNC5VSW50NjQoKSwgYXJjNC5VSW50NjQoKSwgYXJjNC5VSW50NjQoKSksCiAgICAvLyApLAogICAgZGlnIDIKICAgIGNvbmNhdAogICAgYm94X2dldAogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2UvY29udHJhY3QucHk6OTc5CiAgICAvLyBkZWZhdWx0PVNhbGUoYXJjNC5VSW50NjQoKSwgYXJjNC5VSW50NjQoKSwgYXJjNC5VSW50NjQoKSksCiAgICBwdXNoYnl0ZXMgMHgwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5Ojk3Ny05ODAKICAgIC8vIHNlbGYuc2FsZXMuZ2V0KAogICAgLy8gICAgIHNhbGVfa2V5LAogICAgLy8gICAgIGRlZmF1bHQ9U2FsZShhcmM0LlVJbnQ2NCgpLCBhcmM0LlVJbnQ2NCgpLCBhcmM0LlVJbnQ2NCgpKSwKICAgIC8vICksCiAgICBjb3ZlciAyCiAgICBzZWxlY3QKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL3N1YnJvdXRpbmVzLnB5OjE5MgogICAgLy8gb3AuZXh0cmFjdChvcC5zaGEyNTYoa2V5LmJ5dGVzKSwgMCwgY3N0LlNBTEVfSURfTEVOR1RIKQogICAgdW5jb3ZlciAyCiAgICBzaGEyNTYKICAgIGV4dHJhY3QgMCA4CiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weTo5ODEKICAgIC8vIHNlbGYuYmlkcy5nZXQoCiAgICBieXRlYyA0IC8vICJiaWRzIgogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2UvY29udHJhY3QucHk6OTgxLTk4NAogICAgLy8gc2VsZi5iaWRzLmdldCgKICAgIC8vICAgICBzYWxlX2lkX29mKHNhbGVfa2V5KSwKICAgIC8vICAgICBkZWZhdWx0PUJpZChhcmM0LkFkZHJlc3MoKSwgYXJjNC5VSW50NjQoKSwgYXJjNC5Cb29sKCkpLAogICAgLy8gKSwKICAgIHN3YXAKICAgIGNvbmNhdAogICAgYm94X2dldAogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2UvY29udHJhY3QucHk6OTgzCiAgICAvLyBkZWZhdWx0PUJpZChhcmM0LkFkZHJlc3MoKSwgYXJjNC5VSW50NjQoKSwgYXJjNC5Cb29sKCkpLAogICAgcHVzaGJ5dGVzIGJhc2UzMihBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUEpCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weTo5ODEtOTg0CiAgICAvLyBzZWxmLmJpZHMuZ2V0KAogICAgLy8gICAgIHNhbGVfaWRfb2Yoc2FsZV9rZXkpLAogICAgLy8gICAgIGRlZmF1bHQ9QmlkKGFyYzQuQWRkcmVzcygpLCBhcmM0LlVJbnQ2NCgpLCBhcmM0LkJvb2woKSksCiAgICAvLyApLAogICAgY292ZXIgMgogICAgc2VsZWN0CiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weTo5NzYtOTg1CiAgICAvLyBTYWxlTGlzdGluZygKICAgIC8vICAgICBzZWxmLnNhbGVzLmdldCgKICAgIC8vICAgICAgICAgc2FsZV9rZXksCiAgICAvLyAgICAgICAgIGRlZmF1bHQ9U2FsZShhcmM0LlVJbnQ2NCgpLCBhcmM0LlVJbnQ2NCgpLCBhcmM0LlVJbnQ2NCgpKSwKICAgIC8vICAgICApLAogICAgLy8gICAgIHNlbGYuYmlkcy5nZXQoCiAgICAvLyAgICAgICAgIHNhbGVfaWRfb2Yoc2FsZV9rZXkpLAogICAgLy8gICAgICAgICBkZWZhdWx0PUJpZChhcmM0LkFkZHJlc3MoKSwgYXJjNC5VSW50NjQoKSwgYXJjNC5Cb29sKCkpLAogICAgLy8gICAgICksCiAgICAvLyApCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5Ojk3NS05ODYKICAgIC8vIGxpc3RpbmdzLmFwcGVuZCgKICAgIC8vICAgICBTYWxlTGlzdGluZygKICAgIC8vICAgICAgICAgc2VsZi5zYWxlcy5nZXQoCiAgICAvLyAgICAgICAgICAgICBzYWxlX2tleSwKICAgIC8vICAgICAgICAgICAgIGRlZmF1bHQ9U2FsZShhcmM0LlVJbnQ2NCgpLCBhcmM0LlVJbnQ2NCgpLCBhcmM0LlVJbnQ2NCgpKSwKICAgIC8vICAgICAgICAgKSwKICAgIC8vICAgICAgICAgc2VsZi5iaWRzLmdldCgKICAgIC8vICAgICAgICAgICAgIHNhbGVfaWRfb2Yoc2FsZV9rZXkpLAogICAgLy8gICAgICAgICAgICAgZGVmYXVsdD1CaWQoYXJjNC5BZGRyZXNzKCksIGFyYzQuVUludDY0KCksIGFyYzQuQm9vbCgpKSwKICAgIC8vICAgICAgICAgKSwKICAgIC8vICAgICApCiAgICAvLyApCiAgICBjb25jYXQKICAgIGR1cAogICAgbGVuCiAgICBwdXNoaW50IDY1IC8vIDY1CiAgICAvCiAgICBpdG9iCiAgICBleHRyYWN0IDYgMgogICAgc3dhcAogICAgY29uY2F0CiAgICBmcmFtZV9idXJ5IDAKICAgIGludGNfMSAvLyAxCiAgICArCiAgICBmcmFtZV9idXJ5IDIKICAgIGIgZ2V0X3NhbGVzX2Zvcl9oZWFkZXJAMQoKZ2V0X3NhbGVzX2FmdGVyX2ZvckA0OgogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2UvY29udHJhY3QucHk6OTg3CiAgICAvLyByZXR1cm4gbGlzdGluZ3MKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5kaWdpdGFsX21hcmtldHBsYWNlLmNvbnRyYWN0LkRpZ2l0YWxNYXJrZXRwbGFjZS5hd2FyZF9iaWQoc2FsZV9rZXk6IGJ5dGVzLCBzYWxlX2lkOiBieXRlcywgYmlkOiBieXRlcykgLT4gdm9pZDoKYXdhcmRfYmlkOgogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2UvY29udHJhY3QucHk6OTg5LTk5MAogICAgLy8gQHN1YnJvdXRpbmUKICAgIC8vIGRlZiBhd2FyZF9iaWQoc2VsZiwgc2FsZV9rZXk6IFNhbGVLZXksIHNhbGVfaWQ6IGFyYzQuVUludDY0LCBiaWQ6IEJpZCkgLT4gTm9uZToKICAgIHByb3RvIDMgMAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzEgLy8gIiIKICAgIGR1cG4gMwogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2UvY29udHJhY3QucHk6OTkxLTk5NQogICAgLy8gIyBTZXR0bGVzIHRoZSB3aW5uaW5nIGJpZCBvZiBhIHNhbGUgd2hvc2UgYXNzZXQgd2VudCB0byB0aGUgYmlkZGVyOiB0aGUgYmlkCiAgICAvLyAjICBib3ggYW5kIHRoZSB3aW5uaW5nIHJlY2VpcHQgYXJlIGRlbGV0ZWQgYW5kIHRoZWlyIE1CUiBnaXZlbiBiYWNrLgogICAgLy8gIyBBIGJpZGRlciBjYW4gaG9sZCBhbiBvbGRlciwgbG93ZXIgcmVjZWlwdCBmb3IgdGhlIHNhbWUgc2FsZSBpbiB0aGUgb3RoZXIKICAgIC8vICMgIHN0b3JhZ2UsIHdoaWNoIHN0YXlzIGluIHBsYWNlIGFuZCBiZWNvbWVzIGNsYWltYWJsZSBvbmNlIHRoZSBzYWxlIGlzIGdvbmUuCiAgICAvLyBiaWRkZXIgPSBiaWQuYmlkZGVyLm5hdGl2ZQogICAgZnJhbWVfZGlnIC0xCiAgICBleHRyYWN0IDAgMzIgLy8gb24gZXJyb3I6IEluZGV4IGFjY2VzcyBpcyBvdXQgb2YgYm91bmRzCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weTo5OTYKICAgIC8vIGlmIGJpZC5pc29sYXRlZC5uYXRpdmU6CiAgICBmcmFtZV9kaWcgLTEKICAgIHB1c2hpbnQgMzIwIC8vIDMyMAogICAgZ2V0Yml0CiAgICBieXRlYyAxMiAvLyAweDAwCiAgICBpbnRjXzAgLy8gMAogICAgdW5jb3ZlciAyCiAgICBzZXRiaXQKICAgIGludGNfMCAvLyAwCiAgICBnZXRiaXQKICAgIGJ6IGF3YXJkX2JpZF9lbHNlX2JvZHlAMgogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2Uvc3Vicm91dGluZXMucHk6MTk4LTE5OQogICAgLy8gIyBSZWNlaXB0cyBvZiB0aGUgc2FtZSBiaWRkZXIgc2hhcmUgdGhlIHByZWZpeCBhbmQgY2FuIGJlIGxpc3RlZCBvZmYtY2hhaW4uCiAgICAvLyByZXR1cm4gYmlkZGVyLmJ5dGVzICsgc2FsZV9pZC5ieXRlcwogICAgZnJhbWVfZGlnIDUKICAgIGZyYW1lX2RpZyAtMgogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weTo5OTcKICAgIC8vIGRlbCBzZWxmLmlzb2xhdGVkX3JlY2VpcHRzW2lzb2xhdGVkX3JlY2VpcHRfa2V5KGJpZGRlciwgc2FsZV9pZCldCiAgICBieXRlYyA3IC8vIDB4NjkKICAgIHN3YXAKICAgIGNvbmNhdAogICAgYm94X2RlbAogICAgcG9wCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9zdWJyb3V0aW5lcy5weToyNi0yNwogICAgLy8gIyBUaGUgc2l6ZSBvZiBhIGJveCBpbmNsdWRlcyBpdHMgbmFtZSwga2V5IHByZWZpeCBpbmNsdWRlZC4KICAgIC8vIHJldHVybiBjc3QuQk9YX0ZMQVRfTUlOX0JBTEFOQ0UgKyBzaXplICogY3N0LkJPWF9CWVRFX01JTl9CQUxBTkNFCiAgICBpbnRjIDUgLy8gMjIxMDAKCmF3YXJkX2JpZF9hZnRlcl9pZl9lbHNlQDM6CiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weToxMDEwCiAgICAvLyBzZWxmLmRlbGV0ZV9iaWQoc2FsZV9rZXksIHNhbGVfaWQpCiAgICBmcmFtZV9kaWcgLTMKICAgIGZyYW1lX2RpZyAtMgogICAgY2FsbHN1YiBkZWxldGVfYmlkCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weToxMDEyCiAgICAvLyBzZWxmLnN1Yl9iaWRfdG90YWxzKGJpZGRlciwgYmlkLmFtb3VudC5uYXRpdmUsIGJpZC5hbW91bnQubmF0aXZlKQogICAgZnJhbWVfZGlnIC0xCiAgICBwdXNoaW50IDMyIC8vIDMyCiAgICBleHRyYWN0X3VpbnQ2NAogICAgZnJhbWVfZGlnIDUKICAgIGR1cAogICAgY292ZXIgMgogICAgZGlnIDEKICAgIHVuY292ZXIgMgogICAgY2FsbHN1YiBzdWJfYmlkX3RvdGFscwogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2UvY29udHJhY3QucHk6MTAxMwogICAgLy8gc2VsZi5kZXBvc2l0ZWRbYmlkZGVyXSArPSByZWNlaXB0X21iciArIHNlbGYuYmlkX2JveF9tYnIoKQogICAgYnl0ZWNfMCAvLyAiZGVwb3NpdGVkIgogICAgc3dhcAogICAgY29uY2F0CiAgICBkdXAKICAgIGJveF9nZXQKICAgIHN3YXAKICAgIGJ0b2kKICAgIHN3YXAKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmRlcG9zaXRlZCBlbnRyeSBleGlzdHMKICAgIHVuY292ZXIgMgogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2Uvc3Vicm91dGluZXMucHk6MjYtMjcKICAgIC8vICMgVGhlIHNpemUgb2YgYSBib3ggaW5jbHVkZXMgaXRzIG5hbWUsIGtleSBwcmVmaXggaW5jbHVkZWQuCiAgICAvLyByZXR1cm4gY3N0LkJPWF9GTEFUX01JTl9CQUxBTkNFICsgc2l6ZSAqIGNzdC5CT1hfQllURV9NSU5fQkFMQU5DRQogICAgaW50YyA2IC8vIDIzNzAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weToxMDEzCiAgICAvLyBzZWxmLmRlcG9zaXRlZFtiaWRkZXJdICs9IHJlY2VpcHRfbWJyICsgc2VsZi5iaWRfYm94X21icigpCiAgICArCiAgICArCiAgICBpdG9iCiAgICBib3hfcHV0CiAgICByZXRzdWIKCmF3YXJkX2JpZF9lbHNlX2JvZHlAMjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjEwMDAKICAgIC8vIHJlY2VpcHRfYm9vaywgcGFnZSA9IHNlbGYucmVjZWlwdF9ib29rX29mKGJpZGRlciwgc2FsZV9pZCkKICAgIGZyYW1lX2RpZyA1CiAgICBmcmFtZV9kaWcgLTIKICAgIGNhbGxzdWIgcmVjZWlwdF9ib29rX29mCiAgICBmcmFtZV9idXJ5IDQKICAgIGR1cAogICAgZnJhbWVfYnVyeSAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9zdWJyb3V0aW5lcy5weTozNQogICAgLy8gcmV0dXJuIG9wLmJ0b2kocmVjZWlwdF9ib29rLmV4dHJhY3QoMCwgY3N0LkFSUkFZX0hFQURFUl9TSVpFKSkKICAgIGR1cAogICAgaW50Y18wIC8vIDAKICAgIGludGNfMiAvLyAyCiAgICBib3hfZXh0cmFjdAogICAgYnRvaQogICAgZnJhbWVfYnVyeSAyCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weToxMDAyCiAgICAvLyBmb3VuZCwgaW5kZXggPSBmaW5kX2JpZF9yZWNlaXB0KHJlY2VpcHRfYm9vaywgc2FsZV9pZCkKICAgIGR1cAogICAgZnJhbWVfZGlnIC0yCiAgICBjYWxsc3ViIGZpbmRfYmlkX3JlY2VpcHQKICAgIGR1cAogICAgY292ZXIgMwogICAgZnJhbWVfYnVyeSAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weToxMDAzCiAgICAvLyBhc3NlcnQgZm91bmQKICAgIGFzc2VydAogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2Uvc3Vicm91dGluZXMucHk6MzUKICAgIC8vIHJldHVybiBvcC5idG9pKHJlY2VpcHRfYm9vay5leHRyYWN0KDAsIGNzdC5BUlJBWV9IRUFERVJfU0laRSkpCiAgICBpbnRjXzAgLy8gMAogICAgaW50Y18yIC8vIDIKICAgIGJveF9leHRyYWN0CiAgICBidG9pCiAgICBkdXAKICAgIGZyYW1lX2J1cnkgMwogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2Uvc3Vicm91dGluZXMucHk6ODYKICAgIC8vIGlmIGluZGV4ICsgMSA8IG5fcmVjZWlwdHM6CiAgICBzd2FwCiAgICBpbnRjXzEgLy8gMQogICAgKwogICAgPgogICAgYnogYXdhcmRfYmlkX2FmdGVyX2lmX2Vsc2VANgogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2Uvc3Vicm91dGluZXMucHk6NDAKICAgIC8vIHJldHVybiBjc3QuQVJSQVlfSEVBREVSX1NJWkUgKyBpbmRleCAqIGNzdC5CSURfUkVDRUlQVF9TSVpFCiAgICBmcmFtZV9kaWcgMQogICAgaW50Y18zIC8vIDE2CiAgICAqCiAgICBpbnRjXzIgLy8gMgogICAgKwogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2Uvc3Vicm91dGluZXMucHk6ODcKICAgIC8vIHJlY2VpcHRfYm9vay5zcGxpY2UocmVjZWlwdF9vZmZzZXQoaW5kZXgpLCBjc3QuQklEX1JFQ0VJUFRfU0laRSwgQnl0ZXMoKSkKICAgIGZyYW1lX2RpZyAwCiAgICBzd2FwCiAgICBpbnRjXzMgLy8gMTYKICAgIGJ5dGVjXzEgLy8gMHgKICAgIGJveF9zcGxpY2UKCmF3YXJkX2JpZF9hZnRlcl9pZl9lbHNlQDY6CiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9zdWJyb3V0aW5lcy5weTo4OAogICAgLy8gdHJ1bmNhdGVfcmVjZWlwdHMocmVjZWlwdF9ib29rLCBuX3JlY2VpcHRzIC0gMSkKICAgIGZyYW1lX2RpZyAzCiAgICBpbnRjXzEgLy8gMQogICAgLQogICAgZnJhbWVfZGlnIDAKICAgIGR1cAogICAgdW5jb3ZlciAyCiAgICBjYWxsc3ViIHRydW5jYXRlX3JlY2VpcHRzCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weToxMDA2CiAgICAvLyBzZWxmLmNvdW50X3BhZ2VfcmVjZWlwdHMoYmlkZGVyLCBwYWdlLCBuX3JlY2VpcHRzIC0gMSkKICAgIGZyYW1lX2RpZyAyCiAgICBkdXAKICAgIGludGNfMSAvLyAxCiAgICAtCiAgICBmcmFtZV9kaWcgNQogICAgZnJhbWVfZGlnIDQKICAgIGRpZyAyCiAgICBjYWxsc3ViIGNvdW50X3BhZ2VfcmVjZWlwdHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjEwMDcKICAgIC8vIHJlY2VpcHRfbWJyID0gcmVjZWlwdF9ib29rX21icihyZWNlaXB0X2Jvb2ssIG5fcmVjZWlwdHMpIC0gcmVjZWlwdF9ib29rX21icigKICAgIGRpZyAyCiAgICB1bmNvdmVyIDIKICAgIGNhbGxzdWIgcmVjZWlwdF9ib29rX21icgogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2UvY29udHJhY3QucHk6MTAwNy0xMDA5CiAgICAvLyByZWNlaXB0X21iciA9IHJlY2VpcHRfYm9va19tYnIocmVjZWlwdF9ib29rLCBuX3JlY2VpcHRzKSAtIHJlY2VpcHRfYm9va19tYnIoCiAgICAvLyAgICAgcmVjZWlwdF9ib29rLCBuX3JlY2VpcHRzIC0gMQogICAgLy8gKQogICAgY292ZXIgMgogICAgY2FsbHN1YiByZWNlaXB0X2Jvb2tfbWJyCiAgICAtCiAgICBiIGF3YXJkX2JpZF9hZnRlcl9pZl9lbHNlQDMKCgovLyBzbWFydF9jb250cmFjdHMuZGlnaXRhbF9tYXJrZXRwbGFjZS5jb250cmFjdC5EaWdpdGFsTWFya2V0cGxhY2UuYWNjZXB0X2JpZChhc3NldDogYnl0ZXMpIC0+IHZvaWQ6CmFjY2VwdF9iaWQ6CiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weToxMDE1LTEwMTYKICAgIC8vIEBhYmltZXRob2QKICAgIC8vIGRlZiBhY2NlcHRfYmlkKHNlbGYsIGFzc2V0OiBhcmM0LlVJbnQ2NCkgLT4gTm9uZToKICAgIHByb3RvIDEgMAogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2UvY29udHJhY3QucHk6MTAxNwogICAgLy8gc2FsZV9rZXkgPSBTYWxlS2V5KG93bmVyPWFyYzQuQWRkcmVzcyhUeG4uc2VuZGVyKSwgYXNzZXQ9YXNzZXQpCiAgICB0eG4gU2VuZGVyCiAgICBmcmFtZV9kaWcgLTEKICAgIGNvbmNhdAogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2Uvc3Vicm91dGluZXMucHk6MTkyCiAgICAvLyBvcC5leHRyYWN0KG9wLnNoYTI1NihrZXkuYnl0ZXMpLCAwLCBjc3QuU0FMRV9JRF9MRU5HVEgpCiAgICBkdXAKICAgIHNoYTI1NgogICAgZXh0cmFjdCAwIDgKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjEwMTkKICAgIC8vIHNhbGUgPSBzZWxmLnNhbGVzW3NhbGVfa2V5XQogICAgYnl0ZWNfMiAvLyAic2FsZXMiCiAgICBkaWcgMgogICAgY29uY2F0CiAgICBib3hfZ2V0CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5zYWxlcyBlbnRyeSBleGlzdHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjEwMjAKICAgIC8vIGN1cnJlbnRfYmVzdF9iaWQgPSBzZWxmLmJpZHNbc2FsZV9pZF0KICAgIGJ5dGVjIDQgLy8gImJpZHMiCiAgICBkaWcgMgogICAgY29uY2F0CiAgICBib3hfZ2V0CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5iaWRzIGVudHJ5IGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2UvY29udHJhY3QucHk6MTAyMgogICAgLy8gc2VsZi5kZWxldGVfc2FsZShzYWxlX2tleSkKICAgIGRpZyAzCiAgICBjYWxsc3ViIGRlbGV0ZV9zYWxlCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weToxMDI0CiAgICAvLyBzZWxmLmRlcG9zaXRlZFtUeG4uc2VuZGVyXSArPSAoCiAgICBieXRlY18wIC8vICJkZXBvc2l0ZWQiCiAgICB0eG4gU2VuZGVyCiAgICBjb25jYXQKICAgIGR1cAogICAgYm94X2dldAogICAgc3dhcAogICAgYnRvaQogICAgc3dhcAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuZGVwb3NpdGVkIGVudHJ5IGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2UvY29udHJhY3QucHk6MTAyNQogICAgLy8gY3VycmVudF9iZXN0X2JpZC5hbW91bnQubmF0aXZlICsgc2VsZi5zYWxlX2JveF9tYnIoKQogICAgZGlnIDIKICAgIHB1c2hpbnQgMzIgLy8gMzIKICAgIGV4dHJhY3RfdWludDY0CiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9zdWJyb3V0aW5lcy5weToyNi0yNwogICAgLy8gIyBUaGUgc2l6ZSBvZiBhIGJveCBpbmNsdWRlcyBpdHMgbmFtZSwga2V5IHByZWZpeCBpbmNsdWRlZC4KICAgIC8vIHJldHVybiBjc3QuQk9YX0ZMQVRfTUlOX0JBTEFOQ0UgKyBzaXplICogY3N0LkJPWF9CWVRFX01JTl9CQUxBTkNFCiAgICBpbnRjIDQgLy8gMzAxMDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjEwMjUKICAgIC8vIGN1cnJlbnRfYmVzdF9iaWQuYW1vdW50Lm5hdGl2ZSArIHNlbGYuc2FsZV9ib3hfbWJyKCkKICAgICsKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjEwMjQtMTAyNgogICAgLy8gc2VsZi5kZXBvc2l0ZWRbVHhuLnNlbmRlcl0gKz0gKAogICAgLy8gICAgIGN1cnJlbnRfYmVzdF9iaWQuYW1vdW50Lm5hdGl2ZSArIHNlbGYuc2FsZV9ib3hfbWJyKCkKICAgIC8vICkKICAgICsKICAgIGl0b2IKICAgIGJveF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjEwMjctMTAzMQogICAgLy8gaXR4bi5Bc3NldFRyYW5zZmVyKAogICAgLy8gICAgIHhmZXJfYXNzZXQ9YXNzZXQubmF0aXZlLAogICAgLy8gICAgIGFzc2V0X3JlY2VpdmVyPWN1cnJlbnRfYmVzdF9iaWQuYmlkZGVyLm5hdGl2ZSwKICAgIC8vICAgICBhc3NldF9hbW91bnQ9c2FsZS5hbW91bnQubmF0aXZlLAogICAgLy8gKS5zdWJtaXQoKQogICAgaXR4bl9iZWdpbgogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2UvY29udHJhY3QucHk6MTAyOAogICAgLy8geGZlcl9hc3NldD1hc3NldC5uYXRpdmUsCiAgICBmcmFtZV9kaWcgLTEKICAgIGJ0b2kKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjEwMjkKICAgIC8vIGFzc2V0X3JlY2VpdmVyPWN1cnJlbnRfYmVzdF9iaWQuYmlkZGVyLm5hdGl2ZSwKICAgIGRpZyAxCiAgICBleHRyYWN0IDAgMzIgLy8gb24gZXJyb3I6IEluZGV4IGFjY2VzcyBpcyBvdXQgb2YgYm91bmRzCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weToxMDMwCiAgICAvLyBhc3NldF9hbW91bnQ9c2FsZS5hbW91bnQubmF0aXZlLAogICAgdW5jb3ZlciAzCiAgICBpbnRjXzAgLy8gMAogICAgZXh0cmFjdF91aW50NjQKICAgIGl0eG5fZmllbGQgQXNzZXRBbW91bnQKICAgIGl0eG5fZmllbGQgQXNzZXRSZWNlaXZlcgogICAgaXR4bl9maWVsZCBYZmVyQXNzZXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjEwMjcKICAgIC8vIGl0eG4uQXNzZXRUcmFuc2ZlcigKICAgIHB1c2hpbnQgNCAvLyBheGZlcgogICAgaXR4bl9maWVsZCBUeXBlRW51bQogICAgaW50Y18wIC8vIDAKICAgIGl0eG5fZmllbGQgRmVlCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weToxMDI3LTEwMzEKICAgIC8vIGl0eG4uQXNzZXRUcmFuc2ZlcigKICAgIC8vICAgICB4ZmVyX2Fzc2V0PWFzc2V0Lm5hdGl2ZSwKICAgIC8vICAgICBhc3NldF9yZWNlaXZlcj1jdXJyZW50X2Jlc3RfYmlkLmJpZGRlci5uYXRpdmUsCiAgICAvLyAgICAgYXNzZXRfYW1vdW50PXNhbGUuYW1vdW50Lm5hdGl2ZSwKICAgIC8vICkuc3VibWl0KCkKICAgIGl0eG5fc3VibWl0CiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weToxMDMzCiAgICAvLyBzZWxmLmF3YXJkX2JpZChzYWxlX2tleSwgc2FsZV9pZCwgY3VycmVudF9iZXN0X2JpZCkKICAgIGNhbGxzdWIgYXdhcmRfYmlkCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuZGlnaXRhbF9tYXJrZXRwbGFjZS5jb250cmFjdC5EaWdpdGFsTWFya2V0cGxhY2Uuc2V0dGxlX2V4cGlyZWQoc2FsZV9rZXlzOiBieXRlcykgLT4gdm9pZDoKc2V0dGxlX2V4cGlyZWQ6CiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weToxMDM1LTEwMzYKICAgIC8vIEBhYmltZXRob2QKICAgIC8vIGRlZiBzZXR0bGVfZXhwaXJlZChzZWxmLCBzYWxlX2tleXM6IGFyYzQuRHluYW1pY0FycmF5W1NhbGVLZXldKSAtPiBOb25lOgogICAgcHJvdG8gMSAwCiAgICBpbnRjXzAgLy8gMAogICAgZHVwbiA1CiAgICBieXRlY18xIC8vICIiCiAgICBkdXAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjEwMzctMTA0NgogICAgLy8gIyBBbnlvbmUgY2FuIHNldHRsZSBleHBpcmVkIHNhbGVzOiB0aGUgYXNzZXQgZ29lcyB0byB0aGUgYmVzdCBiaWRkZXIsIG9yIGJhY2sKICAgIC8vICMgIHRvIHRoZSBvd25lciBpZiB0aGVyZSBhcmUgbm8gYmlkcywgYW5kIHRoZSBib3hlcyBvZiB0aGUgc2FsZSBhcmUgZGVsZXRlZC4KICAgIC8vICMgQSBiZXN0IGJpZGRlciB0aGF0IGNhbiBubyBsb25nZXIgcmVjZWl2ZSB0aGUgYXNzZXQgbG9zZXMgdGhlIHNhbGUsIHRoZWlyIGJpZAogICAgLy8gIyAgaXMgcmVsZWFzZWQgYW5kIHRoZSBhc3NldCBnb2VzIGJhY2sgdG8gdGhlIG93bmVyLiBBIHNhbGUgd2hvc2Ugb3duZXIgY2FuJ3QKICAgIC8vICMgIHJlY2VpdmUgaXQgZWl0aGVyIGlzIHNraXBwZWQgYW5kIHN0YXlzIGV4cGlyZWQgdW50aWwgaXQgY2FuIGJlIHNldHRsZWQuCiAgICAvLyAjIEEgc2FsZSB0aGF0IG5vIGxvbmdlciBleGlzdHMsIGFzIHdoZW4gYW5vdGhlciBjYWxsZXIgc2V0dGxlZCBpdCBmaXJzdCwgaXMKICAgIC8vICMgIHNraXBwZWQgdG9vLCBzbyB0aGF0IGNvbXBldGluZyBjYWxsZXJzIGRvbid0IHJldmVydCBlYWNoIG90aGVyJ3MgYmF0Y2hlcy4KICAgIC8vICMgQWxsIHRoZSBhc3NldCB0cmFuc2ZlcnMgYXJlIHN1Ym1pdHRlZCBhcyBhIHNpbmdsZSBpbm5lciBncm91cCwgd2hvc2UgZmVlcwogICAgLy8gIyAgYXJlIHBhaWQgYnkgdGhlIGNhbGxlci4KICAgIC8vIGFzc2VydCBzYWxlX2tleXMubGVuZ3RoLCBlcnIuTk9fU0FMRVMKICAgIGZyYW1lX2RpZyAtMQogICAgaW50Y18wIC8vIDAKICAgIGV4dHJhY3RfdWludDE2CiAgICBkdXAKICAgIGFzc2VydCAvLyBObyBzYWxlcwogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2UvY29udHJhY3QucHk6MTA0NwogICAgLy8gbl90cmFuc2ZlcnMgPSBVSW50NjQoMCkKICAgIGludGNfMCAvLyAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weToxMDQ4LTEwNDkKICAgIC8vIGJpZF9yZWZ1bmRzID0gVUludDY0KDApCiAgICAvLyBmb3IgaSBpbiB1cmFuZ2Uoc2FsZV9rZXlzLmxlbmd0aCk6CiAgICBkdXBuIDIKCnNldHRsZV9leHBpcmVkX2Zvcl9oZWFkZXJAMToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjEwNDkKICAgIC8vIGZvciBpIGluIHVyYW5nZShzYWxlX2tleXMubGVuZ3RoKToKICAgIGZyYW1lX2RpZyAxMQogICAgZnJhbWVfZGlnIDgKICAgIDwKICAgIGJ6IHNldHRsZV9leHBpcmVkX2FmdGVyX2ZvckAyMQogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2UvY29udHJhY3QucHk6MTA1MAogICAgLy8gc2FsZV9rZXkgPSBzYWxlX2tleXNbaV0KICAgIGZyYW1lX2RpZyAtMQogICAgZXh0cmFjdCAyIDAKICAgIGZyYW1lX2RpZyAxMQogICAgcHVzaGludCA0MCAvLyA0MAogICAgKgogICAgcHVzaGludCA0MCAvLyA0MAogICAgZXh0cmFjdDMgLy8gb24gZXJyb3I6IEluZGV4IGFjY2VzcyBpcyBvdXQgb2YgYm91bmRzCiAgICBkdXAKICAgIGZyYW1lX2J1cnkgNQogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2UvY29udHJhY3QucHk6MTA1MQogICAgLy8gc2FsZSwgZXhpc3RzID0gc2VsZi5zYWxlcy5tYXliZShzYWxlX2tleSkKICAgIGJ5dGVjXzIgLy8gInNhbGVzIgogICAgc3dhcAogICAgY29uY2F0CiAgICBib3hfZ2V0CiAgICBzd2FwCiAgICBmcmFtZV9idXJ5IDMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjEwNTIKICAgIC8vIGlmIG5vdCBleGlzdHM6CiAgICBieiBzZXR0bGVfZXhwaXJlZF9mb3JfZm9vdGVyQDIwCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weToxMDU0CiAgICAvLyBhc3NlcnQgaXNfZXhwaXJlZChzYWxlKSwgZXJyLlNBTEVfTk9UX0VYUElSRUQKICAgIGZyYW1lX2RpZyAzCiAgICBjYWxsc3ViIGlzX2V4cGlyZWQKICAgIGFzc2VydCAvLyBTYWxlIG5vdCBleHBpcmVkCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weToxMDU2CiAgICAvLyByZWNlaXZlciA9IHNhbGVfa2V5Lm93bmVyLm5hdGl2ZQogICAgZnJhbWVfZGlnIDUKICAgIGR1cAogICAgZXh0cmFjdCAwIDMyIC8vIG9uIGVycm9yOiBJbmRleCBhY2Nlc3MgaXMgb3V0IG9mIGJvdW5kcwogICAgZnJhbWVfYnVyeSAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9zdWJyb3V0aW5lcy5weToxOTIKICAgIC8vIG9wLmV4dHJhY3Qob3Auc2hhMjU2KGtleS5ieXRlcyksIDAsIGNzdC5TQUxFX0lEX0xFTkdUSCkKICAgIHNoYTI1NgogICAgZXh0cmFjdCAwIDgKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL3N1YnJvdXRpbmVzLnB5OjE4OC0xOTMKICAgIC8vICMgQ29tcGFjdCA4IGJ5dGVzIGlkZW50aWZpZXIgb2YgYSBzYWxlLCBkZXJpdmVkIGZyb20gaXRzIDQwIGJ5dGVzIGtleSBzbyB0aGF0IGl0CiAgICAvLyAjICBjYW4gYmUgY29tcHV0ZWQgYnkgYW55b25lIGtub3dpbmcgdGhlIChvd25lciwgYXNzZXQpIHBhaXIgd2l0aG91dCBhIGxvb2t1cC4KICAgIC8vICMgUmVhZCBhcyBhIHVpbnQ2NCwgc28gdGhhdCByZWNlaXB0cyBzb3J0ZWQgYnkgc2FsZSBpZCBjb21wYXJlIGFzIGludGVnZXJzLgogICAgLy8gcmV0dXJuIGFyYzQuVUludDY0LmZyb21fYnl0ZXMoCiAgICAvLyAgICAgb3AuZXh0cmFjdChvcC5zaGEyNTYoa2V5LmJ5dGVzKSwgMCwgY3N0LlNBTEVfSURfTEVOR1RIKQogICAgLy8gKQogICAgZHVwCiAgICBmcmFtZV9idXJ5IDQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjEwNTgKICAgIC8vIGJpZCwgaGFzX2JpZCA9IHNlbGYuYmlkcy5tYXliZShzYWxlX2lkKQogICAgYnl0ZWMgNCAvLyAiYmlkcyIKICAgIHN3YXAKICAgIGNvbmNhdAogICAgYm94X2dldAogICAgc3dhcAogICAgZnJhbWVfYnVyeSAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weToxMDU5LTEwNjEKICAgIC8vIGF3YXJkZWQgPSBoYXNfYmlkIGFuZCBjYW5fcmVjZWl2ZV9hc3NldCgKICAgIC8vICAgICBiaWQuYmlkZGVyLm5hdGl2ZSwgc2FsZV9rZXkuYXNzZXQubmF0aXZlCiAgICAvLyApCiAgICBieiBzZXR0bGVfZXhwaXJlZF9ib29sX2ZhbHNlQDcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjEwNjAKICAgIC8vIGJpZC5iaWRkZXIubmF0aXZlLCBzYWxlX2tleS5hc3NldC5uYXRpdmUKICAgIGZyYW1lX2RpZyAwCiAgICBleHRyYWN0IDAgMzIgLy8gb24gZXJyb3I6IEluZGV4IGFjY2VzcyBpcyBvdXQgb2YgYm91bmRzCiAgICBmcmFtZV9kaWcgNQogICAgcHVzaGludCAzMiAvLyAzMgogICAgZXh0cmFjdF91aW50NjQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjEwNTktMTA2MQogICAgLy8gYXdhcmRlZCA9IGhhc19iaWQgYW5kIGNhbl9yZWNlaXZlX2Fzc2V0KAogICAgLy8gICAgIGJpZC5iaWRkZXIubmF0aXZlLCBzYWxlX2tleS5hc3NldC5uYXRpdmUKICAgIC8vICkKICAgIGNhbGxzdWIgY2FuX3JlY2VpdmVfYXNzZXQKICAgIGJ6IHNldHRsZV9leHBpcmVkX2Jvb2xfZmFsc2VANwogICAgaW50Y18xIC8vIDEKICAgIGZyYW1lX2J1cnkgNgoKc2V0dGxlX2V4cGlyZWRfYm9vbF9tZXJnZUA4OgogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2UvY29udHJhY3QucHk6MTA2MgogICAgLy8gaWYgYXdhcmRlZDoKICAgIGZyYW1lX2RpZyA2CiAgICBieiBzZXR0bGVfZXhwaXJlZF9lbHNlX2JvZHlAMTAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjEwNjMKICAgIC8vIHJlY2VpdmVyID0gYmlkLmJpZGRlci5uYXRpdmUKICAgIGZyYW1lX2RpZyAwCiAgICBleHRyYWN0IDAgMzIgLy8gb24gZXJyb3I6IEluZGV4IGFjY2VzcyBpcyBvdXQgb2YgYm91bmRzCiAgICBmcmFtZV9idXJ5IDIKCnNldHRsZV9leHBpcmVkX2FmdGVyX2lmX2Vsc2VAMTM6CiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weToxMDY3CiAgICAvLyBzZWxmLmRlbGV0ZV9zYWxlKHNhbGVfa2V5KQogICAgZnJhbWVfZGlnIDUKICAgIGNhbGxzdWIgZGVsZXRlX3NhbGUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL3N1YnJvdXRpbmVzLnB5OjI2LTI3CiAgICAvLyAjIFRoZSBzaXplIG9mIGEgYm94IGluY2x1ZGVzIGl0cyBuYW1lLCBrZXkgcHJlZml4IGluY2x1ZGVkLgogICAgLy8gcmV0dXJuIGNzdC5CT1hfRkxBVF9NSU5fQkFMQU5DRSArIHNpemUgKiBjc3QuQk9YX0JZVEVfTUlOX0JBTEFOQ0UKICAgIGludGMgNCAvLyAzMDEwMAogICAgZnJhbWVfYnVyeSA3CiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weToxMDY5CiAgICAvLyBpZiBhd2FyZGVkOgogICAgZnJhbWVfZGlnIDYKICAgIGJ6IHNldHRsZV9leHBpcmVkX2Vsc2VfYm9keUAxNQogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2UvY29udHJhY3QucHk6MTA3MAogICAgLy8gb3duZXJfcHJvY2VlZHMgKz0gYmlkLmFtb3VudC5uYXRpdmUKICAgIGZyYW1lX2RpZyAwCiAgICBkdXAKICAgIHB1c2hpbnQgMzIgLy8gMzIKICAgIGV4dHJhY3RfdWludDY0CiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9zdWJyb3V0aW5lcy5weToyNi0yNwogICAgLy8gIyBUaGUgc2l6ZSBvZiBhIGJveCBpbmNsdWRlcyBpdHMgbmFtZSwga2V5IHByZWZpeCBpbmNsdWRlZC4KICAgIC8vIHJldHVybiBjc3QuQk9YX0ZMQVRfTUlOX0JBTEFOQ0UgKyBzaXplICogY3N0LkJPWF9CWVRFX01JTl9CQUxBTkNFCiAgICBpbnRjIDQgLy8gMzAxMDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjEwNzAKICAgIC8vIG93bmVyX3Byb2NlZWRzICs9IGJpZC5hbW91bnQubmF0aXZlCiAgICArCiAgICBmcmFtZV9idXJ5IDcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjEwNzEKICAgIC8vIHNlbGYuYXdhcmRfYmlkKHNhbGVfa2V5LCBzYWxlX2lkLCBiaWQpCiAgICBmcmFtZV9kaWcgNQogICAgZnJhbWVfZGlnIDQKICAgIHVuY292ZXIgMgogICAgY2FsbHN1YiBhd2FyZF9iaWQKCnNldHRsZV9leHBpcmVkX2FmdGVyX2lmX2Vsc2VAMTY6CiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weToxMDc0CiAgICAvLyBzZWxmLmRlcG9zaXRlZFtzYWxlX2tleS5vd25lci5uYXRpdmVdICs9IG93bmVyX3Byb2NlZWRzCiAgICBieXRlY18wIC8vICJkZXBvc2l0ZWQiCiAgICBmcmFtZV9kaWcgMQogICAgY29uY2F0CiAgICBkdXAKICAgIGJveF9nZXQKICAgIHN3YXAKICAgIGJ0b2kKICAgIHN3YXAKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmRlcG9zaXRlZCBlbnRyeSBleGlzdHMKICAgIGZyYW1lX2RpZyA3CiAgICArCiAgICBpdG9iCiAgICBib3hfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weToxMDc2CiAgICAvLyBpZiBuX3RyYW5zZmVycyA9PSAwOgogICAgZnJhbWVfZGlnIDkKICAgIGJueiBzZXR0bGVfZXhwaXJlZF9lbHNlX2JvZHlAMTgKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjEwNzcKICAgIC8vIG9wLklUeG5DcmVhdGUuYmVnaW4oKQogICAgaXR4bl9iZWdpbgoKc2V0dGxlX2V4cGlyZWRfYWZ0ZXJfaWZfZWxzZUAxOToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjEwODAKICAgIC8vIG9wLklUeG5DcmVhdGUuc2V0X3R5cGVfZW51bShUcmFuc2FjdGlvblR5cGUuQXNzZXRUcmFuc2ZlcikKICAgIHB1c2hpbnQgNCAvLyBheGZlcgogICAgaXR4bl9maWVsZCBUeXBlRW51bQogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2UvY29udHJhY3QucHk6MTA4MQogICAgLy8gb3AuSVR4bkNyZWF0ZS5zZXRfZmVlKDApCiAgICBpbnRjXzAgLy8gMAogICAgaXR4bl9maWVsZCBGZWUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjEwODIKICAgIC8vIG9wLklUeG5DcmVhdGUuc2V0X3hmZXJfYXNzZXQoc2FsZV9rZXkuYXNzZXQubmF0aXZlKQogICAgZnJhbWVfZGlnIDUKICAgIHB1c2hpbnQgMzIgLy8gMzIKICAgIGV4dHJhY3RfdWludDY0CiAgICBpdHhuX2ZpZWxkIFhmZXJBc3NldAogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2UvY29udHJhY3QucHk6MTA4MwogICAgLy8gb3AuSVR4bkNyZWF0ZS5zZXRfYXNzZXRfcmVjZWl2ZXIocmVjZWl2ZXIpCiAgICBmcmFtZV9kaWcgMgogICAgaXR4bl9maWVsZCBBc3NldFJlY2VpdmVyCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weToxMDg0CiAgICAvLyBvcC5JVHhuQ3JlYXRlLnNldF9hc3NldF9hbW91bnQoc2FsZS5hbW91bnQubmF0aXZlKQogICAgZnJhbWVfZGlnIDMKICAgIGludGNfMCAvLyAwCiAgICBleHRyYWN0X3VpbnQ2NAogICAgaXR4bl9maWVsZCBBc3NldEFtb3VudAogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2UvY29udHJhY3QucHk6MTA4NQogICAgLy8gbl90cmFuc2ZlcnMgKz0gMQogICAgZnJhbWVfZGlnIDkKICAgIGludGNfMSAvLyAxCiAgICArCiAgICBmcmFtZV9idXJ5IDkKCnNldHRsZV9leHBpcmVkX2Zvcl9mb290ZXJAMjA6CiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weToxMDQ5CiAgICAvLyBmb3IgaSBpbiB1cmFuZ2Uoc2FsZV9rZXlzLmxlbmd0aCk6CiAgICBmcmFtZV9kaWcgMTEKICAgIGludGNfMSAvLyAxCiAgICArCiAgICBmcmFtZV9idXJ5IDExCiAgICBiIHNldHRsZV9leHBpcmVkX2Zvcl9oZWFkZXJAMQoKc2V0dGxlX2V4cGlyZWRfZWxzZV9ib2R5QDE4OgogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2UvY29udHJhY3QucHk6MTA3OQogICAgLy8gb3AuSVR4bkNyZWF0ZS5uZXh0KCkKICAgIGl0eG5fbmV4dAogICAgYiBzZXR0bGVfZXhwaXJlZF9hZnRlcl9pZl9lbHNlQDE5CgpzZXR0bGVfZXhwaXJlZF9lbHNlX2JvZHlAMTU6CiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weToxMDczCiAgICAvLyBiaWRfcmVmdW5kcyArPSBzZWxmLmRyb3BfYmlkKHNhbGVfa2V5LCBzYWxlX2lkKQogICAgZnJhbWVfZGlnIDUKICAgIGZyYW1lX2RpZyA0CiAgICBjYWxsc3ViIGRyb3BfYmlkCiAgICBmcmFtZV9kaWcgMTAKICAgICsKICAgIGZyYW1lX2J1cnkgMTAKICAgIGIgc2V0dGxlX2V4cGlyZWRfYWZ0ZXJfaWZfZWxzZUAxNgoKc2V0dGxlX2V4cGlyZWRfZWxzZV9ib2R5QDEwOgogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2UvY29udHJhY3QucHk6MTA2NAogICAgLy8gZWxpZiBub3QgY2FuX3JlY2VpdmVfYXNzZXQocmVjZWl2ZXIsIHNhbGVfa2V5LmFzc2V0Lm5hdGl2ZSk6CiAgICBmcmFtZV9kaWcgNQogICAgcHVzaGludCAzMiAvLyAzMgogICAgZXh0cmFjdF91aW50NjQKICAgIGZyYW1lX2RpZyAxCiAgICBzd2FwCiAgICBjYWxsc3ViIGNhbl9yZWNlaXZlX2Fzc2V0CiAgICBieiBzZXR0bGVfZXhwaXJlZF9mb3JfZm9vdGVyQDIwCiAgICBmcmFtZV9kaWcgMQogICAgZnJhbWVfYnVyeSAyCiAgICBiIHNldHRsZV9leHBpcmVkX2FmdGVyX2lmX2Vsc2VAMTMKCnNldHRsZV9leHBpcmVkX2Jvb2xfZmFsc2VANzoKICAgIGludGNfMCAvLyAwCiAgICBmcmFtZV9idXJ5IDYKICAgIGIgc2V0dGxlX2V4cGlyZWRfYm9vbF9tZXJnZUA4CgpzZXR0bGVfZXhwaXJlZF9hZnRlcl9mb3JAMjE6CiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weToxMDg2CiAgICAvLyBpZiBuX3RyYW5zZmVyczoKICAgIGZyYW1lX2RpZyA5CiAgICBieiBzZXR0bGVfZXhwaXJlZF9hZnRlcl9pZl9lbHNlQDIzCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weToxMDg3CiAgICAvLyBvcC5JVHhuQ3JlYXRlLnN1Ym1pdCgpCiAgICBpdHhuX3N1Ym1pdAoKc2V0dGxlX2V4cGlyZWRfYWZ0ZXJfaWZfZWxzZUAyMzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjEwODgtMTA4OQogICAgLy8gIyBUaGUgY2FsbGVyIGlzIHJlZnVuZGVkIGhlcmUgaWYgb25lIG9mIHRoZSByZWxlYXNlZCBiaWRzIHdhcyB0aGVpcnMuCiAgICAvLyBpZiBiaWRfcmVmdW5kczoKICAgIGZyYW1lX2RpZyAxMAogICAgYnogc2V0dGxlX2V4cGlyZWRfYWZ0ZXJfaWZfZWxzZUAyNQogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2UvY29udHJhY3QucHk6MTA5MAogICAgLy8gc2VsZi5kZXBvc2l0ZWRbVHhuLnNlbmRlcl0gKz0gYmlkX3JlZnVuZHMKICAgIGJ5dGVjXzAgLy8gImRlcG9zaXRlZCIKICAgIHR4biBTZW5kZXIKICAgIGNvbmNhdAogICAgZHVwCiAgICBib3hfZ2V0CiAgICBzd2FwCiAgICBidG9pCiAgICBzd2FwCiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5kZXBvc2l0ZWQgZW50cnkgZXhpc3RzCiAgICBmcmFtZV9kaWcgMTAKICAgICsKICAgIGl0b2IKICAgIGJveF9wdXQKCnNldHRsZV9leHBpcmVkX2FmdGVyX2lmX2Vsc2VAMjU6CiAgICByZXRzdWIK", "clear": "I3ByYWdtYSB2ZXJzaW9uIDEwCiNwcmFnbWEgdHlwZXRyYWNrIGZhbHNlCgovLyBhbGdvcHkuYXJjNC5BUkM0Q29udHJhY3QuY2xlYXJfc3RhdGVfcHJvZ3JhbSgpIC0+IHVpbnQ2NDoKbWFpbjoKICAgIHB1c2hpbnQgMSAvLyAxCiAgICByZXR1cm4K"}, "sourceInfo": {"approval": {"pcOffsetMethod": "none", "sourceInfo": [{"pc": [1642], "errorMessage": "Already opted in"}, {"pc": [1651], "errorMessage": "Clawback ASA"}, {"pc": [1407, 1826], "errorMessage": "Different sender"}, {"pc": [4426], "errorMessage": "Encumbered bid"}, {"pc": [1114, 1131, 1187, 1350, 1727, 1736, 1741, 1746, 1772, 1781, 1800, 1809, 1980, 2121, 2228, 2282, 2408, 2477, 2485, 2599, 2600, 2707, 2762, 2794, 2829, 2880, 2933, 2990, 2998, 3003, 3027, 3059, 3341, 3360, 3546, 3596, 3854, 3858, 4269, 4529, 4638, 4767, 4999, 5061, 5084, 5109, 5133], "errorMessage": "Index access is out of bounds"}, {"pc": [1905], "errorMessage": "Invalid expiry"}, {"pc": [3770], "errorMessage": "Invalid page count"}, {"pc": [2269], "errorMessage": "Invalid quantity"}, {"pc": [3314], "errorMessage": "Length mismatch"}, {"pc": [2652], "errorMessage": "Max total cost exceeded"}, {"pc": [2447, 5037], "errorMessage": "No sales"}, {"pc": [3925, 3996, 4058, 4113, 4175, 4196], "errorMessage": "Nothing to claim"}, {"pc": [358, 373, 388, 408, 428, 449, 469, 491, 506, 524, 542, 557, 572, 587, 599, 617, 635, 653, 671, 689, 704, 722, 737, 766, 792, 810, 819, 834], "errorMessage": "OnCompletion is not NoOp"}, {"pc": [3779, 3786], "errorMessage": "Receipt book in use"}, {"pc": [1851], "errorMessage": "Sale already exists"}, {"pc": [2056, 2140, 2250, 2508, 2955], "errorMessage": "Sale expired"}, {"pc": [5080], "errorMessage": "Sale not expired"}, {"pc": [2950], "errorMessage": "Sale not found"}, {"pc": [2940], "errorMessage": "Seller cannot be bidder"}, {"pc": [2128, 2235, 2492], "errorMessage": "Seller cannot be buyer"}, {"pc": [2979], "errorMessage": "Worse bid"}, {"pc": [1415, 1834], "errorMessage": "Wrong receiver"}, {"pc": [1647], "errorMessage": "asset exists"}, {"pc": [861], "errorMessage": "can only call when creating"}, {"pc": [361, 376, 391, 411, 431, 452, 472, 494, 509, 527, 545, 560, 575, 590, 602, 620, 638, 656, 674, 692, 707, 725, 740, 769, 795, 813, 822, 837], "errorMessage": "can only call when not creating"}, {"pc": [2743], "errorMessage": "check self.bid_totals entry exists"}, {"pc": [4966], "errorMessage": "check self.bids entry exists"}, {"pc": [1463, 1602, 1683, 1889, 1924, 2002, 2095, 2207, 2384, 2622, 2904, 3070, 3735, 3881, 3981, 4019, 4040, 4384, 4447, 4832, 4981, 5181, 5298], "errorMessage": "check self.deposited entry exists"}, {"pc": [4417], "errorMessage": "check self.isolated_receipts entry exists"}, {"pc": [3685], "errorMessage": "check self.receipt_book entry exists"}, {"pc": [2036, 2134, 2245, 2503, 4959], "errorMessage": "check self.sales entry exists"}, {"pc": [923, 1483, 1584, 3196, 3818], "errorMessage": "overflow"}, {"pc": [751, 780, 1967], "errorMessage": "transaction type is axfer"}, {"pc": [847], "errorMessage": "transaction type is pay"}]}, "clear": {"pcOffsetMethod": "none", "sourceInfo": []}}, "templateVariables": {}}"""
 APP_SPEC = algokit_utils.Arc56Contract.from_json(_APP_SPEC_JSON)
 
 def _parse_abi_args(args: object | None = None) -> list[object] | None:
@@ -64,18 +64,32 @@ def _init_dataclass(cls: type, data: dict) -> object:
             field_values[field.name] = field_value
     return cls(**field_values)
 
+@dataclasses.dataclass(frozen=True)
+class AssetBook:
+    """Struct for AssetBook"""
+    n_untracked: int
+    slots: tuple[tuple[str, int, int], tuple[str, int, int], tuple[str, int, int], tuple[str, int, int]]
+
 @dataclasses.dataclass(frozen=True)
 class Bid:
     """Struct for Bid"""
     bidder: str
     amount: int
+    isolated: bool
+
+@dataclasses.dataclass(frozen=True)
+class BidTotals:
+    """Struct for BidTotals"""
+    committed: int
+    winning: int
+    n_pages: int
 
 @dataclasses.dataclass(frozen=True)
 class Sale:
     """Struct for Sale"""
     amount: int
     cost: int
-    bid: Bid
+    expires_at: int
 
 @dataclasses.dataclass(frozen=True)
 class SaleKey:
@@ -127,6 +141,26 @@ class OpenSaleArgs:
     def abi_method_signature(self) -> str:
         return "open_sale(axfer,uint64)void"
 
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class OpenExpiringSaleArgs:
+    """Dataclass for open_expiring_sale arguments"""
+    asset_deposit: algokit_utils.AppMethodCallTransactionArgument
+    cost: int
+    expires_at: int
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "open_expiring_sale(axfer,uint64,uint64)void"
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class OpenSalesArgs:
+    """Dataclass for open_sales arguments"""
+    costs: list[int]
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "open_sales(uint64[])void"
+
 @dataclasses.dataclass(frozen=True, kw_only=True)
 class CloseSaleArgs:
     """Dataclass for close_sale arguments"""
@@ -145,6 +179,26 @@ class BuyArgs:
     def abi_method_signature(self) -> str:
         return "buy((address,uint64))void"
 
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class BuyPartialArgs:
+    """Dataclass for buy_partial arguments"""
+    sale_key: SaleKey
+    quantity: int
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "buy_partial((address,uint64),uint64)void"
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class BuyManyArgs:
+    """Dataclass for buy_many arguments"""
+    sale_keys: list[tuple[str, int]]
+    max_total_cost: int
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "buy_many((address,uint64)[],uint64)void"
+
 @dataclasses.dataclass(frozen=True, kw_only=True)
 class BidArgs:
     """Dataclass for bid arguments"""
@@ -155,6 +209,118 @@ class BidArgs:
     def abi_method_signature(self) -> str:
         return "bid((address,uint64),uint64)void"
 
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class BidManyArgs:
+    """Dataclass for bid_many arguments"""
+    sale_keys: list[tuple[str, int]]
+    amounts: list[int]
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "bid_many((address,uint64)[],uint64[])void"
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class IsolatedBidArgs:
+    """Dataclass for isolated_bid arguments"""
+    sale_key: SaleKey
+    new_bid_amount: int
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "isolated_bid((address,uint64),uint64)void"
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class OpenReceiptPagesArgs:
+    """Dataclass for open_receipt_pages arguments"""
+    n_pages: int
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "open_receipt_pages(uint64)void"
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class ClaimUnencumberedBidsOfPageArgs:
+    """Dataclass for claim_unencumbered_bids_of_page arguments"""
+    page: int
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "claim_unencumbered_bids_of_page(uint64)void"
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class PruneUnencumberedBidsArgs:
+    """Dataclass for prune_unencumbered_bids arguments"""
+    bidder: str
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "prune_unencumbered_bids(address)void"
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class PruneUnencumberedBidsOfPageArgs:
+    """Dataclass for prune_unencumbered_bids_of_page arguments"""
+    bidder: str
+    page: int
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "prune_unencumbered_bids_of_page(address,uint64)void"
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class ClaimUnencumberedBidsPageArgs:
+    """Dataclass for claim_unencumbered_bids_page arguments"""
+    offset: int
+    limit: int
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "claim_unencumbered_bids_page(uint64,uint64)void"
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class ClaimIsolatedBidArgs:
+    """Dataclass for claim_isolated_bid arguments"""
+    sale_key: SaleKey
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "claim_isolated_bid((address,uint64))void"
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class GetTotalAndUnencumberedBidsOfArgs:
+    """Dataclass for get_total_and_unencumbered_bids_of arguments"""
+    bidders: list[str]
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "get_total_and_unencumbered_bids_of(address[])(uint64,uint64)[]"
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class GetReceiptCountArgs:
+    """Dataclass for get_receipt_count arguments"""
+    bidder: str
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "get_receipt_count(address)uint64"
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class GetReceiptPagesArgs:
+    """Dataclass for get_receipt_pages arguments"""
+    bidder: str
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "get_receipt_pages(address)uint16[]"
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class GetSalesArgs:
+    """Dataclass for get_sales arguments"""
+    sale_keys: list[tuple[str, int]]
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "get_sales((address,uint64)[])((uint64,uint64,uint64),(address,uint64,bool))[]"
+
 @dataclasses.dataclass(frozen=True, kw_only=True)
 class AcceptBidArgs:
     """Dataclass for accept_bid arguments"""
@@ -164,6 +330,15 @@ class AcceptBidArgs:
     def abi_method_signature(self) -> str:
         return "accept_bid(uint64)void"
 
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class SettleExpiredArgs:
+    """Dataclass for settle_expired arguments"""
+    sale_keys: list[tuple[str, int]]
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "settle_expired((address,uint64)[])void"
+
 
 class DigitalMarketplaceParams:
     def __init__(self, app_client: algokit_utils.AppClient):
@@ -195,6 +370,17 @@ class DigitalMarketplaceParams:
             "args": method_args,
         }))
 
+    def add_resources(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+    
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "add_resources()void",
+        }))
+
     def sponsor_asset(
         self,
         args: tuple[int] | SponsorAssetArgs,
@@ -221,6 +407,32 @@ class DigitalMarketplaceParams:
             "args": method_args,
         }))
 
+    def open_expiring_sale(
+        self,
+        args: tuple[algokit_utils.AppMethodCallTransactionArgument, int, int] | OpenExpiringSaleArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "open_expiring_sale(axfer,uint64,uint64)void",
+            "args": method_args,
+        }))
+
+    def open_sales(
+        self,
+        args: tuple[list[int]] | OpenSalesArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "open_sales(uint64[])void",
+            "args": method_args,
+        }))
+
     def close_sale(
         self,
         args: tuple[int] | CloseSaleArgs,
@@ -247,501 +459,1280 @@ class DigitalMarketplaceParams:
             "args": method_args,
         }))
 
-    def bid(
+    def buy_partial(
         self,
-        args: tuple[SaleKey, int] | BidArgs,
+        args: tuple[SaleKey, int] | BuyPartialArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> algokit_utils.AppCallMethodCallParams:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
         return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "bid((address,uint64),uint64)void",
+            "method": "buy_partial((address,uint64),uint64)void",
             "args": method_args,
         }))
 
-    def claim_unencumbered_bids(
+    def buy_many(
         self,
+        args: tuple[list[tuple[str, int]], int] | BuyManyArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> algokit_utils.AppCallMethodCallParams:
-    
+        method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
         return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "claim_unencumbered_bids()void",
+            "method": "buy_many((address,uint64)[],uint64)void",
+            "args": method_args,
         }))
 
-    def get_total_and_unencumbered_bids(
+    def bid(
         self,
+        args: tuple[SaleKey, int] | BidArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> algokit_utils.AppCallMethodCallParams:
-    
+        method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
         return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "get_total_and_unencumbered_bids()(uint64,uint64)",
+            "method": "bid((address,uint64),uint64)void",
+            "args": method_args,
         }))
 
-    def accept_bid(
+    def bid_many(
         self,
-        args: tuple[int] | AcceptBidArgs,
+        args: tuple[list[tuple[str, int]], list[int]] | BidManyArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> algokit_utils.AppCallMethodCallParams:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
         return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "accept_bid(uint64)void",
+            "method": "bid_many((address,uint64)[],uint64[])void",
             "args": method_args,
         }))
 
-    def clear_state(
-        self,
-        params: algokit_utils.AppClientBareCallParams | None = None,
-        
-    ) -> algokit_utils.AppCallParams:
-        return self.app_client.params.bare.clear_state(
-            params,
-            
-        )
-
-
-class DigitalMarketplaceCreateTransactionParams:
-    def __init__(self, app_client: algokit_utils.AppClient):
-        self.app_client = app_client
-
-    def deposit(
+    def isolated_bid(
         self,
-        args: tuple[algokit_utils.AppMethodCallTransactionArgument] | DepositArgs,
+        args: tuple[SaleKey, int] | IsolatedBidArgs,
         params: algokit_utils.CommonAppCallParams | None = None
-    ) -> algokit_utils.BuiltTransactions:
+    ) -> algokit_utils.AppCallMethodCallParams:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "deposit(pay)void",
+            "method": "isolated_bid((address,uint64),uint64)void",
             "args": method_args,
         }))
 
-    def withdraw(
+    def claim_unencumbered_bids(
         self,
-        args: tuple[int] | WithdrawArgs,
         params: algokit_utils.CommonAppCallParams | None = None
-    ) -> algokit_utils.BuiltTransactions:
-        method_args = _parse_abi_args(args)
+    ) -> algokit_utils.AppCallMethodCallParams:
+    
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "withdraw(uint64)void",
-            "args": method_args,
+            "method": "claim_unencumbered_bids()void",
         }))
 
-    def sponsor_asset(
+    def open_receipt_pages(
         self,
-        args: tuple[int] | SponsorAssetArgs,
+        args: tuple[int] | OpenReceiptPagesArgs,
         params: algokit_utils.CommonAppCallParams | None = None
-    ) -> algokit_utils.BuiltTransactions:
+    ) -> algokit_utils.AppCallMethodCallParams:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "sponsor_asset(asset)void",
+            "method": "open_receipt_pages(uint64)void",
             "args": method_args,
         }))
 
-    def open_sale(
+    def claim_unencumbered_bids_of_page(
         self,
-        args: tuple[algokit_utils.AppMethodCallTransactionArgument, int] | OpenSaleArgs,
+        args: tuple[int] | ClaimUnencumberedBidsOfPageArgs,
         params: algokit_utils.CommonAppCallParams | None = None
-    ) -> algokit_utils.BuiltTransactions:
+    ) -> algokit_utils.AppCallMethodCallParams:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "open_sale(axfer,uint64)void",
+            "method": "claim_unencumbered_bids_of_page(uint64)void",
             "args": method_args,
         }))
 
-    def close_sale(
+    def prune_unencumbered_bids(
         self,
-        args: tuple[int] | CloseSaleArgs,
+        args: tuple[str] | PruneUnencumberedBidsArgs,
         params: algokit_utils.CommonAppCallParams | None = None
-    ) -> algokit_utils.BuiltTransactions:
+    ) -> algokit_utils.AppCallMethodCallParams:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "close_sale(asset)void",
+            "method": "prune_unencumbered_bids(address)void",
             "args": method_args,
         }))
 
-    def buy(
+    def prune_unencumbered_bids_of_page(
         self,
-        args: tuple[SaleKey] | BuyArgs,
+        args: tuple[str, int] | PruneUnencumberedBidsOfPageArgs,
         params: algokit_utils.CommonAppCallParams | None = None
-    ) -> algokit_utils.BuiltTransactions:
+    ) -> algokit_utils.AppCallMethodCallParams:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "buy((address,uint64))void",
+            "method": "prune_unencumbered_bids_of_page(address,uint64)void",
             "args": method_args,
         }))
 
-    def bid(
+    def claim_unencumbered_bids_page(
         self,
-        args: tuple[SaleKey, int] | BidArgs,
+        args: tuple[int, int] | ClaimUnencumberedBidsPageArgs,
         params: algokit_utils.CommonAppCallParams | None = None
-    ) -> algokit_utils.BuiltTransactions:
+    ) -> algokit_utils.AppCallMethodCallParams:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "bid((address,uint64),uint64)void",
+            "method": "claim_unencumbered_bids_page(uint64,uint64)void",
             "args": method_args,
         }))
 
-    def claim_unencumbered_bids(
+    def claim_isolated_bid(
         self,
+        args: tuple[SaleKey] | ClaimIsolatedBidArgs,
         params: algokit_utils.CommonAppCallParams | None = None
-    ) -> algokit_utils.BuiltTransactions:
-    
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "claim_unencumbered_bids()void",
+            "method": "claim_isolated_bid((address,uint64))void",
+            "args": method_args,
         }))
 
     def get_total_and_unencumbered_bids(
         self,
         params: algokit_utils.CommonAppCallParams | None = None
-    ) -> algokit_utils.BuiltTransactions:
+    ) -> algokit_utils.AppCallMethodCallParams:
     
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
             "method": "get_total_and_unencumbered_bids()(uint64,uint64)",
         }))
 
-    def accept_bid(
+    def get_total_and_unencumbered_bids_of(
         self,
-        args: tuple[int] | AcceptBidArgs,
+        args: tuple[list[str]] | GetTotalAndUnencumberedBidsOfArgs,
         params: algokit_utils.CommonAppCallParams | None = None
-    ) -> algokit_utils.BuiltTransactions:
+    ) -> algokit_utils.AppCallMethodCallParams:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "accept_bid(uint64)void",
+            "method": "get_total_and_unencumbered_bids_of(address[])(uint64,uint64)[]",
             "args": method_args,
         }))
 
-    def clear_state(
+    def get_receipt_count(
         self,
-        params: algokit_utils.AppClientBareCallParams | None = None,
-        
-    ) -> Transaction:
-        return self.app_client.create_transaction.bare.clear_state(
-            params,
-            
-        )
-
+        args: tuple[str] | GetReceiptCountArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_receipt_count(address)uint64",
+            "args": method_args,
+        }))
 
-class DigitalMarketplaceSend:
-    def __init__(self, app_client: algokit_utils.AppClient):
-        self.app_client = app_client
+    def get_receipt_pages(
+        self,
+        args: tuple[str] | GetReceiptPagesArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_receipt_pages(address)uint16[]",
+            "args": method_args,
+        }))
+
+    def get_sales(
+        self,
+        args: tuple[list[tuple[str, int]]] | GetSalesArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_sales((address,uint64)[])((uint64,uint64,uint64),(address,uint64,bool))[]",
+            "args": method_args,
+        }))
+
+    def accept_bid(
+        self,
+        args: tuple[int] | AcceptBidArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "accept_bid(uint64)void",
+            "args": method_args,
+        }))
+
+    def settle_expired(
+        self,
+        args: tuple[list[tuple[str, int]]] | SettleExpiredArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "settle_expired((address,uint64)[])void",
+            "args": method_args,
+        }))
+
+    def clear_state(
+        self,
+        params: algokit_utils.AppClientBareCallParams | None = None,
+        
+    ) -> algokit_utils.AppCallParams:
+        return self.app_client.params.bare.clear_state(
+            params,
+            
+        )
+
+
+class DigitalMarketplaceCreateTransactionParams:
+    def __init__(self, app_client: algokit_utils.AppClient):
+        self.app_client = app_client
 
     def deposit(
         self,
         args: tuple[algokit_utils.AppMethodCallTransactionArgument] | DepositArgs,
-        params: algokit_utils.CommonAppCallParams | None = None,
-        send_params: algokit_utils.SendParams | None = None
-    ) -> algokit_utils.SendAppTransactionResult[None]:
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
             "method": "deposit(pay)void",
             "args": method_args,
-        }), send_params=send_params)
-        parsed_response = response
-        return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
+        }))
 
     def withdraw(
         self,
         args: tuple[int] | WithdrawArgs,
-        params: algokit_utils.CommonAppCallParams | None = None,
-        send_params: algokit_utils.SendParams | None = None
-    ) -> algokit_utils.SendAppTransactionResult[None]:
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
             "method": "withdraw(uint64)void",
             "args": method_args,
-        }), send_params=send_params)
-        parsed_response = response
-        return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
+        }))
+
+    def add_resources(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+    
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "add_resources()void",
+        }))
 
     def sponsor_asset(
         self,
         args: tuple[int] | SponsorAssetArgs,
-        params: algokit_utils.CommonAppCallParams | None = None,
-        send_params: algokit_utils.SendParams | None = None
-    ) -> algokit_utils.SendAppTransactionResult[None]:
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
             "method": "sponsor_asset(asset)void",
             "args": method_args,
-        }), send_params=send_params)
-        parsed_response = response
-        return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
+        }))
 
     def open_sale(
         self,
         args: tuple[algokit_utils.AppMethodCallTransactionArgument, int] | OpenSaleArgs,
-        params: algokit_utils.CommonAppCallParams | None = None,
-        send_params: algokit_utils.SendParams | None = None
-    ) -> algokit_utils.SendAppTransactionResult[None]:
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
             "method": "open_sale(axfer,uint64)void",
             "args": method_args,
-        }), send_params=send_params)
-        parsed_response = response
-        return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
+        }))
+
+    def open_expiring_sale(
+        self,
+        args: tuple[algokit_utils.AppMethodCallTransactionArgument, int, int] | OpenExpiringSaleArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "open_expiring_sale(axfer,uint64,uint64)void",
+            "args": method_args,
+        }))
+
+    def open_sales(
+        self,
+        args: tuple[list[int]] | OpenSalesArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "open_sales(uint64[])void",
+            "args": method_args,
+        }))
 
     def close_sale(
         self,
         args: tuple[int] | CloseSaleArgs,
-        params: algokit_utils.CommonAppCallParams | None = None,
-        send_params: algokit_utils.SendParams | None = None
-    ) -> algokit_utils.SendAppTransactionResult[None]:
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
             "method": "close_sale(asset)void",
             "args": method_args,
-        }), send_params=send_params)
-        parsed_response = response
-        return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
+        }))
 
     def buy(
         self,
         args: tuple[SaleKey] | BuyArgs,
-        params: algokit_utils.CommonAppCallParams | None = None,
-        send_params: algokit_utils.SendParams | None = None
-    ) -> algokit_utils.SendAppTransactionResult[None]:
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
             "method": "buy((address,uint64))void",
             "args": method_args,
-        }), send_params=send_params)
-        parsed_response = response
-        return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
+        }))
+
+    def buy_partial(
+        self,
+        args: tuple[SaleKey, int] | BuyPartialArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "buy_partial((address,uint64),uint64)void",
+            "args": method_args,
+        }))
+
+    def buy_many(
+        self,
+        args: tuple[list[tuple[str, int]], int] | BuyManyArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "buy_many((address,uint64)[],uint64)void",
+            "args": method_args,
+        }))
 
     def bid(
         self,
         args: tuple[SaleKey, int] | BidArgs,
-        params: algokit_utils.CommonAppCallParams | None = None,
-        send_params: algokit_utils.SendParams | None = None
-    ) -> algokit_utils.SendAppTransactionResult[None]:
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
             "method": "bid((address,uint64),uint64)void",
             "args": method_args,
-        }), send_params=send_params)
-        parsed_response = response
-        return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
+        }))
+
+    def bid_many(
+        self,
+        args: tuple[list[tuple[str, int]], list[int]] | BidManyArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "bid_many((address,uint64)[],uint64[])void",
+            "args": method_args,
+        }))
+
+    def isolated_bid(
+        self,
+        args: tuple[SaleKey, int] | IsolatedBidArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "isolated_bid((address,uint64),uint64)void",
+            "args": method_args,
+        }))
 
     def claim_unencumbered_bids(
         self,
-        params: algokit_utils.CommonAppCallParams | None = None,
-        send_params: algokit_utils.SendParams | None = None
-    ) -> algokit_utils.SendAppTransactionResult[None]:
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
     
         params = params or algokit_utils.CommonAppCallParams()
-        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
             "method": "claim_unencumbered_bids()void",
-        }), send_params=send_params)
-        parsed_response = response
-        return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
+        }))
 
-    def get_total_and_unencumbered_bids(
+    def open_receipt_pages(
         self,
-        params: algokit_utils.CommonAppCallParams | None = None,
-        send_params: algokit_utils.SendParams | None = None
-    ) -> algokit_utils.SendAppTransactionResult[UnencumberedBidsReceipt]:
-    
+        args: tuple[int] | OpenReceiptPagesArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "get_total_and_unencumbered_bids()(uint64,uint64)",
-        }), send_params=send_params)
-        parsed_response = dataclasses.replace(response, abi_return=_init_dataclass(UnencumberedBidsReceipt, typing.cast(dict, response.abi_return))) # type: ignore
-        return typing.cast(algokit_utils.SendAppTransactionResult[UnencumberedBidsReceipt], parsed_response)
+            "method": "open_receipt_pages(uint64)void",
+            "args": method_args,
+        }))
 
-    def accept_bid(
+    def claim_unencumbered_bids_of_page(
         self,
-        args: tuple[int] | AcceptBidArgs,
-        params: algokit_utils.CommonAppCallParams | None = None,
-        send_params: algokit_utils.SendParams | None = None
-    ) -> algokit_utils.SendAppTransactionResult[None]:
+        args: tuple[int] | ClaimUnencumberedBidsOfPageArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "accept_bid(uint64)void",
+            "method": "claim_unencumbered_bids_of_page(uint64)void",
             "args": method_args,
-        }), send_params=send_params)
-        parsed_response = response
-        return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
+        }))
 
-    def clear_state(
+    def prune_unencumbered_bids(
         self,
-        params: algokit_utils.AppClientBareCallParams | None = None,
-        send_params: algokit_utils.SendParams | None = None
-    ) -> algokit_utils.SendAppTransactionResult[algokit_utils.ABIReturn]:
-        return self.app_client.send.bare.clear_state(
-            params,
-            send_params=send_params,
-        )
-
-
-class DigitalMarketplaceState:
-    """Methods to access state for the current DigitalMarketplace app"""
-
-    def __init__(self, app_client: algokit_utils.AppClient):
-        self.app_client = app_client
+        args: tuple[str] | PruneUnencumberedBidsArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "prune_unencumbered_bids(address)void",
+            "args": method_args,
+        }))
 
-    @property
-    def box(
-        self
-    ) -> "_BoxState":
-            """Methods to access box for the current app"""
-            return _BoxState(self.app_client)
+    def prune_unencumbered_bids_of_page(
+        self,
+        args: tuple[str, int] | PruneUnencumberedBidsOfPageArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "prune_unencumbered_bids_of_page(address,uint64)void",
+            "args": method_args,
+        }))
 
-class _BoxState:
-    def __init__(self, app_client: algokit_utils.AppClient):
-        self.app_client = app_client
-        
-        # Pre-generated mapping of value types to their struct classes
-        self._struct_classes: dict[str, typing.Type[typing.Any]] = {
-            "Sale": Sale
-        }
+    def claim_unencumbered_bids_page(
+        self,
+        args: tuple[int, int] | ClaimUnencumberedBidsPageArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "claim_unencumbered_bids_page(uint64,uint64)void",
+            "args": method_args,
+        }))
 
-    def get_all(self) -> dict[str, typing.Any]:
-        """Get all current keyed values from box state"""
-        result = self.app_client.state.box.get_all()
-        if not result:
-            return {}
+    def claim_isolated_bid(
+        self,
+        args: tuple[SaleKey] | ClaimIsolatedBidArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "claim_isolated_bid((address,uint64))void",
+            "args": method_args,
+        }))
 
-        converted = {}
-        for key, value in result.items():
-            key_info = self.app_client.app_spec.state.keys.box.get(key)
-            struct_class = self._struct_classes.get(key_info.value_type) if key_info else None
-            converted[key] = (
-                _init_dataclass(struct_class, value) if struct_class and isinstance(value, dict)
-                else value
-            )
-        return converted
+    def get_total_and_unencumbered_bids(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+    
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_total_and_unencumbered_bids()(uint64,uint64)",
+        }))
 
-    @property
-    def deposited(self) -> "_MapState[str, int]":
-        """Get values from the deposited map in box state"""
-        return _MapState(
-            self.app_client.state.box,
-            "deposited",
-            None
-        )
+    def get_total_and_unencumbered_bids_of(
+        self,
+        args: tuple[list[str]] | GetTotalAndUnencumberedBidsOfArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_total_and_unencumbered_bids_of(address[])(uint64,uint64)[]",
+            "args": method_args,
+        }))
 
-    @property
-    def sales(self) -> "_MapState[SaleKey, Sale]":
-        """Get values from the sales map in box state"""
-        return _MapState(
-            self.app_client.state.box,
-            "sales",
-            self._struct_classes.get("Sale")
-        )
+    def get_receipt_count(
+        self,
+        args: tuple[str] | GetReceiptCountArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_receipt_count(address)uint64",
+            "args": method_args,
+        }))
 
-    @property
-    def receipt_book(self) -> "_MapState[str, list[tuple[tuple[str, int], int]]]":
-        """Get values from the receipt_book map in box state"""
-        return _MapState(
-            self.app_client.state.box,
-            "receipt_book",
-            None
-        )
+    def get_receipt_pages(
+        self,
+        args: tuple[str] | GetReceiptPagesArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_receipt_pages(address)uint16[]",
+            "args": method_args,
+        }))
 
-_KeyType = typing.TypeVar("_KeyType")
-_ValueType = typing.TypeVar("_ValueType")
+    def get_sales(
+        self,
+        args: tuple[list[tuple[str, int]]] | GetSalesArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_sales((address,uint64)[])((uint64,uint64,uint64),(address,uint64,bool))[]",
+            "args": method_args,
+        }))
 
-class _AppClientStateMethodsProtocol(typing.Protocol):
-    def get_map(self, map_name: str) -> dict[typing.Any, typing.Any]:
-        ...
-    def get_map_value(self, map_name: str, key: typing.Any) -> typing.Any | None:
-        ...
+    def accept_bid(
+        self,
+        args: tuple[int] | AcceptBidArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "accept_bid(uint64)void",
+            "args": method_args,
+        }))
 
-class _MapState(typing.Generic[_KeyType, _ValueType]):
-    """Generic class for accessing state maps with strongly typed keys and values"""
+    def settle_expired(
+        self,
+        args: tuple[list[tuple[str, int]]] | SettleExpiredArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "settle_expired((address,uint64)[])void",
+            "args": method_args,
+        }))
 
-    def __init__(self, state_accessor: _AppClientStateMethodsProtocol, map_name: str,
-                struct_class: typing.Type[_ValueType] | None = None):
-        self._state_accessor = state_accessor
-        self._map_name = map_name
-        self._struct_class = struct_class
+    def clear_state(
+        self,
+        params: algokit_utils.AppClientBareCallParams | None = None,
+        
+    ) -> Transaction:
+        return self.app_client.create_transaction.bare.clear_state(
+            params,
+            
+        )
 
-    def get_map(self) -> dict[_KeyType, _ValueType]:
-        """Get all current values in the map"""
-        result = self._state_accessor.get_map(self._map_name)
-        if self._struct_class and result:
-            return {k: _init_dataclass(self._struct_class, v) if isinstance(v, dict) else v
-                    for k, v in result.items()}  # type: ignore
-        return typing.cast(dict[_KeyType, _ValueType], result or {})
 
-    def get_value(self, key: _KeyType) -> _ValueType | None:
-        """Get a value from the map by key"""
-        key_value = dataclasses.asdict(key) if dataclasses.is_dataclass(key) else key  # type: ignore
-        value = self._state_accessor.get_map_value(self._map_name, key_value)
-        if value is not None and self._struct_class and isinstance(value, dict):
-            return _init_dataclass(self._struct_class, value)  # type: ignore
-        return typing.cast(_ValueType | None, value)
+class DigitalMarketplaceSend:
+    def __init__(self, app_client: algokit_utils.AppClient):
+        self.app_client = app_client
 
+    def deposit(
+        self,
+        args: tuple[algokit_utils.AppMethodCallTransactionArgument] | DepositArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[None]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "deposit(pay)void",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
 
-class DigitalMarketplaceClient:
-    """Client for interacting with DigitalMarketplace smart contract"""
+    def withdraw(
+        self,
+        args: tuple[int] | WithdrawArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[None]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "withdraw(uint64)void",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
 
-    @typing.overload
-    def __init__(self, app_client: algokit_utils.AppClient) -> None: ...
-    
-    @typing.overload
-    def __init__(
+    def add_resources(
         self,
-        *,
-        algorand: _AlgoKitAlgorandClient,
-        app_id: int,
-        app_name: str | None = None,
-        default_sender: str | None = None,
-        default_signer: TransactionSigner | None = None,
-        approval_source_map: SourceMap | None = None,
-        clear_source_map: SourceMap | None = None,
-    ) -> None: ...
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[None]:
+    
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "add_resources()void",
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
 
-    def __init__(
+    def sponsor_asset(
         self,
-        app_client: algokit_utils.AppClient | None = None,
-        *,
-        algorand: _AlgoKitAlgorandClient | None = None,
+        args: tuple[int] | SponsorAssetArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[None]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "sponsor_asset(asset)void",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
+
+    def open_sale(
+        self,
+        args: tuple[algokit_utils.AppMethodCallTransactionArgument, int] | OpenSaleArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[None]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "open_sale(axfer,uint64)void",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
+
+    def open_expiring_sale(
+        self,
+        args: tuple[algokit_utils.AppMethodCallTransactionArgument, int, int] | OpenExpiringSaleArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[None]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "open_expiring_sale(axfer,uint64,uint64)void",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
+
+    def open_sales(
+        self,
+        args: tuple[list[int]] | OpenSalesArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[None]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "open_sales(uint64[])void",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
+
+    def close_sale(
+        self,
+        args: tuple[int] | CloseSaleArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[None]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "close_sale(asset)void",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
+
+    def buy(
+        self,
+        args: tuple[SaleKey] | BuyArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[None]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "buy((address,uint64))void",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
+
+    def buy_partial(
+        self,
+        args: tuple[SaleKey, int] | BuyPartialArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[None]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "buy_partial((address,uint64),uint64)void",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
+
+    def buy_many(
+        self,
+        args: tuple[list[tuple[str, int]], int] | BuyManyArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[None]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "buy_many((address,uint64)[],uint64)void",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
+
+    def bid(
+        self,
+        args: tuple[SaleKey, int] | BidArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[None]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "bid((address,uint64),uint64)void",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
+
+    def bid_many(
+        self,
+        args: tuple[list[tuple[str, int]], list[int]] | BidManyArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[None]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "bid_many((address,uint64)[],uint64[])void",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
+
+    def isolated_bid(
+        self,
+        args: tuple[SaleKey, int] | IsolatedBidArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[None]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "isolated_bid((address,uint64),uint64)void",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
+
+    def claim_unencumbered_bids(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[None]:
+    
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "claim_unencumbered_bids()void",
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
+
+    def open_receipt_pages(
+        self,
+        args: tuple[int] | OpenReceiptPagesArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[None]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "open_receipt_pages(uint64)void",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
+
+    def claim_unencumbered_bids_of_page(
+        self,
+        args: tuple[int] | ClaimUnencumberedBidsOfPageArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[None]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "claim_unencumbered_bids_of_page(uint64)void",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
+
+    def prune_unencumbered_bids(
+        self,
+        args: tuple[str] | PruneUnencumberedBidsArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[None]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "prune_unencumbered_bids(address)void",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
+
+    def prune_unencumbered_bids_of_page(
+        self,
+        args: tuple[str, int] | PruneUnencumberedBidsOfPageArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[None]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "prune_unencumbered_bids_of_page(address,uint64)void",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
+
+    def claim_unencumbered_bids_page(
+        self,
+        args: tuple[int, int] | ClaimUnencumberedBidsPageArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[None]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "claim_unencumbered_bids_page(uint64,uint64)void",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
+
+    def claim_isolated_bid(
+        self,
+        args: tuple[SaleKey] | ClaimIsolatedBidArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[None]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "claim_isolated_bid((address,uint64))void",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
+
+    def get_total_and_unencumbered_bids(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[UnencumberedBidsReceipt]:
+    
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_total_and_unencumbered_bids()(uint64,uint64)",
+        }), send_params=send_params)
+        parsed_response = dataclasses.replace(response, abi_return=_init_dataclass(UnencumberedBidsReceipt, typing.cast(dict, response.abi_return))) # type: ignore
+        return typing.cast(algokit_utils.SendAppTransactionResult[UnencumberedBidsReceipt], parsed_response)
+
+    def get_total_and_unencumbered_bids_of(
+        self,
+        args: tuple[list[str]] | GetTotalAndUnencumberedBidsOfArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[list[tuple[int, int]]]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_total_and_unencumbered_bids_of(address[])(uint64,uint64)[]",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[list[tuple[int, int]]], parsed_response)
+
+    def get_receipt_count(
+        self,
+        args: tuple[str] | GetReceiptCountArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[int]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_receipt_count(address)uint64",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[int], parsed_response)
+
+    def get_receipt_pages(
+        self,
+        args: tuple[str] | GetReceiptPagesArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[list[int]]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_receipt_pages(address)uint16[]",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[list[int]], parsed_response)
+
+    def get_sales(
+        self,
+        args: tuple[list[tuple[str, int]]] | GetSalesArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[list[tuple[tuple[int, int, int], tuple[str, int, bool]]]]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_sales((address,uint64)[])((uint64,uint64,uint64),(address,uint64,bool))[]",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[list[tuple[tuple[int, int, int], tuple[str, int, bool]]]], parsed_response)
+
+    def accept_bid(
+        self,
+        args: tuple[int] | AcceptBidArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[None]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "accept_bid(uint64)void",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
+
+    def settle_expired(
+        self,
+        args: tuple[list[tuple[str, int]]] | SettleExpiredArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[None]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "settle_expired((address,uint64)[])void",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
+
+    def clear_state(
+        self,
+        params: algokit_utils.AppClientBareCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[algokit_utils.ABIReturn]:
+        return self.app_client.send.bare.clear_state(
+            params,
+            send_params=send_params,
+        )
+
+
+class DigitalMarketplaceState:
+    """Methods to access state for the current DigitalMarketplace app"""
+
+    def __init__(self, app_client: algokit_utils.AppClient):
+        self.app_client = app_client
+
+    @property
+    def box(
+        self
+    ) -> "_BoxState":
+            """Methods to access box for the current app"""
+            return _BoxState(self.app_client)
+
+class _BoxState:
+    def __init__(self, app_client: algokit_utils.AppClient):
+        self.app_client = app_client
+        
+        # Pre-generated mapping of value types to their struct classes
+        self._struct_classes: dict[str, typing.Type[typing.Any]] = {
+            "Sale": Sale,
+            "Bid": Bid,
+            "AssetBook": AssetBook,
+            "BidTotals": BidTotals
+        }
+
+    def get_all(self) -> dict[str, typing.Any]:
+        """Get all current keyed values from box state"""
+        result = self.app_client.state.box.get_all()
+        if not result:
+            return {}
+
+        converted = {}
+        for key, value in result.items():
+            key_info = self.app_client.app_spec.state.keys.box.get(key)
+            struct_class = self._struct_classes.get(key_info.value_type) if key_info else None
+            converted[key] = (
+                _init_dataclass(struct_class, value) if struct_class and isinstance(value, dict)
+                else value
+            )
+        return converted
+
+    @property
+    def deposited(self) -> "_MapState[str, int]":
+        """Get values from the deposited map in box state"""
+        return _MapState(
+            self.app_client.state.box,
+            "deposited",
+            None
+        )
+
+    @property
+    def sales(self) -> "_MapState[SaleKey, Sale]":
+        """Get values from the sales map in box state"""
+        return _MapState(
+            self.app_client.state.box,
+            "sales",
+            self._struct_classes.get("Sale")
+        )
+
+    @property
+    def bids(self) -> "_MapState[int, Bid]":
+        """Get values from the bids map in box state"""
+        return _MapState(
+            self.app_client.state.box,
+            "bids",
+            self._struct_classes.get("Bid")
+        )
+
+    @property
+    def best_asks(self) -> "_MapState[int, AssetBook]":
+        """Get values from the best_asks map in box state"""
+        return _MapState(
+            self.app_client.state.box,
+            "best_asks",
+            self._struct_classes.get("AssetBook")
+        )
+
+    @property
+    def best_bids(self) -> "_MapState[int, AssetBook]":
+        """Get values from the best_bids map in box state"""
+        return _MapState(
+            self.app_client.state.box,
+            "best_bids",
+            self._struct_classes.get("AssetBook")
+        )
+
+    @property
+    def receipt_book(self) -> "_MapState[str, list[tuple[int, int]]]":
+        """Get values from the receipt_book map in box state"""
+        return _MapState(
+            self.app_client.state.box,
+            "receipt_book",
+            None
+        )
+
+    @property
+    def receipt_pages(self) -> "_MapState[str, list[int]]":
+        """Get values from the receipt_pages map in box state"""
+        return _MapState(
+            self.app_client.state.box,
+            "receipt_pages",
+            None
+        )
+
+    @property
+    def receipt_book_pages(self) -> "_MapState[bytes, list[tuple[int, int]]]":
+        """Get values from the receipt_book_pages map in box state"""
+        return _MapState(
+            self.app_client.state.box,
+            "receipt_book_pages",
+            None
+        )
+
+    @property
+    def isolated_receipts(self) -> "_MapState[bytes, int]":
+        """Get values from the isolated_receipts map in box state"""
+        return _MapState(
+            self.app_client.state.box,
+            "isolated_receipts",
+            None
+        )
+
+    @property
+    def bid_totals(self) -> "_MapState[str, BidTotals]":
+        """Get values from the bid_totals map in box state"""
+        return _MapState(
+            self.app_client.state.box,
+            "bid_totals",
+            self._struct_classes.get("BidTotals")
+        )
+
+_KeyType = typing.TypeVar("_KeyType")
+_ValueType = typing.TypeVar("_ValueType")
+
+class _AppClientStateMethodsProtocol(typing.Protocol):
+    def get_map(self, map_name: str) -> dict[typing.Any, typing.Any]:
+        ...
+    def get_map_value(self, map_name: str, key: typing.Any) -> typing.Any | None:
+        ...
+
+class _MapState(typing.Generic[_KeyType, _ValueType]):
+    """Generic class for accessing state maps with strongly typed keys and values"""
+
+    def __init__(self, state_accessor: _AppClientStateMethodsProtocol, map_name: str,
+                struct_class: typing.Type[_ValueType] | None = None):
+        self._state_accessor = state_accessor
+        self._map_name = map_name
+        self._struct_class = struct_class
+
+    def get_map(self) -> dict[_KeyType, _ValueType]:
+        """Get all current values in the map"""
+        result = self._state_accessor.get_map(self._map_name)
+        if self._struct_class and result:
+            return {k: _init_dataclass(self._struct_class, v) if isinstance(v, dict) else v
+                    for k, v in result.items()}  # type: ignore
+        return typing.cast(dict[_KeyType, _ValueType], result or {})
+
+    def get_value(self, key: _KeyType) -> _ValueType | None:
+        """Get a value from the map by key"""
+        key_value = dataclasses.asdict(key) if dataclasses.is_dataclass(key) else key  # type: ignore
+        value = self._state_accessor.get_map_value(self._map_name, key_value)
+        if value is not None and self._struct_class and isinstance(value, dict):
+            return _init_dataclass(self._struct_class, value)  # type: ignore
+        return typing.cast(_ValueType | None, value)
+
+
+class DigitalMarketplaceClient:
+    """Client for interacting with DigitalMarketplace smart contract"""
+
+    @typing.overload
+    def __init__(self, app_client: algokit_utils.AppClient) -> None: ...
+    
+    @typing.overload
+    def __init__(
+        self,
+        *,
+        algorand: _AlgoKitAlgorandClient,
+        app_id: int,
+        app_name: str | None = None,
+        default_sender: str | None = None,
+        default_signer: TransactionSigner | None = None,
+        approval_source_map: SourceMap | None = None,
+        clear_source_map: SourceMap | None = None,
+    ) -> None: ...
+
+    def __init__(
+        self,
+        app_client: algokit_utils.AppClient | None = None,
+        *,
+        algorand: _AlgoKitAlgorandClient | None = None,
         app_id: int | None = None,
         app_name: str | None = None,
         default_sender: str | None = None,
@@ -772,529 +1763,996 @@ class DigitalMarketplaceClient:
         self.send = DigitalMarketplaceSend(self.app_client)
         self.state = DigitalMarketplaceState(self.app_client)
 
-    @staticmethod
-    def from_creator_and_name(
-        creator_address: str,
-        app_name: str,
-        algorand: _AlgoKitAlgorandClient,
-        default_sender: str | None = None,
-        default_signer: TransactionSigner | None = None,
-        approval_source_map: SourceMap | None = None,
-        clear_source_map: SourceMap | None = None,
-        ignore_cache: bool | None = None,
-        app_lookup_cache: algokit_utils.ApplicationLookup | None = None,
-    ) -> "DigitalMarketplaceClient":
-        return DigitalMarketplaceClient(
-            algokit_utils.AppClient.from_creator_and_name(
-                creator_address=creator_address,
-                app_name=app_name,
-                app_spec=APP_SPEC,
-                algorand=algorand,
-                default_sender=default_sender,
-                default_signer=default_signer,
-                approval_source_map=approval_source_map,
-                clear_source_map=clear_source_map,
-                ignore_cache=ignore_cache,
-                app_lookup_cache=app_lookup_cache,
-            )
-        )
+    @staticmethod
+    def from_creator_and_name(
+        creator_address: str,
+        app_name: str,
+        algorand: _AlgoKitAlgorandClient,
+        default_sender: str | None = None,
+        default_signer: TransactionSigner | None = None,
+        approval_source_map: SourceMap | None = None,
+        clear_source_map: SourceMap | None = None,
+        ignore_cache: bool | None = None,
+        app_lookup_cache: algokit_utils.ApplicationLookup | None = None,
+    ) -> "DigitalMarketplaceClient":
+        return DigitalMarketplaceClient(
+            algokit_utils.AppClient.from_creator_and_name(
+                creator_address=creator_address,
+                app_name=app_name,
+                app_spec=APP_SPEC,
+                algorand=algorand,
+                default_sender=default_sender,
+                default_signer=default_signer,
+                approval_source_map=approval_source_map,
+                clear_source_map=clear_source_map,
+                ignore_cache=ignore_cache,
+                app_lookup_cache=app_lookup_cache,
+            )
+        )
+    
+    @staticmethod
+    def from_network(
+        algorand: _AlgoKitAlgorandClient,
+        app_name: str | None = None,
+        default_sender: str | None = None,
+        default_signer: TransactionSigner | None = None,
+        approval_source_map: SourceMap | None = None,
+        clear_source_map: SourceMap | None = None,
+    ) -> "DigitalMarketplaceClient":
+        return DigitalMarketplaceClient(
+            algokit_utils.AppClient.from_network(
+                app_spec=APP_SPEC,
+                algorand=algorand,
+                app_name=app_name,
+                default_sender=default_sender,
+                default_signer=default_signer,
+                approval_source_map=approval_source_map,
+                clear_source_map=clear_source_map,
+            )
+        )
+
+    @property
+    def app_id(self) -> int:
+        return self.app_client.app_id
+    
+    @property
+    def app_address(self) -> str:
+        return self.app_client.app_address
+    
+    @property
+    def app_name(self) -> str:
+        return self.app_client.app_name
+    
+    @property
+    def app_spec(self) -> algokit_utils.Arc56Contract:
+        return self.app_client.app_spec
+    
+    @property
+    def algorand(self) -> _AlgoKitAlgorandClient:
+        return self.app_client.algorand
+
+    def clone(
+        self,
+        app_name: str | None = None,
+        default_sender: str | None = None,
+        default_signer: TransactionSigner | None = None,
+        approval_source_map: SourceMap | None = None,
+        clear_source_map: SourceMap | None = None,
+    ) -> "DigitalMarketplaceClient":
+        return DigitalMarketplaceClient(
+            self.app_client.clone(
+                app_name=app_name,
+                default_sender=default_sender,
+                default_signer=default_signer,
+                approval_source_map=approval_source_map,
+                clear_source_map=clear_source_map,
+            )
+        )
+
+    def new_group(self) -> "DigitalMarketplaceComposer":
+        return DigitalMarketplaceComposer(self)
+
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["deposit(pay)void"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["withdraw(uint64)void"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["add_resources()void"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["sponsor_asset(asset)void"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["open_sale(axfer,uint64)void"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["open_expiring_sale(axfer,uint64,uint64)void"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["open_sales(uint64[])void"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["close_sale(asset)void"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["buy((address,uint64))void"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["buy_partial((address,uint64),uint64)void"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["buy_many((address,uint64)[],uint64)void"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["bid((address,uint64),uint64)void"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["bid_many((address,uint64)[],uint64[])void"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["isolated_bid((address,uint64),uint64)void"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["claim_unencumbered_bids()void"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["open_receipt_pages(uint64)void"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["claim_unencumbered_bids_of_page(uint64)void"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["prune_unencumbered_bids(address)void"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["prune_unencumbered_bids_of_page(address,uint64)void"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["claim_unencumbered_bids_page(uint64,uint64)void"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["claim_isolated_bid((address,uint64))void"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["get_total_and_unencumbered_bids()(uint64,uint64)"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> UnencumberedBidsReceipt | None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["get_total_and_unencumbered_bids_of(address[])(uint64,uint64)[]"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> list[tuple[int, int]] | None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["get_receipt_count(address)uint64"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> int | None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["get_receipt_pages(address)uint16[]"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> list[int] | None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["get_sales((address,uint64)[])((uint64,uint64,uint64),(address,uint64,bool))[]"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> list[tuple[tuple[int, int, int], tuple[str, int, bool]]] | None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["accept_bid(uint64)void"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["settle_expired((address,uint64)[])void"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: str,
+        return_value: algokit_utils.ABIReturn | None
+    ) -> algokit_utils.ABIValue | algokit_utils.ABIStruct | None: ...
+
+    def decode_return_value(
+        self,
+        method: str,
+        return_value: algokit_utils.ABIReturn | None
+    ) -> algokit_utils.ABIValue | algokit_utils.ABIStruct | None | UnencumberedBidsReceipt | int | list[int] | list[tuple[int, int]] | list[tuple[tuple[int, int, int], tuple[str, int, bool]]]:
+        """Decode ABI return value for the given method."""
+        if return_value is None:
+            return None
     
-    @staticmethod
-    def from_network(
+        arc56_method = self.app_spec.get_arc56_method(method)
+        decoded = return_value.get_arc56_value(arc56_method, self.app_spec.structs)
+    
+        # If method returns a struct, convert the dict to appropriate dataclass
+        if (arc56_method and
+            arc56_method.returns and
+            arc56_method.returns.struct and
+            isinstance(decoded, dict)):
+            struct_class = globals().get(arc56_method.returns.struct)
+            if struct_class:
+                return struct_class(**typing.cast(dict, decoded))
+        return decoded
+
+
+@dataclasses.dataclass(frozen=True)
+class DigitalMarketplaceBareCallCreateParams(algokit_utils.AppClientBareCallCreateParams):
+    """Parameters for creating DigitalMarketplace contract with bare calls"""
+    on_complete: typing.Literal[OnComplete.NoOpOC] | None = None
+
+    def to_algokit_utils_params(self) -> algokit_utils.AppClientBareCallCreateParams:
+        return algokit_utils.AppClientBareCallCreateParams(**self.__dict__)
+
+class DigitalMarketplaceFactory(algokit_utils.TypedAppFactoryProtocol[DigitalMarketplaceBareCallCreateParams, None, None]):
+    """Factory for deploying and managing DigitalMarketplaceClient smart contracts"""
+
+    def __init__(
+        self,
         algorand: _AlgoKitAlgorandClient,
+        *,
         app_name: str | None = None,
         default_sender: str | None = None,
         default_signer: TransactionSigner | None = None,
-        approval_source_map: SourceMap | None = None,
-        clear_source_map: SourceMap | None = None,
-    ) -> "DigitalMarketplaceClient":
-        return DigitalMarketplaceClient(
-            algokit_utils.AppClient.from_network(
-                app_spec=APP_SPEC,
+        version: str | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None,
+    ):
+        self.app_factory = algokit_utils.AppFactory(
+            params=algokit_utils.AppFactoryParams(
                 algorand=algorand,
+                app_spec=APP_SPEC,
                 app_name=app_name,
                 default_sender=default_sender,
                 default_signer=default_signer,
-                approval_source_map=approval_source_map,
-                clear_source_map=clear_source_map,
+                version=version,
+                compilation_params=compilation_params,
             )
         )
+        self.params = DigitalMarketplaceFactoryParams(self.app_factory)
+        self.create_transaction = DigitalMarketplaceFactoryCreateTransaction(self.app_factory)
+        self.send = DigitalMarketplaceFactorySend(self.app_factory)
 
-    @property
-    def app_id(self) -> int:
-        return self.app_client.app_id
-    
-    @property
-    def app_address(self) -> str:
-        return self.app_client.app_address
-    
     @property
     def app_name(self) -> str:
-        return self.app_client.app_name
+        return self.app_factory.app_name
     
     @property
     def app_spec(self) -> algokit_utils.Arc56Contract:
-        return self.app_client.app_spec
+        return self.app_factory.app_spec
     
     @property
     def algorand(self) -> _AlgoKitAlgorandClient:
-        return self.app_client.algorand
+        return self.app_factory.algorand
 
-    def clone(
+    def deploy(
         self,
+        *,
+        on_update: algokit_utils.OnUpdate | None = None,
+        on_schema_break: algokit_utils.OnSchemaBreak | None = None,
+        create_params: DigitalMarketplaceBareCallCreateParams | None = None,
+        update_params: None = None,
+        delete_params: None = None,
+        existing_deployments: algokit_utils.ApplicationLookup | None = None,
+        ignore_cache: bool = False,
         app_name: str | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None,
+        send_params: algokit_utils.SendParams | None = None,
+    ) -> tuple[DigitalMarketplaceClient, algokit_utils.AppFactoryDeployResult]:
+        """Deploy the application"""
+        deploy_response = self.app_factory.deploy(
+            on_update=on_update,
+            on_schema_break=on_schema_break,
+            create_params=create_params.to_algokit_utils_params() if create_params else None,
+            update_params=update_params,
+            delete_params=delete_params,
+            existing_deployments=existing_deployments,
+            ignore_cache=ignore_cache,
+            app_name=app_name,
+            compilation_params=compilation_params,
+            send_params=send_params,
+        )
+
+        return DigitalMarketplaceClient(deploy_response[0]), deploy_response[1]
+
+    def get_app_client_by_creator_and_name(
+        self,
+        creator_address: str,
+        app_name: str,
         default_sender: str | None = None,
         default_signer: TransactionSigner | None = None,
+        ignore_cache: bool | None = None,
+        app_lookup_cache: algokit_utils.ApplicationLookup | None = None,
         approval_source_map: SourceMap | None = None,
         clear_source_map: SourceMap | None = None,
-    ) -> "DigitalMarketplaceClient":
+    ) -> DigitalMarketplaceClient:
+        """Get an app client by creator address and name"""
         return DigitalMarketplaceClient(
-            self.app_client.clone(
-                app_name=app_name,
-                default_sender=default_sender,
-                default_signer=default_signer,
-                approval_source_map=approval_source_map,
-                clear_source_map=clear_source_map,
+            self.app_factory.get_app_client_by_creator_and_name(
+                creator_address,
+                app_name,
+                default_sender,
+                default_signer,
+                ignore_cache,
+                app_lookup_cache,
+                approval_source_map,
+                clear_source_map,
             )
         )
 
-    def new_group(self) -> "DigitalMarketplaceComposer":
-        return DigitalMarketplaceComposer(self)
-
-    @typing.overload
-    def decode_return_value(
-        self,
-        method: typing.Literal["deposit(pay)void"],
-        return_value: algokit_utils.ABIReturn | None
-    ) -> None: ...
-    @typing.overload
-    def decode_return_value(
-        self,
-        method: typing.Literal["withdraw(uint64)void"],
-        return_value: algokit_utils.ABIReturn | None
-    ) -> None: ...
-    @typing.overload
-    def decode_return_value(
+    def get_app_client_by_id(
         self,
-        method: typing.Literal["sponsor_asset(asset)void"],
-        return_value: algokit_utils.ABIReturn | None
-    ) -> None: ...
-    @typing.overload
-    def decode_return_value(
+        app_id: int,
+        app_name: str | None = None,
+        default_sender: str | None = None,
+        default_signer: TransactionSigner | None = None,
+        approval_source_map: SourceMap | None = None,
+        clear_source_map: SourceMap | None = None,
+    ) -> DigitalMarketplaceClient:
+        """Get an app client by app ID"""
+        return DigitalMarketplaceClient(
+            self.app_factory.get_app_client_by_id(
+                app_id,
+                app_name,
+                default_sender,
+                default_signer,
+                approval_source_map,
+                clear_source_map,
+            )
+        )
+
+
+class DigitalMarketplaceFactoryParams:
+    """Parameters for creating transactions for DigitalMarketplace contract"""
+
+    def __init__(self, app_factory: algokit_utils.AppFactory):
+        self.app_factory = app_factory
+        self.create = DigitalMarketplaceFactoryCreateParams(app_factory)
+        self.update = DigitalMarketplaceFactoryUpdateParams(app_factory)
+        self.delete = DigitalMarketplaceFactoryDeleteParams(app_factory)
+
+class DigitalMarketplaceFactoryCreateParams:
+    """Parameters for 'create' operations of DigitalMarketplace contract"""
+
+    def __init__(self, app_factory: algokit_utils.AppFactory):
+        self.app_factory = app_factory
+
+    def bare(
         self,
-        method: typing.Literal["open_sale(axfer,uint64)void"],
-        return_value: algokit_utils.ABIReturn | None
-    ) -> None: ...
-    @typing.overload
-    def decode_return_value(
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateParams:
+        """Creates an instance using a bare call"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.bare.create(
+            algokit_utils.AppFactoryCreateParams(**dataclasses.asdict(params)),
+            compilation_params=compilation_params)
+
+    def deposit(
         self,
-        method: typing.Literal["close_sale(asset)void"],
-        return_value: algokit_utils.ABIReturn | None
-    ) -> None: ...
-    @typing.overload
-    def decode_return_value(
+        args: tuple[algokit_utils.AppMethodCallTransactionArgument] | DepositArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the deposit(pay)void ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "deposit(pay)void",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def withdraw(
         self,
-        method: typing.Literal["buy((address,uint64))void"],
-        return_value: algokit_utils.ABIReturn | None
-    ) -> None: ...
-    @typing.overload
-    def decode_return_value(
+        args: tuple[int] | WithdrawArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the withdraw(uint64)void ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "withdraw(uint64)void",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def add_resources(
         self,
-        method: typing.Literal["bid((address,uint64),uint64)void"],
-        return_value: algokit_utils.ABIReturn | None
-    ) -> None: ...
-    @typing.overload
-    def decode_return_value(
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the add_resources()void ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "add_resources()void",
+                "args": None,
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def sponsor_asset(
         self,
-        method: typing.Literal["claim_unencumbered_bids()void"],
-        return_value: algokit_utils.ABIReturn | None
-    ) -> None: ...
-    @typing.overload
-    def decode_return_value(
+        args: tuple[int] | SponsorAssetArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the sponsor_asset(asset)void ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "sponsor_asset(asset)void",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def open_sale(
         self,
-        method: typing.Literal["get_total_and_unencumbered_bids()(uint64,uint64)"],
-        return_value: algokit_utils.ABIReturn | None
-    ) -> UnencumberedBidsReceipt | None: ...
-    @typing.overload
-    def decode_return_value(
+        args: tuple[algokit_utils.AppMethodCallTransactionArgument, int] | OpenSaleArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the open_sale(axfer,uint64)void ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "open_sale(axfer,uint64)void",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def open_expiring_sale(
         self,
-        method: typing.Literal["accept_bid(uint64)void"],
-        return_value: algokit_utils.ABIReturn | None
-    ) -> None: ...
-    @typing.overload
-    def decode_return_value(
+        args: tuple[algokit_utils.AppMethodCallTransactionArgument, int, int] | OpenExpiringSaleArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the open_expiring_sale(axfer,uint64,uint64)void ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "open_expiring_sale(axfer,uint64,uint64)void",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def open_sales(
         self,
-        method: str,
-        return_value: algokit_utils.ABIReturn | None
-    ) -> algokit_utils.ABIValue | algokit_utils.ABIStruct | None: ...
+        args: tuple[list[int]] | OpenSalesArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the open_sales(uint64[])void ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "open_sales(uint64[])void",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
 
-    def decode_return_value(
+    def close_sale(
         self,
-        method: str,
-        return_value: algokit_utils.ABIReturn | None
-    ) -> algokit_utils.ABIValue | algokit_utils.ABIStruct | None | UnencumberedBidsReceipt:
-        """Decode ABI return value for the given method."""
-        if return_value is None:
-            return None
-    
-        arc56_method = self.app_spec.get_arc56_method(method)
-        decoded = return_value.get_arc56_value(arc56_method, self.app_spec.structs)
-    
-        # If method returns a struct, convert the dict to appropriate dataclass
-        if (arc56_method and
-            arc56_method.returns and
-            arc56_method.returns.struct and
-            isinstance(decoded, dict)):
-            struct_class = globals().get(arc56_method.returns.struct)
-            if struct_class:
-                return struct_class(**typing.cast(dict, decoded))
-        return decoded
+        args: tuple[int] | CloseSaleArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the close_sale(asset)void ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "close_sale(asset)void",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
 
+    def buy(
+        self,
+        args: tuple[SaleKey] | BuyArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the buy((address,uint64))void ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "buy((address,uint64))void",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
 
-@dataclasses.dataclass(frozen=True)
-class DigitalMarketplaceBareCallCreateParams(algokit_utils.AppClientBareCallCreateParams):
-    """Parameters for creating DigitalMarketplace contract with bare calls"""
-    on_complete: typing.Literal[OnComplete.NoOpOC] | None = None
+    def buy_partial(
+        self,
+        args: tuple[SaleKey, int] | BuyPartialArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the buy_partial((address,uint64),uint64)void ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "buy_partial((address,uint64),uint64)void",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
 
-    def to_algokit_utils_params(self) -> algokit_utils.AppClientBareCallCreateParams:
-        return algokit_utils.AppClientBareCallCreateParams(**self.__dict__)
+    def buy_many(
+        self,
+        args: tuple[list[tuple[str, int]], int] | BuyManyArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the buy_many((address,uint64)[],uint64)void ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "buy_many((address,uint64)[],uint64)void",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
 
-class DigitalMarketplaceFactory(algokit_utils.TypedAppFactoryProtocol[DigitalMarketplaceBareCallCreateParams, None, None]):
-    """Factory for deploying and managing DigitalMarketplaceClient smart contracts"""
+    def bid(
+        self,
+        args: tuple[SaleKey, int] | BidArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the bid((address,uint64),uint64)void ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "bid((address,uint64),uint64)void",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
 
-    def __init__(
+    def bid_many(
         self,
-        algorand: _AlgoKitAlgorandClient,
+        args: tuple[list[tuple[str, int]], list[int]] | BidManyArgs,
         *,
-        app_name: str | None = None,
-        default_sender: str | None = None,
-        default_signer: TransactionSigner | None = None,
-        version: str | None = None,
-        compilation_params: algokit_utils.AppClientCompilationParams | None = None,
-    ):
-        self.app_factory = algokit_utils.AppFactory(
-            params=algokit_utils.AppFactoryParams(
-                algorand=algorand,
-                app_spec=APP_SPEC,
-                app_name=app_name,
-                default_sender=default_sender,
-                default_signer=default_signer,
-                version=version,
-                compilation_params=compilation_params,
-            )
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the bid_many((address,uint64)[],uint64[])void ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "bid_many((address,uint64)[],uint64[])void",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
         )
-        self.params = DigitalMarketplaceFactoryParams(self.app_factory)
-        self.create_transaction = DigitalMarketplaceFactoryCreateTransaction(self.app_factory)
-        self.send = DigitalMarketplaceFactorySend(self.app_factory)
-
-    @property
-    def app_name(self) -> str:
-        return self.app_factory.app_name
-    
-    @property
-    def app_spec(self) -> algokit_utils.Arc56Contract:
-        return self.app_factory.app_spec
-    
-    @property
-    def algorand(self) -> _AlgoKitAlgorandClient:
-        return self.app_factory.algorand
 
-    def deploy(
+    def isolated_bid(
         self,
+        args: tuple[SaleKey, int] | IsolatedBidArgs,
         *,
-        on_update: algokit_utils.OnUpdate | None = None,
-        on_schema_break: algokit_utils.OnSchemaBreak | None = None,
-        create_params: DigitalMarketplaceBareCallCreateParams | None = None,
-        update_params: None = None,
-        delete_params: None = None,
-        existing_deployments: algokit_utils.ApplicationLookup | None = None,
-        ignore_cache: bool = False,
-        app_name: str | None = None,
-        compilation_params: algokit_utils.AppClientCompilationParams | None = None,
-        send_params: algokit_utils.SendParams | None = None,
-    ) -> tuple[DigitalMarketplaceClient, algokit_utils.AppFactoryDeployResult]:
-        """Deploy the application"""
-        deploy_response = self.app_factory.deploy(
-            on_update=on_update,
-            on_schema_break=on_schema_break,
-            create_params=create_params.to_algokit_utils_params() if create_params else None,
-            update_params=update_params,
-            delete_params=delete_params,
-            existing_deployments=existing_deployments,
-            ignore_cache=ignore_cache,
-            app_name=app_name,
-            compilation_params=compilation_params,
-            send_params=send_params,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the isolated_bid((address,uint64),uint64)void ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "isolated_bid((address,uint64),uint64)void",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
         )
 
-        return DigitalMarketplaceClient(deploy_response[0]), deploy_response[1]
-
-    def get_app_client_by_creator_and_name(
+    def claim_unencumbered_bids(
         self,
-        creator_address: str,
-        app_name: str,
-        default_sender: str | None = None,
-        default_signer: TransactionSigner | None = None,
-        ignore_cache: bool | None = None,
-        app_lookup_cache: algokit_utils.ApplicationLookup | None = None,
-        approval_source_map: SourceMap | None = None,
-        clear_source_map: SourceMap | None = None,
-    ) -> DigitalMarketplaceClient:
-        """Get an app client by creator address and name"""
-        return DigitalMarketplaceClient(
-            self.app_factory.get_app_client_by_creator_and_name(
-                creator_address,
-                app_name,
-                default_sender,
-                default_signer,
-                ignore_cache,
-                app_lookup_cache,
-                approval_source_map,
-                clear_source_map,
-            )
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the claim_unencumbered_bids()void ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "claim_unencumbered_bids()void",
+                "args": None,
+                }
+            ),
+            compilation_params=compilation_params
         )
 
-    def get_app_client_by_id(
+    def open_receipt_pages(
         self,
-        app_id: int,
-        app_name: str | None = None,
-        default_sender: str | None = None,
-        default_signer: TransactionSigner | None = None,
-        approval_source_map: SourceMap | None = None,
-        clear_source_map: SourceMap | None = None,
-    ) -> DigitalMarketplaceClient:
-        """Get an app client by app ID"""
-        return DigitalMarketplaceClient(
-            self.app_factory.get_app_client_by_id(
-                app_id,
-                app_name,
-                default_sender,
-                default_signer,
-                approval_source_map,
-                clear_source_map,
-            )
+        args: tuple[int] | OpenReceiptPagesArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the open_receipt_pages(uint64)void ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "open_receipt_pages(uint64)void",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
         )
 
-
-class DigitalMarketplaceFactoryParams:
-    """Parameters for creating transactions for DigitalMarketplace contract"""
-
-    def __init__(self, app_factory: algokit_utils.AppFactory):
-        self.app_factory = app_factory
-        self.create = DigitalMarketplaceFactoryCreateParams(app_factory)
-        self.update = DigitalMarketplaceFactoryUpdateParams(app_factory)
-        self.delete = DigitalMarketplaceFactoryDeleteParams(app_factory)
-
-class DigitalMarketplaceFactoryCreateParams:
-    """Parameters for 'create' operations of DigitalMarketplace contract"""
-
-    def __init__(self, app_factory: algokit_utils.AppFactory):
-        self.app_factory = app_factory
-
-    def bare(
+    def claim_unencumbered_bids_of_page(
         self,
+        args: tuple[int] | ClaimUnencumberedBidsOfPageArgs,
         *,
         params: algokit_utils.CommonAppCallCreateParams | None = None,
         compilation_params: algokit_utils.AppClientCompilationParams | None = None
-    ) -> algokit_utils.AppCreateParams:
-        """Creates an instance using a bare call"""
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the claim_unencumbered_bids_of_page(uint64)void ABI method"""
         params = params or algokit_utils.CommonAppCallCreateParams()
-        return self.app_factory.params.bare.create(
-            algokit_utils.AppFactoryCreateParams(**dataclasses.asdict(params)),
-            compilation_params=compilation_params)
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "claim_unencumbered_bids_of_page(uint64)void",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
 
-    def deposit(
+    def prune_unencumbered_bids(
         self,
-        args: tuple[algokit_utils.AppMethodCallTransactionArgument] | DepositArgs,
+        args: tuple[str] | PruneUnencumberedBidsArgs,
         *,
         params: algokit_utils.CommonAppCallCreateParams | None = None,
         compilation_params: algokit_utils.AppClientCompilationParams | None = None
     ) -> algokit_utils.AppCreateMethodCallParams:
-        """Creates a new instance using the deposit(pay)void ABI method"""
+        """Creates a new instance using the prune_unencumbered_bids(address)void ABI method"""
         params = params or algokit_utils.CommonAppCallCreateParams()
         return self.app_factory.params.create(
             algokit_utils.AppFactoryCreateMethodCallParams(
                 **{
                 **dataclasses.asdict(params),
-                "method": "deposit(pay)void",
+                "method": "prune_unencumbered_bids(address)void",
                 "args": _parse_abi_args(args),
                 }
             ),
             compilation_params=compilation_params
         )
 
-    def withdraw(
+    def prune_unencumbered_bids_of_page(
         self,
-        args: tuple[int] | WithdrawArgs,
+        args: tuple[str, int] | PruneUnencumberedBidsOfPageArgs,
         *,
         params: algokit_utils.CommonAppCallCreateParams | None = None,
         compilation_params: algokit_utils.AppClientCompilationParams | None = None
     ) -> algokit_utils.AppCreateMethodCallParams:
-        """Creates a new instance using the withdraw(uint64)void ABI method"""
+        """Creates a new instance using the prune_unencumbered_bids_of_page(address,uint64)void ABI method"""
         params = params or algokit_utils.CommonAppCallCreateParams()
         return self.app_factory.params.create(
             algokit_utils.AppFactoryCreateMethodCallParams(
                 **{
                 **dataclasses.asdict(params),
-                "method": "withdraw(uint64)void",
+                "method": "prune_unencumbered_bids_of_page(address,uint64)void",
                 "args": _parse_abi_args(args),
                 }
             ),
             compilation_params=compilation_params
         )
 
-    def sponsor_asset(
+    def claim_unencumbered_bids_page(
         self,
-        args: tuple[int] | SponsorAssetArgs,
+        args: tuple[int, int] | ClaimUnencumberedBidsPageArgs,
         *,
         params: algokit_utils.CommonAppCallCreateParams | None = None,
         compilation_params: algokit_utils.AppClientCompilationParams | None = None
     ) -> algokit_utils.AppCreateMethodCallParams:
-        """Creates a new instance using the sponsor_asset(asset)void ABI method"""
+        """Creates a new instance using the claim_unencumbered_bids_page(uint64,uint64)void ABI method"""
         params = params or algokit_utils.CommonAppCallCreateParams()
         return self.app_factory.params.create(
             algokit_utils.AppFactoryCreateMethodCallParams(
                 **{
                 **dataclasses.asdict(params),
-                "method": "sponsor_asset(asset)void",
+                "method": "claim_unencumbered_bids_page(uint64,uint64)void",
                 "args": _parse_abi_args(args),
                 }
             ),
             compilation_params=compilation_params
         )
 
-    def open_sale(
+    def claim_isolated_bid(
         self,
-        args: tuple[algokit_utils.AppMethodCallTransactionArgument, int] | OpenSaleArgs,
+        args: tuple[SaleKey] | ClaimIsolatedBidArgs,
         *,
         params: algokit_utils.CommonAppCallCreateParams | None = None,
         compilation_params: algokit_utils.AppClientCompilationParams | None = None
     ) -> algokit_utils.AppCreateMethodCallParams:
-        """Creates a new instance using the open_sale(axfer,uint64)void ABI method"""
+        """Creates a new instance using the claim_isolated_bid((address,uint64))void ABI method"""
         params = params or algokit_utils.CommonAppCallCreateParams()
         return self.app_factory.params.create(
             algokit_utils.AppFactoryCreateMethodCallParams(
                 **{
                 **dataclasses.asdict(params),
-                "method": "open_sale(axfer,uint64)void",
+                "method": "claim_isolated_bid((address,uint64))void",
                 "args": _parse_abi_args(args),
                 }
             ),
             compilation_params=compilation_params
         )
 
-    def close_sale(
+    def get_total_and_unencumbered_bids(
         self,
-        args: tuple[int] | CloseSaleArgs,
         *,
         params: algokit_utils.CommonAppCallCreateParams | None = None,
         compilation_params: algokit_utils.AppClientCompilationParams | None = None
     ) -> algokit_utils.AppCreateMethodCallParams:
-        """Creates a new instance using the close_sale(asset)void ABI method"""
+        """Creates a new instance using the get_total_and_unencumbered_bids()(uint64,uint64) ABI method"""
         params = params or algokit_utils.CommonAppCallCreateParams()
         return self.app_factory.params.create(
             algokit_utils.AppFactoryCreateMethodCallParams(
                 **{
                 **dataclasses.asdict(params),
-                "method": "close_sale(asset)void",
+                "method": "get_total_and_unencumbered_bids()(uint64,uint64)",
+                "args": None,
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def get_total_and_unencumbered_bids_of(
+        self,
+        args: tuple[list[str]] | GetTotalAndUnencumberedBidsOfArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the get_total_and_unencumbered_bids_of(address[])(uint64,uint64)[] ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "get_total_and_unencumbered_bids_of(address[])(uint64,uint64)[]",
                 "args": _parse_abi_args(args),
                 }
             ),
             compilation_params=compilation_params
         )
 
-    def buy(
+    def get_receipt_count(
         self,
-        args: tuple[SaleKey] | BuyArgs,
+        args: tuple[str] | GetReceiptCountArgs,
         *,
         params: algokit_utils.CommonAppCallCreateParams | None = None,
         compilation_params: algokit_utils.AppClientCompilationParams | None = None
     ) -> algokit_utils.AppCreateMethodCallParams:
-        """Creates a new instance using the buy((address,uint64))void ABI method"""
+        """Creates a new instance using the get_receipt_count(address)uint64 ABI method"""
         params = params or algokit_utils.CommonAppCallCreateParams()
         return self.app_factory.params.create(
             algokit_utils.AppFactoryCreateMethodCallParams(
                 **{
                 **dataclasses.asdict(params),
-                "method": "buy((address,uint64))void",
+                "method": "get_receipt_count(address)uint64",
                 "args": _parse_abi_args(args),
                 }
             ),
             compilation_params=compilation_params
         )
 
-    def bid(
+    def get_receipt_pages(
         self,
-        args: tuple[SaleKey, int] | BidArgs,
+        args: tuple[str] | GetReceiptPagesArgs,
         *,
         params: algokit_utils.CommonAppCallCreateParams | None = None,
         compilation_params: algokit_utils.AppClientCompilationParams | None = None
     ) -> algokit_utils.AppCreateMethodCallParams:
-        """Creates a new instance using the bid((address,uint64),uint64)void ABI method"""
+        """Creates a new instance using the get_receipt_pages(address)uint16[] ABI method"""
         params = params or algokit_utils.CommonAppCallCreateParams()
         return self.app_factory.params.create(
             algokit_utils.AppFactoryCreateMethodCallParams(
                 **{
                 **dataclasses.asdict(params),
-                "method": "bid((address,uint64),uint64)void",
+                "method": "get_receipt_pages(address)uint16[]",
                 "args": _parse_abi_args(args),
                 }
             ),
             compilation_params=compilation_params
         )
 
-    def claim_unencumbered_bids(
+    def get_sales(
         self,
+        args: tuple[list[tuple[str, int]]] | GetSalesArgs,
         *,
         params: algokit_utils.CommonAppCallCreateParams | None = None,
         compilation_params: algokit_utils.AppClientCompilationParams | None = None
     ) -> algokit_utils.AppCreateMethodCallParams:
-        """Creates a new instance using the claim_unencumbered_bids()void ABI method"""
+        """Creates a new instance using the get_sales((address,uint64)[])((uint64,uint64,uint64),(address,uint64,bool))[] ABI method"""
         params = params or algokit_utils.CommonAppCallCreateParams()
         return self.app_factory.params.create(
             algokit_utils.AppFactoryCreateMethodCallParams(
                 **{
                 **dataclasses.asdict(params),
-                "method": "claim_unencumbered_bids()void",
-                "args": None,
+                "method": "get_sales((address,uint64)[])((uint64,uint64,uint64),(address,uint64,bool))[]",
+                "args": _parse_abi_args(args),
                 }
             ),
             compilation_params=compilation_params
         )
 
-    def get_total_and_unencumbered_bids(
+    def accept_bid(
         self,
+        args: tuple[int] | AcceptBidArgs,
         *,
         params: algokit_utils.CommonAppCallCreateParams | None = None,
         compilation_params: algokit_utils.AppClientCompilationParams | None = None
     ) -> algokit_utils.AppCreateMethodCallParams:
-        """Creates a new instance using the get_total_and_unencumbered_bids()(uint64,uint64) ABI method"""
+        """Creates a new instance using the accept_bid(uint64)void ABI method"""
         params = params or algokit_utils.CommonAppCallCreateParams()
         return self.app_factory.params.create(
             algokit_utils.AppFactoryCreateMethodCallParams(
                 **{
                 **dataclasses.asdict(params),
-                "method": "get_total_and_unencumbered_bids()(uint64,uint64)",
-                "args": None,
+                "method": "accept_bid(uint64)void",
+                "args": _parse_abi_args(args),
                 }
             ),
             compilation_params=compilation_params
         )
 
-    def accept_bid(
+    def settle_expired(
         self,
-        args: tuple[int] | AcceptBidArgs,
+        args: tuple[list[tuple[str, int]]] | SettleExpiredArgs,
         *,
         params: algokit_utils.CommonAppCallCreateParams | None = None,
         compilation_params: algokit_utils.AppClientCompilationParams | None = None
     ) -> algokit_utils.AppCreateMethodCallParams:
-        """Creates a new instance using the accept_bid(uint64)void ABI method"""
+        """Creates a new instance using the settle_expired((address,uint64)[])void ABI method"""
         params = params or algokit_utils.CommonAppCallCreateParams()
         return self.app_factory.params.create(
             algokit_utils.AppFactoryCreateMethodCallParams(
                 **{
                 **dataclasses.asdict(params),
-                "method": "accept_bid(uint64)void",
+                "method": "settle_expired((address,uint64)[])void",
                 "args": _parse_abi_args(args),
                 }
             ),
@@ -1438,6 +2896,23 @@ class DigitalMarketplaceComposer:
         )
         return self
 
+    def add_resources(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "DigitalMarketplaceComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.add_resources(
+                
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "add_resources()void", v
+            )
+        )
+        return self
+
     def sponsor_asset(
         self,
         args: tuple[int] | SponsorAssetArgs,
@@ -1474,6 +2949,42 @@ class DigitalMarketplaceComposer:
         )
         return self
 
+    def open_expiring_sale(
+        self,
+        args: tuple[algokit_utils.AppMethodCallTransactionArgument, int, int] | OpenExpiringSaleArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "DigitalMarketplaceComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.open_expiring_sale(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "open_expiring_sale(axfer,uint64,uint64)void", v
+            )
+        )
+        return self
+
+    def open_sales(
+        self,
+        args: tuple[list[int]] | OpenSalesArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "DigitalMarketplaceComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.open_sales(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "open_sales(uint64[])void", v
+            )
+        )
+        return self
+
     def close_sale(
         self,
         args: tuple[int] | CloseSaleArgs,
@@ -1510,6 +3021,42 @@ class DigitalMarketplaceComposer:
         )
         return self
 
+    def buy_partial(
+        self,
+        args: tuple[SaleKey, int] | BuyPartialArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "DigitalMarketplaceComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.buy_partial(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "buy_partial((address,uint64),uint64)void", v
+            )
+        )
+        return self
+
+    def buy_many(
+        self,
+        args: tuple[list[tuple[str, int]], int] | BuyManyArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "DigitalMarketplaceComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.buy_many(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "buy_many((address,uint64)[],uint64)void", v
+            )
+        )
+        return self
+
     def bid(
         self,
         args: tuple[SaleKey, int] | BidArgs,
@@ -1528,6 +3075,42 @@ class DigitalMarketplaceComposer:
         )
         return self
 
+    def bid_many(
+        self,
+        args: tuple[list[tuple[str, int]], list[int]] | BidManyArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "DigitalMarketplaceComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.bid_many(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "bid_many((address,uint64)[],uint64[])void", v
+            )
+        )
+        return self
+
+    def isolated_bid(
+        self,
+        args: tuple[SaleKey, int] | IsolatedBidArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "DigitalMarketplaceComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.isolated_bid(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "isolated_bid((address,uint64),uint64)void", v
+            )
+        )
+        return self
+
     def claim_unencumbered_bids(
         self,
         params: algokit_utils.CommonAppCallParams | None = None
@@ -1545,6 +3128,114 @@ class DigitalMarketplaceComposer:
         )
         return self
 
+    def open_receipt_pages(
+        self,
+        args: tuple[int] | OpenReceiptPagesArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "DigitalMarketplaceComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.open_receipt_pages(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "open_receipt_pages(uint64)void", v
+            )
+        )
+        return self
+
+    def claim_unencumbered_bids_of_page(
+        self,
+        args: tuple[int] | ClaimUnencumberedBidsOfPageArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "DigitalMarketplaceComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.claim_unencumbered_bids_of_page(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "claim_unencumbered_bids_of_page(uint64)void", v
+            )
+        )
+        return self
+
+    def prune_unencumbered_bids(
+        self,
+        args: tuple[str] | PruneUnencumberedBidsArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "DigitalMarketplaceComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.prune_unencumbered_bids(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "prune_unencumbered_bids(address)void", v
+            )
+        )
+        return self
+
+    def prune_unencumbered_bids_of_page(
+        self,
+        args: tuple[str, int] | PruneUnencumberedBidsOfPageArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "DigitalMarketplaceComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.prune_unencumbered_bids_of_page(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "prune_unencumbered_bids_of_page(address,uint64)void", v
+            )
+        )
+        return self
+
+    def claim_unencumbered_bids_page(
+        self,
+        args: tuple[int, int] | ClaimUnencumberedBidsPageArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "DigitalMarketplaceComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.claim_unencumbered_bids_page(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "claim_unencumbered_bids_page(uint64,uint64)void", v
+            )
+        )
+        return self
+
+    def claim_isolated_bid(
+        self,
+        args: tuple[SaleKey] | ClaimIsolatedBidArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "DigitalMarketplaceComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.claim_isolated_bid(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "claim_isolated_bid((address,uint64))void", v
+            )
+        )
+        return self
+
     def get_total_and_unencumbered_bids(
         self,
         params: algokit_utils.CommonAppCallParams | None = None
@@ -1562,6 +3253,78 @@ class DigitalMarketplaceComposer:
         )
         return self
 
+    def get_total_and_unencumbered_bids_of(
+        self,
+        args: tuple[list[str]] | GetTotalAndUnencumberedBidsOfArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "DigitalMarketplaceComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.get_total_and_unencumbered_bids_of(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "get_total_and_unencumbered_bids_of(address[])(uint64,uint64)[]", v
+            )
+        )
+        return self
+
+    def get_receipt_count(
+        self,
+        args: tuple[str] | GetReceiptCountArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "DigitalMarketplaceComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.get_receipt_count(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "get_receipt_count(address)uint64", v
+            )
+        )
+        return self
+
+    def get_receipt_pages(
+        self,
+        args: tuple[str] | GetReceiptPagesArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "DigitalMarketplaceComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.get_receipt_pages(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "get_receipt_pages(address)uint16[]", v
+            )
+        )
+        return self
+
+    def get_sales(
+        self,
+        args: tuple[list[tuple[str, int]]] | GetSalesArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "DigitalMarketplaceComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.get_sales(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "get_sales((address,uint64)[])((uint64,uint64,uint64),(address,uint64,bool))[]", v
+            )
+        )
+        return self
+
     def accept_bid(
         self,
         args: tuple[int] | AcceptBidArgs,
@@ -1580,6 +3343,24 @@ class DigitalMarketplaceComposer:
         )
         return self
 
+    def settle_expired(
+        self,
+        args: tuple[list[tuple[str, int]]] | SettleExpiredArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "DigitalMarketplaceComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.settle_expired(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "settle_expired((address,uint64)[])void", v
+            )
+        )
+        return self
+
     def clear_state(
         self,
         *,
@@ -0,0 +1,39 @@
+# Minimum balance required by the protocol for each box and for each byte of a box.
+BOX_FLAT_MIN_BALANCE: int = 2_500
+BOX_BYTE_MIN_BALANCE: int = 400
+
+# Length of the compact identifier of a sale.
+SALE_ID_LENGTH: int = 8
+
+# Encoded sizes of the keys and values stored in boxes.
+# They follow the ARC-4 struct definitions in contract.py and must be kept in sync.
+ADDRESS_SIZE: int = 32
+UINT64_SIZE: int = 8
+UINT16_SIZE: int = 2
+# Dynamic arrays are prefixed by their uint16 length.
+ARRAY_HEADER_SIZE: int = 2
+SALE_KEY_SIZE: int = 40
+SALE_SIZE: int = 24
+BID_SIZE: int = 41
+BID_RECEIPT_SIZE: int = 16
+BID_TOTALS_SIZE: int = 18
+BOOK_ENTRY_SIZE: int = 48
+
+# Number of sales indexed per asset in each of its books, best first.
+# Must match the length of the BookSlots static array in contract.py.
+ASSET_BOOK_SLOTS: int = 4
+# The untracked count followed by the slots.
+ASSET_BOOK_SIZE: int = UINT64_SIZE + ASSET_BOOK_SLOTS * BOOK_ENTRY_SIZE
+
+# Maximum number of page boxes a receipt book can be split across.
+MAX_RECEIPT_PAGES: int = 256
+
+# Share of the freed MBR paid to whoever prunes the receipts of another bidder: the
+#  freed MBR divided by this value.
+PRUNE_BOUNTY_DIVISOR: int = 10
+
+# Opcode budget reserved by the methods that loop over a receipt book.
+# These values are shared with the off-chain helpers that size the fee of a call,
+#  so that the OpUp inner transactions issued on chain are always covered.
+RECEIPT_LOOP_BASE_BUDGET: int = 200
+RECEIPT_LOOP_PER_RECEIPT_BUDGET: int = 150
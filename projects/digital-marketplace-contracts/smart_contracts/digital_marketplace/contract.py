@@ -5,20 +5,45 @@ from algopy import (
     ARC4Contract,
     Asset,
     BoxMap,
+    BoxRef,
+    Bytes,
     Global,
     ImmutableArray,
+    TransactionType,
     Txn,
     UInt64,
     arc4,
     gtxn,
     itxn,
+    op,
     subroutine,
+    urange,
 )
 from algopy.arc4 import abimethod
 
+import smart_contracts.digital_marketplace.constants as cst
 import smart_contracts.digital_marketplace.errors as err
 from smart_contracts.digital_marketplace.subroutines import (
+    box_mbr,
+    can_receive_asset,
+    ensure_receipt_loop_budget,
     find_bid_receipt,
+    insert_receipt,
+    is_expired,
+    isolated_receipt_key,
+    pro_rata_cost,
+    put_book_entry,
+    read_receipt,
+    receipt_book_mbr,
+    receipt_count,
+    receipt_offset,
+    receipt_page,
+    receipt_page_key,
+    remove_book_entry,
+    remove_receipt,
+    sale_id_of,
+    truncate_receipts,
+    write_receipt,
 )
 
 
@@ -30,23 +55,64 @@ class SaleKey(arc4.Struct, frozen=True):
 class Bid(arc4.Struct, frozen=True):
     bidder: arc4.Address
     amount: arc4.UInt64
+    # Whether the bid was placed with isolated_bid, so that its receipt is looked up in
+    #  the isolated receipts and the receipt book is only read for the other bids.
+    isolated: arc4.Bool
 
 
 class Sale(arc4.Struct, frozen=True):
     amount: arc4.UInt64
     cost: arc4.UInt64
-    # Ideally we'd like to write:
-    #  bid: Optional[Bid]
-    # Since there's no Optional in Algorand Python, we use the truthiness of bid.bidder
-    # to know if a bid is present
-    bid: Bid
+    # The round from which a sale opened with open_expiring_sale no longer takes bids
+    #  or buys and anyone can settle it with settle_expired, zero if it never expires.
+    expires_at: arc4.UInt64
 
 
 class BidReceipt(arc4.Struct, frozen=True):
-    sale_key: SaleKey
+    # The compact id of the sale, see sale_id_of.
+    sale_id: arc4.UInt64
     amount: arc4.UInt64
 
 
+class SaleListing(arc4.Struct, frozen=True):
+    # A sale that doesn't exist reads as a zero sale and a sale without bids reads as
+    #  a zero bid.
+    sale: Sale
+    bid: Bid
+
+
+class BidTotals(arc4.Struct, frozen=True):
+    # Sum of the receipts held by a bidder, in the receipt book or isolated.
+    committed: arc4.UInt64
+    # Sum of the bids of the bidder that are currently the best bid of their sale.
+    winning: arc4.UInt64
+    # Number of pages of the receipt book of the bidder, zero if it isn't paged.
+    # Kept here so that finding the receipt book of a bidder doesn't need to reference
+    #  the header box of the paged receipt books.
+    n_pages: arc4.UInt16
+
+
+class BookEntry(arc4.Struct, frozen=True):
+    # The owner of the sale, whose asset is the key of the book.
+    owner: arc4.Address
+    # The cost of the sale in the book of asks, the best bid in the book of bids.
+    price: arc4.UInt64
+    # The amount of the asset on sale, which the price is for. Entries are ranked by
+    #  the price per unit, so that sales of different amounts compare fairly.
+    amount: arc4.UInt64
+
+
+# Must be as long as cst.ASSET_BOOK_SLOTS.
+BookSlots = arc4.StaticArray[BookEntry, typing.Literal[4]]
+
+
+class AssetBook(arc4.Struct, frozen=True):
+    # Number of sales of the asset missing from the slots, pushed out of a full book or
+    #  left out of it. The slots hold every sale in order when it is zero.
+    n_untracked: arc4.UInt64
+    slots: BookSlots
+
+
 class UnencumberedBidsReceipt(typing.NamedTuple):
     total_bids: UInt64
     unencumbered_bids: UInt64
@@ -56,8 +122,46 @@ class DigitalMarketplace(ARC4Contract):
     def __init__(self) -> None:
         self.deposited = BoxMap(Account, UInt64)
 
+        # Sales are keyed by their full key, which maps the compact id of a sale back to
+        #  its owner and asset. Every other box of a sale is keyed by that id instead.
         self.sales = BoxMap(SaleKey, Sale)
+        # The best bid of a sale lives in its own box, created by the first bid.
+        # This way sales without bids don't pay for an empty bid and bids don't rewrite
+        #  the sale box.
+        self.bids = BoxMap(arc4.UInt64, Bid)
+        # Per asset index of the cheapest sales and of the sales with the best bids,
+        #  so that the top of the book is found with a single box read.
+        # The books are created by sponsor_asset and only track the best few sales,
+        #  a sale pushed out of a full book comes back in when its price is updated.
+        # The slot freed by a closed sale is taken by the next sale written, even if a
+        #  better sale was pushed out earlier, since finding it would need a scan of
+        #  every sale. The books count the sales they miss instead: the first slot is
+        #  the best sale of the asset when that count is zero, otherwise clients have
+        #  to check the sales of the asset off-chain.
+        self.best_asks = BoxMap(arc4.UInt64, AssetBook)
+        self.best_bids = BoxMap(arc4.UInt64, AssetBook)
+        # Receipt books are only accessed in place through receipt_book_box, the map
+        #  declares their key and type for clients.
         self.receipt_book = BoxMap(Account, ImmutableArray[BidReceipt])
+        # A bidder can instead split their receipts across a fixed number of page
+        #  boxes, each one a sorted receipt book of its own keyed by the bidder and
+        #  the page, so that a bid only touches the page of its sale.
+        # The header box of the bidder holds the number of receipts of each page.
+        self.receipt_pages = BoxMap(Account, arc4.DynamicArray[arc4.UInt16])
+        # The prefixes of the boxes that a bidder can hold many of are kept short, since
+        #  every byte of a box name adds to its MBR.
+        self.receipt_book_pages = BoxMap(
+            Bytes, ImmutableArray[BidReceipt], key_prefix=b"p"
+        )
+        # Receipts of bids placed with isolated_bid live in their own box, keyed by
+        #  the bidder followed by the compact id of the sale, and only hold the amount.
+        # The sale key is always known to the caller, so it doesn't need to be stored.
+        self.isolated_receipts = BoxMap(Bytes, UInt64, key_prefix=b"i")
+        # Running totals of the bids of each bidder, kept up to date by every method
+        #  that moves a receipt or a best bid so that they can be read without a scan.
+        # The box is created by the first bid of a bidder, or by open_receipt_pages, and
+        #  never deleted.
+        self.bid_totals = BoxMap(Account, BidTotals)
 
     @abimethod
     def deposit(self, payment: gtxn.PaymentTransaction) -> None:
@@ -66,12 +170,102 @@ class DigitalMarketplace(ARC4Contract):
             payment.receiver == Global.current_application_address
         ), err.WRONG_RECEIVER
 
-        mbr_baseline = Global.current_application_address.min_balance
-        self.deposited[Txn.sender] = (
-            self.deposited.get(Txn.sender, default=UInt64(0)) + payment.amount
+        # The MBR of a new deposit box is known upfront, so the box is written once.
+        deposited, exists = self.deposited.maybe(Txn.sender)
+        box_mbr_charge = UInt64(0)
+        if not exists:
+            box_mbr_charge = self.deposit_box_mbr()
+        self.deposited[Txn.sender] = deposited + payment.amount - box_mbr_charge
+
+    # The MBR of each box is derived from the layout of its key and value, so methods
+    #  charge and refund it without probing the min balance of the application.
+    @subroutine
+    def deposit_box_mbr(self) -> UInt64:
+        return box_mbr(
+            self.deposited.key_prefix.length + cst.ADDRESS_SIZE + cst.UINT64_SIZE
+        )
+
+    @subroutine
+    def sale_box_mbr(self) -> UInt64:
+        return box_mbr(self.sales.key_prefix.length + cst.SALE_KEY_SIZE + cst.SALE_SIZE)
+
+    @subroutine
+    def bid_box_mbr(self) -> UInt64:
+        return box_mbr(self.bids.key_prefix.length + cst.SALE_ID_LENGTH + cst.BID_SIZE)
+
+    @subroutine
+    def asset_books_mbr(self) -> UInt64:
+        # The asset id key and the book.
+        book_size = UInt64(cst.UINT64_SIZE + cst.ASSET_BOOK_SIZE)
+        return box_mbr(self.best_asks.key_prefix.length + book_size) + box_mbr(
+            self.best_bids.key_prefix.length + book_size
+        )
+
+    @subroutine
+    def isolated_receipt_box_mbr(self) -> UInt64:
+        return box_mbr(
+            self.isolated_receipts.key_prefix.length
+            + cst.ADDRESS_SIZE
+            + cst.SALE_ID_LENGTH
+            + cst.UINT64_SIZE
+        )
+
+    @subroutine
+    def bid_totals_box_mbr(self) -> UInt64:
+        return box_mbr(
+            self.bid_totals.key_prefix.length + cst.ADDRESS_SIZE + cst.BID_TOTALS_SIZE
         )
-        mbr_diff = Global.current_application_address.min_balance - mbr_baseline
-        self.deposited[Txn.sender] -= mbr_diff
+
+    @subroutine
+    def settle(self, account: Account, credit: UInt64, debit: UInt64) -> None:
+        # Methods net all the credits and debits of an account in memory and settle
+        #  them here, so that each deposit box is read and written once per call.
+        # Credits are applied first, so that a call can spend what it gives back.
+        self.deposited[account] = self.deposited[account] + credit - debit
+
+    @subroutine
+    def receipt_book_box(self, bidder: Account) -> BoxRef:
+        return BoxRef(key=self.receipt_book.key_prefix + bidder.bytes)
+
+    @subroutine
+    def receipt_pages_box(self, bidder: Account) -> BoxRef:
+        return BoxRef(key=self.receipt_pages.key_prefix + bidder.bytes)
+
+    @subroutine
+    def receipt_page_box(self, bidder: Account, page: UInt64) -> BoxRef:
+        return BoxRef(
+            key=self.receipt_book_pages.key_prefix + receipt_page_key(bidder, page)
+        )
+
+    @subroutine
+    def receipt_pages_of(self, bidder: Account) -> UInt64:
+        totals, exists = self.bid_totals.maybe(bidder)
+        if not exists:
+            return UInt64(0)
+        return totals.n_pages.native
+
+    @subroutine
+    def receipt_book_of(
+        self, bidder: Account, sale_id: arc4.UInt64
+    ) -> tuple[BoxRef, UInt64]:
+        # Returns the box holding the receipt of the bidder for the sale and its page,
+        #  which is zero for a bidder without pages.
+        n_pages = self.receipt_pages_of(bidder)
+        if not n_pages:
+            return self.receipt_book_box(bidder), UInt64(0)
+        page = receipt_page(sale_id, n_pages)
+        return self.receipt_page_box(bidder, page), page
+
+    @subroutine
+    def count_page_receipts(
+        self, bidder: Account, page: UInt64, n_receipts: UInt64
+    ) -> None:
+        # Keeps the number of receipts of the page in the header of a paged bidder.
+        if self.receipt_pages_of(bidder):
+            self.receipt_pages_box(bidder).replace(
+                cst.ARRAY_HEADER_SIZE + page * cst.UINT16_SIZE,
+                arc4.UInt16(n_receipts).bytes,
+            )
 
     @abimethod
     def withdraw(self, amount: arc4.UInt64) -> None:
@@ -79,6 +273,12 @@ class DigitalMarketplace(ARC4Contract):
 
         itxn.Payment(receiver=Txn.sender, amount=amount.native).submit()
 
+    @abimethod
+    def add_resources(self) -> None:
+        # Does nothing: callers add it to a group to carry the references that don't
+        #  fit in its other app calls, which share them.
+        pass
+
     @abimethod
     def sponsor_asset(self, asset: Asset) -> None:
         assert not Global.current_application_address.is_opted_in(
@@ -86,7 +286,13 @@ class DigitalMarketplace(ARC4Contract):
         ), err.ALREADY_OPTED_IN
         assert asset.clawback == Global.zero_address, err.CLAWBACK_ASA
 
-        self.deposited[Txn.sender] -= Global.asset_opt_in_min_balance
+        asset_key = arc4.UInt64(asset.id)
+        self.best_asks[asset_key] = AssetBook.from_bytes(op.bzero(cst.ASSET_BOOK_SIZE))
+        self.best_bids[asset_key] = AssetBook.from_bytes(op.bzero(cst.ASSET_BOOK_SIZE))
+
+        self.deposited[Txn.sender] -= (
+            Global.asset_opt_in_min_balance + self.asset_books_mbr()
+        )
 
         itxn.AssetTransfer(
             xfer_asset=asset,
@@ -94,9 +300,59 @@ class DigitalMarketplace(ARC4Contract):
             asset_amount=0,
         ).submit()
 
-    @abimethod
-    def open_sale(
-        self, asset_deposit: gtxn.AssetTransferTransaction, cost: arc4.UInt64
+    # Sales and best bids are written and deleted through these subroutines, which
+    #  keep the asset books up to date. Replacing tells whether the sale already has
+    #  an entry, in the slots or counted as untracked.
+    @subroutine
+    def put_sale(self, sale_key: SaleKey, sale: Sale, *, replace: bool) -> None:
+        self.sales[sale_key] = sale
+        put_book_entry(
+            BoxRef(key=self.best_asks.key_prefix + sale_key.asset.bytes),
+            BookEntry(sale_key.owner, sale.cost, sale.amount),
+            descending=False,
+            replace=replace,
+        )
+
+    @subroutine
+    def delete_sale(self, sale_key: SaleKey) -> None:
+        del self.sales[sale_key]
+        remove_book_entry(
+            BoxRef(key=self.best_asks.key_prefix + sale_key.asset.bytes),
+            sale_key.owner,
+        )
+
+    @subroutine
+    def put_bid(
+        self,
+        sale_key: SaleKey,
+        sale_id: arc4.UInt64,
+        sale: Sale,
+        bid: Bid,
+        *,
+        replace: bool,
+    ) -> None:
+        self.bids[sale_id] = bid
+        put_book_entry(
+            BoxRef(key=self.best_bids.key_prefix + sale_key.asset.bytes),
+            BookEntry(sale_key.owner, bid.amount, sale.amount),
+            descending=True,
+            replace=replace,
+        )
+
+    @subroutine
+    def delete_bid(self, sale_key: SaleKey, sale_id: arc4.UInt64) -> None:
+        del self.bids[sale_id]
+        remove_book_entry(
+            BoxRef(key=self.best_bids.key_prefix + sale_key.asset.bytes),
+            sale_key.owner,
+        )
+
+    @subroutine
+    def create_sale(
+        self,
+        asset_deposit: gtxn.AssetTransferTransaction,
+        cost: arc4.UInt64,
+        expires_at: arc4.UInt64,
     ) -> None:
         assert asset_deposit.sender == Txn.sender, err.DIFFERENT_SENDER
         assert (
@@ -108,35 +364,72 @@ class DigitalMarketplace(ARC4Contract):
         )
         assert sale_key not in self.sales, err.SALE_ALREADY_EXISTS
 
-        mbr_baseline = Global.current_application_address.min_balance
-        self.sales[sale_key] = Sale(
-            arc4.UInt64(asset_deposit.asset_amount),
-            cost,
-            Bid(arc4.Address(), arc4.UInt64()),
+        self.put_sale(
+            sale_key,
+            Sale(arc4.UInt64(asset_deposit.asset_amount), cost, expires_at),
+            replace=False,
         )
-        mbr_diff = Global.current_application_address.min_balance - mbr_baseline
 
-        self.deposited[Txn.sender] -= mbr_diff
+    @abimethod
+    def open_sale(
+        self, asset_deposit: gtxn.AssetTransferTransaction, cost: arc4.UInt64
+    ) -> None:
+        self.create_sale(asset_deposit, cost, arc4.UInt64(0))
+
+        self.deposited[Txn.sender] -= self.sale_box_mbr()
+
+    @abimethod
+    def open_expiring_sale(
+        self,
+        asset_deposit: gtxn.AssetTransferTransaction,
+        cost: arc4.UInt64,
+        expires_at: arc4.UInt64,
+    ) -> None:
+        assert expires_at.native > Global.round, err.INVALID_EXPIRY
+        self.create_sale(asset_deposit, cost, expires_at)
+
+        self.deposited[Txn.sender] -= self.sale_box_mbr()
+
+    @abimethod
+    def open_sales(self, costs: arc4.DynamicArray[arc4.UInt64]) -> None:
+        # The asset deposits are the costs.length transactions right before this call,
+        #  in the same order as their costs.
+        first_deposit_index = Txn.group_index - costs.length
+
+        for i in urange(costs.length):
+            self.create_sale(
+                gtxn.AssetTransferTransaction(first_deposit_index + i),
+                costs[i],
+                arc4.UInt64(0),
+            )
+
+        self.deposited[Txn.sender] -= costs.length * self.sale_box_mbr()
 
     @abimethod
     def close_sale(self, asset: Asset) -> None:
         sale_key = SaleKey(arc4.Address(Txn.sender), arc4.UInt64(asset.id))
+        sale_id = sale_id_of(sale_key)
+        sale = self.sales[sale_key]
+        # An expired sale with a bid belongs to its best bidder and can only be settled.
+        assert not (is_expired(sale) and sale_id in self.bids), err.SALE_EXPIRED
 
         itxn.AssetTransfer(
             xfer_asset=asset,
             asset_receiver=Txn.sender,
-            asset_amount=self.sales[sale_key].amount.native,
+            asset_amount=sale.amount.native,
         ).submit()
 
-        mbr_baseline = Global.current_application_address.min_balance
-        del self.sales[sale_key]
-        mbr_diff = mbr_baseline - Global.current_application_address.min_balance
-        self.deposited[Txn.sender] += mbr_diff
+        self.delete_sale(sale_key)
+
+        self.deposited[Txn.sender] += self.sale_box_mbr() + self.drop_bid(
+            sale_key, sale_id
+        )
 
     @abimethod
     def buy(self, sale_key: SaleKey) -> None:
         assert Txn.sender != sale_key.owner.native, err.SELLER_CANT_BE_BUYER
         sale = self.sales[sale_key]
+        assert not is_expired(sale), err.SALE_EXPIRED
 
         itxn.AssetTransfer(
             xfer_asset=sale_key.asset.native,
@@ -144,117 +437,654 @@ class DigitalMarketplace(ARC4Contract):
             asset_amount=sale.amount.native,
         ).submit()
 
-        mbr_baseline = Global.current_application_address.min_balance
-        del self.sales[sale_key]
-        mbr_diff = mbr_baseline - Global.current_application_address.min_balance
+        self.delete_sale(sale_key)
 
-        self.deposited[Txn.sender] -= sale.cost.native
-        self.deposited[sale_key.owner.native] += sale.cost.native + mbr_diff
+        self.settle(
+            Txn.sender, self.drop_bid(sale_key, sale_id_of(sale_key)), sale.cost.native
+        )
+        self.deposited[sale_key.owner.native] += sale.cost.native + self.sale_box_mbr()
 
     @abimethod
-    def bid(self, sale_key: SaleKey, new_bid_amount: arc4.UInt64) -> None:
-        new_bid = Bid(bidder=arc4.Address(Txn.sender), amount=new_bid_amount)
+    def buy_partial(self, sale_key: SaleKey, quantity: arc4.UInt64) -> None:
+        # Buys quantity units of the asset on sale at the pro-rata price of its cost,
+        #  leaving the rest of the sale open. Buying the whole amount closes the sale.
+        # The best bid was placed on the whole amount, so it is dropped either way.
+        assert Txn.sender != sale_key.owner.native, err.SELLER_CANT_BE_BUYER
+        sale = self.sales[sale_key]
+        assert not is_expired(sale), err.SALE_EXPIRED
+        assert 0 < quantity.native <= sale.amount.native, err.INVALID_QUANTITY
+        price = pro_rata_cost(sale.cost.native, quantity.native, sale.amount.native)
 
-        assert Txn.sender != sale_key.owner, err.SELLER_CANT_BE_BIDDER
+        itxn.AssetTransfer(
+            xfer_asset=sale_key.asset.native,
+            asset_receiver=Txn.sender,
+            asset_amount=quantity.native,
+        ).submit()
 
-        sale = self.sales[sale_key]
-        if sale.bid.bidder:
-            assert sale.bid.amount.native < new_bid_amount.native, err.WORSE_BID
+        owner_proceeds = price
+        if quantity == sale.amount:
+            self.delete_sale(sale_key)
+            owner_proceeds += self.sale_box_mbr()
+        else:
+            self.put_sale(
+                sale_key,
+                Sale(
+                    arc4.UInt64(sale.amount.native - quantity.native),
+                    arc4.UInt64(sale.cost.native - price),
+                    sale.expires_at,
+                ),
+                replace=True,
+            )
 
-        self.sales[sale_key] = sale._replace(bid=new_bid)
+        self.settle(Txn.sender, self.drop_bid(sale_key, sale_id_of(sale_key)), price)
+        self.deposited[sale_key.owner.native] += owner_proceeds
 
-        mbr_baseline = Global.current_application_address.min_balance
-        new_bid_receipt = BidReceipt(sale_key, new_bid_amount)
-        receipt_book, exists = self.receipt_book.maybe(Txn.sender)
-        if exists:
-            found, index = find_bid_receipt(receipt_book, sale_key)
-            if found:
-                self.deposited[Txn.sender] += receipt_book[index].amount.native
-                self.receipt_book[Txn.sender] = receipt_book.replace(
-                    index, new_bid_receipt
-                )
+    @abimethod
+    def buy_many(
+        self, sale_keys: arc4.DynamicArray[SaleKey], max_total_cost: arc4.UInt64
+    ) -> None:
+        # All the asset transfers are submitted as a single inner group.
+        # Proceeds are credited once per run of adjacent sale keys with the same owner,
+        #  so callers should group the sale keys by owner.
+        assert sale_keys.length, err.NO_SALES
+        total_cost = UInt64(0)
+        bid_refunds = UInt64(0)
+        owner_proceeds = UInt64(0)
+        for i in urange(sale_keys.length):
+            sale_key = sale_keys[i]
+            assert Txn.sender != sale_key.owner.native, err.SELLER_CANT_BE_BUYER
+            sale = self.sales[sale_key]
+            assert not is_expired(sale), err.SALE_EXPIRED
+
+            if i == 0:
+                op.ITxnCreate.begin()
             else:
-                self.receipt_book[Txn.sender] = receipt_book.append(new_bid_receipt)
-        else:
-            self.receipt_book[Txn.sender] = ImmutableArray(new_bid_receipt)
-        mbr_diff = Global.current_application_address.min_balance - mbr_baseline
+                op.ITxnCreate.next()
+            op.ITxnCreate.set_type_enum(TransactionType.AssetTransfer)
+            op.ITxnCreate.set_fee(0)
+            op.ITxnCreate.set_xfer_asset(sale_key.asset.native)
+            op.ITxnCreate.set_asset_receiver(Txn.sender)
+            op.ITxnCreate.set_asset_amount(sale.amount.native)
+
+            self.delete_sale(sale_key)
+            bid_refunds += self.drop_bid(sale_key, sale_id_of(sale_key))
+
+            total_cost += sale.cost.native
+            owner_proceeds += sale.cost.native + self.sale_box_mbr()
+            if i + 1 == sale_keys.length or sale_keys[i + 1].owner != sale_key.owner:
+                self.deposited[sale_key.owner.native] += owner_proceeds
+                owner_proceeds = UInt64(0)
+        op.ITxnCreate.submit()
+
+        assert total_cost <= max_total_cost.native, err.MAX_TOTAL_COST_EXCEEDED
+        self.settle(Txn.sender, bid_refunds, total_cost)
+
+    @subroutine
+    def add_bid_totals(
+        self, bidder: Account, committed: UInt64, released: UInt64, winning: UInt64
+    ) -> UInt64:
+        # Commits the new receipts of the bidder and releases the receipts they
+        #  overwrote in a single write of the totals box.
+        # The released amount can be larger than the committed one if it was left on a
+        #  sale that has since been closed and opened again, so it is taken off last.
+        # Returns the MBR of the totals box if it had to be created, which the bidder
+        #  has to pay.
+        totals, exists = self.bid_totals.maybe(bidder)
+        if not exists:
+            totals = BidTotals(arc4.UInt64(), arc4.UInt64(), arc4.UInt16())
+
+        self.bid_totals[bidder] = BidTotals(
+            arc4.UInt64(totals.committed.native + committed - released),
+            arc4.UInt64(totals.winning.native + winning),
+            totals.n_pages,
+        )
+        if exists:
+            return UInt64(0)
+        return self.bid_totals_box_mbr()
 
-        self.deposited[Txn.sender] -= new_bid_amount.native + mbr_diff
+    @subroutine
+    def sub_bid_totals(
+        self, bidder: Account, committed: UInt64, winning: UInt64
+    ) -> None:
+        totals = self.bid_totals[bidder]
+        self.bid_totals[bidder] = BidTotals(
+            arc4.UInt64(totals.committed.native - committed),
+            arc4.UInt64(totals.winning.native - winning),
+            totals.n_pages,
+        )
 
     @subroutine
-    def is_encumbered(self, bid: BidReceipt) -> bool:
-        sale, exists = self.sales.maybe(bid.sale_key)
-        return exists and bool(sale.bid.bidder) and sale.bid.bidder == Txn.sender
+    def release_bid(self, sale_id: arc4.UInt64, bid: Bid) -> UInt64:
+        # Called when a bid stops being the best bid of its sale.
+        # Returns what the bidder is owed: the MBR of the bid box and, if the bid was
+        #  placed with isolated_bid, its receipt which is pushed back right away.
+        # Receipts in the receipt book stay committed until they are claimed.
+        if bid.isolated.native:
+            del self.isolated_receipts[isolated_receipt_key(bid.bidder.native, sale_id)]
+            self.sub_bid_totals(bid.bidder.native, bid.amount.native, bid.amount.native)
+            return (
+                self.bid_box_mbr() + bid.amount.native + self.isolated_receipt_box_mbr()
+            )
+
+        self.sub_bid_totals(bid.bidder.native, UInt64(0), bid.amount.native)
+        return self.bid_box_mbr()
+
+    @subroutine
+    def drop_bid(self, sale_key: SaleKey, sale_id: arc4.UInt64) -> UInt64:
+        # Releases the best bid of the sale, if there is one.
+        # The refund of any other account is settled here, while the refund of the
+        #  caller is returned to be netted with the rest of the call.
+        bid, exists = self.bids.maybe(sale_id)
+        if not exists:
+            return UInt64(0)
+
+        self.delete_bid(sale_key, sale_id)
+        refund = self.release_bid(sale_id, bid)
+        if bid.bidder == Txn.sender:
+            return refund
+        self.deposited[bid.bidder.native] += refund
+        return UInt64(0)
+
+    @subroutine
+    def outbid(
+        self,
+        sale_key: SaleKey,
+        sale_id: arc4.UInt64,
+        new_bid_amount: arc4.UInt64,
+        *,
+        isolated: bool,
+    ) -> tuple[UInt64, UInt64]:
+        # Returns the MBR of the bid box that the caller has to pay and how much the
+        #  winning bids of the caller grew.
+        # The best bidder always holds the MBR of the bid box: a new best bidder pays
+        #  it back to the previous one, while raising your own bid costs nothing.
+        new_bid = Bid(
+            bidder=arc4.Address(Txn.sender),
+            amount=new_bid_amount,
+            isolated=arc4.Bool(isolated),
+        )
+
+        assert Txn.sender != sale_key.owner, err.SELLER_CANT_BE_BIDDER
+        sale, sale_exists = self.sales.maybe(sale_key)
+        assert sale_exists, err.SALE_NOT_FOUND
+        assert not is_expired(sale), err.SALE_EXPIRED
+
+        current_bid, exists = self.bids.maybe(sale_id)
+        if exists:
+            assert current_bid.amount.native < new_bid_amount.native, err.WORSE_BID
+
+        self.put_bid(sale_key, sale_id, sale, new_bid, replace=exists)
+        if exists and current_bid.bidder == Txn.sender:
+            return UInt64(0), new_bid_amount.native - current_bid.amount.native
+        if exists:
+            self.deposited[current_bid.bidder.native] += self.release_bid(
+                sale_id, current_bid
+            )
+        return self.bid_box_mbr(), new_bid_amount.native
+
+    @subroutine
+    def record_bid(
+        self, sale_id: arc4.UInt64, new_bid_amount: arc4.UInt64
+    ) -> tuple[UInt64, UInt64]:
+        # Writes the receipt of the new bid in the receipt book of the caller.
+        # Returns the MBR of the receipt that the caller has to pay and the amount of
+        #  the receipt it overwrote.
+        receipt_book, page = self.receipt_book_of(Txn.sender, sale_id)
+        if not receipt_book:
+            _created = receipt_book.create(size=cst.ARRAY_HEADER_SIZE)
+        new_bid_receipt = BidReceipt(sale_id, new_bid_amount)
+
+        found, index = find_bid_receipt(receipt_book, sale_id)
+        if found:
+            overwritten_amount = read_receipt(receipt_book, index).amount.native
+            write_receipt(receipt_book, index, new_bid_receipt)
+            return UInt64(0), overwritten_amount
+
+        insert_receipt(receipt_book, index, new_bid_receipt)
+        n_receipts = receipt_count(receipt_book)
+        self.count_page_receipts(Txn.sender, page, n_receipts)
+        return (
+            receipt_book_mbr(receipt_book, n_receipts)
+            - receipt_book_mbr(receipt_book, n_receipts - 1),
+            UInt64(0),
+        )
+
+    @abimethod
+    def bid(self, sale_key: SaleKey, new_bid_amount: arc4.UInt64) -> None:
+        sale_id = sale_id_of(sale_key)
+        bid_box_mbr, winning = self.outbid(
+            sale_key, sale_id, new_bid_amount, isolated=False
+        )
+        receipt_mbr, overwritten_amount = self.record_bid(sale_id, new_bid_amount)
+
+        mbr_diff = receipt_mbr + self.add_bid_totals(
+            Txn.sender, new_bid_amount.native, overwritten_amount, winning
+        )
+
+        # The overwritten receipt is given back before the new bid is taken.
+        self.settle(
+            Txn.sender,
+            overwritten_amount,
+            new_bid_amount.native + bid_box_mbr + mbr_diff,
+        )
+
+    @abimethod
+    def bid_many(
+        self,
+        sale_keys: arc4.DynamicArray[SaleKey],
+        amounts: arc4.DynamicArray[arc4.UInt64],
+    ) -> None:
+        assert sale_keys.length == amounts.length, err.LENGTH_MISMATCH
+
+        overwritten_amount = UInt64(0)
+        new_bids_amount = UInt64(0)
+        mbr_diff = UInt64(0)
+        winning = UInt64(0)
+        for i in urange(sale_keys.length):
+            sale_id = sale_id_of(sale_keys[i])
+            bid_box_mbr, bid_winning = self.outbid(
+                sale_keys[i], sale_id, amounts[i], isolated=False
+            )
+            receipt_mbr, overwritten_receipt_amount = self.record_bid(
+                sale_id, amounts[i]
+            )
+            mbr_diff += bid_box_mbr + receipt_mbr
+            winning += bid_winning
+            overwritten_amount += overwritten_receipt_amount
+            new_bids_amount += amounts[i].native
+
+        mbr_diff += self.add_bid_totals(
+            Txn.sender, new_bids_amount, overwritten_amount, winning
+        )
+
+        self.settle(Txn.sender, overwritten_amount, new_bids_amount + mbr_diff)
+
+    @abimethod
+    def isolated_bid(self, sale_key: SaleKey, new_bid_amount: arc4.UInt64) -> None:
+        sale_id = sale_id_of(sale_key)
+        bid_box_mbr, winning = self.outbid(
+            sale_key, sale_id, new_bid_amount, isolated=True
+        )
+
+        receipt_key = isolated_receipt_key(Txn.sender, sale_id)
+        previous_amount, exists = self.isolated_receipts.maybe(receipt_key)
+        receipt_box_mbr = UInt64(0)
+        if not exists:
+            receipt_box_mbr = self.isolated_receipt_box_mbr()
+
+        self.isolated_receipts[receipt_key] = new_bid_amount.native
+        receipt_box_mbr += self.add_bid_totals(
+            Txn.sender, new_bid_amount.native, previous_amount, winning
+        )
+
+        self.settle(
+            Txn.sender,
+            previous_amount,
+            new_bid_amount.native + bid_box_mbr + receipt_box_mbr,
+        )
+
+    @subroutine
+    def is_encumbered(self, bidder: Account, sale_id: arc4.UInt64) -> bool:
+        best_bid, exists = self.bids.maybe(sale_id)
+        return exists and best_bid.bidder == bidder
+
+    @subroutine
+    def claim_receipts(
+        self, bidder: Account, receipt_book: BoxRef, n_receipts: UInt64
+    ) -> tuple[UInt64, UInt64]:
+        # Removes the unencumbered receipts of the bidder from their receipt book.
+        # Returns the claimed amount and the number of receipts left in the book.
+        ensure_receipt_loop_budget(n_receipts)
+
+        # Encumbered receipts are compacted in place at the start of the book, and
+        #  only the ones that have to move are written.
+        claimed = UInt64(0)
+        n_encumbered = UInt64(0)
+        for i in urange(n_receipts):
+            receipt = read_receipt(receipt_book, i)
+            if not self.is_encumbered(bidder, receipt.sale_id):
+                claimed += receipt.amount.native
+                continue
+            if n_encumbered != i:
+                write_receipt(receipt_book, n_encumbered, receipt)
+            n_encumbered += 1
+
+        if n_encumbered != n_receipts:
+            truncate_receipts(receipt_book, n_encumbered)
+        return claimed, n_encumbered
 
     @abimethod
     def claim_unencumbered_bids(self) -> None:
-        encumbered_receipts = ImmutableArray[BidReceipt]()
+        # The length of the box is read first, failing if there is no receipt book.
+        n_receipts = (
+            self.receipt_book.length(Txn.sender) - cst.ARRAY_HEADER_SIZE
+        ) // cst.BID_RECEIPT_SIZE
+        receipt_book = self.receipt_book_box(Txn.sender)
+        claimed, n_encumbered = self.claim_receipts(
+            Txn.sender, receipt_book, n_receipts
+        )
+
+        mbr_diff = receipt_book_mbr(receipt_book, n_receipts) - receipt_book_mbr(
+            receipt_book, n_encumbered
+        )
+        self.sub_bid_totals(Txn.sender, claimed, UInt64(0))
+        self.deposited[Txn.sender] += claimed + mbr_diff
+
+    @abimethod
+    def open_receipt_pages(self, n_pages: arc4.UInt64) -> None:
+        # Splits the receipts of the caller across n_pages page boxes.
+        # The number of pages decides the page of every sale, so it can only be chosen
+        #  once and before any receipt is written in the receipt book.
+        assert 0 < n_pages.native <= cst.MAX_RECEIPT_PAGES, err.INVALID_PAGE_COUNT
+        assert Txn.sender not in self.receipt_book, err.RECEIPT_BOOK_IN_USE
+        assert not self.receipt_pages_of(Txn.sender), err.RECEIPT_BOOK_IN_USE
+
+        receipt_pages = self.receipt_pages_box(Txn.sender)
+        header_size = cst.ARRAY_HEADER_SIZE + n_pages.native * cst.UINT16_SIZE
+        _created = receipt_pages.create(size=header_size)
+        receipt_pages.replace(0, arc4.UInt16(n_pages.native).bytes)
+
+        # The number of pages is also kept in the totals of the bidder, which are
+        #  created here if the bidder never bid.
+        totals, exists = self.bid_totals.maybe(Txn.sender)
+        totals_mbr = UInt64(0)
+        if not exists:
+            totals = BidTotals(arc4.UInt64(), arc4.UInt64(), arc4.UInt16())
+            totals_mbr = self.bid_totals_box_mbr()
+        self.bid_totals[Txn.sender] = BidTotals(
+            totals.committed, totals.winning, arc4.UInt16(n_pages.native)
+        )
+
+        self.deposited[Txn.sender] -= (
+            box_mbr(receipt_pages.key.length + header_size) + totals_mbr
+        )
 
-        for receipt in self.receipt_book[Txn.sender]:
-            if self.is_encumbered(receipt):
-                encumbered_receipts = encumbered_receipts.append(receipt)
+    @abimethod
+    def claim_unencumbered_bids_of_page(self, page: arc4.UInt64) -> None:
+        # Same as claim_unencumbered_bids for a single page of a paged receipt book.
+        receipt_book = self.receipt_page_box(Txn.sender, page.native)
+        assert receipt_book, err.NOTHING_TO_CLAIM
+        n_receipts = receipt_count(receipt_book)
+        claimed, n_encumbered = self.claim_receipts(
+            Txn.sender, receipt_book, n_receipts
+        )
+        self.count_page_receipts(Txn.sender, page.native, n_encumbered)
+
+        mbr_diff = receipt_book_mbr(receipt_book, n_receipts) - receipt_book_mbr(
+            receipt_book, n_encumbered
+        )
+        self.sub_bid_totals(Txn.sender, claimed, UInt64(0))
+        self.deposited[Txn.sender] += claimed + mbr_diff
+
+    @subroutine
+    def pay_pruned_receipts(
+        self, bidder: Account, claimed: UInt64, freed_mbr: UInt64
+    ) -> None:
+        # The caller is paid a share of the MBR freed by pruning the receipts, the rest
+        #  goes back to the bidder along with the amount of the receipts.
+        assert freed_mbr, err.NOTHING_TO_CLAIM
+        bounty = freed_mbr // cst.PRUNE_BOUNTY_DIVISOR
+
+        self.sub_bid_totals(bidder, claimed, UInt64(0))
+        self.deposited[bidder] += claimed + freed_mbr - bounty
+        self.deposited[Txn.sender] += bounty
+
+    @abimethod
+    def prune_unencumbered_bids(self, bidder: arc4.Address) -> None:
+        # Anyone can claim the unencumbered receipts of a bidder on their behalf, so
+        #  that the boxes of inactive bidders don't keep growing.
+        assert bidder.native in self.receipt_book, err.NOTHING_TO_CLAIM
+        receipt_book = self.receipt_book_box(bidder.native)
+        n_receipts = receipt_count(receipt_book)
+        claimed, n_encumbered = self.claim_receipts(
+            bidder.native, receipt_book, n_receipts
+        )
+
+        self.pay_pruned_receipts(
+            bidder.native,
+            claimed,
+            receipt_book_mbr(receipt_book, n_receipts)
+            - receipt_book_mbr(receipt_book, n_encumbered),
+        )
+
+    @abimethod
+    def prune_unencumbered_bids_of_page(
+        self, bidder: arc4.Address, page: arc4.UInt64
+    ) -> None:
+        # Same as prune_unencumbered_bids for a single page of a paged receipt book.
+        receipt_book = self.receipt_page_box(bidder.native, page.native)
+        assert receipt_book, err.NOTHING_TO_CLAIM
+        n_receipts = receipt_count(receipt_book)
+        claimed, n_encumbered = self.claim_receipts(
+            bidder.native, receipt_book, n_receipts
+        )
+        self.count_page_receipts(bidder.native, page.native, n_encumbered)
+
+        self.pay_pruned_receipts(
+            bidder.native,
+            claimed,
+            receipt_book_mbr(receipt_book, n_receipts)
+            - receipt_book_mbr(receipt_book, n_encumbered),
+        )
+
+    @abimethod
+    def claim_unencumbered_bids_page(
+        self, offset: arc4.UInt64, limit: arc4.UInt64
+    ) -> None:
+        # Claims the unencumbered receipts among the (at most) limit receipts starting
+        #  at offset, editing only that slice of the receipt book box.
+        # Claimed receipts shift the following ones down, so several pages chained in
+        #  the same group must be claimed back to front to keep their offsets valid.
+        assert Txn.sender in self.receipt_book, err.NOTHING_TO_CLAIM
+        receipt_book = self.receipt_book_box(Txn.sender)
+
+        n_receipts = receipt_count(receipt_book)
+        assert offset.native < n_receipts, err.NOTHING_TO_CLAIM
+        page_length = n_receipts - offset.native
+        if limit.native < page_length:
+            page_length = limit.native
+
+        page_start = receipt_offset(offset.native)
+        page = receipt_book.extract(page_start, page_length * cst.BID_RECEIPT_SIZE)
+        ensure_receipt_loop_budget(page_length)
+
+        claimed = UInt64(0)
+        encumbered_receipts = Bytes()
+        for i in urange(page_length):
+            receipt = BidReceipt.from_bytes(
+                op.extract(page, i * cst.BID_RECEIPT_SIZE, cst.BID_RECEIPT_SIZE)
+            )
+            if self.is_encumbered(Txn.sender, receipt.sale_id):
+                encumbered_receipts += receipt.bytes
             else:
-                self.deposited[Txn.sender] += receipt.amount.native
+                claimed += receipt.amount.native
+        n_claimed = page_length - encumbered_receipts.length // cst.BID_RECEIPT_SIZE
 
-        mbr_baseline = Global.current_application_address.min_balance
-        if encumbered_receipts:
-            self.receipt_book[Txn.sender] = encumbered_receipts
-        else:
-            del self.receipt_book[Txn.sender]
-        mbr_diff = mbr_baseline - Global.current_application_address.min_balance
+        if n_claimed:
+            receipt_book.splice(page_start, page.length, encumbered_receipts)
+            truncate_receipts(receipt_book, n_receipts - n_claimed)
+        mbr_diff = receipt_book_mbr(receipt_book, n_receipts) - receipt_book_mbr(
+            receipt_book, n_receipts - n_claimed
+        )
+
+        self.sub_bid_totals(Txn.sender, claimed, UInt64(0))
+        self.deposited[Txn.sender] += claimed + mbr_diff
 
-        self.deposited[Txn.sender] += mbr_diff
+    @abimethod
+    def claim_isolated_bid(self, sale_key: SaleKey) -> None:
+        sale_id = sale_id_of(sale_key)
+        receipt_key = isolated_receipt_key(Txn.sender, sale_id)
+        amount = self.isolated_receipts[receipt_key]
+        assert not self.is_encumbered(Txn.sender, sale_id), err.ENCUMBERED_BID
+
+        del self.isolated_receipts[receipt_key]
+
+        self.sub_bid_totals(Txn.sender, amount, UInt64(0))
+        self.deposited[Txn.sender] += amount + self.isolated_receipt_box_mbr()
+
+    @subroutine
+    def total_and_unencumbered_bids(self, bidder: Account) -> UnencumberedBidsReceipt:
+        # Receipts that are not the best bid of their sale count as unencumbered.
+        totals, exists = self.bid_totals.maybe(bidder)
+        if not exists:
+            return UnencumberedBidsReceipt(UInt64(0), UInt64(0))
+        return UnencumberedBidsReceipt(
+            totals.committed.native,
+            totals.committed.native - totals.winning.native,
+        )
 
     @abimethod(readonly=True)
     def get_total_and_unencumbered_bids(self) -> UnencumberedBidsReceipt:
-        total_bids = UInt64(0)
-        unencumbered_bids = UInt64(0)
+        return self.total_and_unencumbered_bids(Txn.sender)
 
-        receipt_book, exists = self.receipt_book.maybe(Txn.sender)
-        if exists:
-            for receipt in receipt_book:
-                total_bids += receipt.amount.native
-                if not self.is_encumbered(receipt):
-                    unencumbered_bids += receipt.amount.native
+    @abimethod(readonly=True)
+    def get_total_and_unencumbered_bids_of(
+        self, bidders: arc4.DynamicArray[arc4.Address]
+    ) -> ImmutableArray[UnencumberedBidsReceipt]:
+        # Same as get_total_and_unencumbered_bids for each of the bidders, in order.
+        receipts = ImmutableArray[UnencumberedBidsReceipt]()
+        for bidder in bidders:
+            receipts = receipts.append(self.total_and_unencumbered_bids(bidder.native))
+        return receipts
+
+    @abimethod(readonly=True)
+    def get_receipt_count(self, bidder: arc4.Address) -> UInt64:
+        # Number of receipts in the receipt book of the bidder, zero if it has none.
+        # Only the length header of the box is read, so that clients sizing the fee of
+        #  a claim don't have to download the whole receipt book.
+        receipt_book = self.receipt_book_box(bidder.native)
+        if not receipt_book:
+            return UInt64(0)
+        return receipt_count(receipt_book)
+
+    @abimethod(readonly=True)
+    def get_receipt_pages(self, bidder: arc4.Address) -> arc4.DynamicArray[arc4.UInt16]:
+        # Number of receipts of each page of the bidder, empty if they have no pages.
+        return self.receipt_pages.get(
+            bidder.native, default=arc4.DynamicArray[arc4.UInt16]()
+        )
+
+    @abimethod(readonly=True)
+    def get_sales(
+        self, sale_keys: arc4.DynamicArray[SaleKey]
+    ) -> arc4.DynamicArray[SaleListing]:
+        # Meant to be simulated with extra opcode budget and unnamed resources, so that
+        #  a single request can snapshot many listings.
+        listings = arc4.DynamicArray[SaleListing]()
+        for sale_key in sale_keys:
+            listings.append(
+                SaleListing(
+                    self.sales.get(
+                        sale_key,
+                        default=Sale(arc4.UInt64(), arc4.UInt64(), arc4.UInt64()),
+                    ),
+                    self.bids.get(
+                        sale_id_of(sale_key),
+                        default=Bid(arc4.Address(), arc4.UInt64(), arc4.Bool()),
+                    ),
+                )
+            )
+        return listings
+
+    @subroutine
+    def award_bid(self, sale_key: SaleKey, sale_id: arc4.UInt64, bid: Bid) -> None:
+        # Settles the winning bid of a sale whose asset went to the bidder: the bid
+        #  box and the winning receipt are deleted and their MBR given back.
+        # A bidder can hold an older, lower receipt for the same sale in the other
+        #  storage, which stays in place and becomes claimable once the sale is gone.
+        bidder = bid.bidder.native
+        if bid.isolated.native:
+            del self.isolated_receipts[isolated_receipt_key(bidder, sale_id)]
+            receipt_mbr = self.isolated_receipt_box_mbr()
+        else:
+            receipt_book, page = self.receipt_book_of(bidder, sale_id)
+            n_receipts = receipt_count(receipt_book)
+            found, index = find_bid_receipt(receipt_book, sale_id)
+            assert found
 
-        return UnencumberedBidsReceipt(total_bids, unencumbered_bids)
+            remove_receipt(receipt_book, index)
+            self.count_page_receipts(bidder, page, n_receipts - 1)
+            receipt_mbr = receipt_book_mbr(receipt_book, n_receipts) - receipt_book_mbr(
+                receipt_book, n_receipts - 1
+            )
+        self.delete_bid(sale_key, sale_id)
+
+        self.sub_bid_totals(bidder, bid.amount.native, bid.amount.native)
+        self.deposited[bidder] += receipt_mbr + self.bid_box_mbr()
 
     @abimethod
     def accept_bid(self, asset: arc4.UInt64) -> None:
         sale_key = SaleKey(owner=arc4.Address(Txn.sender), asset=asset)
+        sale_id = sale_id_of(sale_key)
         sale = self.sales[sale_key]
-        current_best_bid = sale.bid
-        current_best_bidder = current_best_bid.bidder.native
+        current_best_bid = self.bids[sale_id]
 
-        seller_mbr_baseline = Global.current_application_address.min_balance
-        del self.sales[sale_key]
-        seller_mbr_diff = (
-            seller_mbr_baseline - Global.current_application_address.min_balance
-        )
+        self.delete_sale(sale_key)
 
-        self.deposited[Txn.sender] += current_best_bid.amount.native + seller_mbr_diff
+        self.deposited[Txn.sender] += (
+            current_best_bid.amount.native + self.sale_box_mbr()
+        )
         itxn.AssetTransfer(
             xfer_asset=asset.native,
-            asset_receiver=current_best_bidder,
+            asset_receiver=current_best_bid.bidder.native,
             asset_amount=sale.amount.native,
         ).submit()
 
-        receipt_book = self.receipt_book[current_best_bidder]
-        found, index = find_bid_receipt(receipt_book, sale_key)
-        assert found
+        self.award_bid(sale_key, sale_id, current_best_bid)
 
-        encumbered_receipts = ImmutableArray[BidReceipt]()
-        for receipt in receipt_book:
-            if receipt != receipt_book[index]:
-                encumbered_receipts = encumbered_receipts.append(receipt)
+    @abimethod
+    def settle_expired(self, sale_keys: arc4.DynamicArray[SaleKey]) -> None:
+        # Anyone can settle expired sales: the asset goes to the best bidder, or back
+        #  to the owner if there are no bids, and the boxes of the sale are deleted.
+        # A best bidder that can no longer receive the asset loses the sale, their bid
+        #  is released and the asset goes back to the owner. A sale whose owner can't
+        #  receive it either is skipped and stays expired until it can be settled.
+        # A sale that no longer exists, as when another caller settled it first, is
+        #  skipped too, so that competing callers don't revert each other's batches.
+        # All the asset transfers are submitted as a single inner group, whose fees
+        #  are paid by the caller.
+        assert sale_keys.length, err.NO_SALES
+        n_transfers = UInt64(0)
+        bid_refunds = UInt64(0)
+        for i in urange(sale_keys.length):
+            sale_key = sale_keys[i]
+            sale, exists = self.sales.maybe(sale_key)
+            if not exists:
+                continue
+            assert is_expired(sale), err.SALE_NOT_EXPIRED
 
-        bidder_mbr_baseline = Global.current_application_address.min_balance
-        if encumbered_receipts:
-            self.receipt_book[current_best_bidder] = encumbered_receipts
-        else:
-            del self.receipt_book[current_best_bidder]
-        bidder_mbr_diff = (
-            bidder_mbr_baseline - Global.current_application_address.min_balance
-        )
+            receiver = sale_key.owner.native
+            sale_id = sale_id_of(sale_key)
+            bid, has_bid = self.bids.maybe(sale_id)
+            awarded = has_bid and can_receive_asset(
+                bid.bidder.native, sale_key.asset.native
+            )
+            if awarded:
+                receiver = bid.bidder.native
+            elif not can_receive_asset(receiver, sale_key.asset.native):
+                continue
 
-        self.deposited[current_best_bidder] += bidder_mbr_diff
+            self.delete_sale(sale_key)
+            owner_proceeds = self.sale_box_mbr()
+            if awarded:
+                owner_proceeds += bid.amount.native
+                self.award_bid(sale_key, sale_id, bid)
+            else:
+                bid_refunds += self.drop_bid(sale_key, sale_id)
+            self.deposited[sale_key.owner.native] += owner_proceeds
+
+            if n_transfers == 0:
+                op.ITxnCreate.begin()
+            else:
+                op.ITxnCreate.next()
+            op.ITxnCreate.set_type_enum(TransactionType.AssetTransfer)
+            op.ITxnCreate.set_fee(0)
+            op.ITxnCreate.set_xfer_asset(sale_key.asset.native)
+            op.ITxnCreate.set_asset_receiver(receiver)
+            op.ITxnCreate.set_asset_amount(sale.amount.native)
+            n_transfers += 1
+        if n_transfers:
+            op.ITxnCreate.submit()
+        # The caller is refunded here if one of the released bids was theirs.
+        if bid_refunds:
+            self.deposited[Txn.sender] += bid_refunds
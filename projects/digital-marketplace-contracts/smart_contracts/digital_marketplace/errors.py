@@ -8,3 +8,14 @@ SALE_ALREADY_EXISTS: str = "Sale already exists"
 SELLER_CANT_BE_BIDDER: str = "Seller cannot be bidder"
 SELLER_CANT_BE_BUYER: str = "Seller cannot be buyer"
 NOTHING_TO_CLAIM: str = "Nothing to claim"
+ENCUMBERED_BID: str = "Encumbered bid"
+LENGTH_MISMATCH: str = "Length mismatch"
+MAX_TOTAL_COST_EXCEEDED: str = "Max total cost exceeded"
+SALE_NOT_FOUND: str = "Sale not found"
+INVALID_PAGE_COUNT: str = "Invalid page count"
+RECEIPT_BOOK_IN_USE: str = "Receipt book in use"
+INVALID_EXPIRY: str = "Invalid expiry"
+SALE_EXPIRED: str = "Sale expired"
+SALE_NOT_EXPIRED: str = "Sale not expired"
+INVALID_QUANTITY: str = "Invalid quantity"
+NO_SALES: str = "No sales"
@@ -0,0 +1,293 @@
+"""
+Off-chain batching of Digital Marketplace operations into transaction groups.
+
+A stream of operations is packed into groups of up to MAX_GROUP_SIZE transactions. The
+app calls of a group share their references, so the boxes of all the operations of a group
+are spread across the free slots of all its app calls, and add_resources calls are only
+added for the ones that don't fit. Accounts and assets stay on the app call of their
+operation, which has to hold them together for the inner transfers of assets.
+
+Fees are pooled: the first app call of each group pays the minimum fee of every transaction
+of the group and of every inner transaction, the other transactions pay none.
+"""
+
+import math
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+
+from algokit_utils import (
+    AlgoAmount,
+    CommonAppCallParams,
+    PaymentParams,
+    SendAtomicTransactionComposerResults,
+    SendParams,
+)
+
+from smart_contracts.artifacts.digital_marketplace.digital_marketplace_client import (
+    BidArgs,
+    BuyArgs,
+    DepositArgs,
+    DigitalMarketplaceClient,
+    DigitalMarketplaceComposer,
+    IsolatedBidArgs,
+    SaleKey,
+    WithdrawArgs,
+)
+from smart_contracts.digital_marketplace.offchain.budget import MIN_TXN_FEE
+from smart_contracts.digital_marketplace.offchain.resources import (
+    EMPTY_RECEIPT_BOOK,
+    MAX_APP_CALL_ACCOUNT_REFERENCES,
+    MAX_APP_CALL_REFERENCES,
+    TOO_MANY_REFERENCES,
+    AppCallResources,
+    BestBid,
+    ReceiptBookLayout,
+    bid_many_resources,
+    buy_many_resources,
+    deposit_resources,
+    isolated_bid_resources,
+)
+
+MAX_GROUP_SIZE = 16
+
+OPERATION_TOO_LARGE = "The operation doesn't fit in a transaction group"
+
+# Adds the operation to a group, given the params of its app call.
+AddOperation = Callable[
+    [DigitalMarketplaceComposer, CommonAppCallParams], DigitalMarketplaceComposer
+]
+
+
+@dataclass(frozen=True)
+class Operation:
+    """
+    A marketplace app call to batch, along with the transactions it brings to the group
+    and the inner transactions it issues.
+    """
+
+    sender: str
+    resources: AppCallResources
+    add: AddOperation
+    n_transactions: int = 1
+    n_inner_transactions: int = 0
+
+
+def deposit_operation(
+    client: DigitalMarketplaceClient, sender: str, amount: AlgoAmount
+) -> Operation:
+    """
+    Returns the operation depositing an amount for the sender, along with its payment.
+    """
+
+    def add(
+        composer: DigitalMarketplaceComposer, params: CommonAppCallParams
+    ) -> DigitalMarketplaceComposer:
+        payment = client.algorand.create_transaction.payment(
+            PaymentParams(
+                sender=sender,
+                receiver=client.app_address,
+                amount=amount,
+                static_fee=AlgoAmount(micro_algo=0),
+            )
+        )
+        return composer.deposit(DepositArgs(payment=payment), params=params)
+
+    return Operation(sender, deposit_resources(sender), add, n_transactions=2)
+
+
+def withdraw_operation(sender: str, amount: AlgoAmount) -> Operation:
+    """
+    Returns the operation withdrawing an amount for the sender.
+    """
+
+    def add(
+        composer: DigitalMarketplaceComposer, params: CommonAppCallParams
+    ) -> DigitalMarketplaceComposer:
+        return composer.withdraw(WithdrawArgs(amount=amount.micro_algo), params=params)
+
+    return Operation(sender, deposit_resources(sender), add, n_inner_transactions=1)
+
+
+def bid_operation(
+    sender: str,
+    sale_key: SaleKey,
+    amount: AlgoAmount,
+    bid: BestBid | None = None,
+    layout: ReceiptBookLayout = EMPTY_RECEIPT_BOOK,
+) -> Operation:
+    """
+    Returns the operation bidding on a sale, given its best bid and the layout of the
+    receipt book of the sender, which has to count the receipts added by the bids of the
+    sender batched before it.
+    """
+
+    def add(
+        composer: DigitalMarketplaceComposer, params: CommonAppCallParams
+    ) -> DigitalMarketplaceComposer:
+        return composer.bid(
+            BidArgs(sale_key=sale_key, new_bid_amount=amount.micro_algo),
+            params=params,
+        )
+
+    return Operation(sender, bid_many_resources(sender, [(sale_key, bid)], layout), add)
+
+
+def isolated_bid_operation(
+    sender: str, sale_key: SaleKey, amount: AlgoAmount, bid: BestBid | None = None
+) -> Operation:
+    """
+    Returns the operation placing an isolated bid on a sale, given its best bid.
+    """
+
+    def add(
+        composer: DigitalMarketplaceComposer, params: CommonAppCallParams
+    ) -> DigitalMarketplaceComposer:
+        return composer.isolated_bid(
+            IsolatedBidArgs(sale_key=sale_key, new_bid_amount=amount.micro_algo),
+            params=params,
+        )
+
+    return Operation(sender, isolated_bid_resources(sender, sale_key, bid), add)
+
+
+def buy_operation(
+    sender: str, sale_key: SaleKey, bid: BestBid | None = None
+) -> Operation:
+    """
+    Returns the operation buying a sale, given its best bid.
+    """
+
+    def add(
+        composer: DigitalMarketplaceComposer, params: CommonAppCallParams
+    ) -> DigitalMarketplaceComposer:
+        return composer.buy(BuyArgs(sale_key=sale_key), params=params)
+
+    return Operation(
+        sender,
+        buy_many_resources(sender, [(sale_key, bid)]),
+        add,
+        n_inner_transactions=1,
+    )
+
+
+def _free_slots(operation: Operation) -> int:
+    # Slots left for box references on the app call of the operation.
+    resources = operation.resources
+    if (
+        len(resources.accounts) > MAX_APP_CALL_ACCOUNT_REFERENCES
+        or len(resources.accounts) + len(resources.assets) > MAX_APP_CALL_REFERENCES
+    ):
+        raise ValueError(TOO_MANY_REFERENCES)
+    return MAX_APP_CALL_REFERENCES - len(resources.accounts) - len(resources.assets)
+
+
+def _shared_resources(operations: list[Operation]) -> AppCallResources:
+    shared = AppCallResources()
+    for operation in operations:
+        shared.merge(operation.resources)
+    return shared
+
+
+def n_resource_calls(operations: list[Operation]) -> int:
+    """
+    Returns the number of add_resources calls needed by a group of operations, to carry
+    the box references that don't fit in their app calls.
+    """
+    n_free_slots = sum(_free_slots(operation) for operation in operations)
+    n_missing = _shared_resources(operations).n_box_references - n_free_slots
+    return max(0, math.ceil(n_missing / MAX_APP_CALL_REFERENCES))
+
+
+def group_size(operations: list[Operation]) -> int:
+    """
+    Returns the number of transactions of a group of operations.
+    """
+    return sum(operation.n_transactions for operation in operations) + (
+        n_resource_calls(operations)
+    )
+
+
+def pack(operations: Iterable[Operation]) -> list[list[Operation]]:
+    """
+    Packs operations into groups of at most MAX_GROUP_SIZE transactions, in order.
+    Raises a ValueError if an operation doesn't fit in a group on its own.
+    """
+    groups: list[list[Operation]] = []
+    group: list[Operation] = []
+    for operation in operations:
+        if group_size([operation]) > MAX_GROUP_SIZE:
+            raise ValueError(OPERATION_TOO_LARGE)
+        if group and group_size([*group, operation]) > MAX_GROUP_SIZE:
+            groups.append(group)
+            group = []
+        group.append(operation)
+    if group:
+        groups.append(group)
+    return groups
+
+
+def group_fee(operations: list[Operation]) -> AlgoAmount:
+    """
+    Returns the pooled fee of a group of operations.
+    """
+    n_inner_transactions = sum(
+        operation.n_inner_transactions for operation in operations
+    )
+    return AlgoAmount(
+        micro_algo=(group_size(operations) + n_inner_transactions)
+        * MIN_TXN_FEE.micro_algo
+    )
+
+
+def compose(
+    client: DigitalMarketplaceClient, operations: list[Operation]
+) -> DigitalMarketplaceComposer:
+    """
+    Returns the group of a list of operations packed by pack.
+    The first operation's sender pays the fees of the whole group, add_resources calls
+    included, even for the transactions of other senders.
+    """
+    box_references = _shared_resources(operations).box_references()
+    fee = group_fee(operations)
+
+    composer = client.new_group()
+    for i, operation in enumerate(operations):
+        n_free_slots = _free_slots(operation)
+        composer = operation.add(
+            composer,
+            CommonAppCallParams(
+                sender=operation.sender,
+                box_references=box_references[:n_free_slots],
+                account_references=list(operation.resources.accounts),
+                asset_references=list(operation.resources.assets),
+                static_fee=fee if i == 0 else AlgoAmount(micro_algo=0),
+            ),
+        )
+        box_references = box_references[n_free_slots:]
+
+    for i in range(0, len(box_references), MAX_APP_CALL_REFERENCES):
+        composer = composer.add_resources(
+            params=CommonAppCallParams(
+                sender=operations[0].sender,
+                box_references=box_references[i : i + MAX_APP_CALL_REFERENCES],
+                static_fee=AlgoAmount(micro_algo=0),
+            )
+        )
+    return composer
+
+
+def send_batched(
+    client: DigitalMarketplaceClient,
+    operations: Iterable[Operation],
+    send_params: SendParams | None = None,
+) -> list[SendAtomicTransactionComposerResults]:
+    """
+    Sends operations packed into as few groups as possible, one group after the other.
+    Fees are pooled per group, so the sender of the first operation of each group pays
+    for every transaction of the group, including the ones of other senders. Callers
+    mixing senders that must pay their own fees should batch each sender separately.
+    """
+    return [
+        compose(client, group).send(send_params=send_params)
+        for group in pack(operations)
+    ]
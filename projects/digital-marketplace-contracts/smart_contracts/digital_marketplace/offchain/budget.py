@@ -0,0 +1,83 @@
+"""
+Off-chain estimates of the opcode budget needed by the methods that loop over a receipt book.
+
+The Digital Marketplace tops up its budget with OpUp inner app calls paid by the fee credit
+of the group, so a caller only has to add the fee of those inner calls to its transaction.
+"""
+
+import math
+
+from algokit_utils import AlgoAmount, CommonAppCallParams
+
+import smart_contracts.digital_marketplace.constants as cst
+from smart_contracts.artifacts.digital_marketplace.digital_marketplace_client import (
+    DigitalMarketplaceClient,
+    GetReceiptCountArgs,
+)
+
+# Opcode budget granted to every app call, including the OpUp inner ones. The budgets of
+#  the app calls of a group are pooled, add_resources calls included.
+APP_CALL_OPCODE_BUDGET = 700
+# Margin ensure_budget adds to the budget it is asked for.
+ENSURE_BUDGET_MARGIN = 10
+# Opcodes spent by each iteration of the ensure_budget loop, issuing an OpUp inner call
+#  included, along with the single opcode of the OpUp program. Each OpUp only adds the
+#  rest of its budget to the pool.
+OPUP_LOOP_OPCODES = 18
+OPUP_NET_BUDGET = APP_CALL_OPCODE_BUDGET - OPUP_LOOP_OPCODES
+MIN_TXN_FEE = AlgoAmount(micro_algo=1_000)
+
+
+def receipt_book_length(client: DigitalMarketplaceClient, bidder: str) -> int:
+    """
+    Returns the number of receipts in the receipt book of a bidder, zero if it has none.
+    The count is simulated with get_receipt_count, the receipt book isn't downloaded.
+    """
+    return (
+        client.send.get_receipt_count(
+            GetReceiptCountArgs(bidder=bidder),
+            params=CommonAppCallParams(sender=bidder),
+        ).abi_return
+        or 0
+    )
+
+
+def opup_count(n_receipts: int, *, n_app_calls: int = 1) -> int:
+    """
+    Returns how many OpUp inner calls are issued when looping over n_receipts receipts in
+    a group of n_app_calls app calls, which all add their budget to the pool.
+    Counting fewer app calls than the group holds overestimates the OpUp calls.
+    """
+    required_budget = (
+        cst.RECEIPT_LOOP_BASE_BUDGET
+        + n_receipts * cst.RECEIPT_LOOP_PER_RECEIPT_BUDGET
+        + ENSURE_BUDGET_MARGIN
+    )
+    # The work done before the budget check, by the call and the others of the group,
+    #  never exceeds the base budget.
+    available_budget = (
+        n_app_calls * APP_CALL_OPCODE_BUDGET - cst.RECEIPT_LOOP_BASE_BUDGET
+    )
+    return max(0, math.ceil((required_budget - available_budget) / OPUP_NET_BUDGET))
+
+
+def opup_extra_fee(n_receipts: int, *, n_app_calls: int = 1) -> AlgoAmount:
+    """
+    Returns the extra fee covering the OpUp inner calls issued when looping over n_receipts
+    receipts in a group of n_app_calls app calls.
+    """
+    return AlgoAmount(
+        micro_algo=opup_count(n_receipts, n_app_calls=n_app_calls)
+        * MIN_TXN_FEE.micro_algo
+    )
+
+
+def receipt_loop_extra_fee(
+    client: DigitalMarketplaceClient, bidder: str, *, n_app_calls: int = 1
+) -> AlgoAmount:
+    """
+    Returns the extra fee covering the OpUp inner calls issued when looping over the
+    receipt book of a bidder, as in claim_unencumbered_bids, in a group of n_app_calls
+    app calls.
+    """
+    return opup_extra_fee(receipt_book_length(client, bidder), n_app_calls=n_app_calls)
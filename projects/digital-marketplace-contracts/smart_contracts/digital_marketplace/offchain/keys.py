@@ -0,0 +1,110 @@
+"""
+Off-chain derivation of the box keys used by the Digital Marketplace.
+"""
+
+import base64
+import hashlib
+
+import smart_contracts.digital_marketplace.constants as cst
+from smart_contracts.artifacts.digital_marketplace.digital_marketplace_client import (
+    SaleKey,
+)
+
+
+def address_bytes(address: str) -> bytes:
+    """
+    Returns the 32 bytes public key encoded in an Algorand address.
+    """
+    decoded = base64.b32decode(address + "=" * (-len(address) % 8))
+    public_key, checksum = decoded[: cst.ADDRESS_SIZE], decoded[cst.ADDRESS_SIZE :]
+    if (
+        len(public_key) != cst.ADDRESS_SIZE
+        or checksum != hashlib.new("sha512_256", public_key).digest()[-4:]
+    ):
+        raise ValueError(f"invalid address: {address}")
+    return public_key
+
+
+def encode_sale_key(sale_key: SaleKey) -> bytes:
+    """
+    Returns the ARC-4 encoding of a sale key.
+    """
+    return address_bytes(sale_key.owner) + sale_key.asset.to_bytes(8, "big")
+
+
+def sale_id(sale_key: SaleKey) -> int:
+    """
+    Returns the compact identifier of a sale, which keys its bid and bid receipts.
+    """
+    digest = hashlib.sha256(encode_sale_key(sale_key)).digest()
+    return int.from_bytes(digest[: cst.SALE_ID_LENGTH], "big")
+
+
+def encode_sale_id(sale_key: SaleKey) -> bytes:
+    """
+    Returns the 8 bytes encoding of the compact identifier of a sale.
+    """
+    return sale_id(sale_key).to_bytes(cst.SALE_ID_LENGTH, "big")
+
+
+def isolated_receipt_key(bidder: str, sale_key: SaleKey) -> bytes:
+    """
+    Returns the key (without prefix) of the isolated receipt box of a bidder for a sale.
+    """
+    return address_bytes(bidder) + encode_sale_id(sale_key)
+
+
+def receipt_page(sale_key: SaleKey, n_pages: int) -> int:
+    """
+    Returns the page of a paged receipt book holding the receipt for a sale.
+    """
+    return sale_id(sale_key) % n_pages
+
+
+def receipt_page_key(bidder: str, page: int) -> bytes:
+    """
+    Returns the key (without prefix) of a page box of the receipt book of a bidder.
+    """
+    return address_bytes(bidder) + page.to_bytes(2, "big")
+
+
+# Box prefixes, which are the names of the BoxMap attributes of the contract unless
+#  the contract sets a shorter key_prefix.
+DEPOSITED_PREFIX = b"deposited"
+SALES_PREFIX = b"sales"
+BIDS_PREFIX = b"bids"
+BEST_ASKS_PREFIX = b"best_asks"
+BEST_BIDS_PREFIX = b"best_bids"
+RECEIPT_BOOK_PREFIX = b"receipt_book"
+RECEIPT_PAGES_PREFIX = b"receipt_pages"
+RECEIPT_BOOK_PAGES_PREFIX = b"p"
+ISOLATED_RECEIPTS_PREFIX = b"i"
+BID_TOTALS_PREFIX = b"bid_totals"
+
+
+def account_box_name(prefix: bytes, account: str) -> bytes:
+    """
+    Returns the full name of a box keyed by an account, such as its deposit box.
+    """
+    return prefix + address_bytes(account)
+
+
+def sale_box_name(prefix: bytes, sale_key: SaleKey) -> bytes:
+    """
+    Returns the full name of a box keyed by a sale, such as its sale or bid box.
+    """
+    return prefix + encode_sale_key(sale_key)
+
+
+def sale_id_box_name(prefix: bytes, sale_key: SaleKey) -> bytes:
+    """
+    Returns the full name of a box keyed by the compact id of a sale, such as its bid.
+    """
+    return prefix + encode_sale_id(sale_key)
+
+
+def asset_box_name(prefix: bytes, asset: int) -> bytes:
+    """
+    Returns the full name of a box keyed by an asset, such as its books.
+    """
+    return prefix + asset.to_bytes(8, "big")
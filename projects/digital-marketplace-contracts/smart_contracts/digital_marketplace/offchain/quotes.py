@@ -0,0 +1,436 @@
+"""
+Off-chain quotes of what the Digital Marketplace methods cost, computed without simulating
+them.
+
+A quote holds the extra fee covering the inner transactions of a call and how much the call
+changes the minimum balance of the application and the deposit of the sender. The MBR of
+each box is derived from the layout of its key and value, as the contract charges it.
+
+Like the resources of a call, its cost depends on a few facts of the state that callers
+usually already track, such as the best bid of a sale and the layout of a receipt book.
+"""
+
+from dataclasses import dataclass
+
+from algokit_utils import AlgoAmount
+
+import smart_contracts.digital_marketplace.constants as cst
+from smart_contracts.digital_marketplace.offchain import keys
+from smart_contracts.digital_marketplace.offchain.budget import (
+    MIN_TXN_FEE,
+    opup_extra_fee,
+)
+from smart_contracts.digital_marketplace.offchain.resources import (
+    EMPTY_RECEIPT_BOOK,
+    BestBid,
+    ReceiptBookLayout,
+)
+
+# Minimum balance the application needs to hold an asset.
+ASSET_OPT_IN_MIN_BALANCE = AlgoAmount(micro_algo=100_000)
+
+NO_FEE = AlgoAmount(micro_algo=0)
+
+# Receipt book holding nothing but the winning receipt of a sale.
+WINNING_RECEIPT_BOOK = ReceiptBookLayout(n_receipts=1)
+
+NOT_ENOUGH_DEPOSITED = "The deposit doesn't cover the call"
+
+
+@dataclass(frozen=True)
+class Quote:
+    """
+    Cost of a call: the extra fee to add to it for its inner transactions, and the changes
+    it makes to the minimum balance of the application and to the deposit of the sender,
+    in microAlgo.
+    """
+
+    extra_fee: AlgoAmount
+    mbr_delta: int
+    deposit_delta: int
+
+    def __add__(self, other: "Quote") -> "Quote":
+        return Quote(
+            self.extra_fee + other.extra_fee,
+            self.mbr_delta + other.mbr_delta,
+            self.deposit_delta + other.deposit_delta,
+        )
+
+    def deposited_after(self, deposited: int) -> int:
+        """
+        Returns the deposit of the sender after the call, given the one before it.
+        Raises a ValueError if the deposit doesn't cover the call.
+        """
+        if deposited + self.deposit_delta < 0:
+            raise ValueError(NOT_ENOUGH_DEPOSITED)
+        return deposited + self.deposit_delta
+
+
+def box_mbr(size: int) -> AlgoAmount:
+    """
+    Returns the MBR of a box, given the total size of its key and value.
+    """
+    return AlgoAmount(
+        micro_algo=cst.BOX_FLAT_MIN_BALANCE + size * cst.BOX_BYTE_MIN_BALANCE
+    )
+
+
+def deposit_box_mbr() -> AlgoAmount:
+    return box_mbr(len(keys.DEPOSITED_PREFIX) + cst.ADDRESS_SIZE + cst.UINT64_SIZE)
+
+
+def sale_box_mbr() -> AlgoAmount:
+    return box_mbr(len(keys.SALES_PREFIX) + cst.SALE_KEY_SIZE + cst.SALE_SIZE)
+
+
+def bid_box_mbr() -> AlgoAmount:
+    return box_mbr(len(keys.BIDS_PREFIX) + cst.SALE_ID_LENGTH + cst.BID_SIZE)
+
+
+def asset_books_mbr() -> AlgoAmount:
+    """
+    Returns the MBR of the books of the best asks and bids of an asset.
+    """
+    book_size = cst.UINT64_SIZE + cst.ASSET_BOOK_SIZE
+    return box_mbr(len(keys.BEST_ASKS_PREFIX) + book_size) + box_mbr(
+        len(keys.BEST_BIDS_PREFIX) + book_size
+    )
+
+
+def isolated_receipt_box_mbr() -> AlgoAmount:
+    return box_mbr(
+        len(keys.ISOLATED_RECEIPTS_PREFIX)
+        + cst.ADDRESS_SIZE
+        + cst.SALE_ID_LENGTH
+        + cst.UINT64_SIZE
+    )
+
+
+def bid_totals_box_mbr() -> AlgoAmount:
+    return box_mbr(len(keys.BID_TOTALS_PREFIX) + cst.ADDRESS_SIZE + cst.BID_TOTALS_SIZE)
+
+
+def receipt_book_mbr(n_receipts: int) -> AlgoAmount:
+    """
+    Returns the MBR of a receipt book holding n_receipts receipts, which is deleted when
+    empty.
+    """
+    if not n_receipts:
+        return NO_FEE
+    return box_mbr(
+        len(keys.RECEIPT_BOOK_PREFIX)
+        + cst.ADDRESS_SIZE
+        + cst.ARRAY_HEADER_SIZE
+        + n_receipts * cst.BID_RECEIPT_SIZE
+    )
+
+
+def receipt_page_mbr(n_receipts: int) -> AlgoAmount:
+    """
+    Returns the MBR of a page of a receipt book holding n_receipts receipts, which is
+    deleted when empty.
+    """
+    if not n_receipts:
+        return NO_FEE
+    return box_mbr(
+        len(keys.RECEIPT_BOOK_PAGES_PREFIX)
+        + cst.ADDRESS_SIZE
+        + cst.UINT16_SIZE
+        + cst.ARRAY_HEADER_SIZE
+        + n_receipts * cst.BID_RECEIPT_SIZE
+    )
+
+
+def receipt_pages_mbr(n_pages: int) -> AlgoAmount:
+    """
+    Returns the MBR of the header box of a receipt book split across n_pages pages.
+    """
+    return box_mbr(
+        len(keys.RECEIPT_PAGES_PREFIX)
+        + cst.ADDRESS_SIZE
+        + cst.ARRAY_HEADER_SIZE
+        + n_pages * cst.UINT16_SIZE
+    )
+
+
+def pro_rata_cost(cost: int, quantity: int, amount: int) -> int:
+    """
+    Returns the cost of quantity out of amount units on sale, rounded up like on chain.
+    """
+    return -(-cost * quantity // amount)
+
+
+def _book_mbr(layout: ReceiptBookLayout, n_receipts: int) -> int:
+    # MBR of the receipt book, or of the page, holding the receipt of a sale.
+    if layout.n_pages:
+        return receipt_page_mbr(n_receipts).micro_algo
+    return receipt_book_mbr(n_receipts).micro_algo
+
+
+def _released_mbr(bid: BestBid | None) -> int:
+    # MBR freed when a bid stops being the best bid of its sale.
+    if bid is None:
+        return 0
+    if bid.isolated:
+        return bid_box_mbr().micro_algo + isolated_receipt_box_mbr().micro_algo
+    return bid_box_mbr().micro_algo
+
+
+def _refund(sender: str, bid: BestBid | None) -> int:
+    # What the sender is given back when their own bid stops being the best one.
+    if bid is None or bid.bidder != sender:
+        return 0
+    return _released_mbr(bid) + (bid.amount if bid.isolated else 0)
+
+
+def _awarded_mbr(
+    bid: BestBid, layout: ReceiptBookLayout, page_receipts: int | None
+) -> int:
+    # MBR freed when a bid wins its sale: its bid box and its receipt, which deletes the
+    #  book, or its page, holding no other receipt. The layout only counts the largest
+    #  page of a paged book, so the page of the receipt is counted on its own.
+    if bid.isolated:
+        return _released_mbr(bid)
+    n_receipts = layout.n_receipts if page_receipts is None else page_receipts
+    return (
+        bid_box_mbr().micro_algo
+        + _book_mbr(layout, n_receipts)
+        - _book_mbr(layout, n_receipts - 1)
+    )
+
+
+def deposit_quote(amount: AlgoAmount, *, first_deposit: bool = False) -> Quote:
+    box = deposit_box_mbr().micro_algo if first_deposit else 0
+    return Quote(NO_FEE, box, amount.micro_algo - box)
+
+
+def withdraw_quote(amount: AlgoAmount) -> Quote:
+    return Quote(MIN_TXN_FEE, 0, -amount.micro_algo)
+
+
+def sponsor_asset_quote() -> Quote:
+    cost = ASSET_OPT_IN_MIN_BALANCE.micro_algo + asset_books_mbr().micro_algo
+    return Quote(MIN_TXN_FEE, cost, -cost)
+
+
+def open_sale_quote(n_sales: int = 1) -> Quote:
+    """
+    Returns the quote of open_sale, or of open_expiring_sale, and of open_sales with
+    n_sales sales.
+    """
+    mbr = n_sales * sale_box_mbr().micro_algo
+    return Quote(NO_FEE, mbr, -mbr)
+
+
+def close_sale_quote(bid: BestBid | None = None) -> Quote:
+    """
+    Returns the quote of close_sale, given the best bid of the sale.
+    """
+    sale_mbr = sale_box_mbr().micro_algo
+    return Quote(MIN_TXN_FEE, -sale_mbr - _released_mbr(bid), sale_mbr)
+
+
+def buy_quote(sender: str, cost: int, bid: BestBid | None = None) -> Quote:
+    """
+    Returns the quote of buy, given the cost and the best bid of the sale. The quote of
+    buy_many is the sum of the quotes of its sales.
+    """
+    return Quote(
+        MIN_TXN_FEE,
+        -sale_box_mbr().micro_algo - _released_mbr(bid),
+        _refund(sender, bid) - cost,
+    )
+
+
+def buy_partial_quote(
+    sender: str,
+    cost: int,
+    amount: int,
+    quantity: int,
+    bid: BestBid | None = None,
+) -> Quote:
+    """
+    Returns the quote of buy_partial, given the cost, the amount and the best bid of the
+    sale. Buying the whole amount closes the sale.
+    """
+    price = pro_rata_cost(cost, quantity, amount)
+    sale_mbr = sale_box_mbr().micro_algo if quantity == amount else 0
+    return Quote(
+        MIN_TXN_FEE,
+        -sale_mbr - _released_mbr(bid),
+        _refund(sender, bid) - price,
+    )
+
+
+def bid_quote(
+    sender: str,
+    amount: int,
+    bid: BestBid | None = None,
+    receipt_amount: int | None = None,
+    layout: ReceiptBookLayout = EMPTY_RECEIPT_BOOK,
+    *,
+    first_bid: bool = False,
+) -> Quote:
+    """
+    Returns the quote of bid, given the best bid of the sale, the amount of the receipt of
+    the sender for the sale if they hold one, the layout of their receipt book and whether
+    it is their first bid ever. The quote of bid_many is the sum of the quotes of its bids.
+    """
+    # The best bidder holds the MBR of the bid box, which a new one pays back.
+    bid_box = (
+        0 if bid is not None and bid.bidder == sender else bid_box_mbr().micro_algo
+    )
+    new_bid_box = bid_box_mbr().micro_algo if bid is None else 0
+    released_receipt = 0
+    if bid is not None and bid.bidder != sender and bid.isolated:
+        released_receipt = isolated_receipt_box_mbr().micro_algo
+
+    receipt_mbr = 0
+    if receipt_amount is None:
+        receipt_mbr = _book_mbr(layout, layout.n_receipts + 1) - _book_mbr(
+            layout, layout.n_receipts
+        )
+    totals_mbr = bid_totals_box_mbr().micro_algo if first_bid else 0
+
+    return Quote(
+        NO_FEE,
+        new_bid_box + receipt_mbr + totals_mbr - released_receipt,
+        (receipt_amount or 0) - amount - bid_box - receipt_mbr - totals_mbr,
+    )
+
+
+def isolated_bid_quote(
+    sender: str,
+    amount: int,
+    bid: BestBid | None = None,
+    *,
+    first_bid: bool = False,
+) -> Quote:
+    """
+    Returns the quote of isolated_bid, given the best bid of the sale and whether it is the
+    first bid ever of the sender.
+    """
+    bid_box = (
+        0 if bid is not None and bid.bidder == sender else bid_box_mbr().micro_algo
+    )
+    new_bid_box = bid_box_mbr().micro_algo if bid is None else 0
+    released_receipt = 0
+    if bid is not None and bid.bidder != sender and bid.isolated:
+        released_receipt = isolated_receipt_box_mbr().micro_algo
+
+    # Raising your own isolated bid overwrites its receipt.
+    previous_amount = 0
+    receipt_mbr = isolated_receipt_box_mbr().micro_algo
+    if bid is not None and bid.bidder == sender and bid.isolated:
+        previous_amount = bid.amount
+        receipt_mbr = 0
+    totals_mbr = bid_totals_box_mbr().micro_algo if first_bid else 0
+
+    return Quote(
+        NO_FEE,
+        new_bid_box + receipt_mbr + totals_mbr - released_receipt,
+        previous_amount - amount - bid_box - receipt_mbr - totals_mbr,
+    )
+
+
+def accept_bid_quote(
+    bid: BestBid,
+    layout: ReceiptBookLayout = WINNING_RECEIPT_BOOK,
+    *,
+    page_receipts: int | None = None,
+) -> Quote:
+    """
+    Returns the quote of accept_bid, given the best bid of the sale and the layout of the
+    receipt book of its bidder.
+    For a book split across pages, page_receipts is the number of receipts of the page
+    holding the winning receipt, as given by receipt_page_length. It defaults to the
+    receipt count of the layout.
+    """
+    sale_mbr = sale_box_mbr().micro_algo
+    return Quote(
+        MIN_TXN_FEE,
+        -sale_mbr - _awarded_mbr(bid, layout, page_receipts),
+        bid.amount + sale_mbr,
+    )
+
+
+def settle_expired_quote(
+    sales: list[tuple[BestBid | None, ReceiptBookLayout, int | None]],
+) -> Quote:
+    """
+    Returns the quote of settle_expired for its caller, given the best bid of each sale,
+    the layout of the receipt book of its bidder and the number of receipts of the page
+    holding the winning receipt, None for the receipt count of the layout. The proceeds
+    go to the owners.
+    The quote assumes every best bidder can still receive the asset, the bid of one that
+    can't is released instead of awarded.
+    """
+    mbr_delta = 0
+    for bid, layout, page_receipts in sales:
+        mbr_delta -= sale_box_mbr().micro_algo
+        if bid is not None:
+            mbr_delta -= _awarded_mbr(bid, layout, page_receipts)
+    return Quote(
+        AlgoAmount(micro_algo=len(sales) * MIN_TXN_FEE.micro_algo), mbr_delta, 0
+    )
+
+
+def _freed_receipts_mbr(
+    n_receipts: int, claimed: list[int], layout: ReceiptBookLayout
+) -> int:
+    return _book_mbr(layout, n_receipts) - _book_mbr(layout, n_receipts - len(claimed))
+
+
+def claim_quote(
+    n_receipts: int,
+    claimed: list[int],
+    layout: ReceiptBookLayout = EMPTY_RECEIPT_BOOK,
+    *,
+    n_app_calls: int = 1,
+) -> Quote:
+    """
+    Returns the quote of claim_unencumbered_bids, or of claim_unencumbered_bids_of_page
+    for a paged receipt book, given the number of receipts of the book or the page, the
+    amounts of the unencumbered ones and the number of app calls of the group.
+    """
+    freed_mbr = _freed_receipts_mbr(n_receipts, claimed, layout)
+    return Quote(
+        opup_extra_fee(n_receipts, n_app_calls=n_app_calls),
+        -freed_mbr,
+        sum(claimed) + freed_mbr,
+    )
+
+
+def prune_quote(
+    n_receipts: int,
+    claimed: list[int],
+    layout: ReceiptBookLayout = EMPTY_RECEIPT_BOOK,
+    *,
+    n_app_calls: int = 1,
+) -> Quote:
+    """
+    Returns the quote of prune_unencumbered_bids for its caller, or of
+    prune_unencumbered_bids_of_page for a paged receipt book, who is paid a bounty out of
+    the freed MBR, given the number of app calls of the group.
+    """
+    freed_mbr = _freed_receipts_mbr(n_receipts, claimed, layout)
+    return Quote(
+        opup_extra_fee(n_receipts, n_app_calls=n_app_calls),
+        -freed_mbr,
+        freed_mbr // cst.PRUNE_BOUNTY_DIVISOR,
+    )
+
+
+def claim_isolated_bid_quote(amount: int) -> Quote:
+    receipt_mbr = isolated_receipt_box_mbr().micro_algo
+    return Quote(NO_FEE, -receipt_mbr, amount + receipt_mbr)
+
+
+def open_receipt_pages_quote(n_pages: int, *, first_bid: bool = False) -> Quote:
+    """
+    Returns the quote of open_receipt_pages, given whether the sender never bid, in which
+    case it creates the box of their bid totals which keeps the number of pages.
+    """
+    header_mbr = receipt_pages_mbr(n_pages).micro_algo
+    totals_mbr = bid_totals_box_mbr().micro_algo if first_bid else 0
+    return Quote(NO_FEE, header_mbr + totals_mbr, -header_mbr - totals_mbr)
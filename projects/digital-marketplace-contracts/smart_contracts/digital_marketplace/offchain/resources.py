@@ -0,0 +1,568 @@
+"""
+Off-chain resolution of the resources referenced by the Digital Marketplace methods.
+
+Sending with populate_app_call_resources simulates every call to find the boxes, accounts
+and assets it touches. Those only depend on the arguments and the sender of the call, and
+on a few facts of the state that callers usually already track: the best bid of a sale
+and the layout of a receipt book. The functions of this module build the references from
+them, so that calls can be sent to algod right away.
+
+Calls touching more boxes than an app call can reference are sent in a group along with
+add_resources calls carrying the rest, see add_resource_calls.
+
+Callers that don't track those facts can read them with best_bid and
+receipt_book_layout, which simulate the readonly getters of the contract.
+"""
+
+import math
+from dataclasses import dataclass, field
+
+from algokit_utils import AlgoAmount, BoxIdentifier, BoxReference, CommonAppCallParams
+
+import smart_contracts.digital_marketplace.constants as cst
+from smart_contracts.artifacts.digital_marketplace.digital_marketplace_client import (
+    DigitalMarketplaceClient,
+    DigitalMarketplaceComposer,
+    GetReceiptPagesArgs,
+    GetSalesArgs,
+    SaleKey,
+)
+from smart_contracts.digital_marketplace.offchain import keys
+from smart_contracts.digital_marketplace.offchain.budget import receipt_book_length
+
+# Protocol limits of a single app call: the total number of references it can hold, how
+#  many of them can be accounts, and the box bytes each box reference lets it read and
+#  write, which is shared by the whole group.
+MAX_APP_CALL_REFERENCES = 8
+MAX_APP_CALL_ACCOUNT_REFERENCES = 4
+BOX_REFERENCE_IO_BUDGET = 1_024
+
+TOO_MANY_REFERENCES = "The call references more accounts and assets than it can hold"
+
+
+@dataclass(frozen=True)
+class BestBid:
+    """
+    Best bid of a sale: its bidder, its amount and whether it was placed with isolated_bid.
+    """
+
+    bidder: str
+    amount: int
+    isolated: bool = False
+
+
+@dataclass(frozen=True)
+class ReceiptBookLayout:
+    """
+    Layout of the receipt book of a bidder: its number of pages, zero if it isn't split
+    across pages, and its number of receipts, or the number of receipts of its largest
+    page.
+    """
+
+    n_pages: int = 0
+    n_receipts: int = 0
+
+
+EMPTY_RECEIPT_BOOK = ReceiptBookLayout()
+
+
+@dataclass
+class AppCallResources:
+    """
+    Boxes, accounts and assets referenced by an app call.
+
+    Boxes are kept along with the number of bytes they hold, since each box reference only
+    grants BOX_REFERENCE_IO_BUDGET bytes of box I/O: calls touching bigger boxes get extra
+    empty box references.
+    """
+
+    box_sizes: dict[bytes, int] = field(default_factory=dict)
+    accounts: list[str] = field(default_factory=list)
+    assets: list[int] = field(default_factory=list)
+
+    @property
+    def boxes(self) -> list[bytes]:
+        return list(self.box_sizes)
+
+    @property
+    def box_bytes(self) -> int:
+        return sum(self.box_sizes.values())
+
+    def add_box(self, name: bytes, size: int) -> None:
+        self.box_sizes[name] = max(self.box_sizes.get(name, 0), size)
+
+    def add_account(self, account: str) -> None:
+        if account not in self.accounts:
+            self.accounts.append(account)
+
+    def add_asset(self, asset: int) -> None:
+        if asset not in self.assets:
+            self.assets.append(asset)
+
+    def merge(self, other: "AppCallResources") -> None:
+        """
+        Adds the resources of another app call, as when both share them in a group.
+        """
+        for name, size in other.box_sizes.items():
+            self.add_box(name, size)
+        for account in other.accounts:
+            self.add_account(account)
+        for asset in other.assets:
+            self.add_asset(asset)
+
+    @property
+    def n_box_references(self) -> int:
+        return max(len(self.boxes), math.ceil(self.box_bytes / BOX_REFERENCE_IO_BUDGET))
+
+    @property
+    def n_references(self) -> int:
+        return len(self.accounts) + len(self.assets) + self.n_box_references
+
+    def box_references(self) -> list[BoxReference | BoxIdentifier]:
+        return [*self.boxes, *[b""] * (self.n_box_references - len(self.boxes))]
+
+    def params(
+        self, *, sender: str | None = None, extra_fee: AlgoAmount | None = None
+    ) -> CommonAppCallParams:
+        """
+        Returns the params of the app call referencing the accounts, the assets and as many
+        boxes as fit, along with its sender and extra fee. The other box references go to
+        the add_resources calls of extra_params.
+        Raises a ValueError if the accounts and assets alone don't fit in an app call.
+        """
+        n_foreign_references = len(self.accounts) + len(self.assets)
+        if (
+            len(self.accounts) > MAX_APP_CALL_ACCOUNT_REFERENCES
+            or n_foreign_references > MAX_APP_CALL_REFERENCES
+        ):
+            raise ValueError(TOO_MANY_REFERENCES)
+        return CommonAppCallParams(
+            box_references=self.box_references()[
+                : MAX_APP_CALL_REFERENCES - n_foreign_references
+            ],
+            account_references=list(self.accounts),
+            asset_references=list(self.assets),
+            sender=sender,
+            extra_fee=extra_fee,
+        )
+
+    @property
+    def n_app_calls(self) -> int:
+        """
+        Returns the number of app calls of the group: the app call and its add_resources
+        calls.
+        """
+        return 1 + len(self.extra_params())
+
+    def extra_params(self, *, sender: str | None = None) -> list[CommonAppCallParams]:
+        """
+        Returns the params of the add_resources calls carrying the box references that
+        don't fit in the app call, sent by sender.
+        Boxes referenced by any app call of a group are available to all of them.
+        """
+        n_main_box_references = len(self.params().box_references or [])
+        box_references = self.box_references()[n_main_box_references:]
+        return [
+            CommonAppCallParams(
+                box_references=box_references[i : i + MAX_APP_CALL_REFERENCES],
+                sender=sender,
+            )
+            for i in range(0, len(box_references), MAX_APP_CALL_REFERENCES)
+        ]
+
+
+def add_resource_calls(
+    composer: DigitalMarketplaceComposer,
+    resources: AppCallResources,
+    *,
+    sender: str | None = None,
+) -> DigitalMarketplaceComposer:
+    """
+    Adds to a group the add_resources calls, sent by sender, carrying the references of
+    an app call that don't fit in it.
+    """
+    for params in resources.extra_params(sender=sender):
+        composer = composer.add_resources(params=params)
+    return composer
+
+
+def best_bid(client: DigitalMarketplaceClient, sale_key: SaleKey) -> BestBid | None:
+    """
+    Returns the best bid of a sale, None if it has no bids.
+    The bid is simulated with get_sales, which reads a missing bid as a zero bidder.
+    """
+    listings = client.send.get_sales(
+        GetSalesArgs(sale_keys=[(sale_key.owner, sale_key.asset)]),
+        params=CommonAppCallParams(sender=sale_key.owner),
+    ).abi_return
+    if not listings:
+        return None
+    bidder, amount, isolated = listings[0][1]
+    if keys.address_bytes(bidder) == bytes(cst.ADDRESS_SIZE):
+        return None
+    return BestBid(bidder, amount, isolated)
+
+
+def _receipt_page_counts(client: DigitalMarketplaceClient, bidder: str) -> list[int]:
+    # Receipt count of each page of the bidder, simulated with get_receipt_pages.
+    return (
+        client.send.get_receipt_pages(
+            GetReceiptPagesArgs(bidder=bidder),
+            params=CommonAppCallParams(sender=bidder),
+        ).abi_return
+        or []
+    )
+
+
+def receipt_book_layout(
+    client: DigitalMarketplaceClient, bidder: str
+) -> ReceiptBookLayout:
+    """
+    Returns the layout of the receipt book of a bidder.
+    The page counts are simulated with get_receipt_pages, and the receipt count of a
+    bidder without pages with get_receipt_count.
+    """
+    page_counts = _receipt_page_counts(client, bidder)
+    if not page_counts:
+        return ReceiptBookLayout(n_receipts=receipt_book_length(client, bidder))
+    return ReceiptBookLayout(n_pages=len(page_counts), n_receipts=max(page_counts))
+
+
+def receipt_page_length(
+    client: DigitalMarketplaceClient, bidder: str, sale_key: SaleKey
+) -> int:
+    """
+    Returns the number of receipts of the page holding the receipt of a bidder for a
+    sale, or of their whole receipt book if it isn't split across pages.
+    """
+    page_counts = _receipt_page_counts(client, bidder)
+    if not page_counts:
+        return receipt_book_length(client, bidder)
+    return page_counts[keys.receipt_page(sale_key, len(page_counts))]
+
+
+def _add_deposit(resources: AppCallResources, account: str) -> None:
+    resources.add_box(
+        keys.account_box_name(keys.DEPOSITED_PREFIX, account), cst.UINT64_SIZE
+    )
+
+
+def _add_sale(resources: AppCallResources, sale_key: SaleKey) -> None:
+    # The sale box and the book of the asks of its asset.
+    resources.add_box(keys.sale_box_name(keys.SALES_PREFIX, sale_key), cst.SALE_SIZE)
+    resources.add_box(
+        keys.asset_box_name(keys.BEST_ASKS_PREFIX, sale_key.asset), cst.ASSET_BOOK_SIZE
+    )
+
+
+def _add_bid(resources: AppCallResources, sale_key: SaleKey) -> None:
+    # The bid box of the sale and the book of the bids of its asset.
+    resources.add_box(keys.sale_id_box_name(keys.BIDS_PREFIX, sale_key), cst.BID_SIZE)
+    resources.add_box(
+        keys.asset_box_name(keys.BEST_BIDS_PREFIX, sale_key.asset), cst.ASSET_BOOK_SIZE
+    )
+
+
+def _add_bid_totals(resources: AppCallResources, bidder: str) -> None:
+    resources.add_box(
+        keys.account_box_name(keys.BID_TOTALS_PREFIX, bidder), cst.BID_TOTALS_SIZE
+    )
+
+
+def _add_isolated_receipt(
+    resources: AppCallResources, sale_key: SaleKey, bidder: str
+) -> None:
+    resources.add_box(
+        keys.ISOLATED_RECEIPTS_PREFIX + keys.isolated_receipt_key(bidder, sale_key),
+        cst.UINT64_SIZE,
+    )
+
+
+def _add_bidder(resources: AppCallResources, sale_key: SaleKey, bid: BestBid) -> None:
+    # The boxes of a bidder settled when their bid on the sale stops being the best,
+    #  the isolated receipt only being read for a bid placed with isolated_bid.
+    if bid.isolated:
+        _add_isolated_receipt(resources, sale_key, bid.bidder)
+    _add_bid_totals(resources, bid.bidder)
+    _add_deposit(resources, bid.bidder)
+
+
+def _add_receipt_book(
+    resources: AppCallResources,
+    bidder: str,
+    sale_key: SaleKey,
+    layout: ReceiptBookLayout,
+    n_new_receipts: int,
+) -> None:
+    # The box holding the receipt of the bidder for the sale, found through the number
+    #  of pages kept in their bid totals. Only paged bidders reference the header of the
+    #  paged receipt books, which counts the receipts of each page.
+    _add_bid_totals(resources, bidder)
+    if layout.n_pages:
+        resources.add_box(
+            keys.account_box_name(keys.RECEIPT_PAGES_PREFIX, bidder),
+            cst.ARRAY_HEADER_SIZE + layout.n_pages * cst.UINT16_SIZE,
+        )
+
+    book_size = (
+        cst.ARRAY_HEADER_SIZE
+        + (layout.n_receipts + n_new_receipts) * cst.BID_RECEIPT_SIZE
+    )
+    if layout.n_pages:
+        page = keys.receipt_page(sale_key, layout.n_pages)
+        book_name = keys.RECEIPT_BOOK_PAGES_PREFIX + keys.receipt_page_key(bidder, page)
+    else:
+        book_name = keys.account_box_name(keys.RECEIPT_BOOK_PREFIX, bidder)
+    resources.add_box(book_name, book_size)
+
+
+def _add_dropped_bid(
+    resources: AppCallResources, sale_key: SaleKey, bid: BestBid | None
+) -> None:
+    _add_bid(resources, sale_key)
+    if bid is not None:
+        _add_bidder(resources, sale_key, bid)
+
+
+def _add_awarded_bid(
+    resources: AppCallResources,
+    sale_key: SaleKey,
+    bid: BestBid,
+    layout: ReceiptBookLayout,
+) -> None:
+    # The winning receipt is either isolated or in the receipt book of the bidder, and
+    #  the asset is transferred to the bidder.
+    _add_dropped_bid(resources, sale_key, bid)
+    if not bid.isolated:
+        _add_receipt_book(resources, bid.bidder, sale_key, layout, 0)
+    resources.add_account(bid.bidder)
+
+
+def _add_outbid(
+    resources: AppCallResources,
+    sender: str,
+    sale_key: SaleKey,
+    bid: BestBid | None,
+) -> None:
+    # The sale is checked to be open and the previous best bidder, if any, is refunded.
+    resources.add_box(keys.sale_box_name(keys.SALES_PREFIX, sale_key), cst.SALE_SIZE)
+    _add_dropped_bid(
+        resources, sale_key, None if bid is None or bid.bidder == sender else bid
+    )
+
+
+def deposit_resources(sender: str) -> AppCallResources:
+    """
+    Returns the resources of deposit, and of withdraw.
+    """
+    resources = AppCallResources()
+    _add_deposit(resources, sender)
+    return resources
+
+
+def sponsor_asset_resources(sender: str, asset: int) -> AppCallResources:
+    """
+    Returns the resources of sponsor_asset.
+    """
+    resources = AppCallResources()
+    resources.add_asset(asset)
+    resources.add_box(
+        keys.asset_box_name(keys.BEST_ASKS_PREFIX, asset), cst.ASSET_BOOK_SIZE
+    )
+    resources.add_box(
+        keys.asset_box_name(keys.BEST_BIDS_PREFIX, asset), cst.ASSET_BOOK_SIZE
+    )
+    _add_deposit(resources, sender)
+    return resources
+
+
+def open_sales_resources(sender: str, assets: list[int]) -> AppCallResources:
+    """
+    Returns the resources of open_sales, and of open_sale and open_expiring_sale with a
+    single asset.
+    """
+    resources = AppCallResources()
+    for asset in assets:
+        _add_sale(resources, SaleKey(owner=sender, asset=asset))
+    _add_deposit(resources, sender)
+    return resources
+
+
+def close_sale_resources(
+    sender: str, asset: int, bid: BestBid | None = None
+) -> AppCallResources:
+    """
+    Returns the resources of close_sale, given the best bid of the sale.
+    """
+    sale_key = SaleKey(owner=sender, asset=asset)
+    resources = AppCallResources()
+    resources.add_asset(asset)
+    _add_sale(resources, sale_key)
+    _add_dropped_bid(resources, sale_key, bid)
+    _add_deposit(resources, sender)
+    return resources
+
+
+def buy_many_resources(
+    sender: str, sales: list[tuple[SaleKey, BestBid | None]]
+) -> AppCallResources:
+    """
+    Returns the resources of buy_many, given each sale along with its best bid, and of
+    buy and buy_partial with a single sale.
+    """
+    resources = AppCallResources()
+    for sale_key, bid in sales:
+        resources.add_asset(sale_key.asset)
+        _add_sale(resources, sale_key)
+        _add_dropped_bid(resources, sale_key, bid)
+        _add_deposit(resources, sale_key.owner)
+    _add_deposit(resources, sender)
+    return resources
+
+
+def bid_many_resources(
+    sender: str,
+    bids: list[tuple[SaleKey, BestBid | None]],
+    layout: ReceiptBookLayout = EMPTY_RECEIPT_BOOK,
+) -> AppCallResources:
+    """
+    Returns the resources of bid_many, given each sale along with its best bid and the
+    layout of the receipt book of the sender, and of bid with a single sale.
+    """
+    resources = AppCallResources()
+    for sale_key, bid in bids:
+        _add_outbid(resources, sender, sale_key, bid)
+        _add_receipt_book(resources, sender, sale_key, layout, len(bids))
+    _add_bid_totals(resources, sender)
+    _add_deposit(resources, sender)
+    return resources
+
+
+def isolated_bid_resources(
+    sender: str, sale_key: SaleKey, bid: BestBid | None = None
+) -> AppCallResources:
+    """
+    Returns the resources of isolated_bid, given the best bid of the sale.
+    """
+    resources = AppCallResources()
+    _add_outbid(resources, sender, sale_key, bid)
+    _add_isolated_receipt(resources, sale_key, sender)
+    _add_bid_totals(resources, sender)
+    _add_deposit(resources, sender)
+    return resources
+
+
+def open_receipt_pages_resources(sender: str, n_pages: int) -> AppCallResources:
+    """
+    Returns the resources of open_receipt_pages.
+    """
+    resources = AppCallResources()
+    resources.add_box(keys.account_box_name(keys.RECEIPT_BOOK_PREFIX, sender), 0)
+    resources.add_box(
+        keys.account_box_name(keys.RECEIPT_PAGES_PREFIX, sender),
+        cst.ARRAY_HEADER_SIZE + n_pages * cst.UINT16_SIZE,
+    )
+    _add_bid_totals(resources, sender)
+    _add_deposit(resources, sender)
+    return resources
+
+
+def claim_resources(
+    sender: str,
+    bidder: str,
+    receipt_sale_keys: list[SaleKey],
+    layout: ReceiptBookLayout = EMPTY_RECEIPT_BOOK,
+    page: int = 0,
+) -> AppCallResources:
+    """
+    Returns the resources of the methods claiming the receipts of a bidder, given the sale
+    keys of the receipts they go through, the layout of the receipt book and the page
+    claimed if it is split across pages.
+
+    The sender is the bidder for claim_unencumbered_bids, claim_unencumbered_bids_page and
+    claim_unencumbered_bids_of_page, and anyone for the prune methods.
+    """
+    book_size = (
+        cst.ARRAY_HEADER_SIZE
+        + max(layout.n_receipts, len(receipt_sale_keys)) * cst.BID_RECEIPT_SIZE
+    )
+
+    resources = AppCallResources()
+    if layout.n_pages:
+        resources.add_box(
+            keys.RECEIPT_BOOK_PAGES_PREFIX + keys.receipt_page_key(bidder, page),
+            book_size,
+        )
+        resources.add_box(
+            keys.account_box_name(keys.RECEIPT_PAGES_PREFIX, bidder),
+            cst.ARRAY_HEADER_SIZE + layout.n_pages * cst.UINT16_SIZE,
+        )
+    else:
+        resources.add_box(
+            keys.account_box_name(keys.RECEIPT_BOOK_PREFIX, bidder), book_size
+        )
+    # Receipts are encumbered if they hold the best bid of their sale.
+    for sale_key in receipt_sale_keys:
+        resources.add_box(
+            keys.sale_id_box_name(keys.BIDS_PREFIX, sale_key), cst.BID_SIZE
+        )
+    _add_bid_totals(resources, bidder)
+    _add_deposit(resources, bidder)
+    _add_deposit(resources, sender)
+    return resources
+
+
+def claim_isolated_bid_resources(sender: str, sale_key: SaleKey) -> AppCallResources:
+    """
+    Returns the resources of claim_isolated_bid.
+    """
+    resources = AppCallResources()
+    resources.add_box(keys.sale_id_box_name(keys.BIDS_PREFIX, sale_key), cst.BID_SIZE)
+    _add_isolated_receipt(resources, sale_key, sender)
+    _add_bid_totals(resources, sender)
+    _add_deposit(resources, sender)
+    return resources
+
+
+def accept_bid_resources(
+    sender: str,
+    asset: int,
+    bid: BestBid,
+    layout: ReceiptBookLayout = EMPTY_RECEIPT_BOOK,
+) -> AppCallResources:
+    """
+    Returns the resources of accept_bid, given the best bid of the sale and the layout of
+    the receipt book of its bidder.
+    """
+    sale_key = SaleKey(owner=sender, asset=asset)
+    resources = AppCallResources()
+    resources.add_asset(asset)
+    _add_sale(resources, sale_key)
+    _add_awarded_bid(resources, sale_key, bid, layout)
+    _add_deposit(resources, sender)
+    return resources
+
+
+def settle_expired_resources(
+    sales: list[tuple[SaleKey, BestBid | None]],
+    layouts: dict[str, ReceiptBookLayout] | None = None,
+) -> AppCallResources:
+    """
+    Returns the resources of settle_expired, given each sale along with its best bid
+    and the layouts of the receipt books of the bidders, which default to a single book.
+    The owner is referenced even if the sale has a bid, since the asset goes back to them
+    if the bidder can no longer receive it.
+    """
+    layouts = layouts or {}
+    resources = AppCallResources()
+    for sale_key, bid in sales:
+        resources.add_asset(sale_key.asset)
+        _add_sale(resources, sale_key)
+        _add_bid(resources, sale_key)
+        resources.add_account(sale_key.owner)
+        if bid is not None:
+            _add_awarded_bid(
+                resources, sale_key, bid, layouts.get(bid.bidder, EMPTY_RECEIPT_BOOK)
+            )
+        _add_deposit(resources, sale_key.owner)
+    return resources
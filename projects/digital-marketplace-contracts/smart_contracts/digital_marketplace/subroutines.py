@@ -1,13 +1,247 @@
-from algopy import ImmutableArray, UInt64, subroutine, urange
+from algopy import (
+    Account,
+    BoxRef,
+    Bytes,
+    Global,
+    OpUpFeeSource,
+    UInt64,
+    arc4,
+    ensure_budget,
+    op,
+    subroutine,
+    urange,
+)
 
-from smart_contracts.digital_marketplace.contract import BidReceipt, SaleKey
+import smart_contracts.digital_marketplace.constants as cst
+from smart_contracts.digital_marketplace.contract import (
+    BidReceipt,
+    BookEntry,
+    Sale,
+    SaleKey,
+)
 
 
 @subroutine
-def find_bid_receipt(
-    receipts: ImmutableArray[BidReceipt], key: SaleKey
-) -> tuple[bool, UInt64]:
-    for i in urange(receipts.length):
-        if receipts[i].sale_key == key:
-            return True, i
-    return False, UInt64(0)
+def box_mbr(size: UInt64) -> UInt64:
+    # The size of a box includes its name, key prefix included.
+    return cst.BOX_FLAT_MIN_BALANCE + size * cst.BOX_BYTE_MIN_BALANCE
+
+
+# Receipt books are accessed in place through their box, never loaded as a whole.
+# They are ARC-4 encoded: a uint16 length followed by the fixed size receipts, so each
+#  receipt is read and written at a fixed offset and books can exceed a stack value.
+@subroutine
+def receipt_count(receipt_book: BoxRef) -> UInt64:
+    return op.btoi(receipt_book.extract(0, cst.ARRAY_HEADER_SIZE))
+
+
+@subroutine
+def receipt_offset(index: UInt64) -> UInt64:
+    return cst.ARRAY_HEADER_SIZE + index * cst.BID_RECEIPT_SIZE
+
+
+@subroutine
+def receipt_book_mbr(receipt_book: BoxRef, n_receipts: UInt64) -> UInt64:
+    # An empty receipt book is deleted, so it doesn't hold any MBR.
+    if not n_receipts:
+        return UInt64(0)
+    return box_mbr(receipt_book.key.length + receipt_offset(n_receipts))
+
+
+@subroutine
+def read_receipt(receipt_book: BoxRef, index: UInt64) -> BidReceipt:
+    return BidReceipt.from_bytes(
+        receipt_book.extract(receipt_offset(index), cst.BID_RECEIPT_SIZE)
+    )
+
+
+@subroutine
+def write_receipt(receipt_book: BoxRef, index: UInt64, receipt: BidReceipt) -> None:
+    receipt_book.replace(receipt_offset(index), receipt.bytes)
+
+
+@subroutine
+def insert_receipt(receipt_book: BoxRef, index: UInt64, receipt: BidReceipt) -> None:
+    # Shifts the receipts from index up by one slot.
+    n_receipts = receipt_count(receipt_book)
+    receipt_book.resize(receipt_offset(n_receipts + 1))
+    receipt_book.splice(receipt_offset(index), 0, receipt.bytes)
+    receipt_book.replace(0, arc4.UInt16(n_receipts + 1).bytes)
+
+
+@subroutine
+def truncate_receipts(receipt_book: BoxRef, n_receipts: UInt64) -> None:
+    # Keeps the first n_receipts receipts of the book, deleting it once empty.
+    if not n_receipts:
+        _deleted = receipt_book.delete()
+        return
+    receipt_book.resize(receipt_offset(n_receipts))
+    receipt_book.replace(0, arc4.UInt16(n_receipts).bytes)
+
+
+@subroutine
+def remove_receipt(receipt_book: BoxRef, index: UInt64) -> None:
+    # Shifts the receipts after index down by one slot.
+    n_receipts = receipt_count(receipt_book)
+    if index + 1 < n_receipts:
+        receipt_book.splice(receipt_offset(index), cst.BID_RECEIPT_SIZE, Bytes())
+    truncate_receipts(receipt_book, n_receipts - 1)
+
+
+@subroutine
+def find_bid_receipt(receipt_book: BoxRef, sale_id: arc4.UInt64) -> tuple[bool, UInt64]:
+    # Receipt books are sorted by sale id.
+    # Returns whether the receipt was found and either its index or the index where it
+    #  has to be inserted to keep the receipt book sorted.
+    # Only the sale ids of the probed receipts are read.
+    low = UInt64(0)
+    high = receipt_count(receipt_book)
+    while low < high:
+        middle = (low + high) // 2
+        middle_id = op.btoi(
+            receipt_book.extract(receipt_offset(middle), cst.SALE_ID_LENGTH)
+        )
+        if middle_id == sale_id.native:
+            return True, middle
+        if middle_id < sale_id.native:
+            low = middle + 1
+        else:
+            high = middle
+    return False, low
+
+
+# Asset books start with the number of sales of the asset they don't track, followed by
+#  slots indexing its best few sales, sorted from the best price, with the empty slots
+#  zeroed at the end.
+@subroutine
+def book_slot_offset(slot: UInt64) -> UInt64:
+    return cst.UINT64_SIZE + slot * cst.BOOK_ENTRY_SIZE
+
+
+@subroutine
+def read_book_entry(book: BoxRef, slot: UInt64) -> BookEntry:
+    return BookEntry.from_bytes(
+        book.extract(book_slot_offset(slot), cst.BOOK_ENTRY_SIZE)
+    )
+
+
+@subroutine
+def count_untracked(book: BoxRef, n_untracked: UInt64) -> None:
+    book.replace(0, op.itob(n_untracked))
+
+
+@subroutine
+def untracked_count(book: BoxRef) -> UInt64:
+    return op.btoi(book.extract(0, cst.UINT64_SIZE))
+
+
+@subroutine
+def remove_book_entry(book: BoxRef, owner: arc4.Address) -> None:
+    # Shifts the following entries up, which zeroes the last slot. A sale missing from
+    #  the slots was pushed out or left out of them, and is taken off the untracked
+    #  count instead.
+    for slot in urange(cst.ASSET_BOOK_SLOTS):
+        if book.extract(book_slot_offset(slot), cst.ADDRESS_SIZE) == owner.bytes:
+            book.splice(book_slot_offset(slot), cst.BOOK_ENTRY_SIZE, Bytes())
+            return
+    count_untracked(book, untracked_count(book) - 1)
+
+
+@subroutine
+def ranks_before(entry: BookEntry, current: BookEntry, *, descending: bool) -> bool:
+    # Entries are ranked by price per unit, compared by cross-multiplying the prices
+    #  and the amounts on 128 bits so that no precision is lost.
+    entry_high, entry_low = op.mulw(entry.price.native, current.amount.native)
+    current_high, current_low = op.mulw(current.price.native, entry.amount.native)
+    if entry_high != current_high:
+        if descending:
+            return entry_high > current_high
+        return entry_high < current_high
+    if descending:
+        return entry_low > current_low
+    return entry_low < current_low
+
+
+@subroutine
+def put_book_entry(
+    book: BoxRef, entry: BookEntry, *, descending: bool, replace: bool
+) -> None:
+    # Replaces the entry of the sale, if it has one, and inserts the new one in order.
+    # An entry that doesn't beat any indexed one is left out of a full book, and
+    #  inserting in a full book pushes its last entry out. Either way one more sale is
+    #  untracked.
+    if replace:
+        remove_book_entry(book, entry.owner)
+    if read_book_entry(book, UInt64(cst.ASSET_BOOK_SLOTS - 1)).owner != arc4.Address():
+        count_untracked(book, untracked_count(book) + 1)
+    for slot in urange(cst.ASSET_BOOK_SLOTS):
+        current = read_book_entry(book, slot)
+        if current.owner == arc4.Address() or ranks_before(
+            entry, current, descending=descending
+        ):
+            book.splice(book_slot_offset(slot), 0, entry.bytes)
+            return
+
+
+@subroutine
+def sale_id_of(key: SaleKey) -> arc4.UInt64:
+    # Compact 8 bytes identifier of a sale, derived from its 40 bytes key so that it
+    #  can be computed by anyone knowing the (owner, asset) pair without a lookup.
+    # Read as a uint64, so that receipts sorted by sale id compare as integers.
+    return arc4.UInt64.from_bytes(
+        op.extract(op.sha256(key.bytes), 0, cst.SALE_ID_LENGTH)
+    )
+
+
+@subroutine
+def isolated_receipt_key(bidder: Account, sale_id: arc4.UInt64) -> Bytes:
+    # Receipts of the same bidder share the prefix and can be listed off-chain.
+    return bidder.bytes + sale_id.bytes
+
+
+@subroutine
+def receipt_page(sale_id: arc4.UInt64, n_pages: UInt64) -> UInt64:
+    # The page of a sale only depends on its id, so it is found without a lookup.
+    return sale_id.native % n_pages
+
+
+@subroutine
+def receipt_page_key(bidder: Account, page: UInt64) -> Bytes:
+    return bidder.bytes + arc4.UInt16(page).bytes
+
+
+@subroutine
+def pro_rata_cost(cost: UInt64, quantity: UInt64, amount: UInt64) -> UInt64:
+    # Cost of quantity out of amount units, rounded up in favour of the seller.
+    # The product is computed on 128 bits, and the quotient never exceeds cost.
+    product_high, product_low = op.mulw(cost, quantity)
+    _quotient_high, quotient, _remainder_high, remainder = op.divmodw(
+        product_high, product_low, 0, amount
+    )
+    if remainder:
+        return quotient + 1
+    return quotient
+
+
+@subroutine
+def ensure_receipt_loop_budget(n_receipts: UInt64) -> None:
+    # The OpUp inner transactions are paid with the fee credit of the group.
+    ensure_budget(
+        cst.RECEIPT_LOOP_BASE_BUDGET + n_receipts * cst.RECEIPT_LOOP_PER_RECEIPT_BUDGET,
+        OpUpFeeSource.GroupCredit,
+    )
+
+
+@subroutine
+def is_expired(sale: Sale) -> bool:
+    # The expiry round is kept in the sale, so that the methods that check it don't
+    #  reference another box.
+    return sale.expires_at != 0 and Global.round >= sale.expires_at.native
+
+
+@subroutine
+def can_receive_asset(account: Account, asset: UInt64) -> bool:
+    # An asset transfer fails if the receiver isn't opted in to the asset, as when it
+    #  opted out after bidding, or if its holding is frozen.
+    frozen, opted_in = op.AssetHoldingGet.asset_frozen(account, asset)
+    return opted_in and not frozen
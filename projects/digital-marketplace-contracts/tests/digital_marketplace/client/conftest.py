@@ -46,10 +46,12 @@ from smart_contracts.artifacts.digital_marketplace.digital_marketplace_client im
     DepositArgs,
     DigitalMarketplaceClient,
     DigitalMarketplaceFactory,
+    IsolatedBidArgs,
     OpenSaleArgs,
     SaleKey,
     SponsorAssetArgs,
 )
+from smart_contracts.digital_marketplace.offchain.quotes import sponsor_asset_quote
 
 
 @pytest.fixture(scope="session")
@@ -262,7 +264,7 @@ def scenario_sponsor_asset(
     digital_marketplace_client.send.sponsor_asset(
         SponsorAssetArgs(asset=asset_to_sell),
         params=CommonAppCallParams(
-            extra_fee=AlgoAmount(micro_algo=1_000), sender=first_seller.address
+            extra_fee=sponsor_asset_quote().extra_fee, sender=first_seller.address
         ),
         send_params=SendParams(populate_app_call_resources=True),
     )
@@ -363,6 +365,30 @@ def scenario_first_seller_second_bidder_outbid(
     )
 
 
+@pytest.fixture(scope="function")
+def scenario_first_seller_first_bidder_isolated_bid(
+    asset_to_sell: int,
+    digital_marketplace_client: DigitalMarketplaceClient,
+    scenario_open_sale: Callable,
+    first_seller: SigningAccount,
+    first_bidder: SigningAccount,
+) -> None:
+    """
+    In this scenario, the sequence of events is:
+    1. The first seller opens a sale.
+    2. The first bidder places an isolated bid on the sale.
+    This is based on the 'scenario_open_sale'.
+    """
+    digital_marketplace_client.send.isolated_bid(
+        IsolatedBidArgs(
+            sale_key=SaleKey(owner=first_seller.address, asset=asset_to_sell),
+            new_bid_amount=cst.AMOUNT_TO_BID.micro_algo,
+        ),
+        params=CommonAppCallParams(sender=first_bidder.address),
+        send_params=SendParams(populate_app_call_resources=True),
+    )
+
+
 @pytest.fixture(scope="function")
 def scenario_accept_first_bid(
     asset_to_sell: int,
@@ -377,12 +403,13 @@ def scenario_accept_first_bid(
     3. The first seller accepts the bid.
     This is based on the 'scenario_first_seller_first_bidder_bid'.
     """
-    digital_marketplace_client.send.accept_bid(
+    digital_marketplace_client.new_group().accept_bid(
         AcceptBidArgs(asset=asset_to_sell),
         params=CommonAppCallParams(
             extra_fee=AlgoAmount(micro_algo=1_000), sender=first_seller.address
         ),
-        send_params=SendParams(populate_app_call_resources=True),
+    ).add_resources(params=CommonAppCallParams(sender=first_seller.address)).send(
+        send_params=SendParams(populate_app_call_resources=True)
     )
 
 
@@ -413,6 +440,8 @@ def scenario_first_bid_buy_both_sales(
         params=CommonAppCallParams(
             extra_fee=AlgoAmount(micro_algo=1_000), sender=buyer.address
         ),
+    ).add_resources(
+        params=CommonAppCallParams(sender=buyer.address)
     ).send(
         send_params=SendParams(populate_app_call_resources=True)
     )
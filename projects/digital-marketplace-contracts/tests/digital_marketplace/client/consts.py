@@ -1,4 +1,5 @@
 from algokit_utils import AlgoAmount
+from algosdk.constants import ZERO_ADDRESS
 
 AMOUNT_TO_FUND = AlgoAmount(algo=1_000_000)
 AMOUNT_TO_DEPOSIT = AlgoAmount(algo=50)
@@ -15,19 +16,52 @@ AMOUNT_TO_OUTBID = AMOUNT_TO_BID + AlgoAmount(micro_algo=1)
 # Box Prefix
 DEPOSITED_PREFIX = "deposited"
 SALES_PREFIX = "sales"
+BIDS_PREFIX = "bids"
+BEST_ASKS = "best_asks"
+BEST_BIDS = "best_bids"
 RECEIPT_BOOK = "receipt_book"
+ISOLATED_RECEIPTS = "i"
+BID_TOTALS = "bid_totals"
+RECEIPT_PAGES = "receipt_pages"
+RECEIPT_BOOK_PAGES = "p"
 
 # Box MBR
 DEPOSITED_BOX_MBR = AlgoAmount(
     micro_algo=2_500 + 400 * (len(DEPOSITED_PREFIX) + 32 + 8)
 )
 SALES_BOX_MBR = AlgoAmount(
-    micro_algo=2_500 + 400 * (len(SALES_PREFIX) + 32 + 8 + 8 + 8 + 32 + 8)
+    micro_algo=2_500 + 400 * (len(SALES_PREFIX) + 32 + 8 + 8 + 8 + 8)
+)
+BID_BOX_MBR = AlgoAmount(micro_algo=2_500 + 400 * (len(BIDS_PREFIX) + 8 + 32 + 8 + 1))
+ASSET_BOOK_SLOTS = 4
+ASSET_BOOKS_MBR = AlgoAmount(
+    micro_algo=2 * 2_500
+    + 400
+    * (len(BEST_ASKS) + len(BEST_BIDS) + 2 * (8 + 8 + ASSET_BOOK_SLOTS * (32 + 8 + 8)))
 )
 RECEIPT_BOOK_BOX_BASE_MBR = AlgoAmount(
     micro_algo=2_500 + 400 * (len(RECEIPT_BOOK) + 32 + 2)
 )
-RECEIPT_BOOK_BOX_PER_RECEIPT_MBR = AlgoAmount(micro_algo=400 * (32 + 8 + 8))
+RECEIPT_BOOK_BOX_PER_RECEIPT_MBR = AlgoAmount(micro_algo=400 * (8 + 8))
+RECEIPT_PAGES_BOX_BASE_MBR = AlgoAmount(
+    micro_algo=2_500 + 400 * (len(RECEIPT_PAGES) + 32 + 2)
+)
+RECEIPT_PAGES_BOX_PER_PAGE_MBR = AlgoAmount(micro_algo=400 * 2)
+RECEIPT_BOOK_PAGE_BOX_BASE_MBR = AlgoAmount(
+    micro_algo=2_500 + 400 * (len(RECEIPT_BOOK_PAGES) + 32 + 2 + 2)
+)
+ISOLATED_RECEIPT_BOX_MBR = AlgoAmount(
+    micro_algo=2_500 + 400 * (len(ISOLATED_RECEIPTS) + 32 + 8 + 8)
+)
+BID_TOTALS_BOX_MBR = AlgoAmount(
+    micro_algo=2_500 + 400 * (len(BID_TOTALS) + 32 + 8 + 8 + 2)
+)
+
+# Share of the freed MBR paid for pruning the receipts of another bidder
+PRUNE_BOUNTY_DIVISOR = 10
+
+# An empty slot of an asset book, as decoded by the typed client
+EMPTY_BOOK_ENTRY = [ZERO_ADDRESS, 0, 0]
 
 # Frequently used expressions
 RESIDUAL_INITIAL_DEPOSIT = AMOUNT_TO_DEPOSIT - DEPOSITED_BOX_MBR
@@ -1,5 +1,10 @@
 import consts as cst
-from algokit_utils import AlgoAmount, AlgorandClient
+from algokit_utils import AlgoAmount, AlgorandClient, PaymentParams, SigningAccount
+
+from smart_contracts.artifacts.digital_marketplace.digital_marketplace_client import (
+    SaleKey,
+)
+from smart_contracts.digital_marketplace.offchain import keys
 
 
 def asa_amount(algorand_client: AlgorandClient, account: str, asset_id: int) -> int:
@@ -14,6 +19,31 @@ def asa_amount(algorand_client: AlgorandClient, account: str, asset_id: int) ->
     )["amount"]
 
 
+def last_round(algorand_client: AlgorandClient) -> int:
+    """
+    Returns the last round of the ledger.
+    """
+    return algorand_client.client.algod.status()["last-round"]
+
+
+def advance_rounds(
+    algorand_client: AlgorandClient, account: SigningAccount, n_rounds: int
+) -> None:
+    """
+    Advances the ledger by n_rounds rounds, relying on the dev mode of LocalNet where
+    every transaction is confirmed in its own round.
+    """
+    for i in range(n_rounds):
+        algorand_client.send.payment(
+            PaymentParams(
+                sender=account.address,
+                receiver=account.address,
+                amount=AlgoAmount(micro_algo=0),
+                note=f"advance round {i}".encode(),
+            )
+        )
+
+
 def receipt_book_mbr(n_receipts: int) -> AlgoAmount:
     """
     Returns the MBR of the receipt book box depending on how many receipts contains.
@@ -26,3 +56,26 @@ def receipt_book_mbr(n_receipts: int) -> AlgoAmount:
             micro_algo=n_receipts * cst.RECEIPT_BOOK_BOX_PER_RECEIPT_MBR.micro_algo
         )
     )
+
+
+def receipt_pages_mbr(n_pages: int) -> AlgoAmount:
+    """
+    Returns the MBR of the header box of a receipt book split across n_pages pages.
+    """
+    return cst.RECEIPT_PAGES_BOX_BASE_MBR + AlgoAmount(
+        micro_algo=n_pages * cst.RECEIPT_PAGES_BOX_PER_PAGE_MBR.micro_algo
+    )
+
+
+def receipt(owner: str, asset: int, amount: int) -> list:
+    """
+    Returns a bid receipt as decoded by the typed client.
+    """
+    return [keys.sale_id(SaleKey(owner=owner, asset=asset)), amount]
+
+
+def sorted_receipts(receipts: list) -> list:
+    """
+    Sorts receipts in the order of the receipt books, which is by sale id.
+    """
+    return sorted(receipts, key=lambda receipt: receipt[0])
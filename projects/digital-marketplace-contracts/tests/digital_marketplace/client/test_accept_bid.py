@@ -14,11 +14,19 @@ from algosdk.error import AlgodHTTPError
 from smart_contracts.artifacts.digital_marketplace.digital_marketplace_client import (
     AcceptBidArgs,
     Bid,
+    BidArgs,
     DigitalMarketplaceClient,
     SaleKey,
 )
+from smart_contracts.digital_marketplace.offchain.keys import sale_id
+from smart_contracts.digital_marketplace.offchain.resources import (
+    accept_bid_resources,
+    add_resource_calls,
+    best_bid,
+    receipt_book_layout,
+)
 from tests.digital_marketplace.client import helpers
-from tests.digital_marketplace.client.helpers import receipt_book_mbr
+from tests.digital_marketplace.client.helpers import receipt, receipt_book_mbr
 
 
 def test_pass_accept_bid(
@@ -35,11 +43,11 @@ def test_pass_accept_bid(
     """
     sale_key = SaleKey(owner=first_seller.address, asset=asset_to_sell)
 
-    assert dm_client.state.box.sales.get_value(sale_key).bid == Bid(
-        bidder=first_bidder.address, amount=cst.AMOUNT_TO_BID.micro_algo
+    assert dm_client.state.box.bids.get_value(sale_id(sale_key)) == Bid(
+        bidder=first_bidder.address, amount=cst.AMOUNT_TO_BID.micro_algo, isolated=False
     )
     assert dm_client.state.box.receipt_book.get_value(first_bidder.public_key) == [
-        [[sale_key.owner, sale_key.asset], cst.AMOUNT_TO_BID.micro_algo]
+        receipt(sale_key.owner, sale_key.asset, cst.AMOUNT_TO_BID.micro_algo)
     ]
     deposited_before_call = dm_client.state.box.deposited.get_value(
         first_seller.address
@@ -53,11 +61,10 @@ def test_pass_accept_bid(
         first_bidder.address
     )
 
-    dm_client.send.accept_bid(
+    dm_client.new_group().accept_bid(
         AcceptBidArgs(asset=asset_to_sell),
         params=CommonAppCallParams(extra_fee=AlgoAmount(micro_algo=1_000)),
-        send_params=SendParams(populate_app_call_resources=True),
-    )
+    ).add_resources().send(send_params=SendParams(populate_app_call_resources=True))
 
     with pytest.raises(AlgodHTTPError, match="box not found"):
         _ = dm_client.state.box.sales.get_value(sale_key)
@@ -80,7 +87,54 @@ def test_pass_accept_bid(
     assert (
         dm_client.state.box.deposited.get_value(first_bidder.address)
         - bidder_deposited_before_call
-        == receipt_book_mbr(1).micro_algo
+        == (receipt_book_mbr(1) + cst.BID_BOX_MBR).micro_algo
+    )
+
+
+def test_pass_accept_bid_with_resolved_resources(
+    asset_to_sell: int,
+    dm_client: DigitalMarketplaceClient,
+    scenario_first_seller_first_bidder_bid: Callable,
+    algorand_client: AlgorandClient,
+    first_seller: SigningAccount,
+    first_bidder: SigningAccount,
+) -> None:
+    """
+    Test that accepting a bid sent with its resources resolved off-chain succeeds without
+    simulating it first.
+    """
+    sale_key = SaleKey(owner=first_seller.address, asset=asset_to_sell)
+    bid = best_bid(dm_client, sale_key)
+    assert bid is not None and bid.bidder == first_bidder.address
+    asa_balance_before_call = helpers.asa_amount(
+        algorand_client, first_bidder.address, asset_to_sell
+    )
+    resources = accept_bid_resources(
+        first_seller.address,
+        asset_to_sell,
+        bid,
+        receipt_book_layout(dm_client, bid.bidder),
+    )
+
+    add_resource_calls(
+        dm_client.new_group().accept_bid(
+            AcceptBidArgs(asset=asset_to_sell),
+            params=resources.params(
+                sender=first_seller.address, extra_fee=AlgoAmount(micro_algo=1_000)
+            ),
+        ),
+        resources,
+        sender=first_seller.address,
+    ).send(send_params=SendParams(populate_app_call_resources=False))
+
+    with pytest.raises(AlgodHTTPError, match="box not found"):
+        _ = dm_client.state.box.sales.get_value(sale_key)
+    with pytest.raises(AlgodHTTPError, match="box not found"):
+        _ = dm_client.state.box.receipt_book.get_value(first_bidder.public_key)
+    assert (
+        helpers.asa_amount(algorand_client, first_bidder.address, asset_to_sell)
+        - asa_balance_before_call
+        == cst.ASA_AMOUNT_TO_SELL
     )
 
 
@@ -100,10 +154,10 @@ def test_pass_unencumbered_bid_survives(
     sale_key = SaleKey(owner=first_seller.address, asset=asset_to_sell)
 
     assert dm_client.state.box.receipt_book.get_value(first_bidder.public_key) == [
-        [[sale_key.owner, sale_key.asset], cst.AMOUNT_TO_BID.micro_algo]
+        receipt(sale_key.owner, sale_key.asset, cst.AMOUNT_TO_BID.micro_algo)
     ]
     assert dm_client.state.box.receipt_book.get_value(second_bidder.public_key) == [
-        [[sale_key.owner, sale_key.asset], cst.AMOUNT_TO_BID.micro_algo + 1]
+        receipt(sale_key.owner, sale_key.asset, cst.AMOUNT_TO_BID.micro_algo + 1)
     ]
     first_bidder_deposited_before_call = dm_client.state.box.deposited.get_value(
         first_bidder.address
@@ -112,14 +166,13 @@ def test_pass_unencumbered_bid_survives(
         second_bidder.address
     )
 
-    dm_client.send.accept_bid(
+    dm_client.new_group().accept_bid(
         AcceptBidArgs(asset=asset_to_sell),
         params=CommonAppCallParams(extra_fee=AlgoAmount(micro_algo=1_000)),
-        send_params=SendParams(populate_app_call_resources=True),
-    )
+    ).add_resources().send(send_params=SendParams(populate_app_call_resources=True))
 
     assert dm_client.state.box.receipt_book.get_value(first_bidder.public_key) == [
-        [[sale_key.owner, sale_key.asset], cst.AMOUNT_TO_BID.micro_algo]
+        receipt(sale_key.owner, sale_key.asset, cst.AMOUNT_TO_BID.micro_algo)
     ]
     with pytest.raises(AlgodHTTPError, match="box not found"):
         _ = dm_client.state.box.receipt_book.get_value(second_bidder.public_key)
@@ -131,5 +184,47 @@ def test_pass_unencumbered_bid_survives(
     assert (
         dm_client.state.box.deposited.get_value(second_bidder.address)
         - second_bidder_deposited_before_call
-        == receipt_book_mbr(1).micro_algo
+        == (receipt_book_mbr(1) + cst.BID_BOX_MBR).micro_algo
+    )
+
+
+def test_pass_accept_bid_keeps_other_receipts(
+    asset_to_sell: int,
+    dm_client: DigitalMarketplaceClient,
+    scenario_first_seller_first_bidder_bid: Callable,
+    first_seller: SigningAccount,
+    second_seller: SigningAccount,
+    first_bidder: SigningAccount,
+) -> None:
+    """
+    Test that accepting a bid only removes its receipt from a receipt book holding others.
+    """
+    dm_client.send.bid(
+        BidArgs(
+            sale_key=SaleKey(owner=second_seller.address, asset=asset_to_sell),
+            new_bid_amount=cst.AMOUNT_TO_BID.micro_algo,
+        ),
+        params=CommonAppCallParams(sender=first_bidder.address),
+        send_params=SendParams(populate_app_call_resources=True),
+    )
+    bidder_deposited_before_call = dm_client.state.box.deposited.get_value(
+        first_bidder.address
+    )
+
+    dm_client.new_group().accept_bid(
+        AcceptBidArgs(asset=asset_to_sell),
+        params=CommonAppCallParams(
+            extra_fee=AlgoAmount(micro_algo=1_000), sender=first_seller.address
+        ),
+    ).add_resources(params=CommonAppCallParams(sender=first_seller.address)).send(
+        send_params=SendParams(populate_app_call_resources=True)
+    )
+
+    assert dm_client.state.box.receipt_book.get_value(first_bidder.public_key) == [
+        receipt(second_seller.address, asset_to_sell, cst.AMOUNT_TO_BID.micro_algo)
+    ]
+    assert (
+        dm_client.state.box.deposited.get_value(first_bidder.address)
+        - bidder_deposited_before_call
+        == (cst.RECEIPT_BOOK_BOX_PER_RECEIPT_MBR + cst.BID_BOX_MBR).micro_algo
     )
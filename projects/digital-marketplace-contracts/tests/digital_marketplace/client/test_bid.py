@@ -5,23 +5,38 @@ import pytest
 from algokit_utils import (
     AlgoAmount,
     AlgorandClient,
+    AssetTransferParams,
     CommonAppCallParams,
     LogicError,
     SendParams,
     SigningAccount,
 )
-from algosdk.constants import ZERO_ADDRESS
 from algosdk.error import AlgodHTTPError
 
 import smart_contracts.digital_marketplace.errors as err
 from smart_contracts.artifacts.digital_marketplace.digital_marketplace_client import (
     Bid,
     BidArgs,
+    BidTotals,
+    CloseSaleArgs,
     DigitalMarketplaceClient,
+    OpenSaleArgs,
     SaleKey,
     WithdrawArgs,
 )
-from tests.digital_marketplace.client.helpers import receipt_book_mbr
+from smart_contracts.digital_marketplace.offchain.keys import sale_id
+from smart_contracts.digital_marketplace.offchain.quotes import BestBid, bid_quote
+from smart_contracts.digital_marketplace.offchain.resources import (
+    add_resource_calls,
+    best_bid,
+    bid_many_resources,
+    receipt_book_layout,
+)
+from tests.digital_marketplace.client.helpers import (
+    receipt,
+    receipt_book_mbr,
+    sorted_receipts,
+)
 
 
 @pytest.fixture(scope="function")
@@ -42,9 +57,8 @@ def test_pass_first_bid(
     Test that the first bid on a sale succeeds and updates the local state correctly.
     """
     sale_key = SaleKey(owner=first_seller.address, asset=asset_to_sell)
-    assert dm_client.state.box.sales.get_value(sale_key).bid == Bid(
-        bidder=ZERO_ADDRESS, amount=0
-    )
+    with pytest.raises(AlgodHTTPError, match="box not found"):
+        _ = dm_client.state.box.bids.get_value(sale_id(sale_key))
     with pytest.raises(AlgodHTTPError, match="box not found"):
         _ = dm_client.state.box.receipt_book.get_value(first_bidder.public_key)
     deposited_before_call = dm_client.state.box.deposited.get_value(
@@ -59,19 +73,21 @@ def test_pass_first_bid(
         send_params=SendParams(populate_app_call_resources=True),
     )
 
-    assert dm_client.state.box.sales.get_value(sale_key).bid == Bid(
-        bidder=first_bidder.address, amount=cst.AMOUNT_TO_BID.micro_algo
+    assert dm_client.state.box.bids.get_value(sale_id(sale_key)) == Bid(
+        bidder=first_bidder.address, amount=cst.AMOUNT_TO_BID.micro_algo, isolated=False
     )
     assert dm_client.state.box.receipt_book.get_value(first_bidder.public_key) == [
-        [
-            [first_seller.address, asset_to_sell],
-            cst.AMOUNT_TO_BID.micro_algo,
-        ]
+        receipt(first_seller.address, asset_to_sell, cst.AMOUNT_TO_BID.micro_algo)
     ]
-    assert (
-        dm_client.state.box.deposited.get_value(first_bidder.address)
-        - deposited_before_call
-        == -(receipt_book_mbr(1) + cst.AMOUNT_TO_BID).micro_algo
+    assert dm_client.state.box.deposited.get_value(
+        first_bidder.address
+    ) - deposited_before_call == -(
+        (
+            receipt_book_mbr(1)
+            + cst.AMOUNT_TO_BID
+            + cst.BID_BOX_MBR
+            + cst.BID_TOTALS_BOX_MBR
+        ).micro_algo
     )
 
 
@@ -88,8 +104,8 @@ def test_pass_second_bid_is_outbid(
     Test that a second bid on a sale outbids the first bid and updates the local state correctly.
     """
     sale_key = SaleKey(owner=first_seller.address, asset=asset_to_sell)
-    assert dm_client.state.box.sales.get_value(sale_key).bid == Bid(
-        bidder=first_bidder.address, amount=cst.AMOUNT_TO_BID.micro_algo
+    assert dm_client.state.box.bids.get_value(sale_id(sale_key)) == Bid(
+        bidder=first_bidder.address, amount=cst.AMOUNT_TO_BID.micro_algo, isolated=False
     )
     with pytest.raises(AlgodHTTPError, match="box not found"):
         _ = dm_client.state.box.receipt_book.get_value(second_bidder.public_key)
@@ -105,22 +121,112 @@ def test_pass_second_bid_is_outbid(
         send_params=SendParams(populate_app_call_resources=True),
     )
 
-    assert dm_client.state.box.sales.get_value(sale_key).bid == Bid(
-        bidder=second_bidder.address, amount=cst.AMOUNT_TO_OUTBID.micro_algo
+    assert dm_client.state.box.bids.get_value(sale_id(sale_key)) == Bid(
+        bidder=second_bidder.address,
+        amount=cst.AMOUNT_TO_OUTBID.micro_algo,
+        isolated=False,
     )
     assert dm_client.state.box.receipt_book.get_value(second_bidder.public_key) == [
+        receipt(first_seller.address, asset_to_sell, cst.AMOUNT_TO_OUTBID.micro_algo)
+    ]
+    best_bids = dm_client.state.box.best_bids.get_value(asset_to_sell)
+    assert best_bids.n_untracked == 0
+    assert best_bids.slots == [
         [
-            [first_seller.address, asset_to_sell],
+            first_seller.address,
             cst.AMOUNT_TO_OUTBID.micro_algo,
-        ]
+            cst.ASA_AMOUNT_TO_SELL,
+        ],
+        *[cst.EMPTY_BOOK_ENTRY] * (cst.ASSET_BOOK_SLOTS - 1),
     ]
     assert dm_client.state.box.deposited.get_value(
         second_bidder.address
     ) - deposited_before_call == -(
-        (receipt_book_mbr(1) + cst.AMOUNT_TO_OUTBID).micro_algo
+        (
+            receipt_book_mbr(1)
+            + cst.AMOUNT_TO_OUTBID
+            + cst.BID_BOX_MBR
+            + cst.BID_TOTALS_BOX_MBR
+        ).micro_algo
+    )
+
+
+def test_pass_outbid_with_resolved_resources(
+    asset_to_sell: int,
+    dm_client: DigitalMarketplaceClient,
+    scenario_first_seller_first_bidder_bid: Callable,
+    first_seller: SigningAccount,
+    second_bidder: SigningAccount,
+) -> None:
+    """
+    Test that an outbid sent with its resources resolved off-chain succeeds without
+    simulating it first.
+    """
+    sale_key = SaleKey(owner=first_seller.address, asset=asset_to_sell)
+    resources = bid_many_resources(
+        second_bidder.address,
+        [(sale_key, best_bid(dm_client, sale_key))],
+        receipt_book_layout(dm_client, second_bidder.address),
+    )
+
+    add_resource_calls(
+        dm_client.new_group().bid(
+            BidArgs(sale_key=sale_key, new_bid_amount=cst.AMOUNT_TO_OUTBID.micro_algo),
+            params=resources.params(sender=second_bidder.address),
+        ),
+        resources,
+        sender=second_bidder.address,
+    ).send(send_params=SendParams(populate_app_call_resources=False))
+
+    assert dm_client.state.box.bids.get_value(sale_id(sale_key)) == Bid(
+        bidder=second_bidder.address,
+        amount=cst.AMOUNT_TO_OUTBID.micro_algo,
+        isolated=False,
     )
 
 
+def test_pass_outbid_matches_quote(
+    asset_to_sell: int,
+    dm_client: DigitalMarketplaceClient,
+    scenario_first_seller_first_bidder_bid: Callable,
+    algorand_client: AlgorandClient,
+    first_seller: SigningAccount,
+    first_bidder: SigningAccount,
+    second_bidder: SigningAccount,
+) -> None:
+    """
+    Test that an outbid changes the deposit of the bidder and the MBR of the application
+    by exactly its off-chain quote.
+    """
+    sale_key = SaleKey(owner=first_seller.address, asset=asset_to_sell)
+    quote = bid_quote(
+        second_bidder.address,
+        cst.AMOUNT_TO_OUTBID.micro_algo,
+        BestBid(first_bidder.address, cst.AMOUNT_TO_BID.micro_algo),
+        first_bid=True,
+    )
+    mbr_before_call = algorand_client.account.get_information(
+        dm_client.app_address
+    ).min_balance
+    deposited_before_call = dm_client.state.box.deposited.get_value(
+        second_bidder.address
+    )
+
+    dm_client.clone(default_sender=second_bidder.address).send.bid(
+        BidArgs(sale_key=sale_key, new_bid_amount=cst.AMOUNT_TO_OUTBID.micro_algo),
+        params=CommonAppCallParams(extra_fee=quote.extra_fee),
+        send_params=SendParams(populate_app_call_resources=True),
+    )
+
+    assert dm_client.state.box.deposited.get_value(
+        second_bidder.address
+    ) == quote.deposited_after(deposited_before_call)
+    assert (
+        algorand_client.account.get_information(dm_client.app_address).min_balance
+        - mbr_before_call
+    ).micro_algo == quote.mbr_delta
+
+
 def test_fail_worse_bid(
     asset_to_sell: int,
     dm_client: DigitalMarketplaceClient,
@@ -177,12 +283,10 @@ def test_pass_multiple_bid(
     """
     first_sale_key = SaleKey(owner=first_seller.address, asset=asset_to_sell)
     second_sale_key = SaleKey(owner=second_seller.address, asset=asset_to_sell)
-    assert dm_client.state.box.sales.get_value(first_sale_key).bid == Bid(
-        bidder=ZERO_ADDRESS, amount=0
-    )
-    assert dm_client.state.box.sales.get_value(second_sale_key).bid == Bid(
-        bidder=ZERO_ADDRESS, amount=0
-    )
+    with pytest.raises(AlgodHTTPError, match="box not found"):
+        _ = dm_client.state.box.bids.get_value(sale_id(first_sale_key))
+    with pytest.raises(AlgodHTTPError, match="box not found"):
+        _ = dm_client.state.box.bids.get_value(sale_id(second_sale_key))
 
     with pytest.raises(AlgodHTTPError, match="box not found"):
         _ = dm_client.state.box.receipt_book.get_value(first_bidder.public_key)
@@ -205,20 +309,25 @@ def test_pass_multiple_bid(
         send_params=SendParams(populate_app_call_resources=True)
     )
 
-    assert dm_client.state.box.sales.get_value(first_sale_key).bid == Bid(
-        bidder=first_bidder.address, amount=cst.AMOUNT_TO_BID.micro_algo
+    assert dm_client.state.box.bids.get_value(sale_id(first_sale_key)) == Bid(
+        bidder=first_bidder.address, amount=cst.AMOUNT_TO_BID.micro_algo, isolated=False
     )
-    assert dm_client.state.box.sales.get_value(second_sale_key).bid == Bid(
-        bidder=first_bidder.address, amount=cst.AMOUNT_TO_BID.micro_algo
+    assert dm_client.state.box.bids.get_value(sale_id(second_sale_key)) == Bid(
+        bidder=first_bidder.address, amount=cst.AMOUNT_TO_BID.micro_algo, isolated=False
+    )
+    assert dm_client.state.box.receipt_book.get_value(
+        first_bidder.public_key
+    ) == sorted_receipts(
+        [
+            receipt(first_seller.address, asset_to_sell, cst.AMOUNT_TO_BID.micro_algo),
+            receipt(second_seller.address, asset_to_sell, cst.AMOUNT_TO_BID.micro_algo),
+        ]
     )
-    assert dm_client.state.box.receipt_book.get_value(first_bidder.public_key) == [
-        [[first_seller.address, asset_to_sell], cst.AMOUNT_TO_BID.micro_algo],
-        [[second_seller.address, asset_to_sell], cst.AMOUNT_TO_BID.micro_algo],
-    ]
     assert dm_client.state.box.deposited.get_value(
         first_bidder.address
     ) - deposited_before_call == -(
-        2 * cst.AMOUNT_TO_BID.micro_algo + receipt_book_mbr(2).micro_algo
+        2 * (cst.AMOUNT_TO_BID + cst.BID_BOX_MBR).micro_algo
+        + (receipt_book_mbr(2) + cst.BID_TOTALS_BOX_MBR).micro_algo
     )
 
 
@@ -235,11 +344,11 @@ def test_pass_repeated_bid(
     """
     sale_key = SaleKey(owner=first_seller.address, asset=asset_to_sell)
 
-    assert dm_client.state.box.sales.get_value(sale_key).bid == Bid(
-        bidder=first_bidder.address, amount=cst.AMOUNT_TO_BID.micro_algo
+    assert dm_client.state.box.bids.get_value(sale_id(sale_key)) == Bid(
+        bidder=first_bidder.address, amount=cst.AMOUNT_TO_BID.micro_algo, isolated=False
     )
     assert dm_client.state.box.receipt_book.get_value(first_bidder.public_key) == [
-        [[first_seller.address, asset_to_sell], cst.AMOUNT_TO_BID.micro_algo]
+        receipt(first_seller.address, asset_to_sell, cst.AMOUNT_TO_BID.micro_algo)
     ]
     deposited_before_call = dm_client.state.box.deposited.get_value(
         first_bidder.address
@@ -253,11 +362,13 @@ def test_pass_repeated_bid(
         send_params=SendParams(populate_app_call_resources=True),
     )
 
-    assert dm_client.state.box.sales.get_value(sale_key).bid == Bid(
-        bidder=first_bidder.address, amount=cst.AMOUNT_TO_BID.micro_algo + 1
+    assert dm_client.state.box.bids.get_value(sale_id(sale_key)) == Bid(
+        bidder=first_bidder.address,
+        amount=cst.AMOUNT_TO_BID.micro_algo + 1,
+        isolated=False,
     )
     assert dm_client.state.box.receipt_book.get_value(first_bidder.public_key) == [
-        [[first_seller.address, asset_to_sell], cst.AMOUNT_TO_BID.micro_algo + 1],
+        receipt(first_seller.address, asset_to_sell, cst.AMOUNT_TO_BID.micro_algo + 1),
     ]
     assert (
         dm_client.state.box.deposited.get_value(first_bidder.address)
@@ -286,7 +397,11 @@ def test_pass_repeated_bid_exact_deposit(
     dm_client.send.withdraw(
         WithdrawArgs(
             amount=(
-                cst.RESIDUAL_INITIAL_DEPOSIT - cst.AMOUNT_TO_BID - receipt_book_mbr(1)
+                cst.RESIDUAL_INITIAL_DEPOSIT
+                - cst.AMOUNT_TO_BID
+                - cst.BID_BOX_MBR
+                - cst.BID_TOTALS_BOX_MBR
+                - receipt_book_mbr(1)
             ).micro_algo
             - 1
         ),
@@ -296,11 +411,11 @@ def test_pass_repeated_bid_exact_deposit(
 
     sale_key = SaleKey(owner=first_seller.address, asset=asset_to_sell)
 
-    assert dm_client.state.box.sales.get_value(sale_key).bid == Bid(
-        bidder=first_bidder.address, amount=cst.AMOUNT_TO_BID.micro_algo
+    assert dm_client.state.box.bids.get_value(sale_id(sale_key)) == Bid(
+        bidder=first_bidder.address, amount=cst.AMOUNT_TO_BID.micro_algo, isolated=False
     )
     assert dm_client.state.box.receipt_book.get_value(first_bidder.public_key) == [
-        [[first_seller.address, asset_to_sell], cst.AMOUNT_TO_BID.micro_algo]
+        receipt(first_seller.address, asset_to_sell, cst.AMOUNT_TO_BID.micro_algo)
     ]
     assert (
         dm_client.state.box.deposited.get_value(first_bidder.address)
@@ -315,11 +430,13 @@ def test_pass_repeated_bid_exact_deposit(
         send_params=SendParams(populate_app_call_resources=True),
     )
 
-    assert dm_client.state.box.sales.get_value(sale_key).bid == Bid(
-        bidder=first_bidder.address, amount=cst.AMOUNT_TO_BID.micro_algo + 1
+    assert dm_client.state.box.bids.get_value(sale_id(sale_key)) == Bid(
+        bidder=first_bidder.address,
+        amount=cst.AMOUNT_TO_BID.micro_algo + 1,
+        isolated=False,
     )
     assert dm_client.state.box.receipt_book.get_value(first_bidder.public_key) == [
-        [[first_seller.address, asset_to_sell], cst.AMOUNT_TO_BID.micro_algo + 1],
+        receipt(first_seller.address, asset_to_sell, cst.AMOUNT_TO_BID.micro_algo + 1),
     ]
 
     assert (
@@ -328,6 +445,69 @@ def test_pass_repeated_bid_exact_deposit(
     )
 
 
+def test_pass_lower_bid_on_reopened_sale(
+    asset_to_sell: int,
+    dm_client: DigitalMarketplaceClient,
+    scenario_first_seller_first_bidder_bid: Callable,
+    algorand_client: AlgorandClient,
+    first_seller: SigningAccount,
+    first_bidder: SigningAccount,
+) -> None:
+    """
+    Test that bidding on a closed and reopened sale less than the receipt left from the
+    previous listing overwrites the receipt and lowers the committed bids.
+    """
+    sale_key = SaleKey(owner=first_seller.address, asset=asset_to_sell)
+    lower_bid_amount = cst.AMOUNT_TO_BID.micro_algo - 1
+
+    dm_client.new_group().close_sale(
+        CloseSaleArgs(asset=asset_to_sell),
+        params=CommonAppCallParams(
+            extra_fee=AlgoAmount(micro_algo=1_000), sender=first_seller.address
+        ),
+    ).add_resources(params=CommonAppCallParams(sender=first_seller.address)).send(
+        send_params=SendParams(populate_app_call_resources=True)
+    )
+    dm_client.send.open_sale(
+        OpenSaleArgs(
+            asset_deposit=algorand_client.create_transaction.asset_transfer(
+                AssetTransferParams(
+                    sender=first_seller.address,
+                    asset_id=asset_to_sell,
+                    amount=cst.ASA_AMOUNT_TO_SELL,
+                    receiver=dm_client.app_address,
+                )
+            ),
+            cost=cst.COST_TO_BUY.micro_algo,
+        ),
+        params=CommonAppCallParams(sender=first_seller.address),
+        send_params=SendParams(populate_app_call_resources=True),
+    )
+    assert dm_client.state.box.bid_totals.get_value(first_bidder.address) == BidTotals(
+        committed=cst.AMOUNT_TO_BID.micro_algo, winning=0, n_pages=0
+    )
+    deposited_before_call = dm_client.state.box.deposited.get_value(
+        first_bidder.address
+    )
+
+    dm_client.send.bid(
+        BidArgs(sale_key=sale_key, new_bid_amount=lower_bid_amount),
+        send_params=SendParams(populate_app_call_resources=True),
+    )
+
+    assert dm_client.state.box.receipt_book.get_value(first_bidder.public_key) == [
+        receipt(first_seller.address, asset_to_sell, lower_bid_amount)
+    ]
+    assert dm_client.state.box.bid_totals.get_value(first_bidder.address) == BidTotals(
+        committed=lower_bid_amount, winning=lower_bid_amount, n_pages=0
+    )
+    assert (
+        dm_client.state.box.deposited.get_value(first_bidder.address)
+        - deposited_before_call
+        == 1 - cst.BID_BOX_MBR.micro_algo
+    )
+
+
 def test_fail_seller_cannot_be_bidder(
     asset_to_sell: int,
     digital_marketplace_client: DigitalMarketplaceClient,
@@ -0,0 +1,180 @@
+from typing import Callable
+
+import consts as cst
+import pytest
+from algokit_utils import (
+    CommonAppCallParams,
+    LogicError,
+    SendParams,
+    SigningAccount,
+)
+
+import smart_contracts.digital_marketplace.errors as err
+from smart_contracts.artifacts.digital_marketplace.digital_marketplace_client import (
+    Bid,
+    BidManyArgs,
+    DigitalMarketplaceClient,
+    SaleKey,
+)
+from smart_contracts.digital_marketplace.offchain.keys import sale_id
+from tests.digital_marketplace.client.helpers import (
+    receipt,
+    receipt_book_mbr,
+    sorted_receipts,
+)
+
+
+@pytest.fixture(scope="function")
+def dm_client(
+    digital_marketplace_client: DigitalMarketplaceClient, first_bidder: SigningAccount
+) -> DigitalMarketplaceClient:
+    return digital_marketplace_client.clone(default_sender=first_bidder.address)
+
+
+def test_pass_bid_many(
+    asset_to_sell: int,
+    dm_client: DigitalMarketplaceClient,
+    scenario_open_sale: Callable,
+    first_seller: SigningAccount,
+    second_seller: SigningAccount,
+    first_bidder: SigningAccount,
+) -> None:
+    """
+    Test that bidding on many sales in one call updates every sale and the receipt book.
+    """
+    first_sale_key = SaleKey(owner=first_seller.address, asset=asset_to_sell)
+    second_sale_key = SaleKey(owner=second_seller.address, asset=asset_to_sell)
+    deposited_before_call = dm_client.state.box.deposited.get_value(
+        first_bidder.address
+    )
+
+    dm_client.new_group().bid_many(
+        BidManyArgs(
+            sale_keys=[first_sale_key, second_sale_key],
+            amounts=[cst.AMOUNT_TO_BID.micro_algo, cst.AMOUNT_TO_OUTBID.micro_algo],
+        ),
+    ).add_resources().send(send_params=SendParams(populate_app_call_resources=True))
+
+    assert dm_client.state.box.bids.get_value(sale_id(first_sale_key)) == Bid(
+        bidder=first_bidder.address, amount=cst.AMOUNT_TO_BID.micro_algo, isolated=False
+    )
+    assert dm_client.state.box.bids.get_value(sale_id(second_sale_key)) == Bid(
+        bidder=first_bidder.address,
+        amount=cst.AMOUNT_TO_OUTBID.micro_algo,
+        isolated=False,
+    )
+    assert dm_client.state.box.receipt_book.get_value(
+        first_bidder.public_key
+    ) == sorted_receipts(
+        [
+            receipt(first_seller.address, asset_to_sell, cst.AMOUNT_TO_BID.micro_algo),
+            receipt(
+                second_seller.address, asset_to_sell, cst.AMOUNT_TO_OUTBID.micro_algo
+            ),
+        ]
+    )
+    assert dm_client.state.box.deposited.get_value(
+        first_bidder.address
+    ) - deposited_before_call == -(
+        (cst.AMOUNT_TO_BID + cst.AMOUNT_TO_OUTBID + receipt_book_mbr(2)).micro_algo
+        + 2 * cst.BID_BOX_MBR.micro_algo
+        + cst.BID_TOTALS_BOX_MBR.micro_algo
+    )
+
+
+def test_pass_bid_many_overwrites_own_receipt(
+    asset_to_sell: int,
+    dm_client: DigitalMarketplaceClient,
+    scenario_first_seller_first_bidder_bid: Callable,
+    first_seller: SigningAccount,
+    first_bidder: SigningAccount,
+) -> None:
+    """
+    Test that raising an existing bid through bid_many only charges the difference.
+    """
+    sale_key = SaleKey(owner=first_seller.address, asset=asset_to_sell)
+    deposited_before_call = dm_client.state.box.deposited.get_value(
+        first_bidder.address
+    )
+
+    dm_client.send.bid_many(
+        BidManyArgs(sale_keys=[sale_key], amounts=[cst.AMOUNT_TO_OUTBID.micro_algo]),
+        send_params=SendParams(populate_app_call_resources=True),
+    )
+
+    assert dm_client.state.box.receipt_book.get_value(first_bidder.public_key) == [
+        receipt(first_seller.address, asset_to_sell, cst.AMOUNT_TO_OUTBID.micro_algo),
+    ]
+    assert (
+        dm_client.state.box.deposited.get_value(first_bidder.address)
+        - deposited_before_call
+        == -(cst.AMOUNT_TO_OUTBID - cst.AMOUNT_TO_BID).micro_algo
+    )
+
+
+def test_fail_bid_many_worse_bid(
+    asset_to_sell: int,
+    dm_client: DigitalMarketplaceClient,
+    scenario_first_seller_first_bidder_bid: Callable,
+    first_seller: SigningAccount,
+    second_seller: SigningAccount,
+    second_bidder: SigningAccount,
+) -> None:
+    """
+    Test that bid_many fails if any of its bids is worse than the current best bid.
+    """
+    with pytest.raises(LogicError, match=err.WORSE_BID):
+        dm_client.send.bid_many(
+            BidManyArgs(
+                sale_keys=[
+                    SaleKey(owner=second_seller.address, asset=asset_to_sell),
+                    SaleKey(owner=first_seller.address, asset=asset_to_sell),
+                ],
+                amounts=[cst.AMOUNT_TO_BID.micro_algo, cst.AMOUNT_TO_BID.micro_algo],
+            ),
+            params=CommonAppCallParams(sender=second_bidder.address),
+            send_params=SendParams(populate_app_call_resources=True),
+        )
+
+
+def test_fail_bid_many_seller_cannot_be_bidder(
+    asset_to_sell: int,
+    dm_client: DigitalMarketplaceClient,
+    scenario_open_sale: Callable,
+    first_seller: SigningAccount,
+    second_seller: SigningAccount,
+) -> None:
+    """
+    Test that bid_many fails if the caller bids on their own sale.
+    """
+    with pytest.raises(LogicError, match=err.SELLER_CANT_BE_BIDDER):
+        dm_client.send.bid_many(
+            BidManyArgs(
+                sale_keys=[
+                    SaleKey(owner=second_seller.address, asset=asset_to_sell),
+                    SaleKey(owner=first_seller.address, asset=asset_to_sell),
+                ],
+                amounts=[cst.AMOUNT_TO_BID.micro_algo, cst.AMOUNT_TO_BID.micro_algo],
+            ),
+            params=CommonAppCallParams(sender=first_seller.address),
+            send_params=SendParams(populate_app_call_resources=True),
+        )
+
+
+def test_fail_bid_many_length_mismatch(
+    asset_to_sell: int,
+    dm_client: DigitalMarketplaceClient,
+    scenario_open_sale: Callable,
+    first_seller: SigningAccount,
+) -> None:
+    """
+    Test that bid_many fails if sale keys and amounts have different lengths.
+    """
+    with pytest.raises(LogicError, match=err.LENGTH_MISMATCH):
+        dm_client.send.bid_many(
+            BidManyArgs(
+                sale_keys=[SaleKey(owner=first_seller.address, asset=asset_to_sell)],
+                amounts=[],
+            ),
+            send_params=SendParams(populate_app_call_resources=True),
+        )
@@ -0,0 +1,152 @@
+from typing import Callable
+
+import consts as cst
+import helpers
+import pytest
+from algokit_utils import (
+    AlgoAmount,
+    AlgorandClient,
+    CommonAppCallParams,
+    LogicError,
+    SendParams,
+    SigningAccount,
+)
+from algosdk.error import AlgodHTTPError
+
+import smart_contracts.digital_marketplace.errors as err
+from smart_contracts.artifacts.digital_marketplace.digital_marketplace_client import (
+    BuyManyArgs,
+    DigitalMarketplaceClient,
+    SaleKey,
+)
+
+
+@pytest.fixture(scope="function")
+def dm_client(
+    digital_marketplace_client: DigitalMarketplaceClient, buyer: SigningAccount
+) -> DigitalMarketplaceClient:
+    return digital_marketplace_client.clone(default_sender=buyer.address)
+
+
+def test_pass_buy_many(
+    asset_to_sell: int,
+    dm_client: DigitalMarketplaceClient,
+    scenario_open_sale: Callable,
+    algorand_client: AlgorandClient,
+    buyer: SigningAccount,
+    first_seller: SigningAccount,
+    second_seller: SigningAccount,
+) -> None:
+    """
+    Test that sweeping several sales in one call settles all of them.
+    """
+    sale_keys = [
+        SaleKey(owner=first_seller.address, asset=asset_to_sell),
+        SaleKey(owner=second_seller.address, asset=asset_to_sell),
+    ]
+    first_seller_deposited_before_call = dm_client.state.box.deposited.get_value(
+        first_seller.address
+    )
+    second_seller_deposited_before_call = dm_client.state.box.deposited.get_value(
+        second_seller.address
+    )
+    buyer_deposited_before_call = dm_client.state.box.deposited.get_value(buyer.address)
+    buyer_asa_balance = helpers.asa_amount(
+        algorand_client, buyer.address, asset_to_sell
+    )
+
+    dm_client.new_group().buy_many(
+        BuyManyArgs(
+            sale_keys=sale_keys,
+            max_total_cost=2 * cst.COST_TO_BUY.micro_algo,
+        ),
+        params=CommonAppCallParams(extra_fee=AlgoAmount(micro_algo=2_000)),
+    ).add_resources().send(send_params=SendParams(populate_app_call_resources=True))
+
+    assert (
+        dm_client.state.box.deposited.get_value(first_seller.address)
+        - first_seller_deposited_before_call
+        == (cst.COST_TO_BUY + cst.SALES_BOX_MBR).micro_algo
+    )
+    assert (
+        dm_client.state.box.deposited.get_value(second_seller.address)
+        - second_seller_deposited_before_call
+        == (cst.COST_TO_BUY + cst.SALES_BOX_MBR).micro_algo
+    )
+    assert (
+        dm_client.state.box.deposited.get_value(buyer.address)
+        - buyer_deposited_before_call
+        == -2 * cst.COST_TO_BUY.micro_algo
+    )
+    assert (
+        helpers.asa_amount(algorand_client, buyer.address, asset_to_sell)
+        - buyer_asa_balance
+        == 2 * cst.ASA_AMOUNT_TO_SELL
+    )
+    for sale_key in sale_keys:
+        with pytest.raises(AlgodHTTPError, match="box not found"):
+            dm_client.state.box.sales.get_value(sale_key)
+
+
+def test_fail_buy_many_max_total_cost_exceeded(
+    asset_to_sell: int,
+    dm_client: DigitalMarketplaceClient,
+    scenario_open_sale: Callable,
+    first_seller: SigningAccount,
+    second_seller: SigningAccount,
+) -> None:
+    """
+    Test that sweeping fails if the sales cost more than the given ceiling.
+    """
+    with pytest.raises(LogicError, match=err.MAX_TOTAL_COST_EXCEEDED):
+        dm_client.send.buy_many(
+            BuyManyArgs(
+                sale_keys=[
+                    SaleKey(owner=first_seller.address, asset=asset_to_sell),
+                    SaleKey(owner=second_seller.address, asset=asset_to_sell),
+                ],
+                max_total_cost=2 * cst.COST_TO_BUY.micro_algo - 1,
+            ),
+            params=CommonAppCallParams(extra_fee=AlgoAmount(micro_algo=2_000)),
+            send_params=SendParams(populate_app_call_resources=True),
+        )
+
+
+def test_fail_buy_many_seller_cannot_be_buyer(
+    asset_to_sell: int,
+    dm_client: DigitalMarketplaceClient,
+    scenario_open_sale: Callable,
+    first_seller: SigningAccount,
+    second_seller: SigningAccount,
+) -> None:
+    """
+    Test that sweeping fails if the caller is the owner of one of the sales.
+    """
+    with pytest.raises(LogicError, match=err.SELLER_CANT_BE_BUYER):
+        dm_client.send.buy_many(
+            BuyManyArgs(
+                sale_keys=[
+                    SaleKey(owner=first_seller.address, asset=asset_to_sell),
+                    SaleKey(owner=second_seller.address, asset=asset_to_sell),
+                ],
+                max_total_cost=2 * cst.COST_TO_BUY.micro_algo,
+            ),
+            params=CommonAppCallParams(
+                extra_fee=AlgoAmount(micro_algo=2_000), sender=second_seller.address
+            ),
+            send_params=SendParams(populate_app_call_resources=True),
+        )
+
+
+def test_fail_buy_many_no_sales(
+    dm_client: DigitalMarketplaceClient,
+    scenario_open_sale: Callable,
+) -> None:
+    """
+    Test that sweeping fails if no sale is given.
+    """
+    with pytest.raises(LogicError, match=err.NO_SALES):
+        dm_client.send.buy_many(
+            BuyManyArgs(sale_keys=[], max_total_cost=0),
+            send_params=SendParams(populate_app_call_resources=True),
+        )
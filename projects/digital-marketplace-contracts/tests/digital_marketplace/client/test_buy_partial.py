@@ -0,0 +1,165 @@
+from typing import Callable
+
+import consts as cst
+import helpers
+import pytest
+from algokit_utils import (
+    AlgoAmount,
+    AlgorandClient,
+    CommonAppCallParams,
+    LogicError,
+    SendParams,
+    SigningAccount,
+)
+from algosdk.error import AlgodHTTPError
+
+import smart_contracts.digital_marketplace.errors as err
+from smart_contracts.artifacts.digital_marketplace.digital_marketplace_client import (
+    BuyPartialArgs,
+    DigitalMarketplaceClient,
+    Sale,
+    SaleKey,
+)
+
+
+@pytest.fixture(scope="function")
+def dm_client(
+    digital_marketplace_client: DigitalMarketplaceClient, buyer: SigningAccount
+) -> DigitalMarketplaceClient:
+    return digital_marketplace_client.clone(default_sender=buyer.address)
+
+
+def test_pass_buy_partial(
+    asset_to_sell: int,
+    dm_client: DigitalMarketplaceClient,
+    scenario_open_sale: Callable,
+    algorand_client: AlgorandClient,
+    buyer: SigningAccount,
+    first_seller: SigningAccount,
+) -> None:
+    """
+    Test that buying part of a sale charges the pro-rata cost and leaves the rest on sale.
+    """
+    sale_key = SaleKey(owner=first_seller.address, asset=asset_to_sell)
+    quantity = cst.ASA_AMOUNT_TO_SELL // 4
+    price = cst.COST_TO_BUY.micro_algo // 4
+    seller_deposited_before_call = dm_client.state.box.deposited.get_value(
+        first_seller.address
+    )
+    buyer_deposited_before_call = dm_client.state.box.deposited.get_value(buyer.address)
+    asa_balance_before_call = helpers.asa_amount(
+        algorand_client, buyer.address, asset_to_sell
+    )
+
+    dm_client.send.buy_partial(
+        BuyPartialArgs(sale_key=sale_key, quantity=quantity),
+        params=CommonAppCallParams(extra_fee=AlgoAmount(micro_algo=1_000)),
+        send_params=SendParams(populate_app_call_resources=True),
+    )
+
+    assert dm_client.state.box.sales.get_value(sale_key) == Sale(
+        amount=cst.ASA_AMOUNT_TO_SELL - quantity,
+        cost=cst.COST_TO_BUY.micro_algo - price,
+        expires_at=0,
+    )
+    assert (
+        dm_client.state.box.deposited.get_value(first_seller.address)
+        - seller_deposited_before_call
+        == price
+    )
+    assert (
+        dm_client.state.box.deposited.get_value(buyer.address)
+        - buyer_deposited_before_call
+        == -price
+    )
+    assert (
+        helpers.asa_amount(algorand_client, buyer.address, asset_to_sell)
+        - asa_balance_before_call
+        == quantity
+    )
+
+
+def test_pass_buy_partial_keeps_unit_price_rank(
+    asset_to_sell: int,
+    dm_client: DigitalMarketplaceClient,
+    scenario_open_sale: Callable,
+    first_seller: SigningAccount,
+    second_seller: SigningAccount,
+) -> None:
+    """
+    Test that a partly bought sale is ranked in the book of asks by its price per unit,
+    not by its lower remaining cost.
+    """
+    sale_key = SaleKey(owner=first_seller.address, asset=asset_to_sell)
+    quantity = cst.ASA_AMOUNT_TO_SELL // 4
+    price = cst.COST_TO_BUY.micro_algo // 4
+
+    dm_client.send.buy_partial(
+        BuyPartialArgs(sale_key=sale_key, quantity=quantity),
+        params=CommonAppCallParams(extra_fee=AlgoAmount(micro_algo=1_000)),
+        send_params=SendParams(populate_app_call_resources=True),
+    )
+
+    # Both sales still cost the same per unit, so the untouched one keeps the lead.
+    assert dm_client.state.box.best_asks.get_value(asset_to_sell).slots == [
+        [
+            second_seller.address,
+            cst.COST_TO_BUY.micro_algo,
+            cst.ASA_AMOUNT_TO_SELL,
+        ],
+        [
+            first_seller.address,
+            cst.COST_TO_BUY.micro_algo - price,
+            cst.ASA_AMOUNT_TO_SELL - quantity,
+        ],
+        *[cst.EMPTY_BOOK_ENTRY] * (cst.ASSET_BOOK_SLOTS - 2),
+    ]
+
+
+def test_pass_buy_partial_whole_amount(
+    asset_to_sell: int,
+    dm_client: DigitalMarketplaceClient,
+    scenario_open_sale: Callable,
+    first_seller: SigningAccount,
+) -> None:
+    """
+    Test that buying the whole amount of a sale closes it like a regular buy.
+    """
+    sale_key = SaleKey(owner=first_seller.address, asset=asset_to_sell)
+    seller_deposited_before_call = dm_client.state.box.deposited.get_value(
+        first_seller.address
+    )
+
+    dm_client.send.buy_partial(
+        BuyPartialArgs(sale_key=sale_key, quantity=cst.ASA_AMOUNT_TO_SELL),
+        params=CommonAppCallParams(extra_fee=AlgoAmount(micro_algo=1_000)),
+        send_params=SendParams(populate_app_call_resources=True),
+    )
+
+    with pytest.raises(AlgodHTTPError, match="box not found"):
+        _ = dm_client.state.box.sales.get_value(sale_key)
+    assert (
+        dm_client.state.box.deposited.get_value(first_seller.address)
+        - seller_deposited_before_call
+        == (cst.COST_TO_BUY + cst.SALES_BOX_MBR).micro_algo
+    )
+
+
+def test_fail_buy_partial_too_much(
+    asset_to_sell: int,
+    dm_client: DigitalMarketplaceClient,
+    scenario_open_sale: Callable,
+    first_seller: SigningAccount,
+) -> None:
+    """
+    Test that buying more than the amount on sale fails.
+    """
+    with pytest.raises(LogicError, match=err.INVALID_QUANTITY):
+        dm_client.send.buy_partial(
+            BuyPartialArgs(
+                sale_key=SaleKey(owner=first_seller.address, asset=asset_to_sell),
+                quantity=cst.ASA_AMOUNT_TO_SELL + 1,
+            ),
+            params=CommonAppCallParams(extra_fee=AlgoAmount(micro_algo=1_000)),
+            send_params=SendParams(populate_app_call_resources=True),
+        )
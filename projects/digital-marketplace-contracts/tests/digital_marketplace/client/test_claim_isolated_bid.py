@@ -0,0 +1,94 @@
+from typing import Callable
+
+import consts as cst
+import pytest
+from algokit_utils import (
+    CommonAppCallParams,
+    LogicError,
+    SendParams,
+    SigningAccount,
+)
+from algosdk.error import AlgodHTTPError
+
+import smart_contracts.digital_marketplace.errors as err
+from smart_contracts.artifacts.digital_marketplace.digital_marketplace_client import (
+    BidArgs,
+    ClaimIsolatedBidArgs,
+    DigitalMarketplaceClient,
+    SaleKey,
+)
+from smart_contracts.digital_marketplace.offchain.keys import isolated_receipt_key
+
+
+@pytest.fixture(scope="function")
+def dm_client(
+    digital_marketplace_client: DigitalMarketplaceClient, first_bidder: SigningAccount
+) -> DigitalMarketplaceClient:
+    return digital_marketplace_client.clone(default_sender=first_bidder.address)
+
+
+def test_fail_claim_encumbered_isolated_bid(
+    asset_to_sell: int,
+    dm_client: DigitalMarketplaceClient,
+    scenario_first_seller_first_bidder_isolated_bid: Callable,
+    first_seller: SigningAccount,
+) -> None:
+    """
+    Test that an isolated bid cannot be claimed while it is still the best bid.
+    """
+    with pytest.raises(LogicError, match=err.ENCUMBERED_BID):
+        dm_client.send.claim_isolated_bid(
+            ClaimIsolatedBidArgs(
+                sale_key=SaleKey(owner=first_seller.address, asset=asset_to_sell)
+            ),
+            send_params=SendParams(populate_app_call_resources=True),
+        )
+
+
+def test_pass_claim_raised_and_outbid_isolated_bid(
+    asset_to_sell: int,
+    dm_client: DigitalMarketplaceClient,
+    scenario_first_seller_first_bidder_isolated_bid: Callable,
+    first_seller: SigningAccount,
+    first_bidder: SigningAccount,
+    second_bidder: SigningAccount,
+) -> None:
+    """
+    Test that an isolated bid that was raised with a regular bid and then outbid can be
+    claimed back together with its box MBR.
+    """
+    # Outbid isolated receipts are refunded right away, unless they no longer carry
+    #  the best bid of their bidder when it is outbid.
+    sale_key = SaleKey(owner=first_seller.address, asset=asset_to_sell)
+    dm_client.new_group().bid(
+        BidArgs(
+            sale_key=sale_key,
+            new_bid_amount=cst.AMOUNT_TO_OUTBID.micro_algo,
+        ),
+    ).bid(
+        BidArgs(
+            sale_key=sale_key,
+            new_bid_amount=cst.AMOUNT_TO_OUTBID.micro_algo + 1,
+        ),
+        params=CommonAppCallParams(sender=second_bidder.address),
+    ).send(
+        send_params=SendParams(populate_app_call_resources=True)
+    )
+    deposited_before_call = dm_client.state.box.deposited.get_value(
+        first_bidder.address
+    )
+
+    dm_client.send.claim_isolated_bid(
+        ClaimIsolatedBidArgs(sale_key=sale_key),
+        send_params=SendParams(populate_app_call_resources=True),
+    )
+
+    with pytest.raises(AlgodHTTPError, match="box not found"):
+        _ = dm_client.state.box.isolated_receipts.get_value(
+            isolated_receipt_key(first_bidder.address, sale_key)
+        )
+    assert (
+        dm_client.state.box.deposited.get_value(first_bidder.address)
+        - deposited_before_call
+        == (cst.AMOUNT_TO_BID + cst.ISOLATED_RECEIPT_BOX_MBR).micro_algo
+    )
@@ -4,6 +4,9 @@ import consts as cst
 import pytest
 from algokit_utils import (
     AlgoAmount,
+    AlgorandClient,
+    AssetCreateParams,
+    AssetTransferParams,
     CommonAppCallParams,
     LogicError,
     SendParams,
@@ -13,11 +16,27 @@ from algosdk.error import AlgodHTTPError
 
 from smart_contracts.artifacts.digital_marketplace.digital_marketplace_client import (
     BidArgs,
+    BidManyArgs,
     BuyArgs,
     DigitalMarketplaceClient,
+    OpenSaleArgs,
     SaleKey,
+    SponsorAssetArgs,
+)
+from smart_contracts.digital_marketplace.offchain.budget import receipt_loop_extra_fee
+from smart_contracts.digital_marketplace.offchain.quotes import sponsor_asset_quote
+from smart_contracts.digital_marketplace.offchain.resources import (
+    BestBid,
+    add_resource_calls,
+    bid_many_resources,
+    claim_resources,
+    receipt_book_layout,
+)
+from tests.digital_marketplace.client.helpers import (
+    receipt,
+    receipt_book_mbr,
+    sorted_receipts,
 )
-from tests.digital_marketplace.client.helpers import receipt_book_mbr
 
 
 @pytest.fixture(scope="function")
@@ -27,6 +46,80 @@ def dm_client(
     return digital_marketplace_client.clone(default_sender=first_bidder.address)
 
 
+# Long enough for the claim loop to need OpUp calls.
+N_MANY_RECEIPTS = 4
+
+
+@pytest.fixture(scope="function")
+def scenario_first_bidder_outbid_on_many_sales(
+    dm_client: DigitalMarketplaceClient,
+    scenario_deposit: Callable,
+    algorand_client: AlgorandClient,
+    first_seller: SigningAccount,
+    first_bidder: SigningAccount,
+    second_bidder: SigningAccount,
+) -> None:
+    """
+    In this scenario, the sequence of events is:
+    1. The first seller creates, sponsors and opens a sale for several new assets.
+    2. The first bidder bids on every sale with bid_many.
+    3. The second bidder outbids the first bidder on every sale with bid_many.
+    This is based on the 'scenario_deposit'.
+    """
+    sale_keys = []
+    for _ in range(N_MANY_RECEIPTS):
+        asset = algorand_client.send.asset_create(
+            AssetCreateParams(sender=first_seller.address, total=cst.ASA_AMOUNT_TO_SELL)
+        ).asset_id
+        dm_client.send.sponsor_asset(
+            SponsorAssetArgs(asset=asset),
+            params=CommonAppCallParams(
+                extra_fee=sponsor_asset_quote().extra_fee, sender=first_seller.address
+            ),
+            send_params=SendParams(populate_app_call_resources=True),
+        )
+        dm_client.send.open_sale(
+            OpenSaleArgs(
+                asset_deposit=algorand_client.create_transaction.asset_transfer(
+                    AssetTransferParams(
+                        sender=first_seller.address,
+                        asset_id=asset,
+                        amount=cst.ASA_AMOUNT_TO_SELL,
+                        receiver=dm_client.app_address,
+                    )
+                ),
+                cost=cst.COST_TO_BUY.micro_algo,
+            ),
+            params=CommonAppCallParams(sender=first_seller.address),
+            send_params=SendParams(populate_app_call_resources=True),
+        )
+        sale_keys.append(SaleKey(owner=first_seller.address, asset=asset))
+
+    for bidder, amount, previous_bid in (
+        (first_bidder, cst.AMOUNT_TO_BID, None),
+        (
+            second_bidder,
+            cst.AMOUNT_TO_OUTBID,
+            BestBid(first_bidder.address, cst.AMOUNT_TO_BID.micro_algo),
+        ),
+    ):
+        resources = bid_many_resources(
+            bidder.address,
+            [(sale_key, previous_bid) for sale_key in sale_keys],
+            receipt_book_layout(dm_client, bidder.address),
+        )
+        add_resource_calls(
+            dm_client.new_group().bid_many(
+                BidManyArgs(
+                    sale_keys=sale_keys, amounts=[amount.micro_algo] * len(sale_keys)
+                ),
+                params=resources.params(sender=bidder.address),
+            ),
+            resources,
+            sender=bidder.address,
+        ).send(send_params=SendParams(populate_app_call_resources=False))
+
+
 def test_pass_claim_with_no_unencumbered_bids(
     asset_to_sell: int,
     dm_client: DigitalMarketplaceClient,
@@ -70,7 +163,7 @@ def test_pass_claim_with_unencumbered_bids(
     Test that claiming unencumbered bids with existing unencumbered bids updates the state correctly.
     """
     assert dm_client.state.box.receipt_book.get_value(first_bidder.public_key) == [
-        [[first_seller.address, asset_to_sell], cst.AMOUNT_TO_BID.micro_algo]
+        receipt(first_seller.address, asset_to_sell, cst.AMOUNT_TO_BID.micro_algo)
     ]
     deposited_before_call = dm_client.state.box.deposited.get_value(
         first_bidder.address
@@ -108,10 +201,14 @@ def test_pass_claim_with_residue_encumbered_bids(
         send_params=SendParams(populate_app_call_resources=True),
     )
 
-    assert dm_client.state.box.receipt_book.get_value(first_bidder.public_key) == [
-        [[first_seller.address, asset_to_sell], cst.AMOUNT_TO_BID.micro_algo],
-        [[second_seller.address, asset_to_sell], cst.AMOUNT_TO_BID.micro_algo],
-    ]
+    assert dm_client.state.box.receipt_book.get_value(
+        first_bidder.public_key
+    ) == sorted_receipts(
+        [
+            receipt(first_seller.address, asset_to_sell, cst.AMOUNT_TO_BID.micro_algo),
+            receipt(second_seller.address, asset_to_sell, cst.AMOUNT_TO_BID.micro_algo),
+        ]
+    )
     deposited_before_call = dm_client.state.box.deposited.get_value(
         first_bidder.address
     )
@@ -121,7 +218,7 @@ def test_pass_claim_with_residue_encumbered_bids(
     )
 
     assert dm_client.state.box.receipt_book.get_value(first_bidder.public_key) == [
-        [[second_seller.address, asset_to_sell], cst.AMOUNT_TO_BID.micro_algo]
+        receipt(second_seller.address, asset_to_sell, cst.AMOUNT_TO_BID.micro_algo)
     ]
     assert (
         dm_client.state.box.deposited.get_value(first_bidder.address)
@@ -142,11 +239,10 @@ def test_pass_bid_was_sold(
     Test that claiming unencumbered bids after the bid was sold updates the state correctly.
     """
     sale_key = SaleKey(owner=first_seller.address, asset=asset_to_sell)
-    dm_client.clone(default_sender=buyer.address).send.buy(
+    dm_client.clone(default_sender=buyer.address).new_group().buy(
         BuyArgs(sale_key=sale_key),
         params=CommonAppCallParams(extra_fee=AlgoAmount(micro_algo=1_000)),
-        send_params=SendParams(populate_app_call_resources=True),
-    )
+    ).add_resources().send(send_params=SendParams(populate_app_call_resources=True))
 
     deposited_before_call = dm_client.state.box.deposited.get_value(
         first_bidder.address
@@ -182,6 +278,50 @@ def test_fail_bid_was_accepted(
         )
 
 
+def test_pass_claim_with_resolved_resources(
+    asset_to_sell: int,
+    dm_client: DigitalMarketplaceClient,
+    scenario_first_seller_second_bidder_outbid: Callable,
+    first_seller: SigningAccount,
+    first_bidder: SigningAccount,
+) -> None:
+    """
+    Test that a claim sent with its resources resolved off-chain succeeds without
+    simulating it first.
+    """
+    sale_key = SaleKey(owner=first_seller.address, asset=asset_to_sell)
+    deposited_before_call = dm_client.state.box.deposited.get_value(
+        first_bidder.address
+    )
+    resources = claim_resources(
+        first_bidder.address,
+        first_bidder.address,
+        [sale_key],
+        receipt_book_layout(dm_client, first_bidder.address),
+    )
+
+    add_resource_calls(
+        dm_client.new_group().claim_unencumbered_bids(
+            params=resources.params(
+                sender=first_bidder.address,
+                extra_fee=receipt_loop_extra_fee(
+                    dm_client, first_bidder.address, n_app_calls=resources.n_app_calls
+                ),
+            ),
+        ),
+        resources,
+        sender=first_bidder.address,
+    ).send(send_params=SendParams(populate_app_call_resources=False))
+
+    with pytest.raises(AlgodHTTPError, match="box not found"):
+        _ = dm_client.state.box.receipt_book.get_value(first_bidder.public_key)
+    assert (
+        dm_client.state.box.deposited.get_value(first_bidder.address)
+        - deposited_before_call
+        == (cst.AMOUNT_TO_BID + receipt_book_mbr(1)).micro_algo
+    )
+
+
 def test_pass_reopened_sale_is_still_unencumbered(
     asset_to_sell: int,
     dm_client: DigitalMarketplaceClient,
@@ -195,7 +335,7 @@ def test_pass_reopened_sale_is_still_unencumbered(
     Test that claiming unencumbered bids after reopening the same sale updates the state correctly.
     """
     assert dm_client.state.box.receipt_book.get_value(first_bidder.public_key) == [
-        [[first_seller.address, asset_to_sell], cst.AMOUNT_TO_BID.micro_algo]
+        receipt(first_seller.address, asset_to_sell, cst.AMOUNT_TO_BID.micro_algo)
     ]
     deposited_before_call = dm_client.state.box.deposited.get_value(
         first_bidder.address
@@ -225,3 +365,33 @@ def test_fail_empty_receipt_book(
         dm_client.send.claim_unencumbered_bids(
             send_params=SendParams(populate_app_call_resources=True)
         )
+
+
+def test_pass_claim_many_receipts_with_opups(
+    dm_client: DigitalMarketplaceClient,
+    scenario_first_bidder_outbid_on_many_sales: Callable,
+    first_bidder: SigningAccount,
+) -> None:
+    """
+    Test that claiming a receipt book long enough to need OpUp calls succeeds with the
+    extra fee returned by receipt_loop_extra_fee.
+    """
+    extra_fee = receipt_loop_extra_fee(dm_client, first_bidder.address)
+    assert extra_fee.micro_algo > 0
+    deposited_before_call = dm_client.state.box.deposited.get_value(
+        first_bidder.address
+    )
+
+    dm_client.send.claim_unencumbered_bids(
+        params=CommonAppCallParams(extra_fee=extra_fee),
+        send_params=SendParams(populate_app_call_resources=True),
+    )
+
+    with pytest.raises(AlgodHTTPError, match="box not found"):
+        _ = dm_client.state.box.receipt_book.get_value(first_bidder.public_key)
+    assert (
+        dm_client.state.box.deposited.get_value(first_bidder.address)
+        - deposited_before_call
+        == N_MANY_RECEIPTS * cst.AMOUNT_TO_BID.micro_algo
+        + receipt_book_mbr(N_MANY_RECEIPTS).micro_algo
+    )
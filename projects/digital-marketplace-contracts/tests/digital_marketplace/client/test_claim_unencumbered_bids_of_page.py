@@ -0,0 +1,123 @@
+from typing import Callable
+
+import consts as cst
+import pytest
+from algokit_utils import (
+    CommonAppCallParams,
+    LogicError,
+    SendParams,
+    SigningAccount,
+)
+from algosdk.error import AlgodHTTPError
+
+import smart_contracts.digital_marketplace.errors as err
+from smart_contracts.artifacts.digital_marketplace.digital_marketplace_client import (
+    BidArgs,
+    ClaimUnencumberedBidsOfPageArgs,
+    DigitalMarketplaceClient,
+    OpenReceiptPagesArgs,
+    SaleKey,
+)
+from smart_contracts.digital_marketplace.offchain.keys import (
+    receipt_page,
+    receipt_page_key,
+)
+
+N_PAGES = 4
+
+
+@pytest.fixture(scope="function")
+def dm_client(
+    digital_marketplace_client: DigitalMarketplaceClient, first_bidder: SigningAccount
+) -> DigitalMarketplaceClient:
+    return digital_marketplace_client.clone(default_sender=first_bidder.address)
+
+
+@pytest.fixture(scope="function")
+def scenario_paged_bidder_outbid(
+    asset_to_sell: int,
+    dm_client: DigitalMarketplaceClient,
+    scenario_open_sale: Callable,
+    first_seller: SigningAccount,
+    second_bidder: SigningAccount,
+) -> None:
+    """
+    In this scenario, the first bidder opens receipt pages, bids on the first seller's
+    sale and is outbid by the second bidder.
+    """
+    sale_key = SaleKey(owner=first_seller.address, asset=asset_to_sell)
+    dm_client.send.open_receipt_pages(
+        OpenReceiptPagesArgs(n_pages=N_PAGES),
+        send_params=SendParams(populate_app_call_resources=True),
+    )
+    dm_client.send.bid(
+        BidArgs(sale_key=sale_key, new_bid_amount=cst.AMOUNT_TO_BID.micro_algo),
+        send_params=SendParams(populate_app_call_resources=True),
+    )
+    dm_client.new_group().bid(
+        BidArgs(sale_key=sale_key, new_bid_amount=cst.AMOUNT_TO_OUTBID.micro_algo),
+        params=CommonAppCallParams(sender=second_bidder.address),
+    ).add_resources(params=CommonAppCallParams(sender=second_bidder.address)).send(
+        send_params=SendParams(populate_app_call_resources=True)
+    )
+
+
+def test_pass_claim_page(
+    asset_to_sell: int,
+    dm_client: DigitalMarketplaceClient,
+    scenario_paged_bidder_outbid: Callable,
+    first_seller: SigningAccount,
+    first_bidder: SigningAccount,
+) -> None:
+    """
+    Test that claiming a page deletes its unencumbered receipts and updates the header.
+    """
+    page = receipt_page(
+        SaleKey(owner=first_seller.address, asset=asset_to_sell), N_PAGES
+    )
+    deposited_before_call = dm_client.state.box.deposited.get_value(
+        first_bidder.address
+    )
+
+    dm_client.send.claim_unencumbered_bids_of_page(
+        ClaimUnencumberedBidsOfPageArgs(page=page),
+        send_params=SendParams(populate_app_call_resources=True),
+    )
+
+    with pytest.raises(AlgodHTTPError, match="box not found"):
+        _ = dm_client.state.box.receipt_book_pages.get_value(
+            receipt_page_key(first_bidder.address, page)
+        )
+    assert (
+        dm_client.state.box.receipt_pages.get_value(first_bidder.public_key)
+        == [0] * N_PAGES
+    )
+    assert (
+        dm_client.state.box.deposited.get_value(first_bidder.address)
+        - deposited_before_call
+        == (
+            cst.AMOUNT_TO_BID
+            + cst.RECEIPT_BOOK_PAGE_BOX_BASE_MBR
+            + cst.RECEIPT_BOOK_BOX_PER_RECEIPT_MBR
+        ).micro_algo
+    )
+
+
+def test_fail_claim_empty_page(
+    asset_to_sell: int,
+    dm_client: DigitalMarketplaceClient,
+    scenario_paged_bidder_outbid: Callable,
+    first_seller: SigningAccount,
+) -> None:
+    """
+    Test that claiming a page without receipts fails.
+    """
+    page = receipt_page(
+        SaleKey(owner=first_seller.address, asset=asset_to_sell), N_PAGES
+    )
+
+    with pytest.raises(LogicError, match=err.NOTHING_TO_CLAIM):
+        dm_client.send.claim_unencumbered_bids_of_page(
+            ClaimUnencumberedBidsOfPageArgs(page=(page + 1) % N_PAGES),
+            send_params=SendParams(populate_app_call_resources=True),
+        )
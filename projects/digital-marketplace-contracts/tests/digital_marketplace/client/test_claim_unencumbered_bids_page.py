@@ -0,0 +1,171 @@
+from typing import Callable
+
+import consts as cst
+import pytest
+from algokit_utils import (
+    CommonAppCallParams,
+    LogicError,
+    SendParams,
+    SigningAccount,
+)
+from algosdk.error import AlgodHTTPError
+
+import smart_contracts.digital_marketplace.errors as err
+from smart_contracts.artifacts.digital_marketplace.digital_marketplace_client import (
+    BidArgs,
+    ClaimUnencumberedBidsPageArgs,
+    DigitalMarketplaceClient,
+    SaleKey,
+)
+from smart_contracts.digital_marketplace.offchain.keys import sale_id
+from tests.digital_marketplace.client.helpers import receipt, receipt_book_mbr
+
+
+@pytest.fixture(scope="function")
+def dm_client(
+    digital_marketplace_client: DigitalMarketplaceClient, first_bidder: SigningAccount
+) -> DigitalMarketplaceClient:
+    return digital_marketplace_client.clone(default_sender=first_bidder.address)
+
+
+@pytest.fixture(scope="function")
+def scenario_first_bidder_two_receipts(
+    asset_to_sell: int,
+    dm_client: DigitalMarketplaceClient,
+    scenario_first_seller_second_bidder_outbid: Callable,
+    second_seller: SigningAccount,
+) -> None:
+    """
+    In this scenario, the first bidder holds an outbid receipt on the first seller's sale
+    and a winning receipt on the second seller's sale.
+    """
+    dm_client.send.bid(
+        BidArgs(
+            sale_key=SaleKey(owner=second_seller.address, asset=asset_to_sell),
+            new_bid_amount=cst.AMOUNT_TO_BID.micro_algo,
+        ),
+        send_params=SendParams(populate_app_call_resources=True),
+    )
+
+
+def test_pass_claim_page_with_residue_encumbered_bids(
+    asset_to_sell: int,
+    dm_client: DigitalMarketplaceClient,
+    scenario_first_bidder_two_receipts: Callable,
+    second_seller: SigningAccount,
+    first_bidder: SigningAccount,
+) -> None:
+    """
+    Test that claiming a page only removes its unencumbered receipts.
+    """
+    deposited_before_call = dm_client.state.box.deposited.get_value(
+        first_bidder.address
+    )
+
+    dm_client.send.claim_unencumbered_bids_page(
+        ClaimUnencumberedBidsPageArgs(offset=0, limit=2),
+        send_params=SendParams(populate_app_call_resources=True),
+    )
+
+    assert dm_client.state.box.receipt_book.get_value(first_bidder.public_key) == [
+        receipt(second_seller.address, asset_to_sell, cst.AMOUNT_TO_BID.micro_algo)
+    ]
+    assert (
+        dm_client.state.box.deposited.get_value(first_bidder.address)
+        - deposited_before_call
+        == (cst.AMOUNT_TO_BID + cst.RECEIPT_BOOK_BOX_PER_RECEIPT_MBR).micro_algo
+    )
+
+
+def test_pass_claim_page_outside_unencumbered_bids(
+    asset_to_sell: int,
+    dm_client: DigitalMarketplaceClient,
+    scenario_first_bidder_two_receipts: Callable,
+    first_seller: SigningAccount,
+    second_seller: SigningAccount,
+    first_bidder: SigningAccount,
+) -> None:
+    """
+    Test that claiming a page holding only encumbered receipts does not change the state.
+    """
+    # Receipt books are sorted by sale id, so the encumbered receipt on the second
+    #  seller's sale comes last only if its id is the greater one.
+    encumbered_offset = int(
+        sale_id(SaleKey(owner=second_seller.address, asset=asset_to_sell))
+        > sale_id(SaleKey(owner=first_seller.address, asset=asset_to_sell))
+    )
+    receipt_book_before_call = dm_client.state.box.receipt_book.get_value(
+        first_bidder.public_key
+    )
+    deposited_before_call = dm_client.state.box.deposited.get_value(
+        first_bidder.address
+    )
+
+    dm_client.send.claim_unencumbered_bids_page(
+        ClaimUnencumberedBidsPageArgs(offset=encumbered_offset, limit=1),
+        send_params=SendParams(populate_app_call_resources=True),
+    )
+
+    assert (
+        dm_client.state.box.receipt_book.get_value(first_bidder.public_key)
+        == receipt_book_before_call
+    )
+    assert (
+        dm_client.state.box.deposited.get_value(first_bidder.address)
+        == deposited_before_call
+    )
+
+
+def test_pass_claim_chained_pages(
+    asset_to_sell: int,
+    dm_client: DigitalMarketplaceClient,
+    scenario_first_bidder_two_receipts: Callable,
+    second_seller: SigningAccount,
+    first_bidder: SigningAccount,
+    second_bidder: SigningAccount,
+) -> None:
+    """
+    Test that pages claimed back to front in the same group empty the receipt book.
+    """
+    dm_client.new_group().bid(
+        BidArgs(
+            sale_key=SaleKey(owner=second_seller.address, asset=asset_to_sell),
+            new_bid_amount=cst.AMOUNT_TO_OUTBID.micro_algo,
+        ),
+        params=CommonAppCallParams(sender=second_bidder.address),
+    ).add_resources(params=CommonAppCallParams(sender=second_bidder.address)).send(
+        send_params=SendParams(populate_app_call_resources=True)
+    )
+    deposited_before_call = dm_client.state.box.deposited.get_value(
+        first_bidder.address
+    )
+
+    dm_client.new_group().claim_unencumbered_bids_page(
+        ClaimUnencumberedBidsPageArgs(offset=1, limit=1),
+    ).claim_unencumbered_bids_page(
+        ClaimUnencumberedBidsPageArgs(offset=0, limit=1),
+    ).send(
+        send_params=SendParams(populate_app_call_resources=True)
+    )
+
+    with pytest.raises(AlgodHTTPError, match="box not found"):
+        _ = dm_client.state.box.receipt_book.get_value(first_bidder.public_key)
+    assert (
+        dm_client.state.box.deposited.get_value(first_bidder.address)
+        - deposited_before_call
+        == (cst.AMOUNT_TO_BID + cst.AMOUNT_TO_BID + receipt_book_mbr(2)).micro_algo
+    )
+
+
+def test_fail_claim_page_empty_receipt_book(
+    dm_client: DigitalMarketplaceClient,
+    scenario_open_sale: Callable,
+) -> None:
+    """
+    Test that claiming a page fails when the caller has no receipt book.
+    """
+    with pytest.raises(LogicError, match=err.NOTHING_TO_CLAIM):
+        dm_client.send.claim_unencumbered_bids_page(
+            ClaimUnencumberedBidsPageArgs(offset=0, limit=1),
+            send_params=SendParams(populate_app_call_resources=True),
+        )
@@ -17,6 +17,7 @@ from smart_contracts.artifacts.digital_marketplace.digital_marketplace_client im
     DigitalMarketplaceClient,
     SaleKey,
 )
+from smart_contracts.digital_marketplace.offchain.keys import sale_id
 
 
 def test_pass_close_sale(
@@ -25,6 +26,7 @@ def test_pass_close_sale(
     scenario_open_sale: Callable,
     algorand_client: AlgorandClient,
     first_seller: SigningAccount,
+    second_seller: SigningAccount,
 ) -> None:
     """
     Test that closing a sale without any bids succeeds and updates the local state correctly.
@@ -68,3 +70,43 @@ def test_pass_close_sale(
         dm_client.state.box.sales.get_value(
             SaleKey(owner=first_seller.address, asset=asset_to_sell)
         )
+    best_asks = dm_client.state.box.best_asks.get_value(asset_to_sell)
+    assert best_asks.n_untracked == 0
+    assert best_asks.slots == [
+        [
+            second_seller.address,
+            cst.COST_TO_BUY.micro_algo,
+            cst.ASA_AMOUNT_TO_SELL,
+        ],
+        *[cst.EMPTY_BOOK_ENTRY] * (cst.ASSET_BOOK_SLOTS - 1),
+    ]
+
+
+def test_pass_close_sale_with_bid(
+    asset_to_sell: int,
+    dm_client: DigitalMarketplaceClient,
+    scenario_first_seller_first_bidder_bid: Callable,
+    first_seller: SigningAccount,
+    first_bidder: SigningAccount,
+) -> None:
+    """
+    Test that closing a sale with a bid deletes the bid and refunds its MBR to the bidder.
+    """
+    sale_key = SaleKey(owner=first_seller.address, asset=asset_to_sell)
+    bidder_deposited_before_call = dm_client.state.box.deposited.get_value(
+        first_bidder.address
+    )
+
+    dm_client.send.close_sale(
+        CloseSaleArgs(asset=asset_to_sell),
+        params=CommonAppCallParams(extra_fee=AlgoAmount(micro_algo=1_000)),
+        send_params=SendParams(populate_app_call_resources=True),
+    )
+
+    with pytest.raises(AlgodHTTPError, match="box not found"):
+        dm_client.state.box.bids.get_value(sale_id(sale_key))
+    assert (
+        dm_client.state.box.deposited.get_value(first_bidder.address)
+        - bidder_deposited_before_call
+        == cst.BID_BOX_MBR.micro_algo
+    )
@@ -0,0 +1,67 @@
+from typing import Callable
+
+import consts as cst
+from algokit_utils import (
+    SendParams,
+    SigningAccount,
+)
+from algosdk.constants import ZERO_ADDRESS
+
+from smart_contracts.artifacts.digital_marketplace.digital_marketplace_client import (
+    DigitalMarketplaceClient,
+    GetSalesArgs,
+    SaleKey,
+)
+
+
+def test_pass_get_sales(
+    asset_to_sell: int,
+    dm_client: DigitalMarketplaceClient,
+    scenario_first_seller_first_bidder_bid: Callable,
+    first_seller: SigningAccount,
+    second_seller: SigningAccount,
+    first_bidder: SigningAccount,
+) -> None:
+    """
+    Test that get_sales returns the sales and their best bids in the requested order.
+    """
+    listings = dm_client.send.get_sales(
+        GetSalesArgs(
+            sale_keys=[
+                SaleKey(owner=second_seller.address, asset=asset_to_sell),
+                SaleKey(owner=first_seller.address, asset=asset_to_sell),
+            ]
+        ),
+        send_params=SendParams(populate_app_call_resources=True),
+    ).abi_return
+
+    # Each listing is a (sale, bid) pair of (amount, cost, expires_at) and (bidder, amount, isolated).
+    assert listings == [
+        (
+            (cst.ASA_AMOUNT_TO_SELL, cst.COST_TO_BUY.micro_algo, 0),
+            (ZERO_ADDRESS, 0, False),
+        ),
+        (
+            (cst.ASA_AMOUNT_TO_SELL, cst.COST_TO_BUY.micro_algo, 0),
+            (first_bidder.address, cst.AMOUNT_TO_BID.micro_algo, False),
+        ),
+    ]
+
+
+def test_pass_get_missing_sale(
+    asset_to_sell: int,
+    dm_client: DigitalMarketplaceClient,
+    scenario_open_sale: Callable,
+    first_bidder: SigningAccount,
+) -> None:
+    """
+    Test that get_sales returns a zero sale for a sale that doesn't exist.
+    """
+    listings = dm_client.send.get_sales(
+        GetSalesArgs(
+            sale_keys=[SaleKey(owner=first_bidder.address, asset=asset_to_sell)]
+        ),
+        send_params=SendParams(populate_app_call_resources=True),
+    ).abi_return
+
+    assert listings == [((0, 0, 0), (ZERO_ADDRESS, 0, False))]
@@ -3,11 +3,13 @@ from typing import Callable
 import consts as cst
 import pytest
 from algokit_utils import (
+    SendParams,
     SigningAccount,
 )
 
 from smart_contracts.artifacts.digital_marketplace.digital_marketplace_client import (
     DigitalMarketplaceClient,
+    GetTotalAndUnencumberedBidsOfArgs,
     UnencumberedBidsReceipt,
 )
 
@@ -61,3 +63,53 @@ def test_pass_no_bids(
         dm_client.send.get_total_and_unencumbered_bids().abi_return
         == UnencumberedBidsReceipt(total_bids=0, unencumbered_bids=0)
     )
+
+
+def test_pass_of_many_bidders(
+    dm_client: DigitalMarketplaceClient,
+    scenario_first_seller_second_bidder_outbid: Callable,
+    first_seller: SigningAccount,
+    first_bidder: SigningAccount,
+    second_bidder: SigningAccount,
+) -> None:
+    """
+    Test that the total bids and unencumbered bids are reported for each of the given bidders.
+    """
+    assert dm_client.send.get_total_and_unencumbered_bids_of(
+        GetTotalAndUnencumberedBidsOfArgs(
+            bidders=[first_bidder.address, second_bidder.address, first_seller.address]
+        ),
+        send_params=SendParams(populate_app_call_resources=True),
+    ).abi_return == [
+        (cst.AMOUNT_TO_BID.micro_algo, cst.AMOUNT_TO_BID.micro_algo),
+        (cst.AMOUNT_TO_OUTBID.micro_algo, 0),
+        (0, 0),
+    ]
+
+
+def test_pass_with_isolated_bid(
+    dm_client: DigitalMarketplaceClient,
+    scenario_first_seller_first_bidder_isolated_bid: Callable,
+) -> None:
+    """
+    Test that isolated bids are counted in the total bids.
+    """
+    assert (
+        dm_client.send.get_total_and_unencumbered_bids().abi_return
+        == UnencumberedBidsReceipt(
+            total_bids=cst.AMOUNT_TO_BID.micro_algo, unencumbered_bids=0
+        )
+    )
+
+
+def test_pass_after_accepted_bid(
+    dm_client: DigitalMarketplaceClient,
+    scenario_accept_first_bid: Callable,
+) -> None:
+    """
+    Test that an accepted bid no longer counts in the total bids.
+    """
+    assert (
+        dm_client.send.get_total_and_unencumbered_bids().abi_return
+        == UnencumberedBidsReceipt(total_bids=0, unencumbered_bids=0)
+    )
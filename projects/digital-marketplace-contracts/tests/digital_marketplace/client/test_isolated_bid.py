@@ -0,0 +1,225 @@
+from typing import Callable
+
+import consts as cst
+import pytest
+from algokit_utils import (
+    AlgoAmount,
+    AlgorandClient,
+    CommonAppCallParams,
+    LogicError,
+    SendParams,
+    SigningAccount,
+)
+from algosdk.error import AlgodHTTPError
+
+import smart_contracts.digital_marketplace.errors as err
+from smart_contracts.artifacts.digital_marketplace.digital_marketplace_client import (
+    AcceptBidArgs,
+    Bid,
+    BidArgs,
+    DigitalMarketplaceClient,
+    IsolatedBidArgs,
+    SaleKey,
+)
+from smart_contracts.digital_marketplace.offchain.keys import (
+    isolated_receipt_key,
+    sale_id,
+)
+from tests.digital_marketplace.client import helpers
+
+
+@pytest.fixture(scope="function")
+def dm_client(
+    digital_marketplace_client: DigitalMarketplaceClient, first_bidder: SigningAccount
+) -> DigitalMarketplaceClient:
+    return digital_marketplace_client.clone(default_sender=first_bidder.address)
+
+
+def test_pass_first_isolated_bid(
+    asset_to_sell: int,
+    dm_client: DigitalMarketplaceClient,
+    scenario_open_sale: Callable,
+    first_seller: SigningAccount,
+    first_bidder: SigningAccount,
+) -> None:
+    """
+    Test that the first isolated bid on a sale succeeds and stores its receipt in its own box.
+    """
+    sale_key = SaleKey(owner=first_seller.address, asset=asset_to_sell)
+    receipt_key = isolated_receipt_key(first_bidder.address, sale_key)
+    deposited_before_call = dm_client.state.box.deposited.get_value(
+        first_bidder.address
+    )
+
+    dm_client.send.isolated_bid(
+        IsolatedBidArgs(
+            sale_key=sale_key,
+            new_bid_amount=cst.AMOUNT_TO_BID.micro_algo,
+        ),
+        send_params=SendParams(populate_app_call_resources=True),
+    )
+
+    assert dm_client.state.box.bids.get_value(sale_id(sale_key)) == Bid(
+        bidder=first_bidder.address, amount=cst.AMOUNT_TO_BID.micro_algo, isolated=True
+    )
+    assert (
+        dm_client.state.box.isolated_receipts.get_value(receipt_key)
+        == cst.AMOUNT_TO_BID.micro_algo
+    )
+    with pytest.raises(AlgodHTTPError, match="box not found"):
+        _ = dm_client.state.box.receipt_book.get_value(first_bidder.public_key)
+    assert (
+        dm_client.state.box.deposited.get_value(first_bidder.address)
+        - deposited_before_call
+        == -(
+            cst.ISOLATED_RECEIPT_BOX_MBR
+            + cst.AMOUNT_TO_BID
+            + cst.BID_BOX_MBR
+            + cst.BID_TOTALS_BOX_MBR
+        ).micro_algo
+    )
+
+
+def test_pass_repeated_isolated_bid(
+    asset_to_sell: int,
+    dm_client: DigitalMarketplaceClient,
+    scenario_first_seller_first_bidder_isolated_bid: Callable,
+    first_seller: SigningAccount,
+    first_bidder: SigningAccount,
+) -> None:
+    """
+    Test that a repeated isolated bid only charges the difference with the previous one.
+    """
+    sale_key = SaleKey(owner=first_seller.address, asset=asset_to_sell)
+    receipt_key = isolated_receipt_key(first_bidder.address, sale_key)
+    deposited_before_call = dm_client.state.box.deposited.get_value(
+        first_bidder.address
+    )
+
+    dm_client.send.isolated_bid(
+        IsolatedBidArgs(
+            sale_key=sale_key,
+            new_bid_amount=cst.AMOUNT_TO_BID.micro_algo + 1,
+        ),
+        send_params=SendParams(populate_app_call_resources=True),
+    )
+
+    assert (
+        dm_client.state.box.isolated_receipts.get_value(receipt_key)
+        == cst.AMOUNT_TO_BID.micro_algo + 1
+    )
+    assert (
+        dm_client.state.box.deposited.get_value(first_bidder.address)
+        - deposited_before_call
+        == -1
+    )
+
+
+def test_fail_worse_isolated_bid(
+    asset_to_sell: int,
+    dm_client: DigitalMarketplaceClient,
+    scenario_first_seller_first_bidder_isolated_bid: Callable,
+    first_seller: SigningAccount,
+    second_bidder: SigningAccount,
+) -> None:
+    """
+    Test that an isolated bid fails if it is not better than the current highest bid.
+    """
+    with pytest.raises(LogicError, match=err.WORSE_BID):
+        dm_client.send.isolated_bid(
+            IsolatedBidArgs(
+                sale_key=SaleKey(owner=first_seller.address, asset=asset_to_sell),
+                new_bid_amount=cst.AMOUNT_TO_BID.micro_algo,
+            ),
+            params=CommonAppCallParams(sender=second_bidder.address),
+            send_params=SendParams(populate_app_call_resources=True),
+        )
+
+
+def test_pass_outbid_isolated_bid_is_refunded(
+    asset_to_sell: int,
+    dm_client: DigitalMarketplaceClient,
+    scenario_first_seller_first_bidder_isolated_bid: Callable,
+    first_seller: SigningAccount,
+    first_bidder: SigningAccount,
+    second_bidder: SigningAccount,
+) -> None:
+    """
+    Test that outbidding an isolated bid refunds it to its bidder right away.
+    """
+    sale_key = SaleKey(owner=first_seller.address, asset=asset_to_sell)
+    receipt_key = isolated_receipt_key(first_bidder.address, sale_key)
+    deposited_before_call = dm_client.state.box.deposited.get_value(
+        first_bidder.address
+    )
+
+    dm_client.new_group().bid(
+        BidArgs(
+            sale_key=sale_key,
+            new_bid_amount=cst.AMOUNT_TO_OUTBID.micro_algo,
+        ),
+        params=CommonAppCallParams(sender=second_bidder.address),
+    ).add_resources(params=CommonAppCallParams(sender=second_bidder.address)).send(
+        send_params=SendParams(populate_app_call_resources=True)
+    )
+
+    with pytest.raises(AlgodHTTPError, match="box not found"):
+        _ = dm_client.state.box.isolated_receipts.get_value(receipt_key)
+    assert (
+        dm_client.state.box.deposited.get_value(first_bidder.address)
+        - deposited_before_call
+        == (
+            cst.AMOUNT_TO_BID + cst.ISOLATED_RECEIPT_BOX_MBR + cst.BID_BOX_MBR
+        ).micro_algo
+    )
+
+
+def test_pass_accept_isolated_bid(
+    asset_to_sell: int,
+    dm_client: DigitalMarketplaceClient,
+    scenario_first_seller_first_bidder_isolated_bid: Callable,
+    algorand_client: AlgorandClient,
+    first_seller: SigningAccount,
+    first_bidder: SigningAccount,
+) -> None:
+    """
+    Test that accepting an isolated bid deletes its receipt box and refunds its MBR.
+    """
+    sale_key = SaleKey(owner=first_seller.address, asset=asset_to_sell)
+    receipt_key = isolated_receipt_key(first_bidder.address, sale_key)
+    seller_deposited_before_call = dm_client.state.box.deposited.get_value(
+        first_seller.address
+    )
+    bidder_deposited_before_call = dm_client.state.box.deposited.get_value(
+        first_bidder.address
+    )
+    asa_balance_before_call = helpers.asa_amount(
+        algorand_client, first_bidder.address, asset_to_sell
+    )
+
+    dm_client.new_group().accept_bid(
+        AcceptBidArgs(asset=asset_to_sell),
+        params=CommonAppCallParams(
+            extra_fee=AlgoAmount(micro_algo=1_000), sender=first_seller.address
+        ),
+    ).add_resources(params=CommonAppCallParams(sender=first_seller.address)).send(
+        send_params=SendParams(populate_app_call_resources=True)
+    )
+
+    with pytest.raises(AlgodHTTPError, match="box not found"):
+        _ = dm_client.state.box.isolated_receipts.get_value(receipt_key)
+    assert (
+        dm_client.state.box.deposited.get_value(first_seller.address)
+        - seller_deposited_before_call
+        == (cst.AMOUNT_TO_BID + cst.SALES_BOX_MBR).micro_algo
+    )
+    assert (
+        dm_client.state.box.deposited.get_value(first_bidder.address)
+        - bidder_deposited_before_call
+        == (cst.ISOLATED_RECEIPT_BOX_MBR + cst.BID_BOX_MBR).micro_algo
+    )
+    assert (
+        helpers.asa_amount(algorand_client, first_bidder.address, asset_to_sell)
+        - asa_balance_before_call
+        == cst.ASA_AMOUNT_TO_SELL
+    )
@@ -0,0 +1,100 @@
+from typing import Callable
+
+import consts as cst
+import helpers
+import pytest
+from algokit_utils import (
+    AlgorandClient,
+    AssetTransferParams,
+    LogicError,
+    SendParams,
+    SigningAccount,
+)
+
+import smart_contracts.digital_marketplace.errors as err
+from smart_contracts.artifacts.digital_marketplace.digital_marketplace_client import (
+    DigitalMarketplaceClient,
+    OpenExpiringSaleArgs,
+    Sale,
+    SaleKey,
+)
+
+
+def open_expiring_sale_args(
+    algorand_client: AlgorandClient,
+    dm_client: DigitalMarketplaceClient,
+    seller: SigningAccount,
+    asset: int,
+    expires_at: int,
+) -> OpenExpiringSaleArgs:
+    return OpenExpiringSaleArgs(
+        asset_deposit=algorand_client.create_transaction.asset_transfer(
+            AssetTransferParams(
+                sender=seller.address,
+                asset_id=asset,
+                amount=cst.ASA_AMOUNT_TO_SELL,
+                receiver=dm_client.app_address,
+            )
+        ),
+        cost=cst.COST_TO_BUY.micro_algo,
+        expires_at=expires_at,
+    )
+
+
+def test_pass_open_expiring_sale(
+    asset_to_sell: int,
+    dm_client: DigitalMarketplaceClient,
+    scenario_sponsor_asset: Callable,
+    algorand_client: AlgorandClient,
+    first_seller: SigningAccount,
+) -> None:
+    """
+    Test that opening an expiring sale stores its expiry round in the sale and charges
+    the MBR of the sale box.
+    """
+    sale_key = SaleKey(owner=first_seller.address, asset=asset_to_sell)
+    expires_at = helpers.last_round(algorand_client) + 10
+    deposited_before_call = dm_client.state.box.deposited.get_value(
+        first_seller.address
+    )
+
+    dm_client.send.open_expiring_sale(
+        open_expiring_sale_args(
+            algorand_client, dm_client, first_seller, asset_to_sell, expires_at
+        ),
+        send_params=SendParams(populate_app_call_resources=True),
+    )
+
+    assert dm_client.state.box.sales.get_value(sale_key) == Sale(
+        amount=cst.ASA_AMOUNT_TO_SELL,
+        cost=cst.COST_TO_BUY.micro_algo,
+        expires_at=expires_at,
+    )
+    assert (
+        dm_client.state.box.deposited.get_value(first_seller.address)
+        - deposited_before_call
+        == -cst.SALES_BOX_MBR.micro_algo
+    )
+
+
+def test_fail_open_expired_sale(
+    asset_to_sell: int,
+    dm_client: DigitalMarketplaceClient,
+    scenario_sponsor_asset: Callable,
+    algorand_client: AlgorandClient,
+    first_seller: SigningAccount,
+) -> None:
+    """
+    Test that opening a sale that is already expired fails.
+    """
+    with pytest.raises(LogicError, match=err.INVALID_EXPIRY):
+        dm_client.send.open_expiring_sale(
+            open_expiring_sale_args(
+                algorand_client,
+                dm_client,
+                first_seller,
+                asset_to_sell,
+                helpers.last_round(algorand_client),
+            ),
+            send_params=SendParams(populate_app_call_resources=True),
+        )
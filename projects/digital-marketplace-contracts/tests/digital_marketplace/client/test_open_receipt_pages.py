@@ -0,0 +1,137 @@
+from typing import Callable
+
+import consts as cst
+import pytest
+from algokit_utils import (
+    LogicError,
+    SendParams,
+    SigningAccount,
+)
+from algosdk.error import AlgodHTTPError
+
+import smart_contracts.digital_marketplace.errors as err
+from smart_contracts.artifacts.digital_marketplace.digital_marketplace_client import (
+    BidArgs,
+    BidTotals,
+    DigitalMarketplaceClient,
+    OpenReceiptPagesArgs,
+    SaleKey,
+)
+from smart_contracts.digital_marketplace.offchain.keys import (
+    receipt_page,
+    receipt_page_key,
+)
+from tests.digital_marketplace.client.helpers import receipt, receipt_pages_mbr
+
+N_PAGES = 4
+
+
+@pytest.fixture(scope="function")
+def dm_client(
+    digital_marketplace_client: DigitalMarketplaceClient, first_bidder: SigningAccount
+) -> DigitalMarketplaceClient:
+    return digital_marketplace_client.clone(default_sender=first_bidder.address)
+
+
+def test_pass_open_receipt_pages(
+    dm_client: DigitalMarketplaceClient,
+    scenario_open_sale: Callable,
+    first_bidder: SigningAccount,
+) -> None:
+    """
+    Test that opening receipt pages creates an empty header and charges its MBR.
+    """
+    deposited_before_call = dm_client.state.box.deposited.get_value(
+        first_bidder.address
+    )
+
+    dm_client.send.open_receipt_pages(
+        OpenReceiptPagesArgs(n_pages=N_PAGES),
+        send_params=SendParams(populate_app_call_resources=True),
+    )
+
+    assert (
+        dm_client.state.box.receipt_pages.get_value(first_bidder.public_key)
+        == [0] * N_PAGES
+    )
+    assert dm_client.state.box.bid_totals.get_value(first_bidder.address) == BidTotals(
+        committed=0, winning=0, n_pages=N_PAGES
+    )
+    assert (
+        dm_client.state.box.deposited.get_value(first_bidder.address)
+        - deposited_before_call
+        == -(receipt_pages_mbr(N_PAGES) + cst.BID_TOTALS_BOX_MBR).micro_algo
+    )
+
+
+def test_pass_bid_on_receipt_pages(
+    asset_to_sell: int,
+    dm_client: DigitalMarketplaceClient,
+    scenario_open_sale: Callable,
+    first_seller: SigningAccount,
+    first_bidder: SigningAccount,
+) -> None:
+    """
+    Test that a bid of a paged bidder writes its receipt in the page of its sale.
+    """
+    sale_key = SaleKey(owner=first_seller.address, asset=asset_to_sell)
+    page = receipt_page(sale_key, N_PAGES)
+    dm_client.send.open_receipt_pages(
+        OpenReceiptPagesArgs(n_pages=N_PAGES),
+        send_params=SendParams(populate_app_call_resources=True),
+    )
+    deposited_before_call = dm_client.state.box.deposited.get_value(
+        first_bidder.address
+    )
+
+    dm_client.send.bid(
+        BidArgs(sale_key=sale_key, new_bid_amount=cst.AMOUNT_TO_BID.micro_algo),
+        send_params=SendParams(populate_app_call_resources=True),
+    )
+
+    assert dm_client.state.box.receipt_book_pages.get_value(
+        receipt_page_key(first_bidder.address, page)
+    ) == [receipt(first_seller.address, asset_to_sell, cst.AMOUNT_TO_BID.micro_algo)]
+    assert dm_client.state.box.receipt_pages.get_value(first_bidder.public_key) == [
+        int(i == page) for i in range(N_PAGES)
+    ]
+    with pytest.raises(AlgodHTTPError, match="box not found"):
+        _ = dm_client.state.box.receipt_book.get_value(first_bidder.public_key)
+    assert (
+        dm_client.state.box.deposited.get_value(first_bidder.address)
+        - deposited_before_call
+        == -(
+            cst.AMOUNT_TO_BID
+            + cst.BID_BOX_MBR
+            + cst.RECEIPT_BOOK_PAGE_BOX_BASE_MBR
+            + cst.RECEIPT_BOOK_BOX_PER_RECEIPT_MBR
+        ).micro_algo
+    )
+
+
+def test_fail_open_receipt_pages_with_receipt_book(
+    dm_client: DigitalMarketplaceClient,
+    scenario_first_seller_first_bidder_bid: Callable,
+) -> None:
+    """
+    Test that a bidder holding a receipt book cannot open receipt pages.
+    """
+    with pytest.raises(LogicError, match=err.RECEIPT_BOOK_IN_USE):
+        dm_client.send.open_receipt_pages(
+            OpenReceiptPagesArgs(n_pages=N_PAGES),
+            send_params=SendParams(populate_app_call_resources=True),
+        )
+
+
+def test_fail_open_no_receipt_pages(
+    dm_client: DigitalMarketplaceClient,
+    scenario_open_sale: Callable,
+) -> None:
+    """
+    Test that opening zero receipt pages fails.
+    """
+    with pytest.raises(LogicError, match=err.INVALID_PAGE_COUNT):
+        dm_client.send.open_receipt_pages(
+            OpenReceiptPagesArgs(n_pages=0),
+            send_params=SendParams(populate_app_call_resources=True),
+        )
@@ -14,11 +14,10 @@ from algokit_utils import (
     SigningAccount,
 )
 from algosdk.atomic_transaction_composer import TransactionWithSigner
-from algosdk.constants import ZERO_ADDRESS
 
 import smart_contracts.digital_marketplace.errors as err
 from smart_contracts.artifacts.digital_marketplace.digital_marketplace_client import (
-    Bid,
+    CloseSaleArgs,
     DepositArgs,
     DigitalMarketplaceClient,
     OpenSaleArgs,
@@ -229,5 +228,74 @@ def test_pass_open_sale(
     ) == Sale(
         cst.ASA_AMOUNT_TO_SELL,
         cst.COST_TO_BUY.micro_algo,
-        Bid(bidder=ZERO_ADDRESS, amount=0),
+        0,
     )
+
+
+def test_pass_full_book_counts_untracked_sales(
+    asset_to_sell: int,
+    dm_client: DigitalMarketplaceClient,
+    scenario_open_sale: Callable,
+    algorand_client: AlgorandClient,
+    first_seller: SigningAccount,
+    second_seller: SigningAccount,
+    buyer: SigningAccount,
+    first_bidder: SigningAccount,
+    second_bidder: SigningAccount,
+) -> None:
+    """
+    Test that a sale pushed out of a full book of asks is counted as untracked, and taken
+    off the count when it is closed.
+    """
+    # The two sales of the scenario cost COST_TO_BUY, the cheapest sale comes last and
+    #  pushes the most expensive one out.
+    for seller, cost in [
+        (buyer, cst.COST_TO_BUY.micro_algo + 1),
+        (first_bidder, cst.COST_TO_BUY.micro_algo + 2),
+        (second_bidder, cst.COST_TO_BUY.micro_algo - 1),
+    ]:
+        algorand_client.send.asset_transfer(
+            AssetTransferParams(
+                sender=first_seller.address,
+                asset_id=asset_to_sell,
+                amount=cst.ASA_AMOUNT_TO_SELL,
+                receiver=seller.address,
+            )
+        )
+        dm_client.send.open_sale(
+            OpenSaleArgs(
+                asset_deposit=algorand_client.create_transaction.asset_transfer(
+                    AssetTransferParams(
+                        sender=seller.address,
+                        asset_id=asset_to_sell,
+                        amount=cst.ASA_AMOUNT_TO_SELL,
+                        receiver=dm_client.app_address,
+                    )
+                ),
+                cost=cost,
+            ),
+            params=CommonAppCallParams(sender=seller.address),
+            send_params=SendParams(populate_app_call_resources=True),
+        )
+
+    expected_slots = [
+        [second_bidder.address, cst.COST_TO_BUY.micro_algo - 1, cst.ASA_AMOUNT_TO_SELL],
+        [first_seller.address, cst.COST_TO_BUY.micro_algo, cst.ASA_AMOUNT_TO_SELL],
+        [second_seller.address, cst.COST_TO_BUY.micro_algo, cst.ASA_AMOUNT_TO_SELL],
+        [buyer.address, cst.COST_TO_BUY.micro_algo + 1, cst.ASA_AMOUNT_TO_SELL],
+    ]
+    best_asks = dm_client.state.box.best_asks.get_value(asset_to_sell)
+    assert best_asks.n_untracked == 1
+    assert best_asks.slots == expected_slots
+
+    dm_client.send.close_sale(
+        CloseSaleArgs(asset=asset_to_sell),
+        params=CommonAppCallParams(
+            extra_fee=AlgoAmount(micro_algo=1_000), sender=first_bidder.address
+        ),
+        send_params=SendParams(populate_app_call_resources=True),
+    )
+
+    best_asks = dm_client.state.box.best_asks.get_value(asset_to_sell)
+    assert best_asks.n_untracked == 0
+    assert best_asks.slots == expected_slots
@@ -0,0 +1,125 @@
+from typing import Callable
+
+import consts as cst
+import pytest
+from algokit_utils import (
+    AlgoAmount,
+    AlgorandClient,
+    AssetCreateParams,
+    AssetTransferParams,
+    CommonAppCallParams,
+    LogicError,
+    SendParams,
+    SigningAccount,
+)
+
+import smart_contracts.digital_marketplace.errors as err
+from smart_contracts.artifacts.digital_marketplace.digital_marketplace_client import (
+    DigitalMarketplaceClient,
+    OpenSalesArgs,
+    SaleKey,
+    SponsorAssetArgs,
+)
+
+
+@pytest.fixture(scope="function")
+def another_asset_to_sell(
+    algorand_client: AlgorandClient,
+    dm_client: DigitalMarketplaceClient,
+    scenario_sponsor_asset: Callable,
+    first_seller: SigningAccount,
+) -> int:
+    """
+    Fixture to create a second asset held by the first seller and sponsored in the marketplace.
+    """
+    asset_id = algorand_client.send.asset_create(
+        AssetCreateParams(
+            sender=first_seller.address,
+            total=cst.ASA_AMOUNT_TO_CREATE,
+            decimals=cst.ASA_DECIMALS,
+        )
+    ).asset_id
+    dm_client.send.sponsor_asset(
+        SponsorAssetArgs(asset=asset_id),
+        params=CommonAppCallParams(extra_fee=AlgoAmount(micro_algo=1_000)),
+        send_params=SendParams(populate_app_call_resources=True),
+    )
+    return asset_id
+
+
+def test_pass_open_sales(
+    asset_to_sell: int,
+    another_asset_to_sell: int,
+    dm_client: DigitalMarketplaceClient,
+    algorand_client: AlgorandClient,
+    first_seller: SigningAccount,
+) -> None:
+    """
+    Test that listing several assets in one call opens a sale for each of them.
+    """
+    deposited_before_call = dm_client.state.box.deposited.get_value(
+        first_seller.address
+    )
+
+    composer = dm_client.new_group()
+    for asset_id in [asset_to_sell, another_asset_to_sell]:
+        composer = composer.add_transaction(
+            algorand_client.create_transaction.asset_transfer(
+                AssetTransferParams(
+                    sender=first_seller.address,
+                    asset_id=asset_id,
+                    amount=cst.ASA_AMOUNT_TO_SELL,
+                    receiver=dm_client.app_address,
+                )
+            )
+        )
+    composer.open_sales(
+        OpenSalesArgs(
+            costs=[cst.COST_TO_BUY.micro_algo, cst.COST_TO_BUY.micro_algo + 1]
+        ),
+    ).send(send_params=SendParams(populate_app_call_resources=True))
+
+    assert (
+        dm_client.state.box.deposited.get_value(first_seller.address)
+        - deposited_before_call
+        == -2 * cst.SALES_BOX_MBR.micro_algo
+    )
+    assert (
+        dm_client.state.box.sales.get_value(
+            SaleKey(owner=first_seller.address, asset=asset_to_sell)
+        ).cost
+        == cst.COST_TO_BUY.micro_algo
+    )
+    assert (
+        dm_client.state.box.sales.get_value(
+            SaleKey(owner=first_seller.address, asset=another_asset_to_sell)
+        ).cost
+        == cst.COST_TO_BUY.micro_algo + 1
+    )
+
+
+def test_fail_open_sales_diff_sender(
+    asset_to_sell: int,
+    dm_client: DigitalMarketplaceClient,
+    scenario_sponsor_asset: Callable,
+    algorand_client: AlgorandClient,
+    second_seller: SigningAccount,
+) -> None:
+    """
+    Test that listing fails if one of the asset deposits comes from another account.
+    """
+    with pytest.raises(LogicError, match=err.DIFFERENT_SENDER):
+        dm_client.new_group().add_transaction(
+            algorand_client.create_transaction.asset_transfer(
+                AssetTransferParams(
+                    sender=second_seller.address,
+                    asset_id=asset_to_sell,
+                    amount=cst.ASA_AMOUNT_TO_SELL,
+                    receiver=dm_client.app_address,
+                )
+            )
+        ).open_sales(
+            OpenSalesArgs(costs=[cst.COST_TO_BUY.micro_algo]),
+        ).send(
+            send_params=SendParams(populate_app_call_resources=True)
+        )
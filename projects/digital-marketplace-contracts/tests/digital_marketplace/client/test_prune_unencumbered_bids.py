@@ -0,0 +1,76 @@
+from typing import Callable
+
+import consts as cst
+import pytest
+from algokit_utils import (
+    LogicError,
+    SendParams,
+    SigningAccount,
+)
+from algosdk.error import AlgodHTTPError
+
+import smart_contracts.digital_marketplace.errors as err
+from smart_contracts.artifacts.digital_marketplace.digital_marketplace_client import (
+    DigitalMarketplaceClient,
+    PruneUnencumberedBidsArgs,
+)
+from tests.digital_marketplace.client.helpers import receipt_book_mbr
+
+
+@pytest.fixture(scope="function")
+def dm_client(
+    digital_marketplace_client: DigitalMarketplaceClient, buyer: SigningAccount
+) -> DigitalMarketplaceClient:
+    return digital_marketplace_client.clone(default_sender=buyer.address)
+
+
+def test_pass_prune_unencumbered_bids(
+    dm_client: DigitalMarketplaceClient,
+    scenario_first_seller_second_bidder_outbid: Callable,
+    buyer: SigningAccount,
+    first_bidder: SigningAccount,
+) -> None:
+    """
+    Test that anyone can prune the unencumbered receipts of a bidder, who gets them back
+    minus the bounty paid to the caller out of the freed MBR.
+    """
+    bounty = receipt_book_mbr(1).micro_algo // cst.PRUNE_BOUNTY_DIVISOR
+    bidder_deposited_before_call = dm_client.state.box.deposited.get_value(
+        first_bidder.address
+    )
+    caller_deposited_before_call = dm_client.state.box.deposited.get_value(
+        buyer.address
+    )
+
+    dm_client.send.prune_unencumbered_bids(
+        PruneUnencumberedBidsArgs(bidder=first_bidder.address),
+        send_params=SendParams(populate_app_call_resources=True),
+    )
+
+    with pytest.raises(AlgodHTTPError, match="box not found"):
+        _ = dm_client.state.box.receipt_book.get_value(first_bidder.public_key)
+    assert (
+        dm_client.state.box.deposited.get_value(first_bidder.address)
+        - bidder_deposited_before_call
+        == (cst.AMOUNT_TO_BID + receipt_book_mbr(1)).micro_algo - bounty
+    )
+    assert (
+        dm_client.state.box.deposited.get_value(buyer.address)
+        - caller_deposited_before_call
+        == bounty
+    )
+
+
+def test_fail_prune_encumbered_bids(
+    dm_client: DigitalMarketplaceClient,
+    scenario_first_seller_second_bidder_outbid: Callable,
+    second_bidder: SigningAccount,
+) -> None:
+    """
+    Test that pruning a receipt book holding only encumbered receipts fails.
+    """
+    with pytest.raises(LogicError, match=err.NOTHING_TO_CLAIM):
+        dm_client.send.prune_unencumbered_bids(
+            PruneUnencumberedBidsArgs(bidder=second_bidder.address),
+            send_params=SendParams(populate_app_call_resources=True),
+        )
@@ -0,0 +1,80 @@
+import consts as cst
+from algokit_utils import AlgorandClient, SendParams, SigningAccount
+
+from smart_contracts.artifacts.digital_marketplace.digital_marketplace_client import (
+    DigitalMarketplaceClient,
+)
+from smart_contracts.digital_marketplace.offchain.batcher import (
+    deposit_operation,
+    group_fee,
+    pack,
+    send_batched,
+)
+
+
+def test_pass_batched_deposits(
+    dm_client: DigitalMarketplaceClient,
+    first_seller: SigningAccount,
+    second_seller: SigningAccount,
+    buyer: SigningAccount,
+    first_bidder: SigningAccount,
+    second_bidder: SigningAccount,
+) -> None:
+    """
+    Test that batched deposits of several accounts update the <deposited> BoxMap of
+    each of them correctly.
+    """
+    accounts = [first_seller, second_seller, buyer, first_bidder, second_bidder]
+
+    results = send_batched(
+        dm_client,
+        [
+            deposit_operation(dm_client, account.address, cst.AMOUNT_TO_DEPOSIT)
+            for account in accounts
+        ],
+        send_params=SendParams(populate_app_call_resources=False),
+    )
+
+    assert len(results) == 1
+    for account in accounts:
+        assert (
+            dm_client.state.box.deposited.get_value(account.address)
+            == cst.RESIDUAL_INITIAL_DEPOSIT.micro_algo
+        )
+
+
+def test_pass_batched_fees_paid_by_first_sender(
+    dm_client: DigitalMarketplaceClient,
+    algorand_client: AlgorandClient,
+    first_seller: SigningAccount,
+    first_bidder: SigningAccount,
+) -> None:
+    """
+    Test that the sender of the first operation of a group pays the fees of the whole
+    group, including the transactions of the other senders.
+    """
+    operations = [
+        deposit_operation(dm_client, account.address, cst.AMOUNT_TO_DEPOSIT)
+        for account in [first_seller, first_bidder]
+    ]
+    [group] = pack(operations)
+    first_balance_before_call = algorand_client.account.get_information(
+        first_seller.address
+    ).amount
+    second_balance_before_call = algorand_client.account.get_information(
+        first_bidder.address
+    ).amount
+
+    send_batched(
+        dm_client,
+        operations,
+        send_params=SendParams(populate_app_call_resources=False),
+    )
+
+    assert algorand_client.account.get_information(
+        first_seller.address
+    ).amount == first_balance_before_call - cst.AMOUNT_TO_DEPOSIT - group_fee(group)
+    assert (
+        algorand_client.account.get_information(first_bidder.address).amount
+        == second_balance_before_call - cst.AMOUNT_TO_DEPOSIT
+    )
@@ -0,0 +1,398 @@
+from typing import Callable
+
+import consts as cst
+import helpers
+import pytest
+from algokit_utils import (
+    AlgoAmount,
+    AlgorandClient,
+    AssetOptOutParams,
+    AssetTransferParams,
+    CommonAppCallParams,
+    LogicError,
+    SendParams,
+    SigningAccount,
+)
+from algosdk.error import AlgodHTTPError
+
+import smart_contracts.digital_marketplace.errors as err
+from smart_contracts.artifacts.digital_marketplace.digital_marketplace_client import (
+    BidArgs,
+    CloseSaleArgs,
+    DigitalMarketplaceClient,
+    OpenExpiringSaleArgs,
+    SaleKey,
+    SettleExpiredArgs,
+)
+
+# Rounds left before the sale expires once it is opened, enough to place a bid.
+ROUNDS_TO_EXPIRY = 4
+
+
+@pytest.fixture(scope="function")
+def dm_client(
+    digital_marketplace_client: DigitalMarketplaceClient, buyer: SigningAccount
+) -> DigitalMarketplaceClient:
+    return digital_marketplace_client.clone(default_sender=buyer.address)
+
+
+@pytest.fixture(scope="function")
+def scenario_open_expiring_sale(
+    asset_to_sell: int,
+    dm_client: DigitalMarketplaceClient,
+    scenario_sponsor_asset: Callable,
+    algorand_client: AlgorandClient,
+    first_seller: SigningAccount,
+) -> None:
+    """
+    In this scenario, the first seller opens a sale that expires in a few rounds.
+    This is based on the 'scenario_sponsor_asset'.
+    """
+    dm_client.send.open_expiring_sale(
+        OpenExpiringSaleArgs(
+            asset_deposit=algorand_client.create_transaction.asset_transfer(
+                AssetTransferParams(
+                    sender=first_seller.address,
+                    asset_id=asset_to_sell,
+                    amount=cst.ASA_AMOUNT_TO_SELL,
+                    receiver=dm_client.app_address,
+                )
+            ),
+            cost=cst.COST_TO_BUY.micro_algo,
+            expires_at=helpers.last_round(algorand_client) + ROUNDS_TO_EXPIRY,
+        ),
+        params=CommonAppCallParams(sender=first_seller.address),
+        send_params=SendParams(populate_app_call_resources=True),
+    )
+
+
+@pytest.fixture(scope="function")
+def scenario_expiring_sale_first_bidder_bid(
+    asset_to_sell: int,
+    dm_client: DigitalMarketplaceClient,
+    scenario_open_expiring_sale: Callable,
+    first_seller: SigningAccount,
+    first_bidder: SigningAccount,
+) -> None:
+    """
+    In this scenario, the first bidder bids on the expiring sale of the first seller.
+    This is based on the 'scenario_open_expiring_sale'.
+    """
+    dm_client.send.bid(
+        BidArgs(
+            sale_key=SaleKey(owner=first_seller.address, asset=asset_to_sell),
+            new_bid_amount=cst.AMOUNT_TO_BID.micro_algo,
+        ),
+        params=CommonAppCallParams(sender=first_bidder.address),
+        send_params=SendParams(populate_app_call_resources=True),
+    )
+
+
+def test_fail_settle_open_sale(
+    asset_to_sell: int,
+    dm_client: DigitalMarketplaceClient,
+    scenario_expiring_sale_first_bidder_bid: Callable,
+    first_seller: SigningAccount,
+) -> None:
+    """
+    Test that a sale cannot be settled before its expiry round.
+    """
+    with pytest.raises(LogicError, match=err.SALE_NOT_EXPIRED):
+        dm_client.send.settle_expired(
+            SettleExpiredArgs(
+                sale_keys=[SaleKey(owner=first_seller.address, asset=asset_to_sell)]
+            ),
+            params=CommonAppCallParams(extra_fee=AlgoAmount(micro_algo=1_000)),
+            send_params=SendParams(populate_app_call_resources=True),
+        )
+
+
+def test_pass_settle_expired_sale_with_bid(
+    asset_to_sell: int,
+    dm_client: DigitalMarketplaceClient,
+    scenario_expiring_sale_first_bidder_bid: Callable,
+    algorand_client: AlgorandClient,
+    buyer: SigningAccount,
+    first_seller: SigningAccount,
+    first_bidder: SigningAccount,
+) -> None:
+    """
+    Test that anyone can settle an expired sale, handing the asset to the best bidder.
+    """
+    sale_key = SaleKey(owner=first_seller.address, asset=asset_to_sell)
+    helpers.advance_rounds(algorand_client, buyer, ROUNDS_TO_EXPIRY)
+    seller_deposited_before_call = dm_client.state.box.deposited.get_value(
+        first_seller.address
+    )
+    bidder_deposited_before_call = dm_client.state.box.deposited.get_value(
+        first_bidder.address
+    )
+    asa_balance_before_call = helpers.asa_amount(
+        algorand_client, first_bidder.address, asset_to_sell
+    )
+
+    dm_client.new_group().settle_expired(
+        SettleExpiredArgs(sale_keys=[sale_key]),
+        params=CommonAppCallParams(extra_fee=AlgoAmount(micro_algo=1_000)),
+    ).add_resources().send(send_params=SendParams(populate_app_call_resources=True))
+
+    for box in [dm_client.state.box.sales, dm_client.state.box.bids]:
+        with pytest.raises(AlgodHTTPError, match="box not found"):
+            _ = box.get_value(sale_key)
+    assert (
+        dm_client.state.box.deposited.get_value(first_seller.address)
+        - seller_deposited_before_call
+        == (cst.AMOUNT_TO_BID + cst.SALES_BOX_MBR).micro_algo
+    )
+    assert (
+        dm_client.state.box.deposited.get_value(first_bidder.address)
+        - bidder_deposited_before_call
+        == (helpers.receipt_book_mbr(1) + cst.BID_BOX_MBR).micro_algo
+    )
+    assert (
+        helpers.asa_amount(algorand_client, first_bidder.address, asset_to_sell)
+        - asa_balance_before_call
+        == cst.ASA_AMOUNT_TO_SELL
+    )
+
+
+def test_pass_settle_expired_sale_without_bid(
+    asset_to_sell: int,
+    dm_client: DigitalMarketplaceClient,
+    scenario_open_expiring_sale: Callable,
+    algorand_client: AlgorandClient,
+    buyer: SigningAccount,
+    first_seller: SigningAccount,
+) -> None:
+    """
+    Test that settling an expired sale without bids returns the asset to its owner.
+    """
+    sale_key = SaleKey(owner=first_seller.address, asset=asset_to_sell)
+    helpers.advance_rounds(algorand_client, buyer, ROUNDS_TO_EXPIRY)
+    deposited_before_call = dm_client.state.box.deposited.get_value(
+        first_seller.address
+    )
+    asa_balance_before_call = helpers.asa_amount(
+        algorand_client, first_seller.address, asset_to_sell
+    )
+
+    dm_client.send.settle_expired(
+        SettleExpiredArgs(sale_keys=[sale_key]),
+        params=CommonAppCallParams(extra_fee=AlgoAmount(micro_algo=1_000)),
+        send_params=SendParams(populate_app_call_resources=True),
+    )
+
+    with pytest.raises(AlgodHTTPError, match="box not found"):
+        _ = dm_client.state.box.sales.get_value(sale_key)
+    assert (
+        dm_client.state.box.deposited.get_value(first_seller.address)
+        - deposited_before_call
+        == cst.SALES_BOX_MBR.micro_algo
+    )
+    assert (
+        helpers.asa_amount(algorand_client, first_seller.address, asset_to_sell)
+        - asa_balance_before_call
+        == cst.ASA_AMOUNT_TO_SELL
+    )
+
+
+def test_pass_settle_already_settled_sale(
+    asset_to_sell: int,
+    dm_client: DigitalMarketplaceClient,
+    scenario_open_expiring_sale: Callable,
+    algorand_client: AlgorandClient,
+    buyer: SigningAccount,
+    first_seller: SigningAccount,
+) -> None:
+    """
+    Test that a sale already settled by another caller is skipped instead of failing
+    the whole batch.
+    """
+    sale_key = SaleKey(owner=first_seller.address, asset=asset_to_sell)
+    helpers.advance_rounds(algorand_client, buyer, ROUNDS_TO_EXPIRY)
+    dm_client.send.settle_expired(
+        SettleExpiredArgs(sale_keys=[sale_key]),
+        params=CommonAppCallParams(extra_fee=AlgoAmount(micro_algo=1_000)),
+        send_params=SendParams(populate_app_call_resources=True),
+    )
+    deposited_before_call = dm_client.state.box.deposited.get_value(
+        first_seller.address
+    )
+    asa_balance_before_call = helpers.asa_amount(
+        algorand_client, first_seller.address, asset_to_sell
+    )
+
+    dm_client.send.settle_expired(
+        SettleExpiredArgs(sale_keys=[sale_key]),
+        params=CommonAppCallParams(extra_fee=AlgoAmount(micro_algo=1_000)),
+        send_params=SendParams(populate_app_call_resources=True),
+    )
+
+    assert (
+        dm_client.state.box.deposited.get_value(first_seller.address)
+        == deposited_before_call
+    )
+    assert (
+        helpers.asa_amount(algorand_client, first_seller.address, asset_to_sell)
+        == asa_balance_before_call
+    )
+
+
+def test_fail_bid_on_expired_sale(
+    asset_to_sell: int,
+    dm_client: DigitalMarketplaceClient,
+    scenario_open_expiring_sale: Callable,
+    algorand_client: AlgorandClient,
+    buyer: SigningAccount,
+    first_seller: SigningAccount,
+    first_bidder: SigningAccount,
+) -> None:
+    """
+    Test that an expired sale doesn't take bids anymore.
+    """
+    helpers.advance_rounds(algorand_client, buyer, ROUNDS_TO_EXPIRY)
+
+    with pytest.raises(LogicError, match=err.SALE_EXPIRED):
+        dm_client.send.bid(
+            BidArgs(
+                sale_key=SaleKey(owner=first_seller.address, asset=asset_to_sell),
+                new_bid_amount=cst.AMOUNT_TO_BID.micro_algo,
+            ),
+            params=CommonAppCallParams(sender=first_bidder.address),
+            send_params=SendParams(populate_app_call_resources=True),
+        )
+
+
+def test_pass_settle_expired_sale_bidder_opted_out(
+    asset_to_sell: int,
+    dm_client: DigitalMarketplaceClient,
+    scenario_expiring_sale_first_bidder_bid: Callable,
+    algorand_client: AlgorandClient,
+    buyer: SigningAccount,
+    first_seller: SigningAccount,
+    first_bidder: SigningAccount,
+) -> None:
+    """
+    Test that settling an expired sale whose best bidder opted out of the asset releases
+    the bid and returns the asset to its owner, instead of locking the sale.
+    """
+    sale_key = SaleKey(owner=first_seller.address, asset=asset_to_sell)
+    algorand_client.send.asset_opt_out(
+        AssetOptOutParams(
+            sender=first_bidder.address,
+            asset_id=asset_to_sell,
+            creator=first_seller.address,
+        )
+    )
+    helpers.advance_rounds(algorand_client, buyer, ROUNDS_TO_EXPIRY)
+    seller_deposited_before_call = dm_client.state.box.deposited.get_value(
+        first_seller.address
+    )
+    bidder_deposited_before_call = dm_client.state.box.deposited.get_value(
+        first_bidder.address
+    )
+    asa_balance_before_call = helpers.asa_amount(
+        algorand_client, first_seller.address, asset_to_sell
+    )
+
+    dm_client.new_group().settle_expired(
+        SettleExpiredArgs(sale_keys=[sale_key]),
+        params=CommonAppCallParams(extra_fee=AlgoAmount(micro_algo=1_000)),
+    ).add_resources().send(send_params=SendParams(populate_app_call_resources=True))
+
+    for box in [dm_client.state.box.sales, dm_client.state.box.bids]:
+        with pytest.raises(AlgodHTTPError, match="box not found"):
+            _ = box.get_value(sale_key)
+    assert (
+        dm_client.state.box.deposited.get_value(first_seller.address)
+        - seller_deposited_before_call
+        == cst.SALES_BOX_MBR.micro_algo
+    )
+    assert (
+        dm_client.state.box.deposited.get_value(first_bidder.address)
+        - bidder_deposited_before_call
+        == cst.BID_BOX_MBR.micro_algo
+    )
+    assert dm_client.state.box.receipt_book.get_value(first_bidder.public_key) == [
+        helpers.receipt(
+            first_seller.address, asset_to_sell, cst.AMOUNT_TO_BID.micro_algo
+        )
+    ]
+    assert (
+        helpers.asa_amount(algorand_client, first_seller.address, asset_to_sell)
+        - asa_balance_before_call
+        == cst.ASA_AMOUNT_TO_SELL
+    )
+
+
+def test_fail_settle_no_sales(
+    dm_client: DigitalMarketplaceClient,
+    scenario_open_expiring_sale: Callable,
+) -> None:
+    """
+    Test that settling fails if no sale is given.
+    """
+    with pytest.raises(LogicError, match=err.NO_SALES):
+        dm_client.send.settle_expired(
+            SettleExpiredArgs(sale_keys=[]),
+            send_params=SendParams(populate_app_call_resources=True),
+        )
+
+
+def test_pass_close_expired_sale_without_bid(
+    asset_to_sell: int,
+    dm_client: DigitalMarketplaceClient,
+    scenario_open_expiring_sale: Callable,
+    algorand_client: AlgorandClient,
+    buyer: SigningAccount,
+    first_seller: SigningAccount,
+) -> None:
+    """
+    Test that the owner can close an expired sale that has no bid.
+    """
+    sale_key = SaleKey(owner=first_seller.address, asset=asset_to_sell)
+    helpers.advance_rounds(algorand_client, buyer, ROUNDS_TO_EXPIRY)
+    deposited_before_call = dm_client.state.box.deposited.get_value(
+        first_seller.address
+    )
+
+    dm_client.send.close_sale(
+        CloseSaleArgs(asset=asset_to_sell),
+        params=CommonAppCallParams(
+            extra_fee=AlgoAmount(micro_algo=1_000), sender=first_seller.address
+        ),
+        send_params=SendParams(populate_app_call_resources=True),
+    )
+
+    with pytest.raises(AlgodHTTPError, match="box not found"):
+        _ = dm_client.state.box.sales.get_value(sale_key)
+    assert (
+        dm_client.state.box.deposited.get_value(first_seller.address)
+        - deposited_before_call
+        == cst.SALES_BOX_MBR.micro_algo
+    )
+
+
+def test_fail_close_expired_sale_with_bid(
+    asset_to_sell: int,
+    dm_client: DigitalMarketplaceClient,
+    scenario_expiring_sale_first_bidder_bid: Callable,
+    algorand_client: AlgorandClient,
+    buyer: SigningAccount,
+    first_seller: SigningAccount,
+) -> None:
+    """
+    Test that the owner cannot close an expired sale with a bid, which can only be
+    settled.
+    """
+    helpers.advance_rounds(algorand_client, buyer, ROUNDS_TO_EXPIRY)
+
+    with pytest.raises(LogicError, match=err.SALE_EXPIRED):
+        dm_client.new_group().close_sale(
+            CloseSaleArgs(asset=asset_to_sell),
+            params=CommonAppCallParams(
+                extra_fee=AlgoAmount(micro_algo=1_000), sender=first_seller.address
+            ),
+        ).add_resources(params=CommonAppCallParams(sender=first_seller.address)).send(
+            send_params=SendParams(populate_app_call_resources=True)
+        )
@@ -101,7 +101,8 @@ def test_pass_sponsor_asset(
     first_seller: SigningAccount,
 ) -> None:
     """
-    Test that sponsoring an asset succeeds and updates the deposited field correctly.
+    Test that sponsoring an asset succeeds, creates its empty asset books and updates the
+    deposited field correctly.
     """
     deposited_before_call = dm_client.state.box.deposited.get_value(
         first_seller.address
@@ -118,8 +119,14 @@ def test_pass_sponsor_asset(
     assert (
         dm_client.state.box.deposited.get_value(first_seller.address)
         - deposited_before_call
-        == -AlgoAmount(micro_algo=100_000).micro_algo
+        == -(AlgoAmount(micro_algo=100_000) + cst.ASSET_BOOKS_MBR).micro_algo
     )
+    for book in [
+        dm_client.state.box.best_asks.get_value(asset_to_sell),
+        dm_client.state.box.best_bids.get_value(asset_to_sell),
+    ]:
+        assert book.n_untracked == 0
+        assert book.slots == [cst.EMPTY_BOOK_ENTRY] * cst.ASSET_BOOK_SLOTS
 
     assert (
         helpers.asa_amount(
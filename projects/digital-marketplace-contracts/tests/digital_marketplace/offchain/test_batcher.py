@@ -0,0 +1,97 @@
+import pytest
+from algokit_utils import AlgoAmount
+from algosdk.account import generate_account
+
+from smart_contracts.artifacts.digital_marketplace.digital_marketplace_client import (
+    SaleKey,
+)
+from smart_contracts.digital_marketplace.offchain.batcher import (
+    MAX_GROUP_SIZE,
+    OPERATION_TOO_LARGE,
+    Operation,
+    bid_operation,
+    buy_operation,
+    group_fee,
+    group_size,
+    n_resource_calls,
+    pack,
+    withdraw_operation,
+)
+from smart_contracts.digital_marketplace.offchain.budget import MIN_TXN_FEE
+from smart_contracts.digital_marketplace.offchain.resources import (
+    AppCallResources,
+    BestBid,
+    deposit_resources,
+)
+
+SELLER = generate_account()[1]
+BIDDER = generate_account()[1]
+SALE_KEYS = [SaleKey(owner=SELLER, asset=asset) for asset in (1234, 5678)]
+AMOUNT = AlgoAmount(algo=1)
+
+
+def deposit(sender: str) -> Operation:
+    # A deposit brings its payment to the group, it is never composed here.
+    return Operation(
+        sender,
+        deposit_resources(sender),
+        lambda composer, _params: composer,
+        n_transactions=2,
+    )
+
+
+def test_pass_pack_fills_groups() -> None:
+    """
+    Test that operations are packed in order into groups of at most MAX_GROUP_SIZE
+    transactions.
+    """
+    operations = [deposit(generate_account()[1]) for _ in range(10)]
+
+    groups = pack(operations)
+
+    assert [len(group) for group in groups] == [8, 2]
+    assert [operation for group in groups for operation in group] == operations
+    assert group_size(groups[0]) == MAX_GROUP_SIZE
+
+
+def test_pass_shared_boxes_spare_add_resources_calls() -> None:
+    """
+    Test that operations sharing boxes in a group need fewer add_resources calls than
+    each of them on its own.
+    """
+    # Outbidding an isolated bid references one more box than an app call can hold.
+    first_outbid, second_outbid = (
+        bid_operation(BIDDER, sale_key, AMOUNT, BestBid(SELLER, 1, isolated=True))
+        for sale_key in SALE_KEYS
+    )
+
+    assert n_resource_calls([first_outbid]) == 1
+    assert n_resource_calls([second_outbid]) == 1
+    assert n_resource_calls([first_outbid, second_outbid]) == 0
+
+
+def test_pass_group_fee_pools_inner_transactions() -> None:
+    """
+    Test that the pooled fee of a group covers its transactions and their inner ones.
+    """
+    operations = [
+        withdraw_operation(BIDDER, AMOUNT),
+        buy_operation(BIDDER, SALE_KEYS[0]),
+    ]
+
+    assert group_size(operations) == 2
+    assert group_fee(operations).micro_algo == 4 * MIN_TXN_FEE.micro_algo
+
+
+def test_fail_operation_too_large() -> None:
+    """
+    Test that an operation that doesn't fit in a group on its own is rejected.
+    """
+    operation = Operation(
+        BIDDER,
+        AppCallResources(box_sizes={bytes([i]): 8 for i in range(200)}),
+        lambda composer, _params: composer,
+    )
+
+    with pytest.raises(ValueError, match=OPERATION_TOO_LARGE):
+        pack([operation])
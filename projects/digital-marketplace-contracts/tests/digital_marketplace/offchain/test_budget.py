@@ -0,0 +1,108 @@
+from pathlib import Path
+
+import smart_contracts.digital_marketplace.constants as cst
+from smart_contracts.artifacts.digital_marketplace import digital_marketplace_client
+from smart_contracts.digital_marketplace.offchain.budget import (
+    APP_CALL_OPCODE_BUDGET,
+    MIN_TXN_FEE,
+    opup_count,
+    opup_extra_fee,
+)
+
+APPROVAL_TEAL = Path(digital_marketplace_client.__file__).with_name(
+    "DigitalMarketplace.approval.teal"
+)
+# The OpUp inner calls run a program made of a single pushint.
+OPUP_PROGRAM = "0x068101"
+OPUP_PROGRAM_OPCODES = 1
+
+
+def _teal_block(teal: list[str], label: str) -> list[str]:
+    # The opcodes following a label, up to the next label.
+    start = teal.index(f"{label}:") + 1
+    block = []
+    for line in teal[start:]:
+        if line.endswith(":"):
+            break
+        block.append(line)
+    return block
+
+
+def _compiled_opup_count(n_receipts: int, n_app_calls: int) -> int:
+    # Runs the budget loop of the compiled ensure_receipt_loop_budget, starting from
+    #  the pooled budget of the group less the base budget spent before the check.
+    teal = [
+        line.split("//")[0].strip()
+        for line in APPROVAL_TEAL.read_text().splitlines()
+        if line.split("//")[0].strip()
+    ]
+    setup = _teal_block(teal, "ensure_receipt_loop_budget")
+    loop = _teal_block(teal, "ensure_receipt_loop_budget_while_top@2")
+    assert setup[1:] == [
+        "frame_dig -1",
+        f"pushint {cst.RECEIPT_LOOP_PER_RECEIPT_BUDGET}",
+        "*",
+        f"pushint {cst.RECEIPT_LOOP_BASE_BUDGET}",
+        "+",
+        setup[-2],
+        "+",
+    ]
+    margin = int(setup[-2].removeprefix("pushint "))
+    assert OPUP_PROGRAM in APPROVAL_TEAL.read_text()
+
+    required_budget = (
+        cst.RECEIPT_LOOP_BASE_BUDGET
+        + n_receipts * cst.RECEIPT_LOOP_PER_RECEIPT_BUDGET
+        + margin
+    )
+    budget = n_app_calls * APP_CALL_OPCODE_BUDGET - cst.RECEIPT_LOOP_BASE_BUDGET
+    count = 0
+    while required_budget > budget:
+        budget += APP_CALL_OPCODE_BUDGET - len(loop) - OPUP_PROGRAM_OPCODES
+        count += 1
+    return count
+
+
+def test_pass_small_receipt_book_needs_no_opup() -> None:
+    """
+    Test that looping over a small receipt book fits in the budget of a single app call.
+    """
+    assert opup_count(0) == 0
+    assert opup_count(1) == 0
+    assert opup_extra_fee(1).micro_algo == 0
+
+
+def test_pass_opups_grow_with_receipt_book() -> None:
+    """
+    Test that the number of OpUp calls never decreases as the receipt book grows.
+    """
+    counts = [opup_count(n_receipts) for n_receipts in range(100)]
+    assert counts == sorted(counts)
+    assert counts[-1] > 0
+
+
+def test_pass_extra_fee_covers_every_opup() -> None:
+    """
+    Test that the extra fee pays one minimum fee for every OpUp call.
+    """
+    assert opup_extra_fee(50).micro_algo == opup_count(50) * MIN_TXN_FEE.micro_algo
+
+
+def test_pass_opup_count_matches_compiled_loop() -> None:
+    """
+    Test that the OpUp count follows the budget loop of the compiled program, which
+    spends part of the budget of every OpUp call it issues.
+    """
+    for n_app_calls in range(1, 5):
+        for n_receipts in range(100):
+            assert opup_count(
+                n_receipts, n_app_calls=n_app_calls
+            ) == _compiled_opup_count(n_receipts, n_app_calls)
+
+
+def test_pass_app_calls_of_group_reduce_opups() -> None:
+    """
+    Test that the budget of the add_resources calls of a group saves OpUp calls.
+    """
+    assert opup_count(50, n_app_calls=3) < opup_count(50)
+    assert opup_count(3, n_app_calls=2) == 0
@@ -0,0 +1,25 @@
+import pytest
+from algosdk.account import generate_account
+from algosdk.encoding import decode_address
+
+from smart_contracts.digital_marketplace.offchain import keys
+
+
+def test_pass_address_bytes_matches_algosdk() -> None:
+    """
+    Test that the public key decoded from an address matches the one of the SDK.
+    """
+    address = generate_account()[1]
+
+    assert keys.address_bytes(address) == decode_address(address)
+
+
+def test_fail_address_bytes_bad_checksum() -> None:
+    """
+    Test that an address whose checksum doesn't match its public key is rejected.
+    """
+    address = generate_account()[1]
+    tampered = ("A" if address[0] != "A" else "B") + address[1:]
+
+    with pytest.raises(ValueError, match="invalid address"):
+        keys.address_bytes(tampered)
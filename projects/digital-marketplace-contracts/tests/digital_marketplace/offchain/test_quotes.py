@@ -0,0 +1,150 @@
+import pytest
+from algokit_utils import AlgoAmount
+from algosdk.account import generate_account
+
+from smart_contracts.digital_marketplace.offchain.budget import (
+    MIN_TXN_FEE,
+    opup_extra_fee,
+)
+from smart_contracts.digital_marketplace.offchain.quotes import (
+    NOT_ENOUGH_DEPOSITED,
+    BestBid,
+    accept_bid_quote,
+    bid_box_mbr,
+    bid_quote,
+    buy_partial_quote,
+    claim_quote,
+    deposit_box_mbr,
+    isolated_bid_quote,
+    isolated_receipt_box_mbr,
+    receipt_book_mbr,
+    receipt_page_mbr,
+    sale_box_mbr,
+    settle_expired_quote,
+    sponsor_asset_quote,
+)
+from smart_contracts.digital_marketplace.offchain.resources import ReceiptBookLayout
+
+FIRST_BIDDER = generate_account()[1]
+SECOND_BIDDER = generate_account()[1]
+AMOUNT = 4_000_000
+
+
+def test_pass_box_mbr_follows_box_layout() -> None:
+    """
+    Test that the MBR of the boxes is derived from the size of their key and value.
+    """
+    assert deposit_box_mbr().micro_algo == 2_500 + 400 * (9 + 32 + 8)
+    assert bid_box_mbr().micro_algo == 2_500 + 400 * (4 + 8 + 41)
+    assert receipt_book_mbr(0).micro_algo == 0
+    assert receipt_book_mbr(2).micro_algo == 2_500 + 400 * (12 + 32 + 2 + 2 * 16)
+
+
+def test_pass_sponsor_asset_quote() -> None:
+    """
+    Test that sponsoring an asset covers its opt-in transfer and charges the opt-in
+    minimum balance along with the books of the asset.
+    """
+    quote = sponsor_asset_quote()
+    cost = 100_000 + 2 * 2_500 + 400 * (9 + 9 + 2 * (8 + 8 + 4 * 48))
+
+    assert quote.extra_fee == MIN_TXN_FEE
+    assert quote.mbr_delta == cost
+    assert quote.deposit_delta == -cost
+
+
+def test_pass_first_bid_pays_its_boxes() -> None:
+    """
+    Test that the first bid of a bidder pays the bid box, its receipt book and its totals,
+    while outbidding an isolated bid frees the receipt of the previous bidder.
+    """
+    first_bid = bid_quote(FIRST_BIDDER, AMOUNT, first_bid=True)
+    outbid = bid_quote(
+        SECOND_BIDDER,
+        AMOUNT + 1,
+        BestBid(FIRST_BIDDER, AMOUNT, isolated=True),
+        first_bid=True,
+    )
+    boxes_mbr = 23_700 + 27_300 + 26_500
+
+    assert first_bid.extra_fee.micro_algo == 0
+    assert first_bid.mbr_delta == boxes_mbr
+    assert first_bid.deposit_delta == -(AMOUNT + boxes_mbr)
+    assert outbid.mbr_delta == 27_300 + 26_500 - isolated_receipt_box_mbr().micro_algo
+    assert outbid.deposit_delta == -(AMOUNT + 1 + boxes_mbr)
+
+
+def test_pass_raising_own_bid_pays_the_difference() -> None:
+    """
+    Test that raising your own bid only costs the difference with the overwritten receipt.
+    """
+    own_bid = BestBid(FIRST_BIDDER, AMOUNT)
+    raised = bid_quote(FIRST_BIDDER, AMOUNT + 5, own_bid, receipt_amount=AMOUNT)
+    raised_isolated = isolated_bid_quote(
+        FIRST_BIDDER, AMOUNT + 5, BestBid(FIRST_BIDDER, AMOUNT, isolated=True)
+    )
+
+    assert raised.mbr_delta == raised_isolated.mbr_delta == 0
+    assert raised.deposit_delta == raised_isolated.deposit_delta == -5
+
+
+def test_pass_buy_partial_rounds_price_up() -> None:
+    """
+    Test that a partial buy is quoted at its pro-rata price rounded up, while buying the
+    whole amount frees the sale box.
+    """
+    partial = buy_partial_quote(FIRST_BIDDER, cost=5, amount=3, quantity=1)
+    whole = buy_partial_quote(FIRST_BIDDER, cost=5, amount=3, quantity=3)
+
+    assert partial.deposit_delta == -2
+    assert partial.mbr_delta == 0
+    assert whole.deposit_delta == -5
+    assert whole.mbr_delta < 0
+
+
+def test_pass_awarded_receipt_frees_its_own_page() -> None:
+    """
+    Test that a winning receipt alone in its page frees the whole page, even when the
+    largest page of the receipt book holds more receipts.
+    """
+    bid = BestBid(FIRST_BIDDER, AMOUNT)
+    layout = ReceiptBookLayout(n_pages=4, n_receipts=10)
+    freed_mbr = bid_box_mbr().micro_algo + receipt_page_mbr(1).micro_algo
+
+    accepted = accept_bid_quote(bid, layout, page_receipts=1)
+    settled = settle_expired_quote([(bid, layout, 1)])
+
+    assert accepted.mbr_delta == -(sale_box_mbr().micro_algo + freed_mbr)
+    assert settled.mbr_delta == accepted.mbr_delta
+    assert accept_bid_quote(bid, layout).mbr_delta == -(
+        sale_box_mbr().micro_algo
+        + bid_box_mbr().micro_algo
+        + receipt_page_mbr(10).micro_algo
+        - receipt_page_mbr(9).micro_algo
+    )
+
+
+def test_pass_claim_quote_covers_opups() -> None:
+    """
+    Test that a claim is quoted with the fee of its OpUp calls and gives back the claimed
+    amounts along with the freed MBR.
+    """
+    quote = claim_quote(50, [AMOUNT, AMOUNT])
+    freed_mbr = receipt_book_mbr(50).micro_algo - receipt_book_mbr(48).micro_algo
+
+    assert quote.extra_fee == opup_extra_fee(50)
+    assert quote.mbr_delta == -freed_mbr
+    assert quote.deposit_delta == 2 * AMOUNT + freed_mbr
+
+
+def test_fail_quote_exceeds_deposit() -> None:
+    """
+    Test that the deposit left after a call can't go below zero.
+    """
+    quote = bid_quote(FIRST_BIDDER, AMOUNT)
+
+    assert quote.deposited_after(AlgoAmount(algo=10).micro_algo) == (
+        AlgoAmount(algo=10).micro_algo + quote.deposit_delta
+    )
+    with pytest.raises(ValueError, match=NOT_ENOUGH_DEPOSITED):
+        quote.deposited_after(AMOUNT)
@@ -0,0 +1,161 @@
+import pytest
+from algosdk.account import generate_account
+
+from smart_contracts.artifacts.digital_marketplace.digital_marketplace_client import (
+    SaleKey,
+)
+from smart_contracts.digital_marketplace.offchain import keys
+from smart_contracts.digital_marketplace.offchain.resources import (
+    MAX_APP_CALL_REFERENCES,
+    TOO_MANY_REFERENCES,
+    BestBid,
+    ReceiptBookLayout,
+    bid_many_resources,
+    buy_many_resources,
+    deposit_resources,
+)
+
+SELLER = generate_account()[1]
+FIRST_BIDDER = generate_account()[1]
+SECOND_BIDDER = generate_account()[1]
+SALE_KEY = SaleKey(owner=SELLER, asset=1234)
+AMOUNT = 4_000_000
+
+
+def test_pass_deposit_references_deposit_box() -> None:
+    """
+    Test that deposit only references the deposit box of the sender.
+    """
+    params = deposit_resources(FIRST_BIDDER).params(sender=FIRST_BIDDER)
+
+    assert params.box_references == [
+        keys.account_box_name(keys.DEPOSITED_PREFIX, FIRST_BIDDER)
+    ]
+    assert params.account_references == []
+    assert params.asset_references == []
+    assert params.sender == FIRST_BIDDER
+
+
+def test_pass_outbid_references_previous_bidder() -> None:
+    """
+    Test that outbidding another bidder references their boxes, while raising your own
+    bid doesn't reference them twice.
+    """
+    outbid = bid_many_resources(
+        SECOND_BIDDER, [(SALE_KEY, BestBid(FIRST_BIDDER, AMOUNT))]
+    )
+    raise_bid = bid_many_resources(
+        FIRST_BIDDER, [(SALE_KEY, BestBid(FIRST_BIDDER, AMOUNT, isolated=True))]
+    )
+
+    assert keys.account_box_name(keys.DEPOSITED_PREFIX, FIRST_BIDDER) in outbid.boxes
+    assert (
+        keys.ISOLATED_RECEIPTS_PREFIX
+        + keys.isolated_receipt_key(FIRST_BIDDER, SALE_KEY)
+        not in raise_bid.boxes
+    )
+    assert len(raise_bid.boxes) == len(set(raise_bid.boxes))
+
+
+def test_pass_outbid_references_isolated_receipt_of_isolated_bid() -> None:
+    """
+    Test that outbidding only references the isolated receipt of the previous bidder if
+    their bid was placed with isolated_bid.
+    """
+    isolated_receipt = keys.ISOLATED_RECEIPTS_PREFIX + keys.isolated_receipt_key(
+        FIRST_BIDDER, SALE_KEY
+    )
+    outbid = bid_many_resources(
+        SECOND_BIDDER, [(SALE_KEY, BestBid(FIRST_BIDDER, AMOUNT))]
+    )
+    isolated_outbid = bid_many_resources(
+        SECOND_BIDDER, [(SALE_KEY, BestBid(FIRST_BIDDER, AMOUNT, isolated=True))]
+    )
+
+    assert isolated_receipt not in outbid.boxes
+    assert isolated_receipt in isolated_outbid.boxes
+
+
+def test_pass_paged_bid_references_page_of_sale() -> None:
+    """
+    Test that a bid from a bidder with a paged receipt book references the page of its
+    sale instead of the receipt book.
+    """
+    resources = bid_many_resources(
+        FIRST_BIDDER, [(SALE_KEY, None)], ReceiptBookLayout(n_pages=4)
+    )
+    page = keys.receipt_page(SALE_KEY, 4)
+
+    assert (
+        keys.RECEIPT_BOOK_PAGES_PREFIX + keys.receipt_page_key(FIRST_BIDDER, page)
+        in resources.boxes
+    )
+    assert (
+        keys.account_box_name(keys.RECEIPT_BOOK_PREFIX, FIRST_BIDDER)
+        not in resources.boxes
+    )
+
+
+def test_pass_unpaged_bid_skips_receipt_pages_header() -> None:
+    """
+    Test that only a bidder with a paged receipt book references the header of the paged
+    receipt books, the others find their receipt book through their bid totals.
+    """
+    header = keys.account_box_name(keys.RECEIPT_PAGES_PREFIX, SECOND_BIDDER)
+    unpaged = bid_many_resources(
+        SECOND_BIDDER, [(SALE_KEY, BestBid(FIRST_BIDDER, AMOUNT))]
+    )
+    paged = bid_many_resources(
+        SECOND_BIDDER,
+        [(SALE_KEY, BestBid(FIRST_BIDDER, AMOUNT))],
+        ReceiptBookLayout(n_pages=4),
+    )
+
+    assert header not in unpaged.boxes
+    assert header in paged.boxes
+    assert keys.account_box_name(keys.BID_TOTALS_PREFIX, SECOND_BIDDER) in unpaged.boxes
+
+
+def test_pass_extra_box_references_go_to_add_resources_calls() -> None:
+    """
+    Test that the box references that don't fit in the app call are carried by
+    add_resources calls, including the empty ones covering a large receipt book.
+    """
+    resources = bid_many_resources(
+        SECOND_BIDDER,
+        [(SALE_KEY, BestBid(FIRST_BIDDER, AMOUNT))],
+        ReceiptBookLayout(n_receipts=900),
+    )
+    main_references = resources.params().box_references or []
+    extra_references = [
+        reference
+        for params in resources.extra_params()
+        for reference in params.box_references or []
+    ]
+
+    assert len(main_references) == MAX_APP_CALL_REFERENCES
+    assert main_references + extra_references == resources.box_references()
+    assert resources.n_box_references > len(resources.boxes)
+    assert extra_references.count(b"") == resources.n_box_references - len(
+        resources.boxes
+    )
+
+
+def test_pass_small_call_needs_no_add_resources_call() -> None:
+    """
+    Test that an app call whose references fit in it doesn't need add_resources calls.
+    """
+    assert deposit_resources(FIRST_BIDDER).extra_params() == []
+
+
+def test_fail_too_many_references() -> None:
+    """
+    Test that an app call referencing more assets than it can hold is rejected.
+    """
+    resources = buy_many_resources(
+        FIRST_BIDDER,
+        [(SaleKey(owner=SELLER, asset=asset), None) for asset in range(1, 10)],
+    )
+
+    with pytest.raises(ValueError, match=TOO_MANY_REFERENCES):
+        resources.params()